@@ -26,15 +26,10 @@
   const buttons = qsAll(".admin-visibility-toggle");
   if (!buttons.length) return;
 
-  // Hint to the user if the helper isn't running
-  async function pingHelper() {
-    try {
-      const r = await fetch("http://127.0.0.1:7331/ping", { method: "GET" });
-      return r.ok;
-    } catch (_) {
-      return false;
-    }
-  }
+  // tools/visibility_server.py (preview only).
+  const HELPER = "http://127.0.0.1:7331";
+  // Clicks within this window go to the helper in one /toggle request.
+  const BATCH_DELAY_MS = 150;
 
   function setBtn(btn, hidden) {
     btn.dataset.hidden = hidden ? "true" : "false";
@@ -50,6 +45,79 @@
     });
   }
 
+  function applyHidden(map) {
+    Object.keys(map || {}).forEach((id) => setAllOnPage(id, !!map[id]));
+  }
+
+  const pageIds = [];
+  buttons.forEach((btn) => {
+    const id = Number(btn.getAttribute("data-game-id"));
+    if (Number.isFinite(id) && pageIds.indexOf(id) === -1) pageIds.push(id);
+  });
+
+  let helperOk = null;
+
+  // One request for every card on the page. The helper answers with an ETag
+  // (its version) and no-cache, so the browser revalidates and an unchanged
+  // catalog comes back as 304 from its cache.
+  async function syncStatus() {
+    if (!pageIds.length) return;
+    try {
+      const r = await fetch(HELPER + "/status?ids=" + pageIds.join(","), { cache: "no-cache" });
+      if (!r.ok) throw new Error("HTTP " + r.status);
+      const data = await r.json();
+      helperOk = true;
+      applyHidden(data.hidden);
+    } catch (_) {
+      helperOk = false;
+    }
+  }
+
+  function listen() {
+    if (!window.EventSource) return;
+    const events = new EventSource(HELPER + "/events");
+    events.addEventListener("visibility", (e) => {
+      try { applyHidden(JSON.parse(e.data).hidden); } catch (_) {}
+    });
+    // The helper restarted or missed too much to replay; read current state.
+    events.addEventListener("reset", () => { syncStatus(); });
+  }
+
+  let queue = {};
+  let queued = {};
+  let timer = null;
+
+  async function sendQueue() {
+    timer = null;
+    const changes = Object.keys(queue).map((id) => ({ id: Number(id), hidden: queue[id] }));
+    const before = queued;
+    queue = {};
+    queued = {};
+    if (!changes.length) return;
+    try {
+      const res = await fetch(HELPER + "/toggle", {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ changes: changes })
+      });
+      if (!res.ok) {
+        const txt = await res.text();
+        throw new Error(txt || ("HTTP " + res.status));
+      }
+      const data = await res.json();
+      applyHidden(data.hidden);
+      if (data.missing && data.missing.length) {
+        data.missing.forEach((id) => setAllOnPage(id, before[id]));
+        alert("Game id(s) not found in data/games.json: " + data.missing.join(", "));
+      }
+    } catch (e) {
+      // Put the cards back the way they were.
+      Object.keys(before).forEach((id) => setAllOnPage(id, before[id]));
+      helperOk = null;
+      alert("Could not toggle visibility.\n\n" + (e && e.message ? e.message : String(e)));
+    }
+  }
+
   buttons.forEach((btn) => {
     // Initialize visual state
     setBtn(btn, btn.dataset.hidden === "true");
@@ -62,39 +130,22 @@
         return;
       }
 
-      const currentlyHidden = btn.dataset.hidden === "true";
-      const newHidden = !currentlyHidden;
-
-      if (btn.disabled) return;
-      btn.disabled = true;
-
       // Fast fail message if helper isn't running
-      const helperOk = await pingHelper();
+      if (!helperOk) await syncStatus();
       if (!helperOk) {
-        btn.disabled = false;
         alert("Preview visibility helper isn't running.\n\nUse ./tools/preview.sh (recommended),\nor run: python3 tools/visibility_server.py\n\nThen refresh this page.");
         return;
       }
 
-      try {
-        const res = await fetch("http://127.0.0.1:7331/toggle", {
-          method: "POST",
-          headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({ id: id, hidden: newHidden })
-        });
-
-        if (!res.ok) {
-          const txt = await res.text();
-          throw new Error(txt || ("HTTP " + res.status));
-        }
-
-        // Update all occurrences on this page immediately.
-        setAllOnPage(id, newHidden);
-      } catch (e) {
-        alert("Could not toggle visibility.\n\n" + (e && e.message ? e.message : String(e)));
-      } finally {
-        btn.disabled = false;
-      }
+      const currentlyHidden = btn.dataset.hidden === "true";
+      const newHidden = !currentlyHidden;
+      if (!(id in queued)) queued[id] = currentlyHidden;
+      queue[id] = newHidden;
+      // Update all occurrences on this page immediately.
+      setAllOnPage(id, newHidden);
+      if (!timer) timer = setTimeout(sendQueue, BATCH_DELAY_MS);
     });
   });
+
+  syncStatus().then(() => { if (helperOk) listen(); });
 })();
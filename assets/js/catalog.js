@@ -0,0 +1,175 @@
+(function(){
+  'use strict';
+
+  // Decodes the columnar catalog written by tools/generate_client_catalog.py
+  // (window.TGE_CATALOG_DATA). Games are referred to by position; the
+  // search index, Hidden Gems list and slug lookups all use those positions.
+  var d = window.TGE_CATALOG_DATA || {};
+  var titles = d.t || [];
+  var urls = d.u || [];
+  var slugs = d.s || [];
+  var catNumbers = d.c || [];
+  var cats = d.cats || [];
+  var catLabels = d.catLabels || [];
+  var hidden = Object.create(null);
+  (d.hidden || []).forEach(function(pos){ hidden[pos] = true; });
+
+  var cache = [];
+  var bySlugIndex = null;
+
+  function game(pos){
+    if(pos < 0 || pos >= titles.length) return null;
+    var g = cache[pos];
+    if(!g){
+      var c = catNumbers[pos];
+      g = cache[pos] = {
+        pos: pos,
+        title: titles[pos],
+        url: urls[pos],
+        slug: slugs[pos] || '',
+        category: cats[c] || '',
+        categoryLabel: String(catLabels[c] || '').replace(/&amp;/gi, '&')
+      };
+    }
+    return g;
+  }
+
+  // Game for a page slug or any tracking alias (click ids, search slugs).
+  function bySlug(id){
+    if(!bySlugIndex){
+      bySlugIndex = Object.create(null);
+      (d.k || []).forEach(function(pair){
+        if(!(pair[1] in bySlugIndex)) bySlugIndex[pair[1]] = pair[0];
+      });
+      for(var i = 0; i < slugs.length; i++){
+        if(slugs[i]) bySlugIndex[slugs[i]] = i;
+      }
+    }
+    var pos = bySlugIndex[id];
+    return pos === undefined ? null : game(pos);
+  }
+
+  // Games listed by search (the same ones as the search index).
+  function searchGames(){
+    var out = [];
+    for(var i = 0; i < titles.length; i++){
+      if(hidden[i] && !d.searchHidden) continue;
+      out.push(game(i));
+    }
+    return out;
+  }
+
+  // Games shown by Surprise Me, Favourites and Hidden Gems.
+  function featureGames(){
+    var out = [];
+    for(var i = 0; i < titles.length; i++){
+      if(hidden[i] && !d.featureHidden) continue;
+      out.push(game(i));
+    }
+    return out;
+  }
+
+  // Facet bitsets (tools/facet_index.py): run-length encoded, base64.
+  function decodeRuns(data, words){
+    var bits = new Uint32Array(words);
+    var raw = atob(data);
+    var bit = 0, set = false, value = 0, shift = 0;
+    for(var i = 0; i < raw.length; i++){
+      var byte = raw.charCodeAt(i);
+      value += (byte & 0x7f) * Math.pow(2, shift);
+      shift += 7;
+      if(byte & 0x80) continue;
+      if(set){
+        for(var b = bit; b < bit + value; b++) bits[b >>> 5] |= (1 << (b & 31));
+      }
+      bit += value;
+      set = !set;
+      value = 0;
+      shift = 0;
+    }
+    return bits;
+  }
+
+  function Facets(index){
+    this.n = index.n || 0;
+    this.labels = index.labels || {};
+    this._encoded = index.facets || {};
+    this._words = Math.ceil(this.n / 32);
+    this._bits = Object.create(null);
+  }
+
+  Facets.prototype.values = function(facet){
+    return Object.keys(this._encoded[facet] || {});
+  };
+
+  Facets.prototype.bits = function(facet, key){
+    var id = facet + '\u0000' + key;
+    if(!this._bits[id]){
+      var data = (this._encoded[facet] || {})[key];
+      this._bits[id] = data ? decodeRuns(data, this._words) : new Uint32Array(this._words);
+    }
+    return this._bits[id];
+  };
+
+  // filters: { category: 'rom-hacks', genre: ['platformer', 'action'], series: 'super-mario' }
+  // Values within one facet are ORed, facets are ANDed. Returns catalog positions.
+  Facets.prototype.match = function(filters){
+    var result = null;
+    var self = this;
+    Object.keys(filters || {}).forEach(function(facet){
+      var keys = [].concat(filters[facet]).filter(Boolean);
+      if(!keys.length) return;
+      var any = new Uint32Array(self._words);
+      keys.forEach(function(key){
+        var bits = self.bits(facet, key);
+        for(var w = 0; w < any.length; w++) any[w] |= bits[w];
+      });
+      if(!result) result = any;
+      else for(var w = 0; w < result.length; w++) result[w] &= any[w];
+    });
+    var out = [];
+    for(var w = 0; w < this._words; w++){
+      var word = result ? result[w] : 0xffffffff;
+      while(word){
+        var low = word & -word;
+        var pos = (w << 5) + (31 - Math.clz32(low));
+        if(pos < this.n) out.push(pos);
+        word ^= low;
+      }
+    }
+    return out;
+  };
+
+  var facetsPromise = null;
+
+  // Loads the facet index on first use; resolves to a Facets object.
+  function facets(){
+    if(!facetsPromise){
+      if(!d.facets) return Promise.reject(new Error('No facet index'));
+      facetsPromise = fetch(d.facets)
+        .then(function(res){
+          if(!res.ok) throw new Error('HTTP ' + res.status);
+          return res.json();
+        })
+        .then(function(index){ return new Facets(index); })
+        .catch(function(err){
+          facetsPromise = null;
+          throw err;
+        });
+    }
+    return facetsPromise;
+  }
+
+  window.TGE_CATALOG = {
+    count: titles.length,
+    game: game,
+    bySlug: bySlug,
+    searchGames: searchGames,
+    featureGames: featureGames,
+    hiddenGems: function(){
+      return (d.gems || []).map(function(pos){ return slugs[pos]; }).filter(Boolean);
+    },
+    stats: d.stats || {},
+    facets: facets
+  };
+})();
@@ -8,15 +8,17 @@
   var emptyEl = modal ? modal.querySelector("[data-favourites-empty]") : null;
   var clearBtn = modal ? modal.querySelector("[data-favourites-clear]") : null;
   var countEls = document.querySelectorAll("[data-favourites-count]");
-  var games = (window.TGE_FEATURE_DATA && Array.isArray(window.TGE_FEATURE_DATA.favourites)) ? window.TGE_FEATURE_DATA.favourites : [];
+  var games = window.TGE_CATALOG ? window.TGE_CATALOG.featureGames() : [];
   var gameMap = {};
 
   games.forEach(function (g) {
-    g.id = String(g.id || "");
-    g.title = String(g.title || "");
-    g.url = String(g.url || "");
-    g.categoryLabel = String(g.categoryLabel || "").replace(/&amp;/gi, "&");
-    if (g.id) gameMap[g.id] = g;
+    var entry = {
+      id: String(g.slug || ""),
+      title: String(g.title || ""),
+      url: String(g.url || ""),
+      categoryLabel: String(g.categoryLabel || "")
+    };
+    if (entry.id) gameMap[entry.id] = entry;
   });
 
   function load() {
@@ -15,7 +15,7 @@
   var loading = false;
 
   function data(){
-    return (window.TGE_FEATURE_DATA && window.TGE_FEATURE_DATA.hiddenGems) || [];
+    return window.TGE_CATALOG ? window.TGE_CATALOG.hiddenGems() : [];
   }
 
   function shuffle(arr){
@@ -51,9 +51,7 @@
   }
 
   function lookupInfo(id){
-    var direct = window.__GAMES_BY_SLUG__ && window.__GAMES_BY_SLUG__[id];
-    if(direct) return direct;
-    return null;
+    return window.TGE_CATALOG ? window.TGE_CATALOG.bySlug(id) : null;
   }
 
   function render(rows){
@@ -612,6 +612,33 @@ function initGameGrids(){
     // Popularity is click-based only.
     // Do not send card-impression/view requests: they can generate huge Worker traffic.
 
+    // Clicks are queued and posted together to /api/clicks, so a burst of
+    // clicks is one request and one D1 batch. The queue is flushed a few
+    // seconds after the last click, when it fills up, and when the page is
+    // hidden or unloaded (sendBeacon survives navigation).
+    var FLUSH_DELAY_MS = 4000;
+    var MAX_QUEUE = 20;
+    var queue = [];
+    var timer = null;
+
+    function flush(){
+      if(timer){ clearTimeout(timer); timer = null; }
+      if(!queue.length) return;
+      var body = JSON.stringify({ ids: queue });
+      queue = [];
+      try {
+        if(navigator.sendBeacon && navigator.sendBeacon('/api/clicks', body)) return;
+        fetch('/api/clicks', { method: 'POST', body: body, keepalive: true }).catch(function(){});
+      } catch(err) {
+        // ignore
+      }
+    }
+
+    document.addEventListener('visibilitychange', function(){
+      if(document.visibilityState === 'hidden') flush();
+    });
+    window.addEventListener('pagehide', flush);
+
     document.addEventListener('click', function(e){
       var a = e.target && e.target.closest ? e.target.closest('a.game-card__link') : null;
       if(!a) return;
@@ -628,16 +655,13 @@ function initGameGrids(){
       if(lastSent[id] && (now - lastSent[id]) < 3500) return; // simple spam guard
       lastSent[id] = now;
 
-      var url = '/api/click?id=' + encodeURIComponent(id);
-      try {
-        if(navigator.sendBeacon){
-          navigator.sendBeacon(url);
-        } else {
-          fetch(url, { method: 'GET', keepalive: true }).catch(function(){});
-        }
-      } catch(err) {
-        // ignore
+      queue.push(id);
+      if(queue.length >= MAX_QUEUE){
+        flush();
+        return;
       }
+      if(timer) clearTimeout(timer);
+      timer = setTimeout(flush, FLUSH_DELAY_MS);
     }, { passive: true });
   }
 
@@ -765,17 +789,19 @@ function initGameGrids(){
     var tabs = Array.prototype.slice.call(document.querySelectorAll('[data-popular-mode]'));
     if(!btns.length || !pop || !list) return;
 
-    // Build id -> {title,url} lookup from the already-loaded search index.
+    // Build id -> {title,url} lookup from the already-loaded catalog.
     // We store two keys for each entry:
     //  - a slugified title (matches most Hugo urlize outputs)
     //  - a "loose" key with hyphens removed (handles rare normalization differences)
     var lookup = Object.create(null);
     var lookupLoose = Object.create(null);
     try {
-      var idx = (window.__GAME_INDEX__ || []);
-      for(var i=0;i<idx.length;i++){
-        var t = idx[i] && idx[i].title;
-        var u = idx[i] && idx[i].url;
+      var cat = window.TGE_CATALOG;
+      var n = cat ? cat.count : 0;
+      for(var i=0;i<n;i++){
+        var g = cat.game(i);
+        var t = g.title;
+        var u = g.url;
         if(!t || !u) continue;
         var k = slugifyTitle(t);
         lookup[k] = { title: t, url: u };
@@ -871,7 +897,7 @@ function initGameGrids(){
             // Hide any manual test entries (you can also delete them from D1).
             if(id === 'test-game' || id === 'test-live' || id.indexOf('test-') === 0) continue;
 
-            var direct = (window.__GAMES_BY_SLUG__ && window.__GAMES_BY_SLUG__[id]) || null;
+            var direct = (window.TGE_CATALOG && window.TGE_CATALOG.bySlug(id)) || null;
             var info = direct ? { title: direct.title, url: direct.url } : (lookup[id] || lookupLoose[id.replace(/-/g,'')] || null);
             if(!info){
               info = { title: humanizeSlug(id), url: '#' };
@@ -17,7 +17,7 @@
   }
 
   function lookupInfo(id){
-    return window.__GAMES_BY_SLUG__ && window.__GAMES_BY_SLUG__[id] || null;
+    return window.TGE_CATALOG ? window.TGE_CATALOG.bySlug(id) : null;
   }
 
   function open(){
@@ -9,8 +9,25 @@
     const dropdown = document.getElementById('siteSearchDropdown');
     if(!input || !dropdown) return;
 
-    let index = (window.__GAME_INDEX__ || []);
-    if(!Array.isArray(index)) index = [];
+    // Titles and urls come from window.TGE_CATALOG (assets/js/catalog.js);
+    // the word index refers to games by catalog position.
+    // Full mode: window.__SEARCH_TOKENS__ holds the whole word index.
+    // Sharded mode: window.__SEARCH_MANIFEST__ lists one shard per character
+    // and the shard of the query's first character is fetched on first use
+    // (see tools/search_index.py). It holds every title word containing that
+    // character, so it has all prefix and mid-word matches of the first
+    // token; the other tokens are checked against the catalog titles. Only
+    // when that finds nothing (typos, which need the whole vocabulary) is the
+    // query ranked over an index built here from the catalog, as in full
+    // mode, without fetching anything else.
+    const catalog = window.TGE_CATALOG;
+    const manifest = window.__SEARCH_MANIFEST__ || null;
+    const RESULT_LIMIT = 10;
+    let fullSource = null;
+    const shards = Object.create(null);
+    // Catalog position -> normalized title, filled as games are ranked.
+    const norms = Object.create(null);
+    let searchSeq = 0;
 
     function clear(){
       dropdown.innerHTML = '';
@@ -55,9 +72,115 @@
         .replace(/\s+/g, ' ');
     }
 
-    function scoreMatch(title, query){
-      const t = normalize(title);
-      const q = normalize(query);
+    function titleOf(pos){
+      if(!(pos in norms)) norms[pos] = normalize((catalog.game(pos) || {}).title);
+      return norms[pos];
+    }
+
+    // Build a search source from a shipped word index (postings are
+    // delta-encoded). Without one the index is built here once over every
+    // game search lists. `partial` marks a shard: it only indexes the words
+    // of the first token's character.
+    function makeSource(tokens, partial){
+      if(!catalog) return { w: [], p: [], grams: null, partial: false };
+      if(tokens && Array.isArray(tokens.w)){
+        const p = tokens.p.map(deltas => {
+          let pos = 0;
+          return deltas.map(d => (pos += d));
+        });
+        return { w: tokens.w, p, grams: null, partial: !!partial };
+      }
+      const postings = Object.create(null);
+      for(const item of catalog.searchGames()){
+        for(const w of new Set(titleOf(item.pos).split(' '))){
+          if(!w) continue;
+          (postings[w] = postings[w] || []).push(item.pos);
+        }
+      }
+      const w = Object.keys(postings).sort();
+      return { w, p: w.map(word => postings[word]), grams: null, partial: false };
+    }
+
+    function trigrams(word){
+      const out = [];
+      for(let i = 0; i + 3 <= word.length; i++) out.push(word.slice(i, i + 3));
+      return out;
+    }
+
+    // trigram -> word numbers, built on the first query that needs it.
+    function gramsOf(src){
+      if(!src.grams){
+        src.grams = new Map();
+        src.w.forEach((word, wid) => {
+          for(const g of new Set(trigrams(word))){
+            if(!src.grams.has(g)) src.grams.set(g, []);
+            src.grams.get(g).push(wid);
+          }
+        });
+      }
+      return src.grams;
+    }
+
+    // Edit distance, giving up once it exceeds max.
+    function withinDistance(a, b, max){
+      if(Math.abs(a.length - b.length) > max) return false;
+      let prev = [];
+      for(let j = 0; j <= b.length; j++) prev.push(j);
+      for(let i = 1; i <= a.length; i++){
+        const cur = [i];
+        let best = i;
+        for(let j = 1; j <= b.length; j++){
+          const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+          cur.push(Math.min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost));
+          if(cur[j] < best) best = cur[j];
+        }
+        if(best > max) return false;
+        prev = cur;
+      }
+      return prev[b.length] <= max;
+    }
+
+    // Word numbers matching tok: word prefixes by binary search, then
+    // mid-word substrings (via trigrams from 3 characters). Only when neither
+    // matches, words within a small edit distance (4+ characters).
+    function matchWords(src, tok){
+      const w = src.w;
+      let lo = 0, hi = w.length;
+      while(lo < hi){
+        const mid = (lo + hi) >> 1;
+        if(w[mid] < tok) lo = mid + 1; else hi = mid;
+      }
+      const found = new Set();
+      for(let i = lo; i < w.length && w[i].startsWith(tok); i++) found.add(i);
+      if(tok.length < 3){
+        // Too short for trigrams; the vocabulary is far smaller than the catalog.
+        w.forEach((word, wid) => { if(word.includes(tok)) found.add(wid); });
+        return { words: found, fuzzy: false };
+      }
+
+      const lists = [...new Set(trigrams(tok))].map(g => gramsOf(src).get(g) || []);
+      lists.sort((a, b) => a.length - b.length);
+      for(const wid of lists[0]){
+        if(w[wid].includes(tok)) found.add(wid);
+      }
+      // A shard may lack the word a typo was meant to be; leave those to the full index.
+      if(found.size || tok.length < 4 || src.partial) return { words: found, fuzzy: false };
+
+      const max = tok.length >= 8 ? 2 : 1;
+      const seen = new Set();
+      for(const list of lists){
+        for(const wid of list){
+          if(seen.has(wid)) continue;
+          seen.add(wid);
+          if(withinDistance(tok, w[wid], max)) found.add(wid);
+        }
+      }
+      return { words: found, fuzzy: true };
+    }
+
+    // t and q are already normalized. Tokens in `fuzzy` matched a
+    // misspelling and score below any literal match.
+    function scoreMatch(t, q, fuzzy){
       if(!t || !q) return 0;
 
       const words = t.split(' ');
@@ -72,6 +195,7 @@
         if(t.startsWith(tok)) { score += 30; continue; }
         if(words.some(w => w.startsWith(tok))) { score += 24; continue; }
         if(t.includes(tok)) { score += 18; continue; }
+        if(fuzzy.has(tok)) { score += 10; continue; }
         return 0; // token not found anywhere
       }
 
@@ -84,15 +208,33 @@
       return score;
     }
 
-    function search(q){
-      q = (q || '').trim();
-      if(!q){ clear(); return; }
+    // Candidates come from the postings of each query token (intersected,
+    // smallest first), so the cost follows the matches, not the catalog.
+    // A shard only looks up the first token; scoreMatch checks the rest.
+    function rank(src, query){
+      const q = normalize(query);
+      const tokens = [...new Set(q.split(' ').filter(Boolean))];
+      if(!tokens.length) return [];
+
+      const fuzzy = new Set();
+      const sets = (src.partial ? tokens.slice(0, 1) : tokens).map(tok => {
+        const m = matchWords(src, tok);
+        if(m.fuzzy) fuzzy.add(tok);
+        const ids = new Set();
+        for(const wid of m.words){
+          for(const id of src.p[wid]) ids.add(id);
+        }
+        return ids;
+      });
+      sets.sort((a, b) => a.size - b.size);
 
       const results = [];
-      for(const item of index){
-        const title = (item.title || '').trim();
+      for(const pos of sets[0]){
+        if(!sets.every(set => set.has(pos))) continue;
+        const item = catalog.game(pos);
+        const title = ((item && item.title) || '').trim();
         if(!title) continue;
-        const s = scoreMatch(title, q);
+        const s = scoreMatch(titleOf(pos), q, fuzzy);
         if(s > 0) results.push({ ...item, __score: s });
       }
 
@@ -103,7 +245,54 @@
       });
 
       // Strip internal score before rendering
-      render(results.slice(0, 10).map(r => ({ title: r.title, url: r.url })));
+      return results.slice(0, RESULT_LIMIT).map(r => ({ title: r.title, url: r.url }));
+    }
+
+    function loadShard(key){
+      if(!shards[key]){
+        const url = manifest.shards[key];
+        shards[key] = fetch(url)
+          .then(res => {
+            if(!res.ok) throw new Error('HTTP ' + res.status);
+            return res.json();
+          })
+          .then(tokens => makeSource(tokens, true))
+          .catch(err => {
+            delete shards[key]; // retry on the next keystroke
+            throw err;
+          });
+      }
+      return shards[key];
+    }
+
+    function full(){
+      if(!fullSource) fullSource = makeSource(manifest ? null : window.__SEARCH_TOKENS__);
+      return fullSource;
+    }
+
+    function search(q){
+      q = (q || '').trim();
+      const seq = ++searchSeq;
+      if(!q){ clear(); return; }
+
+      if(!manifest){
+        render(rank(full(), q));
+        return;
+      }
+      if(!manifest.shards){ clear(); return; }
+
+      const key = normalize(q).charAt(0);
+      if(!key){ render([]); return; }
+      if(!manifest.shards[key]){ render(rank(full(), q)); return; }
+
+      loadShard(key).then(src => {
+        if(seq !== searchSeq) return;
+        // Nothing only when some token has no literal match in any title.
+        const results = rank(src, q);
+        render(results.length ? results : rank(full(), q));
+      }, () => {
+        if(seq === searchSeq) render(rank(full(), q));
+      });
     }
 
     input.addEventListener('input', function(e){
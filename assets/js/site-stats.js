@@ -8,7 +8,7 @@
   var closers = modal.querySelectorAll("[data-stats-close]");
   var panel = modal.querySelector(".site-stats-modal__panel");
   var lastFocus = null;
-  var stats = (window.TGE_FEATURE_DATA && window.TGE_FEATURE_DATA.stats) ? window.TGE_FEATURE_DATA.stats : {};
+  var stats = (window.TGE_CATALOG && window.TGE_CATALOG.stats) ? window.TGE_CATALOG.stats : {};
 
   modal.querySelectorAll("[data-stat-key]").forEach(function (el) {
     var key = el.getAttribute("data-stat-key");
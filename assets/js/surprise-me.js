@@ -7,11 +7,11 @@
   var select = modal.querySelector("[data-surprise-category]");
   var go = modal.querySelector("[data-surprise-go]");
   var msg = modal.querySelector("[data-surprise-message]");
-  var games = (window.TGE_FEATURE_DATA && Array.isArray(window.TGE_FEATURE_DATA.surprise)) ? window.TGE_FEATURE_DATA.surprise : [];
+  var games = window.TGE_CATALOG ? window.TGE_CATALOG.featureGames() : [];
 
   // Hugo now emits proper JSON strings directly. Do not URL-encode display text:
   // URL encoding is what caused spaces to appear as + and ampersands as &amp;.
-  games = games.map(function (g) {
+  games = games.filter(function (g) { return g.category; }).map(function (g) {
     return {
       title: String(g.title || ""),
       url: String(g.url || ""),
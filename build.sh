@@ -1,20 +1,6 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
-echo "Generating game pages..."
-python3 tools/generate_game_pages.py
-
-
-echo "Generating series pages..."
-python3 tools/generate_series_pages.py
-python3 tools/generate_browse_indexes.py
-
-echo "Generating search index..."
-python3 tools/generate_search_index.py
-
-./check-social
-
-echo "Building Hugo site..."
-hugo
-
-echo "Done. Output is in ./public"
+# Generators, check-social and Hugo all run from tools/build.py, which
+# parses data/games.json once and runs independent stages in parallel.
+exec python3 tools/build.py "$@"
@@ -0,0 +1,32 @@
+-- Run this once in the existing gaming-emporium-popularity D1 database
+-- (safe to run again). Adds the rollup and monthly tables used by the
+-- Worker's scheduled handler; see POPULARITY_TRENDING_SETUP.md.
+
+-- Monthly totals for days compacted out of events_daily
+-- month: YYYY-MM
+CREATE TABLE IF NOT EXISTS events_monthly (
+  month TEXT NOT NULL,
+  id TEXT NOT NULL,
+  clicks INTEGER NOT NULL DEFAULT 0,
+  views INTEGER NOT NULL DEFAULT 0,
+  PRIMARY KEY (month, id)
+);
+
+-- Precomputed /api/top scores, rebuilt by the Worker's scheduled handler
+-- period: trending7, trending30, rising
+-- count: clicks in the window (rising: last 3 days); baseline: rising only
+CREATE TABLE IF NOT EXISTS popularity_rollup (
+  period TEXT NOT NULL,
+  id TEXT NOT NULL,
+  count INTEGER NOT NULL,
+  baseline INTEGER NOT NULL DEFAULT 0,
+  score REAL NOT NULL,
+  PRIMARY KEY (period, id)
+);
+CREATE INDEX IF NOT EXISTS idx_popularity_rollup_score ON popularity_rollup(period, score DESC, count DESC);
+
+-- When each period was last rebuilt (unixepoch)
+CREATE TABLE IF NOT EXISTS popularity_rollup_meta (
+  period TEXT PRIMARY KEY,
+  refreshed_at INTEGER NOT NULL
+);
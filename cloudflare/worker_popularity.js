@@ -3,7 +3,17 @@
  *
  * Routes:
  *  - GET  /api/click?id=<game-id>
+ *  - POST /api/clicks  {"ids": ["<game-id>", ...]}   (queued clicks from main.js)
  *  - GET  /api/top?mode=trending|all|hidden|rising&days=7&limit=10
+ *
+ * /api/top answers are cached at the edge (see cachedTop), so homepage
+ * traffic does not turn into one aggregate D1 query per view.
+ *
+ * Scheduled (Cron Trigger): refreshRollups() rebuilds popularity_rollup
+ * (7- and 30-day trending, rising) and compacts events_daily rows older
+ * than the longest window into events_monthly. Trending and rising then
+ * read the rollup; they fall back to the raw queries if it is stale or
+ * missing (cron not set up, d1_add_popularity_rollups.sql not applied).
  */
 
 export default {
@@ -13,7 +23,7 @@ export default {
     // CORS (simple + permissive)
     const corsHeaders = {
       "Access-Control-Allow-Origin": "*",
-      "Access-Control-Allow-Methods": "GET,OPTIONS",
+      "Access-Control-Allow-Methods": "GET,POST,OPTIONS",
       "Access-Control-Allow-Headers": "Content-Type",
     };
 
@@ -26,135 +36,42 @@ export default {
         const id = (url.searchParams.get("id") || "").trim();
         if (!id) return json({ ok: false, error: "missing_id" }, 400, corsHeaders);
 
-        // All-time counter
-        await env.DB.prepare(
-          `INSERT INTO clicks (id, count, updated_at)
-           VALUES (?1, 1, unixepoch())
-           ON CONFLICT(id) DO UPDATE SET
-             count = count + 1,
-             updated_at = unixepoch()`
-        ).bind(id).run();
-
-        // Rolling window (daily) counter
-        await env.DB.prepare(
-          `INSERT INTO events_daily (day, id, clicks, views)
-           VALUES (date('now'), ?1, 1, 0)
-           ON CONFLICT(day, id) DO UPDATE SET
-             clicks = clicks + 1`
-        ).bind(id).run();
-
+        await env.DB.batch(clickStatements(env, { [id]: 1 }));
         return json({ ok: true }, 200, corsHeaders);
       }
 
-      if (url.pathname === "/api/top") {
-        const mode = (url.searchParams.get("mode") || "all").toLowerCase();
-        const limit = clampInt(url.searchParams.get("limit"), 10, 1, 25);
-        const days = clampInt(url.searchParams.get("days"), 7, 1, 30);
-        const ids = (url.searchParams.get("ids") || "")
-          .split(",")
-          .map((id) => id.trim())
-          .filter(Boolean)
-          .slice(0, 50);
-
-        let rows = [];
-
-        if (mode === "rising") {
-          // Rising: compare the last 3 days with the preceding 14-day baseline.
-          // We smooth the baseline slightly and weight by recent volume so that
-          // a project with 2 clicks after a quiet spell does not outrank one
-          // with a genuinely meaningful surge. No extra D1 table is required.
-          const recentDays = 3;
-          const baselineDays = 14;
-          const startOffset = -(recentDays + baselineDays - 1);
-          const recentOffset = -(recentDays - 1);
-          const risingLimit = clampInt(url.searchParams.get("limit"), 10, 1, 25);
-          const q = `
-            WITH momentum AS (
-              SELECT
-                id,
-                SUM(CASE WHEN day >= date('now', ?1) THEN clicks ELSE 0 END) AS recent_count,
-                SUM(CASE WHEN day < date('now', ?1) THEN clicks ELSE 0 END) AS baseline_count
-              FROM events_daily
-              WHERE day >= date('now', ?2)
-              GROUP BY id
-            )
-            SELECT
-              id,
-              recent_count,
-              baseline_count,
-              ROUND(
-                ((recent_count * recent_count) * ?3 * 1.0) /
-                ((baseline_count + 1) * ?4),
-                2
-              ) AS score
-            FROM momentum
-            WHERE recent_count >= 2
-              AND (recent_count * ?3 * 1.0 / ?4) > baseline_count
-            ORDER BY score DESC, recent_count DESC
-            LIMIT ?5
-          `;
-          const res = await env.DB.prepare(q).bind(
-            `${recentOffset} days`,
-            `${startOffset} days`,
-            baselineDays,
-            recentDays,
-            risingLimit
-          ).all();
-          rows = res.results || [];
-        } else if (mode === "hidden") {
-          // Hidden Gems: return genuinely low-engagement projects directly
-          // from D1 instead of making the browser probe thousands of IDs.
-          // Keep only projects that have at least one click; eligibility by age
-          // is applied client-side using the generated site data.
-          const hiddenLimit = clampInt(url.searchParams.get("limit"), 100, 1, 100);
-          const res = await env.DB.prepare(
-            `SELECT id, count FROM clicks WHERE count > 0 ORDER BY count ASC, RANDOM() LIMIT ?1`
-          ).bind(hiddenLimit).all();
-          rows = res.results || [];
-        } else if (mode === "trending") {
-          // Last N days inclusive (e.g. days=7 => today + previous 6 days)
-          const offset = -(days - 1);
-          if (ids.length) {
-            const marks = ids.map(() => "?").join(",");
-            const q = `
-              SELECT id, SUM(clicks) AS count
-              FROM events_daily
-              WHERE day >= date('now', ?) AND id IN (${marks})
-              GROUP BY id
-              HAVING count > 0
-              ORDER BY count DESC
-              LIMIT ?
-            `;
-            const res = await env.DB.prepare(q).bind(`${offset} days`, ...ids, limit).all();
-            rows = res.results || [];
-          } else {
-            const q = `
-              SELECT id, SUM(clicks) AS count
-              FROM events_daily
-              WHERE day >= date('now', ?1)
-              GROUP BY id
-              HAVING count > 0
-              ORDER BY count DESC
-              LIMIT ?2
-            `;
-            const res = await env.DB.prepare(q).bind(`${offset} days`, limit).all();
-            rows = res.results || [];
-          }
-        } else {
-          if (ids.length) {
-            const marks = ids.map(() => "?").join(",");
-            const q = `SELECT id, count FROM clicks WHERE id IN (${marks}) ORDER BY count DESC LIMIT ?`;
-            const res = await env.DB.prepare(q).bind(...ids, limit).all();
-            rows = res.results || [];
-          } else {
-            const res = await env.DB.prepare(
-              `SELECT id, count FROM clicks ORDER BY count DESC LIMIT ?1`
-            ).bind(limit).all();
-            rows = res.results || [];
+      if (url.pathname === "/api/clicks") {
+        if (request.method !== "POST") {
+          return json({ ok: false, error: "method_not_allowed" }, 405, corsHeaders);
+        }
+        // sendBeacon posts the queue as text/plain JSON (no preflight).
+        let body = null;
+        try {
+          body = JSON.parse(await request.text());
+        } catch (_) {
+          return json({ ok: false, error: "bad_json" }, 400, corsHeaders);
+        }
+        const counts = Object.create(null);
+        let distinct = 0;
+        for (const raw of (body && Array.isArray(body.ids) ? body.ids : []).slice(0, MAX_BATCH_CLICKS)) {
+          const id = String(raw ?? "").trim().slice(0, MAX_ID_LENGTH);
+          if (!id) continue;
+          if (!(id in counts)) {
+            if (distinct >= MAX_BATCH_IDS) continue;
+            counts[id] = 0;
+            distinct++;
           }
+          counts[id]++;
         }
+        if (!distinct) return json({ ok: false, error: "missing_id" }, 400, corsHeaders);
 
-        return json({ ok: true, mode, top: rows }, 200, corsHeaders);
+        // One round-trip (and one implicit transaction) for the whole queue.
+        await env.DB.batch(clickStatements(env, counts));
+        return json({ ok: true, ids: distinct }, 200, corsHeaders);
+      }
+
+      if (url.pathname === "/api/top") {
+        return await cachedTop(url, topParams(url), env, ctx, corsHeaders);
       }
 
       return json({ ok: false, error: "not_found" }, 404, corsHeaders);
@@ -162,8 +79,360 @@ export default {
       return json({ ok: false, error: "server_error" }, 500, corsHeaders);
     }
   },
+
+  async scheduled(event, env, ctx) {
+    ctx.waitUntil(refreshRollups(env));
+  },
 };
 
+// /api/top parameters with the worker's defaults and limits applied. Equal
+// objects give equal answers, so they double as the edge cache key.
+function topParams(url) {
+  const raw = (url.searchParams.get("mode") || "all").toLowerCase();
+  const mode = ["trending", "hidden", "rising"].includes(raw) ? raw : "all";
+  const limit = mode === "hidden"
+    ? clampInt(url.searchParams.get("limit"), 100, 1, 100)
+    : clampInt(url.searchParams.get("limit"), 10, 1, 25);
+  // Only trending reads days; rising and hidden ignore ids.
+  const days = mode === "trending" ? clampInt(url.searchParams.get("days"), 7, 1, 30) : 0;
+  let ids = [];
+  if (mode === "trending" || mode === "all") {
+    ids = [...new Set(
+      (url.searchParams.get("ids") || "")
+        .split(",")
+        .map((id) => id.trim())
+        .filter(Boolean)
+    )].slice(0, 50).sort();
+  }
+  return { mode, limit, days, ids };
+}
+
+function topCacheKey(url, p) {
+  const key = new URL("/api/top", url.origin);
+  key.searchParams.set("mode", p.mode);
+  key.searchParams.set("limit", String(p.limit));
+  if (p.days) key.searchParams.set("days", String(p.days));
+  if (p.ids.length) key.searchParams.set("ids", p.ids.join(","));
+  return key.toString();
+}
+
+async function topRows(env, p) {
+  const { mode, limit, days, ids } = p;
+  const period = mode === "rising" ? "rising" : mode === "trending" ? TRENDING_PERIODS[days] : null;
+  if (period) {
+    const rolled = await rollupRows(env, period, limit, ids);
+    if (rolled) return rolled;
+  }
+  let rows = [];
+
+  if (mode === "rising") {
+    // Rising: compare the last 3 days with the preceding 14-day baseline.
+    // We smooth the baseline slightly and weight by recent volume so that
+    // a project with 2 clicks after a quiet spell does not outrank one
+    // with a genuinely meaningful surge. No extra D1 table is required.
+    const recentDays = RISING_RECENT_DAYS;
+    const baselineDays = RISING_BASELINE_DAYS;
+    const startOffset = -(recentDays + baselineDays - 1);
+    const recentOffset = -(recentDays - 1);
+    const q = `
+      WITH momentum AS (
+        SELECT
+          id,
+          SUM(CASE WHEN day >= date('now', ?1) THEN clicks ELSE 0 END) AS recent_count,
+          SUM(CASE WHEN day < date('now', ?1) THEN clicks ELSE 0 END) AS baseline_count
+        FROM events_daily
+        WHERE day >= date('now', ?2)
+        GROUP BY id
+      )
+      SELECT
+        id,
+        recent_count,
+        baseline_count,
+        ROUND(
+          ((recent_count * recent_count) * ?3 * 1.0) /
+          ((baseline_count + 1) * ?4),
+          2
+        ) AS score
+      FROM momentum
+      WHERE recent_count >= 2
+        AND (recent_count * ?3 * 1.0 / ?4) > baseline_count
+      ORDER BY score DESC, recent_count DESC
+      LIMIT ?5
+    `;
+    const res = await env.DB.prepare(q).bind(
+      `${recentOffset} days`,
+      `${startOffset} days`,
+      baselineDays,
+      recentDays,
+      limit
+    ).all();
+    rows = res.results || [];
+  } else if (mode === "hidden") {
+    // Hidden Gems: return genuinely low-engagement projects directly
+    // from D1 instead of making the browser probe thousands of IDs.
+    // Keep only projects that have at least one click; eligibility by age
+    // is applied client-side using the generated site data.
+    const res = await env.DB.prepare(
+      `SELECT id, count FROM clicks WHERE count > 0 ORDER BY count ASC, RANDOM() LIMIT ?1`
+    ).bind(limit).all();
+    rows = res.results || [];
+  } else if (mode === "trending") {
+    // Last N days inclusive (e.g. days=7 => today + previous 6 days)
+    const offset = -(days - 1);
+    if (ids.length) {
+      const marks = ids.map(() => "?").join(",");
+      const q = `
+        SELECT id, SUM(clicks) AS count
+        FROM events_daily
+        WHERE day >= date('now', ?) AND id IN (${marks})
+        GROUP BY id
+        HAVING count > 0
+        ORDER BY count DESC
+        LIMIT ?
+      `;
+      const res = await env.DB.prepare(q).bind(`${offset} days`, ...ids, limit).all();
+      rows = res.results || [];
+    } else {
+      const q = `
+        SELECT id, SUM(clicks) AS count
+        FROM events_daily
+        WHERE day >= date('now', ?1)
+        GROUP BY id
+        HAVING count > 0
+        ORDER BY count DESC
+        LIMIT ?2
+      `;
+      const res = await env.DB.prepare(q).bind(`${offset} days`, limit).all();
+      rows = res.results || [];
+    }
+  } else {
+    if (ids.length) {
+      const marks = ids.map(() => "?").join(",");
+      const q = `SELECT id, count FROM clicks WHERE id IN (${marks}) ORDER BY count DESC LIMIT ?`;
+      const res = await env.DB.prepare(q).bind(...ids, limit).all();
+      rows = res.results || [];
+    } else {
+      const res = await env.DB.prepare(
+        `SELECT id, count FROM clicks ORDER BY count DESC LIMIT ?1`
+      ).bind(limit).all();
+      rows = res.results || [];
+    }
+  }
+
+  return rows;
+}
+
+// Edge cache for /api/top (Cache API, per data centre), keyed on topParams().
+// An answer is fresh for TOP_TTL[mode] seconds, then served stale for up to
+// TOP_STALE more while one background refresh replaces it. The hidden pool
+// (ORDER BY RANDOM()) therefore changes once per TTL rather than per view.
+const TOP_TTL = { all: 300, trending: 120, rising: 300, hidden: 600 };
+const TOP_STALE = 1800;
+// Browsers may reuse an answer briefly; the edge does the real caching.
+const TOP_BROWSER_MAX_AGE = 30;
+// Refreshes running in this isolate, so concurrent misses share one query.
+const refreshing = new Map();
+
+async function cachedTop(url, p, env, ctx, corsHeaders) {
+  const cache = caches.default;
+  const key = topCacheKey(url, p);
+  const ttl = TOP_TTL[p.mode];
+  const hit = await cache.match(key);
+  if (hit) {
+    const age = (Date.now() - Number(hit.headers.get("X-Top-Cached-At") || 0)) / 1000;
+    if (age < ttl + TOP_STALE) {
+      const stale = age >= ttl;
+      if (stale) ctx.waitUntil(refreshTop(cache, key, p, env, ctx).catch(() => {}));
+      return topResponse(await hit.text(), stale ? "STALE" : "HIT", age, ttl, corsHeaders);
+    }
+  }
+  const body = await refreshTop(cache, key, p, env, ctx);
+  return topResponse(body, "MISS", 0, ttl, corsHeaders);
+}
+
+function refreshTop(cache, key, p, env, ctx) {
+  let pending = refreshing.get(key);
+  if (!pending) {
+    pending = (async () => {
+      const body = JSON.stringify({ ok: true, mode: p.mode, top: await topRows(env, p) });
+      ctx.waitUntil(cache.put(key, new Response(body, {
+        headers: {
+          "Content-Type": "application/json; charset=utf-8",
+          // How long the edge may keep the entry at all (fresh + stale).
+          "Cache-Control": `public, max-age=${TOP_TTL[p.mode] + TOP_STALE}`,
+          "X-Top-Cached-At": String(Date.now()),
+        },
+      })));
+      return body;
+    })().finally(() => refreshing.delete(key));
+    refreshing.set(key, pending);
+  }
+  return pending;
+}
+
+function topResponse(body, status, age, ttl, corsHeaders) {
+  return new Response(body, {
+    status: 200,
+    headers: {
+      "Content-Type": "application/json; charset=utf-8",
+      "Cache-Control": `public, max-age=${Math.min(ttl, TOP_BROWSER_MAX_AGE)}`,
+      "Age": String(Math.floor(age)),
+      "X-Cache": status,
+      "Access-Control-Expose-Headers": "X-Cache, Age",
+      ...corsHeaders,
+    },
+  });
+}
+
+// Rising compares the last RISING_RECENT_DAYS with the RISING_BASELINE_DAYS before.
+const RISING_RECENT_DAYS = 3;
+const RISING_BASELINE_DAYS = 14;
+// Rollups: trending windows kept in popularity_rollup, by days.
+const TRENDING_PERIODS = { 7: "trending7", 30: "trending30" };
+// Raw daily rows kept: the longest window (trending days=30) plus today.
+// Older rows are folded into events_monthly.
+const RETAIN_DAILY_DAYS = 31;
+// Serve from the rollup only if the cron refreshed it this recently.
+const ROLLUP_MAX_AGE = 1800;
+
+// Rows for `period` from the rollup, or null if it is stale or missing.
+async function rollupRows(env, period, limit, ids) {
+  let rows;
+  if (period === "rising") {
+    rows = env.DB.prepare(
+      `SELECT id, count AS recent_count, baseline AS baseline_count, score
+       FROM popularity_rollup WHERE period = ?1
+       ORDER BY score DESC, count DESC LIMIT ?2`
+    ).bind(period, limit);
+  } else if (ids.length) {
+    const marks = ids.map(() => "?").join(",");
+    rows = env.DB.prepare(
+      `SELECT id, count FROM popularity_rollup
+       WHERE period = ? AND id IN (${marks})
+       ORDER BY count DESC LIMIT ?`
+    ).bind(period, ...ids, limit);
+  } else {
+    rows = env.DB.prepare(
+      `SELECT id, count FROM popularity_rollup WHERE period = ?1
+       ORDER BY score DESC, count DESC LIMIT ?2`
+    ).bind(period, limit);
+  }
+  try {
+    const [meta, res] = await env.DB.batch([
+      env.DB.prepare(
+        `SELECT refreshed_at FROM popularity_rollup_meta
+         WHERE period = ?1 AND refreshed_at >= unixepoch() - ?2`
+      ).bind(period, ROLLUP_MAX_AGE),
+      rows,
+    ]);
+    if (!meta.results || !meta.results.length) return null;
+    return res.results || [];
+  } catch (_) {
+    return null;
+  }
+}
+
+// Statements for one refresh, run as a single D1 batch (one transaction).
+function rollupStatements(env, cutoff) {
+  const out = [
+    // Compact raw days older than the retention window into months.
+    env.DB.prepare(
+      `INSERT INTO events_monthly (month, id, clicks, views)
+       SELECT substr(day, 1, 7), id, SUM(clicks), SUM(views)
+       FROM events_daily WHERE day < ?1
+       GROUP BY substr(day, 1, 7), id
+       ON CONFLICT(month, id) DO UPDATE SET
+         clicks = clicks + excluded.clicks,
+         views = views + excluded.views`
+    ).bind(cutoff),
+    env.DB.prepare(`DELETE FROM events_daily WHERE day < ?1`).bind(cutoff),
+  ];
+  const clear = env.DB.prepare(`DELETE FROM popularity_rollup WHERE period = ?1`);
+  const stamp = env.DB.prepare(
+    `INSERT INTO popularity_rollup_meta (period, refreshed_at) VALUES (?1, unixepoch())
+     ON CONFLICT(period) DO UPDATE SET refreshed_at = excluded.refreshed_at`
+  );
+  for (const [days, period] of Object.entries(TRENDING_PERIODS)) {
+    out.push(
+      clear.bind(period),
+      env.DB.prepare(
+        `INSERT INTO popularity_rollup (period, id, count, baseline, score)
+         SELECT ?1, id, SUM(clicks), 0, SUM(clicks)
+         FROM events_daily
+         WHERE day >= date('now', ?2)
+         GROUP BY id
+         HAVING SUM(clicks) > 0`
+      ).bind(period, `${-(Number(days) - 1)} days`),
+      stamp.bind(period)
+    );
+  }
+  // Same formula and thresholds as the raw rising query in topRows(), without
+  // the LIMIT; tools/bench_popularity.py --rollups checks the two agree.
+  out.push(
+    clear.bind("rising"),
+    env.DB.prepare(
+      `INSERT INTO popularity_rollup (period, id, count, baseline, score)
+       SELECT 'rising', id, recent_count, baseline_count,
+         ROUND(
+           ((recent_count * recent_count) * ?3 * 1.0) /
+           ((baseline_count + 1) * ?4),
+           2
+         )
+       FROM (
+         SELECT
+           id,
+           SUM(CASE WHEN day >= date('now', ?1) THEN clicks ELSE 0 END) AS recent_count,
+           SUM(CASE WHEN day < date('now', ?1) THEN clicks ELSE 0 END) AS baseline_count
+         FROM events_daily
+         WHERE day >= date('now', ?2)
+         GROUP BY id
+       )
+       WHERE recent_count >= 2
+         AND (recent_count * ?3 * 1.0 / ?4) > baseline_count`
+    ).bind(
+      `${-(RISING_RECENT_DAYS - 1)} days`,
+      `${-(RISING_RECENT_DAYS + RISING_BASELINE_DAYS - 1)} days`,
+      RISING_BASELINE_DAYS,
+      RISING_RECENT_DAYS
+    ),
+    stamp.bind("rising")
+  );
+  return out;
+}
+
+async function refreshRollups(env) {
+  const cutoff = new Date(Date.now() - RETAIN_DAILY_DAYS * 86400000).toISOString().slice(0, 10);
+  await env.DB.batch(rollupStatements(env, cutoff));
+}
+
+// Limits for POST /api/clicks; a queue is a few seconds of one visitor's clicks.
+const MAX_BATCH_CLICKS = 100;
+const MAX_BATCH_IDS = 25;
+const MAX_ID_LENGTH = 200;
+
+// Statements recording `counts` ({ id: clicks }) for env.DB.batch():
+// the all-time counter and today's rolling-window row for each id.
+function clickStatements(env, counts) {
+  const allTime = env.DB.prepare(
+    `INSERT INTO clicks (id, count, updated_at)
+     VALUES (?1, ?2, unixepoch())
+     ON CONFLICT(id) DO UPDATE SET
+       count = count + ?2,
+       updated_at = unixepoch()`
+  );
+  const daily = env.DB.prepare(
+    `INSERT INTO events_daily (day, id, clicks, views)
+     VALUES (date('now'), ?1, ?2, 0)
+     ON CONFLICT(day, id) DO UPDATE SET
+       clicks = clicks + ?2`
+  );
+  const out = [];
+  for (const [id, n] of Object.entries(counts)) {
+    out.push(allTime.bind(id, n), daily.bind(id, n));
+  }
+  return out;
+}
+
 function json(obj, status = 200, extraHeaders = {}) {
   return new Response(JSON.stringify(obj), {
     status,
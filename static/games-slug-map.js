@@ -1 +0,0 @@
-window.__GAMES_BY_SLUG__ = {"advance-wars-returns": {"title": "Advance Wars Returns", "url": "https://www.romhacking.net/hacks/6012/"}, "age-of-the-ring": {"title": "Age of the Ring", "url": "https://www.moddb.com/mods/the-horse-lords-a-total-modification-for-bfme/news/age-of-the-ring-goes-standalone"}, "alleys-of-anime-2": {"title": "Alleys of Anime 2", "url": "https://romhackplaza.org/romhacks/alleys-of-anime-2-genesis/"}, "all-hell-unleashed": {"title": "All Hell Unleashed", "url": "https://8bitslasher.itch.io/ahu666"}, "altered-beast-remake": {"title": "Altered Beast Remake", "url": "https://gamejolt.com/games/alteredbeastremake/954814"}, "am2r": {"title": "AM2R", "url": "https://archive.org/details/am-2-r"}, "amc-squad": {"title": "AMC Squad", "url": "https://amcsquad.itch.io/game"}, "awful-emblem": {"title": "Awful Emblem", "url": "https://feuniverse.us/t/awful-emblem-version-1-0-release/3987/33"}, "banjo-kazooie-nostalgia-64": {"title": "Banjo Kazooie Nostalgia 64", "url": "https://youtu.be/-niehkOWOKg?si=Na1yDdAOiR7URSDP"}, "banjo-kazooie-the-corrupted-jiggys": {"title": "Banjo Kazooie The Corrupted Jiggys", "url": "https://youtu.be/d5lUT7SSAgg?si=OVsXeH6AOXAxka8k"}, "banjo-kazooie-the-lair-witch-project": {"title": "Banjo Kazooie The Lair Witch Project", "url": "https://youtu.be/dfOERKSm_UE?si=PQOBo8Oj9y1mpraa"}, "barkley-gaiden-the-son-of-dark-draker": {"title": "Barkley Gaiden: The Son of Dark Draker", "url": "https://tunicate.itch.io/barkley"}, "barkley-shut-up-and-jam-gaiden": {"title": "Barkley: Shut Up and Jam! Gaiden", "url": "https://archive.org/details/BarkleyShutUpAndJamGaiden"}, "battle-stormer-classics": {"title": "Battle Stormer Classics", "url": "https://gamejolt.com/games/battle-stormer-classics/14507"}, "bit-of-war-god-of-war-demake": {"title": "Bit of War - God of War Demake", "url": "https://holmadegames.itch.io/bit-of-war?ref=retrododo.com"}, "blaster-master-snes-port": {"title": "Blaster Master SNES Port", "url": "https://archive.org/details/blaster-master-snes"}, "blink-182-n64": {"title": "Blink 182 N64", "url": "https://alarconos.itch.io/videogame182"}, "bloodborne-psx-demake": {"title": "Bloodborne PSX Demake", "url": "https://archive.org/details/bloodborne-psx-demake-v-1.05"}, "bound-to-the-dark-world": {"title": "Bound to the Dark World", "url": "https://chromadeline.itch.io/bound-to-the-dark-world"}, "bubble-bobble-c64-remastered": {"title": "Bubble Bobble C64 Remastered", "url": "https://daves-retro-forge.itch.io/bubble-bobble-c64-remastered"}, "capcom-vs-square-parallel-destinies": {"title": "Capcom Vs Square: Parallel Destinies", "url": "https://sites.google.com/view/cvsqfangame/home?authuser=0"}, "capoeira-fighter-3-legacy-edition": {"title": "Capoeira Fighter 3 Legacy Edition", "url": "https://rubbersharkman.itch.io/capoeira-fighter-3-legacy-edition"}, "captain-america-and-the-avengers-remake": {"title": "Captain America and The Avengers Remake", "url": "https://gamejolt.com/games/capa/1006805"}, "card-miner": {"title": "Card Miner", "url": "https://www.bxfoundry.com/cardminer/"}, "castlemania-2": {"title": "Castlemania 2", "url": "https://www.smwcentral.net/?p=section&a=details&id=40149"}, "castlevania-aga": {"title": "Castlevania AGA", "url": "https://danteretrodev.itch.io/akumajou-dracula-aga"}, "castlevania-alternate-scarlet-symphony": {"title": "Castlevania: Alternate Scarlet Symphony", "url": "https://romhackplaza.org/romhacks/castlevania-alternate-scarlet-symphony-playstation/"}, "castlevania-chronicles-ii-simon-s-quest": {"title": "Castlevania Chronicles II: Simon's Quest", "url": "https://cdromance.org/windows/castlevania-chronicles-ii-simons-quest-fan-made-remake-2/"}, "castlevania-chronicles-iii-dracula-s-curse": {"title": "Castlevania Chronicles III: Dracula's Curse", "url": "https://cdromance.org/windows/castlevania-chronicles-iii-draculas-curse-fan-game-windows-pc/"}, "castlevania-eternity-of-sorrow": {"title": "Castlevania - Eternity of Sorrow", "url": "https://www.romhacking.net/hacks/9309/"}, "castlevania-haunted-castle-2": {"title": "Castlevania Haunted Castle 2", "url": "https://retrolorean.com/en/castlevania-haunted-castle-2-10730"}, "castlevania-haunted-castle-3-trevor-s-quest": {"title": "Castlevania Haunted Castle 3 Trevor's Quest", "url": "https://archive.org/details/hauntedcastle3"}, "castlevania-maria-renard-s-revenge-for-sega-saturn": {"title": "Castlevania Maria Renard's Revenge for Sega Saturn", "url": "https://z-team.itch.io/maria-renards-revenge-sega-saturn"}, "castlevania-revamped": {"title": "Castlevania ReVamped", "url": "https://archive.org/details/castlevania-re-vamped-ubuntu"}, "castlevania-rondo-of-the-night": {"title": "Castlevania: Rondo of the Night", "url": "https://www.romhacking.net/hacks/7919/"}, "castlevania-snes-port": {"title": "Castlevania SNES Port", "url": "https://archive.org/details/castlevania-snes"}, "castlevania-ii-simon-s-quest-snes-port": {"title": "Castlevania II Simon's Quest SNES Port", "url": "https://archive.org/details/castlevania-2_202511"}, "castlevania-symphony-of-the-night-ultimate": {"title": "Castlevania Symphony of the Night Ultimate", "url": "https://sotn2018br.blogspot.com/2025/11/original-name-japanese-dracula-x-gekka.html?m=1"}, "castlevania-the-lecarde-chronicles": {"title": "Castlevania The Lecarde Chronicles", "url": "https://castlevania-the-lecarde-chronicles.en.uptodown.com/windows"}, "castlevania-the-lecarde-chronicles-2": {"title": "Castlevania The Lecarde Chronicles 2", "url": "https://www.dsogaming.com/news/castlevania-the-lecarde-chronicles-2-is-a-new-2d-castlevania-fan-game-that-is-available-for-download/"}, "celeste-64": {"title": "Celeste 64", "url": "https://maddymakesgamesinc.itch.io/celeste64"}, "celeste-mario-s-zap-and-dash-deluxe": {"title": "Celeste Mario's Zap & Dash DELUXE!", "url": "https://romhackplaza.org/romhacks/celeste-marios-zap-dash-deluxe-nes/"}, "chainsawman": {"title": "Chainsawman", "url": "https://www.reddit.com/r/SteamDeck/comments/1k0xxae/chainsawman_fan_game_by_swammy_on_deck/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, "chip-n-dale-snes-port": {"title": "Chip N Dale SNES Port", "url": "https://archive.org/details/chipn-dale-snes"}, "chrono-trigger-prophet-s-guile": {"title": "Chrono Trigger: Prophet's Guile", "url": "https://www.romhacking.net/hacks/362/"}, "clock-tower-advance": {"title": "Clock Tower Advance", "url": "https://romhackplaza.org/homebrew/clock-tower-advance-game-boy-advance/"}, "club-penguin-journey": {"title": "Club Penguin Journey", "url": "https://play.cpjourney.net/"}, "color-a-dinosaur-snes-port": {"title": "Color A Dinosaur SNES Port", "url": "https://archive.org/details/color-adinosaur-snes"}, "command-and-conquer-combined-arms": {"title": "Command & Conquer Combined Arms", "url": "https://www.moddb.com/mods/command-conquer-combined-arms"}, "contra-force-snes-port": {"title": "Contra Force SNES Port", "url": "https://archive.org/details/contra-force-snes-beta"}, "contra-snes-port": {"title": "Contra SNES Port", "url": "https://archive.org/details/contra-snes_20251012"}, "crash-team-racing-retro-fueled": {"title": "Crash Team racing: Retro Fueled", "url": "https://romsfun.com/roms/playstation/crash-team-racing-retro-fueled.html"}, "cry-of-fear": {"title": "Cry of Fear", "url": "https://store.steampowered.com/app/223710/Cry_of_Fear/"}, "dc-task-force": {"title": "DC Task Force", "url": "https://gamejolt.com/games/DCTASKFORCE/962995"}, "dc-vs-marvel-2025": {"title": "DC Vs Marvel 2025", "url": "https://www.reddit.com/r/superman/comments/1p8a432/dc_vs_marvel_2025_game_final_version_release/"}, "dead-space-demake": {"title": "Dead Space Demake", "url": "https://brumley53.itch.io/dead-space-demake"}, "digimon-world-2-alternative": {"title": "Digimon World 2 Alternative", "url": "https://www.romhacking.net/hacks/7272/"}, "discworld-noir": {"title": "Discworld Noir", "url": "https://collectionchamber.blogspot.com/2015/03/discworld-noir.html?m=1"}, "donkey-kong-country-4-nes": {"title": "Donkey Kong Country 4 NES", "url": "https://www.romhacking.net/hacks/9084/"}, "doom-roguelike": {"title": "Doom roguelike", "url": "https://github.com/chaosforgeorg/drl"}, "doom-rpg": {"title": "Doom RPG", "url": "https://www.doomworld.com/forum/topic/129997-doom-rpg-port-reverse-engineering-update-version-022-source-code-release/"}, "doom-2-rpg": {"title": "Doom 2 RPG", "url": "https://www.doomworld.com/forum/topic/135602-doom-ii-rpg-port-reverse-engineering-version-01-source-code-release/"}, "doomscroll-browse-preview-and-play-thousands-of-user-made-doom-wads": {"title": "DoomScroll - Browse, Preview and Play Thousands of User-Made Doom WADS", "url": "https://doomscroll.cx/"}, "doom-32x-resurrection": {"title": "Doom 32X Resurrection", "url": "https://www.doomworld.com/forum/topic/119202-doom-32x-resurrection/"}, "double-dragon-one": {"title": "Double Dragon One", "url": "https://ozzyouzo.itch.io/double-dragon"}, "double-dragon-snes-port": {"title": "Double Dragon SNES Port", "url": "https://archive.org/details/double-dragon-snes"}, "double-dragon-2-snes-port": {"title": "Double Dragon 2 SNES Port", "url": "https://archive.org/details/double-dragon-ii-snes"}, "dr-mario-mania": {"title": "Dr. Mario Mania", "url": "https://toadfangames.itch.io/dr-mario-mania"}, "dr-robotnik-s-ring-racer-editor": {"title": "Dr. Robotnik's Ring Racer + Editor", "url": "https://www.kartkrew.org/news/2024-05-21_dr-robotniks-ring-racers-version-23.html"}, "dragons-dogma-online": {"title": "Dragons' Dogma Online", "url": "https://www.reddit.com/r/SteamDeck/comments/13ps9cv/dragons_dogma_online_working_on_steam_deck/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, "dragon-quest-1-remake": {"title": "Dragon Quest 1 Remake", "url": "https://www.woodus.com/den/resources/dq+nightfly.php"}, "driving-strikers-n64-port": {"title": "Driving Strikers N64 Port", "url": "https://github.com/SpookyIluha/driving-Strikers-64"}, "duck-tales-snes-port": {"title": "Duck Tales SNES Port", "url": "https://archive.org/details/duck-tales-snes_20250430"}, "earthbound-halloween-hack": {"title": "Earthbound Halloween Hack", "url": "https://web.archive.org/web/20190314101907/https://www.romhacking.net/hacks/1882/"}, "elden-ring-gameboy-demake": {"title": "Elden Ring Gameboy Demake", "url": "https://shin.itch.io/elden-ring-gb"}, "fable-20th-anniversary-demake": {"title": "Fable 20th Anniversary Demake", "url": "https://james222.itch.io/fable-gameboy-color-demake"}, "famicom-fighters": {"title": "Famicom Fighters", "url": "https://mcjimmy.net/famicomfighters.html"}, "famidash": {"title": "Famidash", "url": "https://kandowontu.itch.io/famidash"}, "fightcade-a-matchmaking-application-for-playing-retro-games-online": {"title": "Fightcade - a matchmaking application for playing retro games online", "url": "https://www.fightcade.com/"}, "final-fantasy-6-brave-new-world": {"title": "Final Fantasy 6 Brave New World", "url": "http://ngplus.net/index.php?/forums/topic/1262-brave-new-world-21-is-now-available/"}, "final-fantasy-renaissance": {"title": "Final Fantasy Renaissance", "url": "https://www.rengames.us/ffr"}, "final-fantasy-tactics-1-3": {"title": "Final Fantasy Tactics 1.3", "url": "https://www.romhacking.net/hacks/465/"}, "final-fight-md": {"title": "Final Fight MD", "url": "https://mxretrodev.itch.io/final-fight-md"}, "fire-emblem-the-four-kings": {"title": "Fire Emblem: The Four Kings", "url": "https://feuniverse.us/t/fe8-complete-fire-emblem-the-four-kings-4-11-24-update-now-with-weapon-reversal/7030"}, "fire-emblem-the-last-promise": {"title": "Fire Emblem: The Last Promise", "url": "https://www.feshrine.net/thelastpromise/"}, "fire-emblem-vision-quest": {"title": "Fire Emblem: Vision Quest", "url": "https://feuniverse.us/t/fe8-complete-fire-emblem-vision-quest-v3-by-pushwall-1-oct-22/3815"}, "five-nights-at-freddy-s-playstation-demake": {"title": "Five Nights At Freddy's - Playstation Demake", "url": "https://gamejolt.com/games/FNAF-ps1/832993"}, "five-nights-at-freddy-s-2-playstation-demake": {"title": "Five Nights At Freddy's 2 - Playstation Demake", "url": "https://gamejolt.com/games/FNAF2PSX/864126"}, "five-nights-at-freddy-s-2-wii-u-port": {"title": "Five Nights At Freddy's 2 - Wii U Port", "url": "https://the-latte-macchiato.itch.io/fnaf2-wiiu-edition"}, "fso-freespace-2-open": {"title": "FSO - Freespace 2 Open", "url": "https://wiki.hard-light.net/index.php/Manually_Installing_FreeSpace_2_Open"}, "f-zero-beginnings": {"title": "F-Zero Beginnings", "url": "https://romhackplaza.org/romhacks/f-zero-beginnings-snes/"}, "f-zero-deluxe": {"title": "F-Zero Deluxe", "url": "https://www.romhacking.net/hacks/8437/"}, "f-zero-x-climax": {"title": "F-Zero X Climax", "url": "https://www.romhacking.net/hacks/1487/"}, "g-zero": {"title": "G-Zero", "url": "https://gasega68k.itch.io/g-zero"}, "game-over-elysium": {"title": "Game Over: Elysium", "url": "https://romhacking.com/hack/game-over--elysium"}, "ghosts-n-demons": {"title": "Ghosts n Demons", "url": "https://bonusjz.itch.io/ghostsn-demons"}, "goldfinger-64": {"title": "Goldfinger 64", "url": "http://n64vault.com/ge-campaigns:goldfinger-64"}, "golden-axe-returns": {"title": "Golden Axe Returns", "url": "https://golden-axe-returns.en.uptodown.com/windows#google_vignette"}, "gta-2-configuration-guide-steam-deck": {"title": "GTA 2 Configuration Guide - Steam Deck", "url": "https://www.reddit.com/r/SteamDeck/comments/1ehk1ef/grand_theft_auto_2_on_steam_deck_configuration/?share_id=MYnhCG7TMdreb0dxTE5pK&utm_content=1&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1"}, "guitar-hero-world-tour-definitive-edition": {"title": "Guitar Hero World Tour Definitive Edition", "url": "https://ghwt.de/"}, "halo-zero": {"title": "Halo Zero", "url": "https://halo-zero.en.download.it/#google_vignette"}, "harry-potter-unreal": {"title": "Harry Potter Unreal", "url": "https://github.com/metallicafan212/HarryPotterUnrealWiki"}, "hayato-s-journey": {"title": "Hayato's Journey", "url": "https://master-linkuei.itch.io/hayatos-journey"}, "he-man": {"title": "He-Man", "url": "https://gamejolt.com/games/he-man/19434"}, "holocure": {"title": "Holocure", "url": "https://kay-yu.itch.io/holocure"}, "hyper-dragon-ball-z": {"title": "Hyper Dragon Ball Z", "url": "https://network.mugenguild.com/balthazar/hyperdbz/"}, "infested-island": {"title": "Infested Island", "url": "https://boss1995.itch.io/infestedisland"}, "infinity-nikki-on-steam-deck": {"title": "Infinity Nikki on Steam Deck", "url": "https://www.reddit.com/r/InfinityNikki/comments/1h6bqgf/how_i_installed_infinity_nikki_on_the_steam_deck/?share_id=F16A_DbjmheRIVUNcZZJC&utm_content=1&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1"}, "invincible": {"title": "Invincible", "url": "https://www.reddit.com/r/SteamDeck/comments/1k0weqf/invincible_fan_game_wip_by_swammys_on_deck/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, "jedi-knight-dark-forces-2-unreal-engine": {"title": "Jedi Knight Dark Forces 2 Unreal Engine", "url": "https://www.patreon.com/posts/dark-forces-2-v1-78228910?utm_medium=clipboard_copy&utm_source=copyLink&utm_campaign=postshare_creator&utm_content=join_link"}, "jumping-flash-doom-2-0": {"title": "Jumping Flash Doom 2.0", "url": "https://forum.zdoom.org/viewtopic.php?t=75591"}, "kid-icarus-snes-port": {"title": "Kid Icarus SNES Port", "url": "https://archive.org/details/kid-icarusnes-revb"}, "kirby-air-ride-deluxe": {"title": "Kirby Air Ride Deluxe", "url": "https://github.com/UnclePunch/KAR-Deluxe/releases"}, "kirby-s-dream-land-dx": {"title": "Kirby's Dream Land DX", "url": "https://www.romhacking.net/hacks/5213/"}, "kirby-s-dream-land-2-dx": {"title": "Kirby's Dream Land 2 DX", "url": "https://www.romhacking.net/hacks/7724/"}, "labyrinth-of-the-dragon": {"title": "Labyrinth of the Dragon", "url": "https://neshacker.itch.io/labyrinth-of-the-dragon"}, "left-4-dead-2-beta-restoration-project": {"title": "Left 4 Dead 2 Beta Restoration Project", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=413903495"}, "lethalmon": {"title": "Lethalmon", "url": "https://lethalmon-fangame.com/"}, "licar": {"title": "Licar", "url": "https://drummyfish.itch.io/licar"}, "life-force-salamander-snes-port": {"title": "Life Force Salamander SNES Port", "url": "https://archive.org/details/life-force-snes-v-1"}, "life-is-strange-love-is-strange": {"title": "Life is Strange Love is Strange", "url": "https://teamrumblebee.itch.io/lisvn"}, "ufo-alien-invasion": {"title": "UFO: Alien Invasion", "url": "https://sourceforge.net/projects/ufoai/"}, "n64recomplauncher": {"title": "N64RecompLauncher", "url": "https://github.com/SirDiabo/N64RecompLauncher"}, "make-a-good-mega-man-level": {"title": "Make a Good Mega Man Level", "url": "https://www.magmmlcontest.com/games.php"}, "maldita-castilla": {"title": "Maldita Castilla", "url": "https://locomalito.com/games/maldita-castilla"}, "manic-miners-a-lego-rock-raiders-remake": {"title": "Manic Miners - A LEGO Rock Raiders Remake", "url": "https://baraklava.itch.io/manic-miners"}, "mari0": {"title": "Mari0", "url": "https://stabyourself.net/mari0/"}, "mario-adventure3": {"title": "Mario Adventure3", "url": "https://marioadventure3.com/"}, "mario-builder-64": {"title": "Mario Builder 64", "url": "https://gamebanana.com/mods/514361"}, "mario-s-final-adventure": {"title": "Mario's Final Adventure", "url": "https://gamebanana.com/wips/65286"}, "mario-golf-n64-pro-edition-1-1": {"title": "Mario Golf N64 - Pro Edition 1.1", "url": "https://youtu.be/JCBegP3cCtk?si=kkOcvmFp-9A-099B"}, "mario-kart-wii-deluxe": {"title": "Mario Kart Wii Deluxe", "url": "https://wiki.tockdom.com/wiki/Mario_Kart_Wii_Deluxe"}, "mario-s-modules": {"title": "Mario's Modules", "url": "https://romhacking.com/hack/mario-s-modules"}, "mario-party-netplay": {"title": "Mario Party Netplay", "url": "https://www.reddit.com/r/SteamDeck/comments/141ghq0/new_releases_of_mario_party_netplay_for_pj64_and/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, "mario-syndrome": {"title": "Mario Syndrome", "url": "https://www.smwcentral.net/?p=viewthread&t=130911&page=1&pid=1656762#p1656762"}, "marvel-heroes-omega-project-tahiti": {"title": "Marvel Heroes Omega Project TAHITI", "url": "https://mhtahiti.com/"}, "marvel-heroes-server-emulator": {"title": "Marvel Heroes Server Emulator", "url": "https://github.com/Crypto137/MHServerEmu"}, "marvel-infinity-war": {"title": "Marvel Infinity War", "url": "https://gamejolt.com/games/marvel-infinity-war/201435"}, "maximum-carnage-remake": {"title": "Maximum Carnage Remake", "url": "https://gamejolt.com/games/MaximumCarnage/985396"}, "mega-man-snes-port": {"title": "Mega Man SNES Port", "url": "https://archive.org/details/mega-man-i-snes"}, "mega-man-2-5d": {"title": "Mega Man 2.5D", "url": "https://petersjostrand.com/"}, "mega-man-2-snes-port": {"title": "Mega Man 2 SNES Port", "url": "https://archive.org/details/mega-man-ii-snes_202510"}, "mega-man-3-snes-port": {"title": "Mega Man 3 SNES Port", "url": "https://archive.org/details/mega-man-iii-snes_202510"}, "mega-man-4-snes-port": {"title": "Mega Man 4 SNES Port", "url": "https://archive.org/details/mega-man-iv-snes-8-21-21-infidelity"}, "mega-man-5-snes-port": {"title": "Mega Man 5 SNES Port", "url": "https://archive.org/details/mega-man-v-snes_202510"}, "mega-man-6-snes-port": {"title": "Mega Man 6 SNES Port", "url": "https://archive.org/details/mega-man-vi-snes_202510"}, "mega-man-8x-demake-16bit": {"title": "Mega Man 8X Demake 16bit", "url": "https://sonicfangameshq.com/forums/showcase/mega-man-x8-16-bit.2184/"}, "mega-man-arena": {"title": "Mega Man Arena", "url": "https://www.megamanarena.com/"}, "mega-man-legends-rockman-dash-great-adventureon-5-islands": {"title": "Mega Man Legends - Rockman DASH: Great adventureon 5 Islands", "url": "https://www.rockman-corner.com/2025/03/rockman-dash-great-adventure-on-5.html?m=1"}, "mega-man-maker": {"title": "Mega Man Maker", "url": "https://megamanmaker.com/"}, "mega-man-revamped": {"title": "Mega Man Revamped", "url": "https://www.romhacking.net/hacks/9269/"}, "mega-man-2-revamped": {"title": "Mega Man 2 Revamped", "url": "https://www.romhacking.net/hacks/6983/"}, "mega-man-3-revamped": {"title": "Mega Man 3 Revamped", "url": "https://www.romhacking.net/hacks/4773/"}, "mega-man-rock-n-roll": {"title": "Mega Man Rock N Roll", "url": "https://dennisengelhard.com/rock-n-roll/"}, "mega-man-unlimited": {"title": "Mega Man Unlimited", "url": "https://megaphilx.com/index.php/home/games/mega-man-unlimited/"}, "mega-man-world-3-dx": {"title": "Mega Man World 3 DX", "url": "https://www.marcrobledo.com/game-boy/mega-man-world-3-dx/"}, "mega-man-world-4-dx": {"title": "Mega Man World 4 DX", "url": "https://www.marcrobledo.com/game-boy/mega-man-world-4-dx/"}, "mega-man-world-5-dx": {"title": "Mega Man World 5 DX", "url": "https://www.marcrobledo.com/game-boy/mega-man-world-5-dx/"}, "mega-man-x-omega-blaster-ultimate-edition": {"title": "Mega Man X: Omega Blaster Ultimate Edition", "url": "https://gamejolt.com/games/MMX-OmegaBlaster/438452"}, "mega-man-x4-knot-beret": {"title": "Mega Man X4 Knot Beret", "url": "https://ts02014553.itch.io/megaman-x4-kb"}, "mega-pang-megadrive-genesis-port-of-super-pang": {"title": "Mega Pang - Megadrive Genesis Port of Super Pang", "url": "https://rcampeador.itch.io/megapang"}, "mega-serval": {"title": "Mega Serval", "url": "https://store.steampowered.com/app/2009720/Mega_Serval/"}, "mega-splatterhouse": {"title": "Mega Splatterhouse", "url": "https://monsterbathchris.itch.io/mega-splatterhouse-demo"}, "metal-gear-mega-drive-port": {"title": "Metal Gear - Mega Drive Port", "url": "https://h0ffman.itch.io/metal-gear-md"}, "metal-slug-counter": {"title": "Metal Slug Counter", "url": "https://gamejolt.com/games/MetalSlugCounter/926766"}, "metroid-desolation": {"title": "Metroid Desolation", "url": "https://metroidconstruction.com/hack.php?id=732"}, "metroid-snes-port": {"title": "Metroid SNES Port", "url": "https://archive.org/details/metroid-snes_202504"}, "metroid-super-zero-mission": {"title": "Metroid Super Zero Mission", "url": "https://www.romhacking.net/hacks/742/"}, "mighty-final-fight-forever": {"title": "Mighty Final Fight Forever", "url": "https://bouncergames.com/project-forever/"}, "mike-tyson-s-punch-out-snes-port": {"title": "Mike Tyson's Punch Out!!! SNES Port", "url": "https://archive.org/details/mike-tysons-punch-out-snes_202510"}, "mini-doom-2": {"title": "Mini Doom 2", "url": "https://calaverastudio.itch.io/minidoom2"}, "mole-mania-dx": {"title": "Mole Mania DX", "url": "https://www.marcrobledo.com/game-boy/mole-mania-dx/"}, "monster-hunter-freedom-unite-complete": {"title": "Monster Hunter Freedom Unite Complete", "url": "https://fucomplete.github.io/"}, "monster-hunter-frontier-z-steam-deck-guide": {"title": "Monster Hunter Frontier Z - Steam Deck Guide", "url": "https://mholdschool.com/viewtopic.php?t=675"}, "moonring": {"title": "Moonring", "url": "https://dene.itch.io/moonring"}, "mortal-kombat-ii-arkade-edition-nes": {"title": "Mortal Kombat II Arkade Edition NES", "url": "https://www.romhacking.net/hacks/9073/"}, "mortal-kombat-defenders-of-the-earth": {"title": "Mortal Kombat Defenders of The Earth", "url": "https://mortal-kombat-defenders-of-the-earth.en.uptodown.com/windows"}, "mother-2-deluxe": {"title": "Mother 2 Deluxe", "url": "https://romsfun.com/roms/super-nintendo/mother-2-deluxe.html"}, "mushroom-kingdom-fusion": {"title": "Mushroom Kingdom Fusion", "url": "https://fusion-fangaming.itch.io/mushroom-kingdom-fusion"}, "mystery-of-solarus-dx-zelda-link-to-the-past-fan-game-nb-game-needs-to-be-in-zip-format-when-adding-to-solarus-launcher": {"title": "Mystery of Solarus DX - Zelda Link to the Past fan game - NB game needs to be in .zip format when adding to Solarus Launcher!!", "url": "https://www.solarus-games.org/games/the-legend-of-zelda-mystery-of-solarus-dx/"}, "nba-jam-50": {"title": "NBA Jam 50", "url": "https://www.romhacking.net/hacks/9097/"}, "need-for-speed-3-hot-pursuit-next-gen-patch": {"title": "Need For Speed 3 Hot Pursuit Next Gen Patch", "url": "https://rejzor.wordpress.com/need-for-speed-3-nextgen/"}, "need-for-speed-most-wanted-redux-v3": {"title": "Need For Speed Most Wanted Redux V3", "url": "https://youtu.be/9nnmeXzm1oQ?si=wwp4CJAIuCJT_Pld"}, "newer-super-mario-bros-wii": {"title": "Newer Super Mario Bros. Wii", "url": "https://newerteam.com/wii/"}, "nfl-blitz-2026": {"title": "NFL Blitz 2026", "url": "https://x.com/NFL_Blitz_Rez/status/1963389204106547573?s=20"}, "nfl-street-reborn": {"title": "NFL Street Reborn", "url": "https://www.reddit.com/r/NFLStreet/comments/159u73n/announcing_nfl_street_reborn/?share_id=mSXOT9YUPIo6Ar_b2oG0i&utm_content=1&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1"}, "nhl-94-2024-edition": {"title": "NHL '94 2024 Edition", "url": "https://www.romhacking.net/hacks/8267/"}, "nightmare-kart": {"title": "Nightmare Kart", "url": "https://b0tster.itch.io/nmkart"}, "nightvein": {"title": "NightVein", "url": "https://retrohammer.com/#games"}, "ninja-gaiden-shadow-dx": {"title": "Ninja Gaiden Shadow DX", "url": "https://www.marcrobledo.com/game-boy/ninja-gaiden-shadow-dx/"}, "ninja-gaiden-trilogy-snes-port": {"title": "Ninja Gaiden Trilogy SNES Port", "url": "https://archive.org/details/ninja-gaiden-trilogy-snes_202511"}, "not-tetris-2": {"title": "Not Tetris 2", "url": "https://stabyourself.net/nottetris2/"}, "order-66-a-fire-emblem-hack": {"title": "Order 66: A Fire Emblem Hack", "url": "https://feuniverse.us/t/fe8-order-66-a-fire-emblem-hack-v1-0-complete/33929"}, "outrun-cannonball": {"title": "Outrun - Cannonball", "url": "https://github.com/djyt/cannonball/wiki/Cannonball-Manual#getting-started"}, "outrun-gameboy-colour-port": {"title": "Outrun - Gameboy Colour Port", "url": "https://rocketshippark.itch.io/what-if-outrun"}, "paratopic-wii-u-port": {"title": "Paratopic - Wii U Port", "url": "https://thelatteteam.itch.io/paratopic-wii-u"}, "phantasy-star-online-blue-burst-on-steam-deck": {"title": "Phantasy Star Online Blue Burst on Steam Deck", "url": "https://www.pioneer2.net/community/threads/ephinea-pso-bb-on-steam-deck-official-thread.24850/"}, "playstation-home": {"title": "PlayStation Home", "url": "https://github.com/NagatoDEV/PlayStation-Home-Master-Archive"}, "pokemmo": {"title": "PokeMMO", "url": "https://pokemmo.com/en/downloads/"}, "pokemon-dark-rising": {"title": "Pokemon Dark Rising", "url": "https://www.pokeharbor.com/2021/04/pokemon-dark-rising-1-kaizo/"}, "pokemon-emerald-seaglass": {"title": "Pokemon Emerald Seaglass", "url": "https://ko-fi.com/s/4a1535f351"}, "pokemon-gadir-deluxe": {"title": "Pokemon Gadir Deluxe", "url": "https://www.pokecommunity.com/threads/pok%C3%A9mon-gadir-deluxe-complete-v-1-1.539451/"}, "pokemon-gamma-emerald": {"title": "Pokemon Gamma Emerald", "url": "https://undreamedpanic.itch.io/gamma-emerald#download"}, "pokemon-infinite-black-2": {"title": "Pokemon Infinite Black 2", "url": "https://frostfalcon.github.io/NCB2/"}, "pokemon-infinite-fusion": {"title": "Pokemon Infinite Fusion", "url": "https://www.pokemoncoders.com/pokemon-infinite-fusion/"}, "pokemon-lazarus": {"title": "Pokemon Lazarus", "url": "https://ko-fi.com/s/9ae89c2476"}, "pokemon-luminescent-platinum": {"title": "Pokemon Luminescent Platinum", "url": "https://www.reddit.com/r/EmuDeck/comments/1hpi1a9/pok%C3%A9mon_luminescent_platinum_a_guide_ver_10/?share_id=OSwJMWi-KH-OlAQtSbJl1&utm_content=2&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1"}, "pokemon-super-mystery-dungeon-story-echoes-of-yesterday": {"title": "Pokemon Super Mystery Dungeon Story: Echoes of Yesterday", "url": "https://hacks.skytemple.org/h/echoes_yesterday?ref=retrododo.com"}, "pokemon-odyssey": {"title": "Pokemon Odyssey", "url": "https://www.pokecommunity.com/threads/pokemon-odyssey-complete-v4-1-1.488536/"}, "pokemon-prism": {"title": "Pokemon Prism", "url": "https://rainbowdevs.com/title/prism/"}, "pokemon-rejuvenation": {"title": "Pokemon Rejuvenation", "url": "https://www.rebornevo.com/rejuvenation/"}, "pokemon-scrambled-scarlet": {"title": "Pokemon Scrambled Scarlet", "url": "https://www.reddit.com/r/PokemonROMhacks/comments/1lz2rwv/pokemon_scrambled_scarlet_violet_emerald_a_gba/"}, "pokemon-stadium-club": {"title": "Pokemon Stadium Club", "url": "https://eeveeexpo.com/threads/8185/"}, "pokemon-unbound": {"title": "Pokemon Unbound", "url": "https://www.pokeharbor.com/2022/08/pokemon-unbound/"}, "pokemon-unbreakable-ties": {"title": "Pokemon Unbreakable Ties", "url": "https://pokehostel.com/pokemon-unbreakable-ties/"}, "pokemon-uranium": {"title": "Pokemon Uranium", "url": "https://www.reddit.com/r/pokemonuranium/comments/m9yvd6/download_links/?utm%5C_source=share&utm%5C_medium=android%5C_app&utm%5C_name=androidcss&utm%5C_term=1&utm%5C_content=share%5C_button"}, "power-bomberman": {"title": "Power Bomberman", "url": "https://www.bombermanboard.com/viewtopic.php?t=1925"}, "power-rangers-it-s-morphin-time": {"title": "Power Rangers: It's Morphin' Time", "url": "https://popherogames.com/"}, "argentum-age": {"title": "Argentum Age", "url": "http://argentumage.com/"}, "quake-brutalist-jam-3-standalone-and-mod": {"title": "Quake Brutalist Jam 3 - Standalone & Mod", "url": "https://qbj3.slipseer.com/"}, "rayman-lum-o-grams": {"title": "Rayman Lum'o'Grams", "url": "https://sonicfangameshq.com/forums/showcase/rayman-lumograms-30th-anniversary-demo.2637/puzzle"}, "rayman-redemption": {"title": "Rayman Redemption", "url": "https://gamejolt.com/p/version-1-1-4-has-been-released-this-update-only-fixes-one-bug-tha-un2pthix"}, "resident-evil-2-fps": {"title": "Resident Evil 2 FPS", "url": "https://perroautonomo.itch.io/biohazard-2"}, "resident-evil-4-hd-project": {"title": "Resident Evil 4 HD Project", "url": "https://re4hd.com/?page%5C_id=9654"}, "resident-evil-the-mercenaries-3d-hd-project": {"title": "Resident Evil: The Mercenaries 3D HD Project", "url": "https://residentevilmodding.boards.net/thread/20599/resident-evil-mercenaries-3d-project"}, "residentvania": {"title": "Residentvania", "url": "https://oco.itch.io/residentvania?ac=qfCyYFQF-yt"}, "rick-dangerous-dx-megadrive-genesis-port": {"title": "Rick Dangerous DX - Megadrive Genesis Port", "url": "https://z-team.itch.io/rick-dangerous-dx"}, "rockband-3-deluxe": {"title": "Rockband 3 Deluxe", "url": "https://rb3dx.milohax.org/"}, "rygar-snes-port": {"title": "Rygar SNES Port", "url": "https://archive.org/details/rygar-v-1.0"}, "secret-of-mana-plus": {"title": "Secret of Mana Plus", "url": "https://www.romhacking.net/hacks/8491/"}, "sega-rally-2-25th-anniversary-edition": {"title": "Sega Rally 2 - 25th Anniversary Edition", "url": "https://archive.org/details/sega-rally-2-25th-anniversary"}, "sega-vs-capcom-the-next-level": {"title": "Sega vs Capcom: The Next Level", "url": "https://makingthecrossover.fandom.com/wiki/SEGA_vs._Capcom:_The_Next_Level"}, "shenmue-dreams-of-saturn": {"title": "Shenmue - Dreams of Saturn", "url": "https://www.shenmuedojo.com/forum/index.php?threads/a-shenmue-story-new-shenmue-journey-from-george-kitchen.5470/"}, "shin-megami-tensei-nocturne-hardtype": {"title": "Shin Megami Tensei: Nocturne - Hardtype", "url": "https://www.romhacking.net/hacks/3299/"}, "silent-hill-2-enhanced-edition": {"title": "Silent Hill 2: Enhanced Edition", "url": "https://archive.org/details/silent-hill-2.7z_202506"}, "signalis-gameboy-demake": {"title": "Signalis Gameboy Demake", "url": "https://jayjay-1992.itch.io/signalis-gb"}, "skies-of-arcadia-legends-maeson": {"title": "Skies of Arcadia: Legends Maeson", "url": "https://www.romhacking.net/hacks/2859/"}, "slippi-super-smash-brothers-melee-online-pvp-with-rollback-netcode": {"title": "Slippi - Super Smash Brothers Melee Online PvP with Rollback Netcode", "url": "https://slippi.gg/"}, "smash-64-remix": {"title": "Smash 64 Remix", "url": "https://smash64.online/remix/"}, "snk-vs-capcom-c64-c128-port": {"title": "SNK vs Capcom C64 C128 Port", "url": "https://c64universe.com/2025/06/07/snk-vs-capcom-stronger-edition-for-c64-c128-new-demo/"}, "sonic-1-forever": {"title": "Sonic 1 Forever", "url": "https://teamforeveronline.wixsite.com/home/sonic-1-forever"}, "sonic-2-absolute": {"title": "Sonic 2 Absolute", "url": "https://teamforeveronline.wixsite.com/home/sonic-2-absolute"}, "sonic-2-gear-shift": {"title": "Sonic 2 Gear Shift", "url": "https://hedgehogtechnicalinstitute.com/forum/viewtopic.php?t=199&sid=5f8ee328149e8550e942b1dae1303948"}, "sonic-2-hd": {"title": "Sonic 2 HD", "url": "https://sonic2hd.com/download/"}, "sonic-and-the-hedgehogs": {"title": "Sonic And The Hedgehogs", "url": "https://evilbritishguy.itch.io/sonic-and-the-hedgehogs"}, "sonic-3-angel-island-revisited": {"title": "Sonic 3 Angel Island Revisited", "url": "https://sonic3air.org/"}, "sonic-after-the-sequel-dx": {"title": "Sonic After The Sequel DX", "url": "https://forums.sonicretro.org/threads/sonic-after-the-sequel-dx.37097/"}, "sonic-amiga-tech-demo": {"title": "Sonic Amiga Tech Demo", "url": "https://retroric.itch.io/sonic-the-hedgehog-amiga-tech-demo"}, "sonic-and-the-moon-facility": {"title": "Sonic & the Moon Facility", "url": "https://gamejolt.com/games/sonicmoonfacility/975042"}, "sonic-classic-heroes": {"title": "Sonic Classic Heroes", "url": "https://gamejolt.com/games/scheroes/884938"}, "sonic-daybreak": {"title": "Sonic Daybreak", "url": "https://gamejolt.com/games/sonicdaybreak/1015062"}, "sonic-erazor": {"title": "Sonic ERaZor", "url": "https://sonic-erazor.selbi.club/"}, "sonic-galactic": {"title": "Sonic Galactic", "url": "https://sonicgalactic.github.io/"}, "sonic-gt": {"title": "Sonic GT", "url": "https://gamejolt.com/games/Sonic-GT/533291"}, "sonic-gx": {"title": "Sonic GX", "url": "https://www.pouet.net/prod.php?which=105245"}, "sonic-j-online-physics-demo": {"title": "Sonic J Online Physics Demo", "url": "https://gamejolt.com/games/sonic_j/261887"}, "sonic-master-system-remake": {"title": "Sonic Master System Remake", "url": "https://gamejolt.com/games/sonicsmsremake/639432"}, "sonic-omens": {"title": "Sonic Omens", "url": "https://gamejolt.com/games/SonicOmens/469351"}, "sonic-project-06": {"title": "Sonic Project 06", "url": "https://archive.org/details/project-06-update-3.5"}, "sonic-project-forestation": {"title": "Sonic Project Forestation", "url": "https://gamejolt.com/games/forestation/918619"}, "sonic-the-hedgehog-rpg": {"title": "Sonic the Hedgehog rpg", "url": "https://www.sonic-rpg.com/"}, "sonic-riders-tournament-edition": {"title": "Sonic Riders Tournament Edition", "url": "https://www.sonicriders.org/"}, "sonic-robo-blast-2": {"title": "Sonic Robo Blast 2", "url": "https://www.srb2.org/"}, "sonic-robo-blast-32x": {"title": "Sonic Robo Blast 32X", "url": "https://ssntails.srb2.org/srb32x/"}, "sonic-robo-blast-2-kart": {"title": "Sonic Robo Blast 2 Kart", "url": "https://mb.srb2.org/addons/srb2kart.2435/"}, "sonic-smackdown": {"title": "Sonic Smackdown", "url": "https://arcforged.itch.io/sonic-smackdown"}, "sonic-time-twisted": {"title": "Sonic Time Twisted", "url": "https://overboundn.itch.io/sonic-time-twisted"}, "sonic-triple-trouble-16-bit": {"title": "Sonic Triple Trouble 16-bit", "url": "https://gamejolt.com/games/sonictripletrouble16bit/322794"}, "sonic-ultrasaturn": {"title": "Sonic UltraSaturn", "url": "https://www.sonicfangameshq.com/forums/showcase/sonic-ultrasaturn.2059/"}, "sonic-utopia": {"title": "Sonic Utopia", "url": "https://sonicfangameshq.com/forums/showcase/sonic-utopia-early-demo.33/"}, "soul-calibur-swords-of-destiny": {"title": "Soul Calibur: Swords of Destiny", "url": "https://gamejolt.com/games/Soul_Calibur_Swords_of_Destiny/910254"}, "space-quest-ii-vga-deluxe": {"title": "Space Quest II - VGA Deluxe", "url": "https://infamousadventures.itch.io/space-quest-ii-vga-remake"}, "spartan-survivors": {"title": "Spartan Survivors", "url": "https://store.steampowered.com/app/3997630/Spartan_Survivors/"}, "squid-games-gameboy-fan-game": {"title": "Squid Games - Gameboy Fan Game", "url": "https://64bitsanimation.itch.io/squid-game-boy?ref=retrododo.com"}, "star-fox-event-horizon": {"title": "Star Fox: Event Horizon", "url": "https://starfoxeh.weebly.com/"}, "star-fox-ex-snes": {"title": "Star Fox EX (SNES)", "url": "https://romhackplaza.org/romhacks/starfox-ex-super-nintendo/"}, "starship-troopers-2005": {"title": "Starship Troopers 2005", "url": "https://www.reddit.com/r/SteamDeck/comments/13t36hr/starship_troopers_2005_on_deck_how_to_setup_etc/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, "street-fighter-one-remake": {"title": "Street Fighter One Remake", "url": "https://gamejolt.com/games/StreetFighterone/690503"}, "street-fighter-z": {"title": "Street Fighter Z", "url": "https://juegosdemugen.com/en/street-fighter-z-mugen-2"}, "street-fighter-x-mega-man": {"title": "Street Fighter x Mega Man", "url": "https://gamebanana.com/mods/402226"}, "streets-of-rage-remake": {"title": "Streets of Rage Remake", "url": "https://street-rage-remake.en.uptodown.com/windows#google_vignette"}, "streets-of-rage-2-final-fight-crossover": {"title": "Streets of Rage 2 - Final Fight Crossover", "url": "https://www.romhacking.net/hacks/4527/"}, "streets-of-rage-2-new-era": {"title": "Streets of Rage 2 - New Era", "url": "https://www.sor2newera.com/"}, "streets-of-rage-2-teenage-mutant-ninja-turtles-hack": {"title": "Streets of Rage 2 - Teenage Mutant Ninja Turtles hack", "url": "https://www.romhacking.net/hacks/7399/"}, "sugar-ghouls": {"title": "Sugar Ghouls", "url": "https://sodaraptor.itch.io/sugar-ghouls"}, "super-dodgeball-snes-port": {"title": "Super Dodgeball SNES Port", "url": "https://archive.org/details/super-super-dodgeball"}, "super-freaks-ultimate-edition-turbo": {"title": "Super Freaks Ultimate Edition Turbo", "url": "https://mr-freaks.itch.io/super-freaks-1-ultimate-edition"}, "super-mario-3-mario-forever": {"title": "Super Mario 3 Mario Forever", "url": "https://super-mario-3-mario-forever.en.uptodown.com/windows"}, "super-mario-3d-all-stars-deluxe-launcher-pack": {"title": "Super Mario 3D All-Stars Deluxe Launcher Pack", "url": "https://gitlab.com/Minibattle/super-mario-3d-all-stars-deluxe"}, "super-mario-64-coopware": {"title": "Super Mario 64: CoopWare", "url": "https://mods.sm64coopdx.com/mods/coopware.993/"}, "super-mario-64-last-impact": {"title": "Super Mario 64: Last Impact", "url": "https://www.romhacking.net/hacks/5964/"}, "super-mario-64-splitscreen-multiplayer": {"title": "Super Mario 64 Splitscreen Multiplayer", "url": "https://romhacking.com/hack/multiplayer-64-splitscreen-multiplayer"}, "super-mario-all-stars-launcher-for-super-mario-world": {"title": "Super Mario All-stars Launcher For Super Mario World", "url": "https://github.com/qurious-pixel/SMAS_Launcher"}, "super-mario-and-the-rainbow-stars": {"title": "Super Mario & the Rainbow Stars", "url": "https://superstarshi.github.io/smatrs/download"}, "super-mario-brothers-3-level-design-contest": {"title": "Super Mario Brothers 3 Level Design Contest", "url": "https://www.romhacking.net/hacks/9082/"}, "super-mario-bros-cd": {"title": "Super Mario Bros. CD", "url": "https://famicomcd.org/smbcd"}, "super-mario-brothers-flashback": {"title": "Super Mario Brothers Flashback", "url": "https://mfgg.net/index.php?act=resdb&param=02&c=2&id=37605"}, "super-mario-brothers-hack-portal": {"title": "Super Mario Brothers Hack Portal", "url": "https://smbarena.com/search?p=0"}, "super-mario-brothers-movie": {"title": "Super Mario Brothers Movie", "url": "https://speedymcfly.itch.io/the-super-mario-bros-movie-video-game"}, "super-mario-bros-wonder-demake": {"title": "Super Mario Bros. Wonder Demake", "url": "https://shafox.itch.io/super-mario-bros-wonder"}, "super-mario-buys-bread": {"title": "Super Mario Buys Bread", "url": "https://hedgehogtechnicalinstitute.com/forum/viewtopic.php?t=193&sid=5f8ee328149e8550e942b1dae1303948"}, "super-mario-galaxy-63": {"title": "Super Mario Galaxy 63", "url": "https://gamebanana.com/mods/619649"}, "super-mario-kart-zx": {"title": "Super Mario Kart ZX", "url": "https://srperez.itch.io/smk-zx"}, "super-mario-meltdown": {"title": "Super Mario Meltdown", "url": "https://romhacking.com/hack/super-mario-meltdown"}, "super-mario-star-road": {"title": "Super Mario Star Road", "url": "https://www.romhacking.net/hacks/873/"}, "super-mario-sunburn": {"title": "Super Mario Sunburn", "url": "https://romsfun.com/roms/gamecube/super-mario-sunburn.html"}, "super-mario-sunshine-definitive-edition": {"title": "Super Mario Sunshine Definitive Edition", "url": "https://www.reddit.com/r/SteamDeck/comments/xhybbd/super_mario_sunshine_definitive_edition/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, "super-mario-unimaker": {"title": "Super Mario UniMaker", "url": "https://ninstars.itch.io/unimaker"}, "super-mario-war": {"title": "Super Mario War", "url": "http://smwstuff.net/game"}, "pro-evolution-soccer-5": {"title": "Pro Evolution Soccer 5​", "url": "https://www.myabandonware.com/game/world-soccer-winning-eleven-9-g2k"}, "super-mario-world-return-to-dinosaur-land": {"title": "Super Mario World Return to Dinosaur Land", "url": "https://www.smwcentral.net/?a=details&id=4990&p=section"}, "super-mario-world-random-revolution": {"title": "Super Mario World Random Revolution", "url": "https://www.smwcentral.net/?p=viewthread&t=104877"}, "super-mario-world-simpatico": {"title": "Super Mario World - Simpatico", "url": "https://www.smwcentral.net/?p=section&a=details&id=38712"}, "super-mario-world-the-princess-rescue-3": {"title": "Super Mario World - The Princess Rescue 3", "url": "https://www.smwcentral.net/?p=section&a=details&id=35294"}, "super-metroid-x-fusion": {"title": "Super Metroid: X-Fusion", "url": "https://metroidconstruction.com/hack.php?id=837"}, "super-smash-brothers-brawl-project": {"title": "Super Smash Brothers Brawl - Project+", "url": "https://projectplusgame.com/"}, "super-smash-bros-crusade": {"title": "Super Smash Bros. Crusade", "url": "https://smash-crusade.itch.io/crusade"}, "super-smash-flash-2": {"title": "Super Smash Flash 2", "url": "https://www.supersmashflash.com/play/ssf2/"}, "super-smash-land": {"title": "Super Smash Land", "url": "https://www.supersmashland.com/"}, "super-star-wars-holiday-special": {"title": "Super Star Wars Holiday Special", "url": "https://master-linkuei.itch.io/super-star-wars-holiday-special"}, "super-star-wars-redux": {"title": "Super Star Wars Redux", "url": "https://romhackplaza.org/romhacks/super-star-wars-redux-snes/"}, "super-star-wars-return-of-the-jedi-redux": {"title": "Super Star Wars - Return of the Jedi Redux", "url": "https://romhackplaza.org/romhacks/super-star-wars-return-of-the-jedi-redux-snes/"}, "super-star-wars-the-empire-strikes-back-redux": {"title": "Super Star Wars - The Empire Strikes Back Redux", "url": "https://romhackplaza.org/romhacks/super-star-wars-the-empire-strikes-back-redux-snes/"}, "sven-co-op": {"title": "Sven Co-op", "url": "https://store.steampowered.com/app/225840/Sven_Coop/"}, "tango-mega-man-battle-network-with-rollback-netcode": {"title": "Tango - Mega Man Battle Network with Rollback Netcode", "url": "https://tango.n1gp.net/"}, "tanks-rebirth": {"title": "Tanks Rebirth", "url": "https://github.com/RighteousRyan1/TanksRebirth/releases"}, "tecmo-super-bowl-2024": {"title": "Tecmo Super Bowl 2024", "url": "https://tecmobowl.org/files/file/868-tecmo-super-bowl-2024-final-edition/"}, "teenage-mutant-ninja-turtles-snes-port": {"title": "Teenage Mutant Ninja Turtles SNES Port", "url": "https://archive.org/details/teenage-mutant-ninja-turtles-snes_202511"}, "teenage-mutant-ninja-turtles-shredder-s-re-revenge": {"title": "Teenage Mutant Ninja Turtles: Shredder's Re-Revenge", "url": "https://www.romhacking.net/hacks/7399/"}, "tetris-rosy-retrospection-dx": {"title": "Tetris Rosy Retrospection DX", "url": "https://www.romhacking.net/hacks/8259/"}, "the-ark": {"title": "The Ark", "url": "https://www.aeriform.io/0232a57db92c1c62161124a6ed855f96/ark"}, "the-bells-of-arietta": {"title": "The Bells of Arietta", "url": "https://www.mediafire.com/file/a0s5xczjzfz2ku0/The+Bells+Arietta+v1.2.0.zip/file"}, "the-driver-syndicate": {"title": "The Driver Syndicate", "url": "https://driver-syndicate.com/"}, "the-goonies-msx-remake": {"title": "The Goonies MSX Remake", "url": "https://goonies.jorito.net/"}, "the-legend-of-banjo-kazooie-the-bear-waker-deluxe": {"title": "The Legend of Banjo-Kazooie The Bear Waker Deluxe", "url": "https://youtu.be/lBObk1gfPaY?si=_vb4c14JIBFqMZD7"}, "the-legend-of-banjo-kazooie-the-jiggies-of-time": {"title": "The Legend of Banjo-Kazooie - The Jiggies of Time", "url": "https://www.romhacking.net/hacks/6398/"}, "the-legend-of-zelda-ganon-s-deception": {"title": "The Legend of Zelda: Ganon's Deception", "url": "https://www.romhacking.net/hacks/2476/"}, "the-legend-of-zelda-master-of-time": {"title": "The Legend of Zelda: Master of Time", "url": "https://www.romhacking.net/hacks/5801/"}, "the-legend-of-zelda-mirror-of-worlds": {"title": "The Legend of Zelda: Mirror of Worlds", "url": "https://www.romhacking.net/hacks/9203/"}, "the-legend-of-zelda-ocarina-of-time-ultimate-trial": {"title": "The Legend of Zelda: Ocarina of Time Ultimate Trial", "url": "https://www.romhacking.net/hacks/8640/"}, "the-legend-of-zelda-reality-estate": {"title": "The Legend of Zelda: Reality Estate", "url": "https://www.romhacking.net/hacks/9117/"}, "the-legend-of-zelda-sealed-palace": {"title": "The Legend of Zelda: Sealed Palace", "url": "https://www.romhacking.net/hacks/7663/"}, "the-legend-of-zelda-snes-port": {"title": "The Legend of Zelda SNES Port", "url": "https://archive.org/details/the-legend-of-zelda-snes_202510"}, "the-legend-of-zelda-the-missing-link": {"title": "The Legend of Zelda: The Missing Link", "url": "https://www.romhacking.net/hacks/5334/"}, "the-legend-of-zelda-voyager-of-time": {"title": "The Legend of Zelda: Voyager of Time", "url": "https://www.romhacking.net/hacks/5797/"}, "the-lost-vikings-ragnarok-edition": {"title": "The Lost Vikings: Ragnarok Edition", "url": "https://www.romhacking.net/hacks/8985/"}, "the-patchmaker-s-workshop": {"title": "The Patchmaker's Workshop", "url": "https://romhacking.com/hack/the-patchmaker-s-workshop"}, "thief-the-black-parade": {"title": "Thief The Black Parade", "url": "https://www.thiefguild.com/fanmissions/26275/thief-the-black-parade?campaign_details=t#campaign-details"}, "tiny-toon-adventures-dx": {"title": "Tiny Toon adventures DX", "url": "https://romhackplaza.org/romhacks/tiny-toon-adventures-dx-babs-big-break-colorization-patch-for-game-boy-color-game-boy/"}, "tmnt-rescue-palooza": {"title": "TMNT Rescue Palooza", "url": "https://gamejolt.com/games/TMNT-Rescue-Palooza/39658"}, "tony-hawk-s-american-wasteland-rethawed": {"title": "Tony Hawk's American Wasteland reTHAWed", "url": "https://rethawed.com/"}, "toontown-rewritten": {"title": "Toontown Rewritten", "url": "https://www.toontownrewritten.com/"}, "turrican-128k-remaster": {"title": "Turrican 128K Remaster", "url": "https://www.moodler.pl/download/turrican-128kb/"}, "ultimate-doom-32x-resurrection": {"title": "Ultimate Doom 32X Resurrection", "url": "https://www.doomworld.com/forum/topic/155631-ultimate-doom-32x-resurrection/"}, "ultimate-sonic-smackdown": {"title": "Ultimate Sonic Smackdown", "url": "https://arcforged.itch.io/ultimatesonicsmackdown"}, "ultimate-trial": {"title": "Ultimate Trial", "url": "https://github.com/RichieUltimate/ultimate-trial/tree/main"}, "undefeated": {"title": "Undefeated", "url": "https://store.steampowered.com/app/1116960/UNDEFEATED/"}, "undertale-yellow-an-undertale-prequel": {"title": "Undertale Yellow - An Undertale Prequel", "url": "https://gamejolt.com/games/UndertaleYellow/136925"}, "wario-s-conquest-super-mario-land-2-reclaimed": {"title": "Wario's Conquest - Super Mario Land 2 Reclaimed", "url": "https://gamejolt.com/games/SML2WCremake/895658"}, "warzone-2100": {"title": "Warzone 2100", "url": "https://wz2100.net/"}, "wega-and-the-lost-media": {"title": "Wega & The Lost Media", "url": "https://team-lost-media.github.io/Pages/watlm.html#About_section"}, "wolfenstein-rpg": {"title": "Wolfenstein RPG", "url": "https://www.doomworld.com/forum/topic/151475"}, "x-men-arcade-remake": {"title": "X-Men Arcade Remake", "url": "https://gamejolt.com/games/XMKO/994483"}, "x-men-mutant-apocalypse-remake": {"title": "X-Men Mutant Apocalypse Remake", "url": "https://gamejolt.com/games/XMENMA/978953"}, "xenosaga-pied-piper-fan-recreation": {"title": "Xenosaga Pied Piper - Fan Recreation", "url": "https://cyclonefox.itch.io/xenosaga-pied-piper"}, "yarg-yet-another-rhythm-game": {"title": "YARG - Yet Another Rhythm Game", "url": "https://yarg.in/"}, "yume-nikki-ps": {"title": "Yume Nikki PS", "url": "https://eliasdaler.itch.io/yume-nikki-ps1"}, "zelda3-parallel-worlds": {"title": "Zelda3 Parallel Worlds", "url": "https://www.romhacking.net/hacks/197/"}, "zelda-dungeons-of-infinity": {"title": "Zelda Dungeons of Infinity", "url": "https://justinbohemier.wixsite.com/portfolio/game-design"}, "zelda-s-adventuredx": {"title": "Zelda's adventureDX", "url": "https://john-lay.itch.io/zeldas-adventure/devlog/1107281/major-update"}, "zelda-ii-the-adventures-of-link-snes-port": {"title": "Zelda II The adventures of Link SNES Port", "url": "https://archive.org/details/zelda-ii-the-adventure-of-link-snes_202510"}, "zelda-ocarina-of-time-unreal-engine-remake": {"title": "Zelda Ocarina of Time - Unreal Engine Remake", "url": "https://www.patreon.com/collection/912225?view=expanded"}, "zelda-oni-link-begins": {"title": "Zelda: Oni Link Begins", "url": "https://sourceforge.net/projects/zeldaolb/"}, "zenless-zone-zero-on-steam-deck": {"title": "Zenless Zone Zero on Steam Deck", "url": "https://youtu.be/uZEZy7jxj30?si=yJFMHmmYkM1buZz6"}, "zombies-ate-my-neighbours-escape-the-house": {"title": "Zombies Ate My Neighbours: Escape The House!", "url": "https://romhackplaza.org/romhacks/escape-the-house-genesis/"}, "zquest-classic-zelda": {"title": "ZQuest Classic (Zelda)", "url": "https://www.purezc.net/forums/index.php?showtopic=78707"}, "zquest-classic-zelda-quest-lists": {"title": "ZQuest Classic (Zelda) - Quest Lists", "url": "https://www.purezc.net/index.php?page=featured"}, "0-a-d": {"title": "0 A.D.", "url": "https://play0ad.com/"}, "2-ship-2-harkinian-the-legend-of-zelda-majora-s-mask-pc-port": {"title": "2 Ship 2 Harkinian - The Legend of Zelda Majora's Mask PC Port", "url": "https://github.com/HarbourMasters/2ship2harkinian"}, "the-legend-of-zelda-majora-s-mask-recompilation": {"title": "The Legend of Zelda: Majora's Mask Recompilation", "url": "https://github.com/Zelda64Recomp/Zelda64Recomp"}, "r-e-l-i-v-e-abe-s-odyssey-exodus-pc-port": {"title": "R.E.L.I.V.E. - Abe's Odyssey Exodus PC Port", "url": "https://aliveteam.github.io/"}, "acemulator-asheron-s-call-server-emulator": {"title": "ACEmulator - Asheron's Call Server Emulator", "url": "https://github.com/ACEmulator/ACE"}, "aleph-one-marathon-trilogy": {"title": "Aleph One - Marathon Trilogy", "url": "https://github.com/Aleph-One-Marathon/alephone"}, "ambermoon-decompilation": {"title": "Ambermoon Decompilation", "url": "https://github.com/Pyrdacor/Ambermoon.net"}, "anarch": {"title": "Anarch", "url": "https://drummyfish.gitlab.io/anarch/"}, "apotris": {"title": "Apotris", "url": "https://akouzoukos.com/apotris"}, "arkhenaten": {"title": "Arkhenaten", "url": "https://dalerank.itch.io/akhenaten"}, "arx-libertatis-arx-fatalis-port": {"title": "Arx Libertatis - Arx Fatalis Port", "url": "https://arx-libertatis.org/"}, "assaultcube": {"title": "AssaultCube", "url": "https://assault.cubers.net/"}, "balatro-gba-demake": {"title": "Balatro - GBA Demake", "url": "https://github.com/GBALATRO/balatro-gba"}, "barbarian": {"title": "Barbarian", "url": "http://barbarian.1987.free.fr/indexEN.htm"}, "beyond-all-reason": {"title": "Beyond All Reason", "url": "https://www.beyondallreason.info/"}, "boneforge-battlegrounds": {"title": "Boneforge Battlegrounds", "url": "https://matty77.itch.io/boneforge-battlegrounds"}, "bstone-port-of-blake-stone-aliens-of-gold-and-blake-stone-planet-strike": {"title": "BStone - Port of Blake Stone: Aliens of Gold and Blake Stone: Planet Strike", "url": "https://bibendovsky.github.io/bstone/"}, "castlevania-symphony-of-the-night-play-as-maria": {"title": "Castlevania Symphony of the Night - Play as Maria", "url": "https://github.com/Xeeynamo/sotn-decomp/wiki/Maria-PSP-for-PSX-%E2%80%90-How-to-install"}, "cataclysm-dark-days-ahead": {"title": "Cataclysm: Dark Days Ahead", "url": "https://cataclysmdda.org/"}, "cave-story-port": {"title": "Cave Story Port", "url": "https://github.com/doukutsu-rs/doukutsu-rs"}, "c-evo": {"title": "C-Evo", "url": "http://c-evo.org/"}, "citybound": {"title": "Citybound", "url": "https://aeplay.org/citybound"}, "civctp2-apolyton-version-of-call-to-power-ii": {"title": "Civctp2 - Apolyton version of Call To Power II", "url": "https://github.com/civctp2/civctp2/"}, "clangen": {"title": "ClanGen", "url": "https://sablesteel.itch.io/clan-gen-fan-edit"}, "classicube": {"title": "ClassiCube", "url": "https://www.classicube.net/"}, "command-and-conquer-remastered-collection": {"title": "Command & Conquer Remastered Collection", "url": "https://github.com/electronicarts/CnC_Remastered_Collection"}, "conflict-3049": {"title": "Conflict 3049", "url": "https://matty77.itch.io/conflict-3049"}, "corsixth-theme-hospital-port": {"title": "CorsixTH - Theme Hospital Port", "url": "https://github.com/CorsixTH/CorsixTH"}, "cortex-command-community-project": {"title": "Cortex Command Community Project", "url": "https://cortex-command-community.github.io/"}, "counter-strike-football": {"title": "Counter-Strike: Football", "url": "https://github.com/solcloud/Counter-Strike"}, "cro-mag-rally": {"title": "Cro-Mag Rally", "url": "https://jorio.itch.io/cromagrally"}, "cube-2-sauerbraten": {"title": "Cube 2: Sauerbraten", "url": "http://sauerbraten.org/"}, "cubyz": {"title": "Cubyz", "url": "https://github.com/PixelGuys/Cubyz"}, "cuphead-wii-u-port": {"title": "Cuphead - Wii U Port", "url": "https://thelatteteam.itch.io/cuphead-wii-u"}, "cytopia": {"title": "Cytopia", "url": "https://cytopia.itch.io/cytopia"}, "daggerfall-unity": {"title": "Daggerfall Unity", "url": "https://www.dfworkshop.net/"}, "ddracenetwork": {"title": "DDraceNetwork", "url": "https://ddnet.org/"}, "dxx-rebirth-open-descent": {"title": "DXX-Rebirth: Open Descent", "url": "https://www.dxx-rebirth.com/"}, "descent-3-port": {"title": "Descent 3 Port", "url": "https://github.com/DescentDevelopers/Descent3/releases/tag/v1.5.0"}, "devilution-x-open-diablo-for-steam-deck": {"title": "Devilution X - Open Diablo for Steam Deck", "url": "https://www.reddit.com/r/SteamDeck/comments/w9epsg/guide_diablo_1_on_steam_deck_using_devilutionx/?utm%5C_source=share&utm%5C_medium=android%5C_app&utm%5C_name=androidcss&utm%5C_term=1&utm%5C_content=share%5C_button%5D%28https%3A%2F%2Fwww.reddit.com%2Fr%2FSteamDeck%2Fcomments%2Fw9epsg%2Fguide_diablo_1_on_steam_deck_using_devilutionx%2F%3Futm_source%3Dshare&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, "devilution-x-open-diablo": {"title": "Devilution X - Open Diablo", "url": "https://github.com/diasurgical/devilutionX"}, "dinosaur-planet-recompilation": {"title": "Dinosaur Planet Recompilation", "url": "https://github.com/DinosaurPlanetRecomp/dino-recomp"}, "dinosaur-planet-recompilation-rom-patcher": {"title": "Dinosaur Planet Recompilation ROM Patcher", "url": "https://dinosaurpla.net/"}, "dinosaur-planet-recompilation-mods-page": {"title": "Dinosaur Planet Recompilation Mods Page", "url": "https://thunderstore.io/c/dinosaur-planet-recompiled/"}, "dogwalk": {"title": "Dogwalk", "url": "https://blenderstudio.itch.io/dogwalk"}, "doom-64-dreamcast-port": {"title": "Doom 64 - Dreamcast Port", "url": "https://dreamcast.gameplayer.club/index.php/downloads/summary/58-disk-images/493-doom-64-2025-02-15-incl-nightdive-studios-levels-cdi"}, "doom-64-ex": {"title": "Doom 64 EX", "url": "https://www.pcgamingwiki.com/wiki/Doom_64_EX#google_vignette"}, "dr-mario-64-recompilation": {"title": "Dr. Mario 64 Recompilation", "url": "https://github.com/theboy181/drmario64_recomp_plus"}, "duke-nukem-zero-hour-recompilation": {"title": "Duke Nukem Zero Hour Recompilation", "url": "https://github.com/sonicdcer/DNZHRecomp/releases"}, "dungeon-crawl-stone-soup": {"title": "Dungeon Crawl Stone Soup", "url": "https://crawl.develz.org/"}, "dungeonfx-dungeon-keeper-port": {"title": "DungeonFX - Dungeon Keeper Port", "url": "https://keeperfx.net/"}, "opendune": {"title": "OpenDUNE", "url": "https://github.com/OpenDUNE/OpenDUNE"}, "dune-2-the-maker": {"title": "Dune 2 The Maker", "url": "https://dune2themaker.fundynamic.com/"}, "ecwolf-wolfenstein-3d-port": {"title": "ECWolf - Wolfenstein 3D Port", "url": "https://maniacsvault.net/ecwolf/"}, "eduke32-duke-nukem-3d-port": {"title": "EDuke32 - Duke Nukem 3D Port", "url": "https://www.eduke32.com/"}, "exult-ultima-vii-reimplementation": {"title": "Exult - Ultima VII Reimplementation", "url": "https://exult.sourceforge.io/"}, "fallout-community-edition": {"title": "Fallout Community Edition", "url": "https://github.com/alexbatalov/fallout1-ce"}, "fallout-2-community-edition": {"title": "Fallout 2 Community Edition", "url": "https://github.com/alexbatalov/fallout2-ce"}, "fheroes2-heroes-of-might-and-magic-2-recreation": {"title": "Fheroes2 - Heroes of Might & Magic 2 Recreation", "url": "https://github.com/ihhub/fheroes2"}, "fish-folk-jumpy": {"title": "Fish Folk: Jumpy", "url": "https://fishfolk.org/games/jumpy/"}, "flashback-sega-saturn-port": {"title": "Flashback - Sega Saturn Port", "url": "https://segaxtreme.net/threads/flashback-macintosh-version-reminiscence-for-sega-saturn-beta.37965/"}, "flightgear": {"title": "FlightGear", "url": "https://www.flightgear.org/"}, "fpc-atomic-atomic-bomberman-reimplimentation": {"title": "FPC Atomic - Atomic Bomberman Reimplimentation", "url": "https://github.com/PascalCorpsman/fpc_atomic"}, "freeciv": {"title": "FreeCiv", "url": "https://www.freeciv.org/"}, "freecol": {"title": "FreeCol", "url": "https://www.freecol.org/"}, "freedoom": {"title": "Freedoom", "url": "https://freedoom.github.io/about.html"}, "freeorion": {"title": "FreeOrion", "url": "https://www.freeorion.org/index.php/Main_Page"}, "freeserf-settlers-1-clone": {"title": "Freeserf - Settlers 1 Clone", "url": "https://github.com/Pyrdacor/freeserf.net"}, "freespace-open": {"title": "FreeSpace Open", "url": "https://www.hard-light.net/"}, "fs2open-open-freespace-2": {"title": "FS2Open - Open Freespace 2", "url": "https://scp.indiegames.us/bnr_fs2open.php"}, "frets-on-fire": {"title": "Frets on Fire", "url": "https://fretsonfire.sourceforge.net/"}, "friday-night-funkin": {"title": "Friday Night Funkin'", "url": "https://ninja-muffin24.itch.io/funkin"}, "gemrb-implementation-of-infinity-engine-baldur-s-gate-icewind-dale-planescape-torment": {"title": "GemRB - Implementation of Infinity Engine - Baldur's Gate, Icewind Dale, Planescape: Torment", "url": "https://gemrb.org/Features.html"}, "glsmac-sid-meier-s-alpha-centauri-port": {"title": "GLSMAC - Sid Meier's Alpha Centauri Port", "url": "https://github.com/afwbkbc/glsmac"}, "grand-theft-auto-3-dreamcast-port": {"title": "Grand Theft Auto 3 Dreamcast Port", "url": "https://dca3.net/liberty/"}, "grand-theft-auto-vice-city-dreamcast-port": {"title": "Grand Theft Auto Vice City Dreamcast Port", "url": "https://dca3.net/miami/"}, "half-life-decay-pc-port": {"title": "Half-Life: Decay PC Port", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=376774460"}, "hedgewars": {"title": "Hedgewars", "url": "https://hedgewars.itch.io/hedgewars"}, "hurry-curry": {"title": "Hurry Curry!", "url": "https://hurrycurry.org/"}, "hypersomnia": {"title": "Hypersomnia", "url": "https://github.com/TeamHypersomnia/Hypersomnia"}, "infinity-blade": {"title": "Infinity Blade", "url": "https://infinity-blade-pc.en.uptodown.com/windows"}, "infinity-blade-2": {"title": "Infinity Blade 2", "url": "https://infinity-blade-ii-pc.en.uptodown.com/windows"}, "ioquake3-quake-3-arena-port": {"title": "ioquake3 - Quake 3: Arena Port", "url": "https://ioquake3.org/"}, "jagged-alliance-2-stracciatella": {"title": "Jagged Alliance 2 Stracciatella", "url": "https://ja2-stracciatella.github.io/"}, "opengoal-jak-and-daxter-jak-2-and-jak-3-native-pc-ports": {"title": "OpenGoal - Jak & Daxter, Jak 2 and Jak 3 Native PC Ports", "url": "https://github.com/open-goal/jak-project"}, "jazz-resurrection-native-pc-port-jazz-jackrabbit-2": {"title": "Jazz Resurrection - native-pc-port Jazz Jackrabbit 2", "url": "https://flathub.org/en/apps/tk.deat.Jazz2Resurrection"}, "julius-caesar-iii-remake": {"title": "Julius - Caesar III Remake", "url": "https://github.com/bvschaik/julius"}, "kam-remake": {"title": "KaM Remake", "url": "https://www.kamremake.com/download/"}, "kindergarten-wii-u-port": {"title": "Kindergarten - Wii U Port", "url": "https://thelatteteam.itch.io/kindergarten-1-wiiu"}, "kkrieger": {"title": "kkrieger", "url": "https://gamejolt.com/games/kkrieger/878950"}, "legend-of-dragoon-port-severed-chains": {"title": "Legend of Dragoon Port - Severed Chains", "url": "https://legendofdragoon.org/projects/severed-chains/"}, "lego-island-pc-port": {"title": "Lego Island PC Port", "url": "https://github.com/isledecomp/isle-portable"}, "lego-island-web-port": {"title": "Lego Island Web Port", "url": "https://isle.pizza/"}, "lemmini-lemmings-port": {"title": "Lemmini - Lemmings Port", "url": "https://github.com/mjfwalsh/lemmini?tab=readme-ov-file"}, "liblast": {"title": "Liblast", "url": "https://libla.st/"}, "lincity-ng": {"title": "LinCity-NG", "url": "https://github.com/lincity-ng/lincity-ng/releases"}, "link-faces-of-evil-and-zelda-wand-of-gamelon-remastered": {"title": "Link: Faces of Evil & Zelda: Wand of Gamelon Remastered", "url": "https://archive.org/details/FOER-and-WOGR"}, "lsd-revamped-lsd-dream-emulator-remake": {"title": "LSD: Revamped - LSD: Dream Emulator Remake", "url": "https://github.com/figglewatts/LSDRevamped?hl=en-IE"}, "mario-kart-64-dreamcast-port": {"title": "Mario Kart 64 - Dreamcast Port", "url": "https://github.com/jnmartin84/mk64-dc"}, "mario-kart-64-recompilation": {"title": "Mario Kart 64 Recompilation", "url": "https://github.com/sonicdcer/MarioKart64Recomp?reddit"}, "maze-of-galious-port": {"title": "Maze of Galious Port", "url": "https://cdromance.org/windows/maze-of-galious-windows/"}, "mbhaxe-marble-blast-port": {"title": "MBHaxe - Marble Blast Port", "url": "https://github.com/RandomityGuy/MBHaxe"}, "mega-man-legends-pc-port": {"title": "Mega Man Legends PC Port", "url": "https://www.rockman-corner.com/2025/08/mega-man-legends-pc-port-gets.html?m=1"}, "memoria-tools-for-final-fantasy-ix": {"title": "Memoria - Tools for Final Fantasy IX", "url": "https://github.com/Albeoris/Memoria"}, "meritous": {"title": "Meritous", "url": "https://www.asceai.net/meritous/"}, "micropolis-js": {"title": "micropolis-JS", "url": "https://github.com/graememcc/micropolisJS"}, "mute-crimson-dx-dreamcast-port": {"title": "Mute Crimson DX Dreamcast Port", "url": "https://icedlizardgames.itch.io/mute-crimson-dc"}, "myst-online-uru-live": {"title": "Myst Online: Uru Live", "url": "https://mystonline.com/en/"}, "mystical-ninja-starring-goemon-recompilation": {"title": "Mystical Ninja Starring Goemon Recompilation", "url": "https://github.com/klorfmorf/Goemon64Recomp"}, "naev": {"title": "Naev", "url": "https://naev.org/"}, "endless-sky": {"title": "Endless Sky", "url": "https://endless-sky.github.io/"}, "nakedavp-aliens-vs-predator-classic-2000-port": {"title": "NakedAVP: Aliens vs Predator Classic (2000) Port", "url": "https://github.com/atsb/NakedAVP"}, "nblood-blood-exhumed-port": {"title": "NBlood - Blood Exhumed Port", "url": "https://github.com/NBlood/NBlood"}, "nethack": {"title": "NetHack", "url": "https://nethack.org/"}, "omohaaa-open-medal-of-honour-allied-assault": {"title": "OMoHAAA - Open Medal of Honour Allied Assault", "url": "https://github.com/openmoh/openmohaa?tab=readme-ov-file"}, "oolite-an-open-world-space-opera": {"title": "Oolite: An Open-World Space Opera", "url": "https://oolite.space/"}, "open1560-midtown-madness": {"title": "Open1560 - Midtown Madness", "url": "https://0x1f9f1.github.io/Open1560/"}, "openage": {"title": "OpenAge", "url": "https://openage.sft.lol/"}, "opendaoc-dark-age-of-camelot-server-emulator": {"title": "OpenDAoC - Dark Age of Camelot Server Emulator", "url": "https://github.com/OpenDAoC/OpenDAoC-Core"}, "openenroth-open-reimplementation-of-might-and-magic-6-7-and-8-engine": {"title": "OpenEnroth - Open reimplementation of Might and Magic 6, 7 & 8 Engine", "url": "https://github.com/OpenEnroth/OpenEnroth"}, "open-fodder": {"title": "Open Fodder", "url": "https://openfodder.com/"}, "opengothic-gothic-2-port": {"title": "OpenGothic - Gothic 2 Port", "url": "https://github.com/Try/OpenGothic"}, "openhcl": {"title": "OpenHCL", "url": "https://wiibrew.org/wiki/OpenHCL"}, "openhv": {"title": "OpenHV", "url": "https://www.openhv.net/"}, "openloco-chris-sawyer-s-locomotion-port": {"title": "OpenLoco - Chris Sawyer's Locomotion Port", "url": "https://openloco.io/download/"}, "openmw-morrowind-port": {"title": "OpenMW - Morrowind Port", "url": "https://openmw.org/"}, "opennox": {"title": "OpenNox", "url": "https://opennox.github.io/docs/index.html"}, "openomf-one-must-fall-2097": {"title": "OpenOMF - One Must Fall 2097", "url": "https://openomf.org/"}, "openra-command-and-conquer-red-alert-tiberian-dawn-dune-2000": {"title": "OpenRA - Command & Conquer Red Alert + Tiberian Dawn + Dune 2000", "url": "https://www.openra.net/download/"}, "openrct2-roller-coaster-tycoon-2": {"title": "OpenRCT2 - Roller Coaster Tycoon 2", "url": "https://openrct2.io/"}, "openrw-gta-iii-reimplementation": {"title": "OpenRW - GTA III Reimplementation", "url": "https://openrw.org/"}, "opentesarena-elder-scrolls-arena-open-source-reimplementation": {"title": "OpenTESArena - Elder Scrolls Arena Open-source Reimplementation", "url": "https://github.com/afritz1/OpenTESArena"}, "openttd-port-of-transports-tycoon-deluxe": {"title": "OpenTTD - Port of Transports Tycoon Deluxe", "url": "https://www.openttd.org/"}, "opentyrian-2000": {"title": "OpenTyrian 2000", "url": "https://github.com/KScl/opentyrian2000"}, "openxcom": {"title": "OpenXcom", "url": "https://openxcom.org/"}, "pcexhumed-exhumed-powerslave-port": {"title": "PCExhumed - Exhumed Powerslave Port", "url": "https://pcex.retrohost.net/"}, "perfect-dark-pc-port": {"title": "Perfect Dark PC Port", "url": "https://github.com/fgsfdsfgs/perfect_dark"}, "pioneer-space-sim": {"title": "Pioneer Space Sim", "url": "https://pioneerspacesim.net/#slide0"}, "pixel-dungeon": {"title": "Pixel Dungeon", "url": "https://watabou.itch.io/pixel-dungeon"}, "playable3dmaze": {"title": "Playable3DMaze", "url": "https://github.com/x86matthew/Playable3DMaze"}, "pooltool": {"title": "PoolTool", "url": "https://github.com/ekiefl/pooltool"}, "portal64-still-alive": {"title": "Portal64 Still Alive", "url": "https://github.com/VideogameSources/portal64-still-alive"}, "portal-still-alive-pc-port": {"title": "Portal: Still Alive PC Port", "url": "https://www.moddb.com/mods/still-alive-for-steam-deck"}, "prince-of-persia-original-trilogy-port": {"title": "Prince of Persia Original Trilogy Port", "url": "https://www.popot.org/get_the_games.php?game=SDLPoP"}, "project-alice-victoria-2-port": {"title": "Project Alice - Victoria 2 Port", "url": "https://github.com/schombert/Project-Alice"}, "project-diablo-2": {"title": "Project Diablo 2", "url": "https://www.projectdiablo2.com/download"}, "projectr-san-francisco-rush-the-rock-and-san-francisco-rush-2049-ports": {"title": "ProjectR - San Francisco Rush: The Rock and San Francisco Rush 2049 Ports", "url": "https://t3hd0gg.com/project-r/"}, "puzzlemoppet-port": {"title": "puzzleMoppet Port", "url": "https://github.com/karjonas/puzzle-Moppet"}, "quest-64-recompilation": {"title": "Quest 64 Recompilation", "url": "https://github.com/Rainchus/Quest64-Recomp"}, "quick-dungeon-crawler": {"title": "Quick Dungeon Crawler", "url": "https://www.reddit.com/r/opensourcegames/comments/1owrr8q/timekiller_roguelite_quick_dungeon_crawler_v360/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, "redriver2-driver-2-pc-port": {"title": "ReDriver2 - Driver 2 PC Port", "url": "https://github.com/OpenDriver2/REDRIVER2"}, "return-to-the-roots-settlers-ii-remake": {"title": "Return to the Roots - Settlers II Remake", "url": "https://www.siedler25.org/index.php?com=dynamic&mod=1&lang=en&PHPSESSID=g41c6ln3b8qajolf9d25uv1418"}, "rota-bend-gravity": {"title": "ROTA: Bend Gravity", "url": "https://harmonymonroe.itch.io/rota"}, "rvgl-re-volt-port": {"title": "RVGL - Re-Volt Port", "url": "https://rvgl.org/"}, "ship-of-harkinian-zelda-ocarina-of-time-port": {"title": "Ship of Harkinian - Zelda Ocarina of Time Port", "url": "https://github.com/HarbourMasters/Shipwright"}, "ship-of-harkinian-mods": {"title": "Ship of Harkinian mods", "url": "https://gamebanana.com/mods/games/16121"}, "the-simpsons-hit-and-run-pc-port": {"title": "The Simpsons Hit & Run PC Port", "url": "https://youtu.be/QV-70fe4hWc?si=F0Ne5n0lMlxeUhth"}, "sonic-mania-decompilation": {"title": "Sonic Mania Decompilation", "url": "https://gamebanana.com/tuts/15290"}, "sonic-the-hedgehog-2013-and-sonic-the-hedgehog-2-2013-decompilation": {"title": "Sonic the Hedgehog (2013) and Sonic the Hedgehog 2 (2013) Decompilation", "url": "https://github.com/RSDKModding/RSDKv4-Decompilation"}, "sonic-unleashed-recompilation": {"title": "Sonic Unleashed Recompilation", "url": "https://github.com/hedge-dev/UnleashedRecomp"}, "spacecadetpinball": {"title": "SpaceCadetpinball", "url": "https://github.com/k4zmu2a/SpaceCadetpinball"}, "space-station-14": {"title": "Space Station 14", "url": "https://spacestation14.com/"}, "spaghetti-kart-mario-kart-64-pc-port": {"title": "Spaghetti Kart - Mario Kart 64 PC Port", "url": "https://github.com/HarbourMasters/SpaghettiKart/releases"}, "speed-dreams": {"title": "Speed Dreams", "url": "https://www.speed-dreams.net/en"}, "the-ur-quan-masters-star-control-2-port": {"title": "The Ur-Quan Masters - Star Control 2 Port", "url": "https://sc2.sourceforge.net/"}, "star-fox-64-dreamcast-port": {"title": "Star Fox 64 Dreamcast Port", "url": "https://github.com/jnmartin84/sf64-dc"}, "star-fox-64-dreamcast-port-builder-guide": {"title": "Star Fox 64 Dreamcast Port Builder Guide", "url": "https://colab.research.google.com/drive/1jn7SPKeHwZ-0qXIvA4uzdF-ykeh6xtNL"}, "star-fox-64-recompilation": {"title": "Star Fox 64 Recompilation", "url": "https://github.com/sonicdcer/Starfox64Recomp"}, "starship-star-fox-64-pc-port": {"title": "Starship - Star Fox 64 PC Port", "url": "https://github.com/HarbourMasters/Starship/releases"}, "starship-star-fox-64-pc-port-mods": {"title": "Starship - Star Fox 64 PC Port Mods", "url": "https://gamebanana.com/mods/games/21612"}, "stunt-car-remake": {"title": "Stunt Car Remake", "url": "https://pyra-handheld.com/boards/threads/stunt-car-remake.79671/"}, "super-mario-64-co-op-deluxe": {"title": "Super Mario 64 Co-op Deluxe", "url": "https://sm64coopdx.com/"}, "super-mario-64-pc-port": {"title": "Super Mario 64 PC Port", "url": "https://archive.org/details/sm64-source-playable"}, "super-mario-64-render96": {"title": "Super Mario 64 Render96", "url": "https://www.reddit.com/r/SteamDeck/comments/11nfzw5/comment/jbnau5g/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, "super-mario-bros-remastered": {"title": "Super Mario Bros. Remastered", "url": "https://github.com/JHDev2006/Super-Mario-Bros.-Remastered-Public"}, "super-mario-bros-remastered-mods": {"title": "Super Mario Bros. Remastered Mods", "url": "https://gamebanana.com/mods/games/22798"}, "super-mario-bros-remastered-custom-levels": {"title": "Super Mario Bros. Remastered Custom Levels", "url": "https://levelsharesquare.com/SMBR/levels"}, "super-tux-kart": {"title": "Super Tux Kart", "url": "https://supertuxkart.net/Main_Page"}, "super-tux-war": {"title": "Super Tux War", "url": "https://github.com/tuxx/super-tux-war"}, "teeworlds": {"title": "Teeworlds", "url": "https://www.teeworlds.com/"}, "the-battle-for-wesnoth": {"title": "The Battle for Wesnoth", "url": "https://www.wesnoth.org/"}, "the-force-engine-dark-forces-reimplementation": {"title": "The Force Engine - Dark Forces Reimplementation", "url": "https://theforceengine.github.io/"}, "the-labyrinth-of-time-s-edge": {"title": "The Labyrinth Of Time's Edge", "url": "https://the-ventureweaver.itch.io/tlote4111"}, "the-legend-of-zelda-a-link-to-the-past-decompilation": {"title": "The Legend of Zelda A Link To The Past Decompilation", "url": "https://github.com/snesrev/zelda3"}, "the-legend-of-zelda-link-s-awakening-dx-hd-pc-port": {"title": "The Legend of Zelda: Link's Awakening DX HD PC Port", "url": "https://gitlab.com/bighead.0/ladxhd_updated"}, "the-world-ends-with-you-solo-remix-recompilation": {"title": "The World Ends With You Solo Remix Recompilation", "url": "https://www.reddit.com/r/TWEWY/comments/1n58gtx/twewy_solo_remix_is_on_pc/"}, "thextech-open-source-game-engine": {"title": "TheXTech - Open Source Game Engine", "url": "https://wohlsoft.ru/projects/TheXTech/"}, "thrive-open-source-evolution-sim": {"title": "Thrive: Open Source Evolution Sim", "url": "https://github.com/Revolutionary-Games/Thrive/releases/tag/v0.8.3"}, "timesplitters-rewind": {"title": "Timesplitters Rewind", "url": "https://www.timesplittersrewind.com/"}, "trx-tomb-raider-1-and-2-reimplementation": {"title": "TRX: Tomb Raider 1 & 2 Reimplementation", "url": "https://github.com/LostArtefacts/TRX"}, "ultima-vii-revisited": {"title": "Ultima VII Revisited", "url": "https://www.u7revisited.com/"}, "unciv": {"title": "Unciv", "url": "https://yairm210.itch.io/unciv"}, "undertale-decompilation": {"title": "Undertale Decompilation", "url": "https://github.com/kittibyte/UndertaleDecomp"}, "unknown-horizons": {"title": "Unknown Horizons", "url": "https://unknown-horizons.org/"}, "vcmi-heroes-of-might-and-magic-3-open-source-recreation": {"title": "VCMI - Heroes of Might & Magic 3 Open Source Recreation", "url": "https://github.com/vcmi/vcmi"}, "veloren": {"title": "Veloren", "url": "https://www.veloren.net/"}, "voxelibre-formerly-mineclone2": {"title": "VoxeLibre (formerly MineClone2)", "url": "https://content.luanti.org/packages/Wuzzy/mineclone2/"}, "wasted-a-destruction-derby-online-game": {"title": "Wasted! A Destruction-Derby Online Game", "url": "https://wastedgames.codeberg.page/"}, "widelands": {"title": "Widelands", "url": "https://www.widelands.org/"}, "wipeout-dreamcast-port": {"title": "Wipeout Dreamcast Port", "url": "https://github.com/jnmartin84/wipeout-dc/"}, "wipeout-phantom-edition-pc-port": {"title": "Wipeout Phantom Edition PC Port", "url": "https://github.com/wipeout-phantom-edition"}, "xonotic": {"title": "Xonotic", "url": "https://xonotic.org/"}, "yknytt": {"title": "YKnytt", "url": "https://youkaicountry.itch.io/yknytt"}, "zelda-2-enhanced-pc-edition": {"title": "Zelda 2 Enhanced PC Edition", "url": "https://portmaster.games/detail.html?name=ziiaol"}, "zelda-64-recompiled-majora-s-mask-with-mod-support": {"title": "Zelda 64 Recompiled Majora's Mask with Mod Support", "url": "https://github.com/Zelda64Recomp/Zelda64Recomp"}, "zelda-classic": {"title": "Zelda Classic", "url": "https://www.zeldaclassic.com/about/"}, "zero-k": {"title": "Zero-K", "url": "https://zero-k.info/"}, "zork-open-source-port": {"title": "Zork Open Source Port", "url": "https://github.com/historicalsource/zork1"}, "zork-ii-open-source-port": {"title": "Zork II Open Source Port", "url": "https://github.com/historicalsource/zork2"}, "zork-iii-open-source-port": {"title": "Zork III Open Source Port", "url": "https://github.com/historicalsource/zork3"}, "aero-gauge-decompilation": {"title": "Aero Gauge Decompilation", "url": "https://github.com/LLONSIT/AeroGauge"}, "aidyn-chronicles-the-first-mage-decompilation": {"title": "Aidyn Chronicles The First Mage Decompilation", "url": "https://github.com/blackgamma7/Aidyn"}, "alice-in-wonderland-wii-decompilation": {"title": "Alice in Wonderland (Wii) Decompilation", "url": "https://github.com/Alice-2010/Decomp"}, "am64-another-metroid-64": {"title": "AM64 - Another Metroid 64", "url": "https://www.patreon.com/posts/am64-v3-0-0-1-136207928"}, "animal-crossing-gamecube-decompilation": {"title": "Animal Crossing (Gamecube) Decompilation", "url": "https://github.com/ACreTeam/ac-decomp"}, "baku-bomberman-2-jp-decompilation": {"title": "Baku Bomberman 2 (JP) Decompilation", "url": "https://github.com/bomberhackers/tsa"}, "banjo-kazooie-n64-decompilation": {"title": "Banjo-Kazooie (N64) Decompilation", "url": "https://github.com/n64decomp/banjo-kazooie"}, "banjo-kazooie-xbox-360-decompilation": {"title": "Banjo-Kazooie (Xbox 360) Decompilation", "url": "https://github.com/banjo360/bk360"}, "banjo-kazooie-grunty-s-revenge-decompilation": {"title": "Banjo-Kazooie Grunty's Revenge Decompilation", "url": "https://github.com/jellees/bkgr"}, "banjo-tooie-decompilation": {"title": "Banjo-Tooie Decompilation", "url": "https://github.com/Mr-Wiseguy/banjo-tooie"}, "blast-corps-decompilation": {"title": "Blast Corps Decompilation", "url": "https://github.com/retroplastic/blastcorps"}, "body-harvest-decompilation": {"title": "Body Harvest Decompilation", "url": "https://github.com/jaytheham/body-harvest-decompilation"}, "bomberman-hero-decompilation": {"title": "Bomberman Hero Decompilation", "url": "https://github.com/Bomberhackers/bmhero"}, "boom-street-decompilation": {"title": "Boom Street Decompilation", "url": "https://github.com/FortuneStreetModding/boom-street-decomp"}, "breath-of-fire-decompilation": {"title": "Breath of Fire Decompilation", "url": "https://github.com/Normmatt/bof"}, "the-legend-of-zelda-breath-of-the-wild-decompilation": {"title": "The Legend of Zelda: Breath of the Wild Decompilation", "url": "https://github.com/zeldaret/botw"}, "bully-online": {"title": "Bully Online", "url": "https://youtu.be/2J0_BnWKvEA?si=6W-N4UdbE67sWjDk"}, "burnout-3-takedown-decompilation": {"title": "Burnout 3: Takedown Decompilation", "url": "https://github.com/reburndev/reburn3"}, "castlevania-64-decompilation": {"title": "Castlevania 64 Decompilation", "url": "https://github.com/k64ret/cv64"}, "castlevania-order-of-ecclesia-decompilation": {"title": "Castlevania Order of Ecclesia Decompilation", "url": "https://github.com/LagoLunatic/ooe"}, "castlevania-symphony-of-the-night-decompilation": {"title": "Castlevania Symphony of the Night Decompilation", "url": "https://github.com/Xeeynamo/sotn-decomp"}, "castlevania-symphony-of-the-night-megadrive-genesis-port-demo": {"title": "Castlevania Symphony of the Night - Megadrive Genesis Port - Demo", "url": "https://youtu.be/GoPpWU7y70w?si=A13ivHXfmWDOz3Xe"}, "chameleon-twist-recompilation": {"title": "Chameleon Twist Recompilation", "url": "https://github.com/Rainchus/ChameleonTwist1-JP-Recomp"}, "chameleon-twist-2-decompilation": {"title": "Chameleon Twist 2 Decompilation", "url": "https://github.com/chameleontwistret/chameleontwist2v1.0-jp"}, "chibi-robo-pia-decompilation": {"title": "Chibi-Robo: PIA Decompilation", "url": "https://github.com/eavpsp/cbr_decomp"}, "colin-mcrae-rally-2-0-decompilation": {"title": "Colin McRae Rally 2.0 Decompilation", "url": "https://github.com/CMR2Decomp/CMR2Decomp"}, "conker-s-bad-fur-day-decompilation": {"title": "Conker's Bad Fur Day Decompilation", "url": "https://github.com/mkst/conker"}, "contra-decompilation": {"title": "Contra Decompilation", "url": "https://github.com/vermiceli/nes-contra-us/"}, "cosmo-s-cosmic-adventure-decompilation": {"title": "Cosmo's Cosmic Adventure Decompilation", "url": "https://github.com/smitelli/cosmore"}, "crash-bandicoot-decompilation": {"title": "Crash Bandicoot Decompilation", "url": "https://github.com/wurlyfox/c1"}, "crash-bandicoot-2-cortex-strikes-back-decompilation": {"title": "Crash Bandicoot 2: Cortex Strikes Back Decompilation", "url": "https://github.com/ughman/c2c"}, "crash-team-racing-decompilation": {"title": "Crash Team racing Decompilation", "url": "https://github.com/mkst/ctr"}, "crash-twinsanity-remake": {"title": "Crash: Twinsanity Remake", "url": "https://youtu.be/7y3MXMaWWug?si=jMgS0GkZtigdUvX5"}, "croc-legend-of-the-gobbos-decompilation": {"title": "Croc: Legend of the Gobbos Decompilation", "url": "https://github.com/xeeynamo/croc"}, "crystalis-decompilation": {"title": "Crystalis Decompilation", "url": "https://github.com/crystalisdisassembly/crystalisdisassembly"}, "dance-central-3-decompilation": {"title": "Dance Central 3 Decompilation", "url": "https://github.com/rjkiv/dc3-decomp"}, "dark-cloud-decompilation": {"title": "Dark Cloud Decompilation", "url": "https://github.com/adubbz/dcdecomp"}, "dark-rift-decompilation": {"title": "Dark Rift Decompilation", "url": "https://github.com/unnunu/darkrift"}, "demon-s-crest-decompilation": {"title": "Demon's Crest Decompilation", "url": "https://github.com/FredYeye/various-game-disassembly/blob/main/SNES/demons_crest.asm"}, "deus-ex-human-revolution-decompilation": {"title": "Deus-Ex: Human Revolution Decompilation", "url": "https://github.com/rrika/cdcEngineDXHR"}, "diddy-kong-racing-decompilation": {"title": "Diddy Kong racing Decompilation", "url": "https://github.com/DavidSM64/Diddy-Kong-racing"}, "disney-s-piglet-s-big-game-decompilation": {"title": "Disney's Piglet's Big Game Decompilation", "url": "https://github.com/tgsm/pbg"}, "donkey-kong-64-decompilation": {"title": "Donkey Kong 64 Decompilation", "url": "https://github.com/0xGlitchbyte/dk64re"}, "doraemon-nobita-to-mittsu-no-seireiseki-decompilation": {"title": "Doraemon: Nobita to Mittsu no Seireiseki Decompilation", "url": "https://github.com/soracode6/doraemon1"}, "doshin-the-giant-decompilation": {"title": "Doshin the Giant Decompilation", "url": "https://github.com/break-core/doshin-gc"}, "dragon-quest-monsters-decompilation": {"title": "Dragon Quest Monsters Decompilation", "url": "https://github.com/Ebernacher90/DragonQuestMonstersGerman"}, "dragon-quest-ix-decompilation": {"title": "Dragon Quest IX Decompilation", "url": "https://github.com/DQIX/dqix-decomp"}, "dragon-warrior-decompilation": {"title": "Dragon Warrior Decompilation", "url": "https://github.com/nmikstas/dragon-warrior-disassembly"}, "earthbound-beginnings-remake": {"title": "Earthbound Beginnings Remake", "url": "https://ebbr.neocities.org/downloads"}, "elden-ring-morrowind-overhaul-mod": {"title": "Elden Ring: Morrowind Overhaul Mod", "url": "https://youtu.be/n89NFtIUWDI?si=fNfYg_4YLM_Blk1-"}, "fable-2-recompilation": {"title": "Fable 2 Recompilation", "url": "https://github.com/Fable2Recomp/Fable2Recomp"}, "fallout-bakersfield-doom-total-conversion-mod-gzdoom-wad": {"title": "Fallout: Bakersfield - Doom total conversion Mod (GZDoom Wad)", "url": "https://youtu.be/6e8WrmOibpM?si=I-YCVDzgAUP_bodh"}, "fatal-frame-decompilation": {"title": "Fatal Frame Decompilation", "url": "https://github.com/Mikompilation/Himuro"}, "fatal-frame-2-decompilation": {"title": "Fatal Frame 2 Decompilation", "url": "https://github.com/mikompilation/minakami"}, "final-fantasy-crystal-chronicles-decompilation": {"title": "Final Fantasy Crystal Chronicles Decompilation", "url": "https://github.com/zcanann/FFCC-Decomp"}, "final-fantasy-mystic-quest-megadrive-port": {"title": "Final Fantasy Mystic Quest Megadrive Port", "url": "https://github.com/nicomegadrive/SGDK-ROMS/tree/main/MysticQuest"}, "final-fantasy-vii-decompilation": {"title": "Final Fantasy VII Decompilation", "url": "https://github.com/Xeeynamo/ff7-decomp"}, "fire-emblem-shadow-dragon-decompilation": {"title": "Fire Emblem: Shadow Dragon Decompilation", "url": "https://github.com/Eebit/fe11-us"}, "fire-emblem-the-blazing-blade-decompilation": {"title": "Fire Emblem: The Blazing Blade Decompilation", "url": "https://github.com/MokhaLeee/FireEmblem7J"}, "frogger-decompilation": {"title": "Frogger Decompilation", "url": "https://github.com/HighwayFrogs/frogger-psx"}, "f-zero-x-decompilation": {"title": "F-Zero X Decompilation", "url": "https://github.com/inspectredc/fzerox"}, "gauntlet-legends-decompilation": {"title": "Gauntlet Legends Decompilation", "url": "https://github.com/drahsid/gauntlet-legends"}, "gex-64-decompilation": {"title": "Gex 64 Decompilation", "url": "https://github.com/matbourgon/gex64decomp"}, "glover-decompilation": {"title": "Glover Decompilation", "url": "https://github.com/rainchus/glover"}, "goldeneye-007-decompilation": {"title": "Goldeneye 007 Decompilation", "url": "https://github.com/n64decomp/007"}, "golden-sun-decompilation": {"title": "Golden Sun Decompilation", "url": "https://github.com/gsret/goldensun"}, "goof-troop-decompilation": {"title": "Goof Troop Decompilation", "url": "https://github.com/Yoshifanatic1/Goof-Troop-Disassembly"}, "gran-turismo-2-decompilation": {"title": "Gran Turismo 2 Decompilation", "url": "https://github.com/ginryuoku/gt2-reversing"}, "gta-2-decompilation": {"title": "GTA 2 Decompilation", "url": "https://github.com/CriminalRETeam/gta2_re"}, "guilty-gear-x-series-decompilation": {"title": "Guilty Gear X Series Decompilation", "url": "https://github.com/MoonSquaredd/ggx"}, "halo-decompilation": {"title": "Halo Decompilation", "url": "https://github.com/halo-re/halo"}, "harvest-moon-64-decompilation": {"title": "Harvest Moon 64 Decompilation", "url": "https://github.com/harvestwhisperer/hm64-decomp"}, "harvest-moon-a-wonderful-life-decompilation": {"title": "Harvest Moon: A Wonderful Life Decompilation", "url": "https://github.com/ChrisNonyminus/hmawl"}, "harvest-moon-friends-of-mineral-town-decompilation": {"title": "Harvest Moon: Friends of Mineral Town Decompilation", "url": "https://github.com/StanHash/fomt"}, "ice-climber-decompilation": {"title": "Ice Climber Decompilation", "url": "https://github.com/cyneprepou4uk/NES-Games-Disassembly/tree/main/Ice%20Climber"}, "ico-decompilation": {"title": "ICO Decompilation", "url": "https://github.com/rossydoubleunderscore/ico-decomp"}, "inazuma-eleven-strikers-decompilation": {"title": "Inazuma Eleven Strikers Decompilation", "url": "https://github.com/SwareJonge/IEStrikers"}, "jet-force-gemini-decompilation": {"title": "Jet Force Gemini Decompilation", "url": "https://github.com/ryan-myers/jet-force-gemini"}, "jet-set-radio-future-decompilation": {"title": "Jet Set Radio Future Decompilation", "url": "https://github.com/dplewis/jsrf"}, "kid-chameleon-decompilation": {"title": "Kid Chameleon Decompilation", "url": "https://github.com/sonicretro/kid-chameleon-disasm"}, "kingdom-hearts-decompilation": {"title": "Kingdom Hearts Decompilation", "url": "https://github.com/ethteck/kh1"}, "kirby-64-the-crystal-shards-decompilation": {"title": "Kirby 64: The Crystal Shards Decompilation", "url": "https://github.com/kirby64ret/kirby64"}, "kirby-and-the-amazing-mirror-decompilation": {"title": "Kirby & the Amazing Mirror Decompilation", "url": "https://github.com/jiangzhengwenjz/katam"}, "kirby-air-ride-decompilation": {"title": "Kirby Air Ride Decompilation", "url": "https://github.com/doldecomp/kar"}, "kirby-s-epic-yarn-decompilation": {"title": "Kirby's Epic Yarn Decompilation", "url": "https://github.com/swiftshine/key"}, "klonoa-2-lunatea-s-veil-decompilation": {"title": "Klonoa 2: Lunatea's Veil Decompilation", "url": "https://github.com/entriphy/kl2_lv_decomp"}, "knife-edge-nose-gunner-decompilation": {"title": "Knife Edge - Nose Gunner Decompilation", "url": "https://github.com/disi33/KE-NG_Reversing"}, "legacy-of-kain-soul-reaver-decompilation": {"title": "Legacy of Kain: Soul Reaver Decompilation", "url": "https://github.com/fmil95/soul-re"}, "legend-of-legaia-decompilation": {"title": "Legend of Legaia Decompilation", "url": "https://github.com/dacodechick/legaia-decomp"}, "lego-racers-decompilation": {"title": "Lego Racers Decompilation", "url": "https://github.com/marijnvdwerf/lego-racers"}, "lego-star-wars-iii-the-clone-wars-decompilation": {"title": "Lego Star Wars III: The Clone Wars Decompilation", "url": "https://github.com/ThePlayerRolo/LegoCloneWarsWii"}, "lsd-dream-emulator-decompilation": {"title": "LSD: Dream Emulator Decompilation", "url": "https://github.com/FirecatFG/lsddecomp"}, "luigi-s-mansion-decompilation": {"title": "Luigi's Mansion Decompilation", "url": "https://github.com/ThePlayerRolo/lm-decomp"}, "lunar-2-eternal-blue-complete-decompilation": {"title": "Lunar 2: Eternal Blue Complete Decompilation", "url": "https://github.com/Zackmon/lunar2-psx-decomp"}, "mario-and-luigi-partners-in-time-decompilation": {"title": "Mario & Luigi: Partners in Time Decompilation", "url": "https://github.com/rainchus/partnersintime-decomp"}, "mario-and-luigi-superstar-saga-decompilation": {"title": "Mario & Luigi: Superstar Saga Decompilation", "url": "https://github.com/nstearns96/MLSuperstarSaga"}, "mario-golf-64-decompilation": {"title": "Mario Golf 64 Decompilation", "url": "https://github.com/monde-lointain/mariogolf64"}, "mario-kart-double-dash-decompilation": {"title": "Mario Kart Double Dash!! Decompilation", "url": "https://github.com/doldecomp/mkdd"}, "mario-kart-wii-decompilation": {"title": "Mario Kart Wii Decompilation", "url": "https://github.com/doldecomp/mkw"}, "mario-party-4-decompilation": {"title": "Mario Party 4 Decompilation", "url": "https://github.com/mariopartyrd/marioparty4"}, "mario-party-5-decompilation": {"title": "Mario Party 5 Decompilation", "url": "https://github.com/mariopartyrd/marioparty5"}, "mario-superstar-baseball-decompilation": {"title": "Mario Superstar Baseball Decompilation", "url": "https://github.com/mariopartyrd/marioparty5"}, "mario-tennis-decompilation": {"title": "Mario Tennis Decompilation", "url": "https://github.com/dellm-79/mariotennisn64"}, "medievel-decompilation": {"title": "MediEvel Decompilation", "url": "https://github.com/medievildecompilation/medievil-decomp"}, "mega-castlevania-iv": {"title": "Mega Castlevania IV", "url": "https://youtu.be/5PPOKBR3bQk?si=sxKPeItjeypAylaV"}, "mega-man-x-viral-nightmare": {"title": "Mega Man X: Viral Nightmare​", "url": "https://sonicfangameshq.com/forums/showcase/mega-man-x-viral-nightmare.2866/"}, "metal-gear-solid-decompilation": {"title": "Metal Gear Solid Decompilation", "url": "https://github.com/FoxdieTeam/mgs_reversing"}, "metal-gear-solid-2-decompilation": {"title": "Metal Gear Solid 2 Decompilation", "url": "https://github.com/GirianSeed/mgs2"}, "metal-gear-solid-3-decompilation": {"title": "Metal Gear Solid 3 Decompilation", "url": "https://github.com/GirianSeed/mgs3"}, "metal-gear-solid-the-twin-snakes-decompilation": {"title": "Metal Gear Solid: The Twin Snakes Decompilation", "url": "https://github.com/GirianSeed/mgstts"}, "metroid-fusion-decompilation": {"title": "Metroid Fusion Decompilation", "url": "https://github.com/metroidret/mf"}, "metroid-prime-decompilation": {"title": "Metroid Prime Decompilation", "url": "https://github.com/PrimeDecomp/prime"}, "metroid-prime-2-echoes-decompilation": {"title": "Metroid Prime 2: Echoes Decompilation", "url": "https://github.com/PrimeDecomp/echoes"}, "metroid-zero-mission-decompilation": {"title": "Metroid Zero Mission Decompilation", "url": "https://github.com/metroidret/mzm"}, "minecraft-legacy-console-edition-decompilation": {"title": "Minecraft: Legacy Console Edition Decompilation", "url": "https://github.com/GRAnimated/MinecraftLCE"}, "minicraft-minecraft-gba-port": {"title": "Minicraft - Minecraft GBA Port", "url": "https://github.com/TobiasFriedly/minicraft_3d"}, "mischief-makers-decompilation": {"title": "Mischief Makers Decompilation", "url": "https://github.com/drahsid/mischief-makers"}, "naruto-gekitou-ninja-taisen-4-decompilation": {"title": "Naruto: Gekitou Ninja Taisen! 4 Decompilation", "url": "https://github.com/doldecomp/gnt4"}, "need-for-speed-high-stakes-decompilation": {"title": "Need For Speed: High Stakes Decompilation", "url": "https://github.com/OpenNFS/NFSHSX"}, "need-for-speed-most-wanted-decompilation": {"title": "Need For Speed: Most Wanted Decompilation", "url": "https://github.com/dbalatoni13/nfsmw"}, "need-for-speed-underground-decompilation": {"title": "Need For Speed: Underground Decompilation", "url": "https://github.com/dbalatoni13/nfsug"}, "neon-genesis-evanglion-64-decompilation": {"title": "Neon Genesis Evanglion 64 Decompilation", "url": "https://github.com/farisawan-2000/evangelion"}, "new-super-mario-bros-wii-decompilation": {"title": "New Super Mario Bros. Wii Decompilation", "url": "https://github.com/NSMBW-Community/NSMBW-Decomp"}, "onegai-monsters-decompilation": {"title": "Onegai Monsters Decompilation", "url": "https://github.com/ryan-myers/onegaimonsters"}, "opentdu-source-port-of-test-drive-unlimited": {"title": "OpenTDU - Source Port of Test Drive Unlimited", "url": "https://github.com/opentestdriveunlimited/OpenTestDriveUnlimited"}, "panzer-dragoon-saga-decompilation": {"title": "Panzer Dragoon Saga Decompilation", "url": "https://github.com/yaz0r/Azel"}, "paper-mario-decompilation": {"title": "Paper Mario Decompilation", "url": "https://papermar.io/"}, "paper-mario-sticker-star-decompilation": {"title": "Paper Mario: Sticker Star Decompilation", "url": "https://github.com/darxoon/leaflitter"}, "paper-mario-the-thousand-year-door-decompilation": {"title": "Paper Mario: The Thousand Year Door Decompilation", "url": "https://github.com/doldecomp/ttyd"}, "parappa-the-rapper-2-decompilation": {"title": "PaRappa the Rapper 2 Decompilation", "url": "https://github.com/parappadev/parappa2"}, "pikmin-decompilation": {"title": "Pikmin Decompilation", "url": "https://github.com/projectPiki/pikmin"}, "pikmin-2-decompilation": {"title": "Pikmin 2 Decompilation", "url": "https://github.com/projectPiki/pikmin2"}, "plants-vs-zombies-goty-decompilation": {"title": "Plants vs Zombies GOTY Decompilation", "url": "https://github.com/Patoke/re-plants-vs-zombies"}, "pokemon-battle-revolution-decompilation": {"title": "Pokemon Battle Revolution Decompilation", "url": "https://github.com/bgsamm/pbr-dtk"}, "pokemon-mystery-dungeon-red-rescue-team-decompilation": {"title": "Pokemon Mystery Dungeon: Red Rescue Team Decompilation", "url": "https://github.com/pret/pmd-red"}, "pokemon-pinball-decompilation": {"title": "Pokemon pinball Decompilation", "url": "https://github.com/pret/pokepinball"}, "pokemon-puzzleleague-decompilation": {"title": "Pokemon puzzleLeague Decompilation", "url": "https://github.com/AngheloAlf/puzzleleague64"}, "pokemon-snap-decompilation": {"title": "Pokemon Snap Decompilation", "url": "https://github.com/ethteck/pokemonsnap"}, "pokemon-stadium-decompilation": {"title": "Pokemon Stadium Decompilation", "url": "https://github.com/pret/pokestadium"}, "pokemon-stadium-2-decompilation": {"title": "Pokemon Stadium 2 Decompilation", "url": "https://github.com/pret/pokestadiumgs"}, "pokemon-tcg-deompilation": {"title": "Pokemon TCG Deompilation", "url": "https://github.com/pret/poketcg"}, "pokemon-tcg-2-deompilation": {"title": "Pokemon TCG 2 Deompilation", "url": "https://github.com/pret/poketcg2"}, "pokepark-wii-pikachu-s-adventure-decompilation": {"title": "Pokepark Wii: Pikachu's Adventure Decompilation", "url": "https://github.com/SephDB/pokepark-wii-decomp"}, "prey-2006-port": {"title": "Prey 2006 Port", "url": "https://krispy-the-goat.itch.io/prey-2006"}, "project-green": {"title": "Project Green", "url": "https://youtu.be/e393g4U4xUU?si=rTY788C-KdflwLch"}, "quake-4-source-port": {"title": "Quake 4 source-port", "url": "https://github.com/jmarshall23/Quake4Doom"}, "ratatouille-decompilation": {"title": "Ratatouille Decompilation", "url": "https://github.com/ZounaModding/RatDecomp"}, "rayman-2-redreamed": {"title": "Rayman 2: Redreamed", "url": "https://newdawn.games/rayman-2-redreamed/"}, "rayman-3-havok-reignited-remake": {"title": "Rayman 3: Havok Reignited Remake", "url": "https://youtu.be/XjeTYHk9c5c?si=dQyFhBhOywMb88KL"}, "render-98-for-ship-of-harkinian": {"title": "Render 98 for Ship of Harkinian", "url": "https://youtube.com/shorts/4cAWo32Xix4?si=NtC2O68PgiFTqw28"}, "resident-evil-code-veronica-x-game-cube-decompilation": {"title": "Resident Evil: Code Veronica X (Game Cube) Decompilation", "url": "https://github.com/fmil95/recvx-gc-decomp"}, "resident-evil-code-veronica-x-ps2-decompilation": {"title": "Resident Evil: Code Veronica X (PS2) Decompilation", "url": "https://github.com/fmil95/recvx-decomp"}, "return-to-yoshi-s-island": {"title": "Return to Yoshi's Island", "url": "https://romhacking.com/hack/return-to-yoshi-s-island-demo-2"}, "rhythm-heaven-decompilation": {"title": "Rhythm Heaven Decompilation", "url": "https://github.com/patataofcourse/rhgold"}, "rock-band-3-decompilation": {"title": "Rock Band 3 Decompilation", "url": "https://github.com/DarkRTA/rb3"}, "rocket-robot-on-wheels-decompilation": {"title": "Rocket: Robot on Wheels Decompilation", "url": "https://github.com/RocketRet/Rocket-Robot-On-Wheels"}, "secret-of-mana-pc-engine-port": {"title": "Secret of Mana PC-Engine Port", "url": "https://kaffeeware.itch.io/secret-of-mana-pce"}, "shadowgate-64-decompilation": {"title": "Shadowgate 64 Decompilation", "url": "https://github.com/rainchus/shadowgate64"}, "shadow-of-the-colossus-decompilation": {"title": "Shadow of the Colossus Decompilation", "url": "https://github.com/Fantaskink/SOTC"}, "shin-megami-tensei-decompilation": {"title": "Shin Megami Tensei Decompilation", "url": "https://codeberg.org/Chickenzes/smt-decomp"}, "silent-hill-decompilation": {"title": "Silent Hill Decompilation", "url": "https://github.com/Vatuu/silent-hill-decomp"}, "skyblivion": {"title": "Skyblivion", "url": "https://youtu.be/LwUibq6wBn4?si=RzqLY7QaIEZjBOBj"}, "skys-of-arcadia-legends-decompilation": {"title": "Skys of Arcadia Legends Decompilation", "url": "https://github.com/rainchus/SkiesofArcadiaLegends"}, "skywind": {"title": "Skywind", "url": "https://tesrskywind.com/"}, "sly-cooper-and-the-thievius-raccoonus-decompilation": {"title": "Sly Cooper and the Thievius Raccoonus Decompilation", "url": "https://github.com/TheOnlyZac/sly1"}, "snowboard-kids-2-decompilation": {"title": "Snowboard Kids 2 Decompilation", "url": "https://github.com/cdlewis/snowboardkids2-decomp"}, "sonic-advance-2-decompilation": {"title": "Sonic Advance 2 Decompilation", "url": "https://github.com/SAT-R/sa2"}, "sonic-advance-trilogy-decompilation": {"title": "Sonic Advance Trilogy Decompilation", "url": "https://github.com/SAT-R"}, "sonic-and-the-secret-rings-pc-port-project-reignition": {"title": "Sonic and the Secret Rings PC Port - Project Reignition", "url": "https://sonicfangameshq.com/forums/showcase/project-reignition-sage-2025-demo.2540/#itemDownloads"}, "sonic-riders-decompilation": {"title": "Sonic Riders Decompilation", "url": "https://github.com/doldecomp/sonicriders"}, "sonic-riders-zero-gravity-decompilation": {"title": "Sonic Riders: Zero Gravity Decompilation", "url": "https://github.com/KidWizardOfTheWeb/SRZGDecomp"}, "sonic-runners-decompilation": {"title": "Sonic Runners Decompilation", "url": "https://github.com/itsmattkc/RunnersDecomp"}, "sonic-rush-rerun-pc-port": {"title": "Sonic Rush Rerun - PC Port", "url": "https://youtu.be/I5mGwM-uikw?si=w0LLmprSc0FLeIzI"}, "sonic-the-fighters-decompilation": {"title": "Sonic the Fighters Decompilation", "url": "https://github.com/biggestsonicfan/stfdecomp"}, "sonic-the-hedgehog-2006-recompilation": {"title": "Sonic the Hedgehog (2006) Recompilation", "url": "https://github.com/sonicnext-dev/MarathonRecomp"}, "space-station-silicon-valley-decompilation": {"title": "Space Station Silicon Valley Decompilation", "url": "https://github.com/mkst/sssv"}, "spider-man-2001-decompilation": {"title": "Spider-Man 2001 Decompilation", "url": "https://github.com/krystalgamer/spidey-decomp"}, "spongebob-squarepants-battle-for-bikini-bottom-decompilation": {"title": "Spongebob Squarepants: Battle for Bikini Bottom Decompilation", "url": "https://github.com/bfbbdecomp/bfbb"}, "spyro-the-dragon-decompilation": {"title": "Spyro the Dragon Decompilation", "url": "https://github.com/TheMobyCollective/spyro-1"}, "star-fox-adventures-decompilation": {"title": "Star Fox adventures Decompilation", "url": "https://github.com/renakunisaki/sfadebug"}, "star-wars-shadows-of-the-empire-decompilation": {"title": "Star Wars: Shadows of the Empire Decompilation", "url": "https://github.com/eltalelibrarian/sote"}, "street-fighter-iii-3rd-strike-decompilation": {"title": "Street Fighter III 3rd Strike Decompilation", "url": "https://github.com/crowded-street/3s-decomp"}, "summoner-a-goddess-reborn-decompilation": {"title": "Summoner: A Goddess Reborn Decompilation", "url": "https://decomp.dev/Charlese2/sgr"}, "super-ghouls-n-ghosts-decompilation": {"title": "Super Ghouls 'n Ghosts Decompilation", "url": "https://github.com/fredyeye/super-ghouls-n-ghosts-disassembly"}, "super-mario-3d-land-decompilation": {"title": "Super Mario 3D Land Decompilation", "url": "https://github.com/3dsdecomp/redpepper"}, "super-mario-3d-world-bowser-s-fury-decompilation": {"title": "Super Mario 3D World + Bowser's Fury Decompilation", "url": "https://github.com/3DWCommunity/3dcomp"}, "super-mario-64-playstation-port": {"title": "Super Mario 64 - PlayStation Port", "url": "https://github.com/malucard/sm64-psx"}, "super-mario-galaxy-decompilation": {"title": "Super Mario Galaxy Decompilation", "url": "https://github.com/snailspeed3/SMGDecompilation"}, "super-mario-galaxy-2-decompilation": {"title": "Super Mario Galaxy 2 Decompilation", "url": "https://github.com/SMGCommunity/Garigari"}, "super-mario-odyssey-a-galaxy-story": {"title": "Super Mario Odyssey - A Galaxy Story", "url": "https://youtu.be/KnslfMOZ5dY?si=n2Is3Od8bCXdC1Ph"}, "super-mario-odyssey-decompilation": {"title": "Super Mario Odyssey Decompilation", "url": "https://github.com/MonsterDruide1/OdysseyDecomp"}, "super-mario-strikers-decompilation": {"title": "Super Mario Strikers Decompilation", "url": "https://github.com/yannicksuter/smstrikers-decomp"}, "super-mario-sunshine-decompilation": {"title": "Super Mario Sunshine Decompilation", "url": "https://github.com/doldecomp/sms"}, "super-metroid-decompilation": {"title": "Super Metroid Decompilation", "url": "https://github.com/snesrev/sm"}, "super-monkey-ball-decompilation": {"title": "Super Monkey Ball Decompilation", "url": "https://github.com/camthesaxman/smb-decomp/"}, "super-paper-mario-decompilation": {"title": "Super Paper Mario Decompilation", "url": "https://github.com/SeekyCt/spm-decomp"}, "super-smash-bros-64-decompilation": {"title": "Super Smash Bros. 64 Decompilation", "url": "https://github.com/VetriTheRetri/ssb-decomp-re"}, "super-smash-bros-brawl-decompilation": {"title": "Super Smash Bros. Brawl Decompilation", "url": "https://github.com/doldecomp/brawl"}, "super-smash-bros-melee-decompilation": {"title": "Super Smash Bros. Melee Decompilation", "url": "https://github.com/doldecomp/melee"}, "the-legend-of-zelda-phantom-hourglass-decompilation": {"title": "The Legend of Zelda: Phantom Hourglass Decompilation", "url": "https://github.com/zeldaret/ph"}, "the-legend-of-zelda-skyward-sword-decompilation": {"title": "The Legend of Zelda: Skyward Sword Decompilation", "url": "https://github.com/zeldaret/ss"}, "the-legend-of-zelda-tears-of-the-kingdom-online": {"title": "The Legend of Zelda: Tears of the Kingdom Online", "url": "https://youtu.be/XbymS6mbg48?si=KFNXWmiYHKlPtGQs"}, "the-legend-of-zelda-the-wind-waker-decompilation": {"title": "The Legend of Zelda: The Wind Waker Decompilation", "url": "https://github.com/zeldaret/tww"}, "the-legend-of-zelda-twilight-princess-decompilation": {"title": "The Legend of Zelda: Twilight Princess Decompilation", "url": "https://github.com/zeldaret/tp"}, "the-sims-2-castaway-decompilation": {"title": "The Sims 2: Castaway Decompilation", "url": "https://github.com/HaydnTrigg/Castaway"}, "the-spongebob-squarepants-movie-decompilation": {"title": "The Spongebob Squarepants Movie Decompilation", "url": "https://decomp.dev/bfbbdecomp/tssm?sort=updated"}, "the-world-ends-with-you-decompilation": {"title": "The World Ends With You Decompilation", "url": "https://decomp.dev/Yotona/twewy"}, "tomba-decompilation": {"title": "Tomba! Decompilation", "url": "https://github.com/hansbonini/psx_tomba"}, "tomb-raider-chronicles-decompilation": {"title": "Tomb Raider Chronicles Decompilation", "url": "https://github.com/TOMB5/TOMB5"}, "twisted-metal-decompilation": {"title": "Twisted Metal Decompilation", "url": "https://github.com/abelbriggs1/tm1_decomp"}, "twisted-metal-black-decompilation": {"title": "Twisted Metal Black Decompilation", "url": "https://github.com/abelbriggs1/tmb_decomp"}, "twisted-metal-harbor-city-decompilation": {"title": "Twisted Metal: Harbor City Decompilation", "url": "https://github.com/jacobleeharris/tmhc"}, "ty-the-tasmanian-tiger-decompilation": {"title": "Ty The Tasmanian Tiger Decompilation", "url": "https://github.com/1superchip/ty-decomp"}, "unreal-redux": {"title": "Unreal Redux", "url": "https://youtu.be/Pw8zyKdyQsQ?si=78Pc4S6ln60wqiDa"}, "vagrant-story-decompilation": {"title": "Vagrant Story Decompilation", "url": "https://github.com/ser-pounce/rood-reverse"}, "vandal-hearts-decompilation": {"title": "Vandal Hearts Decompilation", "url": "https://github.com/shao113/vh"}, "virtual-pro-wrestling-2-decompilation": {"title": "Virtual Pro-wrestling 2 Decompilation", "url": "https://github.com/aki-club/vpw2"}, "wave-race-64-decompilation": {"title": "Wave Race 64 Decompilation", "url": "https://github.com/LLONSIT/Wave-Race-64"}, "wcw-nwo-revenge-decompilation": {"title": "WCW NWO Revenge Decompilation", "url": "https://github.com/svinsmoke212/revenge"}, "wii-sports-decompilation": {"title": "Wii Sports Decompilation", "url": "https://github.com/doldecomp/ogws"}, "xenoblade-jp-decompilation": {"title": "Xenoblade (JP) Decompilation", "url": "https://github.com/xbret/xenoblade"}, "xenogears-decompilation": {"title": "Xenogears Decompilation", "url": "https://github.com/ladysilverberg/xenogears-decomp"}, "xenosaga-episode-i-decompilation": {"title": "Xenosaga Episode I Decompilation", "url": "https://github.com/squareman/xenosaga"}, "yakuza-1-decompilation": {"title": "Yakuza 1 Decompilation", "url": "https://github.com/hamzaxx370/ogre-decomp"}, "yoshi-s-story-decompilation": {"title": "Yoshi's Story Decompilation", "url": "https://github.com/decompals/yoshis-story"}, "yu-gi-oh-reshef-of-destruction-decompilation": {"title": "Yu-Gi-Oh! Reshef of Destruction Decompilation", "url": "https://github.com/shinny456/ygodm8"}, "zombieland-mmo": {"title": "Zombieland MMO", "url": "https://github.com/andreamonaco/zombieland"}, "zone-of-the-enders-decompilation": {"title": "Zone of the Enders Decompilation", "url": "https://github.com/GirianSeed/zoe1"}, "zone-of-the-enders-the-2nd-runner-decompilation": {"title": "Zone of the Enders: The 2nd Runner Decompilation", "url": "https://github.com/GirianSeed/zoe2"}, "animal-crossing-city-folk-deluxe-animal-crossing-city-folk-let-s-go-to-the-city-mod": {"title": "Animal Crossing: City Folk Deluxe - Animal Crossing City Folk Let's Go To The City Mod", "url": "https://aurumsmods.com/accfdeluxe/"}, "ashes-series-2063-dead-man-walking-afterglow-hard-reset-doom-2-mod": {"title": "Ashes Series (2063 - Dead Man Walking - Afterglow - Hard Reset) - Doom 2 Mod", "url": "https://www.moddb.com/mods/ashes-2063/downloads/ashes-stand-alone-version-101"}, "baldur-s-gate-3-brawl-real-time-combat-mod": {"title": "Baldur's Gate 3: Brawl - Real Time Combat Mod", "url": "https://www.nexusmods.com/baldursgate3/mods/12614"}, "baldur-s-gate-3-chivalry-expansion": {"title": "Baldur's Gate 3: Chivalry Expansion", "url": "https://www.nexusmods.com/baldursgate3/mods/19120"}, "baldur-s-gate-3-forsaken": {"title": "Baldur's Gate 3: Forsaken", "url": "https://www.nexusmods.com/baldursgate3/mods/14844?tab=description"}, "baldur-s-gate-3-ultimate-cut-content-restoration-mod": {"title": "Baldur's Gate 3: Ultimate Cut Content Restoration Mod", "url": "https://www.nexusmods.com/baldursgate3/mods/20353"}, "battlefield-1942-desert-combat": {"title": "Battlefield 1942: Desert Combat", "url": "https://www.moddb.com/mods/desert-combat"}, "bioshock-native-hdr-mod": {"title": "Bioshock - Native HDR Mod", "url": "https://www.nexusmods.com/bioshock/mods/94"}, "black-reliquary-total-conversion-mod-for-darkest-dungeon": {"title": "Black Reliquary - Total conversion mod for Darkest Dungeon", "url": "https://store.steampowered.com/app/2119270/Black_Reliquary/"}, "bloodborne-shadps4-60fps-patch": {"title": "Bloodborne - shadPS4 - 60fps Patch", "url": "https://www.nexusmods.com/bloodborne/mods/252"}, "bloodborne-shadps4-visual-overhaul-mod": {"title": "Bloodborne - shadPS4 - Visual Overhaul Mod", "url": "https://www.nexusmods.com/bloodborne/mods/45?tab=files"}, "brutal-doom-doom-mod": {"title": "Brutal Doom - Doom Mod", "url": "https://www.moddb.com/mods/brutal-doom"}, "castlevania-simon-s-destiny-a-total-conversion-doom-mod": {"title": "Castlevania Simon's Destiny - a total conversion Doom mod", "url": "https://batandy.itch.io/simonsdestiny"}, "castlevania-symphony-of-the-night-randomizer-mod": {"title": "Castlevania Symphony of the Night Randomizer Mod", "url": "https://github.com/MottZilla/SotN_Integrated_Rando"}, "caveman-2-cosmos-civilization-4-total-overhaul-mod": {"title": "Caveman 2 Cosmos - Civilization 4 total overhaul mod", "url": "https://forums.civfanatics.com/forums/civ4-caveman-2-cosmos.449/"}, "celeste-strawberry-jam-mod": {"title": "Celeste Strawberry Jam mod", "url": "https://gamebanana.com/mods/424541"}, "chrono-trigger-pixel-demaster-mod": {"title": "Chrono Trigger Pixel Demaster Mod", "url": "https://www.nexusmods.com/chronotrigger/mods/8"}, "contra-c-and-c-generals-zero-hour-mod": {"title": "Contra - C&C: Generals Zero Hour Mod", "url": "https://www.moddb.com/mods/contra"}, "crusader-kings-2-a-song-of-ice-and-fire-mod": {"title": "Crusader Kings 2 A Song of Ice & Fire Mod", "url": "https://www.moddb.com/mods/crusader-kings-2-a-game-of-thrones-ck2agot"}, "cyberpunk-2077-battle-axe": {"title": "Cyberpunk 2077: Battle Axe", "url": "https://www.nexusmods.com/cyberpunk2077/mods/24895?tab=description"}, "cyberpunk-2077-night-city-traffic-overhaul-mod": {"title": "Cyberpunk 2077: Night City Traffic Overhaul Mod", "url": "https://www.nexusmods.com/cyberpunk2077/mods/25552"}, "cyberpunk-2077-take-a-breather-pace-and-reputation-overhaul-mod": {"title": "Cyberpunk 2077: Take a Breather - Pace & Reputation Overhaul Mod", "url": "https://www.nexusmods.com/cyberpunk2077/mods/23290"}, "dark-souls-2-firelink-edition": {"title": "Dark Souls 2 Firelink Edition", "url": "https://www.nexusmods.com/darksouls2/mods/1498"}, "dark-souls-3-seamless-co-op-mod": {"title": "Dark Souls 3 Seamless Co-op Mod", "url": "https://www.nexusmods.com/darksouls3/mods/1895"}, "dark-souls-remastered-seamless-co-op-mod": {"title": "Dark Souls Remastered Seamless Co-op Mod", "url": "https://www.nexusmods.com/darksoulsremastered/mods/899"}, "dbz-budokai-4-dragonball-z-infinite-world-ps2-mod": {"title": "DBZ Budokai 4 - Dragonball Z Infinite World (PS2) Mod", "url": "https://www.moddb.com/games/dragon-ball-z-budokai-4"}, "deus-ex-nihilum": {"title": "Deus Ex: Nihilum", "url": "https://www.moddb.com/mods/nihilum"}, "dmc3-crimson-devil-may-cry-3-hd-collection-mod": {"title": "DMC3 Crimson - Devil May Cry 3 HD Collection Mod", "url": "https://dmc3crimson.github.io/"}, "dhwem3-doom-3-mod": {"title": "Dhwem3 - Doom 3 Mod", "url": "https://dhewm3.org/mods.html"}, "doom-voxel-doom-replace-2d-sprites-with-3d-voxels": {"title": "Doom - Voxel Doom - Replace 2D Sprites with 3D Voxels", "url": "https://www.moddb.com/mods/doom-voxel-project/addons/voxel-doom"}, "doom-2-voxel-doom-replace-2d-sprites-with-3d-voxels": {"title": "Doom 2 - Voxel Doom - Replace 2D Sprites with 3D Voxels", "url": "https://www.moddb.com/mods/voxel-doom-ii/addons/voxel-doomii-v2-1"}, "doom-3-realdoom": {"title": "Doom 3: RealDOOM", "url": "https://www.moddb.com/mods/realdoom-3/downloads/realdoom-3-50"}, "doom-infinite-doom-2-mod": {"title": "Doom Infinite - Doom 2 Mod", "url": "https://www.moddb.com/mods/doom-infinite"}, "dragon-ballz-dio-moveset": {"title": "Dragon BallZ - DIO Moveset", "url": "https://gamebanana.com/mods/564409"}, "dragon-ballz-yamiyugi-moveset": {"title": "Dragon BallZ - YamiYugi Moveset", "url": "https://gamebanana.com/mods/641650"}, "duke-nukem-3d-voxel-duke": {"title": "Duke Nukem 3D - Voxel Duke", "url": "https://www.moddb.com/mods/voxel-duke-nukem-3d/addons/voxel-duke-3d"}, "dyson-sphere-program-co-op-mod": {"title": "Dyson Sphere Program - Co-op Mod", "url": "https://thunderstore.io/c/dyson-sphere-program/p/nebula/NebulaMultiplayerMod/"}, "elden-ring-nightreign-seamless-two-player-co-op-mod": {"title": "Elden Ring Nightreign Seamless Two Player Co-op Mod", "url": "https://www.nexusmods.com/eldenringnightreign/mods/3?tab=files&file_id=14"}, "elden-ring-seamless-co-op-mod": {"title": "Elden Ring Seamless Co-op Mod", "url": "https://www.nexusmods.com/eldenring/mods/510"}, "elden-ring-the-convergence-overhaul-mod": {"title": "Elden Ring: The Convergence - Overhaul Mod", "url": "https://www.nexusmods.com/eldenring/mods/3419"}, "elden-ring-the-witcher-moveset-mod": {"title": "Elden Ring: The Witcher Moveset Mod", "url": "https://www.nexusmods.com/eldenring/mods/8707?tab=description"}, "skyrim-enderal": {"title": "Skyrim - Enderal", "url": "https://www.nexusmods.com/skyrim/mods/77868"}, "half-life-2-entropy-zero-2": {"title": "Half Life 2 - Entropy Zero 2", "url": "https://store.steampowered.com/app/1583720/Entropy__Zero_2/"}, "factorio-space-exploration": {"title": "Factorio - Space Exploration", "url": "https://mods.factorio.com/mod/space-exploration"}, "civilisation-5-faerun": {"title": "Civilisation 5 - Faerun", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=217840547"}, "fallout-4-fsr3-mod": {"title": "Fallout 4: FSR3 Mod", "url": "https://www.nexusmods.com/fallout4/mods/98208"}, "fallout-4-imperial-attack-on-the-commonwealth": {"title": "Fallout 4: Imperial Attack on the Commonwealth", "url": "https://www.nexusmods.com/fallout4/mods/95285"}, "fallout-4-london-mod-guide": {"title": "Fallout 4 London Mod Guide", "url": "https://steamdeckhq.com/tips-and-guides/how-to-play-the-fallout-london-steam-deck/"}, "fallout-4-loreout-the-modern-roleplaying-modlist": {"title": "Fallout 4: LoreOut - The Modern Roleplaying Modlist", "url": "https://www.nexusmods.com/fallout4/mods/99136"}, "fallout-4-misery-island-isles-of-new-england": {"title": "Fallout 4 Misery Island - Isles of New England", "url": "https://www.nexusmods.com/fallout4/mods/87983"}, "fallout-4-the-order-of-the-third-eye": {"title": "Fallout 4 The Order of the Third Eye", "url": "https://www.nexusmods.com/fallout4/mods/97675"}, "fallout-4-upscaling": {"title": "Fallout 4: Upscaling", "url": "https://www.nexusmods.com/fallout4/mods/99130"}, "fallout-new-vegas-autumn-leaves": {"title": "Fallout New Vegas: Autumn Leaves", "url": "https://www.nexusmods.com/newvegas/mods/50146"}, "fallout-new-vegas-long-15-expansion": {"title": "Fallout New Vegas: Long 15 Expansion", "url": "https://www.nexusmods.com/newvegas/mods/94306"}, "fallout-new-vegas-vanilla-plus-ao": {"title": "Fallout New Vegas: Vanilla Plus AO", "url": "https://www.nexusmods.com/newvegas/mods/94824"}, "f-e-a-r-echo-patch": {"title": "F.E.A.R. - Echo Patch", "url": "https://github.com/Wemino/EchoPatch"}, "fifa-14-and-16-classic-patch": {"title": "Fifa 14 and 16 Classic Patch", "url": "https://fifaclassicpatch.altervista.org/"}, "final-fantasy-7-7th-heaven-mod": {"title": "Final Fantasy 7 7th Heaven Mod", "url": "https://youtu.be/wNguRldtIqk?si=fNjXSMn9buolXYYc"}, "final-fantasy-7-rebirth-playable-dyne-mod": {"title": "Final Fantasy 7 Rebirth Playable Dyne Mod", "url": "https://www.nexusmods.com/finalfantasy7rebirth/mods/1655?tab=description"}, "final-fantasy-7-rebirth-playable-rufus-mod": {"title": "Final Fantasy 7 Rebirth Playable Rufus Mod", "url": "https://www.nexusmods.com/finalfantasy7rebirth/mods/1598"}, "final-fantasy-7-satsuki-yatoshi-syw-mod": {"title": "Final Fantasy 7 Satsuki Yatoshi SYW Mod", "url": "https://youtu.be/4aaaDnCE82g?si=mAFFS_zu-alAn3pk"}, "final-fantasy-9-moguri-mod": {"title": "Final Fantasy 9 Moguri Mod", "url": "https://sites.google.com/view/moguri-mod/home"}, "final-fantasy-tactics-the-lion-war-of-the-lions-mod": {"title": "Final Fantasy Tactics The Lion War of the Lions Mod", "url": "https://www.reddit.com/r/finalfantasytactics/comments/xi0l6t/mod_release_the_lion_war_of_the_lions_tlwotl/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, "battlefield-2-forgotten-hope-2": {"title": "Battlefield 2 - Forgotten Hope 2", "url": "https://www.moddb.com/mods/forgotten-hope-2"}, "mount-and-blade-warband-gekokujo": {"title": "Mount & Blade: Warband - Gekokujo", "url": "https://www.moddb.com/mods/gekokujo"}, "oblivion-remastered-glock-functional-gun-mod": {"title": "Oblivion Remastered - Glock Functional Gun Mod", "url": "https://www.nexusmods.com/oblivionremastered/mods/4681"}, "half-life-2-goldeneye-source": {"title": "Half-Life 2 - GoldenEye: Source", "url": "https://www.moddb.com/mods/goldeneye-source"}, "gta-iv-fusionfix": {"title": "GTA IV FusionFix", "url": "https://www.reddit.com/r/SteamDeck/comments/1nzene8/gta_iv_with_fusionfix_is_awesome/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, "gta-v-large-pedestrian-crowds-mod": {"title": "GTA V: Large Pedestrian Crowds Mod", "url": "https://www.nexusmods.com/gta5enhanced/mods/296?tab=description"}, "gta-v-superman-mod": {"title": "GTA V: Superman Mod", "url": "https://www.patreon.com/posts/superman-v2-2-0-146533832"}, "gta-vice-city-actual-nextgen-edition-modpack": {"title": "GTA Vice City Actual NextGen Edition Modpack", "url": "https://www.mediafire.com/file/1i2gqml81umjugt/GTA+Vice+City+Actual+Next-Gen+Edition+v6.0.7z/file"}, "resident-evil-requiem-merchant": {"title": "Resident Evil Requiem - Merchant", "url": "https://www.nexusmods.com/residentevilrequiem/mods/1920?tab=description"}, "half-life-2-episode-two-raising-the-bar-redux": {"title": "Half-Life 2: Episode Two - Raising The Bar: Redux", "url": "https://www.moddb.com/mods/half-life-2-raising-the-bar-redux"}, "half-life-black-mesa-blue-shift-caretaking-update": {"title": "Half-Life Black Mesa: Blue Shift - Caretaking Update", "url": "https://www.moddb.com/mods/black-mesa-blue-shift-remake/news/chapters-1-5-caretaking-update-release"}, "half-life-diffusion": {"title": "Half-Life Diffusion", "url": "https://www.moddb.com/mods/diffusion"}, "half-life-element-64": {"title": "Half-Life: Element 64", "url": "https://store.steampowered.com/app/1625220/HalfLife_Element_64/"}, "half-life-legacy": {"title": "Half-Life Legacy", "url": "https://store.steampowered.com/app/3619040/HalfLife_Legacy/"}, "the-legend-of-zelda-ocarina-of-time-hero-of-law": {"title": "The Legend of Zelda Ocarina of Time - Hero of Law", "url": "https://newerteam.com/en/hol/index.html"}, "hollow-knight-silksong-multiplayer-mod": {"title": "Hollow Knight: Silksong Multiplayer Mod", "url": "https://www.nexusmods.com/hollowknightsilksong/mods/90?tab=description"}, "heroes-of-might-and-magic-iii-horn-of-the-abyss": {"title": "Heroes of Might and Magic III - Horn of the Abyss", "url": "https://www.moddb.com/mods/horn-of-the-abyss"}, "icewind-dale-2-enhanced-edition-icewind-dale-2-mod": {"title": "Icewind Dale 2 Enhanced Edition - Icewind Dale 2 Mod", "url": "https://forums.beamdog.com/discussion/87952/icewind-dale-2-enhanced-edition-is-released/p1"}, "just-cause-3-unlimited-edition": {"title": "Just Cause 3 Unlimited Edition", "url": "https://videogamemods.com/vgm/justcause3/mods/just-cause-3-unlimited-edition-1001082"}, "kingdom-hearts-refined-a-mod-for-kingdom-hearts-1-5-2-5-remix": {"title": "Kingdom Hearts ReFined - a mod for Kingdom Hearts 1.5 + 2.5 ReMix", "url": "https://github.com/KH-ReFined/KH-ReFined"}, "lies-of-p-co-op-mod": {"title": "Lies of P - Co-op Mod", "url": "https://www.nexusmods.com/liesofp/mods/368?tab=description"}, "luigi-s-mansion-louie-mansion-pikmin-overhaul-mod": {"title": "Luigi's Mansion - Louie' Mansion Pikmin Overhaul Mod", "url": "https://gamebanana.com/mods/551672"}, "mario-kart-64-amped-up": {"title": "Mario Kart 64 - Amped Up", "url": "https://youtu.be/vvg20Gd58WA?si=-3Rx0-7ekPZct7n4"}, "mario-kart-8-deluxe-ctgp-deluxe": {"title": "Mario Kart 8 Deluxe - CTGP Deluxe", "url": "https://www.ctgpdx.com/home"}, "mario-kart-super-circuit-60-fps-patch": {"title": "Mario Kart Super Circuit - 60 FPS Patch", "url": "https://romhack.ing/database/content/entry/xlruT_gHReWVM1HtQL3Lmg/mario-kart-super-circuit-60-fps-patch"}, "marvel-vs-capcom-infinite-and-beyond-mod": {"title": "Marvel vs Capcom Infinite & Beyond Mod", "url": "https://steamdeckhq.com/tips-and-guides/how-to-install-marvel-vs-capcom-infinite-beyond-mod-on-steam-deck/"}, "max-payne-remix": {"title": "Max Payne: Remix", "url": "https://www.moddb.com/mods/max-payne-remix"}, "medal-of-honor-airborne-redux": {"title": "Medal of Honor Airborne Redux", "url": "https://www.moddb.com/mods/medal-of-honor-airborne-redux/downloads"}, "medieval-2-total-war-kingdoms-mod-third-age-total-war": {"title": "Medieval 2: Total War Kingdoms Mod: Third Age Total War", "url": "https://www.moddb.com/mods/third-age-total-war"}, "command-and-conquer-red-alert-2-mental-omega": {"title": "Command & Conquer Red Alert 2 - Mental Omega", "url": "https://www.moddb.com/mods/mental-omega"}, "elder-scrolls-iii-morrowind-morrowind-rebirth": {"title": "Elder Scrolls III: Morrowind - Morrowind Rebirth", "url": "https://www.moddb.com/mods/morrowind-rebirth"}, "nba-jam-legends-on-fire-edition": {"title": "NBA Jam Legends on Fire Edition", "url": "https://forums.nba-live.com/viewtopic.php?f=72&t=114923"}, "need-for-speed-most-wanted-2005-mod-pack-for-steam-deck-and-pc-guide": {"title": "Need for Speed Most Wanted 2005 - Mod Pack for Steam Deck and PC Guide", "url": "https://greatondeck.net/ready-mod-for-need-for-speed-most-wanted-2005-enhanced-graphics-for-steam-deck-and-pc-guide/"}, "need-for-speed-pro-street-mod-pack-for-steam-deck-and-pc-guide": {"title": "Need for Speed Pro Street - Mod Pack for Steam Deck and PC Guide", "url": "https://greatondeck.net/need-for-speed-pro-street-is-easy-on-steam-deck-with-this-guide/"}, "need-for-speed-underground-mod-pack-for-steam-deck-and-pc-guide": {"title": "Need for Speed Underground - Mod Pack for Steam Deck and PC Guide", "url": "https://greatondeck.net/how-to-run-need-for-speed-underground-on-steam-deck-and-modern-pc-guide-with-modpack/"}, "half-life-2-no-more-room-in-hell": {"title": "Half-Life 2 - No More Room in Hell", "url": "https://www.moddb.com/mods/no-more-room-in-hell"}, "oblivion-oscuro-s-overhaul": {"title": "Oblivion - Oscuro's Overhaul", "url": "https://www.moddb.com/mods/oscuros-oblivion-overhaul/downloads"}, "paper-mario-the-thousand-year-door-encore": {"title": "Paper Mario: The Thousand-Year Door Encore", "url": "https://gamebanana.com/mods/590058"}, "paper-mario-tower-of-trials": {"title": "Paper Mario: Tower of Trials", "url": "https://github.com/jdaster64/ttyd-tot"}, "persona-3-fes-hd-overhaul-mod-and-widescreen-patch": {"title": "Persona 3 FES HD Overhaul Mod & Widescreen Patch", "url": "https://youtu.be/deFqMs1tBYo?si=suNlZLJ4J0aL0pU1"}, "pillars-of-eternity-2-deadfire-font-increase-mod": {"title": "Pillars of Eternity 2 Deadfire - Font Increase Mod", "url": "https://www.reddit.com/r/SteamDeck/comments/149rbhs/i_made_a_mod_that_increases_the_dialogue_font/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, "super-smash-brothers-brawl-pmex-remix": {"title": "Super Smash Brothers Brawl - PMEX Remix", "url": "https://theoutcastersnotebook.com/post/set-up-pmex-remix-on-deck/"}, "portal-2-portal-stories-mel": {"title": "Portal 2 - Portal Stories: Mel", "url": "https://store.steampowered.com/app/317400/Portal_Stories_Mel/"}, "portal-2-portal-reloaded": {"title": "Portal 2 - Portal Reloaded", "url": "https://store.steampowered.com/app/1255980/Portal_Reloaded/"}, "portal-2-portal-revolution": {"title": "Portal 2 - Portal Revolution", "url": "https://store.steampowered.com/app/601360/Portal_Revolution/"}, "doom-2-project-brutality": {"title": "Doom 2 - Project Brutality", "url": "https://www.moddb.com/mods/project-brutality"}, "quake-arcane-dimensions": {"title": "Quake - Arcane Dimensions", "url": "https://www.moddb.com/mods/arcane-dimensions"}, "rainbow-six-black-ops": {"title": "Rainbow Six Black Ops", "url": "https://www.moddb.com/mods/rainbow-six-black-ops-20/downloads/rainbow-six-black-ops-20-release"}, "doom-3-bfg-edition-rbdoom3bfg": {"title": "Doom 3 BFG Edition - Rbdoom3BFG", "url": "https://www.moddb.com/mods/rbdoom-3-bfg"}, "red-dead-redemption-2-metal-gear-solid-3-recreation-mod": {"title": "Red Dead Redemption 2 - Metal Gear Solid 3 Recreation Mod", "url": "https://www.nexusmods.com/reddeadredemption2/mods/7152?tab=description"}, "star-wars-empire-at-war-forces-of-corruption-republic-at-war": {"title": "Star Wars: Empire at War: Forces of Corruption - Republic at War", "url": "https://www.moddb.com/mods/republic-at-war"}, "resident-evil-2-re-enhance-mod": {"title": "Resident Evil 2 - RE-Enhance Mod", "url": "https://www.moddb.com/mods/reenhance-re2/downloads/re-enhance-re2-v20-for-gog-version"}, "resident-evil-2-thomas-the-tank-engine-mod": {"title": "Resident Evil 2 - Thomas the Tank Engine Mod", "url": "https://www.nexusmods.com/residentevil22019/mods/62"}, "resident-evil-4-remake-tactical-first-person-mod": {"title": "Resident Evil 4 Remake Tactical First Person Mod", "url": "https://www.nexusmods.com/residentevil42023/mods/5458?tab=description"}, "mario-kart-wii-retro-rewind": {"title": "Mario Kart Wii - Retro Rewind", "url": "https://wiki.tockdom.com/wiki/Retro_Rewind"}, "mario-kart-wii-retro-rewind-wheel-wizard-launcher": {"title": "Mario Kart Wii - Retro Rewind Wheel Wizard Launcher", "url": "https://github.com/TeamWheelWizard/WheelWizard"}, "rimworld-a-rimworld-of-magic": {"title": "RimWorld - A Rimworld of Magic", "url": "https://steamcommunity.com/workshop/filedetails/?id=1201382956"}, "rimworld-android-tiers": {"title": "RimWorld - Android Tiers", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=1386412863"}, "rimworld-pokeworld": {"title": "RimWorld - PokeWorld", "url": "https://steamcommunity.com/workshop/filedetails/?id=2652029657"}, "rimworld-save-our-ship-2": {"title": "RimWorld - Save Our Ship 2", "url": "https://steamcommunity.com/workshop/filedetails/?id=1909914131"}, "rimworld-vanilla-expanded": {"title": "RimWorld - Vanilla Expanded", "url": "https://steamcommunity.com/workshop/filedetails/?id=1884025115"}, "rimworld-zombieland": {"title": "RimWorld - Zombieland", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=928376710"}, "saints-row-2-juiced-patch": {"title": "Saints Row 2 - Juiced Patch", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=3291739005"}, "sekiro-resurrection-overhaul-mod": {"title": "Sekiro Resurrection - Overhaul Mod", "url": "https://www.nexusmods.com/sekiro/mods/723"}, "skyrim-a-ghibli-skyrim-landscapes-mod": {"title": "Skyrim - A Ghibli Skyrim Landscapes Mod", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/166859"}, "skyrim-a-ghibli-skyrim-whiterun-mod": {"title": "Skyrim - A Ghibli Skyrim Whiterun Mod", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/164600"}, "skyrim-midnight-sun": {"title": "Skyrim - Midnight Sun", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/163295?tab=description"}, "skyrim-skypal": {"title": "Skyrim - Skypal", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/154740#:~:text=This%20mod%2C%20as%20the%20name,and%20grow%20together%20with%20them."}, "skyrim-skyparkour-v3-mod": {"title": "Skyrim - SkyParkour v3 Mod", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/132292"}, "skyrim-special-edition-azeroth-reborn": {"title": "Skyrim Special Edition - Azeroth Reborn", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/160339"}, "skyrim-special-edition-lordbound": {"title": "Skyrim Special Edition - Lordbound", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/160493"}, "skyrim-special-edition-norden-ui": {"title": "Skyrim Special Edition - Norden UI", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/166086"}, "skyrim-together-reborn": {"title": "Skyrim - Together Reborn", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/69993"}, "skyrim-tuxborn-overhaul-mod": {"title": "Skyrim - Tuxborn Overhaul Mod", "url": "https://www.reddit.com/r/SteamDeck/comments/1gaiwbi/if_you_want_to_get_back_into_skyrim_there_is_an/?share_id=a3AXVrJPRuFcYljWxp19g&utm_content=1&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1"}, "slay-the-spire-downfall": {"title": "Slay the Spire - Downfall", "url": "https://store.steampowered.com/app/1865780/Downfall__A_Slay_the_Spire_Fan_Expansion/"}, "sonic-robo-blast-2-generations-mod": {"title": "Sonic Robo Blast 2 - Generations Mod", "url": "https://mb.srb2.org/addons/srb2-generations.8725/"}, "sphinx-and-the-cursed-mummy-pc-mod": {"title": "Sphinx and the Cursed Mummy - PC Mod", "url": "https://www.reddit.com/r/pcgaming/comments/1kl27um/sphinx_and_the_cursed_mummy_pc_mod/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, "spiderman-multiplayer-mod": {"title": "Spiderman - Multiplayer Mod", "url": "https://www.patreon.com/hbgda/home"}, "splinter-cell-enhanced": {"title": "Splinter Cell Enhanced", "url": "https://github.com/Joshhhuaaa/EnhancedSC"}, "s-t-a-l-k-e-r-shadow-of-chernobyl-radiophobia-3": {"title": "S.T.A.L.K.E.R.: Shadow of Chernobyl - Radiophobia 3", "url": "https://www.moddb.com/mods/radiophobia"}, "s-t-a-l-k-e-r-2-heart-of-chernobyl-zone-unchained": {"title": "S.T.A.L.K.E.R. 2: Heart of Chernobyl - Zone Unchained", "url": "https://www.nexusmods.com/stalker2heartofchornobyl/mods/1767"}, "stardew-valley-a-voice-over-mod-for-all-love-interests": {"title": "Stardew Valley - A Voice Over Mod For All Love Interests", "url": "https://www.nexusmods.com/stardewvalley/mods/22550"}, "starfield-star-wars-classes": {"title": "Starfield - Star Wars Classes", "url": "https://www.nexusmods.com/starfield/mods/14984?tab=description"}, "starfield-steam-deck-essentials-mod-install-guide": {"title": "Starfield - Steam Deck Essentials Mod Install Guide", "url": "https://youtu.be/T5rQBbcV_AY?si=38PNEz8T3WE4RFtZ"}, "starfield-star-wars-genesis-total-conversion": {"title": "Starfield - Star Wars Genesis Total Conversion", "url": "https://www.nexusmods.com/starfield/mods/11114"}, "star-fox-snes-force-feedback-patch": {"title": "Star Fox SNES Force Feedback Patch", "url": "https://romhackplaza.org/romhacks/star-fox-shindou-edition-snes/"}, "star-wars-battlefront-2-remaster-mod": {"title": "Star Wars Battlefront 2 - Remaster Mod", "url": "https://www.moddb.com/mods/hd-graphics-mod"}, "x4-foundations-star-wars-interworlds": {"title": "X4 Foundations - Star Wars Interworlds", "url": "https://www.nexusmods.com/x4foundations/mods/349"}, "jedi-knight-jedi-academy-star-wars-movie-duels": {"title": "Jedi Knight: Jedi Academy - Star Wars Movie Duels", "url": "https://www.reddit.com/r/SteamDeck/comments/1336a12/how_to_get_the_best_jedi_experience_on_the_steam/?utm%5C_source=share&utm%5C_medium=android%5C_app&utm%5C_name=androidcss&utm%5C_term=1&utm%5C_content=share%5C_button"}, "super-mario-sunshine-super-mario-eclipse": {"title": "Super Mario Sunshine - Super Mario Eclipse", "url": "https://youtu.be/8zABT16mGuY?si=WP1zK92GIvLqmFkL"}, "super-mario-3d-land-super-mario-expedition-2": {"title": "Super Mario 3D Land - Super Mario Expedition 2", "url": "https://youtu.be/Ko2ChgbARnU?si=xX_6YhMwIvBN6Lw4"}, "super-mario-odyssey-online": {"title": "Super Mario Odyssey Online", "url": "https://smoo.it/#/"}, "super-smash-bros-brawl-rex": {"title": "Super Smash Bros. Brawl - REX", "url": "https://www.rexbuild.site/"}, "super-smash-bros-melee-akaneia-build": {"title": "Super Smash Bros. Melee - Akaneia Build", "url": "https://github.com/akaneia/akaneia-build"}, "terraria-calamity-mod": {"title": "Terraria - Calamity Mod", "url": "https://forums.terraria.org/index.php?threads/calamity-mod.44065/"}, "terraria-tmodloader": {"title": "Terraria - tModLoader", "url": "https://store.steampowered.com/app/1281930/tModLoader/"}, "the-binding-of-isaac-external-items-description-mod": {"title": "The Binding of Isaac - External Items Description mod", "url": "https://github.com/wofsauge/External-Item-Descriptions/wiki/How-to-install-the-mod"}, "gothic-2-gold-edition-the-chronicles-of-myrtana-archolos": {"title": "Gothic 2 Gold Edition - The Chronicles Of Myrtana Archolos", "url": "https://store.steampowered.com/app/1467450/The_Chronicles_Of_Myrtana_Archolos"}, "half-life-2-the-citizen": {"title": "Half Life 2 - The Citizen", "url": "https://www.moddb.com/mods/the-citizen"}, "thief-the-dark-mod": {"title": "Thief - The Dark Mod", "url": "https://www.thedarkmod.com/main/"}, "the-legend-of-zelda-breath-of-the-wild-bettervr": {"title": "The Legend of Zelda: Breath of the Wild - BetterVR", "url": "https://github.com/Crementif/BotW-BetterVR"}, "the-legend-of-zelda-breath-of-the-wild-fov-and-shoulder-cam-mod": {"title": "The Legend of Zelda: Breath of the Wild - FOV & Shoulder Cam Mod", "url": "https://gamebanana.com/mods/49627"}, "the-legend-of-zelda-tears-of-the-kingdom-ultracam-mod": {"title": "The Legend of Zelda: Tears of the Kingdom - Ultracam Mod", "url": "https://www.nxoptimizer.com/games/tears-of-the-kingdom/"}, "mount-and-blade-2-bannerlord-the-old-realms": {"title": "Mount & Blade 2: Bannerlord - The Old Realms", "url": "https://www.moddb.com/mods/the-old-realms"}, "the-simpsons-hit-and-run-futurama-overhaul-mod": {"title": "The Simpsons Hit & Run - Futurama Overhaul Mod", "url": "https://youtu.be/JKPz3PE7_4s?si=NJxOrfo5alaNzB9C"}, "the-witcher-3-brothers-in-arms-mod": {"title": "The Witcher 3 - Brothers in Arms Mod", "url": "https://www.nexusmods.com/witcher3/mods/7329"}, "the-witcher-3-brothers-in-arms-ultimate-edition": {"title": "The Witcher 3 - Brothers in Arms Ultimate Edition", "url": "https://www.nexusmods.com/witcher3/mods/11260?tab=description"}, "the-witcher-3-hd-reworked-project-next-gen-edition": {"title": "The Witcher 3 - HD Reworked Project Next Gen Edition", "url": "https://www.nexusmods.com/witcher3/mods/9963?tab=description"}, "the-witcher-3-let-there-be-light": {"title": "The Witcher 3 - Let There Be Light", "url": "https://www.nexusmods.com/witcher3/mods/11246?tab=description"}, "the-witcher-3-wild-monster-hunt": {"title": "The Witcher 3 - Wild Monster Hunt", "url": "https://www.reddit.com/r/ItsAllAboutGames/comments/1o9v7wi/the_witcher_3_turned_into_a_survival_game_with/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, "s-t-a-l-k-e-r-call-of-pripyat-misery": {"title": "S.T.A.L.K.E.R. Call of Pripyat - Misery", "url": "https://www.moddb.com/mods/stalker-misery"}, "tony-hawk-s-underground-2-thugpro": {"title": "Tony Hawk's Underground 2 - THUGPro", "url": "https://www.reddit.com/r/THPS/comments/tjrwgw/thug_pro_on_steam_deck/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, "dungeon-siege-ultima-v-lazarus": {"title": "Dungeon Siege - Ultima V Lazarus", "url": "https://www.u5lazarus.com/Downloads.html"}, "undertale-undertale-together": {"title": "Undertale - Undertale Together", "url": "https://www.moddb.com/mods/undertale-together"}, "unreal-unrealrtx-mod": {"title": "Unreal - UnrealRTX Mod", "url": "https://www.dsogaming.com/pc-performance-analyses/unreal-rtx-remix-path-tracing-mod-fully-released/"}, "watch-dogs-living-city": {"title": "Watch Dogs - Living City", "url": "https://www.nexusmods.com/watchdogs/mods/81"}, "wolfenstein-blade-of-agony": {"title": "Wolfenstein - Blade of Agony", "url": "https://boa.realm667.com/"}, "xcom-enemy-unknown-long-war": {"title": "XCOM: Enemy Unknown - Long War", "url": "https://www.nexusmods.com/xcom/mods/88"}, "star-wars-x-wing-special-edition-xwvm": {"title": "Star Wars X-Wing Special Edition - XWVM", "url": "https://www.moddb.com/mods/xwvm"}, "yakuza-0-co-op-mod": {"title": "Yakuza 0 - Co-op Mod", "url": "https://www.nexusmods.com/yakuza0/mods/1276?tab=description"}, "007-quantum-of-solace": {"title": "007: Quantum of Solace", "url": "https://archive.org/details/quantum-of-solace_202509"}, "ace-combat-assault-horizon-enhanced-edition": {"title": "Ace Combat: Assault Horizon Enhanced Edition", "url": "https://archive.org/details/ace-combat-assault-horizon_202512"}, "afterfall-insanity-extended-edition": {"title": "Afterfall InSanity: Extended Edition", "url": "https://archive.org/details/Afterfall"}, "aladdin-in-nasira-s-revenge": {"title": "Aladdin In Nasira's Revenge", "url": "https://archive.org/details/aladdin-in-nasiras-revenge-repack"}, "alien-trilogy": {"title": "Alien Trilogy", "url": "https://archive.org/details/at_20251025"}, "alien-vs-predor-2-gold-edition": {"title": "Alien vs Predor 2: Gold Edition", "url": "https://archive.org/details/avp-2-gold-edition"}, "america-mcgee-s-alice-remastered": {"title": "America McGee's Alice: Remastered", "url": "https://archive.org/details/american-mc-gee-alice"}, "area-51": {"title": "Area 51", "url": "https://archive.org/details/area-51.7z_202506"}, "assassin-s-creed-iii": {"title": "Assassin's Creed III", "url": "https://archive.org/details/assassins-creed-iii-deluxe-edition"}, "atlantis-the-lost-empire-trial-by-fire": {"title": "Atlantis: The Lost Empire - Trial By Fire", "url": "https://archive.org/details/atlantis-trial-by-fire-repack"}, "back-to-the-future-the-game": {"title": "Back to the Future: The Game", "url": "https://archive.org/details/back-to-the-future-the-game_202508"}, "batman-vengeance": {"title": "Batman: Vengeance", "url": "https://archive.org/details/batman-vengeance.-7z"}, "battlefield-1942-the-complete-collection": {"title": "Battlefield 1942: The Complete Collection", "url": "https://archive.org/details/battlefield-1942-repack"}, "battlefield-2142": {"title": "Battlefield 2142", "url": "https://archive.org/details/bf-2142_202509"}, "battlefield-2-complete-collection": {"title": "Battlefield 2: Complete Collection", "url": "https://archive.org/details/battlefield-2_202509"}, "battlefield-vietnam": {"title": "Battlefield Vietnam", "url": "https://archive.org/details/battlefield-vietnam-repack"}, "battlefield-bad-company-2": {"title": "Battlefield: Bad Company 2", "url": "https://archive.org/details/battlefield-bad-company-2_202509"}, "bedlam": {"title": "Bedlam", "url": "https://archive.org/details/bedlam_202509"}, "blair-witch-trilogy": {"title": "Blair Witch Trilogy", "url": "https://archive.org/details/blair-witch-trilogy"}, "blur": {"title": "Blur", "url": "https://archive.org/details/blur.-7z_202506"}, "celebrity-deathmatch": {"title": "Celebrity Deathmatch", "url": "https://archive.org/details/celebrity-deathmatch_202601"}, "clive-barker-s-jericho": {"title": "Clive Barker's Jericho", "url": "https://archive.org/details/clive-barkers-jericho_202509"}, "colin-mcrae-dirt-2": {"title": "Colin McRae: DiRT 2", "url": "https://archive.org/details/di-rt-2.7z"}, "condemned-criminal-origins": {"title": "Condemned: Criminal Origins", "url": "https://archive.org/details/condemned_20251104"}, "contract-j-a-c-k": {"title": "Contract J.A.C.K.", "url": "https://archive.org/details/contract-j.-a.-c.-k."}, "crazy-taxi-3-high-roller": {"title": "Crazy Taxi 3: High Roller", "url": "https://archive.org/details/crazy-taxi-3-repack"}, "cryostasis": {"title": "Cryostasis", "url": "https://archive.org/details/cryostasis_202510"}, "darksiders-ii": {"title": "Darksiders II", "url": "https://archive.org/details/darks2"}, "dead-man-s-hand": {"title": "Dead Man's Hand", "url": "https://archive.org/details/dmh_20250928"}, "dead-to-rights": {"title": "Dead To Rights", "url": "https://archive.org/details/dead-to-rights.-7z"}, "dead-to-rights-2": {"title": "Dead To Rights 2", "url": "https://archive.org/details/dead-to-rights-2.7z"}, "deadpool": {"title": "Deadpool", "url": "https://archive.org/details/deadpool.-7z"}, "die-hard-nakatomi-plaza": {"title": "Die Hard: Nakatomi Plaza", "url": "https://archive.org/details/die-hard-nakatomi-plaza-repack"}, "dirt-3": {"title": "DiRT 3", "url": "https://archive.org/details/dirt-3_202511"}, "dreamkiller": {"title": "Dreamkiller", "url": "https://archive.org/details/dreamkiller_202509"}, "driver-san-francisco": {"title": "Driver: San Francisco", "url": "https://archive.org/details/driver-san-francisco.-7z"}, "enter-the-matrix": {"title": "Enter The Matrix", "url": "https://archive.org/details/enter-the-matrix_202511"}, "evil-dead-regeneration": {"title": "Evil Dead Regeneration", "url": "https://archive.org/details/evil-dead-regeneration_202510"}, "f1-2010": {"title": "F1 2010", "url": "https://archive.org/details/f-1-2010_202512"}, "f1-2011": {"title": "F1 2011", "url": "https://archive.org/details/f-1-2011_202512"}, "f1-2012": {"title": "F1 2012", "url": "https://archive.org/details/f-1-2012_202512"}, "f1-2013": {"title": "F1 2013", "url": "https://archive.org/details/f-1-2013_202512"}, "f1-2020": {"title": "F1 2020", "url": "https://archive.org/details/f-1-2020"}, "f1-race-stars": {"title": "F1 Race Stars", "url": "https://archive.org/details/f-1-race-stars_202512"}, "fable-iii": {"title": "Fable III", "url": "https://archive.org/details/fable_202508"}, "family-guy-back-to-the-multiverse": {"title": "Family Guy: Back to the Multiverse", "url": "https://archive.org/details/Family_Guy_BTTM"}, "fantastic-four": {"title": "Fantastic Four", "url": "https://archive.org/details/fantastic-four_the_game"}, "fuel": {"title": "Fuel", "url": "https://archive.org/details/fuel_20251222"}, "gears-of-war": {"title": "Gears of War", "url": "https://archive.org/details/gow_20251116"}, "gore-ultimate-soldier": {"title": "Gore: Ultimate Soldier​", "url": "https://www.old-games.com/download/9162/gore-ultimate-soldier"}, "grid-2": {"title": "GRID 2", "url": "https://archive.org/details/grid-2_202511"}, "grid-autosports": {"title": "GRID Autosports", "url": "https://archive.org/details/grid-autosports_202601"}, "guardians-of-the-galaxy-the-telltale-series": {"title": "Guardians of the Galaxy: The Telltale Series", "url": "https://archive.org/details/guardians-of-the-galaxy.telltale-series"}, "halo-combat-evolved": {"title": "Halo: Combat Evolved", "url": "https://archive.org/details/halo_20251027"}, "heavy-metal-f-a-k-k-2": {"title": "Heavy Metal: F.A.K.K. 2", "url": "https://archive.org/details/heavy-metal-fakk-2.7z"}, "heretic-ii": {"title": "Heretic II", "url": "https://archive.org/details/heretic-ii_202601"}, "hulk": {"title": "Hulk", "url": "https://archive.org/details/hulk.-7z_202506"}, "iron-man": {"title": "Iron Man", "url": "https://archive.org/details/iron-man-pc-repack"}, "james-bond-007-blood-stone": {"title": "James Bond 007: Blood Stone", "url": "https://archive.org/details/james-bond-007-blood-stone_202511"}, "james-cameron-s-avatar-the-game": {"title": "James Cameron's Avatar: The Game", "url": "https://archive.org/details/james-camerons-avatar-the-game_202512"}, "juiced": {"title": "Juiced", "url": "https://archive.org/details/juiced.-7z_202506"}, "juiced-2-hot-import-nights": {"title": "Juiced 2: Hot Import Nights", "url": "https://archive.org/details/j-2-hin.-7z"}, "kiss-psycho-circus": {"title": "Kiss Psycho Circus", "url": "https://archive.org/details/kiss-psycho-circus-repack_202511"}, "lost-planet-extreme-condition-colonies-edition": {"title": "Lost Planet: Extreme Condition Colonies Edition", "url": "https://archive.org/details/lost-planet-1"}, "lost-planet-2": {"title": "Lost Planet 2", "url": "https://archive.org/details/lost-planet-2_202510"}, "manhunt-2": {"title": "Manhunt 2", "url": "https://archive.org/details/manhunt-2_202510"}, "marvel-ultimate-alliance": {"title": "Marvel Ultimate Alliance", "url": "https://archive.org/details/marvel-ultimate-alliance_202506"}, "marvel-ultimate-alliance-2": {"title": "Marvel Ultimate Alliance 2", "url": "https://archive.org/details/marvel-ultimate-alliance-2_202506"}, "mercenaries-2-world-in-flames": {"title": "Mercenaries 2: World in Flames", "url": "https://archive.org/details/mc-2_20251112"}, "midnight-club-2": {"title": "Midnight Club 2", "url": "https://archive.org/details/midnight-club-2-repack"}, "mortal-kombat-komplete-edition": {"title": "Mortal Kombat: Komplete Edition", "url": "https://archive.org/details/template_202508"}, "need-for-speed-ii-special-edition": {"title": "Need For Speed II: Special Edition", "url": "https://archive.org/details/need-for-speed-ii-special-edition_202512"}, "need-for-speed-iii-hot-pursuit": {"title": "Need For Speed III: Hot Pursuit", "url": "https://archive.org/details/need-for-speed-iii-hot-pursuit.-7z_202512"}, "need-for-speed-carbon": {"title": "Need For Speed: Carbon", "url": "https://archive.org/details/need-for-speed-carbon_202512"}, "need-for-speed-high-stakes": {"title": "Need For Speed: High Stakes", "url": "https://archive.org/details/need-for-speed-iv-high-stakes.-7z"}, "need-for-speed-hot-pursuit-2": {"title": "Need For Speed: Hot Pursuit 2", "url": "https://archive.org/details/need-for-speed-vi-hot-pursuit-2.7z"}, "need-for-speed-most-wanted": {"title": "Need For Speed: Most Wanted", "url": "https://archive.org/details/need-for-speed-most-wanted-hd-version"}, "need-for-speed-porsche-unleashed": {"title": "Need For Speed: Porsche Unleashed", "url": "https://archive.org/details/need-for-speed-v-porsche-unleashed.-7z"}, "need-for-speed-prostreet": {"title": "Need For Speed: ProStreet", "url": "https://archive.org/details/need-for-speed-pro-street_202512"}, "need-for-speed-shift": {"title": "Need For Speed: SHIFT", "url": "https://archive.org/details/need-for-speed-shift_202512"}, "need-for-speed-shift-2-unleashed": {"title": "Need For Speed: SHIFT 2 Unleashed", "url": "https://archive.org/details/need-for-speed-shift-2-unleashed_202512"}, "need-for-speed-the-run": {"title": "Need For Speed: The Run", "url": "https://archive.org/details/need-for-speed-the-run_202512"}, "need-for-speed-undercover": {"title": "Need For Speed: Undercover", "url": "https://archive.org/details/need-for-speed-undercover_20251214"}, "need-for-speed-underground": {"title": "Need For Speed: Underground", "url": "https://archive.org/details/need-for-speed-underground_202512"}, "need-for-speed-underground-2": {"title": "Need For Speed: Underground 2", "url": "https://archive.org/details/need-for-speed-underground-2_202512"}, "no-one-lives-forever-2-a-spy-in-h-a-r-m-s-way": {"title": "No One Lives Forever 2: A Spy in H.A.R.M.'s Way", "url": "https://archive.org/details/no-one-lives-forever-2-a-spy-in-h.a.r.m.s-way_202509"}, "nocturne": {"title": "Nocturne", "url": "https://archive.org/details/nocturne_202510"}, "oni-anniversary-edition": {"title": "Oni: Anniversary Edition", "url": "https://archive.org/details/oni-anniversary-edition.-7z"}, "operation-flashpoint-dragon-rising": {"title": "Operation Flashpoint: Dragon Rising", "url": "https://archive.org/details/of-dragon-rising.-7z"}, "operation-flashpoint-red-river": {"title": "Operation Flashpoint: Red River", "url": "https://archive.org/details/operation-flashpoint-red-river.-7z"}, "outrun-2006-coast-2-coast": {"title": "OutRun 2006 - Coast 2 Coast​", "url": "https://archive.org/details/OutRun2006Coast2CoastSetupWindows10"}, "pac-man-world-2": {"title": "Pac Man World 2", "url": "https://archive.org/details/pac-man-world-2.7z"}, "peter-jackson-s-king-kong-the-official-game-of-the-movie": {"title": "Peter Jackson's King Kong: The Official Game of the Movie", "url": "https://archive.org/details/king_20251110"}, "poker-night-double-pack": {"title": "Poker Night Double Pack", "url": "https://archive.org/details/poker-night_202508"}, "prey": {"title": "Prey", "url": "https://archive.org/details/prey_20250628"}, "project-cars-goty-edition": {"title": "Project CARS: GOTY Edition", "url": "https://archive.org/details/project-cars_202508"}, "project-cars-2": {"title": "Project CARS 2", "url": "https://archive.org/details/project-cars-2_202508"}, "project-cars-3": {"title": "Project CARS 3", "url": "https://archive.org/details/project-cars-3"}, "project-i-g-i-i-m-going-in": {"title": "Project I.G.I.: I'm Going In", "url": "https://archive.org/details/project-i.-g.-i-im-going-in"}, "psi-ops-the-mindgate-conspiracy": {"title": "Psi-Ops: The Mindgate Conspiracy", "url": "https://archive.org/details/psi-ops-the-mindgate-conspiracy.-7z"}, "psychotoxic": {"title": "Psychotoxic", "url": "https://archive.org/details/psychotoxic_202509"}, "pure": {"title": "Pure", "url": "https://archive.org/details/pure.-7z"}, "race-driver-grid": {"title": "Race Driver: GRID", "url": "https://archive.org/details/race-driver-grid.-7z"}, "rambo-the-videogame": {"title": "Rambo: The Videogame", "url": "https://archive.org/details/rambo-the-video-game_202601"}, "resident-evil-operation-racoon-city": {"title": "Resident Evil: Operation Racoon City", "url": "https://archive.org/details/resident-evil_202510"}, "rethawed": {"title": "reTHAWed", "url": "https://archive.org/details/reTHAWed.7z"}, "road-rash": {"title": "Road Rash", "url": "https://archive.org/details/road-rash_202511"}, "saw": {"title": "Saw", "url": "https://archive.org/details/saw_20251012"}, "sanity-aiken-s-artifact": {"title": "Sanity: Aiken's Artifact", "url": "https://archive.org/details/sanity-aikens-artifact-repack"}, "scarface-the-world-is-yours": {"title": "Scarface: The World is Yours", "url": "https://archive.org/details/scarface-the-world-is-yours-repack-v-3"}, "scratches-director-s-cut": {"title": "Scratches Director's Cut", "url": "https://archive.org/details/scratches-directors-cut"}, "sega-dreamcast-collection": {"title": "SEGA Dreamcast Collection", "url": "https://archive.org/details/ni-ghts-into-dreams_202511"}, "sega-rally-revo": {"title": "SEGA Rally Revo", "url": "https://archive.org/details/sega-rally-revo.-7z_202506"}, "shrak": {"title": "SHRAK", "url": "https://archive.org/details/shrak_202511"}, "silent-hill-3": {"title": "Silent Hill 3", "url": "https://archive.org/details/silent-hill-3_202510"}, "sonic-cd-miracle-edition": {"title": "Sonic CD: Miracle Edition", "url": "https://archive.org/details/sonic-cd-miracle-edition.-7z_202508"}, "sonic-r-the-definitive-edition": {"title": "Sonic R: The Definitive Edition", "url": "https://archive.org/details/sonic-r.-7z_202503"}, "south-park": {"title": "South Park", "url": "https://archive.org/details/south-park-pc-repack"}, "spec-ops-the-line": {"title": "Spec Ops: The Line", "url": "https://archive.org/details/spec-ops-the-line.-7z"}, "spider-man-2-the-game": {"title": "Spider-Man 2: The Game", "url": "https://archive.org/details/spider-man-2-pc-repack"}, "splinter-cell-pandora-tomorrow": {"title": "Splinter Cell: Pandora Tomorrow", "url": "https://archive.org/details/scpt.-7z"}, "starlancer": {"title": "Starlancer", "url": "https://archive.org/details/starlancer_202511"}, "street-fighter-x-tekken": {"title": "Street Fighter X Tekken", "url": "https://archive.org/details/street-fighter-x-tekken_202508"}, "syndicate": {"title": "Syndicate", "url": "https://archive.org/details/syndicate_202509"}, "teenage-mutant-ninja-turtles-mutants-in-manhattan": {"title": "Teenage Mutant Ninja Turtles: Mutants in Manhattan", "url": "https://archive.org/details/teenage-mutant-ninja-turtles-mutants-in-manhattan_202508"}, "test-drive-unlimited": {"title": "Test Drive Unlimited", "url": "https://archive.org/details/test-drive-unlimited.-7z_202506"}, "test-drive-unlimited-2": {"title": "Test Drive Unlimited 2", "url": "https://archive.org/details/test-drive-unlimited-2.7z"}, "the-chronicles-of-riddick-assault-on-dark-athena": {"title": "The Chronicles of Riddick: Assault on Dark Athena", "url": "https://archive.org/details/the-chronicles-of-riddick-assault-on-dark-athena.-7z"}, "the-chronicles-of-riddick-escape-from-butcher-bay": {"title": "The Chronicles of Riddick: Escape From Butcher Bay", "url": "https://archive.org/details/the-chronicles-of-riddick-escape-from-butcher-bay-repack-v-2"}, "the-crew": {"title": "The Crew", "url": "https://archive.org/details/tcu_20250916"}, "the-godfather-part-ii": {"title": "The Godfather Part II", "url": "https://archive.org/details/the-godfather-part-ii"}, "the-godfather-the-game": {"title": "The Godfather: The Game", "url": "https://archive.org/details/the-godfather_20250816"}, "the-last-remnant": {"title": "The Last Remnant", "url": "https://archive.org/details/square_enix_2025"}, "the-legend-of-korra": {"title": "The Legend of Korra", "url": "https://archive.org/details/the-legend-of-korra_202508"}, "the-lord-of-the-rings-war-in-the-north": {"title": "The Lord of the Rings: War in the North", "url": "https://archive.org/details/lord-of-the-rings-war-in-the-north_202512"}, "the-matrix-path-of-neo": {"title": "The Matrix: Path of Neo", "url": "https://archive.org/details/path-of-neo"}, "the-need-for-speed-special-edition": {"title": "The Need For Speed: Special Edition", "url": "https://archive.org/details/the-need-for-speed-special-edition.-7z_202512"}, "the-operative-no-one-lives-forever": {"title": "The Operative: No One Lives Forever", "url": "https://archive.org/details/no-one-lives-forever_202509"}, "the-polar-express": {"title": "The Polar Express", "url": "https://archive.org/details/the-polar-express_202512"}, "the-punisher": {"title": "The Punisher", "url": "https://archive.org/details/the-punisher.-7z_202506"}, "the-simpsons-hit-and-run": {"title": "The Simpsons Hit & Run", "url": "https://archive.org/details/the-simpsons-hit-and-run.-7z_202506"}, "the-suffering": {"title": "The Suffering", "url": "https://archive.org/details/the-suffering_202510"}, "the-suffering-ties-that-bind": {"title": "The Suffering: Ties That Bind", "url": "https://archive.org/details/the-suffering-2_202510"}, "the-walking-dead-survival-instinct": {"title": "The Walking Dead: Survival Instinct", "url": "https://archive.org/details/the-walking-dead-survival-instinct_202601"}, "toca-race-driver": {"title": "ToCA Race Driver", "url": "https://archive.org/details/to-ca-race-driver"}, "toca-race-driver-2": {"title": "ToCA Race Driver 2", "url": "https://archive.org/details/to-ca-race-driver-2"}, "toca-race-driver-3": {"title": "ToCA Race Driver 3", "url": "https://archive.org/details/to-ca-race-driver-3_202601"}, "toy-story-2-buzz-lightyear-to-the-rescue": {"title": "Toy Story 2: Buzz Lightyear to the Rescue", "url": "https://archive.org/details/toy-story-2-repack"}, "transformers-devastation": {"title": "Transformers: Devastation", "url": "https://archive.org/details/transformers-devastation_202507"}, "transformers-fall-of-cybertron": {"title": "Transformers: Fall of Cybertron", "url": "https://archive.org/details/fall_of_cybertron"}, "transformers-revenge-of-the-fallen": {"title": "Transformers: Revenge of the Fallen", "url": "https://archive.org/details/transformers-revenge-of-the-fallen.-7z"}, "transformers-the-game": {"title": "Transformers: The Game", "url": "https://archive.org/details/transformers-the-game.-7z"}, "transformers-war-for-cybertron": {"title": "Transformers: War for Cybertron", "url": "https://archive.org/details/transformers-war-for-cybertron.-7z"}, "tron-evolution": {"title": "Tron Evolution", "url": "https://archive.org/details/tron-evolution-repack"}, "true-crime-streets-of-la": {"title": "True Crime: Streets of LA", "url": "https://archive.org/details/true-crime-streets-of-la.-7z_202506"}, "turok": {"title": "Turok", "url": "https://archive.org/details/turok-repack-video-game-2008"}, "ultimate-spider-man": {"title": "Ultimate Spider Man", "url": "https://archive.org/details/ultimate-spider-man.-7z"}, "unreal-tournament-2004-editor-s-choice-edition": {"title": "Unreal Tournament 2004: Editor's Choice Edition", "url": "https://archive.org/details/ut-2004_202509"}, "unreal-tournament-3-black-edition": {"title": "Unreal Tournament 3: Black Edition", "url": "https://archive.org/details/ue-3_20251113"}, "vietcong": {"title": "Vietcong", "url": "https://archive.org/details/v-1_20250920"}, "vietcong-2": {"title": "Vietcong 2", "url": "https://archive.org/details/v-2_20250920"}, "viva-pinata": {"title": "Viva Pinata", "url": "https://archive.org/details/viva-pinata_202512"}, "vivisector-beast-within": {"title": "Vivisector: Beast Within", "url": "https://archive.org/details/vivisector_202509"}, "will-rock": {"title": "Will Rock", "url": "https://archive.org/details/will-rock.-7z"}, "william-shatner-s-tekwar": {"title": "William Shatner's TekWar", "url": "https://archive.org/details/william-shatners-tekwar_202601"}, "wipeout-portable-collection": {"title": "WipEout Portable Collection", "url": "https://archive.org/details/wip-eout-portable-collection.-7z"}, "wolfenstein": {"title": "Wolfenstein", "url": "https://archive.org/details/wolfenstein.-7z"}, "world-racing": {"title": "World racing", "url": "https://archive.org/details/world-racing.-7z"}, "x-men-legends-ii-rise-of-apocalypse": {"title": "X-Men Legends II: Rise of Apocalypse", "url": "https://archive.org/details/x-men-legends-ii_202601"}, "x-men-origins-wolverine-uncaged-edition": {"title": "X-Men Origins: Wolverine - Uncaged Edition", "url": "https://archive.org/details/x-men-origins-wolverine.-7z"}, "you-are-empty": {"title": "You Are EMPTY", "url": "https://archive.org/details/you-are-empty_202510"}, "archive-of-texture-packs-for-psone-playstation-2-psp-ps-vita-gamecube-n64-3ds-wii-and-dreamcast": {"title": "Archive of texture-packs for PSone, PlayStation 2, PSP, PS Vita, Gamecube, N64, 3DS, Wii & Dreamcast", "url": "https://docs.google.com/spreadsheets/d/1sif8FeRGJRbytK8wFRXgF6Hke9V6GUFs/edit?gid=431767549#gid=431767549"}, "animal-crossing-city-folk-hd-texture-pack": {"title": "Animal Crossing City Folk HD Texture Pack", "url": "https://gamebanana.com/mods/470260"}, "baldur-s-gate-3-hd-texture-pack": {"title": "Baldur's Gate 3 HD Texture Pack", "url": "https://www.nexusmods.com/baldursgate3/mods/18252"}, "batman-arkham-asylum-hd-texture-pack": {"title": "Batman: Arkham Asylum HD Texture Pack", "url": "https://www.nexusmods.com/batmanarkhamasylum/mods/177?tab=description"}, "batman-arkham-city-hd-texture-pack": {"title": "Batman: Arkham City HD Texture Pack", "url": "https://www.nexusmods.com/batmanarkhamcity/mods/407?tab=description"}, "batman-arkham-knight-hd-texture-pack": {"title": "Batman: Arkham Knight HD Texture Pack", "url": "https://www.nexusmods.com/batmanarkhamknight/mods/2671"}, "blood-2-upscale-texture-pack": {"title": "Blood 2 Upscale Texture Pack", "url": "https://www.moddb.com/mods/blood-ii-the-chosen-upscale-pack/addons/blood-ii-the-chosen-upscale-pack-v13"}, "dark-souls-2-hd-texture-pack": {"title": "Dark Souls 2 HD Texture Pack", "url": "https://www.nexusmods.com/darksouls2/mods/1160?tab=description"}, "fallout-new-vegas-texture-upscale-project": {"title": "Fallout New Vegas Texture Upscale Project", "url": "https://www.nexusmods.com/newvegas/mods/93775?tab=description"}, "fallout-4-landscape-textures-overhaul": {"title": "Fallout 4 Landscape Textures Overhaul", "url": "https://www.nexusmods.com/fallout4/mods/98692?tab=description"}, "far-cry-3-hd-texture-pack": {"title": "Far Cry 3 HD Texture Pack", "url": "https://www.nexusmods.com/farcry3/mods/291"}, "final-fantasy-7-remake-4k-8k-texture-collection": {"title": "Final Fantasy 7 Remake 4K 8K Texture Collection", "url": "https://www.nexusmods.com/finalfantasy7remake/mods/1977?tab=description"}, "final-fantasy-7-remake-hd-texture-pack": {"title": "Final Fantasy 7 Remake HD Texture Pack", "url": "https://www.nexusmods.com/finalfantasy7remake/mods/764?tab=files"}, "god-of-war-decked-edition": {"title": "God of War - Decked Edition", "url": "https://www.reddit.com/r/SteamDeck/s/9CczeTYUGk"}, "goldeneye-4k-textures": {"title": "Goldeneye 4K Textures", "url": "https://evilgames.eu/texture-packs/ge007-hd.htm#instructions"}, "grand-theft-auto-5-enhanced-edition-4k-texture-pack": {"title": "Grand Theft Auto 5 Enhanced Edition 4K Texture Pack", "url": "https://www.nexusmods.com/gta5enhanced/mods/272"}, "grand-theft-auto-liberty-city-stories-decked-edition": {"title": "Grand Theft Auto Liberty City Stories - Decked Edition", "url": "https://www.reddit.com/r/SteamDeck/s/bNCOrjHbWg"}, "luigis-mansion": {"title": "Luigis Mansion", "url": "https://www.henrikomagnifico.com/luigis-mansion-4k"}, "mario-kart-64": {"title": "Mario Kart 64", "url": "https://evilgames.eu/texture-packs/mario-kart-64-hd.htm"}, "mario-kart-double-dash": {"title": "Mario Kart Double Dash", "url": "https://forums.dolphin-emu.org/Thread-mario-kart-double-dash-re-rendered-hd-texture-pack-v1-2"}, "mass-effect-legendary-edition": {"title": "Mass Effect Legendary Edition", "url": "https://www.nexusmods.com/masseffectlegendaryedition/mods/1825?tab=description"}, "nier-automata-4k-texture-pack": {"title": "NieR Automata 4K Texture Pack", "url": "https://www.nexusmods.com/nierautomata/mods/759?tab=files"}, "palworld-texture-pack": {"title": "Palworld Texture Pack", "url": "https://www.nexusmods.com/palworld/mods/2723?tab=files"}, "paper-mario-64": {"title": "Paper Mario 64", "url": "https://m.youtube.com/watch?v=fO0Hqhk7qxA"}, "pokemon-scarlet-and-violet-4k-texture-pack": {"title": "Pokemon Scarlet & Violet 4K Texture Pack", "url": "https://www.nexusmods.com/pokemonscarletandviolet/mods/52?tab=files"}, "prince-of-persia-decked-edition": {"title": "Prince of Persia Decked Edition", "url": "https://www.reddit.com/r/SteamDeck/s/2XAd4zeIz3"}, "resident-evil-5-texture-pack": {"title": "Resident Evil 5 Texture Pack", "url": "https://www.nexusmods.com/residentevil5goldedition/mods/737?tab=description"}, "resident-evil-revelations-hd-texture-pack": {"title": "Resident Evil: Revelations HD Texture Pack", "url": "https://www.nexusmods.com/residentevilrevelations/mods/90"}, "resident-evil-revelations-2-hd-texture-pack": {"title": "Resident Evil: Revelations 2 HD Texture Pack", "url": "https://www.nexusmods.com/residentevilrevelations/mods/90"}, "secret-agent-clank": {"title": "Secret Agent Clank", "url": "https://www.reddit.com/r/RatchetAndClank/s/12ydQ6unl0"}, "soul-reaver-dreamcast": {"title": "Soul Reaver Dreamcast", "url": "https://www.sr1hdremaster.com/"}, "ssx-3": {"title": "SSX 3", "url": "https://leonelvidals.blogspot.com/2020/03/ssx-3-hd-texture-pack.html?m=1"}, "super-mario-3d-land": {"title": "Super Mario 3D Land", "url": "https://www.henrikomagnifico.com/super-mario-3d-land-hd"}, "super-mario-galaxy-63-hd-texture-pack": {"title": "Super Mario Galaxy 63 HD Texture Pack", "url": "https://github.com/iZePlayzYT/SuperMarioGalaxy63-TexturePack/releases"}, "super-mario-sunshine": {"title": "Super Mario Sunshine", "url": "https://www.henrikomagnifico.com/super-mario-sunshine-4k"}, "the-legend-of-zelda-breath-of-the-wild-4k-texture-pack": {"title": "The Legend of Zelda: Breath of the Wild 4K Texture Pack", "url": "https://www.nexusmods.com/legendofzeldabreathofthewild/mods/61?tab=description"}, "the-legend-of-zelda-tears-of-the-kingdom-4k-texture-pack": {"title": "The Legend of Zelda: Tears of the Kingdom 4K Texture Pack", "url": "https://www.nexusmods.com/legendofzeldatearsofthekingdom/mods/161"}, "the-witcher-3-wild-hunt-immersion-pack": {"title": "The Witcher 3 Wild Hunt Immersion Pack", "url": "https://www.nexusmods.com/witcher3/mods/11259"}, "tomb-raider-legend-hd-texture-pack": {"title": "Tomb Raider: Legend HD Texture Pack", "url": "https://www.nexusmods.com/tombraiderlegend/mods/97?tab=description"}, "ultimate-spiderman-ps2-decked-edition": {"title": "Ultimate Spiderman (PS2) Decked Edition", "url": "https://www.reddit.com/r/SteamDeck/s/zX3CemaACh"}, "vagrant-story-on-duckstation": {"title": "Vagrant Story on Duckstation", "url": "https://www.youtube.com/watch?v=ouLFjGqcgRQ&t=43s&ab_channel=IceBullet"}, "zelda-majora-s-mask-3d": {"title": "Zelda Majora's Mask 3D", "url": "https://www.henrikomagnifico.com/zelda-majoras-mask-3d-4k"}, "majora-s-mask-n64": {"title": "Majora's Mask N64", "url": "https://github.com/Nerrel/MMHD/releases/tag/v1.1b"}, "zelda-ocarina-of-time-3d": {"title": "Zelda Ocarina of Time 3D", "url": "https://www.henrikomagnifico.com/zelda-ocarina-of-time-3d-4k"}, "dusklight-the-legend-of-zelda-twilight-princess-pc-port-texture-pack-2": {"title": "Dusklight - The Legend of Zelda Twilight Princess PC Port Texture Pack 2", "url": "https://www.henrikomagnifico.com/zelda-twilight-princess-4k"}, "zelda-a-link-between-worlds": {"title": "Zelda A Link Between Worlds", "url": "https://www.henrikomagnifico.com/zelda-a-link-between-worlds-4k"}, "zelda-skyward-sword": {"title": "Zelda Skyward Sword", "url": "https://www.henrikomagnifico.com/zelda-skyward-sword-4k"}, "hidden-palace-archive-of-playable-unreleased-games-prototypes": {"title": "HIDDEN PALACE ARCHIVE OF PLAYABLE UNRELEASED GAMES PROTOTYPES", "url": "https://hiddenpalace.org/Category:Unreleased_game_prototypes"}, "akira-genesis-megadrive": {"title": "Akira - Genesis Megadrive", "url": "https://hiddenpalace.org/Akira_%28Prototype%29"}, "aladdin-ntsc-nes-prototype": {"title": "Aladdin (NTSC) NES Prototype", "url": "https://www.gamesthatwerent.com/2025/07/aladdin-nes-prototype/"}, "animaniacs-hollywood-hypnotics-gameboy-advance": {"title": "Animaniacs: Hollywood Hypnotics - Gameboy Advance", "url": "https://hiddenpalace.org/News/Animaniacs_-_Hollywood_Hypnotics"}, "apocalypse-2-snes": {"title": "Apocalypse 2 - SNES", "url": "https://www.gamesthatwerent.com/2013/02/apocalypse-super-nintendo/"}, "batman-revenge-of-the-joker-snes": {"title": "Batman: Revenge of the Joker - SNES", "url": "https://hiddenpalace.org/Batman:_Revenge_of_the_Joker_%28Prototype%29"}, "big-brother": {"title": "Big Brother", "url": "https://archive.org/details/BigBrother19990401"}, "bio-force-ape-nes": {"title": "Bio Force Ape - NES", "url": "https://tcrf.net/Bio_Force_Ape"}, "beyond-zero-tolerance-genesis-mega-drive": {"title": "Beyond Zero Tolerance - Genesis Mega Drive", "url": "https://wowroms.com/en/roms/sega-genesis-megadrive/beyond-zero-tolerance-usa-proto/25311.html"}, "blue-angelo-angels-from-the-shrine-gameboy-advance": {"title": "Blue Angelo: Angels from the Shrine - Gameboy Advance", "url": "https://hiddenpalace.org/Blue_Angelo:_Angels_from_the_Shrine_%28Late_prototype%29"}, "california-raisins-grape-escape-nes": {"title": "California Raisins: Grape Escape - NES", "url": "https://wowroms.com/en/roms/nintendo-entertainment-system/california-raisins-the-grape-escape-usa-proto/21805.html"}, "castlevania-resurrection-dreamcast": {"title": "Castlevania: Resurrection - Dreamcast", "url": "https://hiddenpalace.org/Castlevania:_Resurrection_%28Nov_5,_1999_prototype%29"}, "dancing-eyes-playstation-3": {"title": "Dancing Eyes - Playstation 3", "url": "https://hiddenpalace.org/Dancing_Eyes_(Mar_10,_2011_Prototype)"}, "daredevil-the-man-without-fear-playstation-2": {"title": "Daredevil: The Man Without Fear - Playstation 2", "url": "https://hiddenpalace.org/Daredevil:_The_Man_Without_Fear_%28Mar_22,_2004_prototype%29"}, "dark-castle-msx2": {"title": "Dark Castle - MSX2", "url": "https://archive.org/details/dark-castle-msx"}, "dark-empires-genesis-mega-drive": {"title": "Dark Empires - Genesis Mega Drive", "url": "https://hiddenpalace.org/Dark_Empires_%28prototype%29"}, "dracula-hunter-arcade": {"title": "Dracula Hunter - Arcade", "url": "https://arlagames.itch.io/dracula-hunter"}, "dinosaur-planet-n64": {"title": "Dinosaur Planet - N64", "url": "https://romsfun.com/roms/nintendo-64/dinosaur-planet-dinomod-enhanced.html"}, "duke-nukem-d-day-ps2": {"title": "Duke Nukem D-Day - PS2", "url": "https://archive.org/details/duke-dday-ps2-2001-06-04"}, "eddie-s-puzzletime-gameboy": {"title": "Eddie's puzzleTime - Gameboy", "url": "https://www.gamesthatwerent.com/2019/11/eddies-puzzle-time-nintendo-game-boy-released/"}, "frog-dude-megadrive": {"title": "Frog Dude - Megadrive", "url": "https://www.gamesthatwerent.com/2014/02/frog-dude-megadrive-and-alfred-chicken-amiga-prototypes-released/"}, "frogger-2-swampy-s-revenge-dreamcast": {"title": "Frogger 2: Swampy's Revenge - Dreamcast", "url": "https://hiddenpalace.org/Frogger_2:_Swampy%27s_Revenge_%28October_10,_2000_prototype%29"}, "it-came-from-the-desert-megadrive": {"title": "It Came From The Desert - Megadrive", "url": "https://www.gamesthatwerent.com/2024/10/it-came-from-the-desert/"}, "jet-set-radio-dreamcast-prototype": {"title": "Jet Set Radio Dreamcast Prototype", "url": "https://www.sega-dreamcast-info-games-preservation.com/en/jet-set-radio-dreamcast-early-us-prototype-iso"}, "mario-kart-xxl-gameboy-advance": {"title": "Mario Kart XXL - Gameboy Advance", "url": "https://hiddenpalace.org/Mario_Kart_XXL_%28Apr_17,_2004_Tech_Demo%29"}, "mechanoids-2-snes": {"title": "mechanoids 2 - SNES", "url": "https://www.gamesthatwerent.com/2025/04/mechanoids-2-the-final-conflict/"}, "mia-hamm-soccer-64-prototypes": {"title": "Mia Hamm Soccer 64 Prototypes", "url": "https://www.gamesthatwerent.com/2025/08/mia-hamm-soccer-64-prototypes/"}, "nigel-mansell-world-championship-c64": {"title": "Nigel Mansell World Championship - C64", "url": "https://www.gamesthatwerent.com/gtw64/nigel-mansell-world-championship/#tabs-downloads"}, "paprium-genesis-mega-drive": {"title": "Paprium - Genesis Mega Drive", "url": "https://www.emu-land.net/en/consoles/genesis/roms/paprium"}, "populous-nes": {"title": "Populous - NES", "url": "https://www.gamesthatwerent.com/2025/03/populous/"}, "porky-pig-s-haunted-holiday-snes": {"title": "Porky Pig's Haunted Holiday - SNES", "url": "https://www.gamesthatwerent.com/2025/07/porky-pigs-haunted-holiday-snes-prototypes/"}, "putty-squad-megadrive": {"title": "Putty Squad - Megadrive", "url": "https://www.gamesthatwerent.com/2020/12/putty-squad/"}, "rayman-snes": {"title": "Rayman - SNES", "url": "https://hiddenpalace.org/Rayman_%28SNES_prototype%29"}, "resident-evil-1-5-psone": {"title": "Resident Evil 1.5 - PSone", "url": "https://archive.org/details/ResidentEvil1.5"}, "resident-evil-gameboy-colour": {"title": "Resident Evil - Gameboy Colour", "url": "https://www.gamesthatwerent.com/2025/12/resident-evil/"}, "robocop-psone": {"title": "Robocop - PSone", "url": "https://www.gamesthatwerent.com/2012/01/exclusive-tech-demos-for-robocop-and-gen-13-on-the-ps-one-available-to-download/"}, "saints-row-undercover-psp": {"title": "Saints Row Undercover - PSP", "url": "https://romsfun.com/download/saints-row-undercover-168984/2"}, "sega-channel-144-preserved-roms-megadrive-genesis": {"title": "Sega Channel - 144 Preserved ROMs - Megadrive Genesis", "url": "https://www.gamingalexandria.com/wp/2025/12/sega-channel-prototype-sega-genesis-roms/"}, "sensible-soccer-nes": {"title": "Sensible Soccer - NES", "url": "https://www.gamesthatwerent.com/2025/03/sensible-soccer/"}, "sonic-crackers-genesis-megadrive": {"title": "Sonic Crackers - Genesis Megadrive", "url": "https://hiddenpalace.org/Sonic_Crackers_%28Apr_1,_1994_prototype%29"}, "team-sas-xbox": {"title": "Team SAS - Xbox", "url": "https://www.gamesthatwerent.com/2024/12/team-sas/"}, "the-addams-family-pugsley-s-scavanger-hunt-nes-prototypes": {"title": "The Addams Family: Pugsley's Scavanger Hunt (NES) Prototypes", "url": "https://www.gamesthatwerent.com/2025/05/the-addams-family-pugsleys-scavenger-hunt-nes-prototypes/"}, "the-elder-scrolls-travels-oblivion-psp": {"title": "The Elder Scrolls Travels: Oblivion - PSP", "url": "https://hiddenpalace.org/The_Elder_Scrolls_Travels:_Oblivion_%28Apr_27,_2007_prototype%29"}, "thrill-kill-psone": {"title": "Thrill Kill - PSone", "url": "https://romsfun.com/download/thrill-kill-25889"}, "time-diver-eon-man-nes": {"title": "Time Diver Eon Man - NES", "url": "https://nesninja.com/game/nes/time-diver-eon-man?rom=Time%20Diver%20Eon%20Man%20%28U%29%20%28Prototype%29%20%5Ba1%5D.nes"}, "tripitaka-windows": {"title": "Tripitaka - Windows", "url": "https://archive.org/details/tripitaka_win_mac"}, "viewpoint-2064-n64": {"title": "Viewpoint 2064 - N64", "url": "https://hiddenpalace.org/Viewpoint_2064_%28Apr_13,_2000_prototype%29"}, "virtua-hamster-sega-32x": {"title": "Virtua Hamster - Sega 32X", "url": "https://www.gamesthatwerent.com/2020/10/virtua-hamster/"}, "warcraft-adventures-lord-of-the-clans-pc-scummvm": {"title": "Warcraft adventures: Lord of the Clans - PC ScummVM", "url": "https://collectionchamber.blogspot.com/2016/09/warcraft-adventures-lord-of-clans.html"}, "yoshi-gameboy-advance": {"title": "Yoshi - Gameboy Advance", "url": "https://hiddenpalace.org/Yoshi_Sample_%28GBA_Tech_Demo%29"}, "7th-dragon-nintendo-ds": {"title": "7th Dragon - Nintendo DS", "url": "https://www.romhacking.net/translations/2176/"}, "airs-adventure-sega-saturn": {"title": "Airs adventure- Sega Saturn", "url": "https://github.com/hitomi2500/airs-patch"}, "american-oudan-ultra-quiz-super-nintendo": {"title": "American Oudan Ultra quiz - Super Nintendo", "url": "https://krokodyl.github.io/post/2025/05/america-oudan/"}, "ao-no-6-go-saigetsufutai-hito-time-and-tide-dreamcast": {"title": "Ao no 6-go Saigetsufutai Hito: Time and Tide - Dreamcast", "url": "https://www.romhacking.net/translations/5773/"}, "baroque-sega-saturn": {"title": "Baroque - Sega Saturn", "url": "https://www.romhacking.net/translations/7001/"}, "battle-master-kykyoku-no-senshitachi-snes": {"title": "Battle Master: Kykyoku no Senshitachi - SNES", "url": "https://romhack.ing/database/content/entry/TAD0OP-qTqGOKtW0lsVeVg"}, "battle-stadium-d-o-n-playstation-2": {"title": "Battle Stadium D.O.N. - PlayStation 2", "url": "https://cdromance.org/ps2-iso/battle-stadium-d-o-n-jpn/"}, "belzerion-3do": {"title": "Belzerion - 3DO", "url": "https://github.com/Eight-Mansions/Belzerion/releases/tag/Release"}, "breath-of-fire-ii-super-nintendo": {"title": "Breath of Fire II - Super Nintendo", "url": "https://www.romhacking.net/translations/1384/"}, "captain-rainbow-wii": {"title": "Captain Rainbow - Wii", "url": "https://www.romhacking.net/translations/5603/"}, "captain-tsubasa-ps2": {"title": "Captain Tsubasa - PS2", "url": "https://cdromance.org/ps2-iso/captain-tsubasa-jpn/"}, "captain-tsubasa-vol-ii-super-striker-nintendo-entertainment-system": {"title": "Captain Tsubasa Vol. II: Super Striker - Nintendo Entertainment System", "url": "https://www.romhacking.net/translations/1182/"}, "castlevania-rondo-of-blood-turbografx-cd": {"title": "Castlevania: Rondo of Blood - Turbografx-CD", "url": "https://www.romhacking.net/translations/846/"}, "cave-story-dokutsu-monogatari-pc": {"title": "Cave Story Dokutsu Monogatari - PC", "url": "https://cdromance.org/windows/cave-story-dokutsu-monogatari-english-patched/"}, "chaos-field-dreamcast": {"title": "Chaos Field - Dreamcast", "url": "https://www.romhacking.net/translations/6412/"}, "chibi-robo-wii": {"title": "Chibi-Robo! - Wii", "url": "https://www.romhacking.net/translations/6722/"}, "chobits-gameboy-advance": {"title": "Chobits - Gameboy Advance", "url": "https://www.romhacking.net/translations/7425/"}, "clock-tower-the-first-fear-playstation": {"title": "Clock Tower: The First Fear - PlayStation", "url": "https://www.romhacking.net/translations/2337/"}, "cookie-s-bustle-pc": {"title": "Cookie's Bustle - PC", "url": "https://romhack.ing/database/content/entry/M8qjG9lMSY2TafBciQMHaA/cookie-s-bustle-english-translation"}, "cotton-2-sega-saturn": {"title": "Cotton 2 - Sega Saturn", "url": "https://www.romhacking.net/translations/5999/"}, "cowboy-bebop-tsuioku-no-serenade-playstation-2": {"title": "Cowboy Bebop: Tsuioku no Serenade - Playstation 2", "url": "https://github.com/SONICMAN69/Bebop-PS2-English"}, "cyber-troopers-virtual-on-playstation-3": {"title": "Cyber Troopers Virtual-On - PlayStation 3", "url": "https://github.com/FeiYenKn/Virtual-On-PS3-English-Translation"}, "dark-half-super-nintendo": {"title": "Dark Half - Super Nintendo", "url": "https://www.romhacking.net/translations/2344/"}, "dark-seed-sega-saturn": {"title": "Dark Seed - Sega Saturn", "url": "https://www.segasaturnshiro.com/2025/04/24/english-patch-for-dark-seed-is-available-now/"}, "dead-of-the-brain-pc98": {"title": "Dead of the Brain - PC98", "url": "https://romhack.ing/database/game/entry/PdNs5JQBNs8FWu0CmDSo/dead-of-the-brain"}, "dead-of-the-brain-2-pc98": {"title": "Dead of the Brain 2 - PC98", "url": "https://romhack.ing/database/content/entry/8mqdySG4SSmYlPYefdKZpQ"}, "densetsu-no-ogre-battle-the-march-of-the-black-queen-sega-saturn": {"title": "Densetsu no Ogre Battle: The March of the Black Queen - Sega Saturn", "url": "https://www.romhacking.net/translations/6514/"}, "digimon-adventure-psp": {"title": "Digimon adventure- PSP", "url": "https://cdromance.org/psp/digi-adventure-english-patched/"}, "digimon-world-re-digitize-playstation-portable": {"title": "Digimon World Re:Digitize - PlayStation Portable", "url": "https://cdromance.org/psp/digimon-world-redigitize-full-english-patched/"}, "digital-devil-monogatari-megami-tensei-nes": {"title": "Digital Devil Monogatari: Megami Tensei - NES", "url": "https://www.romhacking.net/translations/2287/"}, "dragon-ball-z-super-saiya-densetsu-super-nintendo": {"title": "Dragon Ball Z: Super Saiya Densetsu - Super Nintendo", "url": "https://www.romhacking.net/translations/326/"}, "dragon-ball-z-the-legend-sega-saturn": {"title": "Dragon Ball Z: The Legend - Sega Saturn", "url": "https://segaxtreme.net/threads/dragon-ball-z-the-legend-english-translation.37310/"}, "dragon-force-ii-kamisarishi-daichi-ni-sega-saturn": {"title": "Dragon Force II: Kamisarishi Daichi ni - Sega Saturn", "url": "https://www.romhacking.net/translations/1622/"}, "dragon-quest-iii-soshite-densetsu-e-super-nintendo": {"title": "Dragon Quest III: Soshite Densetsu e... - Super Nintendo", "url": "https://www.romhacking.net/translations/1323/"}, "dragon-quest-vi-maboroshi-no-daichi-super-nintendo": {"title": "Dragon Quest VI: Maboroshi no Daichi - Super Nintendo", "url": "https://www.romhacking.net/translations/344/"}, "dragon-quest-v-tenkuu-no-hanayome-playstation-2": {"title": "Dragon Quest V: Tenkuu no Hanayome - PlayStation 2", "url": "https://www.romhacking.net/translations/1482/"}, "dragon-quest-monsters-caravan-heart": {"title": "Dragon Quest Monsters: Caravan Heart", "url": "https://www.romhacking.net/translations/1252/"}, "dungeons-and-dragons-tower-of-doom-sega-saturn": {"title": "Dungeons & Dragons: Tower of Doom - Sega Saturn", "url": "https://segaxtreme.net/resources/dungeons-dragons-tower-of-doom-english-patch.426/"}, "earth-seeker-wii": {"title": "Earth Seeker - Wii", "url": "https://www.romhacking.net/translations/5571/"}, "emerald-dragon-pc-engine-cd": {"title": "Emerald Dragon - PC Engine CD", "url": "https://stargood.org/trans/emdr.php"}, "farland-symphony-pc": {"title": "Farland Symphony - PC", "url": "https://cdromance.org/windows/farland-symphony-english-patched/"}, "final-fantasy-type-0-psp": {"title": "Final Fantasy Type-0 - PSP", "url": "https://cdromance.org/psp/final-fantasy-type-0-english-patched/"}, "final-fantasy-x-2-last-mission-ps2": {"title": "Final Fantasy X-2: Last Mission - PS2", "url": "https://romhack.ing/database/content/entry/js0cv7y6TyyPoaPNwQ2qWw"}, "fire-emblem-fuuin-no-tsurugi-game-boy-advance": {"title": "Fire Emblem: Fuuin no Tsurugi - Game Boy Advance", "url": "https://cdromance.org/gba-roms/fire-emblem-fuuin-no-tsurugi/"}, "fire-emblem-gaiden-nintendo-entertainment-system": {"title": "Fire Emblem Gaiden - Nintendo Entertainment System", "url": "https://www.romhacking.net/translations/1445/"}, "fire-emblem-monshou-no-nazo-super-nintendo": {"title": "Fire Emblem: Monshou no Nazo - Super Nintendo", "url": "https://www.romhacking.net/translations/961/"}, "fire-emblem-path-of-radiance-nintendo-gamecube": {"title": "Fire Emblem: Path of Radiance - Nintendo GameCube", "url": "https://www.romhacking.net/translations/5621/"}, "fire-emblem-shadow-dragon-and-the-blade-of-light-nintendo-entertainment-system": {"title": "Fire Emblem: Shadow Dragon and the Blade of Light - Nintendo Entertainment System", "url": "https://www.romhacking.net/translations/1593/"}, "fire-emblem-shin-monshou-no-nazo-hikari-to-kage-no-eiyuu-nintendo-ds": {"title": "Fire Emblem: Shin Monshou no Nazo - Hikari to Kage no Eiyuu - Nintendo DS", "url": "https://www.romhacking.net/translations/1764/"}, "fire-emblem-thracia-776-super-nintendo": {"title": "Fire Emblem: Thracia 776 - Super Nintendo", "url": "https://www.romhacking.net/translations/4653/"}, "front-mission-2-playstation": {"title": "Front Mission 2 - PlayStation", "url": "https://www.romhacking.net/translations/1750/"}, "front-mission-5-scars-of-the-war-playstation-2": {"title": "Front Mission 5: Scars of the War - PlayStation 2", "url": "https://www.romhacking.net/translations/1297/"}, "fushigi-no-dungeon-fuurai-no-shiren-3-portable-playstation-portabl": {"title": "Fushigi no Dungeon: Fuurai no Shiren 3 Portable - PlayStation Portabl", "url": "https://www.romhacking.net/translations/2015/"}, "god-eater-2-psp": {"title": "God Eater 2 - PSP", "url": "https://cdromance.org/psp/god-eater-2-jpn/"}, "grand-knights-history-psp": {"title": "Grand Knights History - PSP", "url": "https://cdromance.org/psp/grand-knights-history-english-patched/"}, "gyakuten-kenji-2-nintendo-ds": {"title": "Gyakuten Kenji 2 - Nintendo DS", "url": "https://www.romhacking.net/translations/2260/"}, "hybrid-front-sega-genesis-mega-drive": {"title": "Hybrid Front - Sega Genesis Mega Drive", "url": "https://www.romhacking.net/translations/7416/"}, "idolmaster-sp-perfect-sun-wondering-star-and-missing-moon-psp": {"title": "Idolmaster SP: Perfect Sun, Wondering Star & Missing Moon - PSP", "url": "https://sites.google.com/view/imas-sp-en-tl/home"}, "ikenie-no-yoru-wii": {"title": "Ikenie no Yoru - Wii", "url": "https://www.romhacking.net/translations/5575/"}, "illusion-city-msx": {"title": "Illusion City - MSX", "url": "https://msxtranslations.com/ic.php"}, "illusion-of-gaia-super-nintendo": {"title": "Illusion of Gaia - Super Nintendo", "url": "https://www.romhacking.net/forum/index.php?topic=39629.0&fbclid=IwY2xjawHkbdJleHRuA2FlbQIxMAABHRHnrkmq2x9QiVciGQYl_2_Ew9eyDf02rNwB1NZ7UNnNP4F9Jgyn8afZiQ_aem_Do3UbOAI_1z5wwUGm5XRSg"}, "j-b-harold-blue-chicago-blues-sega-saturn": {"title": "J.B. Harold: Blue Chicago Blues - Sega Saturn", "url": "https://www.romhacking.net/translations/7056/"}, "jesus-kyoufu-no-bio-monster-nintendo-entertainment-system": {"title": "Jesus: Kyoufu no Bio Monster - Nintendo Entertainment System", "url": "https://www.romhacking.net/translations/1043/"}, "jingle-cats-playstation": {"title": "Jingle Cats - Playstation", "url": "https://www.timeextension.com/news/2025/06/you-can-now-play-the-japan-exclusive-ps1-cult-classic-jingle-cats-in-english"}, "jojo-no-kimyou-na-bouken-ougon-no-kaze-playstation-2": {"title": "JoJo no Kimyou na Bouken: Ougon no Kaze - PlayStation 2", "url": "https://www.romhacking.net/translations/3956/"}, "jump-ultimate-stars-nintendo-ds": {"title": "Jump Ultimate Stars - Nintendo DS", "url": "https://www.romhacking.net/translations/1636/"}, "kaeru-no-tame-ni-kane-wa-naru-game-boy": {"title": "Kaeru no Tame ni Kane wa Naru - Game Boy", "url": "https://www.romhacking.net/translations/1623/"}, "kidou-senshi-gundam-gundam-vs-gundam-next-plus-psp": {"title": "Kidou Senshi Gundam: Gundam vs. Gundam NEXT PLUS - PSP", "url": "https://cdromance.org/psp/kidou-senshi-gundam-gundam-vs-gundam-next-plus-english-patched/"}, "king-s-field-playstation": {"title": "King's Field - PlayStation", "url": "https://www.romhacking.net/translations/1067/"}, "kingdom-hearts-ii-final-mix-playstation-2": {"title": "Kingdom Hearts II: Final Mix - Playstation 2", "url": "https://cdromance.org/ps2-iso/kingdom-hearts-ii-final-mix-2/"}, "konjiki-no-gash-bell-go-go-mamono-fight-nintendo-gamecube": {"title": "Konjiki no Gash Bell!! Go! Go! Mamono Fight!! - Nintendo GameCube", "url": "https://www.romhacking.net/translations/6640/"}, "kurohyou-ryu-ga-gotoku-shinshou-psp": {"title": "Kurohyou: Ryu ga Gotoku Shinshou - PSP", "url": "https://cdromance.org/psp/kurohyou-ryu-ga-gotoku-shinshou/"}, "la-mulana-pc": {"title": "La Mulana - PC", "url": "https://www.romhacking.net/translations/1079/"}, "la-pucelle-ragnarok-playstation-portable": {"title": "La Pucelle: Ragnarok - PlayStation Portable", "url": "https://www.romhacking.net/translations/2130/"}, "langrisser-iv-playstation": {"title": "Langrisser IV - PlayStation", "url": "https://www.romhacking.net/translations/1711/"}, "linkle-liver-story-sega-saturn": {"title": "Linkle Liver Story - Sega Saturn", "url": "https://www.romhacking.net/translations/4143/"}, "live-a-live-super-nintendo": {"title": "Live a Live - Super Nintendo", "url": "https://www.romhacking.net/translations/381/"}, "l-o-l-lack-of-love-dreamcast": {"title": "L.O.L Lack of Love - Dreamcast", "url": "https://www.romhacking.net/translations/5387/"}, "lsd-dream-emulator-playstation": {"title": "LSD - Dream Emulator - PlayStation", "url": "https://www.romhacking.net/translations/5523/"}, "magical-date-operation-heart-throb-playstation": {"title": "Magical Date: Operation Heart-Throb - PlayStation", "url": "https://www.romhacking.net/translations/7464/"}, "magna-carta-the-phantom-of-avalanche-pc": {"title": "Magna Carta: The Phantom of Avalanche - PC", "url": "https://cdromance.org/windows/magna-carta-the-phantom-of-avalanche-english-patched-windows/"}, "maple-story-ds-nintendo-ds": {"title": "Maple Story DS - Nintendo DS", "url": "https://gbatemp.net/threads/maplestory-ds-2025-full-english-translation-complete.677209/"}, "marie-to-elie-no-atelier-salburg-no-renkinjutsushi-1-and-2-playstation-2": {"title": "Marie to Elie no Atelier: Salburg no Renkinjutsushi 1 & 2 - PlayStation 2", "url": "https://www.romhacking.net/translations/3494/"}, "metal-gear-msx2-msx": {"title": "Metal Gear (MSX2) - MSX", "url": "https://www.romhacking.net/translations/842/"}, "mizzurna-falls-playstation": {"title": "Mizzurna Falls - PlayStation", "url": "https://www.romhacking.net/translations/6027/"}, "monster-hunter-portable-3rd-playstation-portable": {"title": "Monster Hunter Portable 3rd - PlayStation Portable", "url": "https://www.romhacking.net/translations/2043/"}, "mother-1-2-game-boy-advance": {"title": "Mother 1+2 - Game Boy Advance", "url": "https://www.romhacking.net/translations/1609/"}, "mother-3-game-boy-advance": {"title": "Mother 3 - Game Boy Advance", "url": "https://www.romhacking.net/translations/1333/"}, "mushishi-amefuru-sato-nintendo-ds": {"title": "Mushishi: Amefuru Sato - Nintendo DS", "url": "https://romhack.ing/database/content/entry/KLsCYW2oSgeSD9DiIEGgvw"}, "namco-x-capcom-playstation-2": {"title": "Namco x Capcom - PlayStation 2", "url": "https://www.romhacking.net/translations/1270/"}, "nanatsu-no-hikan-senritsu-no-bishou-dreamcast": {"title": "Nanatsu no Hikan: Senritsu no Bishou - Dreamcast", "url": "https://www.romhacking.net/translations/5809/"}, "nayuta-no-kiseki-psp": {"title": "Nayuta no Kiseki - PSP", "url": "https://www.romhacking.net/translations/3560/"}, "one-piece-romance-dawn-psp": {"title": "One Piece: Romance Dawn - PSP", "url": "https://cdromance.org/psp/romance-dawn-english-patched/"}, "ougon-no-kizuna-wii": {"title": "Ougon no Kizuna - Wii", "url": "https://www.romhacking.net/translations/7282/"}, "patlabor-mega-drive-genesis": {"title": "Patlabor - Mega Drive Genesis", "url": "https://romhack.ing/database/content/entry/XN_BmXoyS2qWekII82Q87Q/patlabor-english-translation"}, "persona-2-innocent-sin-playstation": {"title": "Persona 2: Innocent Sin - PlayStation", "url": "https://www.romhacking.net/translations/1249/"}, "pocket-monsters-green-version-game-boy": {"title": "Pocket Monsters: Green Version - Game Boy", "url": "https://www.romhacking.net/translations/1629/"}, "pokemon-trading-card-game-2-game-boy": {"title": "Pokemon Trading Card Game 2 - Game Boy", "url": "https://www.romhacking.net/translations/1736/"}, "pokemon-fushigi-no-dungeon-ikuzo-arashi-no-boukendan-wii": {"title": "Pokemon Fushigi no Dungeon: Ikuzo! Arashi no Boukendan - Wii", "url": "https://www.romhacking.net/translations/5518/"}, "policenauts-playstation": {"title": "Policenauts - PlayStation", "url": "https://www.romhacking.net/translations/1422/"}, "popolocrois-monogatari-2-playstation": {"title": "Popolocrois Monogatari 2 - Playstation", "url": "https://romhackplaza.org/translations/popolocrois-monogatari-ii-english-translation-playstation/"}, "poporogue-playstation": {"title": "PopoRogue - PlayStation", "url": "https://github.com/Lost-Okina/popolocrois-translation-tool/releases/tag/v1.0-poporogue"}, "princess-crown-sega-saturn": {"title": "Princess Crown - Sega Saturn", "url": "https://github.com/eadmaster/pcrown/releases"}, "progenitor-pc98": {"title": "Progenitor - PC98", "url": "https://romhack.ing/database/content/entry/wE3wXKn-RHW8lcesg7lG_g/progenitor-english-translation"}, "puyo-puyo-n-dreamcast": {"title": "Puyo Puyo~n - Dreamcast", "url": "https://www.romhacking.net/translations/6680/"}, "radirgy-generic-nintendo-gamecube": {"title": "Radirgy GeneriC - Nintendo GameCube", "url": "https://www.romhacking.net/translations/7408/"}, "rainbow-cotton-dreamcast": {"title": "Rainbow Cotton - Dreamcast", "url": "https://www.romhacking.net/translations/6198/"}, "ranma-1-2-akanekodan-teki-hihou-super-nintendo": {"title": "Ranma 1 2: Akanekodan Teki Hihou - Super Nintendo", "url": "https://www.romhacking.net/translations/404/"}, "rent-a-hero-no-1-dreamcast": {"title": "Rent-A-Hero No.1 - Dreamcast", "url": "https://www.romhacking.net/translations/6925/"}, "rockman-and-forte-super-nintendo": {"title": "Rockman & Forte - Super Nintendo", "url": "https://www.romhacking.net/translations/621/"}, "rogue-hearts-dungeon-playstation-2": {"title": "Rogue Hearts Dungeon - PlayStation 2", "url": "https://www.romhacking.net/translations/5601/"}, "rhythm-tengoku-game-boy-advance": {"title": "Rhythm Tengoku - Game Boy Advance", "url": "https://www.romhacking.net/translations/1762/"}, "sakura-wars-2-sega-saturn": {"title": "Sakura Wars 2 - Sega Saturn", "url": "https://segaxtreme.net/resources/sakura-wars-2-english-translation.412/"}, "screaming-mad-george-s-paranoiascape-playstation": {"title": "Screaming Mad George's Paranoiascape - PlayStation", "url": "https://aeongenesis.net/projects/paranoiascape"}, "seiken-densetsu-3-super-nintendo": {"title": "Seiken Densetsu 3 - Super Nintendo", "url": "https://www.romhacking.net/translations/440/"}, "shadow-tower-abyss-playstation-2": {"title": "Shadow Tower: Abyss - PlayStation 2", "url": "https://www.romhacking.net/translations/2042/"}, "shin-megami-tensei-playstation": {"title": "Shin Megami Tensei - PlayStation", "url": "https://www.romhacking.net/translations/6610/"}, "shin-megami-tensei-super-nintendo": {"title": "Shin Megami Tensei - Super Nintendo", "url": "https://www.romhacking.net/translations/571/"}, "shin-megami-tensei-ii-super-nintendo": {"title": "Shin Megami Tensei II - Super Nintendo", "url": "https://www.romhacking.net/translations/687/"}, "shin-megami-tensei-if-super-nintendo": {"title": "Shin Megami Tensei if... - Super Nintendo", "url": "https://www.romhacking.net/translations/3951/"}, "shin-megami-tensei-nocturne-playstation-2": {"title": "Shin Megami Tensei: Nocturne - PlayStation 2", "url": "https://www.romhacking.net/translations/3283/"}, "shining-force-iii-scenario-1-sega-saturn": {"title": "Shining Force III: Scenario 1 - Sega Saturn", "url": "https://www.romhacking.net/translations/1569/"}, "shinrei-jusatsushi-taroumaru-sega-saturn": {"title": "Shinrei Jusatsushi Taroumaru - Sega Saturn", "url": "https://github.com/ExxistanceDC/Shinrei-Jusatsushi-Taromaru-English-Patch"}, "silhouette-mirage-sega-saturn": {"title": "Silhouette Mirage - Sega Saturn", "url": "https://www.romhacking.net/translations/7060/"}, "soul-eater-battle-resonance-playstation-2": {"title": "Soul Eater: Battle Resonance - PlayStation 2", "url": "https://www.romhacking.net/translations/6521/"}, "soul-eater-monotone-princess-wii": {"title": "Soul Eater: Monotone Princess - Wii", "url": "https://www.romhacking.net/translations/6340/"}, "splatter-world-nes": {"title": "Splatter World - NES", "url": "https://romhack.ing/database/content/entry/uz8qKfAyQo2GkTX_DHwt6g"}, "super-famicom-wars-super-nintendo": {"title": "Super Famicom Wars - Super Nintendo", "url": "https://www.romhacking.net/translations/3354/"}, "super-robot-taisen-a-portable-playstation-portable": {"title": "Super Robot Taisen A Portable - PlayStation Portable", "url": "https://www.romhacking.net/translations/3658/"}, "super-robot-taisen-gc-nintendo-gamecube": {"title": "Super Robot Taisen GC - Nintendo GameCube", "url": "https://www.romhacking.net/translations/6105/"}, "super-robot-taisen-j-game-boy-advance": {"title": "Super Robot Taisen J - Game Boy Advance", "url": "https://www.romhacking.net/translations/1577/"}, "super-robot-taisen-og-original-generations-playstation-2": {"title": "Super Robot Taisen OG: Original Generations - PlayStation 2", "url": "https://www.romhacking.net/translations/5817/"}, "sword-art-online-infinity-moment-psp": {"title": "Sword Art Online: Infinity Moment - PSP", "url": "https://cdromance.org/psp/sao-infinity-moment-english-patched/"}, "sword-of-the-berserk-guts-rage-dreamcast": {"title": "Sword of the Berserk: Guts' Rage - Dreamcast", "url": "https://www.romhacking.net/translations/6560/"}, "tactics-ogre-let-us-cling-together-super-nintendo": {"title": "Tactics Ogre: Let Us Cling Together - Super Nintendo", "url": "https://www.romhacking.net/translations/1501/"}, "tales-of-phantasia-playstation": {"title": "Tales of Phantasia - PlayStation", "url": "https://www.romhacking.net/translations/1214/"}, "tales-of-rebirth-playstation-2": {"title": "Tales of Rebirth - PlayStation 2", "url": "https://romhack.ing/database/content/entry/LjjufdifRv66ITK_3u_VWA"}, "tear-ring-saga-yutona-eiyuu-senki-playstation": {"title": "Tear Ring Saga: Yutona Eiyuu Senki - PlayStation", "url": "https://www.romhacking.net/translations/2812/"}, "tengai-makyou-zero-super-nintendo": {"title": "Tengai Makyou Zero - Super Nintendo", "url": "https://www.romhacking.net/translations/3243/"}, "the-human-weapon-dead-fox-nes": {"title": "The Human Weapon: Dead Fox - NES", "url": "https://www.romhacking.net/translations/7432"}, "the-hybrid-front-genesis-mega-drive": {"title": "The Hybrid Front - Genesis Mega Drive", "url": "https://nebulous.group/index.php/projects/translations/hybrid-front/#cmtoc_anchor_id_4"}, "the-legend-of-sword-and-fairy-pc": {"title": "The Legend of Sword & Fairy - PC", "url": "https://cdromance.org/windows/the-legend-of-sword-and-fairy-english-patched-v3-3-windows-pc/"}, "time-travelers-3ds": {"title": "Time Travelers - 3DS", "url": "https://fantranslators.info/2025/02/01/time-travelers-english-translation-patch/"}, "tobal-2-playstation": {"title": "Tobal 2 - PlayStation", "url": "https://www.romhacking.net/translations/7435/"}, "tomodachi-collection-nintendo-ds": {"title": "Tomodachi Collection - Nintendo DS", "url": "https://cdromance.org/nds-roms/tomodachi-collection-english-patched/"}, "toradora-portable-playstation-portable": {"title": "Toradora Portable! - PlayStation Portable", "url": "https://www.romhacking.net/translations/2228/"}, "toukiden-kiwami-psp": {"title": "Toukiden Kiwami - PSP", "url": "https://cdromance.org/psp/toukiden-kiwami-english-patched-v2/"}, "tsukihime-pc": {"title": "Tsukihime - PC", "url": "https://cdromance.org/windows/tsukihime-english-patched/"}, "vampire-panic-playstation-2": {"title": "Vampire Panic - PlayStation 2", "url": "https://www.romhacking.net/translations/5623/"}, "variable-geo-pc98": {"title": "Variable Geo - PC98", "url": "https://romhack.ing/database/content/entry/xeLw9oQGSluBM5YGZVJnZg"}, "waku-waku-puyo-puyo-dungeon-sega-saturn": {"title": "Waku Waku Puyo Puyo Dungeon - Sega Saturn", "url": "https://www.timeextension.com/news/2025/05/a-japan-exclusive-puyo-puyo-dungeon-crawler-for-saturn-has-just-received-a-fan-translation"}, "welcome-house-2-keaton-and-his-uncle-playstation": {"title": "Welcome House 2 - Keaton and his Uncle - PlayStation", "url": "https://romhackplaza.org/translations/welcome-house-2-keaton-and-his-uncle-english-translation-playstation/"}, "wizardry-vi-bane-of-the-cosmic-forge-sega-saturn": {"title": "Wizardry VI: Bane of the Cosmic Forge - Sega Saturn", "url": "https://segaxtreme.net/resources/wizardry-vi-vii-complete-english-translation-patch.457/"}, "wonder-trek-playstation": {"title": "Wonder Trek - Playstation", "url": "https://romhackplaza.org/translations/wonder-trek-english-translation-playstation/"}, "yaku-playstation": {"title": "Yaku - Playstation", "url": "https://romhackplaza.org/translations/misfortune-a-story-of-suspicious-friendships-english-translation-playstation/"}, "yu-gi-oh-5d-s-tag-force-6-psp": {"title": "Yu-Gi-Oh! 5D's Tag Force 6 - PSP", "url": "https://cdromance.org/psp/yu-gi-oh-5ds-tag-force-6-english-patched-2/"}, "yu-gi-oh-arc-v-tag-force-special-psp": {"title": "Yu-Gi-Oh! ARC-V Tag Force Special - PSP", "url": "https://cdromance.org/psp/yu-gi-oh-arc-v-tag-force-special-jpn-2/"}, "zangeki-no-reginleiv-wii": {"title": "Zangeki no Reginleiv - Wii", "url": "https://www.romhacking.net/translations/6025/"}, "zanma-chouougi-valhollian-sega-saturn": {"title": "Zanma Chouougi Valhollian - Sega Saturn", "url": "https://www.romhacking.net/translations/5700/"}, "zero-tsukihami-no-kamen-wii": {"title": "Zero: Tsukihami no Kamen - Wii", "url": "https://www.romhacking.net/translations/2044/"}, "zoids-vs-iii-nintendo-gamecube": {"title": "Zoids VS III - Nintendo GameCube", "url": "https://www.romhacking.net/translations/6799/"}, "link-to-darkuni-mega-list-of-steam-deck-video-tutorials": {"title": "LINK TO darkuni MEGA LIST OF STEAM DECK VIDEO TUTORIALS", "url": "https://www.reddit.com/r/steamdeckhq/s/7Xc1vsIx1O"}, "alternatives-to-popular-games-that-don-t-work-on-linux-steamos-and-steam-deck": {"title": "Alternatives to popular games that don't work on Linux SteamOS and Steam Deck", "url": "https://www.gamingonlinux.com/guides/view/alternatives-to-popular-games-that-dont-work-on-linux-steam-deck-and-steamos/"}, "a-hacker-s-essential-toolkit": {"title": "A Hacker's Essential Toolkit", "url": "https://romhackplaza.org/tutorials/a-hackers-essential-toolkit/"}, "an-idiots-guide-to-setting-up-minecraft-on-steam-deck-steamos-with-controller-support": {"title": "An idiots guide to setting up Minecraft on Steam Deck  SteamOS with controller support", "url": "https://www.gamingonlinux.com/guides/view/an-idiots-guide-to-setting-up-minecraft-on-steam-deck-steamos-with-controller-support/"}, "an-introduction-to-understanding-hacking-8-bit-graphics-a-tutorial": {"title": "An Introduction to Understanding Hacking 8 Bit Graphics A Tutorial", "url": "https://romhackplaza.org/tutorials/an-introduction-to-understanding-hacking-8-bit-graphics/"}, "arcade-roms-with-actual-names": {"title": "Arcade ROMs with actual names", "url": "https://mdk.cab/"}, "beginner-s-snes-hacking-guide": {"title": "Beginner's SNES Hacking Guide", "url": "https://romhackplaza.org/tutorials/absolute-beginners-snes-hacking-guide/"}, "bloodborne-on-pc-a-guide": {"title": "BloodBorne on PC - A Guide", "url": "https://www.reddit.com/r/shadps4/comments/1lee438/full_guide_how_to_play_bloodborne_on_pc_for_n00bs/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, "definitive-guide-to-rom-hacking-for-complete-beginners": {"title": "Definitive Guide to rom-hacking for Complete Beginners", "url": "https://romhackplaza.org/tutorials/the-definitive-guide-to-rom-hacking-for-complete-beginners/"}, "emudeck-beginners-guide": {"title": "Emudeck beginners guide", "url": "https://www.youtube.com/watch?v=M1JwSQMINnU&ab_channel=MonroeWorld"}, "emudeck-help-site": {"title": "Emudeck Help Site", "url": "https://manual.emudeck.com/"}, "emulation-guide-1-by-sahbito": {"title": "Emulation guide (1) by Sahbito", "url": "https://www.reddit.com/r/SteamDeck/s/385ijbinDk"}, "emulation-guide-2-by-sahbito": {"title": "Emulation guide (2) by Sahbito", "url": "https://www.reddit.com/r/SteamDeck/s/H0Wmni7DJ9"}, "gba-and-ds-rom-hacksing-guide": {"title": "GBA and DS rom-hacksing Guide", "url": "https://romhackplaza.org/tutorials/gba-and-ds-rom-hacking-guide/"}, "hacking-games-in-hex-sega-genesis-edition": {"title": "Hacking Games in Hex (Sega Genesis Edition)", "url": "https://romhackplaza.org/tutorials/hacking-games-in-hex-sega-genesis-edition/"}, "how-to-dump-roms-all-systems": {"title": "How to Dump ROMs - All Systems", "url": "https://dumping.guide/start"}, "how-to-patch-a-rom": {"title": "How to patch a ROM", "url": "https://youtu.be/H6P7N4po1hM?si=V-_3Iyn9YvEOa0RG"}, "how-to-get-battlefield-3-and-battlefield-4-online-working-on-linux-steamos-steam-deck": {"title": "How to get Battlefield 3 and Battlefield 4 online working on Linux, SteamOS, Steam Deck", "url": "https://www.gamingonlinux.com/guides/view/how-to-get-battlefield-3-and-battlefield-4-online-working-on-linux-steamos-steam-deck/"}, "how-to-install-hd-textures-for-duckstation": {"title": "How to install HD Textures for DuckStation", "url": "https://www.youtube.com/watch?v=ICc0mWPJdUM&ab_channel=WarpedPolygon"}, "how-to-install-hd-textures-for-pcsx2": {"title": "How to install HD Textures for PCSX2", "url": "https://www.youtube.com/watch?v=kGf5t5U5Ays&ab_channel=GeniusBug"}, "how-to-install-hd-textures-for-ppsspp": {"title": "How to install HD Textures for PPSSPP", "url": "https://www.youtube.com/watch?v=YvSXzC2c3pg&ab_channel=GeniusBug"}, "how-to-install-hollow-knight-silksong-modson-linux-steamos-and-steam-deck": {"title": "How to install Hollow Knight: Silksong modson Linux, SteamOS and Steam Deck", "url": "https://www.gamingonlinux.com/guides/view/how-to-install-hollow-knight-silksong-mods-on-linux-steamos-and-steam-deck/"}, "how-to-play-games-from-gog-and-epic-games-on-linux-steamos-and-steam-deck": {"title": "How to play games from GOG and Epic Games on Linux, SteamOS and Steam Deck", "url": "https://www.gamingonlinux.com/guides/view/how-to-play-games-from-gog-and-epic-games-on-linux-steamos-and-steam-deck/"}, "how-to-setup-openmw-for-modern-morrowind-on-linux-steamos-and-steam-deck": {"title": "How to setup OpenMW for modern Morrowind on Linux SteamOS and Steam Deck", "url": "https://www.gamingonlinux.com/guides/view/how-to-setup-openmw-for-modern-morrowind-on-linux-steamos-and-steam-deck/"}, "minecraft-on-steam-deck": {"title": "Minecraft on Steam Deck", "url": "https://youtu.be/WRwJ8c4bTpA?si=NsC7lUIZ2JPLGWGQ"}, "physx-fix-for-linux-steam-deck": {"title": "PhysX fix for Linux Steam Deck", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=2780134576"}, "rom-hacking-101": {"title": "Rom Hacking 101", "url": "https://romhackplaza.org/tutorials/romhacking-101/"}, "rom-hacking-102-font-and-sprites": {"title": "Rom Hacking 102 Font and Sprites", "url": "https://romhackplaza.org/tutorials/romhacking102-fontsprites/"}, "rom-hacking-103-script-insertion": {"title": "Rom Hacking 103 Script Insertion", "url": "https://romhackplaza.org/tutorials/romhacking-103-script-insertion/"}, "rom-hacking-104-compression-scheme": {"title": "Rom Hacking 104 Compression Scheme", "url": "https://romhackplaza.org/tutorials/romhacking-104-compression-scheme-re/"}, "rom-hacking-psp-basics": {"title": "Rom Hacking PSP Basics", "url": "https://romhackplaza.org/tutorials/romhacking-psp_basics/"}, "solution-to-slow-download-speeds-on-steam-deck-1": {"title": "Solution to slow download speeds on Steam Deck (1)", "url": "https://www.reddit.com/r/SteamDeck/comments/16lnsg6/psa_solution_to_slow_steam_downloads_on_deck/?share_id=YSfT6PmFF1o5ap6fl0FPS&utm_content=1&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1"}, "solution-to-slow-download-speeds-on-steam-deck-2": {"title": "Solution to slow download speeds on Steam Deck (2)", "url": "https://www.reddit.com/r/SteamDeck/comments/11yjs1s/comment/jm1irbr/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, "the-playstation-translation-doc": {"title": "The Playstation Translation Doc", "url": "https://romhackplaza.org/tutorials/the-playstation-translation-doc/"}, "waydroid-on-steamos-android-on-steam-deck": {"title": "Waydroid on SteamOS - Android on Steam Deck", "url": "https://decky.net/en-eu/blogs/news/android-auf-dem-steam-deck"}, "banjo-kazooie-recompilation": {"title": "Banjo Kazooie Recompilation", "url": "https://github.com/BanjoRecomp/BanjoRecomp/releases/tag/v1.0.0"}, "ghostship-mario-64-pc-port": {"title": "Ghostship - Mario 64 PC Port", "url": "https://github.com/HarbourMasters/Ghostship"}, "super-monkey-ball-web-browser-game": {"title": "Super Monkey Ball - Web Browser Game", "url": "https://monkeyball-online.pages.dev/"}, "star-wars-battlefront-ii-private-server-and-mod-launcher": {"title": "Star Wars Battlefront II Private Server and Mod Launcher", "url": "https://github.com/ArmchairDevelopers/Kyber"}, "the-witcher-3-witcher-online": {"title": "The Witcher 3 - Witcher Online", "url": "https://www.nexusmods.com/witcher3/mods/11590?tab=description"}, "fallout-new-vegas-talk-of-the-town-relationships-marriage-and-more": {"title": "Fallout New Vegas - Talk of the Town - Relationships, Marriage and more", "url": "https://www.nexusmods.com/newvegas/mods/95615"}, "black-mesa-military": {"title": "Black Mesa - Military", "url": "https://www.moddb.com/mods/black-mesa-military/downloads/black-mesa-military-2026-version-full"}, "fallout-3-fallout-legends": {"title": "Fallout 3 - Fallout Legends", "url": "https://www.nexusmods.com/fallout3/mods/27207?tab=description"}, "starfield-lakin-ik": {"title": "Starfield - Lakin-Ik", "url": "https://www.nexusmods.com/starfield/mods/15877?tab=description"}, "assassin-s-creed-victory-project": {"title": "Assassin's Creed Victory Project", "url": "https://www.moddb.com/mods/assassins-creed-victory-project-version-10/downloads/assassins-creed-victory-project-version-10"}, "virtua-racing-recompilation": {"title": "Virtua Racing Recompilation", "url": "https://github.com/matiaszanolli/sega-vr-disasm"}, "mega-man-zero-3-decompilation": {"title": "Mega Man Zero 3 Decompilation", "url": "https://github.com/mmzret/rmz3"}, "new-super-mario-bros-u-decompilation": {"title": "New Super Mario Bros U Decompilation", "url": "https://github.com/nsmbu/decomp"}, "mega-man-64-recompilation": {"title": "Mega Man 64 Recompilation", "url": "https://github.com/MegaMan64Recomp/MegaMan64Recompiled/releases/tag/v0.1.0-alpha"}, "mobhold": {"title": "Mobhold", "url": "https://agentratelimit.github.io/Mobhold/"}, "beep-8": {"title": "Beep-8", "url": "https://beep8.org/"}, "sonic-r-r-and-r": {"title": "Sonic R - R & R", "url": "https://segaxtreme.net/resources/sonic-r-the-r-r-mod.479/"}, "psydoom": {"title": "PsyDoom", "url": "https://github.com/BodbDearg/PsyDoom/releases/tag/preview-builds%2F1.2.0-preview1"}, "bitcraft-mmorpg-open-source-server-code": {"title": "BitCraft MMORPG Open Source Server Code", "url": "https://github.com/clockworklabs/BitCraftPublic"}, "shizuku-pc98": {"title": "Shizuku - PC98", "url": "https://romhack.ing/database/content/entry/yBy69HXSTe2eXhS1y4DyiA/shizuku-english-translation"}, "bubble-bobble-lost-cave-c64": {"title": "Bubble Bobble Lost Cave C64", "url": "https://daves-retro-forge.itch.io/bubble-bobble-lost-cave-c64"}, "elder-scrolls-iii-morrowind-rebirth": {"title": "Elder Scrolls III - Morrowind Rebirth", "url": "https://www.moddb.com/mods/morrowind-rebirth/downloads"}, "luanti": {"title": "Luanti", "url": "https://www.luanti.org/en/"}, "surge-engine": {"title": "Surge Engine", "url": "https://alemart.itch.io/opensurge"}, "substance-wars-64": {"title": "Substance Wars 64", "url": "https://romhacking.com/hack/substance-wars-64"}, "fallout-new-vegas-enhanced-animations-3rd-person-movement": {"title": "Fallout New Vegas - Enhanced Animations - 3rd Person Movement", "url": "https://www.nexusmods.com/newvegas/mods/95967?tab=description"}, "mega-man-world-dr-wily-s-revenge-dx": {"title": "Mega Man World: Dr. Wily's Revenge DX", "url": "https://www.romhacking.net/hacks/7492/"}, "super-mario-land-dx": {"title": "Super Mario Land DX", "url": "https://www.romhacking.net/hacks/4477/"}, "super-mario-land-2-dx": {"title": "Super Mario Land 2 DX", "url": "https://www.romhacking.net/hacks/3784/"}, "wario-land-super-mario-land-3-dx": {"title": "Wario Land: Super Mario Land 3 DX", "url": "https://www.romhacking.net/hacks/6683/"}, "metroid-ii-ejrtq-colorization": {"title": "Metroid II - EJRTQ Colorization", "url": "https://www.romhacking.net/hacks/4388/"}, "final-fantasy-adventure-dx": {"title": "Final Fantasy Adventure DX", "url": "https://www.romhacking.net/hacks/8673/"}, "donkey-kong-land-dx": {"title": "Donkey Kong Land DX", "url": "https://www.romhacking.net/hacks/6076/"}, "donkey-kong-land-2-dx": {"title": "Donkey Kong Land 2 DX", "url": "https://www.romhacking.net/hacks/6866/"}, "donkey-kong-land-3-dx": {"title": "Donkey Kong Land 3 DX", "url": "https://www.romhacking.net/translations/1757/"}, "pokemon-red-dx": {"title": "Pokemon Red DX", "url": "https://www.romhacking.net/hacks/1385/"}, "revenge-of-the-gator-gold-dx": {"title": "Revenge Of The Gator Gold DX", "url": "https://www.romhacking.net/hacks/7480/"}, "spanky-s-quest-dx": {"title": "Spanky's Quest DX", "url": "https://www.romhacking.net/hacks/8297/"}, "balloon-kid-dx": {"title": "Balloon Kid DX", "url": "https://www.romhacking.net/translations/2573/"}, "alleyway-dx": {"title": "Alleyway DX", "url": "https://www.romhacking.net/hacks/6510/"}, "snoopy-s-magic-show-dx": {"title": "Snoopy's Magic Show DX", "url": "https://www.romhacking.net/hacks/6657/"}, "bomb-jack-dx": {"title": "Bomb Jack DX", "url": "https://www.romhacking.net/hacks/6781/"}, "amazing-penguin-dx": {"title": "Amazing Penguin DX", "url": "https://www.romhacking.net/hacks/6797/"}, "dr-mario-dx": {"title": "Dr. Mario DX", "url": "https://www.romhacking.net/hacks/5281/"}, "galaga-and-galaxian-dx": {"title": "Galaga & Galaxian DX", "url": "https://www.romhacking.net/hacks/6541/"}, "zelda-s-adventure-remastered": {"title": "Zelda's Adventure Remastered", "url": "https://jappawakka.itch.io/zeldas-adventure-remastered"}, "beavis-and-butt-head-do-hollywood-playstation": {"title": "Beavis and Butt-Head Do Hollywood - Playstation", "url": "https://hiddenpalace.org/Beavis_and_Butt-Head_Do_Hollywood_(Nov_10,_1998_prototype)"}, "persona-3-fes-decompilation": {"title": "Persona 3 FES Decompilation", "url": "https://github.com/snaku/Persona3-FES-Decompilation"}, "pokemon-heartgold-soulsilver-decompilation": {"title": "Pokemon HeartGold SoulSilver Decompilation", "url": "https://github.com/pret/pokeheartgold"}, "the-last-of-us-demake-browser-game": {"title": "The Last of Us Demake Browser Game", "url": "https://mourilo.itch.io/the-last-of-us-demastered?ref=retrododo.com"}, "ys-v-lost-kefin-kingdom-of-sand-playstation-2": {"title": "Ys V: Lost Kefin - Kingdom of Sand - Playstation 2", "url": "https://github.com/Kaisaan/lostkefin"}, "star-quest-1-in-the-27th-century": {"title": "Star Quest 1 in the 27th Century", "url": "https://virtual-adventures.itch.io/star-quest-1-in-the-27th-century"}, "2048": {"title": "2048", "url": "https://play2048.co/"}, "cod-community-launcher-plutonium": {"title": "CoD Community Launcher - Plutonium", "url": "https://plutonium.pw/"}, "cod-community-launcher-horizonmw": {"title": "CoD Community Launcher - HorizonMW", "url": "https://horizonmw.org/"}, "animal-crossing-deluxe": {"title": "Animal Crossing Deluxe", "url": "https://www.belltreeforums.com/threads/animal-crossing-deluxe-mod.638259/"}, "team-fortress-2-classified": {"title": "Team Fortress 2 Classified", "url": "https://tf2classified.com/"}, "mamono-hunter-mai": {"title": "Mamono Hunter Mai", "url": "https://archive.org/details/mamono-hunter-mai"}, "harry-potter-and-the-order-of-the-phoenix": {"title": "Harry Potter and the Order of the Phoenix", "url": "https://archive.org/details/harry-potter-and-the-order-of-the-phoenix-ibm-pc-usa"}, "isocity": {"title": "IsoCity", "url": "https://iso-city.com/"}, "isocoaster": {"title": "IsoCoaster", "url": "https://iso-coaster.com/"}, "shattered-pixel-dungeon": {"title": "Shattered Pixel Dungeon", "url": "https://shattered-pixel.itch.io/shattered-pixel-dungeon"}, "unvanquished": {"title": "Unvanquished", "url": "https://unvanquished.net/"}, "warsow": {"title": "Warsow", "url": "https://warsow.net/"}, "ghosts-n-goblins-2": {"title": "Ghosts n' Goblins 2", "url": "https://indieastaroth.itch.io/ghosts-and-goblins-2"}, "tales-of-phantasia-x-psp": {"title": "Tales of Phantasia X - PSP", "url": "https://github.com/lifebottle/Tales-of-Phantasia-X/releases/tag/v1.0"}, "banjo-kazooie-recompilation-mods": {"title": "Banjo Kazooie Recompilation Mods", "url": "https://thunderstore.io/c/banjo-recompiled/"}, "prince-of-persia-the-sands-of-time-remastered": {"title": "Prince Of Persia The Sands of Time Remastered", "url": "https://www.nexusmods.com/princeofpersiathesandsoftime/mods/14?tab=posts"}, "osu-lazer": {"title": "Osu! Lazer", "url": "https://osu.ppy.sh/home/download"}, "red-eclipse": {"title": "Red Eclipse", "url": "https://www.redeclipse.net/"}, "the-mana-world": {"title": "The Mana World", "url": "https://www.themanaworld.org/"}, "tales-of-maj-eyal": {"title": "Tales of Maj'Eyal", "url": "https://te4.org/"}, "openspades": {"title": "OpenSpades", "url": "https://openspades.yvt.jp/"}, "supertux": {"title": "SuperTux", "url": "https://www.supertux.org/"}, "openclonk": {"title": "OpenClonk", "url": "https://www.openclonk.org/"}, "simutrans": {"title": "SimuTrans", "url": "https://www.simutrans.com/en/"}, "open-imperium-galactica": {"title": "Open Imperium Galactica", "url": "https://github.com/akarnokd/open-ig"}, "openarena": {"title": "OpenArena", "url": "http://www.openarena.ws/smfnews.php"}, "freedroidrpg": {"title": "FreedroidRPG", "url": "https://www.freedroid.org/"}, "stunt-rally": {"title": "Stunt Rally", "url": "https://cryham.org/stuntrally/"}, "spring-1944": {"title": "Spring: 1944", "url": "https://spring1944.net/"}, "megaglest": {"title": "MegaGlest", "url": "https://megaglest.org/"}, "bzflag": {"title": "BZFlag", "url": "https://www.bzflag.org/"}, "freegish": {"title": "FreeGish", "url": "https://github.com/freegish/freegish"}, "angband": {"title": "Angband", "url": "https://rephial.org/"}, "planeshift": {"title": "PlaneShift", "url": "https://www.planeshift.it/"}, "rigs-of-rods": {"title": "Rigs of Rods", "url": "https://www.rigsofrods.org/"}, "enemy-territory-legacy": {"title": "Enemy Territory: Legacy", "url": "https://www.etlegacy.com/"}, "pingus": {"title": "Pingus", "url": "https://pingus.seul.org/"}, "tuxemon": {"title": "Tuxemon", "url": "https://tuxemon.org/"}, "triplea": {"title": "TripleA", "url": "https://triplea-game.org/"}, "alien-arena": {"title": "Alien Arena", "url": "https://www.alienarena.org/"}, "magarena": {"title": "Magarena", "url": "https://github.com/magarena/magarena"}, "star-ruler-2": {"title": "Star Ruler 2", "url": "https://github.com/BlindMindStudios/StarRuler2-Source"}, "ryzom": {"title": "Ryzom", "url": "https://ryzom.com/"}, "red-runner": {"title": "Red Runner", "url": "https://bayat.itch.io/red-runner"}, "opensa": {"title": "OpenSA", "url": "https://dzierzan.itch.io/opensa"}, "elona": {"title": "Elona+", "url": "https://github.com/Ruin0x11/ElonaPlusCustom-GX"}, "remnants-of-the-precursors": {"title": "Remnants of the Precursors", "url": "https://rayfowler.itch.io/remnants-of-the-precursors"}, "tremulous": {"title": "Tremulous", "url": "https://tremulous.net/"}, "terasology": {"title": "Terasology", "url": "https://terasology.org/"}, "dead-ascend": {"title": "Dead Ascend", "url": "https://blackgrain.itch.io/dead-ascend"}, "limit-theory-redux": {"title": "Limit Theory Redux", "url": "https://github.com/Limit-Theory-Redux/ltheory"}, "neverball": {"title": "Neverball", "url": "https://neverball.org/screenshots"}, "mk48-io": {"title": "Mk48.io", "url": "https://mk48.io/"}, "friking-shark": {"title": "Friking Shark", "url": "https://repo.openpandora.org/?page=detail&app=friking-shark-ptitseb"}, "the-lord-of-the-rings-conquest-dlc-modded-online-support": {"title": "The Lord of the Rings Conquest - DLC Modded - Online Support", "url": "https://gofile.io/d/oI3bEg"}, "the-lord-of-the-rings-conquest-mordorwide-online-servers": {"title": "The Lord of the Rings Conquest - MordorWide Online Servers", "url": "https://mordorwi.de/"}, "shadows-of-the-past-formerly-the-lord-of-the-rings-conquest-reimagined": {"title": "Shadows of the Past - Formerly The Lord of the Rings Conquest Reimagined", "url": "https://www.shadowsofthepast.org/"}, "dead-rising-prototype": {"title": "Dead Rising Prototype", "url": "https://deadrising2mods.proboards.com/thread/3637"}, "all-japan-women-s-pro-wrestling-queen-of-queens-pcfx": {"title": "All Japan Women's Pro Wrestling Queen of Queens - PCFX", "url": "https://romhack.ing/database/content/entry/-JIdj-dSReyb69bQ1d0aCw/all-japan-women-s-pro-wrestling-queen-of-queens-english"}, "fallout-4-heather-companion-mod": {"title": "Fallout 4 - Heather Companion Mod", "url": "https://www.nexusmods.com/fallout4/mods/23273"}, "crw-metal-jacket-pc98": {"title": "CRW: Metal Jacket - PC98", "url": "https://cdromance.org/pc-98/crw-metal-jacket-english-patched/"}, "tuned-heart-pc98": {"title": "Tuned Heart - PC98", "url": "https://cdromance.org/pc-98/tuned-heart-english-patched/"}, "pokemon-inritum": {"title": "Pokemon Inritum", "url": "https://www.pokecommunity.com/threads/pok%C3%A9mon-inritum.532504/?ref=retrododo.com"}, "delivery-and-beyond": {"title": "Delivery & Beyond", "url": "https://store.steampowered.com/app/3376480/Delivery__Beyond/"}, "lode-runner-nintendo-ds": {"title": "Lode Runner - Nintendo DS", "url": "https://cdromance.org/nds-roms/lode-runner-japan/"}, "rockman-and-forte-snes": {"title": "Rockman & Forte - SNES", "url": "https://cdromance.org/snes-rom/rockman-forte-player-switching-multiple-equipment-hack/"}, "dragon-ball-kai-ultimate-butouden-nintendo-ds": {"title": "Dragon Ball Kai: Ultimate Butouden - Nintendo DS", "url": "https://cdromance.org/nds-roms/dragon-ball-kai-ultimate-butouden-jpn-english-patched/"}, "chobits-chiidake-no-hito-ps2": {"title": "Chobits: Chiidake no Hito - PS2", "url": "https://github.com/sam8457/Chobits-Translation-Project"}, "junk-runner-64": {"title": "Junk Runner 64", "url": "https://github.com/lambertjamesd/n64brew2025"}, "brogue-community-edition": {"title": "Brogue: Community Edition", "url": "https://github.com/tmewett/BrogueCE"}, "ivan": {"title": "IVAN", "url": "https://github.com/Attnam/ivan"}, "shamogu": {"title": "Shamogu", "url": "https://codeberg.org/anaseto/shamogu"}, "harmonist-dayoriah-clan-infiltration": {"title": "Harmonist: Dayoriah Clan Infiltration", "url": "https://codeberg.org/anaseto/harmonist"}, "oathbreaker": {"title": "Oathbreaker", "url": "https://github.com/kiedtl/roguelike"}, "shadow-of-the-wyrm": {"title": "Shadow of the Wyrm", "url": "https://www.shadowofthewyrm.org/"}, "sil-q": {"title": "Sil-Q", "url": "https://github.com/sil-quirk/sil-q"}, "hyperroque": {"title": "Hyperroque", "url": "https://github.com/zenorogue/hyperrogue/"}, "barotrauma": {"title": "Barotrauma", "url": "https://barotraumagame.com/"}, "mindustry": {"title": "Mindustry", "url": "https://mindustrygame.github.io/"}, "ultrastar-deluxw": {"title": "UltraStar Deluxw", "url": "https://usdx.eu/"}, "stepmania": {"title": "StepMania", "url": "https://www.stepmania.com/"}, "space-station-silicon-valley-recompilation": {"title": "Space Station Silicon Valley Recompilation", "url": "https://github.com/Cellenseres/SSSV_Recomp"}, "emudevz": {"title": "EmuDevz", "url": "https://afska.itch.io/emudevz"}, "station-heroes-for-hire": {"title": "Station - Heroes for Hire", "url": "https://ashgb.itch.io/station-heroes-for-hire"}, "openblok": {"title": "OpenBlok", "url": "https://github.com/mmatyas/openblok"}, "pysol-fan-club-edition": {"title": "PySol Fan Club Edition", "url": "https://pysolfc.sourceforge.io/"}, "augustus": {"title": "Augustus", "url": "https://github.com/Keriew/augustus"}, "oni-remaster-mod": {"title": "ONI Remaster Mod", "url": "https://www.reddit.com/r/oni/comments/1qvy35h/oni_remaster_mod_link/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, "red-dead-redemption-2-texture-pack": {"title": "Red Dead Redemption 2 Texture Pack", "url": "https://www.nexusmods.com/reddeadredemption2/mods/8021?tab=description"}, "resident-evil-hd-remaster-4k-texture-pack": {"title": "Resident Evil HD Remaster 4K Texture Pack", "url": "https://www.nexusmods.com/residentevilbiohazardhdremaster/mods/169?tab=description"}, "supertux-3d": {"title": "SuperTux 3D", "url": "https://edsmithy.itch.io/supertux-3d"}, "open-realm-of-stars": {"title": "Open Realm of Stars", "url": "https://reemax.itch.io/open-realm-of-stars"}, "ghostship-mario-64-pc-port-hd-texture-pack": {"title": "Ghostship - Mario 64 PC Port - HD Texture Pack", "url": "https://evilgames.eu/texture-packs/sm64-reloaded.htm"}, "the-witcher-3-dawn-over-kovir": {"title": "The Witcher 3 - Dawn Over Kovir", "url": "https://www.nexusmods.com/witcher3/mods/11831?tab=description"}, "minima": {"title": "Minima", "url": "https://feneric.itch.io/minima"}, "anteform": {"title": "Anteform", "url": "https://feneric.itch.io/anteform"}, "mother-encore": {"title": "MOTHER: Encore", "url": "https://mother-encore.itch.io/mother-encore"}, "project-kat": {"title": "Project Kat", "url": "https://leef6010.itch.io/projectkat"}, "the-freak-circus": {"title": "The Freak Circus", "url": "https://garula.itch.io/the-freak-circus"}, "mario-kart-wii-deluxex": {"title": "Mario Kart Wii DeluxeX", "url": "https://discord.com/invite/tRVhfWSkf2"}, "sonic-megamix-mania": {"title": "Sonic Megamix Mania", "url": "https://sonicmegamixmania.github.io/"}, "final-fight-enhanced-edition-amiga": {"title": "Final Fight Enhanced Edition - Amiga", "url": "https://www.indieretronews.com/2026/02/final-fight-enhanced-enhanced-amiga.html?spref=tw"}, "cold-case": {"title": "Cold Case", "url": "https://segaxtreme.net/resources/cold-case.237/"}, "grand-theft-auto-ready2play": {"title": "Grand Theft Auto: Ready2Play", "url": "https://gtaforums.com/topic/986492-grand-theft-auto-ready2play-full-game-windows-version/"}, "orbhold": {"title": "Orbhold", "url": "https://agentratelimit.github.io/Orbhold/"}, "wonder-project-j2-decompilation": {"title": "Wonder Project J2 Decompilation", "url": "https://github.com/LLONSIT-glitch/wonder"}, "kula-world-32x-port": {"title": "Kula World 32X Port", "url": "https://old-pirate.itch.io/kula-world-32x"}, "castlevania-1-fortified-army": {"title": "Castlevania 1 Fortified Army", "url": "https://www.romhacking.net/hacks/9409/?ref=retrododo.com"}, "chiaki-ng": {"title": "Chiaki NG", "url": "https://github.com/streetpea/chiaki-ng"}, "steam-deck-guide": {"title": "Steam Deck Guide", "url": "https://github.com/mikeroyal/Steam-Deck-Guide"}, "awesome-steam-deck": {"title": "Awesome Steam Deck", "url": "https://github.com/airscripts/awesome-steam-deck"}, "rog-ally-and-steam-deck-ultimate-windows-guides": {"title": "Rog Ally & Steam Deck Ultimate Windows Guides", "url": "https://baldsealion.com/"}, "heart-of-the-alien-n64-port": {"title": "Heart of the Alien N64 Port", "url": "https://old-pirate.itch.io/heart-of-the-alien-n64"}, "super-mario-64-remake": {"title": "Super Mario 64 Remake", "url": "https://cdromance.org/n64-roms/super-mario-64-remake-hack-n64/"}, "assassin-s-creed-director-s-cut-remastered": {"title": "Assassin's Creed Director's Cut Remastered", "url": "https://www.nexusmods.com/assassinscreed/mods/152?tab=description"}, "walfie-s-nonograms": {"title": "Walfie's Nonograms", "url": "https://walfie.itch.io/walfies-nonograms"}, "celeste-classic-psx": {"title": "Celeste Classic PSX", "url": "https://bonnie-games.itch.io/celeste-classic-psx"}, "sonic-the-hedgehog-xa": {"title": "Sonic The Hedgehog XA", "url": "https://github.com/luksamuk/engine-psx"}, "oldunreal-game-installers": {"title": "OldUnreal Game Installers", "url": "https://github.com/OldUnreal/FullGameInstallers/releases/tag/windows-game-installers"}, "super-mario-cd-super-mario-64-for-the-ps1": {"title": "Super Mario CD Super Mario 64 for the PS1", "url": "https://youtu.be/ogc-BAuQEGw?si=biUDDwz2ln5BR0qY"}, "friends-adrift": {"title": "Friends Adrift", "url": "https://zhamul.itch.io/friends-adrift-ps1"}, "magic-castle": {"title": "Magic Castle", "url": "http://netyaroze.com/Media/Magic-Castle"}, "mario-kart-double-dash-retro-track-grand-prix": {"title": "Mario Kart Double Dash Retro Track Grand Prix", "url": "https://gamebanana.com/mods/594415"}, "bangai-o-n64": {"title": "Bangai-O - N64", "url": "https://www.romhacking.net/translations/7509/"}, "openciv3": {"title": "OpenCiv3", "url": "https://openciv3.org/"}, "isometric-games-don-t-exist": {"title": "Isometric Games Don't Exist", "url": "https://cyangmou.itch.io/isometric-games-dont-exist"}, "xenosaga-episode-i-der-wille-zur-macht-decompilation": {"title": "Xenosaga Episode I Der Wille zur Macht Decompilation", "url": "https://github.com/ValakTurtle/Xenosaga-I-Decomp"}, "touhou-koumakyou-the-embodiment-of-scarlet-devil-decompilation": {"title": "Touhou Koumakyou The Embodiment of Scarlet Devil Decompilation", "url": "https://github.com/GensokyoClub/th06"}, "fallout-the-new-west": {"title": "Fallout The New West", "url": "https://youtu.be/KY5X0G_05h0?si=-1DM55tQkS3nQvB8"}, "cyberpunk-2077-the-apex-sonora-canyon-and-safehouse-mod": {"title": "Cyberpunk 2077 The APEX Sonora Canyon and Safehouse Mod", "url": "https://www.nexusmods.com/cyberpunk2077/mods/25999"}, "black-and-white-2": {"title": "Black & White 2", "url": "https://www.myabandonware.com/game/black-white-2-bem"}, "zoo-tycoon-complete-collection": {"title": "Zoo Tycoon Complete Collection", "url": "https://www.myabandonware.com/game/zoo-tycoon-complete-collection-dzx"}, "black-and-white": {"title": "Black & White", "url": "https://www.myabandonware.com/game/black-white-a33"}, "sim-ant": {"title": "Sim Ant", "url": "https://www.myabandonware.com/game/simant-197"}, "mechwarrior-4-mercenaries": {"title": "MechWarrior 4 Mercenaries", "url": "https://www.myabandonware.com/game/mechwarrior-4-mercenaries-3ak"}, "the-movies": {"title": "The Movies", "url": "https://www.myabandonware.com/game/the-movies-bcv"}, "harry-potter-and-the-sorcerer-s-stone": {"title": "Harry Potter and the Sorcerer's Stone", "url": "https://www.myabandonware.com/game/harry-potter-and-the-sorcerer-s-stone-e3o"}, "sonic-heroes": {"title": "Sonic Heroes", "url": "https://www.myabandonware.com/game/sonic-heroes-cm5"}, "disney-s-tarzan": {"title": "Disney's Tarzan", "url": "https://www.myabandonware.com/game/disney-s-tarzan-49p"}, "the-lord-of-the-rings-the-battle-for-middle-earth-ii": {"title": "The Lord of the Rings The Battle for Middle-Earth II", "url": "https://archive.org/details/the-lord-of-the-rings-the-battle-for-middle-earth-ii-repack"}, "adidas-power-soccer": {"title": "Adidas Power Soccer", "url": "https://www.myabandonware.com/game/adidas-power-soccer-dsf"}, "spiderman-web-of-shadows": {"title": "Spiderman Web of Shadows", "url": "https://www.myabandonware.com/game/spider-man-web-of-shadows-gmb"}, "spiderman-shattered-dimensions": {"title": "Spiderman Shattered Dimensions", "url": "https://www.myabandonware.com/game/spider-man-shattered-dimensions-rbo"}, "mushroom-heaven": {"title": "Mushroom Heaven", "url": "https://www.romhacking.net/hacks/6803/"}, "the-beatles-adventures-in-pepperland": {"title": "The Beatles Adventures in Pepperland", "url": "https://www.romhacking.net/hacks/6311/"}, "ghost-recon-advanced-warfighter-1-and-2": {"title": "Ghost Recon Advanced Warfighter 1 and 2", "url": "https://archive.org/details/ghost-recon-advanced-warfighter"}, "of-mice-and-mechs": {"title": "Of Mice and Mechs", "url": "https://github.com/MarxMustermann/OfMiceAndMechs/"}, "pikmin-1": {"title": "Pikmin 1²", "url": "https://pikhacker.github.io/"}, "nhl-94-fight-edition": {"title": "NHL'94 Fight Edition", "url": "https://forum.nhl94.com/index.php?/topic/38026-nhl94-fight-edition/"}, "sword-of-mana-quickmenu": {"title": "Sword of Mana QuickMenu​", "url": "https://www.romhacking.net/hacks/4913/"}, "snoopy-vs-the-red-baron": {"title": "Snoopy vs The Red Baron", "url": "https://archive.org/details/Snoopy_vs._The_Red_Baron_USA"}, "state-of-emergency": {"title": "State of Emergency", "url": "https://archive.org/details/state-of-emergency-repack"}, "rise-of-nations-rise-of-legends": {"title": "Rise of Nations Rise of Legends", "url": "https://archive.org/details/rise-of-nations-rise-of-legends-2006-microsoft-big-huge-games-4-cd-set"}, "super-mariomon": {"title": "Super Mariomon​", "url": "https://www.pokecommunity.com/threads/super-mariomon.535764/"}, "wario-land-4-perfect-version": {"title": "Wario Land 4 Perfect Version​", "url": "https://www.romhacking.net/hacks/8885/"}, "wario-land-4-jungle-rumble": {"title": "Wario Land 4 Jungle Rumble!​", "url": "https://www.romhacking.net/hacks/8027/"}, "goodboy-galaxy-emulator-rumble-patch": {"title": "Goodboy Galaxy Emulator Rumble Patch​", "url": "https://goodboygalaxy.com/wiki/doku.php?id=rumble"}, "a-more-modern-amazing-mirror": {"title": "A More Modern Amazing Mirror​", "url": "https://www.romhacking.net/hacks/8287/"}, "a-more-modern-amazing-mirror-with-coloured-outlines": {"title": "A More Modern Amazing Mirror with Coloured Outlines​", "url": "https://www.romhacking.net/hacks/8204/"}, "a-more-modern-nightmare-in-dream-land": {"title": "A More Modern Nightmare In Dream Land​", "url": "https://www.romhacking.net/hacks/8289/"}, "fire-emblem-sacred-stones-reforged": {"title": "Fire Emblem Sacred Stones Reforged​", "url": "https://feuniverse.us/t/fe8-sacred-stones-reforged-v1-0-4/28486?page=11"}, "rhythm-heaven-silver-gameboy-advance": {"title": "Rhythm Heaven Silver - Gameboy Advance​", "url": "https://github.com/ShaffySwitcher/RhythmHeavenSilver"}, "smas-smb-lost-levels-brick-fix": {"title": "SMAS SMB Lost Levels Brick Fix​", "url": "https://www.romhacking.net/hacks/167/"}, "super-mario-world-mix": {"title": "Super Mario World Mix​", "url": "https://www.smwcentral.net/?p=section&a=details&id=40597"}, "yu-gi-oh-the-eternal-duelist-soul-hack": {"title": "Yu-Gi-Oh! The Eternal Duelist Soul HACK​", "url": "https://www.romhacking.net/hacks/9299/"}, "castlevania-aria-of-sorrow-reprise": {"title": "Castlevania Aria of Sorrow Reprise​", "url": "https://www.romhacking.net/hacks/8425/"}, "castlevania-aria-of-sorrow-definitive-edition": {"title": "Castlevania Aria of Sorrow Definitive Edition​", "url": "https://www.romhacking.net/hacks/8805/"}, "contra-hard-corps-hit-points-restoration-hack": {"title": "Contra Hard Corps Hit Points Restoration Hack​", "url": "https://www.romhacking.net/hacks/797/"}, "super-luigi-rpg-star-powered": {"title": "Super Luigi RPG Star Powered​", "url": "https://will319.itch.io/super-luigi-rpg-star-powered"}, "super-metroid-arcade": {"title": "Super Metroid Arcade​", "url": "https://metroidconstruction.com/hack.php?id=357"}, "zelda-ii-amida-s-curse": {"title": "Zelda II Amida's Curse​", "url": "https://www.romhacking.net/hacks/6292/"}, "zelda-ii-resurrection-of-ganon": {"title": "Zelda II Resurrection of Ganon​", "url": "https://retrohackers.net/hack-details.php?id=5656/"}, "super-mario-kart-horizons": {"title": "Super Mario Kart Horizons​", "url": "https://www.romhacking.net/hacks/8639/"}, "the-legend-of-zelda-allhallows-eve": {"title": "The Legend of Zelda Allhallows Eve​", "url": "https://www.romhacking.net/hacks/8239/"}, "legend-of-the-mana-sword": {"title": "Legend of the Mana Sword​", "url": "https://www.romhacking.net/hacks/6550/"}, "close-combat-first-to-fight": {"title": "Close Combat: First to Fight​", "url": "https://www.myabandonware.com/game/close-combat-first-to-fight-dj8"}, "the-legend-of-zelda-spirit-tracks-d-pad-controls": {"title": "The Legend of Zelda Spirit Tracks D-Pad Controls​", "url": "https://www.romhacking.net/hacks/2235/"}, "wwf-raw": {"title": "WWF Raw​", "url": "https://www.myabandonware.com/game/wwf-raw-e6z"}, "the-legend-of-zelda-phantom-hourglass-d-pad-patch": {"title": "The Legend of Zelda Phantom Hourglass D-Pad Patch​", "url": "https://www.romhacking.net/hacks/2248/"}, "turok-evolution": {"title": "Turok: Evolution​", "url": "https://www.myabandonware.com/game/turok-evolution-amg"}, "paraworld": {"title": "ParaWorld​", "url": "https://www.myabandonware.com/game/paraworld-f3y"}, "dreamcast-image-builder-for-modding-patching-dreamcast-games": {"title": "Dreamcast Image Builder For Modding Patching Dreamcast Games​", "url": "https://gitlab.com/PiKeyAr/dreamcast-image-builder/"}, "dreamcast-image-builder-mods": {"title": "Dreamcast Image Builder Mods​", "url": "https://github.com/X-Hax/dreamcast-mods"}, "wowee-world-of-warcraft-engine-experiment": {"title": "WoWee World Of Warcraft Engine Experiment​", "url": "https://github.com/Kelsidavis/WoWee"}, "mystical-ninja-starring-goemon-recompilation-mods": {"title": "Mystical Ninja Starring Goemon Recompilation Mods​", "url": "https://github.com/klorfmorf/MNSGRecompRedubMod/releases/tag/1.0.0"}, "harry-potter-and-the-deathly-hallows-part-1": {"title": "Harry Potter and the Deathly Hallows: Part 1​", "url": "https://www.myabandonware.com/game/harry-potter-and-the-deathly-hallows-part-1-f6c"}, "shaun-white-skateboarding": {"title": "Shaun White Skateboarding​", "url": "https://www.myabandonware.com/game/shaun-white-skateboarding-wra"}, "sol-survivor": {"title": "Sol Survivor​", "url": "https://www.myabandonware.com/game/sol-survivor-xpy"}, "tom-clancy-s-h-a-w-x-2": {"title": "Tom Clancy's H.A.W.X 2​", "url": "https://www.myabandonware.com/game/tom-clancy-s-h-a-w-x-2-n5j"}, "wrc-fia-world-rally-championship": {"title": "WRC FIA World Rally Championship​", "url": "https://www.myabandonware.com/game/wrc-fia-world-rally-championship-t59"}, "harry-potter-and-the-deathly-hallows-part-2": {"title": "Harry Potter and the Deathly Hallows: Part 2​", "url": "https://www.myabandonware.com/game/harry-potter-and-the-deathly-hallows-part-2-f6d"}, "jurassic-park-the-game": {"title": "Jurassic Park: The Game​", "url": "https://www.myabandonware.com/game/jurassic-park-the-game-yfz"}, "virtua-tennis-4": {"title": "Virtua Tennis 4​", "url": "https://www.myabandonware.com/game/virtua-tennis-4-r0g"}, "farming-simulator-2009": {"title": "Farming Simulator 2009​", "url": "https://www.myabandonware.com/game/farming-simulator-2009-re1"}, "heroes-over-europe": {"title": "Heroes Over Europe​", "url": "https://www.myabandonware.com/game/heroes-over-europe-qml"}, "super-junkoid-dx": {"title": "Super Junkoid DX​", "url": "https://www.romhacking.net/hacks/8109/"}, "yoshi-s-island-no-crying-improved-sfx-and-red-coins": {"title": "Yoshi's Island - No Crying, Improved SFX and Red Coins​", "url": "https://www.romhacking.net/hacks/3945/"}, "hyper-metroid": {"title": "Hyper Metroid​", "url": "https://www.romhacking.net/hacks/3038/"}, "super-metroid-project-base": {"title": "Super Metroid Project Base​", "url": "https://www.romhacking.net/hacks/2767/"}, "super-metroid-subversion": {"title": "Super Metroid: Subversion​", "url": "https://metroidconstruction.com/hack.php?id=716"}, "super-ghouls-n-ghosts-restoration-and-super-arthur": {"title": "Super Ghouls N Ghosts - Restoration and Super Arthur​", "url": "https://kainetertainment.home.blog/2022/11/09/super-gng-hacks/"}, "the-legend-of-zelda-ancient-dungeon": {"title": "The Legend of Zelda: Ancient Dungeon​", "url": "https://www.romhacking.net/hacks/7358/"}, "terminator-salvation": {"title": "Terminator: Salvation​", "url": "https://www.myabandonware.com/game/terminator-salvation-lkf"}, "the-warriors-street-brawl": {"title": "The Warriors: Street Brawl​", "url": "https://www.myabandonware.com/game/the-warriors-street-brawl-f1w"}, "tom-clancy-s-h-a-w-x": {"title": "Tom Clancy's H.A.W.X​", "url": "https://www.myabandonware.com/game/tom-clancy-s-h-a-w-x-jte"}, "motocross-madness": {"title": "Motocross Madness​", "url": "https://archive.org/details/motocross-madness-repack-v-2"}, "motocross-madness-2": {"title": "Motocross Madness 2​", "url": "https://archive.org/details/motocross-madness-2-repack-v-2"}, "rockman-exe-phantom-of-network-pc-port": {"title": "Rockman EXE Phantom of Network PC Port​", "url": "https://github.com/StraDaMa/PoN_PC"}, "pariah": {"title": "Pariah​", "url": "https://www.myabandonware.com/game/pariah-enq"}, "onimusha-3-demon-siege": {"title": "Onimusha 3: Demon Siege", "url": "https://archive.org/details/onimusha-3-demon-siege_202603"}, "gunners-heart": {"title": "Gunners Heart​", "url": "https://www.myabandonware.com/game/gunners-heart-lbu"}, "dynasty-warriors-5": {"title": "Dynasty Warriors 5​", "url": "https://www.myabandonware.com/game/dynasty-warriors-5-special-cnf"}, "dynasty-warriors-4": {"title": "Dynasty Warriors 4​", "url": "https://www.myabandonware.com/game/dynasty-warriors-4-l4c"}, "driv3r": {"title": "Driv3r​", "url": "https://www.myabandonware.com/game/driv3r-eq2"}, "conflict-global-terror": {"title": "Conflict: Global Terror​", "url": "https://archive.org/details/conflict-global-terror-repack"}, "true-crime-new-york-city": {"title": "True Crime: New York City​", "url": "https://www.myabandonware.com/game/true-crime-new-york-city-e37"}, "sonic-riders": {"title": "Sonic Riders​", "url": "https://www.myabandonware.com/game/sonic-riders-cng"}, "micro-machines-v4": {"title": "Micro Machines V4​", "url": "https://www.myabandonware.com/game/micro-machines-v4-dze"}, "blazing-angels-squadrons-of-wwii": {"title": "Blazing Angels: Squadrons of WWII​", "url": "https://archive.org/details/blazing-angels-squadrons-of-wwii-repack"}, "bionicle-heroes": {"title": "Bionicle Heroes​", "url": "https://www.myabandonware.com/game/bionicle-heroes-cnb"}, "billy-hatcher-and-the-giant-egg": {"title": "Billy Hatcher and the Giant Egg​", "url": "https://www.myabandonware.com/game/billy-hatcher-and-the-giant-egg-cnk"}, "universe-at-war-earth-assault": {"title": "Universe at War: Earth Assault​", "url": "https://www.myabandonware.com/game/universe-at-war-earth-assault-f3x"}, "mercenary-x-sky-striker": {"title": "Mercenary-X: Sky Striker​", "url": "https://www.myabandonware.com/game/soeldner-x-himmelsstuermer-limited-edition-lq6"}, "phantasy-star-universe-ambition-of-the-illuminus": {"title": "Phantasy Star Universe: Ambition of the Illuminus​", "url": "https://www.myabandonware.com/game/phantasy-star-universe-ambition-of-the-illuminus-co5"}, "infernal": {"title": "Infernal​", "url": "https://www.myabandonware.com/game/infernal-cki"}, "enemy-territory-quake-wars": {"title": "Enemy Territory: Quake Wars​", "url": "https://www.myabandonware.com/game/enemy-territory-quake-wars-ixd"}, "blacksite-area-51": {"title": "BlackSite: Area 51​", "url": "https://www.myabandonware.com/game/blacksite-area-51-e2g"}, "assault-heroes": {"title": "Assault Heroes​", "url": "https://www.myabandonware.com/game/assault-heroes-ioq"}, "a-farewell-to-dragons": {"title": "A Farewell to Dragons​", "url": "https://www.myabandonware.com/game/a-farewell-to-dragons-nh7"}, "zoo-tycoon-2-ultimate-collection": {"title": "Zoo Tycoon 2: Ultimate Collection​", "url": "https://www.myabandonware.com/game/zoo-tycoon-2-ultimate-collection-tal"}, "turning-point-fall-of-liberty": {"title": "Turning Point: Fall of Liberty​", "url": "https://www.myabandonware.com/game/turning-point-fall-of-liberty-mmx"}, "the-incredible-hulk": {"title": "The Incredible Hulk​", "url": "https://www.myabandonware.com/game/the-incredible-hulk-td5"}, "shaun-white-snowboarding": {"title": "Shaun White Snowboarding​", "url": "https://www.myabandonware.com/game/shaun-white-snowboarding-vs3"}, "samurai-warriors-2": {"title": "Samurai Warriors 2​", "url": "https://www.myabandonware.com/game/samurai-warriors-2-gyg"}, "rayman-raving-rabbids-2": {"title": "Rayman: Raving Rabbids 2​", "url": "https://www.myabandonware.com/game/rayman-raving-rabbids-2-fm0"}, "kung-fu-panda": {"title": "Kung Fu Panda​", "url": "https://www.myabandonware.com/game/kung-fu-panda-nr2"}, "dynasty-warriors-6": {"title": "Dynasty Warriors 6​", "url": "https://www.myabandonware.com/game/dynasty-warriors-6-ixg"}, "lotus-challenge": {"title": "Lotus Challenge", "url": "https://archive.org/details/lotus-challenge-repack"}, "south-park-chef-s-luv-shack": {"title": "South Park - Chef's Luv Shack​", "url": "https://archive.org/details/south-park-chefs-luv-shack-win-7-to-11-compat"}, "frogger-returns": {"title": "Frogger Returns​", "url": "https://archive.org/details/frogger-returns-win-7-to-11-compatible-a-wb-installer"}, "flash-traffic-city-of-angels": {"title": "Flash Traffic - City Of Angels​", "url": "https://archive.org/details/flash_traffic_-_city_of_angels_windows_10_compatible"}, "jimmy-white-s-cueball-world": {"title": "Jimmy White's Cueball World​", "url": "https://archive.org/details/jimmy-whites-cueball-world-windows-10-compatible"}, "crazy-cars-iii": {"title": "Crazy Cars III​", "url": "https://archive.org/details/CrazyCarsIIIInstaller"}, "bloodwings-pumpkinhead-s-revenge": {"title": "Bloodwings - Pumpkinhead's Revenge​", "url": "https://archive.org/details/bloodwings-pumpkinheads-revenge-7-to-11-compat"}, "pirates-gold": {"title": "Pirates! Gold​", "url": "https://archive.org/details/piratesgoldwindows10compatible"}, "grand-prix-500-2": {"title": "Grand Prix 500 2​", "url": "https://archive.org/details/grand-prix-500-2-win-7-11-compatible"}, "dreamweb": {"title": "Dreamweb", "url": "https://archive.org/details/dreamweb-mr-abandonware"}, "pga-tour-golf-486": {"title": "PGA Tour Golf 486​", "url": "https://archive.org/details/pga-tour-golf-486-windows-10-compatible"}, "mad-dog-ii-the-lost-gold": {"title": "Mad Dog II The Lost Gold​", "url": "https://archive.org/details/MadDogIITheLostGold_201905"}, "who-shot-johnny-rock": {"title": "Who Shot Johnny Rock?​", "url": "https://archive.org/details/WhoShotJohnnyRockWindows10Compatible"}, "secret-mission": {"title": "Secret Mission​", "url": "https://archive.org/details/secretmissionwindows10silentinstallerbywhitebob"}, "paperboy-2": {"title": "Paperboy 2​", "url": "https://archive.org/details/paperboy-2-win-7-11-compatible-installer"}, "monkey-island-2-lechuck-s-revenge-ultimate-talkie-dos-edition": {"title": "Monkey Island 2 - LeChuck's Revenge Ultimate Talkie DOS Edition​", "url": "https://archive.org/details/monkey-island-2-lechucks-revenge-ultimate-talkie-dos-edition-win-7-to-11-compat"}, "jimmy-white-s-2-cueball": {"title": "Jimmy White's 2 - Cueball​", "url": "https://archive.org/details/jimmy-whites-2-cueball-windows-10-compatible"}, "international-sensible-soccer": {"title": "International Sensible Soccer​", "url": "https://archive.org/details/InternationalSensibleSoccerSetup"}, "hell-a-cyberpunk-thriller": {"title": "Hell - A Cyberpunk Thriller​", "url": "https://archive.org/details/HellACyberpunkThrillerWindows10"}, "championship-manager-97-98-with-18-19-updatemod": {"title": "Championship Manager 97-98 with 18-19 UpdateMod​", "url": "https://archive.org/details/ChampionshipManager97-98-18-19_Mod"}, "speedball-2-brutal-deluxe": {"title": "Speedball 2 - Brutal Deluxe​", "url": "https://archive.org/details/Speedball2BrutalDeluxeInstallerWindows10Compatible"}, "cool-spot": {"title": "Cool Spot​", "url": "https://archive.org/details/cool-spot-windows-10-compatible"}, "time-gal": {"title": "Time Gal​", "url": "https://archive.org/details/time-gal-win-7-to-11-compatible"}, "project-x-special-edition-93": {"title": "Project-X Special Edition '93​", "url": "https://archive.org/details/project-x-special-edition-93-amiga-version-windows-10-compatible"}, "ghostly-desires": {"title": "Ghostly Desires​", "url": "https://archive.org/details/GhostlyDesiresWindows10"}, "monopoly-casino": {"title": "Monopoly Casino​", "url": "https://archive.org/details/monopoly_casino_windows_10_compatible"}, "ripper": {"title": "Ripper​", "url": "https://archive.org/details/RipperWindows10Compatible"}, "wolfpack": {"title": "Wolfpack​", "url": "https://archive.org/details/wolfpack-gold-edition-cd-rom-windows-7-11-compat"}, "lotus-the-ultimate-challenge": {"title": "Lotus - The Ultimate Challenge​", "url": "https://archive.org/details/LotusTheUltimateChallengeInstaller"}, "beavis-and-butt-head-mini-games": {"title": "Beavis & Butt-Head Mini Games​", "url": "https://archive.org/details/BeavisButt-HeadMiniGamesForWindows10Compatible"}, "worms-the-director-s-cut": {"title": "Worms - The Director's Cut​", "url": "https://archive.org/details/wormsthedirectorscutwindows10compatible"}, "star-wars-chess": {"title": "Star Wars Chess​", "url": "https://archive.org/details/star-wars-chess-win-7-11-compatible"}, "voyeur-ii-watching-is-not-enough": {"title": "Voyeur II - Watching Is Not Enough​", "url": "https://archive.org/details/VoyeurIIWindows10Compatible"}, "space-invaders": {"title": "Space Invaders​", "url": "https://archive.org/details/SpaceInvadersWindows10Compatible"}, "star-wars-episode-i-battle-for-naboo": {"title": "Star Wars Episode I - Battle For Naboo​", "url": "https://archive.org/details/star-wars-episode-i-battle-for-naboo-windows-7-11-compat"}, "night-trap": {"title": "Night Trap​", "url": "https://archive.org/details/NightTrapDirectorsCut"}, "mad-dog-mccree": {"title": "Mad Dog McCree​", "url": "https://archive.org/details/MadDogMcCree"}, "harvester": {"title": "Harvester​", "url": "https://archive.org/details/harvester-windows-10-compat"}, "crash-time-iii": {"title": "Crash Time III​", "url": "https://archive.org/details/crashtimeiii3Windows10Compatible"}, "worms-remastered": {"title": "Worms Remastered​", "url": "https://archive.org/details/worms-remastered-win-7-11-compat-a-white-bob-installer"}, "star-wars-force-commander": {"title": "Star Wars - Force Commander​", "url": "https://archive.org/details/star-wars-force-commander-windows-10-compatible"}, "the-secret-of-monkey-island-1-and-2-original-versions-with-speech-mod": {"title": "The Secret Of Monkey Island 1 & 2 - Original Versions With Speech Mod​", "url": "https://archive.org/details/MONKEYISLAND_201903"}, "crash-time-4-the-syndicate": {"title": "Crash Time 4 - The Syndicate​", "url": "https://archive.org/details/crashtime4thesyndicateinstalleWindows10Compatible"}, "star-wars-trilogy-arcade": {"title": "Star Wars Trilogy Arcade​", "url": "https://archive.org/details/star-wars-trilogy-arcade-win-7-11-compatible-installer"}, "hooligans-storm-over-europe": {"title": "Hooligans - Storm Over Europe​", "url": "https://archive.org/details/HooligansStormOverEuropeWindows10Compatible"}, "007-nightfire": {"title": "007 - Nightfire​", "url": "https://archive.org/details/007NightfireWindows10Compatible"}, "call-of-duty-goy-edition": {"title": "Call Of Duty GOY Edition​", "url": "https://archive.org/details/CallOfDutyGOYEditionWindows10Compatible"}, "global-operations": {"title": "Global Operations​", "url": "https://oldgamesdownload.com/global-operations/"}, "the-wheel-of-time": {"title": "The Wheel Of Time​", "url": "https://archive.org/details/TheWheelOfTime-ZombsLair"}, "the-day-the-world-broke": {"title": "The Day The World Broke​", "url": "https://archive.org/details/TheDayTheWorldBroke-ZombsLair"}, "the-dark-eye": {"title": "The Dark Eye​", "url": "https://archive.org/details/TheDarkEye-ZombsLair"}, "take-no-prisoners": {"title": "Take No Prisoners​", "url": "https://archive.org/details/TakeNoPrisoners-ZombsLair"}, "synnergist": {"title": "Synnergist​", "url": "https://archive.org/details/Synnergist-ZombsLair"}, "stratosphere-conquest-of-the-skies": {"title": "Stratosphere: Conquest of the Skies​", "url": "https://archive.org/details/Stratosphere-ZombsLair"}, "star-trek-the-next-generation-a-final-unity": {"title": "Star Trek: The Next Generation - A Final Unity​", "url": "https://archive.org/details/StarTrekTheNextGenerationAFinalUnity-ZombsLair"}, "spaceship-warlock": {"title": "Spaceship Warlock​", "url": "https://archive.org/details/SpaceshipWarlock-ZombsLair"}, "shadow-of-the-beast-collection": {"title": "Shadow Of The Beast Collection​", "url": "https://archive.org/details/ShadowOfTheBeastCollection-ZombsLair"}, "perihelion-the-prophecy": {"title": "Perihelion: The Prophecy​", "url": "https://archive.org/details/PerihelionTheProphecy-ZombsLair"}, "alien-legacy": {"title": "Alien Legacy​", "url": "https://archive.org/details/AlienLegacy-ZombsLair"}, "nightlong-union-city-conspiracy": {"title": "Nightlong: Union City Conspiracy​", "url": "https://archive.org/details/Nightlong-ZombsLair/Nightlong%20-%20Cover.jpg"}, "mummy-tomb-of-the-pharaoh": {"title": "Mummy: Tomb Of The Pharaoh​", "url": "https://archive.org/details/MummyTombOfThePharaoh-ZombsLair"}, "master-of-dimensions": {"title": "Master of Dimensions​", "url": "https://archive.org/details/MasterOfDimensions-ZombsLair"}, "martian-gothic-unification": {"title": "Martian Gothic: Unification​", "url": "https://archive.org/details/MartianGothic-ZombsLair"}, "lifeforce-tenka": {"title": "Lifeforce Tenka​", "url": "https://archive.org/details/LifeforceTenka-ZombsLair"}, "iron-assault": {"title": "Iron Assault​", "url": "https://archive.org/details/IronAssault-ZombsLair"}, "gunman-chronicles": {"title": "Gunman Chronicles​", "url": "https://archive.org/details/GunmanChronicles-ZombsLair"}, "gothos": {"title": "Gothos​", "url": "https://archive.org/details/Gothos-ZombsLair"}, "gadget-collection": {"title": "Gadget Collection​", "url": "https://archive.org/details/GadgetCollection-ZombsLair"}, "future-cop-lapd": {"title": "Future Cop: LAPD​", "url": "https://archive.org/details/FutureCopLAPD-ZombsLair"}, "frankenstein-through-the-eyes-of-the-monster": {"title": "Frankenstein: Through the Eyes of the Monster​", "url": "https://archive.org/details/FrankensteinThroughTheEyesOfTheMonster-ZombsLair"}, "faust-seven-games-of-the-soul": {"title": "Faust: Seven Games of the Soul​", "url": "https://archive.org/details/Faust-ZombsLair"}, "evil-dead-hail-to-the-king": {"title": "Evil Dead: Hail To The King​", "url": "https://archive.org/details/EvilDeadHailToTheKing-ZombsLair"}, "elvira-collection": {"title": "Elvira Collection​", "url": "https://archive.org/details/ElviraCollection-ZombsLair"}, "drowned-god": {"title": "Drowned God​", "url": "https://archive.org/details/DrownedGod-ZombsLair"}, "death-gate": {"title": "Death Gate​", "url": "https://archive.org/details/DeathGate-ZombsLair"}, "daughter-of-serpents": {"title": "Daughter Of Serpents​", "url": "https://archive.org/details/DaughterOfSerpents-ZombsLair"}, "companions-of-xanth": {"title": "Companions Of Xanth​", "url": "https://archive.org/details/CompanionsOfXanth-ZombsLair"}, "commander-blood": {"title": "Commander Blood​", "url": "https://archive.org/details/CommanderBlood-ZombsLair"}, "biosys": {"title": "Biosys​", "url": "https://archive.org/details/Biosys-ZombsLair"}, "black-dahlia": {"title": "Black Dahlia​", "url": "https://archive.org/details/BlackDahlia-ZombsLair"}, "burn-cycle": {"title": "Burn: Cycle​", "url": "https://archive.org/details/BurnCycle-ZombsLair"}, "blue-heat": {"title": "Blue Heat​", "url": "https://archive.org/details/BlueHeat-ZombsLair"}, "abomination-the-nemesis-project": {"title": "Abomination: The Nemesis Project​", "url": "https://archive.org/details/Abomination-ZombsLair"}, "nightmare-creatures": {"title": "Nightmare Creatures​", "url": "https://archive.org/details/NightmareCreatures-ZombsLair"}, "pro-evolution-soccer-collection": {"title": "Pro Evolution Soccer Collection​", "url": "https://archive.org/details/pro-evolution-soccer-collection"}, "f1-2014": {"title": "F1 2014​", "url": "https://archive.org/details/f-1-2014_202512"}, "007-legends": {"title": "007 Legends​", "url": "https://archive.org/details/007-legends"}, "fifa-17-super-deluxe-edition": {"title": "FIFA 17 Super Deluxe Edition​", "url": "https://archive.org/details/fifa-17-super-deluxe-edition"}, "fifa-15": {"title": "FIFA 15​", "url": "https://archive.org/details/fifa-15-1.4.0.0-v-3"}, "fifa-08": {"title": "FIFA 08​", "url": "https://archive.org/details/fifa-08-el-amigos"}, "fifa-13": {"title": "FIFA 13​", "url": "https://archive.org/details/fifa-13-v-1.7-12.02.2013"}, "fifa-12-euro-2012": {"title": "FIFA 12 + Euro 2012​", "url": "https://archive.org/details/euro-2012-video-game"}, "fifa-11": {"title": "FIFA 11​", "url": "https://archive.org/details/fifa-11-full-reloaded-pc-game-setup-torrent"}, "wings-of-glory": {"title": "Wings Of Glory", "url": "https://archive.org/details/wings-of-glory-mr-abandonware"}, "vengeance-of-excalibur": {"title": "Vengeance Of Excalibur", "url": "https://archive.org/details/vengeance-of-excalibur-mr-abandonware"}, "twilight-2000": {"title": "Twilight 2000", "url": "https://archive.org/details/twilight-2000-mr-abandonware"}, "touche-the-adventures-of-the-fifth-musketeer": {"title": "Touche: The Adventures Of The Fifth Musketeer", "url": "https://archive.org/details/touche-the-adventures-of-the-fifth-musketeer-mr-abandonware"}, "total-distortion": {"title": "Total Distortion", "url": "https://archive.org/details/total-distortion-1-mr-abandonware"}, "tom-clancy-s-ssn": {"title": "Tom Clancy's SSN", "url": "https://archive.org/details/tom-clancys-ssn-mr-abandonware_202208"}, "times-of-lore": {"title": "Times Of Lore", "url": "https://archive.org/details/times-of-lore-mr-abandonware"}, "their-finest-hour-the-battle-of-britain-complete": {"title": "Their Finest Hour: The Battle of Britain - Complete", "url": "https://archive.org/details/their-finest-hour-mr-abandonware"}, "the-terminator-skynet": {"title": "The Terminator: SkyNET", "url": "https://archive.org/details/the-terminator-skynet-mr-abandonware"}, "the-terminator-future-shock": {"title": "The Terminator: Future Shock", "url": "https://archive.org/details/the-terminator-future-shock-mr-abandonware"}, "the-terminator-2029-deluxe-cd-edition": {"title": "The Terminator 2029: Deluxe CD Edition", "url": "https://archive.org/details/the-terminator-2029-deluxe-cd-edition-mr-abandonware"}, "the-scroll": {"title": "The Scroll", "url": "https://archive.org/details/the-scroll-mr-abandonware"}, "the-orion-conspiracy": {"title": "The Orion Conspiracy", "url": "https://archive.org/details/the-orion-conspiracy-mr-abandonware"}, "the-lost-vikings": {"title": "The Lost Vikings", "url": "https://archive.org/details/the-lost-vikings-mr-abandonware"}, "the-lost-files-of-sherlock-holmes-the-case-of-the-serrated-scalpel": {"title": "The Lost Files Of Sherlock Holmes: The Case Of The Serrated Scalpel", "url": "https://archive.org/details/the-lost-files-of-sherlock-holmes-the-case-of-the-serrated-scalpel-mr-abandonware"}, "the-lost-files-of-sherlock-holmes-the-case-of-the-rose-tattoo": {"title": "The Lost Files Of Sherlock Holmes: The Case Of The Rose Tattoo", "url": "https://archive.org/details/the-lost-files-of-sherlock-holmes-the-case-of-the-rose-tattoo-mr-abandonware"}, "the-gene-machine": {"title": "The Gene Machine", "url": "https://archive.org/details/the-gene-machine-mr-abandonware"}, "the-daedalus-encounter": {"title": "The Daedalus Encounter", "url": "https://archive.org/details/the-daedalus-encounter-mr-abandonware"}, "the-clue": {"title": "The Clue!", "url": "https://archive.org/details/the-clue-mr-abandonware"}, "spirit-of-excalibur": {"title": "Spirit Of Excalibur", "url": "https://archive.org/details/spirit-of-excalibur-mr-abandonware"}, "space-hulk": {"title": "Space Hulk", "url": "https://archive.org/details/space-hulk-mr-abandonware"}, "silent-hunter-commander-s-edition": {"title": "Silent Hunter: Commander's Edition", "url": "https://archive.org/details/silent-hunter-mr-abandonware"}, "secret-weapons-of-the-luftwaffe-complete": {"title": "Secret Weapons Of The Luftwaffe - Complete", "url": "https://archive.org/details/secret-weapons-of-the-luftwaffe-mr-abandonware"}, "seal-team": {"title": "Seal Team", "url": "https://archive.org/details/seal-team-mr-abandonware"}, "ringworld-revenge-of-the-patriarch": {"title": "Ringworld: Revenge Of The Patriarch", "url": "https://archive.org/details/ringworld-revenge-of-the-patriarch-mr-abandonware"}, "return-to-ringworld": {"title": "Return To Ringworld", "url": "https://archive.org/details/return-to-ringworld-mr-abandonware"}, "reach-for-the-skies": {"title": "Reach for the Skies", "url": "https://archive.org/details/reach-for-the-skies-mr-abandonware"}, "rama": {"title": "Rama", "url": "https://archive.org/details/rama-mr-abandonware"}, "private-eye": {"title": "Private Eye", "url": "https://archive.org/details/private-eye-1-mr-abandonware"}, "premier-manager-3": {"title": "Premier Manager 3", "url": "https://archive.org/details/premier-manager-3-mr-abandonware"}, "plan-9-from-outer-space": {"title": "Plan 9 From Outer Space", "url": "https://archive.org/details/plan-9-from-outer-space-mr-abandonware"}, "pacific-strike-complete": {"title": "Pacific Strike - Complete", "url": "https://archive.org/details/pacific-strike-mr-abandonware"}, "operation-stealth-james-bond-007-the-stealth-affair": {"title": "Operation Stealth - James Bond 007: The Stealth Affair", "url": "https://archive.org/details/operation-stealth-mr-abandonware"}, "oh-no-more-lemmings": {"title": "Oh No! More Lemmings", "url": "https://archive.org/details/oh-no-more-lemmings-mr-abandonware"}, "noir-a-shadowy-thriller": {"title": "Noir: A Shadowy Thriller", "url": "https://archive.org/details/noir-a-shadowy-thriller-mr-abandonware"}, "neuromancer": {"title": "Neuromancer", "url": "https://archive.org/details/neuromancer-mr-abandonware"}, "nascar-racing-2": {"title": "NASCAR Racing 2", "url": "https://archive.org/details/nascar-racing-2-mr-abandonware"}, "nascar-racing": {"title": "NASCAR Racing", "url": "https://archive.org/details/nascar-racing-mr-abandonware_202207"}, "jungle-strike": {"title": "Jungle Strike", "url": "https://archive.org/details/jungle-strike-mr-abandonware"}, "midwinter-ii-flames-of-freedom": {"title": "Midwinter II: Flames Of Freedom", "url": "https://archive.org/details/midwinter-ii-flames-of-freedom-mr-abandonware"}, "midwinter": {"title": "Midwinter", "url": "https://archive.org/details/midwinter-mr-abandonware"}, "microsoft-flight-simulator-v5-1-complete": {"title": "Microsoft Flight Simulator v5.1 - Complete", "url": "https://archive.org/details/microsoft-flight-simulator-v-5-1-mr-abandonware"}, "metaltech-earthsiege-complete": {"title": "Metaltech Earthsiege - Complete", "url": "https://archive.org/details/metaltech-earthsiege-complete-mr-abandonware"}, "mechwarrior-2-mercenaries": {"title": "MechWarrior 2: Mercenaries", "url": "https://archive.org/details/mechwarrior-2-mercenaries-mr-abandonware"}, "mechwarrior-2-ghost-bear-s-legacy": {"title": "MechWarrior 2: Ghost Bear's Legacy", "url": "https://archive.org/details/mech-warrior-2-ghost-bears-legacy-mr-abandonware"}, "mechwarrior-2-31st-century-combat": {"title": "MechWarrior 2: 31st Century Combat", "url": "https://archive.org/details/mech-warrior-2-mr-abandonware"}, "mechwarrior": {"title": "MechWarrior", "url": "https://archive.org/details/mech-warrior-mr-abandonware"}, "lost-in-time": {"title": "Lost In Time", "url": "https://archive.org/details/lost-in-time-mr-abandonware"}, "lemmings-2-the-tribes": {"title": "Lemmings 2: The Tribes", "url": "https://archive.org/details/lemmings-2-mr-abandonware"}, "lemmings": {"title": "Lemmings", "url": "https://archive.org/details/lemmings-mr-abandonware"}, "kgb-conspiracy": {"title": "KGB - Conspiracy", "url": "https://archive.org/details/kgb-conspiracy-mr-abandonware"}, "journey-the-quest-begins": {"title": "Journey: The Quest Begins", "url": "https://archive.org/details/journey-the-quest-begins-mr-abandonware"}, "jane-s-combat-simulations-longbow-gold": {"title": "Jane's Combat Simulations: Longbow - Gold", "url": "https://archive.org/details/jcs-longbow-gold-mr-abandonware"}, "j-r-r-tolkien-s-the-lord-of-the-rings-vol-ii": {"title": "J.R.R. Tolkien's The Lord of the Rings Vol. II", "url": "https://archive.org/details/lord-of-the-rings-volume-2-mr-abandonware"}, "j-r-r-tolkien-s-the-lord-of-the-rings-vol-i": {"title": "J.R.R. Tolkien's The Lord of the Rings Vol. I", "url": "https://archive.org/details/lord-of-the-rings-volume-1-mr-abandonware"}, "burnout-2-point-of-impact": {"title": "Burnout 2 - Point of Impact", "url": "https://drive.google.com/drive/folders/1Mmmn8SDJpXTMhsulMMcmPwlNwZXOlDGc"}, "burnout-3-takedown": {"title": "Burnout 3 - Takedown", "url": "https://drive.google.com/drive/folders/1WJqEH3WGSPDOp3MaHPs99iTb03OjU5X-"}, "innocent-until-caught-2-presumed-guilty": {"title": "Innocent Until Caught 2: Presumed Guilty", "url": "https://archive.org/details/innocent-until-caught-2-presumed-guilty-mr-abandonware"}, "innocent-until-caught": {"title": "Innocent Until Caught", "url": "https://archive.org/details/innocent-until-caught-mr-abandonware"}, "indycar-racing-ii": {"title": "IndyCar Racing II", "url": "https://archive.org/details/indycar-racing-2-mr-abandonware"}, "indycar-racing-complete": {"title": "IndyCar Racing - Complete", "url": "https://archive.org/details/indy-car-racing-mr-abandonware"}, "inca-ii-nations-of-immortality": {"title": "Inca II: Nations of Immortality", "url": "https://archive.org/details/inca-2-mr-abandonware"}, "inca": {"title": "Inca", "url": "https://archive.org/details/inca-mr-abandonware"}, "hopkins-fbi": {"title": "Hopkins FBI", "url": "https://archive.org/details/hopkins-fbi-mr-abandonware"}, "ghosts": {"title": "Ghosts", "url": "https://archive.org/details/ghosts-1-mr-abandonware"}, "geisha": {"title": "Geisha", "url": "https://archive.org/details/geisha-mr-abandonware"}, "future-wars-adventures-in-time": {"title": "Future Wars: Adventures In Time", "url": "https://archive.org/details/future-wars-mr-abandonware"}, "fascination": {"title": "Fascination", "url": "https://archive.org/details/fascination-mr-abandonware"}, "fade-to-black": {"title": "Fade To Black", "url": "https://archive.org/details/fade-to-black-mr-abandonware"}, "fable": {"title": "Fable", "url": "https://archive.org/details/fable-mr-abandonware"}, "athens-2004": {"title": "Athens 2004", "url": "https://archive.org/details/athens-2004-repack"}, "ecstatica-ii": {"title": "Ecstatica II", "url": "https://archive.org/details/ecstatica-ii-mr-abandonware"}, "ecstatica": {"title": "Ecstatica", "url": "https://archive.org/details/ecstatica-mr-abandonware"}, "dungeon-master-ii-the-legend-of-skullkeep": {"title": "Dungeon Master II: The Legend of Skullkeep", "url": "https://archive.org/details/dungeon-master-ii-mr-abandonware"}, "dungeon-master": {"title": "Dungeon Master", "url": "https://archive.org/details/dungeon-master-mr-abandonware"}, "dune-ii-the-battle-for-arrakis": {"title": "Dune II: The Battle for Arrakis", "url": "https://archive.org/details/dune-2-mr-abandonware"}, "dune-2000": {"title": "Dune 2000", "url": "https://archive.org/details/dune-2000-mr-abandonware"}, "dune": {"title": "Dune", "url": "https://archive.org/details/dune-mr-abandonware"}, "druid-daemons-of-the-mind": {"title": "Druid: Daemons Of The Mind", "url": "https://archive.org/details/druid-daemons-of-the-mind-mr-abandonware"}, "discworld-ii-missing-presumed": {"title": "Discworld II: Missing Presumed!?", "url": "https://archive.org/details/discworld-2-mr-abandonware"}, "discworld": {"title": "Discworld", "url": "https://archive.org/details/discworld-mr-abandonware"}, "destruction-derby": {"title": "Destruction Derby", "url": "https://archive.org/details/destruction-derby-mr-abandonware"}, "desert-strike-return-to-the-gulf": {"title": "Desert Strike: Return to the Gulf", "url": "https://archive.org/details/desert-strike-mr-abandonware"}, "dark-seed-ii": {"title": "Dark Seed II", "url": "https://archive.org/details/dark-seed-ii-mr-abandonware"}, "dark-seed": {"title": "Dark Seed", "url": "https://archive.org/details/dark-seed-mr-abandonware"}, "conan-the-cimmerian": {"title": "Conan: The Cimmerian", "url": "https://archive.org/details/conan-the-cimmerian-mr-abandonware"}, "circuit-s-edge": {"title": "Circuit's Edge", "url": "https://archive.org/details/circuits-edge-mr-abandonware"}, "chuck-yeager-s-air-combat": {"title": "Chuck Yeager's Air Combat", "url": "https://archive.org/details/chuck-yeagers-air-combat-mr-abandonware"}, "buck-rogers-matrix-cubed": {"title": "Buck Rogers: Matrix Cubed", "url": "https://archive.org/details/buck-rogers-matrix-cubed-mr-abandonware"}, "buck-rogers-countdown-to-doomsday": {"title": "Buck Rogers: Countdown To Doomsday", "url": "https://archive.org/details/buck-rogers-countdown-to-doomsday-mr-abandonware"}, "beavis-and-butt-head-in-virtual-stupidity": {"title": "Beavis And Butt Head In Virtual Stupidity", "url": "https://archive.org/details/beavis-and-butt-head-in-virtual-stupidity-mr-abandonware"}, "alien-virus": {"title": "Alien Virus", "url": "https://archive.org/details/alien-virus-mr-abandonware"}, "alien-logic": {"title": "Alien Logic", "url": "https://archive.org/details/alien-logic-mr-abandonware"}, "aces-over-europe": {"title": "Aces Over Europe", "url": "https://archive.org/details/aces-over-europe-mr-abandonware"}, "aces-of-the-pacific-complete": {"title": "Aces Of The Pacific - Complete", "url": "https://archive.org/details/aces-of-the-pacific-mr-abandonware"}, "aces-of-the-deep-complete": {"title": "Aces Of The Deep - Complete", "url": "https://archive.org/details/aces-of-the-deep-mr-abandonware"}, "a-10-tank-killer": {"title": "A-10 Tank Killer", "url": "https://archive.org/details/a-10-tank-killer-mr-abandonware"}, "warcraft-iii-complete-edition": {"title": "Warcraft III Complete Edition", "url": "https://archive.org/details/warcraft-iii-complete-edition-repack-v-3"}, "the-sims": {"title": "The Sims", "url": "https://archive.org/details/the-sims-complete-edition-repack-v-4"}, "the-lord-of-the-rings-the-battle-for-middle-earth": {"title": "The Lord Of The Rings The Battle For Middle Earth", "url": "https://archive.org/details/the-lord-of-the-rings-the-battle-for-middle-earth-repack"}, "the-house-of-the-dead": {"title": "The House Of The Dead", "url": "https://archive.org/details/the-house-of-the-dead-repack-v-3"}, "the-house-of-the-dead-3": {"title": "The House Of The Dead 3", "url": "https://archive.org/details/the-house-of-the-dead-3-repack"}, "the-house-of-the-dead-2": {"title": "The House Of The Dead 2", "url": "https://archive.org/details/the-house-of-the-dead-2-repack-v-3"}, "teenage-mutant-ninja-turtles-2-battle-nexus": {"title": "Teenage Mutant Ninja Turtles 2 Battle Nexus", "url": "https://archive.org/details/teenage-mutant-ninja-turtles-2-battle-nexus-repack"}, "sydney-2000": {"title": "Sydney 2000", "url": "https://archive.org/details/sydney-2000-repack"}, "starcraft": {"title": "StarCraft", "url": "https://archive.org/details/star-craft-repack"}, "spiderman-the-sinister-six": {"title": "Spiderman The Sinister Six", "url": "https://archive.org/details/spider-man-the-sinister-six-repack"}, "spiderman-2-activity-center": {"title": "Spiderman 2 Activity Center", "url": "https://archive.org/details/spider-man-2-activity-center-repack"}, "sega-worldwide-soccer": {"title": "SEGA Worldwide Soccer", "url": "https://archive.org/details/sega-worldwide-soccer-pc-repack"}, "reservoir-dogs": {"title": "Reservoir Dogs", "url": "https://archive.org/details/reservoir-dogs-repack"}, "re-volt": {"title": "Re-Volt", "url": "https://archive.org/details/re-volt-repack-v-2"}, "pac-man-all-stars": {"title": "Pac Man All Stars", "url": "https://archive.org/details/pac-man-all-stars-repack"}, "nba-live-2004": {"title": "NBA Live 2004", "url": "https://archive.org/details/nba-live-2004-repack"}, "microsoft-train-simulator": {"title": "Microsoft Train Simulator", "url": "https://archive.org/details/microsoft-train-simulator-repack"}, "microsoft-combat-flight-simulator-2-ww-ii": {"title": "Microsoft Combat Flight Simulator 2 WW II", "url": "https://archive.org/details/microsoft-combat-flight-simulator-2-ww-ii-pacific-theater-repack"}, "manx-tt-super-bike": {"title": "Manx TT Super Bike", "url": "https://archive.org/details/manx-tt-super-bike-repack"}, "age-of-mythology": {"title": "Age Of Mythology", "url": "https://archive.org/details/age-of-mythology-repack"}, "fear": {"title": "FEAR", "url": "https://archive.org/details/fear-repack"}, "dave-mirra-freestyle-bmx": {"title": "Dave Mirra Freestyle BMX", "url": "https://archive.org/details/dave-mirra-freestyle-bmx-repack"}, "cyber-troopers-virtual-on": {"title": "Cyber Troopers Virtual On", "url": "https://archive.org/details/cyber-troopers-virtual-on-repack"}, "crazy-taxi": {"title": "Crazy Taxi", "url": "https://archive.org/details/crazy-taxi-repack-v-3"}, "colin-mcrae-rally-04": {"title": "Colin McRae Rally 04", "url": "https://archive.org/details/colin-mc-rae-rally-04-repack"}, "blazing-angels-2-secret-missions-of-wwii": {"title": "Blazing Angels 2 - Secret Missions Of WWII", "url": "https://archive.org/details/blazing-angels-2-secret-missions-of-wwii-repack"}, "beetle-crazy-cup": {"title": "Beetle Crazy Cup", "url": "https://archive.org/details/beetle-crazy-cup-repack"}, "atlanta-1996": {"title": "Atlanta 1996", "url": "https://archive.org/details/atlanta-1996-repack"}, "secret-of-mana-reborn": {"title": "Secret of Mana: Reborn", "url": "https://romhack.ing/database/content/entry/YtNv5JQBNs8FWu0C14As/secret-of-mana-english-translation"}, "the-third-of-the-third-street-fighter-iii-3rd-strike-decompilation": {"title": "The Third of the Third - Street Fighter III: 3rd Strike Decompilation", "url": "https://github.com/crowded-street/3sx"}, "dragon-ball-z-budokai-hd-recompiled": {"title": "Dragon Ball Z Budokai HD Recompiled", "url": "https://github.com/WistfulHopes/DBZ1"}, "blue-dragon-recompilation": {"title": "Blue Dragon Recompilation", "url": "https://github.com/rexglue/reblue"}, "pyrite64-n64-game-engine-and-editor-using-libdragon-and-tiny3d": {"title": "Pyrite64 - N64 Game-Engine and Editor using libdragon & tiny3d", "url": "https://github.com/HailToDodongo/pyrite64"}, "streets-of-rage-2-andore-s-rampage": {"title": "Streets of Rage 2: Andore’s Rampage", "url": "https://romhackplaza.org/romhacks/streets-of-rage-2-andores-rampage-genesis/"}, "monster-hunter-portable-3rd-psp": {"title": "Monster Hunter Portable 3rd - PSP", "url": "https://www.youtube.com/watch?v=ucsGdmTjS2M"}, "what-a-mario-world": {"title": "What A Mario World!", "url": "https://ralshi.itch.io/what-a-mario-world"}, "aurora-os-js": {"title": "Aurora OS.js", "url": "https://github.com/mental-os/Aurora-OS.js"}, "fallout-vault-666": {"title": "Fallout: Vault 666", "url": "https://www.moddb.com/mods/fallout-vault-666/downloads/fallout-vault-666"}, "ikemen": {"title": "IKEMEN", "url": "https://drive.google.com/file/d/1vkpnS3YYhGw5A1ul4kxQtEmlkjEVhhDT/view"}, "pasta-la-vista-super-mario-bros": {"title": "Pasta La Vista Super Mario Bros.", "url": "https://www.smwcentral.net/?p=viewthread&t=131870&page=1&pid=1661675"}, "embers-of-mana": {"title": "Embers of Mana", "url": "https://www.romhacking.net/hacks/9447/"}, "star-wars-jedi-survivor-camera-and-animation-stutter-fix": {"title": "Star Wars Jedi: Survivor - Camera and Animation Stutter Fix", "url": "https://community.pcgamingwiki.com/files/file/3924-star-wars-jedi-survivor-camera-and-animation-stutter-fix/"}, "usurper-reborn": {"title": "Usurper Reborn", "url": "https://github.com/binary-knight/usurper-reborn"}, "valkyria-chronicles-3-psp": {"title": "Valkyria Chronicles 3 - PSP", "url": "https://www.youtube.com/watch?v=Q959IdFo6_g"}, "ninja-gaiden-ii-recompilation": {"title": "Ninja Gaiden II Recompilation", "url": "https://youtu.be/iEXDW2_4ffw?si=9zKyApbJwq75U0R1"}, "the-wind-waker-rewritten": {"title": "The Wind Waker Rewritten", "url": "https://www.romhacking.net/hacks/7002/"}, "pokemon-crossroads": {"title": "Pokemon Crossroads", "url": "https://github.com/eonlynx/pokecrossroads"}, "tetrominos": {"title": "Tetrominos", "url": "https://github.com/giraffekey/tetermino"}, "prize-fighter-heavyweight-edition": {"title": "Prize Fighter Heavyweight Edition", "url": "https://archive.org/details/prize-fighter-heavyweight-edition-saturn"}, "metal-gear-solid-v-the-phantom-pain-ground-zeroes": {"title": "Metal Gear Solid V: The Phantom Pain - Ground Zeroes", "url": "https://www.nexusmods.com/metalgearsolidvtpp/mods/2402"}, "the-tairyou-jigoku-ps2": {"title": "The Tairyou Jigoku - PS2", "url": "https://romhack.ing/database/content/entry/sHfHRZI6QEKlylE337Gnng/the-tairyou-jigoku-english-translation"}, "keitai-world-launcher": {"title": "Keitai World Launcher", "url": "https://keitaiarchive.org/"}, "duke-nukem-zero-hour-recompilation-first-person-mod": {"title": "Duke Nukem Zero Hour Recompilation First Person Mod", "url": "https://dnzh-fps.netlify.app/"}, "fallout-new-vegas-for-a-few-brahmin-more": {"title": "Fallout New Vegas - For A Few Brahmin More", "url": "https://www.nexusmods.com/newvegas/mods/96464"}, "bloodborne-hardborne-overhaul-mod": {"title": "Bloodborne - HardBorne Overhaul Mod", "url": "https://www.nexusmods.com/bloodborne/mods/462?tab=description"}, "cyberpunk-2077-unofficial-dlc-2": {"title": "Cyberpunk 2077 Unofficial DLC 2", "url": "https://www.nexusmods.com/cyberpunk2077/mods/22745"}, "castlevania-order-of-shadows-golden-belmont": {"title": "Castlevania Order of Shadows Golden Belmont", "url": "https://elvies.itch.io/castlevania-order-of-shadows-gbc"}, "nx-optimizer": {"title": "NX-Optimizer", "url": "https://www.nxoptimizer.com/"}, "forza-motorsport-2": {"title": "Forza Motorsport 2", "url": "https://1fichier.com/?1dhd3mekh0837olx6yot"}, "forza-motorsport-3": {"title": "Forza Motorsport 3", "url": "https://1fichier.com/?1viocrz3hdst8ly3owns"}, "forza-motorsport-4": {"title": "Forza Motorsport 4", "url": "https://1fichier.com/?q5vvq6l5hs1pg82acj3g"}, "forza-horizon": {"title": "Forza Horizon", "url": "https://1fichier.com/?hr37ifchtddf8khxdbsx"}, "forza-horizon-2": {"title": "Forza Horizon 2", "url": "https://1fichier.com/?9o8go8y8d0tv9vbibal3"}, "forza-horizon-2-presents-fast-and-furious": {"title": "Forza Horizon 2 Presents Fast And Furious", "url": "https://1fichier.com/?8w5n2wg4h902r260o6ek"}, "forza-horizon-3": {"title": "Forza Horizon 3", "url": "https://1fichier.com/?mzlp40gh9oyna4h4dvd3"}, "forza-motorsport-7": {"title": "Forza Motorsport 7", "url": "https://1fichier.com/?g4qsvikj1n17hicmob9g"}, "readym": {"title": "ReadyM", "url": "https://www.ready.mp/"}, "a-super-mario-world": {"title": "A Super Mario World", "url": "https://www.smwcentral.net/?p=viewthread&t=131734"}, "legend-of-mana-decompilation": {"title": "Legend of Mana Decompilation", "url": "https://github.com/celophi/lom-decomp"}, "silent-hill-3-decompilation": {"title": "Silent Hill 3 Decompilation", "url": "https://github.com/dreamingmoths/memory-of-alessa"}, "chrono-cross-decompilation": {"title": "Chrono Cross Decompilation", "url": "https://github.com/jdperos/chrono-cross-decomp"}, "crash-tag-team-racing-gamecube-decompilation": {"title": "Crash Tag Team Racing Gamecube Decompilation", "url": "https://github.com/bluisblu/cttr"}, "kirby-s-dream-collection-decompilation": {"title": "Kirby's Dream Collection Decompilation", "url": "https://github.com/Swiftshine/kdc"}, "dog-s-life-decompilation": {"title": "Dog's Life Decompilation", "url": "https://github.com/IWILLCRAFT-M0d/dogcomp"}, "halo-reach-decompilation": {"title": "Halo Reach Decompilation", "url": "https://github.com/ChimpsAtSea/Reach"}, "pokemon-xd-gale-of-darkness-decompilation": {"title": "Pokemon XD: Gale of Darkness Decompilation", "url": "https://github.com/TeamOrre/xd-decomp"}, "the-legend-of-zelda-ocarina-of-time-dreamcast-port": {"title": "The Legend of Zelda: Ocarina Of Time Dreamcast Port", "url": "https://youtu.be/j2JTcDY9LI4?si=DJCiIOeU5CAbjZ4w"}, "resident-evil-requiem-xenomorph-mod": {"title": "Resident Evil Requiem - Xenomorph Mod", "url": "https://www.nexusmods.com/residentevilrequiem/mods/510?tab=description"}, "star-wars-first-assault": {"title": "Star Wars: First Assault", "url": "https://discord.com/invite/XqQ6Je4muy"}, "celeste-classic-sega-saturn-port": {"title": "Celeste Classic Sega Saturn Port", "url": "https://en83.itch.io/celeste-classic-for-sega-saturn"}, "rise-of-the-tomb-raider-hd-4k-8k-texture-collection": {"title": "Rise Of The Tomb Raider HD 4K 8K Texture Collection", "url": "https://www.nexusmods.com/riseofthetombraider/mods/214?tab=description"}, "perfect-dark-pc-port-friends-of-joanna-4-player-counter-co-operative-mod": {"title": "Perfect Dark PC Port - Friends of Joanna 4-Player Counter + Co-Operative Mod", "url": "https://cylonicboom.itch.io/friends-of-joanna"}, "pokemon-aether-white-2": {"title": "Pokemon Aether White 2", "url": "https://youtu.be/SEDNNMH2DSk?si=IZFkSKdYzYMq0YhK"}, "bugdom": {"title": "Bugdom", "url": "https://github.com/jorio/Bugdom?tab=readme-ov-file"}, "bugdom-2": {"title": "Bugdom 2", "url": "https://github.com/jorio/Bugdom2"}, "billy-frontier": {"title": "Billy Frontier", "url": "https://github.com/jorio/BillyFrontier"}, "mighty-mike-power-pete": {"title": "Mighty Mike - Power Pete", "url": "https://github.com/jorio/MightyMike"}, "nanosaur": {"title": "Nanosaur", "url": "https://github.com/jorio/Nanosaur"}, "nanosaur-2": {"title": "Nanosaur 2", "url": "https://github.com/jorio/Nanosaur2"}, "otto-matic": {"title": "Otto Matic", "url": "https://github.com/jorio/OttoMatic"}, "dungeon-keeper-in-browser": {"title": "Dungeon Keeper in Browser", "url": "https://dk-browser.tiiny.site/?utm_source=chatgpt.com"}, "multiplayer-mods-mega-list": {"title": "Multiplayer Mods Mega List", "url": "https://docs.google.com/spreadsheets/d/e/2PACX-1vSV41AswEt3EpzSyd85YRVtoJaIIXWjtBy347dISJg4fs6xSNPqcgfsh76TxX_l-mnT7pjMlSqTW-87/pubhtml"}, "breath-of-fire-definitive-edition": {"title": "Breath of Fire Definitive Edition", "url": "https://www.romhacking.net/hacks/7597/"}, "breath-of-fire-ii-definitive-edition": {"title": "Breath of Fire II Definitive Edition", "url": "https://www.romhacking.net/hacks/9157/"}, "starfield-stfi-hd-landscape-4k": {"title": "Starfield STFI HD Landscape 4K", "url": "https://www.nexusmods.com/starfield/mods/16155?tab=description"}, "fallout-4-padre-mateo-a-quest-mod": {"title": "Fallout 4 Padre Mateo - A Quest Mod", "url": "https://www.nexusmods.com/fallout4/mods/101772?tab=description"}, "resident-evil-village-high-textures-mod": {"title": "Resident Evil Village - High Textures Mod", "url": "https://www.nexusmods.com/residentevilvillage/mods/643?tab=description"}, "the-witcher-3-kaer-morhen-extended-edition": {"title": "The Witcher 3 Kaer Morhen Extended Edition", "url": "https://www.nexusmods.com/witcher3/mods/11934"}, "zombie-panic": {"title": "Zombie Panic!", "url": "https://store.steampowered.com/app/3825360/Zombie_Panic/"}, "lupin-iii-the-sage-of-pyramid-sega-saturn": {"title": "Lupin III: The Sage of Pyramid - Sega Saturn", "url": "https://romhack.ing/database/content/entry/XJ5SNtjQSvK5-CLf2YUFeg/lupin-iii-the-sage-of-pyramid-english-translation"}, "bubble-buddies": {"title": "Bubble Buddies", "url": "https://geon3.itch.io/buddies"}, "animal-crossing-pc-port": {"title": "Animal Crossing PC Port", "url": "https://github.com/flyngmt/ACGC-PC-Port"}, "red-dead-redemption-2-blurbs-pokemon-rpg": {"title": "Red Dead Redemption 2 - Blurbs Pokemon RPG", "url": "https://www.nexusmods.com/reddeadredemption2/mods/8332"}, "paprium-online-multiplayer": {"title": "Paprium - Online Multiplayer", "url": "https://youtu.be/b4pVjv1u8Hk?si=8rvPGGjV_NCF1J44"}, "minecraft-arnis": {"title": "Minecraft - Arnis", "url": "https://arnismc.com/"}, "baldur-s-gate-3-baldur-s-gate-1-remake-demo": {"title": "Baldur's Gate 3 - Baldur's Gate 1 Remake Demo", "url": "https://www.nexusmods.com/baldursgate3/mods/18315"}, "animal-crossing-pc-port-hd-texture-pack": {"title": "Animal Crossing PC Port HD Texture Pack", "url": "https://gamebanana.com/mods/download/406291#FileInfo_875424"}, "resident-evil-requiem-vr-mod": {"title": "Resident Evil Requiem VR Mod", "url": "https://www.nexusmods.com/residentevilrequiem/mods/1017"}, "deckops": {"title": "DeckOps", "url": "https://github.com/GalvarinoDev/DeckOps"}, "oblivion-remastered-citylord-series-the-fight-club": {"title": "Oblivion Remastered CityLord Series The Fight Club", "url": "https://www.nexusmods.com/oblivionremastered/mods/5330"}, "oblivion-remastered-battlehorn-castle-expansion": {"title": "Oblivion Remastered Battlehorn Castle Expansion", "url": "https://www.nexusmods.com/oblivionremastered/mods/5347"}, "klonoa-empire-of-dreams-decompilation": {"title": "Klonoa: Empire of Dreams Decompilation", "url": "https://github.com/Dream-Atelier/kl-eod-decomp"}, "black-and-white-decompilation": {"title": "Black & White Decompilation", "url": "https://github.com/openblack/bw1-decomp"}, "monster-hunter-portable-2nd-g-decompilation": {"title": "Monster Hunter Portable 2nd G Decompilation", "url": "https://github.com/tclamb/mhp2g-decomp"}, "new-play-control-pikmin-decompilation": {"title": "New Play Control! Pikmin Decompilation", "url": "https://github.com/projectPiki/pik1wii"}, "new-play-control-pikmin-2-decompilation": {"title": "New Play Control! Pikmin 2 Decompilation", "url": "https://github.com/projectPiki/pik2wii"}, "tetris-browser-based": {"title": "Tetris Browser Based", "url": "https://mehmetmhy.github.io/tetris/"}, "crimson-desert-ahk-hotkeys-for-jogging-sprint-and-esc-menus": {"title": "Crimson Desert AHK Hotkeys for Jogging Sprint and Esc Menus", "url": "https://www.nexusmods.com/crimsondesert/mods/47"}, "bomberman-64-recompilation": {"title": "Bomberman 64 Recompilation", "url": "https://github.com/RevoSucks/BM64Recomp"}, "mhserveremu-marvel-heroes-mmo-fan-server": {"title": "MHServerEmu - Marvel Heroes MMO Fan Server", "url": "https://crypto137.github.io/MHServerEmu/blog/2026/03/20/mhserveremu-1-0-0.html"}, "heretic-ii-source-port": {"title": "Heretic II Source Port", "url": "https://github.com/m-x-d/Heretic2R"}, "re-enhance": {"title": "RE:Enhance", "url": "https://www.moddb.com/mods/reenhance-re1/news/reenhance-re1-version-20-is-out"}, "batman-arkham-origins-advanced-graphics": {"title": "Batman Arkham Origins Advanced Graphics", "url": "https://www.nexusmods.com/batmanarkhamorigins/mods/451?tab=description"}, "fire-emblem-path-of-radiance-decompilation": {"title": "Fire Emblem: Path of Radiance Decompilation", "url": "https://github.com/FE8Dev/FE9-Decomp-Project"}, "alone-in-the-dark-decompilation": {"title": "Alone In The Dark Decompilation", "url": "https://github.com/spacefarergames/AloneInTheDarkReHaunted"}, "sheep-wolf-n-dog-decompilation": {"title": "Sheep Wolf N Dog Decompilation", "url": "https://github.com/lace22l/sheep-wolf-n-dog-decomp"}, "the-legend-of-zelda-the-wind-waker-4k-texture-pack": {"title": "The Legend of Zelda: The Wind Waker 4K Texture Pack", "url": "https://www.henrikomagnifico.com/wind-waker-4k"}, "friday-the-13th-revisited": {"title": "Friday the 13th Revisited", "url": "https://zeichigames.itch.io/friday-the-13th-revisited-for-gbc"}, "blaze-and-blade-busters-playstation": {"title": "Blaze and Blade Busters - Playstation", "url": "https://romhack.ing/database/content/entry/CqaRmZaFQNS1JX1zpGFNSQ/blaze-and-blade-busters-english-translation"}, "digimon-world-decompilation": {"title": "Digimon World Decompilation", "url": "https://github.com/jype0/dw_decomp"}, "the-legend-of-zelda-spirit-tracks-decompilation": {"title": "The Legend of Zelda: Spirit Tracks Decompilation", "url": "https://github.com/zeldaret/st"}, "lego-city-undercover-decompilation": {"title": "Lego City Undercover Decompilation", "url": "https://github.com/Nintendocustom/Lego-City-Undercover-Decompilation"}, "mortal-kombat-2-3do-port": {"title": "Mortal Kombat 2 3DO Port", "url": "https://youtu.be/ciFdfj3D_NA?si=t3tWaHm_CB9mQGzY"}, "fallout-new-vegas-the-unforgiven-redux": {"title": "Fallout New Vegas - The Unforgiven REDUX", "url": "https://www.nexusmods.com/newvegas/mods/97105"}, "40-winks-gameboy-colour": {"title": "40 Winks Gameboy Colour", "url": "https://archive.org/details/40-winks-game-boy-color"}, "teknoparrot": {"title": "TeknoParrot", "url": "https://teknoparrot.com/wiki/index.html"}, "monster-hunter-stories-3-twisted-reflection-hd-texture-pack": {"title": "Monster Hunter Stories 3 Twisted Reflection HD Texture Pack", "url": "https://www.nexusmods.com/monsterhunterstories3twistedreflection/mods/131?tab=description"}, "pilotwings-64-decompilation": {"title": "Pilotwings 64 Decompilation", "url": "https://github.com/gcsmith/Pilotwings64Decomp"}, "rexglue-xbox-360-recompilation-runtime-and-toolkit": {"title": "RexGlue - Xbox 360 Recompilation Runtime and Toolkit", "url": "https://github.com/rexglue/rexglue-sdk?ref=readonlymemo.com"}, "banjo-kazooie-nuts-and-bolts-recompilation": {"title": "Banjo-Kazooie Nuts and Bolts Recompilation", "url": "https://github.com/masterspike52/reNut?ref=readonlymemo.com"}, "ninja-gaiden-2-recompilation": {"title": "Ninja Gaiden 2 Recompilation", "url": "https://github.com/Mystixor?tab=overview&from=2026-03-01&to=2026-03-31"}, "halo-3-delta-recompilation": {"title": "Halo 3 Delta Recompilation", "url": "https://github.com/twist84/halo3_cache_release_recomp/?ref=readonlymemo.com"}, "viva-pinata-trouble-in-paradise-recompilation": {"title": "Viva Pinata: Trouble In Paradise Recompilation", "url": "https://github.com/SolarCookies/TiP-Recomp?ref=readonlymemo.com"}, "fallout-new-vegas-retribution-redux": {"title": "Fallout New Vegas - Retribution REDUX", "url": "https://www.nexusmods.com/newvegas/mods/97155"}, "pekka-kana-2": {"title": "Pekka Kana 2", "url": "https://danilolc.itch.io/pekka-kana-2"}, "tecnoballz": {"title": "TecnoballZ", "url": "https://linux.tlk.fr/games/TecnoballZ/"}, "h-craft-championship": {"title": "H-Craft Championship", "url": "http://www.irrgheist.com/games.htm"}, "hero-of-allacrost": {"title": "Hero of Allacrost", "url": "https://sourceforge.net/projects/allacrost/"}, "valyria-tear": {"title": "Valyria Tear", "url": "https://github.com/ValyriaTear"}, "tenmado": {"title": "tenmado", "url": "https://github.com/gondur/tenmado"}, "hurrican": {"title": "Hurrican", "url": "https://github.com/HurricanGame/Hurrican"}, "the-secret-chronicles-of-dr-m": {"title": "The Secret Chronicles of Dr. M.", "url": "https://secretchronicles.org/en/"}, "gravity-bone": {"title": "Gravity Bone", "url": "https://blendogames.itch.io/gravitybone"}, "enigma": {"title": "Enigma", "url": "https://github.com/enigma-game/enigma"}, "starflight-the-lost-colony": {"title": "Starflight - The Lost Colony", "url": "https://sites.google.com/site/starflighttlc/downloads"}, "pocket-palm-heroes": {"title": "Pocket Palm Heroes", "url": "https://github.com/SerVB/pph"}, "transball-gl": {"title": "Transball GL", "url": "https://github.com/santiontanon/transballgl"}, "einstein-puzzle": {"title": "Einstein Puzzle", "url": "https://github.com/lksj/einstein-puzzle"}, "surge-the-rabbit": {"title": "Surge the Rabbit", "url": "https://gamejolt.com/games/surge-the-rabbit/747310"}, "q3rally": {"title": "Q3Rally", "url": "https://www.q3rally.com/"}, "open-hexagon": {"title": "Open Hexagon", "url": "https://github.com/vittorioromeo/SSVOpenHexagon"}, "double-damnation": {"title": "Double Damnation", "url": "https://ddamnation.com/"}, "solaris": {"title": "Solaris", "url": "https://solaris.games/#/"}, "naikari": {"title": "Naikari", "url": "https://naikari.github.io/"}, "opensoldat": {"title": "OpenSoldat", "url": "https://github.com/opensoldat/opensoldat"}, "the-powder-toy": {"title": "The Powder Toy", "url": "https://powdertoy.co.uk/"}, "opendungeonsplus": {"title": "OpenDungeonsPlus", "url": "https://opendungeons.org/"}, "shapez": {"title": "shapez", "url": "https://github.com/tobspr-games/shapez.io"}, "super-mario-bros-sega-master-system-port": {"title": "Super Mario Bros. Sega Master System Port", "url": "https://www.smspower.org/Homebrew/SuperMarioBrosSmsPort-SMS"}, "street-fighter-iii-3rd-strike-psp-port": {"title": "Street Fighter III: 3rd Strike PSP Port", "url": "https://github.com/demmis98/3s-psp"}, "adventure-on-eos": {"title": "Adventure on Eos", "url": "https://blackdemeter.com/adventure-on-eos"}, "worms-armageddon-open-source-re-implementation": {"title": "Worms Armageddon Open Source Re-implementation", "url": "https://github.com/paavohuhtala/OpenWA"}, "yorg": {"title": "Yorg", "url": "https://github.com/cflavio/yorg"}, "scorched3d": {"title": "Scorched3D", "url": "http://www.scorched3d.co.uk/"}, "vega-strike": {"title": "Vega Strike", "url": "https://www.vega-strike.org/"}, "liberation-circuit": {"title": "Liberation Circuit", "url": "https://linleyh.itch.io/liberation-circuit"}, "deer-portal": {"title": "Deer Portal", "url": "https://devcarpet.itch.io/deer-portal"}, "dust-racing-2d": {"title": "Dust Racing 2D", "url": "https://github.com/juzzlin/DustRacing2D"}, "steam-sky": {"title": "Steam Sky", "url": "https://thindil.itch.io/steam-sky"}, "astromenace": {"title": "AstroMenace", "url": "https://viewizard.com/"}, "world-of-padman": {"title": "World of PADMAN", "url": "https://worldofpadman.net/en/"}, "cave-story-sega-megadrive-port": {"title": "Cave Story Sega Megadrive Port", "url": "https://github.com/andwn/cave-story-md"}, "ridge-racer-collection-with-online-play": {"title": "Ridge Racer Collection with Online Play", "url": "https://youtu.be/eNtb8myubnI?si=iKcoY4kzkVWN64CK"}, "silent-hill-2-decompilation": {"title": "Silent Hill 2 Decompilation", "url": "https://decomp.dev/dreamingmoths/mirror-of-alessa"}, "seen-in-liberty-city-gta-3-psp-remake": {"title": "Seen in Liberty City - GTA 3 PSP Remake", "url": "https://barcode-studia.ru/mods/silc/"}, "starfield-neonexpansion": {"title": "Starfield - NeonExpansion", "url": "https://www.nexusmods.com/starfield/mods/16354"}, "advanced-strategic-command": {"title": "Advanced Strategic Command", "url": "https://www.asc-hq.org/"}, "caveexpress": {"title": "CaveExpress", "url": "https://github.com/mgerhardy/caveexpress"}, "wyrmsun": {"title": "Wyrmsun", "url": "https://andrettin.github.io/"}, "shadow-over-the-twelve-lands": {"title": "Shadow Over the Twelve Lands", "url": "https://btco.itch.io/shadow-over-the-twelve-lands"}, "bos-wars": {"title": "Bos Wars", "url": "https://www.boswars.org/"}, "retux": {"title": "reTux", "url": "https://retux-game.github.io/"}, "maelstrom": {"title": "Maelstrom", "url": "https://github.com/libsdl-org/Maelstrom?tab=readme-ov-file"}, "sdl-scavenger": {"title": "SDL Scavenger", "url": "https://www.macintoshrepository.org/77329-sdl-scavenger"}, "sdl-asylum": {"title": "SDL Asylum", "url": "https://sdl-asylum.sourceforge.net/main.html"}, "noctis-iv-plus": {"title": "Noctis IV Plus", "url": "https://github.com/jorisvddonk/Noctis-IV-Plus"}, "tony-hawk-s-underground": {"title": "Tony Hawk's Underground", "url": "https://archive.org/details/tony-hawks-underground"}, "onifoxed": {"title": "OniFoxed", "url": "https://github.com/hogsy/OniFoxed"}, "magical-broom-extreme": {"title": "Magical Broom Extreme", "url": "https://github.com/M-HT/MagicalBroomExtreme"}, "hoverrace": {"title": "HoverRace", "url": "https://github.com/HoverRace/HoverRace?tab=readme-ov-file"}, "roadfighter": {"title": "RoadFighter", "url": "https://github.com/codehard123/RoadFighter"}, "f1-spirit": {"title": "F1-Spirit", "url": "https://github.com/ptitSeb/f1spirit"}, "super-methane-brothers": {"title": "Super Methane Brothers", "url": "https://github.com/rombust/Methane"}, "gardens-of-kadesh": {"title": "Gardens of Kadesh", "url": "https://github.com/GardensOfKadesh/Homeworld"}, "skyrim-special-edition-new-dawn-redux-modlist": {"title": "Skyrim Special Edition - NEW DAWN Redux Modlist", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/176693?tab=description"}, "fallout-new-vegas-decompilation": {"title": "Fallout: New Vegas Decompilation", "url": "https://github.com/ieee802dot11ac/fnv"}, "opennotrium": {"title": "OpenNotrium", "url": "https://github.com/verhoevenv/OpenNotrium"}, "elite-reinforce": {"title": "Elite-Reinforce", "url": "https://github.com/kugelrund/Elite-Reinforce"}, "seven-kingdoms-ancient-adversaries": {"title": "Seven Kingdoms: Ancient Adversaries", "url": "https://7kfans.com/"}, "rigelengine-re-implementation-duke-nukem-ii": {"title": "RigelEngine - Re-implementation Duke Nukem II", "url": "https://github.com/lethal-guitar/RigelEngine"}, "open-iw": {"title": "Open-IW", "url": "https://github.com/TambourineReindeer/open-iw"}, "freesynd-re-implementation-of-syndicate": {"title": "FreeSynd - Re-implementation of Syndicate", "url": "https://freesynd.sourceforge.io/dl.php"}, "jftekwar-tekwar-port": {"title": "jftekwar - TekWar Port", "url": "https://github.com/jonof/jftekwar"}, "commander-genius": {"title": "Commander Genius", "url": "https://github.com/gerstrong/Commander-Genius"}, "dethrace-labs": {"title": "Dethrace Labs", "url": "https://github.com/dethrace-labs/dethrace"}, "bioshock-the-war-in-rapture": {"title": "Bioshock - The War In Rapture", "url": "https://www.nexusmods.com/bioshock/mods/143?tab=description"}, "skyrim-special-edition-through-fire-and-war-a-morrowind-inspired-quest": {"title": "Skyrim Special Edition - Through Fire and War - A Morrowind Inspired Quest", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/176402"}, "terminal-breeder": {"title": "Terminal Breeder", "url": "https://github.com/amit221/compi"}, "tomb-raider-n64-port": {"title": "Tomb Raider N64 Port", "url": "https://youtu.be/SLqWCiGk1rs?si=2RgrAJ9aWYtcT2M-"}, "the-legend-of-zelda-majora-s-mask-ps-vita-port": {"title": "The Legend of Zelda: Majora's Mask PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1384"}, "devil-may-cry-4-refrain-vita": {"title": "Devil May Cry 4 Refrain Vita", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1377"}, "the-legend-of-zelda-ocarina-of-time-ps-vita-port": {"title": "The Legend of Zelda: Ocarina of Time PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1276"}, "animal-crossing-ps-vita-port": {"title": "Animal Crossing PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1381"}, "baldur-s-gate-dark-alliance-ps-vita-port": {"title": "Baldur's Gate: Dark Alliance PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1357"}, "unreal-ps-vita-port": {"title": "Unreal PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1242"}, "arx-libertatis-ps-vita-port": {"title": "Arx Libertatis PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1367"}, "super-mario-all-stars-ps-vita-port": {"title": "Super Mario All-Stars PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1280"}, "super-mario-world-ps-vita-port": {"title": "Super Mario World PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1215"}, "perfect-dark-ps-vita-port": {"title": "Perfect Dark PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1273"}, "the-legend-of-zelda-a-link-to-the-past-ps-vita-port": {"title": "The Legend of Zelda: A Link to The Past PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/993"}, "portforge-a-de-recompilation-port-manager": {"title": "PortForge - A De-Recompilation Port Manager", "url": "https://github.com/portforge/portforge-app"}, "final-fantasy-viii-decompilation": {"title": "Final Fantasy VIII Decompilation", "url": "https://github.com/roengstrom/ff8-decomp"}, "1080-snowboarding-decompilation": {"title": "1080 Snowboarding Decompilation", "url": "https://github.com/bigyoshi51/1080-decomp"}, "pokemon-ranger-shadows-of-almia-decompilation": {"title": "Pokemon Ranger: Shadows of Almia Decompilation", "url": "https://github.com/Kuruyia/pokeranger2"}, "tiny-dec-educational-decompiler-that-helps-people-understand-how-decompilation-works": {"title": "Tiny Dec - Educational decompiler that helps people understand how decompilation works", "url": "https://github.com/ZhangZhuoSJTU/tiny-dec"}, "ghostship-mario-64-ps-vita-port": {"title": "Ghostship - Mario 64 PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1387"}, "starship-starfox-64-ps-vita-port": {"title": "Starship - Starfox 64 PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1388"}, "star-warfare-alien-invasion-ps-vita-port": {"title": "Star Warfare: Alien Invasion PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1386"}, "mario-s-modules-2": {"title": "Mario's Modules 2", "url": "https://romhacking.com/hack/mario-s-modules-2"}, "mega-man-dxtreme": {"title": "Mega Man DXtreme", "url": "https://tomycase.itch.io/megaman-dxtreme"}, "openmw-morrowind-ps-vita-port": {"title": "OpenMW - Morrowind PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1390"}, "pokemon-light-platinum-ds": {"title": "Pokemon Light Platinum DS", "url": "https://pokehacking.com/fangames/light-platinum/"}, "tiny-bullets-playstation": {"title": "Tiny Bullets - Playstation", "url": "https://romhackplaza.org/translations/tiny-bullets-english-translation-playstation/"}, "battleship-smash-brothers-64-pc-port": {"title": "Battleship - Smash Brothers 64 PC Port", "url": "https://github.com/JRickey/BattleShip"}, "bomberman-hero-recompilation": {"title": "Bomberman Hero Recompilation", "url": "https://github.com/RevoSucks/BMHeroRecomp"}, "mario-kart-64-ps-vita-port": {"title": "Mario Kart 64 PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1393"}, "tomb-raider-side-scroller-edition": {"title": "Tomb Raider: Side-Scroller Edition", "url": "https://trcustoms.org/levels/3883"}, "the-legend-of-zelda-the-minish-cap-pc-port": {"title": "The Legend of Zelda: The Minish Cap PC Port", "url": "https://github.com/999sian/tmc"}, "librelancer": {"title": "Librelancer", "url": "https://librelancer.net/"}, "resident-evil-requiem-for-ravenholm": {"title": "Resident Evil - Requiem for Ravenholm", "url": "https://www.nexusmods.com/residentevilrequiem/mods/1976"}, "paper-mario-star-nova": {"title": "Paper Mario: Star Nova", "url": "https://nictuber.itch.io/paper-mario-star-nova"}, "parasite-eve-2-decompilation": {"title": "Parasite Eve 2 Decompilation", "url": "https://github.com/GabeRealB/parasite-eve-2-decomp"}, "warioware-inc-decompilation": {"title": "WarioWare Inc. Decompilation", "url": "https://github.com/ShaffySwitcher/wariowareinc"}, "animal-crossing-gamecube-web-port": {"title": "Animal Crossing Gamecube Web Port", "url": "https://turtlekiosk.github.io/slider/"}, "flare": {"title": "Flare", "url": "https://flarerpg.org/2026/05/03/flare-1-15/"}, "triggerheart-exelica-dreamcast": {"title": "Triggerheart Exelica - Dreamcast", "url": "https://github.com/DerekPascarella/TriggerheartExelica-EnglishPatchDreamcast"}, "dusklight-the-legend-of-zelda-twilight-princess-pc-port": {"title": "Dusklight - The Legend of Zelda Twilight Princess PC Port", "url": "https://twilitrealm.dev/"}, "paperboy-64-decompilation": {"title": "Paperboy 64 Decompilation", "url": "https://github.com/marijnvdwerf/paperboy-n64"}, "evos-space-adventures-decompilation": {"title": "Evos Space Adventures Decompilation", "url": "https://github.com/mkst/esa"}, "ultima-v-warriors-of-destiny-decompilation": {"title": "Ultima V Warriors of Destiny Decompilation", "url": "https://github.com/wonst719/u5d"}, "tokyo-bus-guide-decompilation": {"title": "Tokyo Bus Guide Decompilation", "url": "https://github.com/lhsazevedo/tbg-decomp"}, "armored-trooper-votoms-playstation-2": {"title": "Armored Trooper Votoms - Playstation 2", "url": "https://cdromance.org/ps2-iso/armored-trooper-votoms-english-patched/"}, "racing-battle-c1-grand-prix-playstation-2": {"title": "Racing Battle: C1 Grand Prix - Playstation 2", "url": "https://cdromance.org/ps2-iso/racing-battle-c1-grand-prix-japan/"}, "dusklight-the-legend-of-zelda-twilight-princess-pc-port-texture-pack-1": {"title": "Dusklight - The Legend of Zelda Twilight Princess PC Port Texture Pack 1", "url": "https://gamebanana.com/mods/676609"}, "pokemon-snap-3ds-port": {"title": "Pokemon Snap 3DS Port", "url": "https://www.pokecommunity.com/threads/unity-engine-3ds-pok%C3%A9mon-snap-3ds-new-nintendo-3ds-esp-eng-it-fr-pt-de-jap-beta-v0-3-1.542188/#post-10987188"}, "ace-driver-arcade-emulator-for-xbox-360": {"title": "Ace Driver - Arcade Emulator for Xbox 360", "url": "https://github.com/wanszai/Ace-Driver-Collection-X360-Releases"}, "castlevania-sega-master-system-port": {"title": "Castlevania - Sega Master System Port", "url": "https://youtu.be/OlHIwUhjvnM?si=OREN0jkPBm5OXQvC"}, "spelunkyclassichd": {"title": "SpelunkyClassicHD", "url": "https://github.com/yancharkin/SpelunkyClassicHD"}, "starfield-star-wars-resources-galaxy": {"title": "Starfield - Star Wars Resources - Galaxy", "url": "https://www.nexusmods.com/starfield/mods/16954?tab=description"}, "star-fox-64-psp-port": {"title": "Star Fox 64 PSP Port", "url": "https://github.com/TheMrIron2/sf64-psp"}, "beat-hazard-2-ps-vita-port": {"title": "Beat Hazard 2 PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1056"}, "vitadb-downloader": {"title": "VitaDB Downloader", "url": "https://www.rinnegatamante.eu/vitadb/#/info/877"}, "universal-dreamcast-patcher": {"title": "Universal Dreamcast Patcher", "url": "https://github.com/DerekPascarella/UniversalDreamcastPatcher"}, "r-c-pro-am-snes-port": {"title": "R. C. Pro Am SNES Port", "url": "https://archive.org/details/r.-c.-pro-am"}, "goopie-xbox-360-recompilation-launcher": {"title": "Goopie - Xbox 360 Recompilation Launcher", "url": "https://goopie.xyz/"}, "kameo-elements-of-power-recompilation": {"title": "Kameo: Elements of Power Recompilation", "url": "https://github.com/birabittoh/KameoRePowered"}, "lollipop-chainsaw-recompilation": {"title": "Lollipop Chainsaw Recompilation", "url": "https://github.com/MaxDeadBear/Re-Cherry"}, "naughty-bear-recompilation": {"title": "Naughty Bear Recompilation", "url": "https://github.com/MaxDeadBear/NaughtyBear_ReStuff"}, "destroy-all-humans-path-of-the-furon-recompilation": {"title": "Destroy All Humans: Path of the Furon Recompilation", "url": "https://github.com/masterspike52/redahm"}, "ecstatica-1-and-2-recompilation": {"title": "Ecstatica 1 and 2 Recompilation", "url": "https://github.com/spacefarergames/EcstaticaRecompiled"}, "nesrecomp-nes-recompiler-project": {"title": "nesrecomp - NES Recompiler Project", "url": "https://github.com/mstan/nesrecomp"}, "castlevania-symphony-of-the-night-gbc": {"title": "Castlevania - Symphony of the Night GBC", "url": "https://richterwilker.itch.io/castlevania-gospel-of-belmont"}, "animal-crossing-gbc": {"title": "Animal Crossing GBC", "url": "https://richterwilker.itch.io/animal-forest-gb-folk"}, "blasnesmous-blasphemous-nes-demake": {"title": "BlasNESmous - Blasphemous NES Demake", "url": "https://fjpolo.itch.io/blasnesmous"}, "magiczna-kula-papatki-decompilation": {"title": "Magiczna kula Papatki Decompilation", "url": "https://github.com/regratka/mkp"}, "return-to-castle-wolfenstein-ps-vita-port": {"title": "Return to Castle Wolfenstein PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/459"}, "ps2recomp-playstation-2-static-recompiler-and-runtime-tool-to-make-native-pc-ports": {"title": "PS2Recomp - Playstation 2 Static Recompiler & Runtime Tool to make native PC Ports", "url": "https://github.com/ran-j/PS2Recomp"}, "terranigma-redux": {"title": "Terranigma Redux", "url": "https://www.romhacking.net/hacks/8939/"}, "five-nights-at-freddy-s-3-wii-edition": {"title": "Five Nights At Freddy's 3: Wii Edition", "url": "https://gamejolt.com/games/fnaf3wii/1071424"}, "quetoo": {"title": "Quetoo", "url": "https://quetoo.org/news/quetoo-is-here/"}, "wcw-nwo-revenge-starrcade-edition": {"title": "WCW nWo Revenge Starrcade Edition", "url": "https://patcher.aki.guide/revse.html"}, "grand-theft-auto-san-andreas-carcer-city": {"title": "Grand Theft Auto: San Andreas - Carcer City", "url": "https://www.moddb.com/mods/gta-carcer-city"}, "grand-theft-auto-5-squid-games": {"title": "Grand Theft Auto 5 - Squid Games", "url": "https://www.gta5-mods.com/scripts/squid-game-mod"}, "saints-row-2-console-dlc-for-pc": {"title": "Saints Row 2 - Console DLC For PC", "url": "https://www.saintsrowmods.com/forum/threads/sr2-pc-dlc.24993/"}, "battleship-smash-brothers-64-pc-port-netplay": {"title": "Battleship - Smash Brothers 64 PC Port Netplay", "url": "https://github.com/TechnicallyComputers/BattleShip/releases/tag/Netplay-Alpha-1"}, "real-robots-final-attack-playstation": {"title": "Real Robots Final Attack - Playstation", "url": "https://romhack.ing/database/content/entry/8ffEsSDoTrabAI5gVzclNg/real-robots-final-attack-english-translation"}, "sonic-advance-3-sp": {"title": "Sonic Advance 3 SP", "url": "https://astromuseum.org/sonicZone/sonicmods/sonicadvance3"}, "wwe-smackdown-vs-raw-2007-recompilation": {"title": "WWE SmackDown vs. Raw 2007 Recompilation", "url": "https://github.com/HollywoodAkeem/SVR07-Recomp"}, "recut-paper-mario-recompilation": {"title": "ReCut - Paper Mario Recompilation", "url": "https://github.com/SMCGames/Paper-Mario-ReCut"}, "gradius-generation-black-label": {"title": "Gradius Generation BLACK LABEL", "url": "https://www.romhacking.net/hacks/9694/"}, "snesrecomp": {"title": "SNESRecomp", "url": "https://github.com/mstan/snesrecomp"}, "super-mario-world-recompilation": {"title": "Super Mario World Recompilation", "url": "https://github.com/mstan/SuperMarioWorldRecomp"}, "the-legend-of-zelda-a-link-to-the-past-recompilation": {"title": "The Legend of Zelda: A Link to the Past Recompilation", "url": "https://github.com/mstan/ZeldaAlttPSNESRecomp"}, "mega-man-x-recompilation": {"title": "Mega Man X Recompilation", "url": "https://github.com/mstan/MegaManXSNESRecomp"}, "pokemon-crystal-pc-port": {"title": "Pokemon Crystal PC Port", "url": "https://github.com/DanZC/suiCune"}, "banjo-kazooie-recompiled-stereoscopic-3d": {"title": "Banjo Kazooie Recompiled Stereoscopic 3D", "url": "https://github.com/oneup03/BanjoRecomp3D/releases"}, "perfect-dark-recompiled-stereoscopic-3d": {"title": "Perfect Dark Recompiled Stereoscopic 3D", "url": "https://github.com/oneup03/perfect_dark_3D/releases"}, "phantasy-star-generation-2-ps2": {"title": "Phantasy Star Generation:2 - PS2", "url": "https://cdromance.org/ps2-iso/sega-ages-2500-series-vol-17-phantasy-star-generation2-english-patched/"}, "daytona-usa-recompilation": {"title": "Daytona USA Recompilation", "url": "https://github.com/Subarasheese/daytona-xbla-recomp/"}, "morrowind-muffinwind-rebaked": {"title": "Morrowind - Muffinwind Rebaked", "url": "https://www.nexusmods.com/morrowind/mods/59081"}, "skate-3-recompilation-1": {"title": "Skate 3 Recompilation 1", "url": "https://github.com/portingpete/skate3-recomp"}, "skate-3-recompilation-2": {"title": "Skate 3 Recompilation 2", "url": "https://github.com/mchughalex/skate3recomp"}, "lost-odyssey-recompilation": {"title": "Lost Odyssey Recompilation", "url": "https://github.com/Graine25/reodyssey"}, "the-outfit-recompilation": {"title": "The Outfit Recompilation", "url": "https://github.com/DohmBoy64Bit/TheOutFit"}, "test-drive-unlimited-recompilation": {"title": "Test Drive Unlimited Recompilation", "url": "https://github.com/testdriveupgrade/TDURE"}, "rock-band-3-recompilation": {"title": "Rock Band 3 Recompilation", "url": "https://github.com/ihatecompvir/band3_recomp"}, "eternal-sonata-recompilation": {"title": "Eternal Sonata Recompilation", "url": "https://github.com/birabittoh/EternalSonataReprise"}, "castlevania-legacy-of-darkness-recompilation": {"title": "Castlevania Legacy of Darkness Recompilation", "url": "https://github.com/fliperama86/cvlod_recomp"}, "unreal-tournament-ps-vita-port": {"title": "Unreal Tournament PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1399"}, "resident-evil-4-mobile-ps-vita-port": {"title": "Resident Evil 4 Mobile PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1402"}, "pac-man-championship-edition-dx-ps-vita-port": {"title": "PAC-MAN Championship Edition DX PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1409"}, "call-of-duty-black-ops-zombies-ps-vita-port": {"title": "Call of Duty Black Ops Zombies PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1410"}, "marvel-s-spider-man-2-first-person-camera-mod": {"title": "Marvel's Spider-Man 2 First Person Camera Mod", "url": "https://www.nexusmods.com/marvelsspiderman2/mods/1993?tab=description"}, "recompone-static-psone-recompiler": {"title": "RecompOne - Static PSOne Recompiler", "url": "https://github.com/flafmg/RecompOne"}, "soul-blazer-snes": {"title": "Soul Blazer - SNES", "url": "https://romhack.ing/database/content/entry/ecw_olT_SyWuzHzrJz_tPg/soul-blazer-relocalization"}, "rushing-beat-shura-the-eternal-conflict-snes": {"title": "Rushing Beat Shura The Eternal Conflict - SNES", "url": "https://romhack.ing/database/content/entry/iiKVVaitQxSE0Lfm2I0Xkw/rushing-beate-shura-the-eternal-conflict-english-translation"}, "kowloon-s-gate-playstation": {"title": "Kowloon's Gate - Playstation", "url": "https://www.patreon.com/posts/160555525"}, "dusklight-the-legend-of-zelda-twilight-princess-pc-port-web-browser-build": {"title": "Dusklight - The Legend of Zelda Twilight Princess PC Port Web Browser Build", "url": "https://dusklight.pages.dev/"}, "pokemon-stadium-recompilation": {"title": "Pokemon Stadium Recompilation", "url": "https://github.com/mstan/PokemonStadiumRecomp"}, "goldeneye-xbla-recompilation": {"title": "Goldeneye XBLA Recompilation", "url": "https://github.com/SunJaycy/GoldenEye-Recomp"}, "paper-mario-down-bad-edition": {"title": "Paper Mario Down Bad Edition", "url": "https://github.com/MinusBros/downbadeditionsource/releases"}, "snes-cheat-patcher-studio-apply-game-genie-cheats-to-snes-roms": {"title": "SNES Cheat Patcher Studio - Apply Game Genie Cheats To SNES Roms", "url": "https://github.com/Dax-Dot/SNES-Cheat-Patcher-Studio"}, "silent-hill-pc-port": {"title": "Silent Hill PC Port", "url": "https://github.com/SlickAmogus/silent-hill-decomp"}, "super-mario-64-nintendo-ds-port-with-multiplayer": {"title": "Super Mario 64 Nintendo DS Port with Multiplayer", "url": "https://github.com/TobiasFriedly/sm64-nds"}, "fire-emblem-seima-no-kouseki-decompilation": {"title": "Fire Emblem: Seima no Kouseki Decompilation", "url": "https://github.com/laqieer/fireemblem8j"}, "star-wars-rogue-squadron-ii-rogue-leader-decompilation": {"title": "Star Wars: Rogue Squadron II - Rogue Leader Decompilation", "url": "https://github.com/AARosson48/rogue-leader-decomp"}, "homeworld-2-classic-decompilation": {"title": "Homeworld 2 Classic Decompilation", "url": "https://github.com/HaydnTrigg/Homeworld2Classic"}, "wolfenstein-3d-atari-lynx-port": {"title": "Wolfenstein 3D Atari Lynx Port", "url": "https://drive.google.com/drive/folders/11Mq1f8bDg_ZH8Z9DtjH5dC1-cCsP8ycZ"}, "ironclad-xbox-360": {"title": "Ironclad - Xbox 360", "url": "https://hiddenpalace.org/Ironclad_(Dec_16,_2008_prototype)"}, "resident-evil-4-multiplayer-mod": {"title": "Resident Evil 4 - Multiplayer Mod", "url": "https://www.nexusmods.com/residentevil42023/mods/6539?tab=description"}, "dariusburst-sp-ps-vita-port": {"title": "DARIUSBURST SP PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1415"}, "a-bite-at-freddy-s-ps-vita-port": {"title": "A Bite at Freddy's PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1413"}, "colin-mcrae-rally-2-0": {"title": "Colin McRae Rally 2.0", "url": "https://archive.org/details/colin-mcrae-rally-2.0-repack"}, "colin-mcrae-rally": {"title": "Colin McRae Rally", "url": "https://archive.org/details/colin-mcrae-rally-repack?"}, "snowboard-kids-decompilation": {"title": "Snowboard Kids Decompilation", "url": "https://github.com/cdlewis/snowboardkids-decomp"}, "god-hand-decompilation": {"title": "God Hand Decompilation", "url": "https://github.com/LucasPicoli/god-hand-decomp"}, "wwe-2k16": {"title": "WWE 2K16", "url": "https://archive.org/details/wwe-2k16"}, "wwe-2k17": {"title": "WWE 2K17", "url": "https://archive.org/details/wwe-2k17"}, "wwe-2k18": {"title": "WWE 2K18", "url": "https://archive.org/details/wwe-2k18"}, "wwe-2k19": {"title": "WWE 2K19", "url": "https://archive.org/details/wwe-2k19"}, "wwe-2k20": {"title": "WWE 2K20", "url": "https://archive.org/details/wwe-2k20"}, "wwe-2k22": {"title": "WWE 2K22", "url": "https://archive.org/details/wwe-2k22_202603"}, "wwe-2k23": {"title": "WWE 2K23", "url": "https://archive.org/details/wwe-2k23"}, "starship-troopers-terran-ascendancy": {"title": "Starship Troopers - Terran Ascendancy", "url": "https://archive.org/details/starship-troopers-terran-ascendancy"}, "ghostbusters-the-video-game": {"title": "Ghostbusters: The Video Game", "url": "https://archive.org/details/ghostbusters-the-video-game_202603"}, "dexter-the-game": {"title": "Dexter: The Game", "url": "https://archive.org/details/dexter-the-game.-7z_202603"}, "house-m-d": {"title": "House M.D.", "url": "https://archive.org/details/house-m.-d.-7z"}, "mechcommander-gold": {"title": "MechCommander: Gold", "url": "https://archive.org/details/mechcommander-gold"}, "mechcommander-2": {"title": "MechCommander 2", "url": "https://archive.org/details/mechcommander-2"}, "forza-horizon-4": {"title": "Forza Horizon 4", "url": "https://archive.org/details/forza-horizon-4_20260322"}, "colin-mcrae-dirt": {"title": "Colin McRae: DiRT", "url": "https://archive.org/details/colin-mcrae-dirt_202603"}, "tom-clancy-s-ghost-recon-advanced-warfighter": {"title": "Tom Clancy's Ghost Recon Advanced Warfighter", "url": "https://archive.org/details/ghost-recon-advanced-warfighter_202603"}, "tom-clancy-s-ghost-recon-advanced-warfighter-2": {"title": "Tom Clancy's Ghost Recon Advanced Warfighter 2", "url": "https://archive.org/details/ghost-recon-advanced-warfighter-2"}, "star-trek": {"title": "Star Trek", "url": "https://archive.org/details/star-trek_202603"}, "the-lord-of-the-rings-war-of-the-ring": {"title": "The Lord Of The Rings - War Of The Ring", "url": "https://archive.org/details/the-lord-of-the-rings-war-of-the-ring_202603"}, "peaky-blinders-mastermind": {"title": "Peaky Blinders Mastermind", "url": "https://archive.org/details/peaky-blinders-mastermind"}, "tony-hawk-s-pro-skater-2": {"title": "Tony Hawk's Pro Skater 2", "url": "https://archive.org/details/tony-hawks-pro-skater-2_202604"}, "tony-hawk-s-pro-skater-3": {"title": "Tony Hawk's Pro Skater 3", "url": "https://archive.org/details/tony-hawks-pro-skater-3_202604"}, "tony-hawk-s-underground-2": {"title": "Tony Hawk's Underground 2", "url": "https://archive.org/details/tony-hawks-underground-2_202604"}, "tony-hawk-s-pro-skater-hd": {"title": "Tony Hawk's Pro Skater HD", "url": "https://archive.org/details/tony-hawks-pro-skater-hd_202604"}, "grand-theft-auto-2": {"title": "Grand Theft Auto 2", "url": "https://archive.org/details/grand-theft-auto-2_202604"}, "mlb-2k9": {"title": "MLB 2K9", "url": "https://archive.org/details/mlb-2-k-9"}, "mlb-2k10": {"title": "MLB 2K10", "url": "https://archive.org/details/mlb-2k10"}, "mlb-2k11": {"title": "MLB 2K11", "url": "https://archive.org/details/mlb-2k11"}, "prison-break-the-conspiracy": {"title": "Prison Break: The Conspiracy", "url": "https://archive.org/details/prison-break_202604"}, "tonic-trouble": {"title": "Tonic Trouble", "url": "https://archive.org/details/tonic-trouble.-7z"}, "the-neverhood": {"title": "The Neverhood", "url": "https://archive.org/details/the-neverhood_202604"}, "disney-s-g-force": {"title": "Disney's G-Force", "url": "https://archive.org/details/disneys-g-force"}, "sheep-dog-n-wolf": {"title": "Sheep, Dog, 'n' Wolf", "url": "https://archive.org/details/sheep-dog-n-wolf-repack"}, "csi-3-dimensions-of-murder": {"title": "CSI: 3 Dimensions Of Murder", "url": "https://archive.org/details/csi-3-dimensions-of-murder-repack"}, "star-trek-legacy": {"title": "Star Trek Legacy", "url": "https://archive.org/details/star-trek-legacy-repack"}, "lost-via-domus": {"title": "Lost: Via Domus", "url": "https://archive.org/details/lost-via-domus-repack"}, "nba-playgrounds": {"title": "NBA Playgrounds", "url": "https://archive.org/details/nba-playgrounds-repack"}, "nba-2k-playgrounds-2": {"title": "NBA 2K Playgrounds 2", "url": "https://archive.org/details/nba-2k-playgrounds-2-repack"}, "deep-black-reloaded": {"title": "Deep Black: Reloaded", "url": "https://archive.org/details/deep-black-reloaded-repack"}, "cabela-s-dangerous-hunts-2013": {"title": "Cabela's Dangerous Hunts 2013", "url": "https://archive.org/details/cabelas-dangerous-hunts-2013-repack"}, "pirates-of-the-caribbean-at-worlds-end": {"title": "Pirates Of The Caribbean: At Worlds End", "url": "https://archive.org/details/pirates-of-the-caribbean-at-worlds-end-repack"}, "friday-the-13th-killer-puzzle": {"title": "Friday The 13th - Killer Puzzle", "url": "https://archive.org/details/friday-the-13th-killer-puzzle-repack"}, "lego-2k-drive": {"title": "LEGO 2K Drive", "url": "https://archive.org/details/lego-2k-drive-repack"}, "madden-nfl-08": {"title": "Madden NFL 08", "url": "https://archive.org/details/madden-nfl-08_20260525"}, "fuser": {"title": "Fuser", "url": "https://archive.org/details/fuser-repack"}, "x2-wolverine-s-revenge": {"title": "X2: Wolverine's Revenge", "url": "https://archive.org/details/x2-wolverines-revenge-repack"}, "pro-evolution-soccer-2014": {"title": "Pro Evolution Soccer 2014", "url": "https://archive.org/details/pro-evolution-soccer-2014-repack"}, "pro-evolution-soccer-2015": {"title": "Pro Evolution Soccer 2015", "url": "https://archive.org/details/pro-evolution-soccer-2015-repack"}, "pro-evolution-soccer-2016": {"title": "Pro Evolution Soccer 2016", "url": "https://archive.org/details/pro-evolution-soccer-2016-repack"}, "pro-evolution-soccer-2017": {"title": "Pro Evolution Soccer 2017", "url": "https://archive.org/details/pro-evolution-soccer-2017-repack"}, "pro-evolution-soccer-2018": {"title": "Pro Evolution Soccer 2018", "url": "https://archive.org/details/pro-evolution-soccer-2018-repack"}, "pro-evolution-soccer-2019": {"title": "Pro Evolution Soccer 2019", "url": "https://archive.org/details/pro-evolution-soccer-2019-repack"}, "efootball-pes-2020": {"title": "eFootball PES 2020", "url": "https://archive.org/details/e-football-pes-2020-repack"}, "efootball-pes-2021": {"title": "eFootball PES 2021", "url": "https://archive.org/details/e-football-pes-2021-repack"}, "banjo-kazooie-recompilation-for-android": {"title": "Banjo-Kazooie Recompilation for Android", "url": "https://github.com/AurelioB/BanjoRecomp-Android/releases"}, "alundra-definitive-edition": {"title": "Alundra Definitive Edition", "url": "https://github.com/Pixelplix93/Alundra-Definitive-Edition"}, "ancient-ys-vanished-omen-pc-98": {"title": "Ancient Ys Vanished Omen - PC-98", "url": "https://github.com/GhaleonX/Ys"}, "deadly-premonition-recompilation": {"title": "Deadly Premonition Recompilation", "url": "https://github.com/LittleBitUA/DPRecomp"}, "silent-hill-downpour-recompilation": {"title": "Silent Hill: Downpour Recompilation", "url": "https://github.com/LittleBitUA/DownpourRecomp"}, "snowboard-kids-2-recompilation": {"title": "Snowboard Kids 2 Recompilation", "url": "https://github.com/cdlewis/snowboardkids2-recomp/releases/tag/v1.0.5"}, "crash-team-racing-pc-port": {"title": "Crash Team Racing PC Port", "url": "https://github.com/CTR-tools/ctr-native/releases"}, "dolrecomp-a-static-recompiler-for-gamecube-wii-and-experimental-wii-u-cpu-code": {"title": "DolRecomp - A static recompiler for GameCube, Wii, and experimental Wii U CPU code", "url": "https://github.com/ExpansionPak/DolRecomp"}, "smash-remix-project-galleon": {"title": "Smash Remix: Project Galleon", "url": "https://www.youtube.com/watch?v=LIvRGQ0mZB8"}, "openprey": {"title": "OpenPREY", "url": "https://github.com/themuffinator/OpenPREY"}, "ship-of-harkinian-zelda-ocarina-of-time-port-cel-shaded-model-mod": {"title": "Ship of Harkinian - Zelda Ocarina of Time Port - Cel Shaded Model Mod", "url": "https://github.com/roborich/Shipwright/releases/tag/v0.3-cel-shade"}, "monster-hunter-dynamic-hunting-ps-vita-port": {"title": "Monster Hunter Dynamic Hunting PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1420"}, "castlevania-revamped-android-port": {"title": "Castlevania ReVamped Android Port", "url": "https://github.com/eboody/Castlevania-ReVamped-Open-Source-Edition/releases"}, "ps3recomp-static-recompilation-runtime-libraries-for-playstation-3-titles": {"title": "PS3Recomp - Static Recompilation Runtime Libraries for PlayStation 3 Titles", "url": "https://github.com/sp00nznet/ps3recomp"}, "premier-eleven-dreamcast": {"title": "Premier Eleven - Dreamcast", "url": "https://www.dreamcast-talk.com/forum/viewtopic.php?t=19255&__cf_chl_rt_tk=YJ0o21txXUMYJtgIvVfTSG_hjnIMcIAKErnX7wQTYI8-1782419778-1.0.1.1-vsZKSi9MQisA6rmf0lb5RARZJcGT02X2VJkBBqGOxV4"}, "harvest-moon-64-recompilation": {"title": "Harvest Moon 64 Recompilation", "url": "https://github.com/HarvestMoon64Recomp/HarvestMoon64Recomp"}, "dark-lands-ps-vita-port": {"title": "Dark Lands PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1425"}, "aleph-one-ps-vita-port": {"title": "Aleph One PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1421"}, "resistance-fall-of-man-resistanceonline": {"title": "Resistance Fall of Man - ResistanceOnline", "url": "https://archive.org/download/ResistanceOnline"}, "damnation": {"title": "Damnation", "url": "https://archive.org/details/damnation-repack"}, "lego-star-wars-the-video-game": {"title": "LEGO Star Wars: The Video Game", "url": "https://archive.org/details/lego-star-wars-repack"}, "lego-star-wars-ii-the-original-trilogy": {"title": "LEGO Star Wars II: The Original Trilogy", "url": "https://archive.org/details/lego-star-wars-ii-repack"}, "horizon-chase-turbo": {"title": "Horizon Chase Turbo", "url": "https://archive.org/details/horizon-chase-turbo-repack"}, "ace-combat-6-fires-of-liberation-recompilation": {"title": "Ace Combat 6: Fires of Liberation Recompilation", "url": "https://github.com/sal063/AC6_recomp"}, "resistance-2-rpcs-3-patched-build": {"title": "Resistance 2 RPCS 3 Patched Build", "url": "https://archive.org/details/Resistance2-RPCS3"}, "1-githublauncher-universal-launcher-for-recompilations-and-pc-ports": {"title": "1 GithubLauncher - Universal Launcher for Recompilations and PC Ports", "url": "https://github.com/SirDiabo/GithubLauncher"}, "nocturnerecomp-castlevania-symphony-of-the-night-xbla-recompilation": {"title": "NocturneRecomp - Castlevania Symphony of the Night XBLA Recompilation", "url": "https://github.com/birabittoh/NocturneRecomp"}, "metal-slug-xx-recompilation": {"title": "Metal Slug XX Recompilation", "url": "https://github.com/FluffyQuack/rexglue-MetalSlugXX"}, "perfect-dark-vr-port": {"title": "Perfect Dark VR Port", "url": "https://github.com/Alex-LeTux/perfect_dark_VR/releases"}, "harvest-moon-64-recompilation-mods": {"title": "Harvest Moon 64 Recompilation Mods", "url": "https://thunderstore.io/c/harvest-moon-64-recompiled/"}, "diablo-3-xbox-360-recompilation": {"title": "Diablo 3 Xbox 360 Recompilation", "url": "https://github.com/Boron853/Souls-of-the-Reaper/releases/tag/beta-1.2"}, "kingdom-hearts-358-2-days-decompilation": {"title": "Kingdom Hearts 358 2 Days Decompilation", "url": "https://github.com/Yokimitsuro/khdays-decomp"}, "digimon-world-4-decompilation": {"title": "Digimon World 4 Decompilation", "url": "https://github.com/ivanno4317/dw4-gc"}, "halo-3-permafrost": {"title": "Halo 3 Permafrost", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=3663541185"}, "mega-man-x6-recompilation": {"title": "Mega Man X6 Recompilation", "url": "https://github.com/mstan/MegaManX6Recomp"}, "virtual-pro-wrestling-2-recompilation": {"title": "Virtual Pro Wrestling 2 Recompilation", "url": "https://discovery.onl/Grix/a1ac11ed-e635-4c5f-959e-2716d6c3fdd0"}, "tomba-recompilation": {"title": "Tomba! Recompilation", "url": "https://github.com/mstan/TombaRecomp"}, "wcw-vs-nwo-world-tour-recompilation": {"title": "WCW vs. nWo World Tour Recompilation", "url": "https://github.com/jessetbh/WCWvsNWOWorldTourRecomp"}, "grand-theft-auto-3-liberty-extended": {"title": "Grand Theft Auto 3 - Liberty Extended", "url": "https://libertycity.net/files/gta-3/191140-liberty-extended-october-2025-update.html"}, "grand-theft-auto-vice-city-vice-extended": {"title": "Grand Theft Auto Vice City - Vice Extended", "url": "https://libertycity.net/files/gta-vice-city/167639-vice-extended-october-2025-update.html"}, "mega-man-x4-recompilation": {"title": "Mega Man X4 Recompilation", "url": "https://github.com/mstan/MegaManX4Recomp"}, "virtua-racing-pc-emulation": {"title": "Virtua Racing PC Emulation", "url": "https://github.com/wanszai/Virtua-Racing---XBOXONE-Windows"}, "virtua-fighter-pc-emulation": {"title": "Virtua Fighter PC Emulation", "url": "https://github.com/wanszai/Virtua-Fighter---XboxOne-Windows"}, "zool-majyu-charmer-legend-n64": {"title": "Zool Majyu Charmer Legend - N64", "url": "https://romhack.ing/database/content/entry/gNAq0phlTYqaYSpT_kY1XQ/zool-majy-charmer-legend-english-translation"}, "moderngekko-static-recompilation-pipeline-for-gamecube-and-wii-games": {"title": "ModernGekko - Static-Recompilation pipeline for GameCube and Wii games", "url": "https://github.com/ExpansionPak/ModernGekko-Template"}, "the-legend-of-zelda-majora-s-mask-recompilation-for-android": {"title": "The Legend of Zelda Majora's Mask Recompilation for Android", "url": "https://github.com/linkzenic/Zelda64Recomp-Android"}, "monster-hunter-decompilation": {"title": "Monster Hunter Decompilation", "url": "https://github.com/2Tie/mh1j"}, "lemmings-paintball-decompilation": {"title": "Lemmings Paintball Decompilation", "url": "https://github.com/vonhoff/lemball-decomp"}, "dragon-quest-iv-decompilation": {"title": "Dragon Quest IV Decompilation", "url": "https://github.com/GoldieLeGenie/DQIV-DECOMP"}, "crash-bandicoot-the-wrath-of-cortex-decompilation": {"title": "Crash Bandicoot The Wrath of Cortex Decompilation", "url": "https://github.com/denzi-gh/crashwoc-decomp-ps2"}, "tenchu-decompilation": {"title": "Tenchu Decompilation", "url": "https://github.com/Fuuzetsu/tenchu-decomp"}, "mother-encore-ps-vita-port": {"title": "MOTHER Encore PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1431"}, "after-burner-climax-ps-vita-port": {"title": "After Burner Climax PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1433"}, "gears-of-war-2-pc-port": {"title": "Gears of War 2 PC Port", "url": "https://www.moddb.com/mods/gears-of-war-2-hollow/downloads/gears-of-war-2-hollow-launcher"}, "mischief-makers-recompilation": {"title": "Mischief Makers Recompilation", "url": "https://github.com/ThiagoLira/trouble-makers-pc-recomp"}, "wwf-wrestlemania-2000-recompilation": {"title": "WWF WrestleMania 2000 Recompilation", "url": "https://github.com/jessetbh/WWFWrestleMania2000Recomp"}, "wcw-nwo-revenge-recompilation": {"title": "WCW nWo Revenge Recompilation", "url": "https://github.com/jessetbh/WCWnWoRevengeRecomp"}, "wwf-no-mercy-recompilation": {"title": "WWF No Mercy Recompilation", "url": "https://github.com/jessetbh/WWFNoMercyRecomp"}, "virtual-pro-wrestling-64-recompilation": {"title": "Virtual Pro Wrestling 64 Recompilation", "url": "https://github.com/jessetbh/VPW64Recomp"}, "akilauncher-launcher-for-the-aki-engine-n64-wrestling-recompilations": {"title": "AkiLauncher - Launcher for the AKI-engine N64 Wrestling Recompilations", "url": "https://github.com/jessetbh/AkiLauncher"}, "infamous-rpcs-3-patched-build": {"title": "Infamous RPCS 3 Patched Build", "url": "https://archive.org/details/INFAMOUS1RPCS3"}, "uncharted-rpcs-3-patched-build": {"title": "Uncharted RPCS 3 Patched Build", "url": "https://transfer.it/t/4GqbvrpB2DCI"}, "motorstorm-pacific-rift-rpcs-3-patched-build": {"title": "Motorstorm Pacific Rift RPCS 3 Patched Build", "url": "https://archive.org/details/MOTORSTORMPACIFICRIFTRPCS3"}, "uncharted-2-rpcs-3-patched-build": {"title": "Uncharted 2 RPCS 3 Patched Build", "url": "https://transfer.it/t/sv5gYVknSZia"}, "wet-rpcs-3-patched-build": {"title": "Wet RPCS 3 Patched Build", "url": "https://transfer.it/t/AnylMJ1XXTKa"}, "dodonpachi-saidaioujou-recompilation": {"title": "Dodonpachi Saidaioujou Recompilation", "url": "https://github.com/eandis/SDOJ-Recomp"}, "greenvita-xbox-cloud-gaming-on-playstation-vita": {"title": "GreenVita - Xbox Cloud Gaming on PlayStation Vita", "url": "https://github.com/Day-OS/green-vita"}, "pokemon-red-recompilation": {"title": "Pokemon Red Recompilation", "url": "https://github.com/bryanthaboi/pokemon-gen1-recomp-project"}, "kirby-s-return-to-dream-land-recompilation": {"title": "Kirby's Return to Dream Land Recompilation", "url": "https://github.com/ExpansionPak/ModernGekko/releases/tag/kirby"}, "street-fighter-iii-third-strike-pc-port": {"title": "Street Fighter III Third Strike PC Port", "url": "https://github.com/guimaraf/3sxw"}, "heavenly-sword-rpcs-3-build": {"title": "Heavenly Sword RPCS 3 Build", "url": "https://archive.org/details/heavenly-sword-rpcs-3"}, "rain-rpcs-3-build": {"title": "Rain RPCS 3 Build", "url": "https://gofile.io/d/pxeLJ3"}, "tokyo-jungle-rpcs-3-build": {"title": "Tokyo Jungle RPCS 3 Build", "url": "https://archive.org/details/TOKYOJUNGLERPCS3"}, "folklore": {"title": "Folklore", "url": "https://archive.org/details/folklore_rpcs3"}, "pepsiman-recompilation": {"title": "Pepsiman Recompilation", "url": "https://pepsiman.ol.mr/"}, "sega-rally-championship-pc-emulation": {"title": "Sega Rally Championship PC Emulation", "url": "https://github.com/wanszai/Sega-Rally-Championship-PC-Xbox360-Series-X-/releases/tag/1.0.0"}, "starcraft-64-campaign-co-op-mod": {"title": "StarCraft 64 Campaign Co-Op Mod", "url": "https://github.com/Tokatta007/Starcraft-64-Co-Op-Mod"}, "undermobile-undertale-android-port": {"title": "UnderMobile - Undertale Android Port", "url": "https://gamejolt.com/games/UnderMobile/1086330"}, "fullmetal-alchemist-3-the-girl-who-succeeds-god-playstation-2": {"title": "Fullmetal Alchemist 3 The Girl Who Succeeds God - Playstation 2", "url": "https://agtteam.net/fma/"}, "vl-mr-hub-for-browser-based-recompilation-projects": {"title": "VL.MR - Hub for Browser Based Recompilation Projects", "url": "https://vl.mr/"}, "2-quiver-recompilation-launcher": {"title": "2 Quiver - Recompilation Launcher", "url": "https://github.com/tgeorgiadis/quiver"}, "crash-bandicoot-pc-port": {"title": "Crash Bandicoot PC Port", "url": "https://github.com/Matteo842/CrashBandicoot-Launcher/releases"}, "smash-remix-extra": {"title": "Smash Remix +Extra", "url": "https://github.com/joaorb64/smashremix-plus-extra/releases/tag/0.5.0"}, "saw-pc-patched": {"title": "Saw - PC Patched", "url": "https://archive.org/details/saw_20251012"}, "crazy-taxi-3-pc-patched": {"title": "Crazy Taxi 3 - PC Patched", "url": "https://archive.org/details/crazy-taxi-3_202601"}, "spider-man-friend-or-foe-pc-patched": {"title": "Spider Man Friend Or Foe - PC Patched", "url": "https://archive.org/details/spider-man-friend-or-foe-repack"}, "halo-2-pc-patched": {"title": "Halo 2 - PC Patched", "url": "https://archive.org/details/halo-2-repack"}, "resident-evil-dead-aim-pc-patched": {"title": "Resident Evil Dead Aim - PC Patched", "url": "https://archive.org/details/resident-evil-dead-aim_20260610"}, "the-simpsons-game-recompilation": {"title": "The Simpsons Game Recompilation", "url": "https://github.com/YesterMester/TheSimpsonsGameRecomp"}, "hollow-knight-android-port": {"title": "Hollow Knight Android Port", "url": "https://archive.org/details/hollow-knight-android"}, "super-mario-64-android-port": {"title": "Super Mario 64 Android Port", "url": "https://github.com/ManIsCat2/sm64coopdx/releases/tag/Av1.5.1"}, "devilutionx-diablo-1-android-port": {"title": "DevilutionX - Diablo 1 - Android Port", "url": "https://github.com/diasurgical/DevilutionX"}, "ship-of-harkinian-the-legend-of-zelda-ocarina-of-time-android-port": {"title": "Ship of Harkinian - The Legend of Zelda Ocarina of Time Android Port", "url": "https://github.com/Waterdish/Shipwright-Android"}, "brotato-android-port": {"title": "Brotato Android Port", "url": "https://drive.google.com/file/d/1x6tEy9skIO84Xu8QYPCkg9APf4qJ_4yw/view"}, "the-case-of-the-golden-idol-android-port": {"title": "The Case of the Golden Idol Android Port", "url": "https://drive.google.com/drive/u/0/folders/1T33HnJ7Q6oKTEoOngEO7HaYKvC9O2Vdl"}, "delta-touch-doom-engine-source-ports-for-android": {"title": "Delta Touch - Doom Engine Source Ports for Android", "url": "http://opentouchgaming.com/delta-touch/"}, "zeta-touch-raze-and-eduke32-engines-for-android": {"title": "Zeta Touch - Raze and EDuke32 Engines for Android", "url": "http://opentouchgaming.com/zeta-touch/"}, "vcmi-open-heroes-3-heroes-of-might-and-magic-3-for-android": {"title": "VCMI - Open Heroes 3 - Heroes of Might and Magic 3 - for Android", "url": "https://vcmi.eu/"}, "quad-touch-pc-quake-engines-for-android": {"title": "Quad Touch PC Quake engines for Android", "url": "http://opentouchgaming.com/quad-touch/"}, "alpha-touch-90-s-classic-fps-shooters-for-android": {"title": "Alpha Touch 90’s classic FPS shooters for Android", "url": "http://opentouchgaming.com/alpha-touch/"}, "openmw-morrowind-for-android": {"title": "OpenMW - Morrowind for Android", "url": "https://gitlab.com/duron27/alpha3"}, "sonic-unleashed-recompilation-for-android": {"title": "Sonic Unleashed Recompilation for Android", "url": "https://github.com/SansNope/UnleashedRecomp-Android"}, "partyboard-mario-party-4-for-android": {"title": "PartyBoard - Mario Party 4 for Android", "url": "https://github.com/mariopartyrd/marioparty4"}, "opencrossing-animal-crossing-for-android": {"title": "OpenCrossing - Animal Crossing for Android", "url": "https://github.com/GabeConway/OpenCrossing-Anbernic/releases"}, "sigma-touch-unreal-and-unreal-tournament-99-engine-for-android": {"title": "Sigma Touch - Unreal and Unreal Tournament 99 Engine for Android", "url": "http://opentouchgaming.com/sigma-touch/"}, "battleship-super-smash-brothers-64-for-android": {"title": "Battleship - Super Smash Brothers 64 for Android", "url": "https://github.com/JRickey/BattleShip/releases"}, "the-simpsons-hit-and-run-for-android": {"title": "The Simpsons Hit & Run for Android", "url": "https://github.com/Carlox33/The-Simpsons-Hit-and-Run-Android/releases"}, "perfect-dark-for-android": {"title": "Perfect Dark for Android", "url": "https://github.com/izzy2lost/perfect_dark/releases/tag/1.0"}, "pokemon-red-blue-and-yellow-recompilation": {"title": "Pokemon Red Blue and Yellow Recompilation", "url": "https://github.com/bryanthaboi/gen1recomp"}, "pokemon-red-blue-and-yellow-recompilation-dramatic-shape-voxel-mod": {"title": "Pokemon Red, Blue and Yellow Recompilation Dramatic Shape Voxel Mod", "url": "https://github.com/DramaticShape/DramaticShapeVoxelMod/releases"}, "the-legend-of-zelda-the-minish-cap-for-android": {"title": "The Legend of Zelda the Minish Cap for Android", "url": "https://github.com/samyost1/tmc-android/releases"}, "link-s-awakening-dx-hd-for-android": {"title": "Link's Awakening DX HD for Android", "url": "https://archive.org/details/links-awakening-dx-hd-v-1.7.0-windows-direct-x.-7z"}, "2-starboard-play-games-from-the-portmaster-library-on-your-android-handheld": {"title": "2 Starboard Play Games From The Portmaster Library On Your Android Handheld", "url": "https://github.com/get-starboard/starboard"}, "1-obtainium": {"title": "1 Obtainium", "url": "https://github.com/ImranR98/Obtainium"}, "switchnow-a-native-nintendo-switch-homebrew-client-for-geforce-now": {"title": "SwitchNow a Native Nintendo Switch Homebrew Client for Geforce Now", "url": "https://github.com/Blade-Punisher/SwitchNOW"}, "am2r-for-android": {"title": "AM2R for Android", "url": "https://archive.org/download/am-2-rlauncher-2.2.0-win-android/"}, "gran-turismo-2-pc-patched": {"title": "Gran Turismo 2 PC Patched", "url": "https://archive.org/details/gt-2_20260509"}, "forza-horizon-pc-patched": {"title": "Forza Horizon PC Patched", "url": "https://archive.org/details/forza-horizon"}, "forza-horizon-2-pc-patched": {"title": "Forza Horizon 2 PC Patched", "url": "https://archive.org/details/fh-2_20260510"}, "forza-motorsport-3-pc-patched": {"title": "Forza Motorsport 3 PC Patched", "url": "https://archive.org/details/fm-3_20260510"}, "forza-motorsport-4-pc-patched": {"title": "Forza Motorsport 4 PC Patched", "url": "https://archive.org/details/fm-4_20260510"}, "dirge-of-cerberus-final-fantasy-vii-pc-patched": {"title": "Dirge Of Cerberus: Final Fantasy VII PC Patched", "url": "https://archive.org/details/dirge-of-cerberus-final-fantasy-vii"}, "midnight-club-la-complete-edition-pc-patched": {"title": "Midnight Club LA Complete Edition PC Patched", "url": "https://archive.org/details/midnight-club-la-complete-edition"}, "gears-of-war-2-pc-patched": {"title": "Gears Of War 2 PC Patched", "url": "https://archive.org/details/gears-of-war-2_202605"}, "vigilante-8-arcade-pc-patched": {"title": "Vigilante 8 Arcade PC Patched", "url": "https://archive.org/details/vigilante-8-arcade"}, "gears-of-war-3-pc-patched": {"title": "Gears Of War 3 PC Patched", "url": "https://archive.org/details/gears-of-war-3.7z"}, "gun-pc-patched": {"title": "Gun PC Patched", "url": "https://archive.org/details/gun.-7z"}, "midnight-club-3-dub-edition-remix-pc-patched": {"title": "Midnight Club 3 Dub Edition Remix PC Patched", "url": "https://archive.org/details/midnight-club-3-dub-edition-remix.-7z"}, "pirates-of-the-caribbean-at-worlds-end-pc-patched": {"title": "Pirates Of The Caribbean At Worlds End PC Patched", "url": "https://archive.org/details/pirates-of-the-caribbean-at-worlds-end.-7z"}, "gear-of-war-judgment-pc-patched": {"title": "Gear Of War Judgment PC Patched", "url": "https://archive.org/details/gear-of-war-judgment-brasil.-7z"}, "fist-of-the-north-star-kens-rage-2-pc-patched": {"title": "Fist Of The North Star - Kens Rage 2 PC Patched", "url": "https://archive.org/details/fist-of-the-north-star-kens-rage-2.7z"}, "fist-of-the-north-star-kens-rage-pc-patched": {"title": "Fist Of The North Star - Kens Rage PC Patched", "url": "https://archive.org/details/fist-of-the-north-star-kens-rage.-7z"}, "naruto-the-broken-bond-pc-patched": {"title": "Naruto - The Broken Bond PC Patched", "url": "https://archive.org/details/naruto-the-broken-bond.-7z"}, "naruto-rise-of-a-ninja-pc-patched": {"title": "Naruto - Rise Of A Ninja PC Patched", "url": "https://archive.org/details/naruto-rise-of-a-ninja.-7z"}, "dragon-ball-z-ultimate-tenkaichi-pc-patched": {"title": "Dragon Ball Z - Ultimate Tenkaichi PC Patched", "url": "https://archive.org/details/dragon-ball-z-ultimate-tenkaichi.-7z"}, "dragon-ball-raging-blast-2-pc-patched": {"title": "Dragon Ball - Raging Blast 2 PC Patched", "url": "https://archive.org/details/dragon-ball-raging-blast-2.7z"}, "dragon-ball-raging-blast-pc-patched": {"title": "Dragon Ball - Raging Blast PC Patched", "url": "https://archive.org/details/dragon-ball-raging-blast.-7z"}, "dragon-ball-z-burst-limit-pc-patched": {"title": "Dragon Ball Z - Burst Limit PC Patched", "url": "https://archive.org/details/dragon-ball-z-burst-limit.-7z"}, "resident-evil-code-veronica-x-pc-patched": {"title": "Resident Evil - Code Veronica X PC Patched", "url": "https://archive.org/details/re-code-veronica-x"}, "fable-ii-game-of-the-year-edition-pc-patched": {"title": "Fable II - Game of The Year Edition PC Patched", "url": "https://archive.org/details/fable-ii_20260615"}, "the-sly-collection-pc-patched": {"title": "The Sly Collection PC Patched", "url": "https://archive.org/details/sly-collection"}, "sly-cooper-thieves-in-time-pc-patched": {"title": "Sly Cooper - Thieves in Time PC Patched", "url": "https://archive.org/details/sly-4_202607"}, "drakengard-1-and-2-pc-patched": {"title": "Drakengard 1 & 2 PC Patched", "url": "https://archive.org/details/drakengard-1-2"}, "ico-pc-patched": {"title": "ICO PC Patched", "url": "https://archive.org/details/ico_20260704"}, "ninja-gaiden-ii-pc-patched": {"title": "Ninja Gaiden II PC Patched", "url": "https://archive.org/details/ninja-gaiden-2"}, "drakengard-3-pc-patched": {"title": "Drakengard 3 PC Patched", "url": "https://archive.org/details/drakengard-3_202607"}, "fatal-frame-trilogy-pc-patched": {"title": "Fatal Frame Trilogy PC Patched", "url": "https://archive.org/details/fatal-frame-trilogy_202607"}, "splatterhouse-pc-patched": {"title": "Splatterhouse PC Patched", "url": "https://archive.org/details/splatterhouse_202607"}, "haunting-ground-pc-patched": {"title": "Haunting Ground PC Patched", "url": "https://archive.org/details/haunting-ground_202607"}, "captain-america-super-soldier-pc-patched": {"title": "Captain America Super Soldier PC Patched", "url": "https://archive.org/details/captain-america-super-soldier_202607"}, "dante-s-inferno-pc-patched": {"title": "Dante's Inferno PC Patched", "url": "https://archive.org/details/dantes-inferno_20260727"}, "gravity-rush-remastered-pc-patched": {"title": "Gravity Rush Remastered PC Patched", "url": "https://archive.org/details/gravity-rush_202607"}, "2010-fifa-world-cup-south-africa-pc-patched": {"title": "2010 FIFA World Cup South Africa PC Patched", "url": "https://archive.org/details/2010-fifa-world-cup-south-africa_202607"}, "asura-s-wrath-pc-patched": {"title": "Asura's Wrath PC Patched", "url": "https://archive.org/details/asuras-wrath_20260727"}, "gravity-rush-2-pc-patched": {"title": "Gravity Rush 2 PC Patched", "url": "https://archive.org/details/gravity-rush-2"}, "lost-odyssey-pc-patched": {"title": "Lost Odyssey PC Patched", "url": "https://archive.org/details/lost-odyssey_202607"}, "blue-dragon-pc-patched": {"title": "Blue Dragon PC Patched", "url": "https://archive.org/details/blue-dragon_202607"}, "rimdroid-rimworld-launcher-for-android": {"title": "RimDroid - RimWorld Launcher for Android", "url": "https://github.com/udarmolota/RimDroid"}, "automobili-lamborghini-recompilation": {"title": "Automobili Lamborghini Recompilation", "url": "https://github.com/alondero/automobililamborghini-recomp/releases/tag/v0.5.0"}, "halo-campaign-evolved-split-screen-co-op-mod": {"title": "Halo Campaign Evolved Split-Screen Co-op Mod", "url": "https://www.nexusmods.com/halocampaignevolved/mods/53"}, "surging-aura-sega-megadrive": {"title": "Surging Aura - Sega Megadrive", "url": "https://www.romhacking.net/translations/7660/"}, "diddy-kong-racing-webgpu-android-port": {"title": "Diddy Kong Racing WebGPU Android Port", "url": "https://www.mediafire.com/file/j1hc0cg224ghiky/Golden_Balloon_1.0_%25281%2529.apk/file"}, "syphon-filter-pc-port": {"title": "Syphon Filter PC Port", "url": "https://github.com/Madxbio97/SF-pc-port"}, "teknoparrot-for-android": {"title": "TeknoParrot for Android", "url": "https://github.com/teknogods/TeknoParrotUI/releases/tag/TeknoParrotUI-android"}, "super-smash-bros-64-nintendo-ds-port": {"title": "Super Smash Bros. 64 Nintendo DS Port", "url": "https://github.com/rockenrooster/Smash64DS_Port"}, "croc-definitive-edition": {"title": "Croc Definitive Edition", "url": "https://archive.org/details/croc64-1.3.0-setup"}, "mad-monks-revenge-definitive-edition": {"title": "Mad Monks Revenge Definitive Edition", "url": "https://mmr.quarkrobot.com/"}, "dominatrix-port-of-sin": {"title": "Dominatrix - Port of SiN", "url": "https://rohit.itch.io/dominatrix"}, "colditz-escape": {"title": "Colditz Escape", "url": "https://aperture-software.github.io/colditz-escape/"}, "c-dogs-sdl": {"title": "C-Dogs SDL", "url": "https://cxong.github.io/cdogs-sdl/"}, "the-legend-of-zelda-a-link-to-the-past-dual-screen-nintendo-3ds-port": {"title": "The Legend of Zelda A Link to the Past Dual Screen Nintendo 3DS Port", "url": "https://github.com/EstebanPdN/zelda-alttp-3ds"}, "the-legend-of-zelda-a-link-to-the-past-for-android": {"title": "The Legend of Zelda A Link to the Past for Android", "url": "https://github.com/Waterdish/zelda3-android"}, "crash-team-racing-for-android": {"title": "Crash Team Racing for Android", "url": "https://github.com/Simon358/ctr-native-android/releases"}, "warcraft-ii-for-android": {"title": "Warcraft II for Android", "url": "https://dos.zone/offline/warcraft-ii-android/"}, "dune-2-for-android": {"title": "Dune 2 For Android", "url": "https://dos.zone/offline/dune-2-android/"}, "xash3d-fwgs-engine-for-half-life-blue-shift-opposing-force": {"title": "Xash3D FWGS engine for Half-Life - Blue Shift - Opposing force", "url": "https://github.com/fwgs/xash3d-fwgs"}, "goldeneye-recompilation-for-android": {"title": "Goldeneye Recompilation for Android", "url": "https://github.com/jeffory/GoldenEye-Recomp/releases"}, "golden-balloon-diddy-kong-racing-recompilation": {"title": "Golden Balloon - Diddy Kong Racing Recompilation", "url": "https://github.com/akratch/golden-balloon"}, "idtech4a-engine-for-doom-iii-quake-4-prey-2006-on-android": {"title": "idTech4A++ - Engine for Doom III - Quake 4 - Prey 2006 on Android", "url": "https://github.com/glKarin/com.n0n3m4.diii4a"}, "lighthouse-banjo-kazooie-pc-port": {"title": "Lighthouse - Banjo Kazooie PC Port", "url": "https://github.com/HarbourMasters/Lighthouse/releases/tag/1.0.0"}, "source-engine-for-android": {"title": "Source Engine for Android", "url": "https://arumoon.github.io/source-engine-download/"}, "openrct2-rollercoaster-tycoon-2-for-android": {"title": "OpenRCT2 - Rollercoaster Tycoon 2 for Android", "url": "https://github.com/OpenRCT2/OpenRCT2/releases"}, "openttd-for-android": {"title": "OpenTTD for Android", "url": "https://github.com/pelya/openttd-android/releases"}, "corsixth-theme-hospital-for-android": {"title": "CorsixTH - Theme Hospital for Android", "url": "https://github.com/alanwoolley/CorsixTH-Android/releases"}, "openlara-tomb-raider-engine-for-android": {"title": "OpenLara - Tomb Raider Engine for Android", "url": "https://github.com/XProger/OpenLara"}, "zomdroid-unofficial-project-zomboid-launcher-for-android": {"title": "Zomdroid - Unofficial Project Zomboid Launcher for Android", "url": "https://github.com/udarmolota/zomdroid/releases"}, "openstarbound-for-android": {"title": "OpenStarbound for Android", "url": "https://github.com/RohanBhattacharyya/oSBM/releases"}, "super-mario-maker-world-engine-for-android": {"title": "Super Mario Maker World Engine for Android", "url": "https://gamejolt.com/games/Supermariomakerapk/704972"}, "counter-strike-1-6-for-android": {"title": "Counter Strike 1.6 for Android", "url": "https://github.com/Velaron/cs16-client"}, "unturned-for-android": {"title": "Unturned for Android", "url": "https://unturned.en.uptodown.com/android"}, "gamenative-run-supported-steam-epic-and-gog-games-locally-on-android": {"title": "GameNative - run supported Steam, Epic and GOG games locally on Android", "url": "https://gamenative.app/"}, "warsmash-warcraft-3-for-android": {"title": "Warsmash - Warcraft 3 for Android", "url": "https://f-droid.org/en/packages/net.warsmash.phone/"}, "fallout-community-edition-for-android": {"title": "Fallout Community Edition for Android", "url": "https://github.com/alexbatalov/fallout1-ce/releases/tag/v1.1.0"}, "fallout-2-community-edition-for-android": {"title": "Fallout 2 Community Edition for Android", "url": "https://github.com/alexbatalov/fallout2-ce/releases/tag/v1.3.0"}, "daggerfall-for-android": {"title": "Daggerfall for Android", "url": "https://github.com/Vwing/daggerfall-unity-android"}, "classic-core-unofficial-android-ports-of-classic-game-engines": {"title": "Classic Core - Unofficial Android Ports of Classic Game Engines", "url": "https://github.com/sandstranger/com.mobilerpgpack.phone"}, "holotz-s-castle": {"title": "Holotz's Castle", "url": "https://www.mobygames.com/game/23431/holotzs-castle/"}, "openjkdf2-dark-forces-2-for-android": {"title": "OpenJKDF2 - Dark Forces 2 for Android", "url": "https://github.com/shinyquagsire23/OpenJKDF2"}, "openxcom-for-android": {"title": "OpenXcom for Android", "url": "https://github.com/sfalexrog/openxcom-android"}, "exult-ultima-vii-for-android": {"title": "Exult - Ultima VII for Android", "url": "https://exult.sourceforge.io/"}, "arx-libertatis-arx-fatalis-for-android": {"title": "Arx Libertatis - Arx Fatalis for Android", "url": "https://obfusk.gitlab.io/jekyll-fdroid/packages/com.arxlibertatis/"}, "jagged-alliance-2-stracciatella-for-android": {"title": "Jagged Alliance 2 Stracciatella for Android", "url": "https://ja2-stracciatella.github.io/download/"}, "julius-caesar-iii-for-android": {"title": "Julius - Caesar III for Android", "url": "https://github.com/bvschaik/julius/releases/tag/v1.8.0"}, "augustus-caesar-iii-for-android": {"title": "Augustus - Caesar III for Android", "url": "https://github.com/Keriew/augustus/releases/tag/v4.0.0"}, "freeciv-for-android": {"title": "Freeciv for Android", "url": "https://github.com/zielmicha/freeciv-android"}, "pokemon-platinum-pc-port": {"title": "Pokemon Platinum PC Port", "url": "https://github.com/cybervisi0n/pokeplatinum"}, "team-fortress-2-reclassic-for-android": {"title": "Team Fortress 2 ReClassic for Android", "url": "https://files.workbench.network/srceng/TF2RC%20(TF2L)/"}, "rexuiz-for-android": {"title": "Rexuiz for Android", "url": "https://rexuiz.itch.io/rexuiz-fps"}, "super-mario-bros-remastered-for-android": {"title": "Super Mario Bros Remastered for Android", "url": "https://github.com/mircowuffwuff/super-mario-bros.-remastered-android/releases"}, "space-cadet-pinball-for-android": {"title": "Space Cadet Pinball for Android", "url": "https://ksylvestre.itch.io/space-cadet-pinball"}, "pinball-fx-go-for-android": {"title": "Pinball FX GO for Android", "url": "https://play.google.com/store/apps/details?id=com.zenstudios.ZenPinballWorld&hl=en_US"}, "sonic-roboblast-2-for-android": {"title": "Sonic Roboblast 2 for Android", "url": "https://github.com/bitten2up/SRB2-Android/releases"}, "game-collection-portal-beta-cuphead-buckshot-roulette-and-smm-we-for-android": {"title": "Game Collection - Portal Beta, Cuphead, Buckshot Roulette and SMM_WE for Android", "url": "https://www.mediafire.com/folder/kbbg5zosc7v9j/ChewAPKbackup"}, "star-trek-voyager-elite-force-single-player-for-android": {"title": "Star Trek Voyager - Elite Force Single Player for Android", "url": "https://github.com/imjustadudegamer/VoyagerSP-Android"}, "star-trek-voyager-elite-force-holomatch-for-android": {"title": "Star Trek Voyager - Elite Force Holomatch for Android", "url": "https://github.com/imjustadudegamer/VoyagerHM-Android"}, "sdlioq3a-quake-iii-for-android": {"title": "sdlioq3a - Quake III for Android", "url": "https://play.google.com/store/apps/details?id=de.fpsclasico.sdlioq3a&hl=en_IN"}, "sonic-mania-plus-for-android": {"title": "Sonic Mania Plus for Android", "url": "https://gamejolt.com/games/sonicmaniaplusports/892889"}, "sonic-the-hedgehog-forever-for-android": {"title": "Sonic the Hedgehog Forever for Android", "url": "https://gamejolt.com/games/Sonic1ForeverAndroid/817792"}, "sonic-2-absolute-for-android": {"title": "Sonic 2 Absolute for Android", "url": "https://gamejolt.com/games/gamejolt1234/955225"}, "sonic-cd-restored-for-android": {"title": "Sonic CD Restored for Android", "url": "https://gamejolt.com/games/RestoredCDAndroid/1086519"}, "render96-for-android": {"title": "Render96 for Android", "url": "https://www.reddit.com/r/AynThor/s/JlKfJ41tDC"}, "spaghetti-kart-mario-kart-64-recompilation-for-android": {"title": "Spaghetti Kart - Mario Kart 64 Recompilation for Android", "url": "https://github.com/izzy2lost/SpaghettiKart/releases/tag/v1.0.0"}, "starship-starfox-64-recompilation-for-android": {"title": "Starship - Starfox 64 Recompilation for Android", "url": "https://github.com/izzy2lost/Starship/releases/tag/v1.0.3"}, "ghostship-mario-64-recompilation-for-android": {"title": "Ghostship - Mario 64 Recompilation for Android", "url": "https://github.com/izzy2lost/Ghostship/releases/tag/1.0.1"}, "easyrpg-player-for-android": {"title": "EasyRPG Player for Android", "url": "https://easyrpg.org/player/downloads/"}, "pizza-legacy-pizza-tycoon-port": {"title": "Pizza Legacy - Pizza Tycoon Port", "url": "https://codeberg.org/cowomaly/pizzalegacy"}, "castlevania-symphony-of-the-night-recompilation": {"title": "Castlevania Symphony of the Night Recompilation", "url": "https://github.com/BlackLabelHQ/SymphonyRecomp"}, "robocop-megadrive-port": {"title": "Robocop Megadrive Port", "url": "https://bocasretrostuff.itch.io/robocop-md"}, "teenage-mutant-ninja-turtles-out-of-the-shadows-pc-patched": {"title": "Teenage Mutant Ninja Turtles - Out of the Shadows PC Patched", "url": "https://transfer.it/t/fR1Ii9oFRBgY"}, "wipeout-hd-fury-with-multiplayer-pc-patched": {"title": "Wipeout HD Fury with Multiplayer PC Patched", "url": "https://archive.org/details/wipeout-hd-rpcs3"}, "jump-force-pc-patched": {"title": "Jump Force PC Patched", "url": "https://transfer.it/t/B9VUf1hxGLAY"}, "siren-blood-curse-pc-patched": {"title": "Siren Blood Curse PC Patched", "url": "https://transfer.it/t/AvPCovlnwJpa"}, "the-legend-of-spyro-dawn-of-the-dragon-pc-patched": {"title": "The Legend of Spyro Dawn of the Dragon PC Patched", "url": "https://transfer.it/t/cTfVUEwhELjR"}, "ratchet-and-clank-quest-for-booty-pc-patched": {"title": "Ratchet and Clank Quest For Booty PC Patched", "url": "https://transfer.it/t/KnnoEQh30ZxQ"}, "spiderman-3-pc-patched": {"title": "Spiderman 3 PC Patched", "url": "https://archive.org/details/spider-man-3-repack"}, "fight-night-champion-pc-patched": {"title": "Fight Night: Champion PC Patched", "url": "https://transfer.it/t/XQwOnn5TmBya"}, "soul-calibur-iv-pc-patched": {"title": "Soul Calibur IV PC Patched", "url": "https://transfer.it/t/KuTvpZsBlDzC"}, "disgaea-d2-a-brighter-darkness-pc-patched": {"title": "Disgaea D2: A Brighter Darkness PC Patched", "url": "https://transfer.it/t/zhB2zuoVhRQR"}, "modnation-racers-pc-patched": {"title": "ModNation Racers PC Patched", "url": "https://archive.org/details/rpcs-3-latest-mod-nation-racers-online"}, "demon-s-souls-pc-patched": {"title": "Demon's Souls PC Patched", "url": "https://archive.org/details/DemonsSoulsRPCS3"}, "guitar-hero-metallica-pc-patched": {"title": "Guitar Hero Metallica PC Patched", "url": "https://transfer.it/t/RMgcNyhBmJwa"}, "bloodborne-pc-patched": {"title": "Bloodborne PC Patched", "url": "https://gofile.io/d/SN3T1I"}, "never-dead-pc-patched": {"title": "Never Dead PC Patched", "url": "https://transfer.it/t/lMaFbPg1TBRD"}, "god-of-war-3-pc-patched": {"title": "God of War 3 PC Patched", "url": "https://gofile.io/d/MmVHsU"}, "dragon-s-crown-pc-patched": {"title": "Dragon's Crown PC Patched", "url": "https://transfer.it/t/UkkS9qsBXLrR"}, "darkenstein-3d": {"title": "Darkenstein 3D", "url": "https://store.steampowered.com/app/2195910/Darkenstein_3D/"}, "vandal-hearts-pc-port": {"title": "Vandal Hearts PC Port", "url": "https://github.com/HalmyLyseas/VandalHearts-PcPort"}, "mobileuo-ultima-online-mobile-port": {"title": "MobileUO - Ultima Online Mobile Port", "url": "https://www.mobileuo.com/"}, "pokemon-everworld-online": {"title": "Pokemon Everworld Online", "url": "https://pokeeverworldonline.com/"}, "aleph-one-marathon-trilogy-for-android": {"title": "Aleph One - Marathon Trilogy for Android", "url": "https://github.com/daniele-rapagnani/alephone-android"}, "supreme-commander-forged-alliance-forged-alliance-forever": {"title": "Supreme Commander Forged Alliance - Forged Alliance Forever", "url": "https://www.faforever.com/"}, "pokemon-brown-3d": {"title": "Pokemon Brown 3D", "url": "https://rainbowdevs.com/title/brown-3d/"}, "harvest-moon-64-recompilation-with-dual-screen-support-for-android": {"title": "Harvest Moon 64 Recompilation with Dual Screen Support for Android", "url": "https://github.com/igawa6/HarvestMoon64Recomp/releases/"}, "dusklight-the-legend-of-zelda-twilight-princess-recompilation-for-android": {"title": "Dusklight - The Legend of Zelda Twilight Princess Recompilation for Android", "url": "https://github.com/TwilitRealm/dusklight/releases"}, "sonic-triple-trouble-for-android": {"title": "Sonic Triple Trouble for Android", "url": "https://gamejolt.com/games/sonictripletrouble16bit/322794"}, "condemned-2-bloodshot-recompilation": {"title": "Condemned 2: Bloodshot Recompilation", "url": "https://github.com/psxrestore/Condemned2Recomp"}, "london-seirei-tanteidan-playstation": {"title": "London Seirei Tanteidan - Playstation", "url": "https://github.com/bigbanana23/london-seirei-tanteidan"}, "godzilla-pc-patched": {"title": "Godzilla PC Patched", "url": "https://transfer.it/t/mtvSiTgXDbQK"}, "syphon-filter-2-recompilation": {"title": "Syphon Filter 2 Recompilation", "url": "https://github.com/Alexbeav/syphon-filter-2-recompiled/releases/tag/v0.1.1-alpha"}, "am2r-autopatcher-for-android": {"title": "AM2R Autopatcher for Android", "url": "https://github.com/am2r-android/AM2R-Autopatcher-Android"}, "banjo-kazooie-switch-port": {"title": "Banjo Kazooie Switch Port", "url": "https://github.com/PalindromicBreadLoaf/Docklight"}, "doom-64-switch-port": {"title": "Doom 64 Switch Port", "url": "https://www.gamebrew.org/wiki/Doom64EX_Switch"}, "super-mario-64-switch-port": {"title": "Super Mario 64 Switch Port", "url": "https://github.com/fgsfdsfgs/sm64ex"}, "the-legend-of-zelda-majoras-mask-switch-port": {"title": "The Legend of Zelda Majoras Mask Switch Port", "url": "https://github.com/YoshiCrystal9/2ship2harkinian-Switch"}, "the-legend-of-zelda-majoras-mask-wii-u-port": {"title": "The Legend of Zelda Majoras Mask Wii U Port", "url": "https://github.com/HarbourMasters/2ship2harkinian-WiiU"}, "perfect-dark-psp-port": {"title": "Perfect Dark PSP Port", "url": "https://github.com/z2442/perfect_dark-PSP"}, "super-mario-64-ps4-port": {"title": "Super Mario 64 PS4 Port", "url": "https://github.com/mindfreakdev/sm64-ps4-osirizx"}, "perfect-dark-3ds-port": {"title": "Perfect Dark 3DS Port", "url": "https://archive.org/details/perfectdark3ds"}, "super-mario-64-3ds-port": {"title": "Super Mario 64 3DS Port", "url": "https://github.com/mkst/sm64-port/tree/3ds-port"}, "super-mario-64-nintendo-dsi-port": {"title": "Super Mario 64 Nintendo DSi Port", "url": "https://github.com/Hydr8gon/sm64"}, "banjo-kazooie-vr": {"title": "Banjo Kazooie VR", "url": "https://github.com/RaYRoD-TV/BanjoKazooie-VR"}, "super-mario-64-vr": {"title": "Super Mario 64 VR", "url": "https://github.com/RaYRoD-TV/sm64coopdx-vr"}, "mario-kart-64-vr": {"title": "Mario Kart 64 VR", "url": "https://github.com/RaYRoD-TV/MarioKart64-VR"}, "star-fox-64-vr": {"title": "Star Fox 64 VR", "url": "https://github.com/RaYRoD-TV/StarFox64-VR"}, "sonic-robo-blast-2-vr": {"title": "Sonic Robo Blast 2 VR", "url": "https://github.com/RaYRoD-TV/SRB2-VR"}, "dr-robotnik-s-ring-racers-vr": {"title": "Dr. Robotnik's Ring Racers VR", "url": "https://github.com/RaYRoD-TV/RingRacers-VR"}, "port-of-the-xash3d-fwgs-half-life-engine-to-oculus-quest": {"title": "Port of the Xash3D-FWGS Half Life Engine to Oculus Quest", "url": "https://github.com/Team-Beef-Studios/Lambda1VR"}, "quake-vr": {"title": "Quake VR", "url": "https://github.com/Team-Beef-Studios/QuakeQuest"}, "quake-2-on-the-oculus-quest": {"title": "Quake 2 on the Oculus Quest", "url": "https://github.com/Team-Beef-Studios/Quake2Quest"}, "doom-3-vr": {"title": "Doom 3 VR", "url": "https://github.com/Team-Beef-Studios/Doom3Quest"}, "return-to-castle-wolfenstein-for-the-oculus-quest": {"title": "Return to Castle Wolfenstein for the Oculus Quest", "url": "https://github.com/Team-Beef-Studios/RTCWQuest"}, "jedi-knight-games-on-openxr-devices": {"title": "Jedi Knight games on OpenXR Devices", "url": "https://github.com/Team-Beef-Studios/JKXR"}, "tomb-raider-vr": {"title": "Tomb Raider VR", "url": "https://github.com/Team-Beef-Studios/BeefRaiderXR"}, "prey-vr": {"title": "Prey VR", "url": "https://sidequestvr.com/app/23478/prey-vr"}, "razexr-duke-nukem-3d-blood-shadow-warrior-etc": {"title": "RazeXR - Duke Nukem 3D, Blood, Shadow Warrior, etc", "url": "https://github.com/Team-Beef-Studios/RazeXR"}, "questzdoom-doom-heretic-hexen-strife-etc": {"title": "QuestZDoom - DOOM, Heretic, Hexen, Strife, etc", "url": "https://github.com/Team-Beef-Studios/QuestZDoom?utm_source=chatgpt.com"}, "metal-gear-solid-fan-remake": {"title": "Metal Gear Solid Fan Remake", "url": "https://youtu.be/VgvFT43zUYI?si=y7qVvSA_xKXbZ4kd"}, "the-legend-of-zelda-ocarina-of-time-vr": {"title": "The Legend of Zelda Ocarina of Time VR", "url": "https://github.com/ShinyWindow/Shipwright-VR"}, "sega-vs-capcom": {"title": "SEGA VS CAPCOM", "url": "https://4cydestudios.com/game/sega-vs-capcom"}, "infinity-blade-for-android": {"title": "Infinity Blade for Android", "url": "https://archive.org/details/infinity-blade-android"}, "pokemon-dark-rising-remake": {"title": "Pokemon Dark Rising Remake", "url": "https://eeveeexpo.com/threads/9603/"}, "ys-iii-wanderers-playstation-2": {"title": "Ys III Wanderers - Playstation 2", "url": "https://github.com/Kaisaan/wanderers/releases/tag/v1.0"}, "ys-v-lost-kefin-playstation-2": {"title": "Ys V Lost Kefin - Playstation 2", "url": "https://github.com/Kaisaan/lostkefin"}, "messenger": {"title": "Messenger", "url": "https://messenger.abeto.co/"}, "dusklight-the-legend-of-zelda-twilight-princess-recompilation-in-browser": {"title": "Dusklight - The Legend of Zelda Twilight Princess Recompilation in Browser", "url": "https://dusklight.pages.dev/"}, "the-elder-scrolls-iii-morrowind-openmw-in-browser": {"title": "The Elder Scrolls III Morrowind – OpenMW in Browser", "url": "https://morrowind.virtastic.app/"}, "half-life-2-in-browser": {"title": "Half-Life 2 in Browser", "url": "https://hl2.slqnt.dev/"}, "portal-in-browser": {"title": "Portal in Browser", "url": "https://yikes.pw/portal/"}, "diablo-in-browser": {"title": "Diablo in Browser", "url": "https://d07riv.github.io/diabloweb/"}, "3d-pinball-space-cadet-in-browser": {"title": "3D Pinball Space Cadet in Browser", "url": "https://ksylvestre.itch.io/space-cadet-pinball"}, "wipeout-in-browser": {"title": "Wipeout in Browser", "url": "https://phoboslab.org/wipegame/"}, "doom-webprboom-in-browser": {"title": "Doom – WebPrBoom in Browser", "url": "https://raz0red.github.io/webprboom/"}, "doom-3-demo-in-browser": {"title": "Doom 3 Demo in Browser", "url": "https://wasm.continuation-labs.com/d3demo/"}, "quake-quake-wasm-in-browser": {"title": "Quake – Quake WASM in Browser", "url": "https://qwasm.m-h.org.uk/"}, "quake-2-quake-wasm2-in-browser": {"title": "Quake 2 – Quake WASM2 in Browser", "url": "https://qwasm2.m-h.org.uk/"}, "arx-fatalis-arxwasm-demo-in-browser": {"title": "Arx Fatalis – Arxwasm Demo in Browser", "url": "https://wasm.continuation-labs.com/arxdemo/"}, "homeworld-gardens-of-kadesh-demo-in-browser": {"title": "Homeworld - Gardens of Kadesh Demo in Browser", "url": "https://gardens-of-kadesh.gitlab.io/gardens-of-kadesh/"}, "cave-story-in-browser": {"title": "Cave Story in Browser", "url": "https://midzer.de/wasm/cavestory/"}, "commander-keen-in-browser": {"title": "Commander Keen in Browser", "url": "https://www.jamesfmackenzie.com/chocolatekeen/"}, "cro-mag-rally-in-browser": {"title": "Cro-Mag Rally in Browser", "url": "https://midzer.de/wasm/cromagrally/"}, "descent-descent-ii-dxx-rebirth-in-browser": {"title": "Descent Descent II – DXX-Rebirth in Browser", "url": "https://midzer.de/wasm/descent1/"}, "duke-nukem-3d-belgian-chocolate-duke3d-in-browser": {"title": "Duke Nukem 3D – Belgian Chocolate Duke3D in Browser", "url": "https://midzer.de/wasm/duke3d/"}, "fallout-nevada-sonora-in-browser": {"title": "Fallout Nevada Sonora in Browser", "url": "https://fallout-nevada.ru/#/en"}, "might-and-magic-ii-fheroes2-in-browser": {"title": "Might and Magic II - fheroes2 in Browser", "url": "https://midzer.de/wasm/heroes2/"}, "prince-of-persia-in-browser": {"title": "Prince of Persia in Browser", "url": "https://princejs.com/"}, "tyrian-opentyrian-in-browser": {"title": "Tyrian – OpenTyrian in Browser", "url": "https://midzer.de/wasm/opentyrian/"}, "tomb-raider-in-browser": {"title": "Tomb Raider in Browser", "url": "http://xproger.info/projects/OpenLara/"}, "super-monkey-ball-in-browser": {"title": "Super Monkey Ball in Browser", "url": "https://monkeyball-online.pages.dev/"}, "tetris-in-browser": {"title": "Tetris in Browser", "url": "https://mehmetmhy.github.io/tetris/"}, "the-last-of-us-demake-in-browser": {"title": "The Last of Us Demake in Browser", "url": "https://mirtilowgames.itch.io/the-last-of-us-demastered"}, "cyberpunk-2077-vr": {"title": "Cyberpunk 2077 VR", "url": "https://www.nexusmods.com/cyberpunk2077/mods/30093"}, "call-of-duty-4-modern-warfare-vr": {"title": "Call of Duty 4 Modern Warfare VR", "url": "https://github.com/jplakon/CallOfDuty4_VR/releases"}, "bioshock-remastered-vr": {"title": "BioShock Remastered VR", "url": "https://github.com/mohamad-balouza/bioshock-vr"}, "skyrim-vr": {"title": "Skyrim VR", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/107333"}, "resident-evil-requiem-vr": {"title": "Resident Evil Requiem VR", "url": "https://www.nexusmods.com/residentevilrequiem/mods/1017?tab=videos"}, "silent-hill-2-vr": {"title": "Silent Hill 2 VR", "url": "https://github.com/jbusfield/SH2_UEVR/releases/tag/v1.0.0"}, "call-of-duty-black-ops-zombies-for-android": {"title": "Call of Duty Black Ops Zombies for Android", "url": "https://github.com/eugene373/COD-BOZ-Partially-Decompiled/releases/tag/v0.3-s3e-tools"}, "donkey-kong-land-pc-remake": {"title": "Donkey Kong Land PC Remake", "url": "https://drive.google.com/file/d/1bvBYmbFtw1q-0lG1tKivm3c610-pCS4P/view"}, "the-legend-of-zelda-breath-of-the-wild-vr": {"title": "The Legend of Zelda Breath of the Wild VR", "url": "https://github.com/Crementif/BotW-BetterVR"}, "command-and-conquer-generals-in-browser": {"title": "Command & Conquer Generals in Browser", "url": "https://generals.wasm.com.br/"}, "doom-2-in-doom-3": {"title": "Doom 2 in Doom 3", "url": "https://www.moddb.com/mods/doom-ii-for-doom-3"}, "zquest-classic-in-browser": {"title": "ZQuest Classic in Browser", "url": "https://web.zquestclassic.com/play/"}, "surreal-engine-web-unreal-ut99-in-browser": {"title": "Surreal Engine Web – Unreal UT99 in Browser", "url": "https://demensdeum.com/demos/SurrealEngine/"}, "f-zero-x-pc-port": {"title": "F-Zero X PC Port", "url": "https://github.com/Zorkats/G-Diffuser"}, "diddy-kong-racing-recompilation": {"title": "Diddy Kong Racing Recompilation", "url": "https://github.com/ThatGuyMcd/DKR-R"}, "f-e-a-r-2-project-origin-vr-mod": {"title": "F.E.A.R. 2: Project Origin VR Mod", "url": "https://github.com/praydog/FEAR2VR"}, "asobi-remote-play-stream-ps-plus-games-to-steam-deck-or-steam-machine": {"title": "Asobi: Remote Play - Stream PS Plus games to Steam Deck or Steam Machine", "url": "https://store.steampowered.com/app/4505440/Asobi_Remote_Play/"}, "unreal-tournament-vr": {"title": "Unreal Tournament VR", "url": "https://ut99vr.pages.dev/"}, "super-mario-64-ds-pc-port": {"title": "Super Mario 64 DS PC Port", "url": "https://tangos.dev/downloads"}, "sonic-the-hedgehog-2006-android-port": {"title": "Sonic the Hedgehog 2006 Android Port", "url": "https://github.com/Player124413/MarathonRecomp_android-test-edition/releases"}, "pokemon-gold-pc-port": {"title": "Pokemon Gold PC Port", "url": "https://github.com/bryanthaboi/gen1recomp"}, "pokemon-gold-port-for-android": {"title": "Pokemon Gold Port for Android", "url": "https://github.com/bryanthaboi/gen1recomp"}, "battlefield-1942-vr": {"title": "Battlefield 1942 VR", "url": "https://github.com/JayBiggsGMG/BFVR-Battlefield-1942-VR-Mod/releases/tag/v1.0.0"}, "ace-combat-6-recompilation": {"title": "Ace Combat 6 Recompilation", "url": "https://github.com/sal063/AC6_recomp"}, "metroid-prime-origins": {"title": "Metroid Prime Origins", "url": "https://www.reddit.com/r/Metroid/s/23ukkKGon4"}, "the-legend-of-zelda-z-for-2-two-player-simultaneous-co-op": {"title": "The Legend of Zelda: Z for 2 - Two Player Simultaneous Co-Op", "url": "https://www.romhacking.net/hacks/9882/"}, "spyro-the-dragon-recompilation": {"title": "Spyro the Dragon Recompilation", "url": "https://openpete.com/"}, "twisted-metal-4-recompilation": {"title": "Twisted Metal 4 Recompilation", "url": "https://github.com/TechnicallyComputers/TwistedMetal4Recomp"}, "the-legend-of-zelda-the-minish-cap-3ds-port": {"title": "The Legend of Zelda The Minish Cap 3DS Port", "url": "https://github.com/EstebanPdN/zelda-tmc-3ds"}, "1-the-multiverse-vr-hub": {"title": "1 The Multiverse VR Hub", "url": "https://github.com/RaYRoD-TV/MVRH"}, "untitled-sonic-fangame": {"title": "Untitled Sonic Fangame", "url": "https://liquafusion.itch.io/untitled-sonic-fangame"}, "mario-kart-64-3ds-port": {"title": "Mario Kart 64 3DS Port", "url": "https://github.com/EstebanPdN/mario-kart-64-3ds"}, "street-fighter-aplha-3-recompilation": {"title": "Street Fighter Aplha 3 Recompilation", "url": "https://github.com/TechnicallyComputers/Street-Fighter-Alpha-3-Recomp"}, "zenonia-3-ps-vita-port": {"title": "Zenonia 3 PS Vita Port", "url": "https://github.com/MetalSyntax/zenonia3-psvita-port"}, "crash-bandicoot-for-android": {"title": "Crash Bandicoot for Android", "url": "https://github.com/Matteo842/CrashBandicoot-Launcher/releases"}, "world-of-warcraft-for-android": {"title": "World of Warcraft for Android", "url": "https://github.com/marcocastignoli/wow-mobile"}, "ace-combat-x-recompilation": {"title": "Ace Combat X Recompilation", "url": "https://github.com/sal063/Ace-Combat-X-Recompilation"}, "gta-vice-city-stories-recompilation": {"title": "GTA: Vice City Stories Recompilation", "url": "https://github.com/jessicanataliagta/PSPRecomp/tree/main/profiles/vcs"}, "tama-adventurous-ball-in-giddy-labyrinth-sega-saturn": {"title": "Tama: Adventurous Ball in Giddy Labyrinth - Sega Saturn", "url": "https://github.com/ExxistanceDC/Tama-English-Translation"}, "hissatsu-sega-saturn": {"title": "Hissatsu! - Sega Saturn", "url": "https://github.com/ExxistanceDC/Hissatsu-English-Translation"}, "pokemon-blue-vr": {"title": "Pokemon Blue VR", "url": "https://youtu.be/oY_3Uvyjy_k?si=xjiXCeK6Tx15zW20"}, "ridge-racer-collection": {"title": "Ridge Racer Collection", "url": "https://github.com/wanszai/Ridge-Racer-Collection"}, "spaghetti-kart-mario-kart-64-pc-port-track-editor": {"title": "Spaghetti Kart - Mario Kart 64 PC Port Track Editor", "url": "https://trackeditor.goodhouseinc.com/"}, "baldur-s-gate-2-enhanced-edition-ps-vita-port": {"title": "Baldur's Gate 2: Enhanced Edition PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1454"}, "hollow-knight-silksong-for-android": {"title": "Hollow Knight: Silksong for Android", "url": "https://apkvision.org/games/action/hollow-knight-silksong-130787/"}, "jeb-s-legend-of-zelda": {"title": "Jeb's Legend of Zelda", "url": "https://gamejolt.com/games/jzelda_woohoo/1043660"}, "outertale-project-spacetime": {"title": "Outertale - Project Spacetime", "url": "https://gamejolt.com/games/outertale/643082"}, "five-nights-at-frickbear-s-3": {"title": "Five Nights At Frickbear's 3", "url": "https://gamejolt.com/games/frickbears3/930477"}, "pokemon-gamma-emerald-early-access": {"title": "Pokemon Gamma Emerald - Early Access", "url": "https://undreamedpanic.itch.io/gamma-emerald-ea"}, "prey-2017-co-op": {"title": "Prey 2017 Co-op", "url": "https://www.nexusmods.com/prey2017/mods/218?tab=description"}, "castlevania-symphony-of-the-night-for-android": {"title": "Castlevania: Symphony of the Night for Android", "url": "https://github.com/sergiomanzur/SymphonyRecomp/releases/tag/android-v0.9b"}, "goldeneye-007-random-eye-zer-mod": {"title": "Goldeneye 007 Random-Eye-zer Mod", "url": "https://www.moddb.com/mods/random-eye-the-true-randomizer"}, "outlast-vr": {"title": "Outlast VR", "url": "https://www.patreon.com/dhalcyon/posts/nowhere-to-hide-165840706"}, "mine64-minecraft-for-n64-in-browser": {"title": "Mine64 - Minecraft for N64 in Browser", "url": "https://mine64.c0di.com/"}, "sim-copter-reimplementation": {"title": "Sim Copter Reimplementation", "url": "https://github.com/JamesIV4/sim-copter-remake"}, "dusklight-the-legend-of-zelda-twilight-princess-vr": {"title": "Dusklight - The Legend of Zelda Twilight Princess VR", "url": "https://github.com/JoeyAW/dusklight-vr/releases/"}, "rage-racer-pc-port": {"title": "Rage Racer PC Port", "url": "https://github.com/khasinski/rage-racer-pc"}, "pokemon-dawn-of-darkness-mmorpg": {"title": "Pokemon Dawn of Darkness MMORPG", "url": "https://pdod.dev/"}, "metroid-prime-hunters-recompilation": {"title": "Metroid Prime Hunters Recompilation", "url": "https://github.com/mstan/MetroidPrimeHuntersRecomp"}, "dragon-ball-z-buu-s-fury-recompilation": {"title": "Dragon Ball Z: Buu's Fury Recompilation", "url": "https://github.com/mstan/DragonBallZBuusFuryRecomp"}, "chonkcraft-warcraft-2-rebuilt": {"title": "ChonkCraft - Warcraft 2 Rebuilt", "url": "https://chonkbase.net/chonkcraft/"}, "street-fighter-3-3rd-strike-online-edition-recompilation": {"title": "Street Fighter 3: 3rd Strike Online Edition Recompilation", "url": "https://github.com/updeshxp/SF3TSOEReborn"}, "jackie-chan-stuntmaster-pc-port": {"title": "Jackie Chan Stuntmaster PC Port", "url": "https://github.com/GABRIELNNK/ReChan"}, "jackie-chan-stuntmaster-pc-port-steam-deck-fork": {"title": "Jackie Chan Stuntmaster PC Port - Steam Deck Fork", "url": "https://github.com/GABRIELNNK/ReChan/releases/tag/ReChan_v1.0.2-beta_Steamdeck"}, "fallout-new-vegas-tale-of-two-wastelands": {"title": "Fallout New Vegas: Tale of Two Wastelands", "url": "https://taleoftwowastelands.com/"}, "sonic-4-episode-1-in-browser": {"title": "Sonic 4 Episode 1 in Browser", "url": "https://wamwoowam.co.uk/sonic4/"}, "sonic-the-hedgehog-for-android": {"title": "Sonic the Hedgehog for Android", "url": "https://sonic-the-hedgehog.en.uptodown.com/android"}, "sonic-the-hedgehog-2-for-android": {"title": "Sonic the Hedgehog 2 for Android", "url": "https://sonic-the-hedgehog-2-classic.en.uptodown.com/android"}, "lighthouse-banjo-kazooie-port-for-android": {"title": "Lighthouse - Banjo Kazooie Port for Android", "url": "https://github.com/izzy2lost/Lighthouse/releases/tag/1.0.2"}, "lighthouse-banjo-kazooie-ps-vita-port": {"title": "Lighthouse - Banjo Kazooie PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1468"}, "tony-hawk-s-project-8-recompilation": {"title": "Tony Hawk's Project 8 Recompilation", "url": "https://github.com/theokyr/Project8Recomp"}, "mega-man-x-regenesis": {"title": "Mega Man X Regenesis", "url": "https://mmxregenesis.itch.io/mega-man-x-regenesis"}, "grand-theft-auto-vice-city-vr": {"title": "Grand Theft Auto Vice City VR", "url": "https://github.com/dubrovskiy-yevhen-stakelogic/vice-city-vr-quest/tree/master"}, "minecraft-story-mode-ps-vita-port": {"title": "Minecraft: Story Mode PS Vita Port", "url": "https://github.com/LeZergan/mcsm-vita"}, "zelda-ii-the-adventure-of-link-co-op": {"title": "Zelda II: The Adventure of Link Co-op", "url": "https://retrohackers.net/hack-details.php?id=5243"}, "resident-evil-4-vr": {"title": "Resident Evil 4 VR", "url": "https://re4vr.com/"}, "jedi-knight-dark-forces-ii-xbox-port": {"title": "Jedi Knight: Dark Forces II Xbox Port", "url": "https://github.com/GTTeancum/OpenJKDF2ogx"}, "yu-gi-oh-forbidden-memories-recompilation": {"title": "Yu-Gi-Oh! Forbidden Memories Recompilation", "url": "https://github.com/Unchiga/YuGiOhForbiddenMemoriesRecomp"}, "dontforget": {"title": "DONTFORGET", "url": "https://rickygdev.itch.io/dontforget"}, "ribbit-the-deltarune-mod": {"title": "RIBBIT - The Deltarune Mod", "url": "https://gamejolt.com/games/ribbitmod/671888"}, "kirby-battle-blitz": {"title": "Kirby Battle Blitz!", "url": "https://gamejolt.com/games/KBB/578480"}, "mega-man-8-bit-deathmatch": {"title": "Mega Man 8-Bit Deathmatch", "url": "https://mm8bdm.net/home"}, "off": {"title": "OFF", "url": "https://off.fandom.com/wiki/Downloads#Version_3.0_Downloads"}, "freeciv-in-browser": {"title": "FreeCiv in Browser", "url": "https://webciv.org/webclient/?action=new&type=singleplayer&utm"}, "dune-2-in-browser": {"title": "Dune 2 in Browser", "url": "https://dune2js.com/"}, "kiki-the-nano-bot-in-browser": {"title": "Kiki the Nano Bot in Browser", "url": "https://transmutrix.itch.io/kiki-the-nanobot"}, "moon-child-fe-in-browser": {"title": "Moon Child FE in Browser", "url": "https://mors-games.itch.io/moon-child-fe"}, "undertale-2": {"title": "Undertale 2", "url": "https://pep.itch.io/undertale-2"}, "deltatraveler-deltarune-interdream": {"title": "Deltatraveler - Deltarune Interdream", "url": "https://interdream.teamcinnabun.com/other/"}, "skate-3-recompilation-for-android": {"title": "Skate 3 Recompilation for Android", "url": "https://github.com/Buku313/Skate3-Mobile"}, "castlevania-mx": {"title": "Castlevania MX", "url": "https://www.moddb.com/games/castlevania-mx"}, "project-gotham-racing-4-recompilation": {"title": "Project Gotham Racing 4 Recompilation", "url": "https://github.com/beatrixzy/PGR4-Recomp"}, "dragon-quest-viii-masterpiece-reborn-pc-port": {"title": "Dragon Quest VIII: Masterpiece Reborn PC Port", "url": "https://www.romhacking.net/forum/index.php?topic=34365.msg443220#msg443220"}, "dragon-quest-viii-masterpiece-reborn-for-android": {"title": "Dragon Quest VIII: Masterpiece Reborn for Android", "url": "https://www.romhacking.net/forum/index.php?topic=34365.msg426869#msg426869"}, "amnesia-the-dark-descent-for-android": {"title": "Amnesia: The Dark Descent for Android", "url": "https://createam.itch.io/sclerosis"}, "penumbra-black-plague-for-android": {"title": "Penumbra: Black Plague for Android", "url": "https://createam.itch.io/antumbra"}, "grand-theft-auto-vice-city-in-browser": {"title": "Grand Theft Auto Vice City in Browser", "url": "https://revc.wasm.ltd/"}, "virtua-cop-2-vr": {"title": "Virtua Cop 2 VR", "url": "https://github.com/NeuralF/Rea-Virtua-Cop-2-VR"}, "openxcom-nintendo-3ds-port": {"title": "OpenXCOM Nintendo 3DS Port", "url": "https://github.com/TheRumble/OpenXCOM-3DS"}, "command-and-conquer-64-pc-port": {"title": "Command & Conquer 64 PC Port", "url": "https://cnc3dgame.com/"}, "star-wars-masters-of-teras-kasi-recompilation": {"title": "Star Wars: Masters of Teras Kasi Recompilation", "url": "https://github.com/TechnicallyComputers/MastersOfTerasKasiRecomp"}, "rampage-through-time-recompilation": {"title": "Rampage Through Time Recompilation", "url": "https://github.com/TechnicallyComputers/Rampage---Through-Time-Recomp"}, "system-shock-for-android": {"title": "System Shock for Android", "url": "https://github.com/raposomiguel50/system-shock-android"}, "red-faction-vr": {"title": "Red Faction VR", "url": "https://github.com/CactusVRStudios/alpinefactionVR"}, "rpg-maker-ds-create-the-new-world-nintendo-ds": {"title": "RPG Maker DS+ Create the New World - Nintendo DS", "url": "https://romhackplaza.org/translations/rpg-maker-ds-create-the-new-world-english-translation-nintendo-ds"}, "hollow-knight-silksong-dual-screen-android-port": {"title": "Hollow Knight: Silksong Dual-Screen Android Port", "url": "https://github.com/jakobkhansen/SilksongAndroid"}, "doom-64-ray-tracing": {"title": "Doom 64 Ray Tracing", "url": "https://github.com/jlrouzies-fr/doom64-rt"}, "bloody-roar-2-recompilation": {"title": "Bloody Roar 2 Recompilation", "url": "https://github.com/novapowers0/BloodyRoar2Recomp"}, "terraria-in-browser": {"title": "Terraria in Browser", "url": "https://terraria.mercurywork.shop/"}, "celeste-in-browser": {"title": "Celeste in Browser", "url": "https://celeste.r58playz.dev/"}};
\ No newline at end of file
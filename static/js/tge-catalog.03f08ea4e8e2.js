@@ -0,0 +1 @@
+window.TGE_CATALOG_DATA={"t":["Advance Wars Returns","Age of the Ring","Alleys of Anime 2","All Hell Unleashed","Altered Beast Remake","AM2R","AMC Squad","Awful Emblem","Banjo Kazooie Nostalgia 64","Banjo Kazooie The Corrupted Jiggys","Banjo Kazooie The Lair Witch Project","Barkley Gaiden: The Son of Dark Draker","Barkley: Shut Up and Jam! Gaiden","Battle Stormer Classics","Bit of War - God of War Demake","Blaster Master SNES Port","Blink 182 N64","Bloodborne PSX Demake","Bound to the Dark World","Bubble Bobble C64 Remastered","Capcom Vs Square: Parallel Destinies","Capoeira Fighter 3 Legacy Edition","Captain America and The Avengers Remake","Card Miner","Castlemania 2","Castlevania AGA","Castlevania: Alternate Scarlet Symphony","Castlevania Chronicles II: Simon's Quest","Castlevania Chronicles III: Dracula's Curse","Castlevania - Eternity of Sorrow","Castlevania Haunted Castle 2","Castlevania Haunted Castle 3 Trevor's Quest","Castlevania Maria Renard's Revenge for Sega Saturn","Castlevania ReVamped","Castlevania: Rondo of the Night","Castlevania SNES Port","Castlevania II Simon's Quest SNES Port","Castlevania Symphony of the Night Ultimate","Castlevania The Lecarde Chronicles","Castlevania The Lecarde Chronicles 2","Celeste 64","Celeste Mario's Zap & Dash DELUXE!","Chainsawman","Chip N Dale SNES Port","Chrono Trigger: Prophet's Guile","Clock Tower Advance","Club Penguin Journey","Color A Dinosaur SNES Port","Command & Conquer Combined Arms","Contra Force SNES Port","Contra SNES Port","Crash Team racing: Retro Fueled","Cry of Fear","DC Task Force","DC Vs Marvel 2025","Dead Space Demake","Digimon World 2 Alternative","Discworld Noir","Donkey Kong Country 4 NES","Doom roguelike","Doom RPG","Doom 2 RPG","DoomScroll - Browse, Preview and Play Thousands of User-Made Doom WADS","Doom 32X Resurrection","Double Dragon One","Double Dragon SNES Port","Double Dragon 2 SNES Port","Dr. Mario Mania","Dr. Robotnik's Ring Racer + Editor","Dragons' Dogma Online","Dragon Quest 1 Remake","Driving Strikers N64 Port","Duck Tales SNES Port","Earthbound Halloween Hack","Elden Ring Gameboy Demake","Fable 20th Anniversary Demake","Famicom Fighters","Famidash","Fightcade - a matchmaking application for playing retro games online","Final Fantasy 6 Brave New World","Final Fantasy Renaissance","Final Fantasy Tactics 1.3","Final Fight MD","Fire Emblem: The Four Kings","Fire Emblem: The Last Promise","Fire Emblem: Vision Quest","Five Nights At Freddy's - Playstation Demake","Five Nights At Freddy's 2 - Playstation Demake","Five Nights At Freddy's 2 - Wii U Port","FSO - Freespace 2 Open","F-Zero Beginnings","F-Zero Deluxe","F-Zero X Climax","G-Zero","Game Over: Elysium","Ghosts n Demons","Goldfinger 64","Golden Axe Returns","GTA 2 Configuration Guide - Steam Deck","Guitar Hero World Tour Definitive Edition","Halo Zero","Harry Potter Unreal","Hayato's Journey","He-Man","Holocure","Hyper Dragon Ball Z","Infested Island","Infinity Nikki on Steam Deck","Invincible","Jedi Knight Dark Forces 2 Unreal Engine","Jumping Flash Doom 2.0","Kid Icarus SNES Port","Kirby Air Ride Deluxe","Kirby's Dream Land DX","Kirby's Dream Land 2 DX","Labyrinth of the Dragon","Left 4 Dead 2 Beta Restoration Project","Lethalmon","Licar","Life Force Salamander SNES Port","Life is Strange Love is Strange","UFO: Alien Invasion","N64RecompLauncher","Make a Good Mega Man Level","Maldita Castilla","Manic Miners - A LEGO Rock Raiders Remake","Mari0","Mario Adventure3","Mario Builder 64","Mario's Final Adventure","Mario Golf N64 - Pro Edition 1.1","Mario Kart Wii Deluxe","Mario's Modules","Mario Party Netplay","Mario Syndrome","Marvel Heroes Omega Project TAHITI","Marvel Heroes Server Emulator","Marvel Infinity War","Maximum Carnage Remake","Mega Man SNES Port","Mega Man 2.5D","Mega Man 2 SNES Port","Mega Man 3 SNES Port","Mega Man 4 SNES Port","Mega Man 5 SNES Port","Mega Man 6 SNES Port","Mega Man 8X Demake 16bit","Mega Man Arena","Mega Man Legends - Rockman DASH: Great adventureon 5 Islands","Mega Man Maker","Mega Man Revamped","Mega Man 2 Revamped","Mega Man 3 Revamped","Mega Man Rock N Roll","Mega Man Unlimited","Mega Man World 3 DX","Mega Man World 4 DX","Mega Man World 5 DX","Mega Man X: Omega Blaster Ultimate Edition","Mega Man X4 Knot Beret","Mega Pang - Megadrive Genesis Port of Super Pang","Mega Serval","Mega Splatterhouse","Metal Gear - Mega Drive Port","Metal Slug Counter","Metroid Desolation","Metroid SNES Port","Metroid Super Zero Mission","Mighty Final Fight Forever","Mike Tyson's Punch Out!!! SNES Port","Mini Doom 2","Mole Mania DX","Monster Hunter Freedom Unite Complete","Monster Hunter Frontier Z - Steam Deck Guide","Moonring","Mortal Kombat II Arkade Edition NES","Mortal Kombat Defenders of The Earth","Mother 2 Deluxe","Mushroom Kingdom Fusion","Mystery of Solarus DX - Zelda Link to the Past fan game - NB game needs to be in .zip format when adding to Solarus Launcher!!","NBA Jam 50","Need For Speed 3 Hot Pursuit Next Gen Patch","Need For Speed Most Wanted Redux V3","Newer Super Mario Bros. Wii","NFL Blitz 2026","NFL Street Reborn","NHL '94 2024 Edition","Nightmare Kart","NightVein","Ninja Gaiden Shadow DX","Ninja Gaiden Trilogy SNES Port","Not Tetris 2","Order 66: A Fire Emblem Hack","Outrun - Cannonball","Outrun - Gameboy Colour Port","Paratopic - Wii U Port","Phantasy Star Online Blue Burst on Steam Deck","PlayStation Home","PokeMMO","Pokemon Dark Rising","Pokemon Emerald Seaglass","Pokemon Gadir Deluxe","Pokemon Gamma Emerald","Pokemon Infinite Black 2","Pokemon Infinite Fusion","Pokemon Lazarus","Pokemon Luminescent Platinum","Pokemon Super Mystery Dungeon Story: Echoes of Yesterday","Pokemon Odyssey","Pokemon Prism","Pokemon Rejuvenation","Pokemon Scrambled Scarlet","Pokemon Stadium Club","Pokemon Unbound","Pokemon Unbreakable Ties","Pokemon Uranium","Power Bomberman","Power Rangers: It's Morphin' Time","Argentum Age","Quake Brutalist Jam 3 - Standalone & Mod","Rayman Lum'o'Grams","Rayman Redemption","Resident Evil 2 FPS","Resident Evil 4 HD Project","Resident Evil: The Mercenaries 3D HD Project","Residentvania","Rick Dangerous DX - Megadrive Genesis Port","Rockband 3 Deluxe","Rygar SNES Port","Secret of Mana Plus","Sega Rally 2 - 25th Anniversary Edition","Sega vs Capcom: The Next Level","Shenmue - Dreams of Saturn","Shin Megami Tensei: Nocturne - Hardtype","Silent Hill 2 Enhanced Edition","Signalis Gameboy Demake","Skies of Arcadia: Legends Maeson","Slippi - Super Smash Brothers Melee Online PvP with Rollback Netcode","Smash 64 Remix","SNK vs Capcom C64 C128 Port","Sonic 1 Forever","Sonic 2 Absolute","Sonic 2 Gear Shift","Sonic 2 HD","Sonic And The Hedgehogs","Sonic 3 Angel Island Revisited","Sonic After The Sequel DX","Sonic Amiga Tech Demo","Sonic & the Moon Facility","Sonic Classic Heroes","Sonic Daybreak","Sonic ERaZor","Sonic Galactic","Sonic GT","Sonic GX","Sonic J Online Physics Demo","Sonic Master System Remake","Sonic Omens","Sonic Project 06","Sonic Project Forestation","Sonic the Hedgehog rpg","Sonic Riders Tournament Edition","Sonic Robo Blast 2","Sonic Robo Blast 32X","Sonic Robo Blast 2 Kart","Sonic Smackdown","Sonic Time Twisted","Sonic Triple Trouble 16-bit","Sonic UltraSaturn","Sonic Utopia","Soul Calibur: Swords of Destiny","Space Quest II - VGA Deluxe","Spartan Survivors","Squid Games - Gameboy Fan Game","Star Fox: Event Horizon","Star Fox EX (SNES)","Starship Troopers 2005","Street Fighter One Remake","Street Fighter Z","Street Fighter x Mega Man","Streets of Rage Remake","Streets of Rage 2 - Final Fight Crossover","Streets of Rage 2 - New Era","Streets of Rage 2 - Teenage Mutant Ninja Turtles hack","Sugar Ghouls","Super Dodgeball SNES Port","Super Freaks Ultimate Edition Turbo","Super Mario 3 Mario Forever","Super Mario 3D All-Stars Deluxe Launcher Pack","Super Mario 64: CoopWare","Super Mario 64: Last Impact","Super Mario 64 Splitscreen Multiplayer","Super Mario All-stars Launcher For Super Mario World","Super Mario & the Rainbow Stars","Super Mario Brothers 3 Level Design Contest","Super Mario Bros. CD","Super Mario Brothers Flashback","Super Mario Brothers Hack Portal","Super Mario Brothers Movie","Super Mario Bros. Wonder Demake","Super Mario Buys Bread","Super Mario Galaxy 63","Super Mario Kart ZX","Super Mario Meltdown","Super Mario Star Road","Super Mario Sunburn","Super Mario Sunshine Definitive Edition","Super Mario UniMaker","Super Mario War","Pro Evolution Soccer 5​","Super Mario World Return to Dinosaur Land","Super Mario World Random Revolution","Super Mario World - Simpatico","Super Mario World - The Princess Rescue 3","Super Metroid: X-Fusion","Super Smash Brothers Brawl - Project+","Super Smash Bros. Crusade","Super Smash Flash 2","Super Smash Land","Super Star Wars Holiday Special","Super Star Wars Redux","Super Star Wars - Return of the Jedi Redux","Super Star Wars - The Empire Strikes Back Redux","Sven Co-op","Tango - Mega Man Battle Network with Rollback Netcode","Tanks Rebirth","Tecmo Super Bowl 2024","Teenage Mutant Ninja Turtles SNES Port","Teenage Mutant Ninja Turtles: Shredder's Re-Revenge","Tetris Rosy Retrospection DX","The Ark","The Bells of Arietta","The Driver Syndicate","The Goonies MSX Remake","The Legend of Banjo-Kazooie The Bear Waker Deluxe","The Legend of Banjo-Kazooie - The Jiggies of Time","The Legend of Zelda: Ganon's Deception","The Legend of Zelda: Master of Time","The Legend of Zelda: Mirror of Worlds","The Legend of Zelda: Ocarina of Time Ultimate Trial","The Legend of Zelda: Reality Estate","The Legend of Zelda: Sealed Palace","The Legend of Zelda SNES Port","The Legend of Zelda: The Missing Link","The Legend of Zelda: Voyager of Time","The Lost Vikings: Ragnarok Edition","The Patchmaker's Workshop","Thief The Black Parade","Tiny Toon adventures DX","TMNT Rescue Palooza","Tony Hawk's American Wasteland reTHAWed","Toontown Rewritten","Turrican 128K Remaster","Ultimate Doom 32X Resurrection","Ultimate Sonic Smackdown","Ultimate Trial","Undefeated","Undertale Yellow - An Undertale Prequel","Wario's Conquest - Super Mario Land 2 Reclaimed","Warzone 2100","Wega & The Lost Media","Wolfenstein RPG","X-Men Arcade Remake","X-Men Mutant Apocalypse Remake","Xenosaga Pied Piper - Fan Recreation","YARG - Yet Another Rhythm Game","Yume Nikki PS","Zelda3 Parallel Worlds","Zelda Dungeons of Infinity","Zelda's adventureDX","Zelda II The adventures of Link SNES Port","Zelda Ocarina of Time - Unreal Engine Remake","Zelda: Oni Link Begins","Zenless Zone Zero on Steam Deck","Zombies Ate My Neighbours: Escape The House!","ZQuest Classic (Zelda)","ZQuest Classic (Zelda) - Quest Lists","0 A.D.","2 Ship 2 Harkinian - The Legend of Zelda Majora's Mask PC Port","The Legend of Zelda: Majora's Mask Recompilation","R.E.L.I.V.E. - Abe's Odyssey Exodus PC Port","ACEmulator - Asheron's Call Server Emulator","Aleph One - Marathon Trilogy","Ambermoon Decompilation","Anarch","Apotris","Arkhenaten","Arx Libertatis - Arx Fatalis Port","AssaultCube","Balatro - GBA Demake","Barbarian","Beyond All Reason","Boneforge Battlegrounds","BStone - Port of Blake Stone: Aliens of Gold and Blake Stone: Planet Strike","Castlevania Symphony of the Night - Play as Maria","Cataclysm: Dark Days Ahead","Cave Story Port","C-Evo","Citybound","Civctp2 - Apolyton version of Call To Power II","ClanGen","ClassiCube","Command & Conquer Remastered Collection","Conflict 3049","CorsixTH - Theme Hospital Port","Cortex Command Community Project","Counter-Strike: Football","Cro-Mag Rally","Cube 2: Sauerbraten","Cubyz","Cuphead - Wii U Port","Cytopia","Daggerfall Unity","DDraceNetwork","DXX-Rebirth: Open Descent","Descent 3 Port","Devilution X - Open Diablo for Steam Deck","Devilution X - Open Diablo","Dinosaur Planet Recompilation","Dinosaur Planet Recompilation ROM Patcher","Dinosaur Planet Recompilation Mods Page","Dogwalk","Doom 64 - Dreamcast Port","Doom 64 EX","Dr. Mario 64 Recompilation","Duke Nukem Zero Hour Recompilation","Dungeon Crawl Stone Soup","DungeonFX - Dungeon Keeper Port","OpenDUNE","Dune 2 The Maker","ECWolf - Wolfenstein 3D Port","EDuke32 - Duke Nukem 3D Port","Exult - Ultima VII Reimplementation","Fallout Community Edition","Fallout 2 Community Edition","Fheroes2 - Heroes of Might & Magic 2 Recreation","Fish Folk: Jumpy","Flashback - Sega Saturn Port","FlightGear","FPC Atomic - Atomic Bomberman Reimplimentation","FreeCiv","FreeCol","Freedoom","FreeOrion","Freeserf - Settlers 1 Clone","FreeSpace Open","FS2Open - Open Freespace 2","Frets on Fire","Friday Night Funkin'","GemRB - Implementation of Infinity Engine - Baldur's Gate, Icewind Dale, Planescape: Torment","GLSMAC - Sid Meier's Alpha Centauri Port","Grand Theft Auto 3 Dreamcast Port","Grand Theft Auto Vice City Dreamcast Port","Half-Life: Decay PC Port","Hedgewars","Hurry Curry!","Hypersomnia","Infinity Blade","Infinity Blade 2","ioquake3 - Quake 3: Arena Port","Jagged Alliance 2 Stracciatella","OpenGoal - Jak & Daxter, Jak 2 and Jak 3 Native PC Ports","Jazz Resurrection - native-pc-port Jazz Jackrabbit 2","Julius - Caesar III Remake","KaM Remake","Kindergarten - Wii U Port","kkrieger","Legend of Dragoon Port - Severed Chains","Lego Island PC Port","Lego Island Web Port","Lemmini - Lemmings Port","Liblast","LinCity-NG","Link: Faces of Evil & Zelda: Wand of Gamelon Remastered","LSD: Revamped - LSD: Dream Emulator Remake","Mario Kart 64 - Dreamcast Port","Mario Kart 64 Recompilation","Maze of Galious Port","MBHaxe - Marble Blast Port","Mega Man Legends PC Port","Memoria - Tools for Final Fantasy IX","Meritous","micropolis-JS","Mute Crimson DX Dreamcast Port","Myst Online: Uru Live","Mystical Ninja Starring Goemon Recompilation","Naev","Endless Sky","NakedAVP: Aliens vs Predator Classic (2000) Port","NBlood - Blood Exhumed Port","NetHack","OMoHAAA - Open Medal of Honour Allied Assault","Oolite: An Open-World Space Opera","Open1560 - Midtown Madness","OpenAge","OpenDAoC - Dark Age of Camelot Server Emulator","OpenEnroth - Open reimplementation of Might and Magic 6, 7 & 8 Engine","Open Fodder","OpenGothic - Gothic 2 Port","OpenHCL","OpenHV","OpenLoco - Chris Sawyer's Locomotion Port","OpenMW - Morrowind Port","OpenNox","OpenOMF - One Must Fall 2097","OpenRA - Command & Conquer Red Alert + Tiberian Dawn + Dune 2000","OpenRCT2 - Roller Coaster Tycoon 2","OpenRW - GTA III Reimplementation","OpenTESArena - Elder Scrolls Arena Open-source Reimplementation","OpenTTD - Port of Transports Tycoon Deluxe","OpenTyrian 2000","OpenXcom","PCExhumed - Exhumed Powerslave Port","Perfect Dark PC Port","Pioneer Space Sim","Pixel Dungeon","Playable3DMaze","PoolTool","Portal64 Still Alive","Portal: Still Alive PC Port","Prince of Persia Original Trilogy Port","Project Alice - Victoria 2 Port","Project Diablo 2","ProjectR - San Francisco Rush: The Rock and San Francisco Rush 2049 Ports","puzzleMoppet Port","Quest 64 Recompilation","Quick Dungeon Crawler","ReDriver2 - Driver 2 PC Port","Return to the Roots - Settlers II Remake","ROTA: Bend Gravity","RVGL - Re-Volt Port","Ship of Harkinian - Zelda Ocarina of Time Port","Ship of Harkinian mods","The Simpsons Hit & Run PC Port","Sonic Mania Decompilation","Sonic the Hedgehog (2013) and Sonic the Hedgehog 2 (2013) Decompilation","Sonic Unleashed Recompilation","SpaceCadetpinball","Space Station 14","Spaghetti Kart - Mario Kart 64 PC Port","Speed Dreams","The Ur-Quan Masters - Star Control 2 Port","Star Fox 64 Dreamcast Port","Star Fox 64 Dreamcast Port Builder Guide","Star Fox 64 Recompilation","Starship - Star Fox 64 PC Port","Starship - Star Fox 64 PC Port Mods","Stunt Car Remake","Super Mario 64 Co-op Deluxe","Super Mario 64 PC Port","Super Mario 64 Render96","Super Mario Bros. Remastered","Super Mario Bros. Remastered Mods","Super Mario Bros. Remastered Custom Levels","Super Tux Kart","Super Tux War","Teeworlds","The Battle for Wesnoth","The Force Engine - Dark Forces Reimplementation","The Labyrinth Of Time's Edge","The Legend of Zelda A Link To The Past Decompilation","The Legend of Zelda: Link's Awakening DX HD PC Port","The World Ends With You Solo Remix Recompilation","TheXTech - Open Source Game Engine","Thrive: Open Source Evolution Sim","Timesplitters Rewind","TRX: Tomb Raider 1 & 2 Reimplementation","Ultima VII Revisited","Unciv","Undertale Decompilation","Unknown Horizons","VCMI - Heroes of Might & Magic 3 Open Source Recreation","Veloren","VoxeLibre (formerly MineClone2)","Warzone 2100","Wasted! A Destruction-Derby Online Game","Widelands","Wipeout Dreamcast Port","Wipeout Phantom Edition PC Port","Xonotic","YKnytt","Zelda 2 Enhanced PC Edition","Zelda 64 Recompiled Majora's Mask with Mod Support","Zelda Classic","Zero-K","Zork Open Source Port","Zork II Open Source Port","Zork III Open Source Port","Aero Gauge Decompilation","Aidyn Chronicles The First Mage Decompilation","Alice in Wonderland (Wii) Decompilation","AM64 - Another Metroid 64","Animal Crossing (Gamecube) Decompilation","Baku Bomberman 2 (JP) Decompilation","Banjo-Kazooie (N64) Decompilation","Banjo-Kazooie (Xbox 360) Decompilation","Banjo-Kazooie Grunty's Revenge Decompilation","Banjo-Tooie Decompilation","Blast Corps Decompilation","Body Harvest Decompilation","Bomberman Hero Decompilation","Boom Street Decompilation","Breath of Fire Decompilation","The Legend of Zelda: Breath of the Wild Decompilation","Bully Online","Burnout 3: Takedown Decompilation","Castlevania 64 Decompilation","Castlevania Order of Ecclesia Decompilation","Castlevania Symphony of the Night Decompilation","Castlevania Symphony of the Night - Megadrive Genesis Port - Demo","Chameleon Twist Recompilation","Chameleon Twist 2 Decompilation","Chibi-Robo: PIA Decompilation","Colin McRae Rally 2.0 Decompilation","Conker's Bad Fur Day Decompilation","Contra Decompilation","Cosmo's Cosmic Adventure Decompilation","Crash Bandicoot Decompilation","Crash Bandicoot 2: Cortex Strikes Back Decompilation","Crash Team racing Decompilation","Crash: Twinsanity Remake","Croc: Legend of the Gobbos Decompilation","Crystalis Decompilation","Dance Central 3 Decompilation","Dark Cloud Decompilation","Dark Rift Decompilation","Demon's Crest Decompilation","Deus-Ex: Human Revolution Decompilation","Diddy Kong racing Decompilation","Disney's Piglet's Big Game Decompilation","Donkey Kong 64 Decompilation","Doraemon: Nobita to Mittsu no Seireiseki Decompilation","Doshin the Giant Decompilation","Dragon Quest Monsters Decompilation","Dragon Quest IX Decompilation","Dragon Warrior Decompilation","EarthBound Beginnings Remake","Elden Ring: Morrowind Overhaul Mod","Fable 2 Recompilation","Fallout: Bakersfield - Doom total conversion Mod (GZDoom Wad)","Fatal Frame Decompilation","Fatal Frame 2 Decompilation","Final Fantasy Crystal Chronicles Decompilation","Final Fantasy Mystic Quest Megadrive Port","Final Fantasy VII Decompilation","Fire Emblem: Shadow Dragon Decompilation","Fire Emblem: The Blazing Blade Decompilation","Frogger Decompilation","F-Zero X Decompilation","Gauntlet Legends Decompilation","Gex 64 Decompilation","Glover Decompilation","Goldeneye 007 Decompilation","Golden Sun Decompilation","Goof Troop Decompilation","Gran Turismo 2 Decompilation","GTA 2 Decompilation","Guilty Gear X Series Decompilation","Halo Decompilation","Harvest Moon 64 Decompilation","Harvest Moon: A Wonderful Life Decompilation","Harvest Moon: Friends of Mineral Town Decompilation","Ice Climber Decompilation","ICO Decompilation","Inazuma Eleven Strikers Decompilation","Jet Force Gemini Decompilation","Jet Set Radio Future Decompilation","Kid Chameleon Decompilation","Kingdom Hearts Decompilation","Kirby 64: The Crystal Shards Decompilation","Kirby & the Amazing Mirror Decompilation","Kirby Air Ride Decompilation","Kirby's Epic Yarn Decompilation","Klonoa 2: Lunatea's Veil Decompilation","Knife Edge - Nose Gunner Decompilation","Legacy of Kain: Soul Reaver Decompilation","Legend of Legaia Decompilation","Lego Racers Decompilation","Lego Star Wars III: The Clone Wars Decompilation","LSD: Dream Emulator Decompilation","Luigi's Mansion Decompilation","Lunar 2: Eternal Blue Complete Decompilation","Mario & Luigi: Partners in Time Decompilation","Mario & Luigi: Superstar Saga Decompilation","Mario Golf 64 Decompilation","Mario Kart Double Dash!! Decompilation","Mario Kart Wii Decompilation","Mario Party 4 Decompilation","Mario Party 5 Decompilation","Mario Superstar Baseball Decompilation","Mario Tennis Decompilation","MediEvel Decompilation","Mega Castlevania IV","Mega Man X: Viral Nightmare​","Metal Gear Solid Decompilation","Metal Gear Solid 2 Decompilation","Metal Gear Solid 3 Decompilation","Metal Gear Solid: The Twin Snakes Decompilation","Metroid Fusion Decompilation","Metroid Prime Decompilation","Metroid Prime 2: Echoes Decompilation","Metroid Zero Mission Decompilation","Minecraft: Legacy Console Edition Decompilation","Minicraft - Minecraft GBA Port","Mischief Makers Decompilation","Naruto: Gekitou Ninja Taisen! 4 Decompilation","Need For Speed: High Stakes Decompilation","Need For Speed: Most Wanted Decompilation","Need For Speed: Underground Decompilation","Neon Genesis Evanglion 64 Decompilation","New Super Mario Bros. Wii Decompilation","Onegai Monsters Decompilation","OpenTDU - Source Port of Test Drive Unlimited","Panzer Dragoon Saga Decompilation","Paper Mario Decompilation","Paper Mario: Sticker Star Decompilation","Paper Mario: The Thousand Year Door Decompilation","PaRappa the Rapper 2 Decompilation","Pikmin Decompilation","Pikmin 2 Decompilation","Plants vs Zombies GOTY Decompilation","Pokemon Battle Revolution Decompilation","Pokemon Mystery Dungeon: Red Rescue Team Decompilation","Pokemon pinball Decompilation","Pokemon puzzleLeague Decompilation","Pokemon Snap Decompilation","Pokemon Stadium Decompilation","Pokemon Stadium 2 Decompilation","Pokemon TCG Deompilation","Pokemon TCG 2 Deompilation","Pokepark Wii: Pikachu's Adventure Decompilation","Prey 2006 Port","Project Green","Quake 4 source-port","Ratatouille Decompilation","Rayman 2: Redreamed","Rayman 3: Havok Reignited Remake","Render 98 for Ship of Harkinian","Resident Evil: Code Veronica X (Game Cube) Decompilation","Resident Evil: Code Veronica X (PS2) Decompilation","Return to Yoshi's Island","Rhythm Heaven Decompilation","Rock Band 3 Decompilation","Rocket: Robot on Wheels Decompilation","Secret of Mana PC-Engine Port","Shadowgate 64 Decompilation","Shadow of the Colossus Decompilation","Shin Megami Tensei Decompilation","Silent Hill Decompilation","Skyblivion","Skys of Arcadia Legends Decompilation","Skywind","Sly Cooper and the Thievius Raccoonus Decompilation","Snowboard Kids 2 Decompilation","Sonic Advance 2 Decompilation","Sonic Advance Trilogy Decompilation","Sonic and the Secret Rings PC Port - Project Reignition","Sonic Riders Decompilation","Sonic Riders: Zero Gravity Decompilation","Sonic Runners Decompilation","Sonic Rush Rerun - PC Port","Sonic the Fighters Decompilation","Sonic the Hedgehog (2006) Recompilation","Space Station Silicon Valley Decompilation","Spider-Man 2001 Decompilation","Spongebob Squarepants: Battle for Bikini Bottom Decompilation","Spyro the Dragon Decompilation","Star Fox adventures Decompilation","Star Wars: Shadows of the Empire Decompilation","Street Fighter III 3rd Strike Decompilation","Summoner: A Goddess Reborn Decompilation","Super Ghouls 'n Ghosts Decompilation","Super Mario 3D Land Decompilation","Super Mario 3D World + Bowser's Fury Decompilation","Super Mario 64 - PlayStation Port","Super Mario Galaxy Decompilation","Super Mario Galaxy 2 Decompilation","Super Mario Odyssey - A Galaxy Story","Super Mario Odyssey Decompilation","Super Mario Strikers Decompilation","Super Mario Sunshine Decompilation","Super Metroid Decompilation","Super Monkey Ball Decompilation","Super Paper Mario Decompilation","Super Smash Bros. 64 Decompilation","Super Smash Bros. Brawl Decompilation","Super Smash Bros. Melee Decompilation","The Legend of Zelda: Phantom Hourglass Decompilation","The Legend of Zelda: Skyward Sword Decompilation","The Legend of Zelda: Tears of the Kingdom Online","The Legend of Zelda: The Wind Waker Decompilation","The Legend of Zelda: Twilight Princess Decompilation","The Sims 2: Castaway Decompilation","The Spongebob Squarepants Movie Decompilation","The World Ends With You Decompilation","Tomba! Decompilation","Tomb Raider Chronicles Decompilation","Twisted Metal Decompilation","Twisted Metal Black Decompilation","Twisted Metal: Harbor City Decompilation","Ty The Tasmanian Tiger Decompilation","Unreal Redux","Vagrant Story Decompilation","Vandal Hearts Decompilation","Virtual Pro-wrestling 2 Decompilation","Wave Race 64 Decompilation","WCW NWO Revenge Decompilation","Wii Sports Decompilation","Xenoblade (JP) Decompilation","Xenogears Decompilation","Xenosaga Episode I Decompilation","Yakuza 1 Decompilation","Yoshi's Story Decompilation","Yu-Gi-Oh! Reshef of Destruction Decompilation","Zombieland MMO","Zone of the Enders Decompilation","Zone of the Enders: The 2nd Runner Decompilation","Animal Crossing: City Folk Deluxe - Animal Crossing City Folk Let's Go To The City Mod","Ashes Series (2063 - Dead Man Walking - Afterglow - Hard Reset) - Doom 2 Mod","Baldur's Gate 3: Brawl - Real Time Combat Mod","Baldur's Gate 3: Chivalry Expansion","Baldur's Gate 3: Forsaken","Baldur's Gate 3: Ultimate Cut Content Restoration Mod","Battlefield 1942: Desert Combat","Bioshock - Native HDR Mod","Black Reliquary - Total conversion mod for Darkest Dungeon","Bloodborne - shadPS4 - 60fps Patch","Bloodborne - shadPS4 - Visual Overhaul Mod","Brutal Doom - Doom Mod","Castlevania Simon's Destiny - a total conversion Doom mod","Castlevania Symphony of the Night Randomizer Mod","Caveman 2 Cosmos - Civilization 4 total overhaul mod","Celeste Strawberry Jam mod","Chrono Trigger Pixel Demaster Mod","Contra - C&C: Generals Zero Hour Mod","Crusader Kings 2 A Song of Ice & Fire Mod","Cyberpunk 2077: Battle Axe","Cyberpunk 2077: Night City Traffic Overhaul Mod","Cyberpunk 2077: Take a Breather - Pace & Reputation Overhaul Mod","Dark Souls 2 Firelink Edition","Dark Souls 3 Seamless Co-op Mod","Dark Souls Remastered Seamless Co-op Mod","DBZ Budokai 4 - Dragonball Z Infinite World (PS2) Mod","Deus Ex: Nihilum","DMC3 Crimson - Devil May Cry 3 HD Collection Mod","Dhwem3 - Doom 3 Mod","Doom - Voxel Doom - Replace 2D Sprites with 3D Voxels","Doom 2 - Voxel Doom - Replace 2D Sprites with 3D Voxels","Doom 3: RealDOOM","Doom Infinite - Doom 2 Mod","Dragon BallZ - DIO Moveset","Dragon BallZ - YamiYugi Moveset","Duke Nukem 3D - Voxel Duke","Dyson Sphere Program - Co-op Mod","Elden Ring Nightreign Seamless Two Player Co-op Mod","Elden Ring Seamless Co-op Mod","Elden Ring: The Convergence - Overhaul Mod","Elden Ring: The Witcher Moveset Mod","Skyrim - Enderal","Half Life 2 - Entropy Zero 2","Factorio - Space Exploration","Civilisation 5 - Faerun","Fallout 4: FSR3 Mod","Fallout 4: Imperial Attack on the Commonwealth","Fallout 4 London Mod Guide","Fallout 4: LoreOut - The Modern Roleplaying Modlist","Fallout 4 Misery Island - Isles of New England","Fallout 4 The Order of the Third Eye","Fallout 4: Upscaling","Fallout New Vegas: Autumn Leaves","Fallout New Vegas: Long 15 Expansion","Fallout New Vegas: Vanilla Plus AO","F.E.A.R. - Echo Patch","Fifa 14 and 16 Classic Patch","Final Fantasy 7 7th Heaven Mod","Final Fantasy 7 Rebirth Playable Dyne Mod","Final Fantasy 7 Rebirth Playable Rufus Mod","Final Fantasy 7 Satsuki Yatoshi SYW Mod","Final Fantasy 9 Moguri Mod","Final Fantasy Tactics The Lion War of the Lions Mod","Battlefield 2 - Forgotten Hope 2","Mount & Blade: Warband - Gekokujo","Oblivion Remastered - Glock Functional Gun Mod","Half-Life 2 - GoldenEye: Source","GTA IV FusionFix","GTA V: Large Pedestrian Crowds Mod","GTA V: Superman Mod","GTA Vice City Actual NextGen Edition Modpack","Guitar Hero World Tour Definitive Edition","Resident Evil Requiem - Merchant","Half-Life 2: Episode Two - Raising The Bar: Redux","Half-Life Black Mesa: Blue Shift - Caretaking Update","Half-Life Diffusion","Half-Life: Element 64","Half-Life Legacy","The Legend of Zelda Ocarina of Time - Hero of Law","Hollow Knight: Silksong Multiplayer Mod","Heroes of Might and Magic III - Horn of the Abyss","Icewind Dale 2 Enhanced Edition - Icewind Dale 2 Mod","Just Cause 3 Unlimited Edition","Kingdom Hearts ReFined - a mod for Kingdom Hearts 1.5 + 2.5 ReMix","Lies of P - Co-op Mod","Luigi's Mansion - Louie' Mansion Pikmin Overhaul Mod","Mario Kart 64 - Amped Up","Mario Kart 8 Deluxe - CTGP Deluxe","Mario Kart Super Circuit - 60 FPS Patch","Marvel vs Capcom Infinite & Beyond Mod","Max Payne: Remix","Medal of Honor Airborne Redux","Medieval 2: Total War Kingdoms Mod: Third Age Total War","Command & Conquer Red Alert 2 - Mental Omega","Elder Scrolls III: Morrowind - Morrowind Rebirth","NBA Jam Legends on Fire Edition","Need for Speed Most Wanted 2005 - Mod Pack for Steam Deck and PC Guide","Need for Speed Pro Street - Mod Pack for Steam Deck and PC Guide","Need for Speed Underground - Mod Pack for Steam Deck and PC Guide","Half-Life 2 - No More Room in Hell","Oblivion - Oscuro's Overhaul","Paper Mario: The Thousand-Year Door Encore","Paper Mario: Tower of Trials","Persona 3 FES HD Overhaul Mod & Widescreen Patch","Pillars of Eternity 2 Deadfire - Font Increase Mod","Super Smash Brothers Brawl - PMEX Remix","Portal 2 - Portal Stories: Mel","Portal 2 - Portal Reloaded","Portal 2 - Portal Revolution","Doom 2 - Project Brutality","Quake - Arcane Dimensions","Rainbow Six Black Ops","Doom 3 BFG Edition - Rbdoom3BFG","Red Dead Redemption 2 - Metal Gear Solid 3 Recreation Mod","Star Wars: Empire at War: Forces of Corruption - Republic at War","Resident Evil 2 - RE-Enhance Mod","Resident Evil 2 - Thomas the Tank Engine Mod","Resident Evil 4 Remake Tactical First Person Mod","Mario Kart Wii - Retro Rewind","Mario Kart Wii - Retro Rewind Wheel Wizard Launcher","RimWorld - A Rimworld of Magic","RimWorld - Android Tiers","RimWorld - PokeWorld","RimWorld - Save Our Ship 2","RimWorld - Vanilla Expanded","RimWorld - Zombieland","Saints Row 2 - Juiced Patch","Sekiro Resurrection - Overhaul Mod","Skyrim - A Ghibli Skyrim Landscapes Mod","Skyrim - A Ghibli Skyrim Whiterun Mod","Skyrim - Midnight Sun","Skyrim - Skypal","Skyrim - SkyParkour v3 Mod","Skyrim Special Edition - Azeroth Reborn","Skyrim Special Edition - Lordbound","Skyrim Special Edition - Norden UI","Skyrim - Together Reborn","Skyrim - Tuxborn Overhaul Mod","Slay the Spire - Downfall","Sonic Robo Blast 2 - Generations Mod","Sphinx and the Cursed Mummy - PC Mod","Spiderman - Multiplayer Mod","Splinter Cell Enhanced","S.T.A.L.K.E.R.: Shadow of Chernobyl - Radiophobia 3","S.T.A.L.K.E.R. 2: Heart of Chernobyl - Zone Unchained","Stardew Valley - A Voice Over Mod For All Love Interests","Starfield - Star Wars Classes","Starfield - Steam Deck Essentials Mod Install Guide","Starfield - Star Wars Genesis Total Conversion","Star Fox SNES Force Feedback Patch","Star Wars Battlefront 2 - Remaster Mod","X4 Foundations - Star Wars Interworlds","Jedi Knight: Jedi Academy - Star Wars Movie Duels","Super Mario Sunshine - Super Mario Eclipse","Super Mario 3D Land - Super Mario Expedition 2","Super Mario Odyssey Online","Super Smash Bros. Brawl - REX","Super Smash Bros. Melee - Akaneia Build","Terraria - Calamity Mod","Terraria - tModLoader","The Binding of Isaac - External Items Description mod","Gothic 2 Gold Edition - The Chronicles Of Myrtana Archolos","Half Life 2 - The Citizen","Thief - The Dark Mod","The Legend of Zelda: Breath of the Wild - BetterVR","The Legend of Zelda: Breath of the Wild - FOV & Shoulder Cam Mod","The Legend of Zelda: Tears of the Kingdom - Ultracam Mod","Mount & Blade 2: Bannerlord - The Old Realms","The Simpsons Hit & Run - Futurama Overhaul Mod","The Witcher 3 - Brothers in Arms Mod","The Witcher 3 - Brothers in Arms Ultimate Edition","The Witcher 3 - HD Reworked Project Next Gen Edition","The Witcher 3 - Let There Be Light","The Witcher 3 - Wild Monster Hunt","S.T.A.L.K.E.R. Call of Pripyat - Misery","Tony Hawk's Underground 2 - THUGPro","Dungeon Siege - Ultima V Lazarus","Undertale - Undertale Together","Unreal - UnrealRTX Mod","Watch Dogs - Living City","Wolfenstein - Blade of Agony","XCOM: Enemy Unknown - Long War","Star Wars X-Wing Special Edition - XWVM","Yakuza 0 - Co-op Mod","007: Quantum of Solace","Ace Combat: Assault Horizon Enhanced Edition","Afterfall InSanity: Extended Edition","Aladdin In Nasira's Revenge","Alien Trilogy","Alien vs Predor 2: Gold Edition","America McGee's Alice: Remastered","Area 51","Assassin's Creed III","Atlantis: The Lost Empire - Trial By Fire","Back to the Future: The Game","Batman: Vengeance","Battlefield 1942: The Complete Collection","Battlefield 2142","Battlefield 2: Complete Collection","Battlefield Vietnam","Battlefield: Bad Company 2","Bedlam","Blair Witch Trilogy","Blur","Celebrity Deathmatch","Clive Barker's Jericho","Colin McRae: DiRT 2","Condemned: Criminal Origins","Contract J.A.C.K.","Crazy Taxi 3: High Roller","Cryostasis","Darksiders II","Dead Man's Hand","Dead To Rights","Dead To Rights 2","Deadpool","Die Hard: Nakatomi Plaza","DiRT 3","Dreamkiller","Driver: San Francisco","Enter The Matrix","Evil Dead Regeneration","F1 2010","F1 2011","F1 2012","F1 2013","F1 2020","F1 Race Stars","Fable III","Family Guy: Back to the Multiverse","Fantastic Four","Fuel","Gears of War","Gore: Ultimate Soldier","GRID 2","GRID Autosports","Guardians of the Galaxy: The Telltale Series","Halo: Combat Evolved","Heavy Metal: F.A.K.K. 2","Heretic II","Hulk","Iron Man","James Bond 007: Blood Stone","James Cameron's Avatar: The Game","Juiced","Juiced 2: Hot Import Nights","Kiss Psycho Circus","Lost Planet: Extreme Condition Colonies Edition","Lost Planet 2","Manhunt 2","Marvel Ultimate Alliance","Marvel Ultimate Alliance 2","Mercenaries 2: World in Flames","Midnight Club 2","Mortal Kombat: Komplete Edition","Need For Speed II: Special Edition","Need For Speed III: Hot Pursuit","Need For Speed: Carbon","Need For Speed: High Stakes","Need For Speed: Hot Pursuit 2","Need For Speed: Most Wanted","Need For Speed: Porsche Unleashed","Need For Speed: ProStreet","Need For Speed: SHIFT","Need For Speed: SHIFT 2 Unleashed","Need For Speed: The Run","Need For Speed: Undercover","Need For Speed: Underground","Need For Speed: Underground 2","No One Lives Forever 2: A Spy in H.A.R.M.'s Way","Nocturne","Oni: Anniversary Edition","Operation Flashpoint: Dragon Rising","Operation Flashpoint: Red River","Outrun 2006: Coast 2 Coast","Pac Man World 2","Peter Jackson's King Kong: The Official Game of the Movie","Poker Night Double Pack","Prey","Project CARS: GOTY Edition","Project CARS 2","Project CARS 3","Project I.G.I.: I'm Going In","Psi-Ops: The Mindgate Conspiracy","Psychotoxic","Pure","Race Driver: GRID","Rambo: The Videogame","Resident Evil: Operation Racoon City","reTHAWed","Road Rash","Saw","Sanity: Aiken's Artifact","Scarface: The World is Yours","Scratches Director's Cut","SEGA Dreamcast Collection","SEGA Rally Revo","SHRAK","Silent Hill 2: Enhanced Edition","Silent Hill 3","Sonic CD: Miracle Edition","Sonic R: The Definitive Edition","South Park","Spec Ops: The Line","Spider-Man 2: The Game","Splinter Cell: Pandora Tomorrow","Starlancer","Street Fighter X Tekken","Syndicate","Teenage Mutant Ninja Turtles: Mutants in Manhattan","Test Drive Unlimited","Test Drive Unlimited 2","The Chronicles of Riddick: Assault on Dark Athena","The Chronicles of Riddick: Escape From Butcher Bay","The Crew","The Godfather Part II","The Godfather: The Game","The Last Remnant","The Legend of Korra","The Lord of the Rings: War in the North","The Matrix: Path of Neo","The Need For Speed: Special Edition","The Operative: No One Lives Forever","The Polar Express","The Punisher","The Simpsons Hit & Run","The Suffering","The Suffering: Ties That Bind","The Walking Dead: Survival Instinct","ToCA Race Driver","ToCA Race Driver 2","ToCA Race Driver 3","Toy Story 2: Buzz Lightyear to the Rescue","Transformers: Devastation","Transformers: Fall of Cybertron","Transformers: Revenge of the Fallen","Transformers: The Game","Transformers: War for Cybertron","Tron Evolution","True Crime: Streets of LA","Turok","Ultimate Spider Man","Unreal Tournament 2004: Editor's Choice Edition","Unreal Tournament 3: Black Edition","Vietcong","Vietcong 2","Viva Pinata","Vivisector: Beast Within","Will Rock","William Shatner's TekWar","WipEout Portable Collection","Wolfenstein","World racing","X-Men Legends II: Rise of Apocalypse","X-Men Origins: Wolverine - Uncaged Edition","You Are EMPTY","Archive of texture-packs for PSone, PlayStation 2, PSP, PS Vita, Gamecube, N64, 3DS, Wii & Dreamcast","Animal Crossing City Folk HD Texture Pack","Baldur's Gate 3 HD Texture Pack","Batman: Arkham Asylum HD Texture Pack","Batman: Arkham City HD Texture Pack","Batman: Arkham Knight HD Texture Pack","Blood 2 Upscale Texture Pack","Dark Souls 2 HD Texture Pack","Fallout New Vegas Texture Upscale Project","Fallout 4 Landscape Textures Overhaul","Far Cry 3 HD Texture Pack","Final Fantasy 7 Remake 4K 8K Texture Collection","Final Fantasy 7 Remake HD Texture Pack","God of War - Decked Edition","Goldeneye 4K Textures","Grand Theft Auto 5 Enhanced Edition 4K Texture Pack","Grand Theft Auto Liberty City Stories - Decked Edition","Luigis Mansion","Mario Kart 64","Mario Kart Double Dash","Mass Effect Legendary Edition","NieR Automata 4K Texture Pack","Palworld Texture Pack","Paper Mario 64","Pokemon Scarlet & Violet 4K Texture Pack","Prince of Persia Decked Edition","Resident Evil 5 Texture Pack","Resident Evil: Revelations HD Texture Pack","Resident Evil: Revelations 2 HD Texture Pack","Secret Agent Clank","Soul Reaver Dreamcast","SSX 3","Super Mario 3D Land","Super Mario Galaxy 63 HD Texture Pack","Super Mario Sunshine","The Legend of Zelda: Breath of the Wild 4K Texture Pack","The Legend of Zelda: Tears of the Kingdom 4K Texture Pack","The Witcher 3 Wild Hunt Immersion Pack","Tomb Raider: Legend HD Texture Pack","Ultimate Spiderman (PS2) Decked Edition","Vagrant Story on Duckstation","Zelda Majora's Mask 3D","Majora's Mask N64","Zelda Ocarina of Time 3D","Dusklight - The Legend of Zelda Twilight Princess PC Port Texture Pack 2","Zelda A Link Between Worlds","Zelda Skyward Sword","HIDDEN PALACE ARCHIVE OF PLAYABLE UNRELEASED GAMES PROTOTYPES","Akira - Genesis Megadrive","Aladdin (NTSC) NES Prototype","Animaniacs: Hollywood Hypnotics - Gameboy Advance","Apocalypse 2 - SNES","Batman: Revenge of the Joker - SNES","Big Brother","Bio Force Ape - NES","Beyond Zero Tolerance - Genesis Mega Drive","Blue Angelo: Angels from the Shrine - Gameboy Advance","California Raisins: Grape Escape - NES","Castlevania: Resurrection - Dreamcast","Dancing Eyes - Playstation 3","Daredevil: The Man Without Fear - Playstation 2","Dark Castle - MSX2","Dark Empires - Genesis Mega Drive","Dracula Hunter - Arcade","Dinosaur Planet - N64","Duke Nukem D-Day - PS2","Eddie's puzzleTime - Gameboy","Frog Dude - Megadrive","Frogger 2: Swampy's Revenge - Dreamcast","It Came From The Desert - Megadrive","Jet Set Radio Dreamcast Prototype","Mario Kart XXL - Gameboy Advance","mechanoids 2 - SNES","Mia Hamm Soccer 64 Prototypes","Nigel Mansell World Championship - C64","Paprium - Genesis Mega Drive","Populous - NES","Porky Pig's Haunted Holiday - SNES","Putty Squad - Megadrive","Rayman - SNES","Resident Evil 1.5 - PSone","Resident Evil - Gameboy Colour","Robocop - PSone","Saints Row Undercover - PSP","Sega Channel - 144 Preserved ROMs - Megadrive Genesis","Sensible Soccer - NES","Sonic Crackers - Genesis Megadrive","Team SAS - Xbox","The Addams Family: Pugsley's Scavanger Hunt (NES) Prototypes","The Elder Scrolls Travels: Oblivion - PSP","Thrill Kill - PSone","Time Diver Eon Man - NES","Tripitaka - Windows","Viewpoint 2064 - N64","Virtua Hamster - Sega 32X","Warcraft adventures: Lord of the Clans - PC ScummVM","Yoshi - Gameboy Advance","7th Dragon - Nintendo DS","Airs adventure- Sega Saturn","American Oudan Ultra quiz - Super Nintendo","Ao no 6-go Saigetsufutai Hito: Time and Tide - Dreamcast","Baroque - Sega Saturn","Battle Master: Kykyoku no Senshitachi - SNES","Battle Stadium D.O.N. - PlayStation 2","Belzerion - 3DO","Breath of Fire II - Super Nintendo","Captain Rainbow - Wii","Captain Tsubasa - PS2","Captain Tsubasa Vol. II: Super Striker - Nintendo Entertainment System","Castlevania: Rondo of Blood - Turbografx-CD","Cave Story Dokutsu Monogatari - PC","Chaos Field - Dreamcast","Chibi-Robo! - Wii","Chobits - Gameboy Advance","Clock Tower: The First Fear - PlayStation","Cookie's Bustle - PC","Cotton 2 - Sega Saturn","Cowboy Bebop: Tsuioku no Serenade - Playstation 2","Cyber Troopers Virtual-On - PlayStation 3","Dark Half - Super Nintendo","Dark Seed - Sega Saturn","Dead of the Brain - PC98","Dead of the Brain 2 - PC98","Densetsu no Ogre Battle: The March of the Black Queen - Sega Saturn","Digimon adventure- PSP","Digimon World Re:Digitize - PlayStation Portable","Digital Devil Monogatari: Megami Tensei - NES","Dragon Ball Z: Super Saiya Densetsu - Super Nintendo","Dragon Ball Z: The Legend - Sega Saturn","Dragon Force II: Kamisarishi Daichi ni - Sega Saturn","Dragon Quest III: Soshite Densetsu e... - Super Nintendo","Dragon Quest VI: Maboroshi no Daichi - Super Nintendo","Dragon Quest V: Tenkuu no Hanayome - PlayStation 2","Dragon Quest Monsters: Caravan Heart","Dungeons & Dragons: Tower of Doom - Sega Saturn","Earth Seeker - Wii","Emerald Dragon - PC Engine CD","Farland Symphony - PC","Final Fantasy Type-0 - PSP","Final Fantasy X-2: Last Mission - PS2","Fire Emblem: Fuuin no Tsurugi - Game Boy Advance","Fire Emblem Gaiden - Nintendo Entertainment System","Fire Emblem: Monshou no Nazo - Super Nintendo","Fire Emblem: Path of Radiance - Nintendo GameCube","Fire Emblem: Shadow Dragon and the Blade of Light - Nintendo Entertainment System","Fire Emblem: Shin Monshou no Nazo - Hikari to Kage no Eiyuu - Nintendo DS","Fire Emblem: Thracia 776 - Super Nintendo","Front Mission 2 - PlayStation","Front Mission 5: Scars of the War - PlayStation 2","Fushigi no Dungeon: Fuurai no Shiren 3 Portable - PlayStation Portabl","God Eater 2 - PSP","Grand Knights History - PSP","Gyakuten Kenji 2 - Nintendo DS","Hybrid Front - Sega Genesis Mega Drive","Idolmaster SP: Perfect Sun, Wondering Star & Missing Moon - PSP","Ikenie no Yoru - Wii","Illusion City - MSX","Illusion of Gaia - Super Nintendo","J.B. Harold: Blue Chicago Blues - Sega Saturn","Jesus: Kyoufu no Bio Monster - Nintendo Entertainment System","Jingle Cats - Playstation","JoJo no Kimyou na Bouken: Ougon no Kaze - PlayStation 2","Jump Ultimate Stars - Nintendo DS","Kaeru no Tame ni Kane wa Naru - Game Boy","Kidou Senshi Gundam: Gundam vs. Gundam NEXT PLUS - PSP","King's Field - PlayStation","Kingdom Hearts II: Final Mix - Playstation 2","Konjiki no Gash Bell!! Go! Go! Mamono Fight!! - Nintendo GameCube","Kurohyou: Ryu ga Gotoku Shinshou - PSP","La Mulana - PC","La Pucelle: Ragnarok - PlayStation Portable","Langrisser IV - PlayStation","Linkle Liver Story - Sega Saturn","Live a Live - Super Nintendo","L.O.L Lack of Love - Dreamcast","LSD - Dream Emulator - PlayStation","Magical Date: Operation Heart-Throb - PlayStation","Magna Carta: The Phantom of Avalanche - PC","Maple Story DS - Nintendo DS","Marie to Elie no Atelier: Salburg no Renkinjutsushi 1 & 2 - PlayStation 2","Metal Gear (MSX2) - MSX","Mizzurna Falls - PlayStation","Monster Hunter Portable 3rd - PlayStation Portable","Mother 1+2 - Game Boy Advance","Mother 3 - Game Boy Advance","Mushishi: Amefuru Sato - Nintendo DS","Namco x Capcom - PlayStation 2","Nanatsu no Hikan: Senritsu no Bishou - Dreamcast","Nayuta no Kiseki - PSP","One Piece: Romance Dawn - PSP","Ougon no Kizuna - Wii","Patlabor - Mega Drive Genesis","Persona 2: Innocent Sin - PlayStation","Pocket Monsters: Green Version - Game Boy","Pokemon Trading Card Game 2 - Game Boy","Pokemon Fushigi no Dungeon: Ikuzo! Arashi no Boukendan - Wii","Policenauts - PlayStation","Popolocrois Monogatari 2 - Playstation","PopoRogue - PlayStation","Princess Crown - Sega Saturn","Progenitor - PC98","Puyo Puyo~n - Dreamcast","Radirgy GeneriC - Nintendo GameCube","Rainbow Cotton - Dreamcast","Ranma 1 2: Akanekodan Teki Hihou - Super Nintendo","Rent-A-Hero No.1 - Dreamcast","Rockman & Forte - Super Nintendo","Rogue Hearts Dungeon - PlayStation 2","Rhythm Tengoku - Game Boy Advance","Sakura Wars 2 - Sega Saturn","Screaming Mad George's Paranoiascape - PlayStation","Seiken Densetsu 3 - Super Nintendo","Shadow Tower: Abyss - PlayStation 2","Shin Megami Tensei - PlayStation","Shin Megami Tensei - Super Nintendo","Shin Megami Tensei II - Super Nintendo","Shin Megami Tensei if... - Super Nintendo","Shin Megami Tensei: Nocturne - PlayStation 2","Shining Force III: Scenario 1 - Sega Saturn","Shinrei Jusatsushi Taroumaru - Sega Saturn","Silhouette Mirage - Sega Saturn","Soul Eater: Battle Resonance - PlayStation 2","Soul Eater: Monotone Princess - Wii","Splatter World - NES","Super Famicom Wars - Super Nintendo","Super Robot Taisen A Portable - PlayStation Portable","Super Robot Taisen GC - Nintendo GameCube","Super Robot Taisen J - Game Boy Advance","Super Robot Taisen OG: Original Generations - PlayStation 2","Sword Art Online: Infinity Moment - PSP","Sword of the Berserk: Guts' Rage - Dreamcast","Tactics Ogre: Let Us Cling Together - Super Nintendo","Tales of Phantasia - PlayStation","Tales of Rebirth - PlayStation 2","Tear Ring Saga: Yutona Eiyuu Senki - PlayStation","Tengai Makyou Zero - Super Nintendo","The Human Weapon: Dead Fox - NES","The Hybrid Front - Genesis Mega Drive","The Legend of Sword & Fairy - PC","Time Travelers - 3DS","Tobal 2 - PlayStation","Tomodachi Collection - Nintendo DS","Toradora Portable! - PlayStation Portable","Toukiden Kiwami - PSP","Tsukihime - PC","Vampire Panic - PlayStation 2","Variable Geo - PC98","Waku Waku Puyo Puyo Dungeon - Sega Saturn","Welcome House 2 - Keaton and his Uncle - PlayStation","Wizardry VI: Bane of the Cosmic Forge - Sega Saturn","Wonder Trek - Playstation","Yaku - Playstation","Yu-Gi-Oh! 5D's Tag Force 6 - PSP","Yu-Gi-Oh! ARC-V Tag Force Special - PSP","Zangeki no Reginleiv - Wii","Zanma Chouougi Valhollian - Sega Saturn","Zero: Tsukihami no Kamen - Wii","Zoids VS III - Nintendo GameCube","LINK TO darkuni MEGA LIST OF STEAM DECK VIDEO TUTORIALS","Alternatives to popular games that don't work on Linux SteamOS and Steam Deck","A Hacker's Essential Toolkit","An idiots guide to setting up Minecraft on Steam Deck  SteamOS with controller support","An Introduction to Understanding Hacking 8 Bit Graphics A Tutorial","Arcade ROMs with actual names","Beginner's SNES Hacking Guide","BloodBorne on PC - A Guide","Definitive Guide to rom-hacking for Complete Beginners","Emudeck beginners guide","Emudeck Help Site","Emulation guide (1) by Sahbito","Emulation guide (2) by Sahbito","GBA and DS rom-hacksing Guide","Hacking Games in Hex (Sega Genesis Edition)","How to Dump ROMs - All Systems","How to patch a ROM","How to get Battlefield 3 and Battlefield 4 online working on Linux, SteamOS, Steam Deck","How to install HD Textures for DuckStation","How to install HD Textures for PCSX2","How to install HD Textures for PPSSPP","How to install Hollow Knight: Silksong modson Linux, SteamOS and Steam Deck","How to play games from GOG and Epic Games on Linux, SteamOS and Steam Deck","How to setup OpenMW for modern Morrowind on Linux SteamOS and Steam Deck","Minecraft on Steam Deck","PhysX fix for Linux Steam Deck","Rom Hacking 101","Rom Hacking 102 Font and Sprites","Rom Hacking 103 Script Insertion","Rom Hacking 104 Compression Scheme","Rom Hacking PSP Basics","Solution to slow download speeds on Steam Deck (1)","Solution to slow download speeds on Steam Deck (2)","The Playstation Translation Doc","Waydroid on SteamOS - Android on Steam Deck","Banjo Kazooie Recompilation","Ghostship - Mario 64 PC Port","Super Monkey Ball - Web Browser Game","Star Wars Battlefront II Private Server and Mod Launcher","The Witcher 3 - Witcher Online","Fallout New Vegas - Talk of the Town - Relationships, Marriage and more","Black Mesa - Military","Fallout 3 - Fallout Legends","Starfield - Lakin-Ik","Assassin's Creed Victory Project","Virtua Racing Recompilation","Mega Man Zero 3 Decompilation","New Super Mario Bros U Decompilation","Mega Man 64 Recompilation","Mobhold","Beep-8","Sonic R - R & R","PsyDoom","BitCraft MMORPG Open Source Server Code","Shizuku - PC98","Bubble Bobble Lost Cave C64","Elder Scrolls III - Morrowind Rebirth","Luanti","Surge Engine","Substance Wars 64","Fallout New Vegas - Enhanced Animations - 3rd Person Movement","Mega Man World: Dr. Wily's Revenge DX","Super Mario Land DX","Super Mario Land 2 DX","Wario Land: Super Mario Land 3 DX","Metroid II - EJRTQ Colorization","Final Fantasy Adventure DX","Donkey Kong Land DX","Donkey Kong Land 2 DX","Donkey Kong Land 3 DX","Pokemon Red DX","Revenge Of The Gator Gold DX","Spanky's Quest DX","Balloon Kid DX","Alleyway DX","Snoopy's Magic Show DX","Bomb Jack DX","Amazing Penguin DX","Dr. Mario DX","Galaga & Galaxian DX","Zelda's Adventure Remastered","Beavis and Butt-Head Do Hollywood - Playstation","Persona 3 FES Decompilation","Pokemon HeartGold SoulSilver Decompilation","The Last of Us Demake Browser Game","Ys V: Lost Kefin - Kingdom of Sand - Playstation 2","Star Quest 1 in the 27th Century","2048","CoD Community Launcher - Plutonium","CoD Community Launcher - HorizonMW","Animal Crossing Deluxe","Team Fortress 2 Classified","Mamono Hunter Mai","Harry Potter and the Order of the Phoenix","IsoCity","IsoCoaster","Shattered Pixel Dungeon","Unvanquished","Warsow","Ghosts n' Goblins 2","Tales of Phantasia X - PSP","Banjo Kazooie Recompilation Mods","Prince Of Persia The Sands of Time Remastered","Osu! Lazer","Red Eclipse","The Mana World","Tales of Maj'Eyal","OpenSpades","SuperTux","OpenClonk","SimuTrans","Open Imperium Galactica","OpenArena","FreedroidRPG","Stunt Rally","Spring: 1944","MegaGlest","BZFlag","FreeGish","Angband","PlaneShift","Rigs of Rods","Enemy Territory: Legacy","Pingus","Tuxemon","TripleA","Alien Arena","Magarena","Star Ruler 2","Ryzom","Red Runner","OpenSA","Elona+","Remnants of the Precursors","Tremulous","Terasology","Dead Ascend","Limit Theory Redux","Neverball","Mk48.io","Friking Shark","The Lord of the Rings Conquest - DLC Modded - Online Support","The Lord of the Rings Conquest - MordorWide Online Servers","Shadows of the Past - Formerly The Lord of the Rings Conquest Reimagined","Dead Rising Prototype","All Japan Women's Pro Wrestling Queen of Queens - PCFX","Fallout 4 - Heather Companion Mod","CRW: Metal Jacket - PC98","Tuned Heart - PC98","Pokemon Inritum","Delivery & Beyond","Lode Runner - Nintendo DS","Rockman & Forte - SNES","Dragon Ball Kai: Ultimate Butouden - Nintendo DS","Chobits: Chiidake no Hito - PS2","Junk Runner 64","Brogue: Community Edition","IVAN","Shamogu","Harmonist: Dayoriah Clan Infiltration","Oathbreaker","Shadow of the Wyrm","Sil-Q","Hyperroque","Barotrauma","Mindustry","UltraStar Deluxw","StepMania","Space Station Silicon Valley Recompilation","EmuDevz","Station - Heroes for Hire","OpenBlok","PySol Fan Club Edition","Augustus","ONI Remaster Mod","Red Dead Redemption 2 Texture Pack","Resident Evil HD Remaster 4K Texture Pack","SuperTux 3D","Open Realm of Stars","Ghostship - Mario 64 PC Port - HD Texture Pack","The Witcher 3 - Dawn Over Kovir","Minima","Anteform","MOTHER: Encore","Project Kat","The Freak Circus","Mario Kart Wii DeluxeX","Sonic Megamix Mania","Final Fight Enhanced Edition - Amiga","Cold Case","Grand Theft Auto: Ready2Play","Orbhold","Wonder Project J2 Decompilation","Kula World 32X Port","Castlevania 1 Fortified Army","Chiaki NG","Steam Deck Guide","Awesome Steam Deck","Rog Ally & Steam Deck Ultimate Windows Guides","Heart of the Alien N64 Port","Super Mario 64 Remake","Assassin's Creed Director's Cut Remastered","Walfie's Nonograms","Celeste Classic PSX","Sonic The Hedgehog XA","OldUnreal Game Installers","Super Mario CD Super Mario 64 for the PS1","Friends Adrift","Magic Castle","Mario Kart Double Dash Retro Track Grand Prix","Bangai-O - N64","OpenCiv3","Isometric Games Don't Exist","Xenosaga Episode I Der Wille zur Macht Decompilation","Touhou Koumakyou The Embodiment of Scarlet Devil Decompilation","Fallout The New West","Cyberpunk 2077 The APEX Sonora Canyon and Safehouse Mod","Black & White 2","Zoo Tycoon Complete Collection","Black & White","Sim Ant","MechWarrior 4 Mercenaries","The Movies","Harry Potter and the Sorcerer's Stone","Sonic Heroes","Disney's Tarzan","The Lord of the Rings The Battle for Middle-Earth II","Adidas Power Soccer","Spiderman Web of Shadows","Spiderman Shattered Dimensions","Mushroom Heaven","The Beatles Adventures in Pepperland","Ghost Recon Advanced Warfighter 1 and 2","Of Mice and Mechs","Pikmin 1²","NHL'94 Fight Edition","Sword of Mana QuickMenu​","Snoopy vs The Red Baron","State of Emergency","Rise of Nations Rise of Legends","Super Mariomon​","Wario Land 4 Perfect Version​","Wario Land 4 Jungle Rumble!​","Goodboy Galaxy Emulator Rumble Patch​","A More Modern Amazing Mirror​","A More Modern Amazing Mirror with Coloured Outlines​","A More Modern Nightmare In Dream Land​","Fire Emblem Sacred Stones Reforged​","Rhythm Heaven Silver - Gameboy Advance​","SMAS SMB Lost Levels Brick Fix​","Super Mario World Mix​","Yu-Gi-Oh! The Eternal Duelist Soul HACK​","Castlevania Aria of Sorrow Reprise​","Castlevania Aria of Sorrow Definitive Edition​","Contra Hard Corps Hit Points Restoration Hack​","Super Luigi RPG Star Powered​","Super Metroid Arcade​","Zelda II Amida's Curse​","Zelda II Resurrection of Ganon​","Super Mario Kart Horizons​","The Legend of Zelda Allhallows Eve​","Legend of the Mana Sword​","Close Combat: First to Fight​","The Legend of Zelda Spirit Tracks D-Pad Controls​","WWF Raw​","The Legend of Zelda Phantom Hourglass D-Pad Patch​","Turok: Evolution​","ParaWorld​","Dreamcast Image Builder For Modding Patching Dreamcast Games​","Dreamcast Image Builder Mods​","WoWee World Of Warcraft Engine Experiment​","Mystical Ninja Starring Goemon Recompilation Mods​","Harry Potter and the Deathly Hallows: Part 1​","Shaun White Skateboarding​","Sol Survivor​","Tom Clancy's H.A.W.X 2​","WRC FIA World Rally Championship​","Harry Potter and the Deathly Hallows: Part 2​","Jurassic Park: The Game​","Virtua Tennis 4​","Farming Simulator 2009​","Heroes Over Europe​","Super Junkoid DX​","Yoshi's Island - No Crying, Improved SFX and Red Coins​","Hyper Metroid​","Super Metroid Project Base​","Super Metroid: Subversion​","Super Ghouls N Ghosts - Restoration and Super Arthur​","The Legend of Zelda: Ancient Dungeon​","Terminator: Salvation​","The Warriors: Street Brawl​","Tom Clancy's H.A.W.X​","Motocross Madness​","Motocross Madness 2​","Rockman EXE Phantom of Network PC Port​","Pariah​","Onimusha 3: Demon Siege​","Gunners Heart​","Dynasty Warriors 5​","Dynasty Warriors 4​","Driv3r​","Conflict: Global Terror​","True Crime: New York City​","Sonic Riders​","Micro Machines V4​","Blazing Angels: Squadrons of WWII​","Bionicle Heroes​","Billy Hatcher and the Giant Egg​","Universe at War: Earth Assault​","Mercenary-X: Sky Striker​","Phantasy Star Universe: Ambition of the Illuminus​","Infernal​","Enemy Territory: Quake Wars​","BlackSite: Area 51​","Assault Heroes​","A Farewell to Dragons​","Zoo Tycoon 2: Ultimate Collection​","Turning Point: Fall of Liberty​","The Incredible Hulk​","Shaun White Snowboarding​","Samurai Warriors 2​","Rayman: Raving Rabbids 2​","Kung Fu Panda​","Dynasty Warriors 6​","Lotus Challenge​","South Park - Chef's Luv Shack​","Frogger Returns​","Flash Traffic - City Of Angels​","Jimmy White's Cueball World​","Crazy Cars III​","Bloodwings - Pumpkinhead's Revenge​","Pirates! Gold​","Grand Prix 500 2​","DreamWeb​","PGA Tour Golf 486​","Mad Dog II The Lost Gold​","Who Shot Johnny Rock?​","Secret Mission​","Paperboy 2​","Monkey Island 2 - LeChuck's Revenge Ultimate Talkie DOS Edition​","Jimmy White's 2 - Cueball​","International Sensible Soccer​","Hell - A Cyberpunk Thriller​","Championship Manager 97-98 with 18-19 UpdateMod​","Speedball 2 - Brutal Deluxe​","Cool Spot​","Time Gal​","Project-X Special Edition '93​","Ghostly Desires​","Monopoly Casino​","Ripper​","Wolfpack​","Lotus - The Ultimate Challenge​","Beavis & Butt-Head Mini Games​","Worms - The Director's Cut​","Star Wars Chess​","Voyeur II - Watching Is Not Enough​","Space Invaders​","Star Wars Episode I - Battle For Naboo​","Night Trap​","Mad Dog McCree​","Harvester​","Crash Time III​","Worms Remastered​","Star Wars - Force Commander​","The Secret Of Monkey Island 1 & 2 - Original Versions With Speech Mod​","Crash Time 4 - The Syndicate​","Star Wars Trilogy Arcade​","Hooligans - Storm Over Europe​","007 - Nightfire​","OutRun 2006 - Coast 2 Coast​","Call Of Duty GOY Edition​","Gore: Ultimate Soldier​","Global Operations​","The Wheel Of Time​","The Day The World Broke​","The Dark Eye​","Take No Prisoners​","Synnergist​","Stratosphere: Conquest of the Skies​","Star Trek: The Next Generation - A Final Unity​","Spaceship Warlock​","Shadow Of The Beast Collection​","Perihelion: The Prophecy​","Alien Legacy​","Nightlong: Union City Conspiracy​","Mummy: Tomb Of The Pharaoh​","Master of Dimensions​","Martian Gothic: Unification​","Lifeforce Tenka​","Iron Assault​","Gunman Chronicles​","Gothos​","Gadget Collection​","Future Cop: LAPD​","Frankenstein: Through the Eyes of the Monster​","Faust: Seven Games of the Soul​","Evil Dead: Hail To The King​","Elvira Collection​","Drowned God​","Death Gate​","Daughter Of Serpents​","Companions Of Xanth​","Commander Blood​","Biosys​","Black Dahlia​","Burn: Cycle​","Blue Heat​","Abomination: The Nemesis Project​","Nightmare Creatures​","Pro Evolution Soccer Collection​","F1 2014​","007 Legends​","FIFA 17 Super Deluxe Edition​","FIFA 15​","FIFA 08​","FIFA 13​","FIFA 12 + Euro 2012​","FIFA 11​","Wings Of Glory","Vengeance Of Excalibur","Twilight 2000","Touche: The Adventures Of The Fifth Musketeer","Total Distortion","Tom Clancy's SSN","Times Of Lore","Their Finest Hour: The Battle of Britain - Complete","The Terminator: SkyNET","The Terminator: Future Shock","The Terminator 2029: Deluxe CD Edition","The Scroll","The Orion Conspiracy","The Lost Vikings","The Lost Files Of Sherlock Holmes: The Case Of The Serrated Scalpel","The Lost Files Of Sherlock Holmes: The Case Of The Rose Tattoo","The Gene Machine","The Daedalus Encounter","The Clue!","Spirit Of Excalibur","Space Hulk","Silent Hunter: Commander's Edition","Secret Weapons Of The Luftwaffe - Complete","Seal Team","Ringworld: Revenge Of The Patriarch","Return To Ringworld","Reach for the Skies","Rama","Private Eye","Premier Manager 3","Plan 9 From Outer Space","Pacific Strike - Complete","Operation Stealth - James Bond 007: The Stealth Affair","Oh No! More Lemmings","Noir: A Shadowy Thriller","Neuromancer","NASCAR Racing 2","NASCAR Racing","Jungle Strike","Midwinter II: Flames Of Freedom","Midwinter","Microsoft Flight Simulator v5.1 - Complete","Metaltech Earthsiege - Complete","MechWarrior 2: Mercenaries","MechWarrior 2: Ghost Bear's Legacy","MechWarrior 2: 31st Century Combat","MechWarrior","Lost In Time","Lemmings 2: The Tribes","Lemmings","KGB - Conspiracy","Journey: The Quest Begins","Jane's Combat Simulations: Longbow - Gold","J.R.R. Tolkien's The Lord of the Rings Vol. II","J.R.R. Tolkien's The Lord of the Rings Vol. I","Burnout 2 - Point of Impact","Burnout 3 - Takedown","Innocent Until Caught 2: Presumed Guilty","Innocent Until Caught","IndyCar Racing II","IndyCar Racing - Complete","Inca II: Nations of Immortality","Inca","Hopkins FBI","Ghosts","Geisha","Future Wars: Adventures In Time","Fascination","Fade To Black","Fable","Athens 2004","Ecstatica II","Ecstatica","Dungeon Master II: The Legend of Skullkeep","Dungeon Master","Dune II: The Battle for Arrakis","Dune 2000","Dune","Druid: Daemons Of The Mind","Dreamweb","Discworld II: Missing Presumed!?","Discworld","Destruction Derby","Desert Strike: Return to the Gulf","Dark Seed II","Dark Seed","Conan: The Cimmerian","Circuit's Edge","Chuck Yeager's Air Combat","Buck Rogers: Matrix Cubed","Buck Rogers: Countdown To Doomsday","Beavis And Butt Head In Virtual Stupidity","Alien Virus","Alien Logic","Aces Over Europe","Aces Of The Pacific - Complete","Aces Of The Deep - Complete","A-10 Tank Killer","Warcraft III Complete Edition","The Sims","The Lord Of The Rings The Battle For Middle Earth","The House Of The Dead","The House Of The Dead 3","The House Of The Dead 2","Teenage Mutant Ninja Turtles 2 Battle Nexus","Sydney 2000","StarCraft","Spiderman The Sinister Six","Spiderman 2 Activity Center","SEGA Worldwide Soccer","Reservoir Dogs","Re-Volt","Pac Man All Stars","NBA Live 2004","Microsoft Train Simulator","Microsoft Combat Flight Simulator 2 WW II","Manx TT Super Bike","Lotus Challenge","Age Of Mythology","FEAR","Dave Mirra Freestyle BMX","Cyber Troopers Virtual On","Crazy Taxi","Colin McRae Rally 04","Blazing Angels 2 - Secret Missions Of WWII","Beetle Crazy Cup","Atlanta 1996","Secret of Mana: Reborn","The Third of the Third - Street Fighter III: 3rd Strike Decompilation","Dragon Ball Z Budokai HD Recompiled","Blue Dragon Recompilation","Pyrite64 - N64 Game-Engine and Editor using libdragon & tiny3d","Streets of Rage 2: Andore’s Rampage","Monster Hunter Portable 3rd - PSP","What A Mario World!","Aurora OS.js","Fallout: Vault 666","IKEMEN","Pasta La Vista Super Mario Bros.","Embers of Mana","Star Wars Jedi: Survivor - Camera and Animation Stutter Fix","Usurper Reborn","Valkyria Chronicles 3 - PSP","Ninja Gaiden II Recompilation","The Wind Waker Rewritten","Pokemon Crossroads","Tetrominos","Prize Fighter Heavyweight Edition","Metal Gear Solid V: The Phantom Pain - Ground Zeroes","The Tairyou Jigoku - PS2","Keitai World Launcher","Duke Nukem Zero Hour Recompilation First Person Mod","Fallout New Vegas - For A Few Brahmin More","Bloodborne - HardBorne Overhaul Mod","Cyberpunk 2077 Unofficial DLC 2","Castlevania Order of Shadows Golden Belmont","NX-Optimizer","Forza Motorsport 2","Forza Motorsport 3","Forza Motorsport 4","Forza Horizon","Forza Horizon 2","Forza Horizon 2 Presents Fast And Furious","Forza Horizon 3","Forza Motorsport 7","ReadyM","A Super Mario World","Legend of Mana Decompilation","Silent Hill 3 Decompilation","Chrono Cross Decompilation","Crash Tag Team Racing Gamecube Decompilation","Kirby's Dream Collection Decompilation","Dog's Life Decompilation","Halo Reach Decompilation","Pokemon XD: Gale of Darkness Decompilation","The Legend of Zelda: Ocarina Of Time Dreamcast Port","Resident Evil Requiem - Xenomorph Mod","Star Wars: First Assault","Celeste Classic Sega Saturn Port","Rise Of The Tomb Raider HD 4K 8K Texture Collection","Perfect Dark PC Port - Friends of Joanna 4-Player Counter + Co-Operative Mod","Pokemon Aether White 2","Bugdom","Bugdom 2","Billy Frontier","Mighty Mike - Power Pete","Nanosaur","Nanosaur 2","Otto Matic","Dungeon Keeper In Browser","Multiplayer Mods Mega List","Breath of Fire Definitive Edition","Breath of Fire II Definitive Edition","Starfield STFI HD Landscape 4K","Fallout 4 Padre Mateo - A Quest Mod","Resident Evil Village - High Textures Mod","The Witcher 3 Kaer Morhen Extended Edition","Zombie Panic!","Lupin III: The Sage of Pyramid - Sega Saturn","Bubble Buddies","Animal Crossing PC Port","Red Dead Redemption 2 - Blurbs Pokemon RPG","Paprium - Online Multiplayer","Minecraft - Arnis","Baldur's Gate 3 - Baldur's Gate 1 Remake Demo","Animal Crossing PC Port HD Texture Pack","Resident Evil Requiem VR Mod","DeckOps","Oblivion Remastered CityLord Series The Fight Club","Oblivion Remastered Battlehorn Castle Expansion","Klonoa: Empire of Dreams Decompilation","Black & White Decompilation","Monster Hunter Portable 2nd G Decompilation","New Play Control! Pikmin Decompilation","New Play Control! Pikmin 2 Decompilation","Tetris Browser Based","Crimson Desert AHK Hotkeys for Jogging Sprint and Esc Menus","Bomberman 64 Recompilation","MHServerEmu - Marvel Heroes MMO Fan Server","Heretic II Source Port","RE:Enhance","Batman Arkham Origins Advanced Graphics","Fire Emblem: Path of Radiance Decompilation","Alone In The Dark Decompilation","Sheep Wolf N Dog Decompilation","The Legend of Zelda: The Wind Waker 4K Texture Pack","Friday the 13th Revisited","Blaze and Blade Busters - Playstation","Digimon World Decompilation","The Legend of Zelda: Spirit Tracks Decompilation","Lego City Undercover Decompilation","Mortal Kombat 2 3DO Port","Fallout New Vegas - The Unforgiven REDUX","40 Winks Gameboy Colour","TeknoParrot","Monster Hunter Stories 3 Twisted Reflection HD Texture Pack","Pilotwings 64 Decompilation","RexGlue - Xbox 360 Recompilation Runtime and Toolkit","Banjo-Kazooie Nuts and Bolts Recompilation","Ninja Gaiden 2 Recompilation","Halo 3 Delta Recompilation","Viva Pinata: Trouble In Paradise Recompilation","Fallout New Vegas - Retribution REDUX","Pekka Kana 2","TecnoballZ","H-Craft Championship","Hero of Allacrost","Valyria Tear","tenmado","Hurrican","The Secret Chronicles of Dr. M.","Gravity Bone","Enigma","Starflight - The Lost Colony","Pocket Palm Heroes","Transball GL","Einstein Puzzle","Surge the Rabbit","Q3Rally","Open Hexagon","Double Damnation","Solaris","Naikari","OpenSoldat","The Powder Toy","OpenDungeonsPlus","shapez","Super Mario Bros. Sega Master System Port","Street Fighter III: 3rd Strike PSP Port","Adventure on Eos","Worms Armageddon Open Source Re-implementation","Yorg","Scorched3D","Vega Strike","Liberation Circuit","Deer Portal","Dust Racing 2D","Steam Sky","AstroMenace","World of PADMAN","Cave Story Sega Megadrive Port","Ridge Racer Collection with Online Play","Silent Hill 2 Decompilation","Seen in Liberty City - GTA 3 PSP Remake","Starfield - NeonExpansion","Advanced Strategic Command","CaveExpress","Wyrmsun","Shadow Over the Twelve Lands","Bos Wars","reTux","Maelstrom","SDL Scavenger","SDL Asylum","Noctis IV Plus","Tony Hawk's Underground","OniFoxed","Magical Broom Extreme","HoverRace","RoadFighter","F1-Spirit","Super Methane Brothers","Gardens of Kadesh","Skyrim Special Edition - NEW DAWN Redux Modlist","Fallout: New Vegas Decompilation","OpenNotrium","Elite-Reinforce","Seven Kingdoms: Ancient Adversaries","RigelEngine - Re-implementation Duke Nukem II","Open-IW","FreeSynd - Re-implementation of Syndicate","jftekwar - TekWar Port","Commander Genius","Dethrace Labs","Bioshock - The War In Rapture","Skyrim Special Edition - Through Fire and War - A Morrowind Inspired Quest","Terminal Breeder","Tomb Raider N64 Port","The Legend of Zelda: Majora's Mask PS Vita Port","Devil May Cry 4 Refrain Vita","The Legend of Zelda: Ocarina of Time PS Vita Port","Animal Crossing PS Vita Port","Baldur's Gate: Dark Alliance PS Vita Port","Unreal PS Vita Port","Arx Libertatis PS Vita Port","Super Mario All-Stars PS Vita Port","Super Mario World PS Vita Port","Perfect Dark PS Vita Port","The Legend of Zelda: A Link to The Past PS Vita Port","PortForge - A De-Recompilation Port Manager","Final Fantasy VIII Decompilation","1080 Snowboarding Decompilation","Pokemon Ranger: Shadows of Almia Decompilation","Tiny Dec - Educational decompiler that helps people understand how decompilation works","Ghostship - Mario 64 PS Vita Port","Starship - Starfox 64 PS Vita Port","Star Warfare: Alien Invasion PS Vita Port","Mario's Modules 2","Mega Man DXtreme","OpenMW - Morrowind PS Vita Port","Pokemon Light Platinum DS","Tiny Bullets - Playstation","Battleship - Smash Brothers 64 PC Port","Bomberman Hero Recompilation","Mario Kart 64 PS Vita Port","Tomb Raider: Side-Scroller Edition","The Legend of Zelda: The Minish Cap PC Port","Librelancer","Resident Evil - Requiem for Ravenholm","Paper Mario: Star Nova","Parasite Eve 2 Decompilation","WarioWare Inc. Decompilation","Animal Crossing Gamecube Web Port","Flare","Triggerheart Exelica - Dreamcast","Dusklight - The Legend of Zelda Twilight Princess PC Port","Paperboy 64 Decompilation","Evos Space Adventures Decompilation","Ultima V Warriors of Destiny Decompilation","Tokyo Bus Guide Decompilation","Armored Trooper Votoms - Playstation 2","Racing Battle: C1 Grand Prix - Playstation 2","Dusklight - The Legend of Zelda Twilight Princess PC Port Texture Pack 1","Pokemon Snap 3DS Port","Ace Driver - Arcade Emulator for Xbox 360","Castlevania - Sega Master System Port","SpelunkyClassicHD","Starfield - Star Wars Resources - Galaxy","Star Fox 64 PSP Port","Beat Hazard 2 PS Vita Port","VitaDB Downloader","Universal Dreamcast Patcher","R. C. Pro Am SNES Port","Goopie - Xbox 360 Recompilation Launcher","Kameo: Elements of Power Recompilation","Lollipop Chainsaw Recompilation","Naughty Bear Recompilation","Destroy All Humans: Path of the Furon Recompilation","Ecstatica 1 and 2 Recompilation","nesrecomp - NES Recompiler Project","Castlevania - Symphony of the Night GBC","Animal Crossing GBC","BlasNESmous - Blasphemous NES Demake","Magiczna kula Papatki Decompilation","Return to Castle Wolfenstein PS Vita Port","PS2Recomp - Playstation 2 Static Recompiler & Runtime Tool to make native PC Ports","Terranigma Redux","Five Nights At Freddy's 3: Wii Edition","Quetoo","WCW nWo Revenge Starrcade Edition","Grand Theft Auto: San Andreas - Carcer City","Grand Theft Auto 5 - Squid Games","Saints Row 2 - Console DLC For PC","Battleship - Smash Brothers 64 PC Port Netplay","Real Robots Final Attack - Playstation","Sonic Advance 3 SP","WWE SmackDown vs. Raw 2007 Recompilation","ReCut - Paper Mario Recompilation","Gradius Generation BLACK LABEL","SNESRecomp","Super Mario World Recompilation","The Legend of Zelda: A Link to the Past Recompilation","Mega Man X Recompilation","Pokemon Crystal PC Port","Banjo Kazooie Recompiled Stereoscopic 3D","Perfect Dark Recompiled Stereoscopic 3D","Phantasy Star Generation:2 - PS2","Daytona USA Recompilation","Morrowind - Muffinwind Rebaked","Skate 3 Recompilation 1","Skate 3 Recompilation 2","Lost Odyssey Recompilation","The Outfit Recompilation","Test Drive Unlimited Recompilation","Rock Band 3 Recompilation","Eternal Sonata Recompilation","Castlevania Legacy of Darkness Recompilation","Unreal Tournament PS Vita Port","Resident Evil 4 Mobile PS Vita Port","PAC-MAN Championship Edition DX PS Vita Port","Call of Duty Black Ops Zombies PS Vita Port","Marvel's Spider-Man 2 First Person Camera Mod","RecompOne - Static PSOne Recompiler","Soul Blazer - SNES","Rushing Beat Shura The Eternal Conflict - SNES","Kowloon's Gate - Playstation","Dusklight - The Legend of Zelda Twilight Princess PC Port Web Browser Build","Pokemon Stadium Recompilation","Goldeneye XBLA Recompilation","Paper Mario Down Bad Edition","SNES Cheat Patcher Studio - Apply Game Genie Cheats To SNES Roms","Silent Hill PC Port","Super Mario 64 Nintendo DS Port with Multiplayer","Earthbound Beginnings Remake","Fire Emblem: Seima no Kouseki Decompilation","Star Wars: Rogue Squadron II - Rogue Leader Decompilation","Homeworld 2 Classic Decompilation","Wolfenstein 3D Atari Lynx Port","Ironclad - Xbox 360","Resident Evil 4 - Multiplayer Mod","DARIUSBURST SP PS Vita Port","A Bite at Freddy's PS Vita Port","Colin McRae Rally 2.0","Colin McRae Rally","Snowboard Kids Decompilation","God Hand Decompilation","WWE 2K16","WWE 2K17","WWE 2K18","WWE 2K19","WWE 2K20","WWE 2K22","WWE 2K23","Starship Troopers - Terran Ascendancy","Ghostbusters: The Video Game","Dexter: The Game","House M.D.","MechCommander: Gold","MechCommander 2","Onimusha 3: Demon Siege","Forza Horizon 4","Colin McRae: DiRT","Tom Clancy's Ghost Recon Advanced Warfighter","Tom Clancy's Ghost Recon Advanced Warfighter 2","Star Trek","The Lord Of The Rings - War Of The Ring","Peaky Blinders Mastermind","Tony Hawk's Pro Skater 2","Tony Hawk's Pro Skater 3","Tony Hawk's Underground","Tony Hawk's Underground 2","Tony Hawk's Pro Skater HD","Grand Theft Auto 2","MLB 2K9","MLB 2K10","MLB 2K11","Prison Break: The Conspiracy","Tonic Trouble","The Neverhood","Disney's G-Force","Sheep, Dog, 'n' Wolf","CSI: 3 Dimensions Of Murder","Star Trek Legacy","Lost: Via Domus","NBA Playgrounds","NBA 2K Playgrounds 2","Deep Black: Reloaded","Cabela's Dangerous Hunts 2013","Pirates Of The Caribbean: At Worlds End","Friday The 13th - Killer Puzzle","LEGO 2K Drive","Madden NFL 08","Fuser","X2: Wolverine's Revenge","Pro Evolution Soccer 2014","Pro Evolution Soccer 2015","Pro Evolution Soccer 2016","Pro Evolution Soccer 2017","Pro Evolution Soccer 2018","Pro Evolution Soccer 2019","eFootball PES 2020","eFootball PES 2021","Banjo-Kazooie Recompilation for Android","Alundra Definitive Edition","Ancient Ys Vanished Omen - PC-98","Deadly Premonition Recompilation","Silent Hill: Downpour Recompilation","Snowboard Kids 2 Recompilation","Crash Team Racing PC Port","DolRecomp - A static recompiler for GameCube, Wii, and experimental Wii U CPU code","Smash Remix: Project Galleon","OpenPREY","Ship of Harkinian - Zelda Ocarina of Time Port - Cel Shaded Model Mod","Monster Hunter Dynamic Hunting PS Vita Port","Castlevania ReVamped Android Port","PS3Recomp - Static Recompilation Runtime Libraries for PlayStation 3 Titles","Premier Eleven - Dreamcast","Harvest Moon 64 Recompilation","Dark Lands PS Vita Port","Aleph One PS Vita Port","Resistance Fall of Man - ResistanceOnline","Damnation","LEGO Star Wars: The Video Game","LEGO Star Wars II: The Original Trilogy","Horizon Chase Turbo","Ace Combat 6: Fires of Liberation Recompilation","Resistance 2 RPCS 3 Patched Build","1 GithubLauncher - Universal Launcher for Recompilations and PC Ports","NocturneRecomp - Castlevania Symphony of the Night XBLA Recompilation","Metal Slug XX Recompilation","Perfect Dark VR Port","Harvest Moon 64 Recompilation Mods","Diablo 3 Xbox 360 Recompilation","Kingdom Hearts 358 2 Days Decompilation","Digimon World 4 Decompilation","Halo 3 Permafrost","Mega Man X6 Recompilation","Virtual Pro Wrestling 2 Recompilation","Tomba! Recompilation","WCW vs. nWo World Tour Recompilation","Grand Theft Auto 3 - Liberty Extended","Grand Theft Auto Vice City - Vice Extended","Mega Man X4 Recompilation","Virtua Racing PC Emulation","Virtua Fighter PC Emulation","Zool Majyu Charmer Legend - N64","ModernGekko - Static-Recompilation pipeline for GameCube and Wii games","The Legend of Zelda Majora's Mask Recompilation for Android","Monster Hunter Decompilation","Lemmings Paintball Decompilation","Dragon Quest IV Decompilation","Crash Bandicoot The Wrath of Cortex Decompilation","Tenchu Decompilation","MOTHER Encore PS Vita Port","After Burner Climax PS Vita Port","Gears of War 2 PC Port","Mischief Makers Recompilation","Chameleon Twist Recompilation","WWF WrestleMania 2000 Recompilation","WCW nWo Revenge Recompilation","WWF No Mercy Recompilation","Virtual Pro Wrestling 64 Recompilation","AkiLauncher - Launcher for the AKI-engine N64 Wrestling Recompilations","Infamous RPCS 3 Patched Build","Uncharted RPCS 3 Patched Build","Motorstorm Pacific Rift RPCS 3 Patched Build","Uncharted 2 RPCS 3 Patched Build","Wet RPCS 3 Patched Build","Dodonpachi Saidaioujou Recompilation","GreenVita - Xbox Cloud Gaming on PlayStation Vita","Pokemon Red Recompilation","Kirby's Return to Dream Land Recompilation","Street Fighter III Third Strike PC Port","Heavenly Sword RPCS 3 Build","Rain RPCS 3 Build","Tokyo Jungle RPCS 3 Build","Folklore","Pepsiman Recompilation","Sega Rally Championship PC Emulation","StarCraft 64 Campaign Co-Op Mod","UnderMobile - Undertale Android Port","Fullmetal Alchemist 3 The Girl Who Succeeds God - Playstation 2","VL.MR - Hub for Browser Based Recompilation Projects","2 Quiver - Recompilation Launcher","Crash Bandicoot PC Port","Smash Remix +Extra","Saw - PC Patched","Crazy Taxi 3 - PC Patched","Spider Man Friend Or Foe - PC Patched","Halo 2 - PC Patched","Resident Evil Dead Aim - PC Patched","The Simpsons Game Recompilation","Hollow Knight Android Port","Super Mario 64 Android Port","DevilutionX - Diablo 1 - Android Port","Ship of Harkinian - The Legend of Zelda Ocarina of Time Android Port","Brotato Android Port","The Case of the Golden Idol Android Port","Delta Touch - Doom Engine Source Ports for Android","Zeta Touch - Raze and EDuke32 Engines for Android","VCMI - Open Heroes 3 - Heroes of Might and Magic 3 - for Android","Quad Touch PC Quake engines for Android","Alpha Touch 90’s classic FPS shooters for Android","OpenMW - Morrowind for Android","Sonic Unleashed Recompilation for Android","PartyBoard - Mario Party 4 for Android","OpenCrossing - Animal Crossing for Android","Sigma Touch - Unreal and Unreal Tournament 99 Engine for Android","Battleship - Super Smash Brothers 64 for Android","The Simpsons Hit & Run for Android","Perfect Dark for Android","Pokemon Red, Blue and Yellow Recompilation","Pokemon Red, Blue and Yellow Recompilation Dramatic Shape Voxel Mod","Pokemon Red Blue and Yellow Recompilation","Pokemon Red, Blue and Yellow Recompilation Dramatic Shape Voxel Mod","The Legend of Zelda the Minish Cap for Android","Link's Awakening DX HD for Android","2 Starboard Play Games From The Portmaster Library On Your Android Handheld","1 Obtainium","SwitchNow a Native Nintendo Switch Homebrew Client for Geforce Now","AM2R for Android","Gran Turismo 2 PC Patched","Forza Horizon PC Patched","Forza Horizon 2 PC Patched","Forza Motorsport 3 PC Patched","Forza Motorsport 4 PC Patched","Dirge Of Cerberus: Final Fantasy VII PC Patched","Midnight Club LA Complete Edition PC Patched","Gears Of War 2 PC Patched","Vigilante 8 Arcade PC Patched","Gears Of War 3 PC Patched","Gun PC Patched","Midnight Club 3 Dub Edition Remix PC Patched","Pirates Of The Caribbean At Worlds End PC Patched","Gear Of War Judgment PC Patched","Fist Of The North Star - Kens Rage 2 PC Patched","Fist Of The North Star - Kens Rage PC Patched","Naruto - The Broken Bond PC Patched","Naruto - Rise Of A Ninja PC Patched","Dragon Ball Z - Ultimate Tenkaichi PC Patched","Dragon Ball - Raging Blast 2 PC Patched","Dragon Ball - Raging Blast PC Patched","Dragon Ball Z - Burst Limit PC Patched","Resident Evil - Code Veronica X PC Patched","Fable II - Game of The Year Edition PC Patched","The Sly Collection PC Patched","Sly Cooper - Thieves in Time PC Patched","Drakengard 1 & 2 PC Patched","ICO PC Patched","Ninja Gaiden II PC Patched","Drakengard 3 PC Patched","Fatal Frame Trilogy PC Patched","Splatterhouse PC Patched","Haunting Ground PC Patched","Captain America Super Soldier PC Patched","Dante's Inferno PC Patched","Gravity Rush Remastered PC Patched","2010 FIFA World Cup South Africa PC Patched","Asura's Wrath PC Patched","Gravity Rush 2 PC Patched","Lost Odyssey PC Patched","Blue Dragon PC Patched","RimDroid - RimWorld Launcher for Android","Automobili Lamborghini Recompilation","Halo Campaign Evolved Split-Screen Co-op Mod","Surging Aura - Sega Megadrive","Diddy Kong Racing WebGPU Android Port","Syphon Filter PC Port","TeknoParrot for Android","Super Smash Bros. 64 Nintendo DS Port","Croc Definitive Edition","Mad Monks Revenge Definitive Edition","Dominatrix - Port of SiN","Colditz Escape","C-Dogs SDL","The Legend of Zelda A Link to the Past Dual Screen Nintendo 3DS Port","The Legend of Zelda A Link to the Past for Android","Crash Team Racing for Android","Warcraft II for Android","Dune 2 For Android","Xash3D FWGS engine for Half-Life - Blue Shift - Opposing force","Goldeneye Recompilation for Android","Golden Balloon - Diddy Kong Racing Recompilation","idTech4A++ - Engine for Doom III - Quake 4 - Prey 2006 on Android","Lighthouse - Banjo Kazooie PC Port","Source Engine for Android","OpenRCT2 - Rollercoaster Tycoon 2 for Android","OpenTTD for Android","CorsixTH - Theme Hospital for Android","OpenLara - Tomb Raider Engine for Android","Zomdroid - Unofficial Project Zomboid Launcher for Android","OpenStarbound for Android","Super Mario Maker World Engine for Android","Counter Strike 1.6 for Android","Unturned for Android","GameNative - run supported Steam, Epic and GOG games locally on Android","Warsmash - Warcraft 3 for Android","Fallout Community Edition for Android","Fallout 2 Community Edition for Android","Daggerfall for Android","Classic Core - Unofficial Android Ports of Classic Game Engines","Holotz's Castle","OpenJKDF2 - Dark Forces 2 for Android","OpenXcom for Android","Exult - Ultima VII for Android","Arx Libertatis - Arx Fatalis for Android","Jagged Alliance 2 Stracciatella for Android","Julius - Caesar III for Android","Augustus - Caesar III for Android","Freeciv for Android","Pokemon Platinum PC Port","Team Fortress 2 ReClassic for Android","Rexuiz for Android","Super Mario Bros Remastered for Android","Space Cadet Pinball for Android","Pinball FX GO for Android","Sonic Roboblast 2 for Android","Game Collection - Portal Beta, Cuphead, Buckshot Roulette and SMM_WE for Android","Star Trek Voyager - Elite Force Single Player for Android","Star Trek Voyager - Elite Force Holomatch for Android","sdlioq3a - Quake III for Android","Sonic Mania Plus for Android","Sonic the Hedgehog Forever for Android","Sonic 2 Absolute for Android","Sonic CD Restored for Android","Render96 for Android","Spaghetti Kart - Mario Kart 64 Recompilation for Android","Starship - Starfox 64 Recompilation for Android","Ghostship - Mario 64 Recompilation for Android","EasyRPG Player for Android","Pizza Legacy - Pizza Tycoon Port","Castlevania Symphony of the Night Recompilation","Robocop Megadrive Port","Teenage Mutant Ninja Turtles - Out of the Shadows PC Patched","Wipeout HD Fury with Multiplayer PC Patched","Jump Force PC Patched","Siren Blood Curse PC Patched","The Legend of Spyro Dawn of the Dragon PC Patched","Ratchet and Clank Quest For Booty PC Patched","Spiderman 3 PC Patched","Fight Night: Champion PC Patched","Soul Calibur IV PC Patched","Disgaea D2: A Brighter Darkness PC Patched","ModNation Racers PC Patched","Demon's Souls PC Patched","Guitar Hero Metallica PC Patched","Bloodborne PC Patched","Never Dead PC Patched","God of War 3 PC Patched","Dragon's Crown PC Patched","Darkenstein 3D","Vandal Hearts PC Port","MobileUO - Ultima Online Mobile Port","Pokemon Everworld Online","Aleph One - Marathon Trilogy for Android","Supreme Commander Forged Alliance - Forged Alliance Forever","Pokemon Brown 3D","Harvest Moon 64 Recompilation with Dual Screen Support for Android","Dusklight - The Legend of Zelda Twilight Princess Recompilation for Android","Sonic Triple Trouble for Android","Condemned 2: Bloodshot Recompilation","Pokemon Gamma Emerald","London Seirei Tanteidan - Playstation","Godzilla PC Patched","Syphon Filter 2 Recompilation","AM2R Autopatcher for Android","Banjo Kazooie Switch Port","Doom 64 Switch Port","Super Mario 64 Switch Port","The Legend of Zelda Majoras Mask Switch Port","The Legend of Zelda Majoras Mask Wii U Port","Star Fox 64 PSP Port","Perfect Dark PSP Port","Super Mario 64 PS4 Port","Perfect Dark 3DS Port","Super Mario 64 3DS Port","Super Mario 64 Nintendo DSi Port","Banjo Kazooie VR","Super Mario 64 VR","Mario Kart 64 VR","Star Fox 64 VR","Sonic Robo Blast 2 VR","Dr. Robotnik's Ring Racers VR","Port of the Xash3D-FWGS Half Life Engine to Oculus Quest","Quake VR","Quake 2 on the Oculus Quest","Doom 3 VR","Return to Castle Wolfenstein for the Oculus Quest","Jedi Knight games on OpenXR Devices","Jedi Knight games on OpenXR Devices","Tomb Raider VR","Prey VR","RazeXR - Duke Nukem 3D, Blood, Shadow Warrior, etc","QuestZDoom - DOOM, Heretic, Hexen, Strife, etc","Metal Gear Solid Fan Remake","The Legend of Zelda Ocarina of Time VR","SEGA VS CAPCOM","Infinity Blade for Android","Pokemon Dark Rising Remake","Pokemon Dark Rising Remake","Ys III Wanderers - Playstation 2","Ys V Lost Kefin - Playstation 2","Messenger","Dungeon Keeper in Browser","Dusklight - The Legend of Zelda Twilight Princess Recompilation in Browser","The Elder Scrolls III Morrowind – OpenMW in Browser","Half-Life 2 in Browser","Portal in Browser","Diablo in Browser","3D Pinball Space Cadet in Browser","Wipeout in Browser","Doom – WebPrBoom in Browser","Doom 3 Demo in Browser","Quake – Quake WASM in Browser","Quake 2 – Quake WASM2 in Browser","Arx Fatalis – Arxwasm Demo in Browser","Homeworld - Gardens of Kadesh Demo in Browser","Cave Story in Browser","Commander Keen in Browser","Cro-Mag Rally in Browser","Descent Descent II – DXX-Rebirth in Browser","Duke Nukem 3D – Belgian Chocolate Duke3D in Browser","Fallout Nevada Sonora in Browser","Might and Magic II - fheroes2 in Browser","Prince of Persia in Browser","Tyrian – OpenTyrian in Browser","Tomb Raider in Browser","Super Monkey Ball in Browser","Tetris in Browser","The Last of Us Demake in Browser","Cyberpunk 2077 VR","Call of Duty 4 Modern Warfare VR","BioShock Remastered VR","Skyrim VR","Resident Evil Requiem VR","Silent Hill 2 VR","Eternal Sonata Recompilation","Call of Duty Black Ops Zombies for Android","Donkey Kong Land PC Remake","The Legend of Zelda Breath of the Wild VR","Command & Conquer Generals in Browser","Doom 2 in Doom 3","ZQuest Classic in Browser","Surreal Engine Web – Unreal UT99 in Browser","F-Zero X PC Port","Diddy Kong Racing Recompilation","F.E.A.R. 2: Project Origin VR Mod","Asobi: Remote Play - Stream PS Plus games to Steam Deck or Steam Machine","Unreal Tournament VR","Super Mario 64 DS PC Port","Sonic the Hedgehog 2006 Android Port","Pokemon Gold PC Port","Pokemon Gold Port for Android","Battlefield 1942 VR","Ace Combat 6 Recompilation","Metroid Prime Origins","The Legend of Zelda: Z for 2 - Two Player Simultaneous Co-Op","Spyro the Dragon Recompilation","Twisted Metal 4 Recompilation","The Legend of Zelda The Minish Cap 3DS Port","1 The Multiverse VR Hub","Untitled Sonic Fangame","Mario Kart 64 3DS Port","Street Fighter Aplha 3 Recompilation","Zenonia 3 PS Vita Port","Crash Bandicoot for Android","World of Warcraft for Android","Ace Combat X Recompilation","GTA: Vice City Stories Recompilation","Tama: Adventurous Ball in Giddy Labyrinth - Sega Saturn","Hissatsu! - Sega Saturn","Pokemon Blue VR","Ridge Racer Collection","Spaghetti Kart - Mario Kart 64 PC Port Track Editor","Baldur's Gate 2: Enhanced Edition PS Vita Port","Hollow Knight: Silksong for Android","Jeb's Legend of Zelda","Outertale - Project Spacetime","Five Nights At Frickbear's 3","Five Nights At Frickbear's 3","Pokemon Gamma Emerald - Early Access","Prey 2017 Co-op","Castlevania: Symphony of the Night for Android","Goldeneye 007 Random-Eye-zer Mod","Outlast VR","Mine64 - Minecraft for N64 in Browser","Sim Copter Reimplementation","Dusklight - The Legend of Zelda Twilight Princess VR","Rage Racer PC Port","Pokemon Dawn of Darkness MMORPG","Metroid Prime Hunters Recompilation","Dragon Ball Z: Buu's Fury Recompilation","ChonkCraft - Warcraft 2 Rebuilt","Street Fighter 3: 3rd Strike Online Edition Recompilation","Jackie Chan Stuntmaster PC Port","Jackie Chan Stuntmaster PC Port - Steam Deck Fork","Fallout New Vegas: Tale of Two Wastelands","Sonic 4 Episode 1 in Browser","Sonic the Hedgehog for Android","Sonic the Hedgehog 2 for Android","Lighthouse - Banjo Kazooie Port for Android","Lighthouse - Banjo Kazooie PS Vita Port","Tony Hawk's Project 8 Recompilation","Mega Man X Regenesis","Grand Theft Auto Vice City VR","Minecraft: Story Mode PS Vita Port","1 The Multiverse VR Hub","Zelda II: The Adventure of Link Co-op","Resident Evil 4 VR","Jedi Knight: Dark Forces II Xbox Port","Yu-Gi-Oh! Forbidden Memories Recompilation","DONTFORGET","DONTFORGET","RIBBIT - The Deltarune Mod","Kirby Battle Blitz!","Mega Man 8-Bit Deathmatch","OFF","FreeCiv in Browser","Dune 2 in Browser","Kiki the Nano Bot in Browser","Moon Child FE in Browser","Undertale 2","Deltatraveler - Deltarune Interdream","Skate 3 Recompilation for Android","Castlevania MX","Project Gotham Racing 4 Recompilation","Dragon Quest VIII: Masterpiece Reborn PC Port","Dragon Quest VIII: Masterpiece Reborn for Android","Amnesia: The Dark Descent for Android","Penumbra: Black Plague for Android","Grand Theft Auto Vice City in Browser","Virtua Cop 2 VR","OpenXCOM Nintendo 3DS Port","Command & Conquer 64 PC Port","Star Wars: Masters of Teras Kasi Recompilation","Rampage Through Time Recompilation","System Shock for Android","Red Faction VR","RPG Maker DS+ Create the New World - Nintendo DS","Hollow Knight: Silksong Dual-Screen Android Port","Doom 64 Ray Tracing","Bloody Roar 2 Recompilation","Terraria in Browser","Celeste in Browser"],"u":["https://www.romhacking.net/hacks/6012/","https://www.moddb.com/mods/the-horse-lords-a-total-modification-for-bfme/news/age-of-the-ring-goes-standalone","https://romhackplaza.org/romhacks/alleys-of-anime-2-genesis/","https://8bitslasher.itch.io/ahu666","https://gamejolt.com/games/alteredbeastremake/954814","https://archive.org/details/am-2-r","https://amcsquad.itch.io/game","https://feuniverse.us/t/awful-emblem-version-1-0-release/3987/33","https://youtu.be/-niehkOWOKg?si=Na1yDdAOiR7URSDP","https://youtu.be/d5lUT7SSAgg?si=OVsXeH6AOXAxka8k","https://youtu.be/dfOERKSm_UE?si=PQOBo8Oj9y1mpraa","https://tunicate.itch.io/barkley","https://archive.org/details/BarkleyShutUpAndJamGaiden","https://gamejolt.com/games/battle-stormer-classics/14507","https://holmadegames.itch.io/bit-of-war?ref=retrododo.com","https://archive.org/details/blaster-master-snes","https://alarconos.itch.io/videogame182","https://archive.org/details/bloodborne-psx-demake-v-1.05","https://chromadeline.itch.io/bound-to-the-dark-world","https://daves-retro-forge.itch.io/bubble-bobble-c64-remastered","https://sites.google.com/view/cvsqfangame/home?authuser=0","https://rubbersharkman.itch.io/capoeira-fighter-3-legacy-edition","https://gamejolt.com/games/capa/1006805","https://www.bxfoundry.com/cardminer/","https://www.smwcentral.net/?p=section&a=details&id=40149","https://danteretrodev.itch.io/akumajou-dracula-aga","https://romhackplaza.org/romhacks/castlevania-alternate-scarlet-symphony-playstation/","https://cdromance.org/windows/castlevania-chronicles-ii-simons-quest-fan-made-remake-2/","https://cdromance.org/windows/castlevania-chronicles-iii-draculas-curse-fan-game-windows-pc/","https://www.romhacking.net/hacks/9309/","https://retrolorean.com/en/castlevania-haunted-castle-2-10730","https://archive.org/details/hauntedcastle3","https://z-team.itch.io/maria-renards-revenge-sega-saturn","https://archive.org/details/castlevania-re-vamped-ubuntu","https://www.romhacking.net/hacks/7919/","https://archive.org/details/castlevania-snes","https://archive.org/details/castlevania-2_202511","https://sotn2018br.blogspot.com/2025/11/original-name-japanese-dracula-x-gekka.html?m=1","https://castlevania-the-lecarde-chronicles.en.uptodown.com/windows","https://www.dsogaming.com/news/castlevania-the-lecarde-chronicles-2-is-a-new-2d-castlevania-fan-game-that-is-available-for-download/","https://maddymakesgamesinc.itch.io/celeste64","https://romhackplaza.org/romhacks/celeste-marios-zap-dash-deluxe-nes/","https://www.reddit.com/r/SteamDeck/comments/1k0xxae/chainsawman_fan_game_by_swammy_on_deck/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button","https://archive.org/details/chipn-dale-snes","https://www.romhacking.net/hacks/362/","https://romhackplaza.org/homebrew/clock-tower-advance-game-boy-advance/","https://play.cpjourney.net/","https://archive.org/details/color-adinosaur-snes","https://www.moddb.com/mods/command-conquer-combined-arms","https://archive.org/details/contra-force-snes-beta","https://archive.org/details/contra-snes_20251012","https://romsfun.com/roms/playstation/crash-team-racing-retro-fueled.html","https://store.steampowered.com/app/223710/Cry_of_Fear/","https://gamejolt.com/games/DCTASKFORCE/962995","https://www.reddit.com/r/superman/comments/1p8a432/dc_vs_marvel_2025_game_final_version_release/","https://brumley53.itch.io/dead-space-demake","https://www.romhacking.net/hacks/7272/","https://collectionchamber.blogspot.com/2015/03/discworld-noir.html?m=1","https://www.romhacking.net/hacks/9084/","https://github.com/chaosforgeorg/drl","https://www.doomworld.com/forum/topic/129997-doom-rpg-port-reverse-engineering-update-version-022-source-code-release/","https://www.doomworld.com/forum/topic/135602-doom-ii-rpg-port-reverse-engineering-version-01-source-code-release/","https://doomscroll.cx/","https://www.doomworld.com/forum/topic/119202-doom-32x-resurrection/","https://ozzyouzo.itch.io/double-dragon","https://archive.org/details/double-dragon-snes","https://archive.org/details/double-dragon-ii-snes","https://toadfangames.itch.io/dr-mario-mania","https://www.kartkrew.org/news/2024-05-21_dr-robotniks-ring-racers-version-23.html","https://www.reddit.com/r/SteamDeck/comments/13ps9cv/dragons_dogma_online_working_on_steam_deck/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button","https://www.woodus.com/den/resources/dq+nightfly.php","https://github.com/SpookyIluha/driving-Strikers-64","https://archive.org/details/duck-tales-snes_20250430","https://web.archive.org/web/20190314101907/https://www.romhacking.net/hacks/1882/","https://shin.itch.io/elden-ring-gb","https://james222.itch.io/fable-gameboy-color-demake","https://mcjimmy.net/famicomfighters.html","https://kandowontu.itch.io/famidash","https://www.fightcade.com/","http://ngplus.net/index.php?/forums/topic/1262-brave-new-world-21-is-now-available/","https://www.rengames.us/ffr","https://www.romhacking.net/hacks/465/","https://mxretrodev.itch.io/final-fight-md","https://feuniverse.us/t/fe8-complete-fire-emblem-the-four-kings-4-11-24-update-now-with-weapon-reversal/7030","https://www.feshrine.net/thelastpromise/","https://feuniverse.us/t/fe8-complete-fire-emblem-vision-quest-v3-by-pushwall-1-oct-22/3815","https://gamejolt.com/games/FNAF-ps1/832993","https://gamejolt.com/games/FNAF2PSX/864126","https://the-latte-macchiato.itch.io/fnaf2-wiiu-edition","https://wiki.hard-light.net/index.php/Manually_Installing_FreeSpace_2_Open","https://romhackplaza.org/romhacks/f-zero-beginnings-snes/","https://www.romhacking.net/hacks/8437/","https://www.romhacking.net/hacks/1487/","https://gasega68k.itch.io/g-zero","https://romhacking.com/hack/game-over--elysium","https://bonusjz.itch.io/ghostsn-demons","http://n64vault.com/ge-campaigns:goldfinger-64","https://golden-axe-returns.en.uptodown.com/windows#google_vignette","https://www.reddit.com/r/SteamDeck/comments/1ehk1ef/grand_theft_auto_2_on_steam_deck_configuration/?share_id=MYnhCG7TMdreb0dxTE5pK&utm_content=1&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1","https://ghwt.de/","https://halo-zero.en.download.it/#google_vignette","https://github.com/metallicafan212/HarryPotterUnrealWiki","https://master-linkuei.itch.io/hayatos-journey","https://gamejolt.com/games/he-man/19434","https://kay-yu.itch.io/holocure","https://network.mugenguild.com/balthazar/hyperdbz/","https://boss1995.itch.io/infestedisland","https://www.reddit.com/r/InfinityNikki/comments/1h6bqgf/how_i_installed_infinity_nikki_on_the_steam_deck/?share_id=F16A_DbjmheRIVUNcZZJC&utm_content=1&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1","https://www.reddit.com/r/SteamDeck/comments/1k0weqf/invincible_fan_game_wip_by_swammys_on_deck/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button","https://www.patreon.com/posts/dark-forces-2-v1-78228910?utm_medium=clipboard_copy&utm_source=copyLink&utm_campaign=postshare_creator&utm_content=join_link","https://forum.zdoom.org/viewtopic.php?t=75591","https://archive.org/details/kid-icarusnes-revb","https://github.com/UnclePunch/KAR-Deluxe/releases","https://www.romhacking.net/hacks/5213/","https://www.romhacking.net/hacks/7724/","https://neshacker.itch.io/labyrinth-of-the-dragon","https://steamcommunity.com/sharedfiles/filedetails/?id=413903495","https://lethalmon-fangame.com/","https://drummyfish.itch.io/licar","https://archive.org/details/life-force-snes-v-1","https://teamrumblebee.itch.io/lisvn","https://sourceforge.net/projects/ufoai/","https://github.com/SirDiabo/N64RecompLauncher","https://www.magmmlcontest.com/games.php","https://locomalito.com/games/maldita-castilla","https://baraklava.itch.io/manic-miners","https://stabyourself.net/mari0/","https://marioadventure3.com/","https://gamebanana.com/mods/514361","https://gamebanana.com/wips/65286","https://youtu.be/JCBegP3cCtk?si=kkOcvmFp-9A-099B","https://wiki.tockdom.com/wiki/Mario_Kart_Wii_Deluxe","https://romhacking.com/hack/mario-s-modules","https://www.reddit.com/r/SteamDeck/comments/141ghq0/new_releases_of_mario_party_netplay_for_pj64_and/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button","https://www.smwcentral.net/?p=viewthread&t=130911&page=1&pid=1656762#p1656762","https://mhtahiti.com/","https://github.com/Crypto137/MHServerEmu","https://gamejolt.com/games/marvel-infinity-war/201435","https://gamejolt.com/games/MaximumCarnage/985396","https://archive.org/details/mega-man-i-snes","https://petersjostrand.com/","https://archive.org/details/mega-man-ii-snes_202510","https://archive.org/details/mega-man-iii-snes_202510","https://archive.org/details/mega-man-iv-snes-8-21-21-infidelity","https://archive.org/details/mega-man-v-snes_202510","https://archive.org/details/mega-man-vi-snes_202510","https://sonicfangameshq.com/forums/showcase/mega-man-x8-16-bit.2184/","https://www.megamanarena.com/","https://www.rockman-corner.com/2025/03/rockman-dash-great-adventure-on-5.html?m=1","https://megamanmaker.com/","https://www.romhacking.net/hacks/9269/","https://www.romhacking.net/hacks/6983/","https://www.romhacking.net/hacks/4773/","https://dennisengelhard.com/rock-n-roll/","https://megaphilx.com/index.php/home/games/mega-man-unlimited/","https://www.marcrobledo.com/game-boy/mega-man-world-3-dx/","https://www.marcrobledo.com/game-boy/mega-man-world-4-dx/","https://www.marcrobledo.com/game-boy/mega-man-world-5-dx/","https://gamejolt.com/games/MMX-OmegaBlaster/438452","https://ts02014553.itch.io/megaman-x4-kb","https://rcampeador.itch.io/megapang","https://store.steampowered.com/app/2009720/Mega_Serval/","https://monsterbathchris.itch.io/mega-splatterhouse-demo","https://h0ffman.itch.io/metal-gear-md","https://gamejolt.com/games/MetalSlugCounter/926766","https://metroidconstruction.com/hack.php?id=732","https://archive.org/details/metroid-snes_202504","https://www.romhacking.net/hacks/742/","https://bouncergames.com/project-forever/","https://archive.org/details/mike-tysons-punch-out-snes_202510","https://calaverastudio.itch.io/minidoom2","https://www.marcrobledo.com/game-boy/mole-mania-dx/","https://fucomplete.github.io/","https://mholdschool.com/viewtopic.php?t=675","https://dene.itch.io/moonring","https://www.romhacking.net/hacks/9073/","https://mortal-kombat-defenders-of-the-earth.en.uptodown.com/windows","https://romsfun.com/roms/super-nintendo/mother-2-deluxe.html","https://fusion-fangaming.itch.io/mushroom-kingdom-fusion","https://www.solarus-games.org/games/the-legend-of-zelda-mystery-of-solarus-dx/","https://www.romhacking.net/hacks/9097/","https://rejzor.wordpress.com/need-for-speed-3-nextgen/","https://youtu.be/9nnmeXzm1oQ?si=wwp4CJAIuCJT_Pld","https://newerteam.com/wii/","https://x.com/NFL_Blitz_Rez/status/1963389204106547573?s=20","https://www.reddit.com/r/NFLStreet/comments/159u73n/announcing_nfl_street_reborn/?share_id=mSXOT9YUPIo6Ar_b2oG0i&utm_content=1&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1","https://www.romhacking.net/hacks/8267/","https://b0tster.itch.io/nmkart","https://retrohammer.com/#games","https://www.marcrobledo.com/game-boy/ninja-gaiden-shadow-dx/","https://archive.org/details/ninja-gaiden-trilogy-snes_202511","https://stabyourself.net/nottetris2/","https://feuniverse.us/t/fe8-order-66-a-fire-emblem-hack-v1-0-complete/33929","https://github.com/djyt/cannonball/wiki/Cannonball-Manual#getting-started","https://rocketshippark.itch.io/what-if-outrun","https://thelatteteam.itch.io/paratopic-wii-u","https://www.pioneer2.net/community/threads/ephinea-pso-bb-on-steam-deck-official-thread.24850/","https://github.com/NagatoDEV/PlayStation-Home-Master-Archive","https://pokemmo.com/en/downloads/","https://www.pokeharbor.com/2021/04/pokemon-dark-rising-1-kaizo/","https://ko-fi.com/s/4a1535f351","https://www.pokecommunity.com/threads/pok%C3%A9mon-gadir-deluxe-complete-v-1-1.539451/","https://gammaemerald.org/","https://frostfalcon.github.io/NCB2/","https://www.pokemoncoders.com/pokemon-infinite-fusion/","https://ko-fi.com/s/9ae89c2476","https://www.reddit.com/r/EmuDeck/comments/1hpi1a9/pok%C3%A9mon_luminescent_platinum_a_guide_ver_10/?share_id=OSwJMWi-KH-OlAQtSbJl1&utm_content=2&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1","https://hacks.skytemple.org/h/echoes_yesterday?ref=retrododo.com","https://www.pokecommunity.com/threads/pokemon-odyssey-complete-v4-1-1.488536/","https://rainbowdevs.com/title/prism/","https://www.rebornevo.com/rejuvenation/","https://www.reddit.com/r/PokemonROMhacks/comments/1lz2rwv/pokemon_scrambled_scarlet_violet_emerald_a_gba/","https://eeveeexpo.com/threads/8185/","https://www.pokeharbor.com/2022/08/pokemon-unbound/","https://pokehostel.com/pokemon-unbreakable-ties/","https://www.reddit.com/r/pokemonuranium/comments/m9yvd6/download_links/?utm%5C_source=share&utm%5C_medium=android%5C_app&utm%5C_name=androidcss&utm%5C_term=1&utm%5C_content=share%5C_button","https://www.bombermanboard.com/viewtopic.php?t=1925","https://popherogames.com/","http://argentumage.com/","https://qbj3.slipseer.com/","https://sonicfangameshq.com/forums/showcase/rayman-lumograms-30th-anniversary-demo.2637/puzzle","https://gamejolt.com/p/version-1-1-4-has-been-released-this-update-only-fixes-one-bug-tha-un2pthix","https://perroautonomo.itch.io/biohazard-2","https://re4hd.com/?page%5C_id=9654","https://residentevilmodding.boards.net/thread/20599/resident-evil-mercenaries-3d-project","https://oco.itch.io/residentvania?ac=qfCyYFQF-yt","https://z-team.itch.io/rick-dangerous-dx","https://rb3dx.milohax.org/","https://archive.org/details/rygar-v-1.0","https://www.romhacking.net/hacks/8491/","https://archive.org/details/sega-rally-2-25th-anniversary","https://makingthecrossover.fandom.com/wiki/SEGA_vs._Capcom:_The_Next_Level","https://www.shenmuedojo.com/forum/index.php?threads/a-shenmue-story-new-shenmue-journey-from-george-kitchen.5470/","https://www.romhacking.net/hacks/3299/","https://enhanced.townofsilenthill.com/SH2/about.htm","https://jayjay-1992.itch.io/signalis-gb","https://www.romhacking.net/hacks/2859/","https://slippi.gg/","https://smash64.online/remix/","https://c64universe.com/2025/06/07/snk-vs-capcom-stronger-edition-for-c64-c128-new-demo/","https://teamforeveronline.wixsite.com/home/sonic-1-forever","https://teamforeveronline.wixsite.com/home/sonic-2-absolute","https://hedgehogtechnicalinstitute.com/forum/viewtopic.php?t=199&sid=5f8ee328149e8550e942b1dae1303948","https://sonic2hd.com/download/","https://evilbritishguy.itch.io/sonic-and-the-hedgehogs","https://sonic3air.org/","https://forums.sonicretro.org/threads/sonic-after-the-sequel-dx.37097/","https://retroric.itch.io/sonic-the-hedgehog-amiga-tech-demo","https://gamejolt.com/games/sonicmoonfacility/975042","https://gamejolt.com/games/scheroes/884938","https://gamejolt.com/games/sonicdaybreak/1015062","https://sonic-erazor.selbi.club/","https://sonicgalactic.github.io/","https://gamejolt.com/games/Sonic-GT/533291","https://www.pouet.net/prod.php?which=105245","https://gamejolt.com/games/sonic_j/261887","https://gamejolt.com/games/sonicsmsremake/639432","https://gamejolt.com/games/SonicOmens/469351","https://archive.org/details/project-06-update-3.5","https://gamejolt.com/games/forestation/918619","https://www.sonic-rpg.com/","https://www.sonicriders.org/","https://www.srb2.org/","https://ssntails.srb2.org/srb32x/","https://mb.srb2.org/addons/srb2kart.2435/","https://arcforged.itch.io/sonic-smackdown","https://overboundn.itch.io/sonic-time-twisted","https://gamejolt.com/games/sonictripletrouble16bit/322794","https://www.sonicfangameshq.com/forums/showcase/sonic-ultrasaturn.2059/","https://sonicfangameshq.com/forums/showcase/sonic-utopia-early-demo.33/","https://gamejolt.com/games/Soul_Calibur_Swords_of_Destiny/910254","https://infamousadventures.itch.io/space-quest-ii-vga-remake","https://store.steampowered.com/app/3997630/Spartan_Survivors/","https://64bitsanimation.itch.io/squid-game-boy?ref=retrododo.com","https://starfoxeh.weebly.com/","https://romhackplaza.org/romhacks/starfox-ex-super-nintendo/","https://www.reddit.com/r/SteamDeck/comments/13t36hr/starship_troopers_2005_on_deck_how_to_setup_etc/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button","https://gamejolt.com/games/StreetFighterone/690503","https://juegosdemugen.com/en/street-fighter-z-mugen-2","https://gamebanana.com/mods/402226","https://street-rage-remake.en.uptodown.com/windows#google_vignette","https://www.romhacking.net/hacks/4527/","https://www.sor2newera.com/","https://www.romhacking.net/hacks/7399/","https://sodaraptor.itch.io/sugar-ghouls","https://archive.org/details/super-super-dodgeball","https://mr-freaks.itch.io/super-freaks-1-ultimate-edition","https://super-mario-3-mario-forever.en.uptodown.com/windows","https://gitlab.com/Minibattle/super-mario-3d-all-stars-deluxe","https://mods.sm64coopdx.com/mods/coopware.993/","https://www.romhacking.net/hacks/5964/","https://romhacking.com/hack/multiplayer-64-splitscreen-multiplayer","https://github.com/qurious-pixel/SMAS_Launcher","https://superstarshi.github.io/smatrs/download","https://www.romhacking.net/hacks/9082/","https://famicomcd.org/smbcd","https://mfgg.net/index.php?act=resdb&param=02&c=2&id=37605","https://smbarena.com/search?p=0","https://speedymcfly.itch.io/the-super-mario-bros-movie-video-game","https://shafox.itch.io/super-mario-bros-wonder","https://hedgehogtechnicalinstitute.com/forum/viewtopic.php?t=193&sid=5f8ee328149e8550e942b1dae1303948","https://gamebanana.com/mods/619649","https://srperez.itch.io/smk-zx","https://romhacking.com/hack/super-mario-meltdown","https://www.romhacking.net/hacks/873/","https://romsfun.com/roms/gamecube/super-mario-sunburn.html","https://www.reddit.com/r/SteamDeck/comments/xhybbd/super_mario_sunshine_definitive_edition/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button","https://ninstars.itch.io/unimaker","http://smwstuff.net/game","https://www.myabandonware.com/game/world-soccer-winning-eleven-9-g2k","https://www.smwcentral.net/?a=details&id=4990&p=section","https://www.smwcentral.net/?p=viewthread&t=104877","https://www.smwcentral.net/?p=section&a=details&id=38712","https://www.smwcentral.net/?p=section&a=details&id=35294","https://metroidconstruction.com/hack.php?id=837","https://projectplusgame.com/","https://smash-crusade.itch.io/crusade","https://www.supersmashflash.com/play/ssf2/","https://www.supersmashland.com/","https://master-linkuei.itch.io/super-star-wars-holiday-special","https://romhackplaza.org/romhacks/super-star-wars-redux-snes/","https://romhackplaza.org/romhacks/super-star-wars-return-of-the-jedi-redux-snes/","https://romhackplaza.org/romhacks/super-star-wars-the-empire-strikes-back-redux-snes/","https://store.steampowered.com/app/225840/Sven_Coop/","https://tango.n1gp.net/","https://github.com/RighteousRyan1/TanksRebirth/releases","https://tecmobowl.org/files/file/868-tecmo-super-bowl-2024-final-edition/","https://archive.org/details/teenage-mutant-ninja-turtles-snes_202511","https://www.romhacking.net/hacks/7399/","https://www.romhacking.net/hacks/8259/","https://www.aeriform.io/0232a57db92c1c62161124a6ed855f96/ark","https://www.mediafire.com/file/a0s5xczjzfz2ku0/The+Bells+Arietta+v1.2.0.zip/file","https://driver-syndicate.com/","https://goonies.jorito.net/","https://youtu.be/lBObk1gfPaY?si=_vb4c14JIBFqMZD7","https://www.romhacking.net/hacks/6398/","https://www.romhacking.net/hacks/2476/","https://www.romhacking.net/hacks/5801/","https://www.romhacking.net/hacks/9203/","https://www.romhacking.net/hacks/8640/","https://www.romhacking.net/hacks/9117/","https://www.romhacking.net/hacks/7663/","https://archive.org/details/the-legend-of-zelda-snes_202510","https://www.romhacking.net/hacks/5334/","https://www.romhacking.net/hacks/5797/","https://www.romhacking.net/hacks/8985/","https://romhacking.com/hack/the-patchmaker-s-workshop","https://www.thiefguild.com/fanmissions/26275/thief-the-black-parade?campaign_details=t#campaign-details","https://romhackplaza.org/romhacks/tiny-toon-adventures-dx-babs-big-break-colorization-patch-for-game-boy-color-game-boy/","https://gamejolt.com/games/TMNT-Rescue-Palooza/39658","https://rethawed.com/","https://www.toontownrewritten.com/","https://www.moodler.pl/download/turrican-128kb/","https://www.doomworld.com/forum/topic/155631-ultimate-doom-32x-resurrection/","https://arcforged.itch.io/ultimatesonicsmackdown","https://github.com/RichieUltimate/ultimate-trial/tree/main","https://store.steampowered.com/app/1116960/UNDEFEATED/","https://gamejolt.com/games/UndertaleYellow/136925","https://gamejolt.com/games/SML2WCremake/895658","https://wz2100.net/","https://team-lost-media.github.io/Pages/watlm.html#About_section","https://www.doomworld.com/forum/topic/151475","https://gamejolt.com/games/XMKO/994483","https://gamejolt.com/games/XMENMA/978953","https://cyclonefox.itch.io/xenosaga-pied-piper","https://yarg.in/","https://eliasdaler.itch.io/yume-nikki-ps1","https://www.romhacking.net/hacks/197/","https://justinbohemier.wixsite.com/portfolio/game-design","https://john-lay.itch.io/zeldas-adventure/devlog/1107281/major-update","https://archive.org/details/zelda-ii-the-adventure-of-link-snes_202510","https://www.patreon.com/collection/912225?view=expanded","https://sourceforge.net/projects/zeldaolb/","https://youtu.be/uZEZy7jxj30?si=yJFMHmmYkM1buZz6","https://romhackplaza.org/romhacks/escape-the-house-genesis/","https://www.purezc.net/forums/index.php?showtopic=78707","https://www.purezc.net/index.php?page=featured","https://play0ad.com/","https://github.com/HarbourMasters/2ship2harkinian","https://github.com/Zelda64Recomp/Zelda64Recomp","https://aliveteam.github.io/","https://github.com/ACEmulator/ACE","https://github.com/Aleph-One-Marathon/alephone","https://github.com/Pyrdacor/Ambermoon.net","https://drummyfish.gitlab.io/anarch/","https://akouzoukos.com/apotris","https://dalerank.itch.io/akhenaten","https://arx-libertatis.org/","https://assault.cubers.net/","https://github.com/GBALATRO/balatro-gba","http://barbarian.1987.free.fr/indexEN.htm","https://www.beyondallreason.info/","https://matty77.itch.io/boneforge-battlegrounds","https://bibendovsky.github.io/bstone/","https://github.com/Xeeynamo/sotn-decomp/wiki/Maria-PSP-for-PSX-%E2%80%90-How-to-install","https://cataclysmdda.org/","https://github.com/doukutsu-rs/doukutsu-rs","http://c-evo.org/","https://aeplay.org/citybound","https://github.com/civctp2/civctp2/","https://sablesteel.itch.io/clan-gen-fan-edit","https://www.classicube.net/","https://github.com/electronicarts/CnC_Remastered_Collection","https://matty77.itch.io/conflict-3049","https://github.com/CorsixTH/CorsixTH","https://cortex-command-community.github.io/","https://github.com/solcloud/Counter-Strike","https://jorio.itch.io/cromagrally","http://sauerbraten.org/","https://github.com/PixelGuys/Cubyz","https://thelatteteam.itch.io/cuphead-wii-u","https://cytopia.itch.io/cytopia","https://www.dfworkshop.net/","https://ddnet.org/","https://www.dxx-rebirth.com/","https://github.com/DescentDevelopers/Descent3/releases/tag/v1.5.0","https://www.reddit.com/r/SteamDeck/comments/w9epsg/guide_diablo_1_on_steam_deck_using_devilutionx/?utm%5C_source=share&utm%5C_medium=android%5C_app&utm%5C_name=androidcss&utm%5C_term=1&utm%5C_content=share%5C_button%5D%28https%3A%2F%2Fwww.reddit.com%2Fr%2FSteamDeck%2Fcomments%2Fw9epsg%2Fguide_diablo_1_on_steam_deck_using_devilutionx%2F%3Futm_source%3Dshare&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button","https://github.com/diasurgical/devilutionX","https://github.com/DinosaurPlanetRecomp/dino-recomp","https://dinosaurpla.net/","https://thunderstore.io/c/dinosaur-planet-recompiled/","https://blenderstudio.itch.io/dogwalk","https://dreamcast.gameplayer.club/index.php/downloads/summary/58-disk-images/493-doom-64-2025-02-15-incl-nightdive-studios-levels-cdi","https://www.pcgamingwiki.com/wiki/Doom_64_EX#google_vignette","https://github.com/theboy181/drmario64_recomp_plus","https://github.com/sonicdcer/DNZHRecomp/releases","https://crawl.develz.org/","https://keeperfx.net/","https://github.com/OpenDUNE/OpenDUNE","https://dune2themaker.fundynamic.com/","https://maniacsvault.net/ecwolf/","https://www.eduke32.com/","https://exult.sourceforge.io/","https://github.com/alexbatalov/fallout1-ce","https://github.com/alexbatalov/fallout2-ce","https://github.com/ihhub/fheroes2","https://fishfolk.org/games/jumpy/","https://segaxtreme.net/threads/flashback-macintosh-version-reminiscence-for-sega-saturn-beta.37965/","https://www.flightgear.org/","https://github.com/PascalCorpsman/fpc_atomic","https://www.freeciv.org/","https://www.freecol.org/","https://freedoom.github.io/about.html","https://www.freeorion.org/index.php/Main_Page","https://github.com/Pyrdacor/freeserf.net","https://www.hard-light.net/","https://scp.indiegames.us/bnr_fs2open.php","https://fretsonfire.sourceforge.net/","https://ninja-muffin24.itch.io/funkin","https://gemrb.org/Features.html","https://github.com/afwbkbc/glsmac","https://dca3.net/liberty/","https://dca3.net/miami/","https://steamcommunity.com/sharedfiles/filedetails/?id=376774460","https://hedgewars.itch.io/hedgewars","https://hurrycurry.org/","https://github.com/TeamHypersomnia/Hypersomnia","https://infinity-blade-pc.en.uptodown.com/windows","https://infinity-blade-ii-pc.en.uptodown.com/windows","https://ioquake3.org/","https://ja2-stracciatella.github.io/","https://github.com/open-goal/jak-project","https://flathub.org/en/apps/tk.deat.Jazz2Resurrection","https://github.com/bvschaik/julius","https://www.kamremake.com/download/","https://thelatteteam.itch.io/kindergarten-1-wiiu","https://gamejolt.com/games/kkrieger/878950","https://legendofdragoon.org/projects/severed-chains/","https://github.com/isledecomp/isle-portable","https://isle.pizza/","https://github.com/mjfwalsh/lemmini?tab=readme-ov-file","https://libla.st/","https://github.com/lincity-ng/lincity-ng/releases","https://archive.org/details/FOER-and-WOGR","https://github.com/figglewatts/LSDRevamped?hl=en-IE","https://github.com/jnmartin84/mk64-dc","https://github.com/sonicdcer/MarioKart64Recomp?reddit","https://cdromance.org/windows/maze-of-galious-windows/","https://github.com/RandomityGuy/MBHaxe","https://www.rockman-corner.com/2025/08/mega-man-legends-pc-port-gets.html?m=1","https://github.com/Albeoris/Memoria","https://www.asceai.net/meritous/","https://github.com/graememcc/micropolisJS","https://icedlizardgames.itch.io/mute-crimson-dc","https://mystonline.com/en/","https://github.com/klorfmorf/Goemon64Recomp","https://naev.org/","https://endless-sky.github.io/","https://github.com/atsb/NakedAVP","https://github.com/NBlood/NBlood","https://nethack.org/","https://github.com/openmoh/openmohaa?tab=readme-ov-file","https://oolite.space/","https://0x1f9f1.github.io/Open1560/","https://openage.sft.lol/","https://github.com/OpenDAoC/OpenDAoC-Core","https://github.com/OpenEnroth/OpenEnroth","https://openfodder.com/","https://github.com/Try/OpenGothic","https://wiibrew.org/wiki/OpenHCL","https://www.openhv.net/","https://openloco.io/download/","https://openmw.org/","https://opennox.github.io/docs/index.html","https://openomf.org/","https://www.openra.net/download/","https://openrct2.io/","https://openrw.org/","https://github.com/afritz1/OpenTESArena","https://www.openttd.org/","https://github.com/KScl/opentyrian2000","https://openxcom.org/","https://pcex.retrohost.net/","https://github.com/fgsfdsfgs/perfect_dark","https://pioneerspacesim.net/#slide0","https://watabou.itch.io/pixel-dungeon","https://github.com/x86matthew/Playable3DMaze","https://github.com/ekiefl/pooltool","https://github.com/VideogameSources/portal64-still-alive","https://www.moddb.com/mods/still-alive-for-steam-deck","https://www.popot.org/get_the_games.php?game=SDLPoP","https://github.com/schombert/Project-Alice","https://www.projectdiablo2.com/download","https://t3hd0gg.com/project-r/","https://github.com/karjonas/puzzle-Moppet","https://github.com/Rainchus/Quest64-Recomp","https://www.reddit.com/r/opensourcegames/comments/1owrr8q/timekiller_roguelite_quick_dungeon_crawler_v360/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button","https://github.com/OpenDriver2/REDRIVER2","https://www.siedler25.org/index.php?com=dynamic&mod=1&lang=en&PHPSESSID=g41c6ln3b8qajolf9d25uv1418","https://harmonymonroe.itch.io/rota","https://rvgl.org/","https://github.com/HarbourMasters/Shipwright","https://gamebanana.com/mods/games/16121","https://youtu.be/QV-70fe4hWc?si=F0Ne5n0lMlxeUhth","https://gamebanana.com/tuts/15290","https://github.com/RSDKModding/RSDKv4-Decompilation","https://github.com/hedge-dev/UnleashedRecomp","https://github.com/k4zmu2a/SpaceCadetpinball","https://spacestation14.com/","https://github.com/HarbourMasters/SpaghettiKart/releases","https://www.speed-dreams.net/en","https://sc2.sourceforge.net/","https://github.com/jnmartin84/sf64-dc","https://colab.research.google.com/drive/1jn7SPKeHwZ-0qXIvA4uzdF-ykeh6xtNL","https://github.com/sonicdcer/Starfox64Recomp","https://github.com/HarbourMasters/Starship/releases","https://gamebanana.com/mods/games/21612","https://pyra-handheld.com/boards/threads/stunt-car-remake.79671/","https://sm64coopdx.com/","https://archive.org/details/sm64-source-playable","https://www.reddit.com/r/SteamDeck/comments/11nfzw5/comment/jbnau5g/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button","https://github.com/JHDev2006/Super-Mario-Bros.-Remastered-Public","https://gamebanana.com/mods/games/22798","https://levelsharesquare.com/SMBR/levels","https://supertuxkart.net/Main_Page","https://github.com/tuxx/super-tux-war","https://www.teeworlds.com/","https://www.wesnoth.org/","https://theforceengine.github.io/","https://the-ventureweaver.itch.io/tlote4111","https://github.com/snesrev/zelda3","https://gitlab.com/bighead.0/ladxhd_updated","https://www.reddit.com/r/TWEWY/comments/1n58gtx/twewy_solo_remix_is_on_pc/","https://wohlsoft.ru/projects/TheXTech/","https://github.com/Revolutionary-Games/Thrive/releases/tag/v0.8.3","https://www.timesplittersrewind.com/","https://github.com/LostArtefacts/TRX","https://www.u7revisited.com/","https://yairm210.itch.io/unciv","https://github.com/kittibyte/UndertaleDecomp","https://unknown-horizons.org/","https://github.com/vcmi/vcmi","https://www.veloren.net/","https://content.luanti.org/packages/Wuzzy/mineclone2/","https://wz2100.net/","https://wastedgames.codeberg.page/","https://www.widelands.org/","https://github.com/jnmartin84/wipeout-dc/","https://github.com/wipeout-phantom-edition","https://xonotic.org/","https://youkaicountry.itch.io/yknytt","https://portmaster.games/detail.html?name=ziiaol","https://github.com/Zelda64Recomp/Zelda64Recomp","https://www.zeldaclassic.com/about/","https://zero-k.info/","https://github.com/historicalsource/zork1","https://github.com/historicalsource/zork2","https://github.com/historicalsource/zork3","https://github.com/LLONSIT/AeroGauge","https://github.com/blackgamma7/Aidyn","https://github.com/Alice-2010/Decomp","https://www.patreon.com/posts/am64-v3-0-0-1-136207928","https://github.com/ACreTeam/ac-decomp","https://github.com/bomberhackers/tsa","https://github.com/n64decomp/banjo-kazooie","https://github.com/banjo360/bk360","https://github.com/jellees/bkgr","https://github.com/Mr-Wiseguy/banjo-tooie","https://github.com/retroplastic/blastcorps","https://github.com/jaytheham/body-harvest-decompilation","https://github.com/Bomberhackers/bmhero","https://github.com/FortuneStreetModding/boom-street-decomp","https://github.com/Normmatt/bof","https://github.com/zeldaret/botw","https://youtu.be/2J0_BnWKvEA?si=6W-N4UdbE67sWjDk","https://github.com/reburndev/reburn3","https://github.com/k64ret/cv64","https://github.com/LagoLunatic/ooe","https://github.com/Xeeynamo/sotn-decomp","https://youtu.be/GoPpWU7y70w?si=A13ivHXfmWDOz3Xe","https://github.com/Rainchus/ChameleonTwist1-JP-Recomp","https://github.com/chameleontwistret/chameleontwist2v1.0-jp","https://github.com/eavpsp/cbr_decomp","https://github.com/CMR2Decomp/CMR2Decomp","https://github.com/mkst/conker","https://github.com/vermiceli/nes-contra-us/","https://github.com/smitelli/cosmore","https://github.com/wurlyfox/c1","https://github.com/ughman/c2c","https://github.com/mkst/ctr","https://youtu.be/7y3MXMaWWug?si=jMgS0GkZtigdUvX5","https://github.com/xeeynamo/croc","https://github.com/crystalisdisassembly/crystalisdisassembly","https://github.com/rjkiv/dc3-decomp","https://github.com/adubbz/dcdecomp","https://github.com/unnunu/darkrift","https://github.com/FredYeye/various-game-disassembly/blob/main/SNES/demons_crest.asm","https://github.com/rrika/cdcEngineDXHR","https://github.com/DavidSM64/Diddy-Kong-racing","https://github.com/tgsm/pbg","https://github.com/0xGlitchbyte/dk64re","https://github.com/soracode6/doraemon1","https://github.com/break-core/doshin-gc","https://github.com/Ebernacher90/DragonQuestMonstersGerman","https://github.com/DQIX/dqix-decomp","https://github.com/nmikstas/dragon-warrior-disassembly","https://youtu.be/h9ppmP7eG2Q?si=llithvZsPJ_Li4oN","https://youtu.be/n89NFtIUWDI?si=fNfYg_4YLM_Blk1-","https://github.com/Fable2Recomp/Fable2Recomp","https://youtu.be/6e8WrmOibpM?si=I-YCVDzgAUP_bodh","https://github.com/Mikompilation/Himuro","https://github.com/mikompilation/minakami","https://github.com/zcanann/FFCC-Decomp","https://github.com/nicomegadrive/SGDK-ROMS/tree/main/MysticQuest","https://github.com/Xeeynamo/ff7-decomp","https://github.com/Eebit/fe11-us","https://github.com/MokhaLeee/FireEmblem7J","https://github.com/HighwayFrogs/frogger-psx","https://github.com/inspectredc/fzerox","https://github.com/drahsid/gauntlet-legends","https://github.com/matbourgon/gex64decomp","https://github.com/rainchus/glover","https://github.com/n64decomp/007","https://github.com/gsret/goldensun","https://github.com/Yoshifanatic1/Goof-Troop-Disassembly","https://github.com/ginryuoku/gt2-reversing","https://github.com/CriminalRETeam/gta2_re","https://github.com/MoonSquaredd/ggx","https://github.com/halo-re/halo","https://github.com/harvestwhisperer/hm64-decomp","https://github.com/ChrisNonyminus/hmawl","https://github.com/StanHash/fomt","https://github.com/cyneprepou4uk/NES-Games-Disassembly/tree/main/Ice%20Climber","https://github.com/rossydoubleunderscore/ico-decomp","https://github.com/SwareJonge/IEStrikers","https://github.com/ryan-myers/jet-force-gemini","https://github.com/dplewis/jsrf","https://github.com/sonicretro/kid-chameleon-disasm","https://github.com/ethteck/kh1","https://github.com/kirby64ret/kirby64","https://github.com/jiangzhengwenjz/katam","https://github.com/doldecomp/kar","https://github.com/swiftshine/key","https://github.com/entriphy/kl2_lv_decomp","https://github.com/disi33/KE-NG_Reversing","https://github.com/fmil95/soul-re","https://github.com/dacodechick/legaia-decomp","https://github.com/marijnvdwerf/lego-racers","https://github.com/ThePlayerRolo/LegoCloneWarsWii","https://github.com/FirecatFG/lsddecomp","https://github.com/ThePlayerRolo/lm-decomp","https://github.com/Zackmon/lunar2-psx-decomp","https://github.com/rainchus/partnersintime-decomp","https://github.com/nstearns96/MLSuperstarSaga","https://github.com/monde-lointain/mariogolf64","https://github.com/doldecomp/mkdd","https://github.com/doldecomp/mkw","https://github.com/mariopartyrd/marioparty4","https://github.com/mariopartyrd/marioparty5","https://github.com/mariopartyrd/marioparty5","https://github.com/dellm-79/mariotennisn64","https://github.com/medievildecompilation/medievil-decomp","https://youtu.be/5PPOKBR3bQk?si=sxKPeItjeypAylaV","https://sonicfangameshq.com/forums/showcase/mega-man-x-viral-nightmare.2866/","https://github.com/FoxdieTeam/mgs_reversing","https://github.com/GirianSeed/mgs2","https://github.com/GirianSeed/mgs3","https://github.com/GirianSeed/mgstts","https://github.com/metroidret/mf","https://github.com/PrimeDecomp/prime","https://github.com/PrimeDecomp/echoes","https://github.com/metroidret/mzm","https://github.com/GRAnimated/MinecraftLCE","https://github.com/TobiasFriedly/minicraft_3d","https://github.com/drahsid/mischief-makers","https://github.com/doldecomp/gnt4","https://github.com/OpenNFS/NFSHSX","https://github.com/dbalatoni13/nfsmw","https://github.com/dbalatoni13/nfsug","https://github.com/farisawan-2000/evangelion","https://github.com/NSMBW-Community/NSMBW-Decomp","https://github.com/ryan-myers/onegaimonsters","https://github.com/opentestdriveunlimited/OpenTestDriveUnlimited","https://github.com/yaz0r/Azel","https://papermar.io/","https://github.com/darxoon/leaflitter","https://github.com/doldecomp/ttyd","https://github.com/parappadev/parappa2","https://github.com/projectPiki/pikmin","https://github.com/projectPiki/pikmin2","https://github.com/Patoke/re-plants-vs-zombies","https://github.com/bgsamm/pbr-dtk","https://github.com/pret/pmd-red","https://github.com/pret/pokepinball","https://github.com/AngheloAlf/puzzleleague64","https://github.com/ethteck/pokemonsnap","https://github.com/pret/pokestadium","https://github.com/pret/pokestadiumgs","https://github.com/pret/poketcg","https://github.com/pret/poketcg2","https://github.com/SephDB/pokepark-wii-decomp","https://krispy-the-goat.itch.io/prey-2006","https://youtu.be/e393g4U4xUU?si=rTY788C-KdflwLch","https://github.com/jmarshall23/Quake4Doom","https://github.com/ZounaModding/RatDecomp","https://newdawn.games/rayman-2-redreamed/","https://youtu.be/XjeTYHk9c5c?si=dQyFhBhOywMb88KL","https://youtube.com/shorts/4cAWo32Xix4?si=NtC2O68PgiFTqw28","https://github.com/fmil95/recvx-gc-decomp","https://github.com/fmil95/recvx-decomp","https://romhacking.com/hack/return-to-yoshi-s-island-demo-2","https://github.com/patataofcourse/rhgold","https://github.com/DarkRTA/rb3","https://github.com/RocketRet/Rocket-Robot-On-Wheels","https://kaffeeware.itch.io/secret-of-mana-pce","https://github.com/rainchus/shadowgate64","https://github.com/Fantaskink/SOTC","https://codeberg.org/Chickenzes/smt-decomp","https://github.com/Vatuu/silent-hill-decomp","https://youtu.be/LwUibq6wBn4?si=RzqLY7QaIEZjBOBj","https://github.com/rainchus/SkiesofArcadiaLegends","https://tesrskywind.com/","https://github.com/TheOnlyZac/sly1","https://github.com/cdlewis/snowboardkids2-decomp","https://github.com/SAT-R/sa2","https://github.com/SAT-R","https://sonicfangameshq.com/forums/showcase/project-reignition-sage-2025-demo.2540/#itemDownloads","https://github.com/doldecomp/sonicriders","https://github.com/KidWizardOfTheWeb/SRZGDecomp","https://github.com/itsmattkc/RunnersDecomp","https://youtu.be/I5mGwM-uikw?si=w0LLmprSc0FLeIzI","https://github.com/biggestsonicfan/stfdecomp","https://github.com/sonicnext-dev/MarathonRecomp","https://github.com/mkst/sssv","https://github.com/krystalgamer/spidey-decomp","https://github.com/bfbbdecomp/bfbb","https://github.com/TheMobyCollective/spyro-1","https://github.com/renakunisaki/sfadebug","https://github.com/eltalelibrarian/sote","https://github.com/crowded-street/3s-decomp","https://decomp.dev/Charlese2/sgr","https://github.com/fredyeye/super-ghouls-n-ghosts-disassembly","https://github.com/3dsdecomp/redpepper","https://github.com/3DWCommunity/3dcomp","https://github.com/malucard/sm64-psx","https://github.com/snailspeed3/SMGDecompilation","https://github.com/SMGCommunity/Garigari","https://youtu.be/KnslfMOZ5dY?si=n2Is3Od8bCXdC1Ph","https://github.com/MonsterDruide1/OdysseyDecomp","https://github.com/yannicksuter/smstrikers-decomp","https://github.com/doldecomp/sms","https://github.com/snesrev/sm","https://github.com/camthesaxman/smb-decomp/","https://github.com/SeekyCt/spm-decomp","https://github.com/VetriTheRetri/ssb-decomp-re","https://github.com/doldecomp/brawl","https://github.com/doldecomp/melee","https://github.com/zeldaret/ph","https://github.com/zeldaret/ss","https://youtu.be/XbymS6mbg48?si=KFNXWmiYHKlPtGQs","https://github.com/zeldaret/tww","https://github.com/zeldaret/tp","https://github.com/HaydnTrigg/Castaway","https://decomp.dev/bfbbdecomp/tssm?sort=updated","https://decomp.dev/Yotona/twewy","https://github.com/hansbonini/psx_tomba","https://github.com/TOMB5/TOMB5","https://github.com/abelbriggs1/tm1_decomp","https://github.com/abelbriggs1/tmb_decomp","https://github.com/jacobleeharris/tmhc","https://github.com/1superchip/ty-decomp","https://youtu.be/Pw8zyKdyQsQ?si=78Pc4S6ln60wqiDa","https://github.com/ser-pounce/rood-reverse","https://github.com/shao113/vh","https://github.com/aki-club/vpw2","https://github.com/LLONSIT/Wave-Race-64","https://github.com/svinsmoke212/revenge","https://github.com/doldecomp/ogws","https://github.com/xbret/xenoblade","https://github.com/ladysilverberg/xenogears-decomp","https://github.com/squareman/xenosaga","https://github.com/hamzaxx370/ogre-decomp","https://github.com/decompals/yoshis-story","https://github.com/shinny456/ygodm8","https://github.com/andreamonaco/zombieland","https://github.com/GirianSeed/zoe1","https://github.com/GirianSeed/zoe2","https://aurumsmods.com/accfdeluxe/","https://www.moddb.com/mods/ashes-2063/downloads/ashes-stand-alone-version-101","https://www.nexusmods.com/baldursgate3/mods/12614","https://www.nexusmods.com/baldursgate3/mods/19120","https://www.nexusmods.com/baldursgate3/mods/14844?tab=description","https://www.nexusmods.com/baldursgate3/mods/20353","https://www.moddb.com/mods/desert-combat","https://www.nexusmods.com/bioshock/mods/94","https://store.steampowered.com/app/2119270/Black_Reliquary/","https://www.nexusmods.com/bloodborne/mods/252","https://www.nexusmods.com/bloodborne/mods/45?tab=files","https://www.moddb.com/mods/brutal-doom","https://batandy.itch.io/simonsdestiny","https://github.com/MottZilla/SotN_Integrated_Rando","https://forums.civfanatics.com/forums/civ4-caveman-2-cosmos.449/","https://gamebanana.com/mods/424541","https://www.nexusmods.com/chronotrigger/mods/8","https://www.moddb.com/mods/contra","https://www.moddb.com/mods/crusader-kings-2-a-game-of-thrones-ck2agot","https://www.nexusmods.com/cyberpunk2077/mods/24895?tab=description","https://www.nexusmods.com/cyberpunk2077/mods/25552","https://www.nexusmods.com/cyberpunk2077/mods/23290","https://www.nexusmods.com/darksouls2/mods/1498","https://www.nexusmods.com/darksouls3/mods/1895","https://www.nexusmods.com/darksoulsremastered/mods/899","https://www.moddb.com/games/dragon-ball-z-budokai-4","https://www.moddb.com/mods/nihilum","https://dmc3crimson.github.io/","https://dhewm3.org/mods.html","https://www.moddb.com/mods/doom-voxel-project/addons/voxel-doom","https://www.moddb.com/mods/voxel-doom-ii/addons/voxel-doomii-v2-1","https://www.moddb.com/mods/realdoom-3/downloads/realdoom-3-50","https://www.moddb.com/mods/doom-infinite","https://gamebanana.com/mods/564409","https://gamebanana.com/mods/641650","https://www.moddb.com/mods/voxel-duke-nukem-3d/addons/voxel-duke-3d","https://thunderstore.io/c/dyson-sphere-program/p/nebula/NebulaMultiplayerMod/","https://www.nexusmods.com/eldenringnightreign/mods/3?tab=files&file_id=14","https://www.nexusmods.com/eldenring/mods/510","https://www.nexusmods.com/eldenring/mods/3419","https://www.nexusmods.com/eldenring/mods/8707?tab=description","https://www.nexusmods.com/skyrim/mods/77868","https://store.steampowered.com/app/1583720/Entropy__Zero_2/","https://mods.factorio.com/mod/space-exploration","https://steamcommunity.com/sharedfiles/filedetails/?id=217840547","https://www.nexusmods.com/fallout4/mods/98208","https://www.nexusmods.com/fallout4/mods/95285","https://steamdeckhq.com/tips-and-guides/how-to-play-the-fallout-london-steam-deck/","https://www.nexusmods.com/fallout4/mods/99136","https://www.nexusmods.com/fallout4/mods/87983","https://www.nexusmods.com/fallout4/mods/97675","https://www.nexusmods.com/fallout4/mods/99130","https://www.nexusmods.com/newvegas/mods/50146","https://www.nexusmods.com/newvegas/mods/94306","https://www.nexusmods.com/newvegas/mods/94824","https://github.com/Wemino/EchoPatch","https://fifaclassicpatch.altervista.org/","https://youtu.be/wNguRldtIqk?si=fNjXSMn9buolXYYc","https://www.nexusmods.com/finalfantasy7rebirth/mods/1655?tab=description","https://www.nexusmods.com/finalfantasy7rebirth/mods/1598","https://youtu.be/4aaaDnCE82g?si=mAFFS_zu-alAn3pk","https://sites.google.com/view/moguri-mod/home","https://www.reddit.com/r/finalfantasytactics/comments/xi0l6t/mod_release_the_lion_war_of_the_lions_tlwotl/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button","https://www.moddb.com/mods/forgotten-hope-2","https://www.moddb.com/mods/gekokujo","https://www.nexusmods.com/oblivionremastered/mods/4681","https://www.moddb.com/mods/goldeneye-source","https://www.reddit.com/r/SteamDeck/comments/1nzene8/gta_iv_with_fusionfix_is_awesome/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button","https://www.nexusmods.com/gta5enhanced/mods/296?tab=description","https://www.patreon.com/posts/superman-v2-2-0-146533832","https://www.mediafire.com/file/1i2gqml81umjugt/GTA+Vice+City+Actual+Next-Gen+Edition+v6.0.7z/file","https://ghwt.de/","https://www.nexusmods.com/residentevilrequiem/mods/1920?tab=description","https://www.moddb.com/mods/half-life-2-raising-the-bar-redux","https://www.moddb.com/mods/black-mesa-blue-shift-remake/news/chapters-1-5-caretaking-update-release","https://www.moddb.com/mods/diffusion","https://store.steampowered.com/app/1625220/HalfLife_Element_64/","https://store.steampowered.com/app/3619040/HalfLife_Legacy/","https://newerteam.com/en/hol/index.html","https://www.nexusmods.com/hollowknightsilksong/mods/90?tab=description","https://www.moddb.com/mods/horn-of-the-abyss","https://forums.beamdog.com/discussion/87952/icewind-dale-2-enhanced-edition-is-released/p1","https://videogamemods.com/vgm/justcause3/mods/just-cause-3-unlimited-edition-1001082","https://github.com/KH-ReFined/KH-ReFined","https://www.nexusmods.com/liesofp/mods/368?tab=description","https://gamebanana.com/mods/551672","https://youtu.be/vvg20Gd58WA?si=-3Rx0-7ekPZct7n4","https://www.ctgpdx.com/home","https://romhack.ing/database/content/entry/xlruT_gHReWVM1HtQL3Lmg/mario-kart-super-circuit-60-fps-patch","https://steamdeckhq.com/tips-and-guides/how-to-install-marvel-vs-capcom-infinite-beyond-mod-on-steam-deck/","https://www.moddb.com/mods/max-payne-remix","https://www.moddb.com/mods/medal-of-honor-airborne-redux/downloads","https://www.moddb.com/mods/third-age-total-war","https://www.moddb.com/mods/mental-omega","https://www.moddb.com/mods/morrowind-rebirth","https://forums.nba-live.com/viewtopic.php?f=72&t=114923","https://greatondeck.net/ready-mod-for-need-for-speed-most-wanted-2005-enhanced-graphics-for-steam-deck-and-pc-guide/","https://greatondeck.net/need-for-speed-pro-street-is-easy-on-steam-deck-with-this-guide/","https://greatondeck.net/how-to-run-need-for-speed-underground-on-steam-deck-and-modern-pc-guide-with-modpack/","https://www.moddb.com/mods/no-more-room-in-hell","https://www.moddb.com/mods/oscuros-oblivion-overhaul/downloads","https://gamebanana.com/mods/590058","https://github.com/jdaster64/ttyd-tot","https://youtu.be/deFqMs1tBYo?si=suNlZLJ4J0aL0pU1","https://www.reddit.com/r/SteamDeck/comments/149rbhs/i_made_a_mod_that_increases_the_dialogue_font/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button","https://theoutcastersnotebook.com/post/set-up-pmex-remix-on-deck/","https://store.steampowered.com/app/317400/Portal_Stories_Mel/","https://store.steampowered.com/app/1255980/Portal_Reloaded/","https://store.steampowered.com/app/601360/Portal_Revolution/","https://www.moddb.com/mods/project-brutality","https://www.moddb.com/mods/arcane-dimensions","https://www.moddb.com/mods/rainbow-six-black-ops-20/downloads/rainbow-six-black-ops-20-release","https://www.moddb.com/mods/rbdoom-3-bfg","https://www.nexusmods.com/reddeadredemption2/mods/7152?tab=description","https://www.moddb.com/mods/republic-at-war","https://www.moddb.com/mods/reenhance-re2/downloads/re-enhance-re2-v20-for-gog-version","https://www.nexusmods.com/residentevil22019/mods/62","https://www.nexusmods.com/residentevil42023/mods/5458?tab=description","https://wiki.tockdom.com/wiki/Retro_Rewind","https://github.com/TeamWheelWizard/WheelWizard","https://steamcommunity.com/workshop/filedetails/?id=1201382956","https://steamcommunity.com/sharedfiles/filedetails/?id=1386412863","https://steamcommunity.com/workshop/filedetails/?id=2652029657","https://steamcommunity.com/workshop/filedetails/?id=1909914131","https://steamcommunity.com/workshop/filedetails/?id=1884025115","https://steamcommunity.com/sharedfiles/filedetails/?id=928376710","https://steamcommunity.com/sharedfiles/filedetails/?id=3291739005","https://www.nexusmods.com/sekiro/mods/723","https://www.nexusmods.com/skyrimspecialedition/mods/166859","https://www.nexusmods.com/skyrimspecialedition/mods/164600","https://www.nexusmods.com/skyrimspecialedition/mods/163295?tab=description","https://www.nexusmods.com/skyrimspecialedition/mods/154740#:~:text=This%20mod%2C%20as%20the%20name,and%20grow%20together%20with%20them.","https://www.nexusmods.com/skyrimspecialedition/mods/132292","https://www.nexusmods.com/skyrimspecialedition/mods/160339","https://www.nexusmods.com/skyrimspecialedition/mods/160493","https://www.nexusmods.com/skyrimspecialedition/mods/166086","https://www.nexusmods.com/skyrimspecialedition/mods/69993","https://www.reddit.com/r/SteamDeck/comments/1gaiwbi/if_you_want_to_get_back_into_skyrim_there_is_an/?share_id=a3AXVrJPRuFcYljWxp19g&utm_content=1&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1","https://store.steampowered.com/app/1865780/Downfall__A_Slay_the_Spire_Fan_Expansion/","https://mb.srb2.org/addons/srb2-generations.8725/","https://www.reddit.com/r/pcgaming/comments/1kl27um/sphinx_and_the_cursed_mummy_pc_mod/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button","https://www.patreon.com/hbgda/home","https://github.com/Joshhhuaaa/EnhancedSC","https://www.moddb.com/mods/radiophobia","https://www.nexusmods.com/stalker2heartofchornobyl/mods/1767","https://www.nexusmods.com/stardewvalley/mods/22550","https://www.nexusmods.com/starfield/mods/14984?tab=description","https://youtu.be/T5rQBbcV_AY?si=38PNEz8T3WE4RFtZ","https://www.nexusmods.com/starfield/mods/11114","https://romhackplaza.org/romhacks/star-fox-shindou-edition-snes/","https://www.moddb.com/mods/hd-graphics-mod","https://www.nexusmods.com/x4foundations/mods/349","https://www.reddit.com/r/SteamDeck/comments/1336a12/how_to_get_the_best_jedi_experience_on_the_steam/?utm%5C_source=share&utm%5C_medium=android%5C_app&utm%5C_name=androidcss&utm%5C_term=1&utm%5C_content=share%5C_button","https://youtu.be/8zABT16mGuY?si=WP1zK92GIvLqmFkL","https://youtu.be/Ko2ChgbARnU?si=xX_6YhMwIvBN6Lw4","https://smoo.it/#/","https://www.rexbuild.site/","https://github.com/akaneia/akaneia-build","https://forums.terraria.org/index.php?threads/calamity-mod.44065/","https://store.steampowered.com/app/1281930/tModLoader/","https://github.com/wofsauge/External-Item-Descriptions/wiki/How-to-install-the-mod","https://store.steampowered.com/app/1467450/The_Chronicles_Of_Myrtana_Archolos","https://www.moddb.com/mods/the-citizen","https://www.thedarkmod.com/main/","https://github.com/Crementif/BotW-BetterVR","https://gamebanana.com/mods/49627","https://www.nxoptimizer.com/games/tears-of-the-kingdom/","https://www.moddb.com/mods/the-old-realms","https://youtu.be/JKPz3PE7_4s?si=NJxOrfo5alaNzB9C","https://www.nexusmods.com/witcher3/mods/7329","https://www.nexusmods.com/witcher3/mods/11260?tab=description","https://www.nexusmods.com/witcher3/mods/9963?tab=description","https://www.nexusmods.com/witcher3/mods/11246?tab=description","https://www.reddit.com/r/ItsAllAboutGames/comments/1o9v7wi/the_witcher_3_turned_into_a_survival_game_with/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button","https://www.moddb.com/mods/stalker-misery","https://www.reddit.com/r/THPS/comments/tjrwgw/thug_pro_on_steam_deck/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button","https://www.u5lazarus.com/Downloads.html","https://www.moddb.com/mods/undertale-together","https://www.dsogaming.com/pc-performance-analyses/unreal-rtx-remix-path-tracing-mod-fully-released/","https://www.nexusmods.com/watchdogs/mods/81","https://boa.realm667.com/","https://www.nexusmods.com/xcom/mods/88","https://www.moddb.com/mods/xwvm","https://www.nexusmods.com/yakuza0/mods/1276?tab=description","https://archive.org/details/quantum-of-solace_202509","https://archive.org/details/ace-combat-assault-horizon_202512","https://archive.org/details/Afterfall","https://archive.org/details/aladdin-in-nasiras-revenge-repack","https://archive.org/details/at_20251025","https://archive.org/details/avp-2-gold-edition","https://archive.org/details/american-mc-gee-alice","https://archive.org/details/area-51.7z_202506","https://archive.org/details/assassins-creed-iii-deluxe-edition","https://archive.org/details/atlantis-trial-by-fire-repack","https://archive.org/details/back-to-the-future-the-game_202508","https://archive.org/details/batman-vengeance.-7z","https://archive.org/details/battlefield-1942-repack","https://archive.org/details/bf-2142_202509","https://archive.org/details/battlefield-2_202509","https://archive.org/details/battlefield-vietnam-repack","https://archive.org/details/battlefield-bad-company-2_202509","https://archive.org/details/bedlam_202509","https://archive.org/details/blair-witch-trilogy","https://archive.org/details/blur.-7z_202506","https://archive.org/details/celebrity-deathmatch_202601","https://archive.org/details/clive-barkers-jericho_202509","https://archive.org/details/di-rt-2.7z","https://archive.org/details/condemned_20251104","https://archive.org/details/contract-j.-a.-c.-k.","https://archive.org/details/crazy-taxi-3-repack","https://archive.org/details/cryostasis_202510","https://archive.org/details/darks2","https://archive.org/details/dmh_20250928","https://archive.org/details/dead-to-rights.-7z","https://archive.org/details/dead-to-rights-2.7z","https://archive.org/details/deadpool.-7z","https://archive.org/details/die-hard-nakatomi-plaza-repack","https://archive.org/details/dirt-3_202511","https://archive.org/details/dreamkiller_202509","https://archive.org/details/driver-san-francisco.-7z","https://archive.org/details/enter-the-matrix_202511","https://archive.org/details/evil-dead-regeneration_202510","https://archive.org/details/f-1-2010_202512","https://archive.org/details/f-1-2011_202512","https://archive.org/details/f-1-2012_202512","https://archive.org/details/f-1-2013_202512","https://archive.org/details/f-1-2020","https://archive.org/details/f-1-race-stars_202512","https://archive.org/details/fable_202508","https://archive.org/details/Family_Guy_BTTM","https://archive.org/details/fantastic-four_the_game","https://archive.org/details/fuel_20251222","https://archive.org/details/gow_20251116","https://archive.org/details/gore-ultimate-soldier.-7z","https://archive.org/details/grid-2_202511","https://archive.org/details/grid-autosports_202601","https://archive.org/details/guardians-of-the-galaxy.telltale-series","https://archive.org/details/halo_20251027","https://archive.org/details/heavy-metal-fakk-2.7z","https://archive.org/details/heretic-ii_202601","https://archive.org/details/hulk.-7z_202506","https://archive.org/details/iron-man-pc-repack","https://archive.org/details/james-bond-007-blood-stone_202511","https://archive.org/details/james-camerons-avatar-the-game_202512","https://archive.org/details/juiced.-7z_202506","https://archive.org/details/j-2-hin.-7z","https://archive.org/details/kiss-psycho-circus-repack_202511","https://archive.org/details/lost-planet-1","https://archive.org/details/lost-planet-2_202510","https://archive.org/details/manhunt-2_202510","https://archive.org/details/marvel-ultimate-alliance_202506","https://archive.org/details/marvel-ultimate-alliance-2_202506","https://archive.org/details/mc-2_20251112","https://archive.org/details/midnight-club-2-repack","https://archive.org/details/template_202508","https://archive.org/details/need-for-speed-ii-special-edition_202512","https://archive.org/details/need-for-speed-iii-hot-pursuit.-7z_202512","https://archive.org/details/need-for-speed-carbon_202512","https://archive.org/details/need-for-speed-iv-high-stakes.-7z","https://archive.org/details/need-for-speed-vi-hot-pursuit-2.7z","https://archive.org/details/need-for-speed-most-wanted-hd-version","https://archive.org/details/need-for-speed-v-porsche-unleashed.-7z","https://archive.org/details/need-for-speed-pro-street_202512","https://archive.org/details/need-for-speed-shift_202512","https://archive.org/details/need-for-speed-shift-2-unleashed_202512","https://archive.org/details/need-for-speed-the-run_202512","https://archive.org/details/need-for-speed-undercover_20251214","https://archive.org/details/need-for-speed-underground_202512","https://archive.org/details/need-for-speed-underground-2_202512","https://archive.org/details/no-one-lives-forever-2-a-spy-in-h.a.r.m.s-way_202509","https://archive.org/details/nocturne_202510","https://archive.org/details/oni-anniversary-edition.-7z","https://archive.org/details/of-dragon-rising.-7z","https://archive.org/details/operation-flashpoint-red-river.-7z","https://archive.org/details/out-run-2006-coast-2-coast.-7z","https://archive.org/details/pac-man-world-2.7z","https://archive.org/details/king_20251110","https://archive.org/details/poker-night_202508","https://archive.org/details/prey_20250628","https://archive.org/details/project-cars_202508","https://archive.org/details/project-cars-2_202508","https://archive.org/details/project-cars-3","https://archive.org/details/project-i.-g.-i-im-going-in","https://archive.org/details/psi-ops-the-mindgate-conspiracy.-7z","https://archive.org/details/psychotoxic_202509","https://archive.org/details/pure.-7z","https://archive.org/details/race-driver-grid.-7z","https://archive.org/details/rambo-the-video-game_202601","https://archive.org/details/resident-evil_202510","https://archive.org/details/reTHAWed.7z","https://archive.org/details/road-rash_202511","https://archive.org/details/saw_20251012","https://archive.org/details/sanity-aikens-artifact-repack","https://archive.org/details/scarface-the-world-is-yours-repack-v-3","https://archive.org/details/scratches-directors-cut","https://archive.org/details/ni-ghts-into-dreams_202511","https://archive.org/details/sega-rally-revo.-7z_202506","https://archive.org/details/shrak_202511","https://archive.org/details/silent-hill-2.7z_202506","https://archive.org/details/silent-hill-3_202510","https://archive.org/details/sonic-cd-miracle-edition.-7z_202508","https://archive.org/details/sonic-r.-7z_202503","https://archive.org/details/south-park-pc-repack","https://archive.org/details/spec-ops-the-line.-7z","https://archive.org/details/spider-man-2-pc-repack","https://archive.org/details/scpt.-7z","https://archive.org/details/starlancer_202511","https://archive.org/details/street-fighter-x-tekken_202508","https://archive.org/details/syndicate_202509","https://archive.org/details/teenage-mutant-ninja-turtles-mutants-in-manhattan_202508","https://archive.org/details/test-drive-unlimited.-7z_202506","https://archive.org/details/test-drive-unlimited-2.7z","https://archive.org/details/the-chronicles-of-riddick-assault-on-dark-athena.-7z","https://archive.org/details/the-chronicles-of-riddick-escape-from-butcher-bay-repack-v-2","https://archive.org/details/tcu_20250916","https://archive.org/details/the-godfather-part-ii","https://archive.org/details/the-godfather_20250816","https://archive.org/details/square_enix_2025","https://archive.org/details/the-legend-of-korra_202508","https://archive.org/details/lord-of-the-rings-war-in-the-north_202512","https://archive.org/details/path-of-neo","https://archive.org/details/the-need-for-speed-special-edition.-7z_202512","https://archive.org/details/no-one-lives-forever_202509","https://archive.org/details/the-polar-express_202512","https://archive.org/details/the-punisher.-7z_202506","https://archive.org/details/the-simpsons-hit-and-run.-7z_202506","https://archive.org/details/the-suffering_202510","https://archive.org/details/the-suffering-2_202510","https://archive.org/details/the-walking-dead-survival-instinct_202601","https://archive.org/details/to-ca-race-driver","https://archive.org/details/to-ca-race-driver-2","https://archive.org/details/to-ca-race-driver-3_202601","https://archive.org/details/toy-story-2-repack","https://archive.org/details/transformers-devastation_202507","https://archive.org/details/fall_of_cybertron","https://archive.org/details/transformers-revenge-of-the-fallen.-7z","https://archive.org/details/transformers-the-game.-7z","https://archive.org/details/transformers-war-for-cybertron.-7z","https://archive.org/details/tron-evolution-repack","https://archive.org/details/true-crime-streets-of-la.-7z_202506","https://archive.org/details/turok-repack-video-game-2008","https://archive.org/details/ultimate-spider-man.-7z","https://archive.org/details/ut-2004_202509","https://archive.org/details/ue-3_20251113","https://archive.org/details/v-1_20250920","https://archive.org/details/v-2_20250920","https://archive.org/details/viva-pinata_202512","https://archive.org/details/vivisector_202509","https://archive.org/details/will-rock.-7z","https://archive.org/details/william-shatners-tekwar_202601","https://archive.org/details/wip-eout-portable-collection.-7z","https://archive.org/details/wolfenstein.-7z","https://archive.org/details/world-racing.-7z","https://archive.org/details/x-men-legends-ii_202601","https://archive.org/details/x-men-origins-wolverine.-7z","https://archive.org/details/you-are-empty_202510","https://docs.google.com/spreadsheets/d/1sif8FeRGJRbytK8wFRXgF6Hke9V6GUFs/edit?gid=431767549#gid=431767549","https://gamebanana.com/mods/470260","https://www.nexusmods.com/baldursgate3/mods/18252","https://www.nexusmods.com/batmanarkhamasylum/mods/177?tab=description","https://www.nexusmods.com/batmanarkhamcity/mods/407?tab=description","https://www.nexusmods.com/batmanarkhamknight/mods/2671","https://www.moddb.com/mods/blood-ii-the-chosen-upscale-pack/addons/blood-ii-the-chosen-upscale-pack-v13","https://www.nexusmods.com/darksouls2/mods/1160?tab=description","https://www.nexusmods.com/newvegas/mods/93775?tab=description","https://www.nexusmods.com/fallout4/mods/98692?tab=description","https://www.nexusmods.com/farcry3/mods/291","https://www.nexusmods.com/finalfantasy7remake/mods/1977?tab=description","https://www.nexusmods.com/finalfantasy7remake/mods/764?tab=files","https://www.reddit.com/r/SteamDeck/s/9CczeTYUGk","https://evilgames.eu/texture-packs/ge007-hd.htm#instructions","https://www.nexusmods.com/gta5enhanced/mods/272","https://www.reddit.com/r/SteamDeck/s/bNCOrjHbWg","https://www.henrikomagnifico.com/luigis-mansion-4k","https://evilgames.eu/texture-packs/mario-kart-64-hd.htm","https://forums.dolphin-emu.org/Thread-mario-kart-double-dash-re-rendered-hd-texture-pack-v1-2","https://www.nexusmods.com/masseffectlegendaryedition/mods/1825?tab=description","https://www.nexusmods.com/nierautomata/mods/759?tab=files","https://www.nexusmods.com/palworld/mods/2723?tab=files","https://m.youtube.com/watch?v=fO0Hqhk7qxA","https://www.nexusmods.com/pokemonscarletandviolet/mods/52?tab=files","https://www.reddit.com/r/SteamDeck/s/2XAd4zeIz3","https://www.nexusmods.com/residentevil5goldedition/mods/737?tab=description","https://www.nexusmods.com/residentevilrevelations/mods/90","https://www.nexusmods.com/residentevilrevelations/mods/90","https://www.reddit.com/r/RatchetAndClank/s/12ydQ6unl0","https://www.sr1hdremaster.com/","https://leonelvidals.blogspot.com/2020/03/ssx-3-hd-texture-pack.html?m=1","https://www.henrikomagnifico.com/super-mario-3d-land-hd","https://github.com/iZePlayzYT/SuperMarioGalaxy63-TexturePack/releases","https://www.henrikomagnifico.com/super-mario-sunshine-4k","https://www.nexusmods.com/legendofzeldabreathofthewild/mods/61?tab=description","https://www.nexusmods.com/legendofzeldatearsofthekingdom/mods/161","https://www.nexusmods.com/witcher3/mods/11259","https://www.nexusmods.com/tombraiderlegend/mods/97?tab=description","https://www.reddit.com/r/SteamDeck/s/zX3CemaACh","https://www.youtube.com/watch?v=ouLFjGqcgRQ&t=43s&ab_channel=IceBullet","https://www.henrikomagnifico.com/zelda-majoras-mask-3d-4k","https://github.com/Nerrel/MMHD/releases/tag/v1.1b","https://www.henrikomagnifico.com/zelda-ocarina-of-time-3d-4k","https://www.henrikomagnifico.com/zelda-twilight-princess-4k","https://www.henrikomagnifico.com/zelda-a-link-between-worlds-4k","https://www.henrikomagnifico.com/zelda-skyward-sword-4k","https://hiddenpalace.org/Category:Unreleased_game_prototypes","https://hiddenpalace.org/Akira_%28Prototype%29","https://www.gamesthatwerent.com/2025/07/aladdin-nes-prototype/","https://hiddenpalace.org/News/Animaniacs_-_Hollywood_Hypnotics","https://www.gamesthatwerent.com/2013/02/apocalypse-super-nintendo/","https://hiddenpalace.org/Batman:_Revenge_of_the_Joker_%28Prototype%29","https://archive.org/details/BigBrother19990401","https://tcrf.net/Bio_Force_Ape","https://wowroms.com/en/roms/sega-genesis-megadrive/beyond-zero-tolerance-usa-proto/25311.html","https://hiddenpalace.org/Blue_Angelo:_Angels_from_the_Shrine_%28Late_prototype%29","https://wowroms.com/en/roms/nintendo-entertainment-system/california-raisins-the-grape-escape-usa-proto/21805.html","https://hiddenpalace.org/Castlevania:_Resurrection_%28Nov_5,_1999_prototype%29","https://hiddenpalace.org/Dancing_Eyes_(Mar_10,_2011_Prototype)","https://hiddenpalace.org/Daredevil:_The_Man_Without_Fear_%28Mar_22,_2004_prototype%29","https://archive.org/details/dark-castle-msx","https://hiddenpalace.org/Dark_Empires_%28prototype%29","https://arlagames.itch.io/dracula-hunter","https://romsfun.com/roms/nintendo-64/dinosaur-planet-dinomod-enhanced.html","https://archive.org/details/duke-dday-ps2-2001-06-04","https://www.gamesthatwerent.com/2019/11/eddies-puzzle-time-nintendo-game-boy-released/","https://www.gamesthatwerent.com/2014/02/frog-dude-megadrive-and-alfred-chicken-amiga-prototypes-released/","https://hiddenpalace.org/Frogger_2:_Swampy%27s_Revenge_%28October_10,_2000_prototype%29","https://www.gamesthatwerent.com/2024/10/it-came-from-the-desert/","https://www.sega-dreamcast-info-games-preservation.com/en/jet-set-radio-dreamcast-early-us-prototype-iso","https://hiddenpalace.org/Mario_Kart_XXL_%28Apr_17,_2004_Tech_Demo%29","https://www.gamesthatwerent.com/2025/04/mechanoids-2-the-final-conflict/","https://www.gamesthatwerent.com/2025/08/mia-hamm-soccer-64-prototypes/","https://www.gamesthatwerent.com/gtw64/nigel-mansell-world-championship/#tabs-downloads","https://www.emu-land.net/en/consoles/genesis/roms/paprium","https://www.gamesthatwerent.com/2025/03/populous/","https://www.gamesthatwerent.com/2025/07/porky-pigs-haunted-holiday-snes-prototypes/","https://www.gamesthatwerent.com/2020/12/putty-squad/","https://hiddenpalace.org/Rayman_%28SNES_prototype%29","https://archive.org/details/ResidentEvil1.5","https://www.gamesthatwerent.com/2025/12/resident-evil/","https://www.gamesthatwerent.com/2012/01/exclusive-tech-demos-for-robocop-and-gen-13-on-the-ps-one-available-to-download/","https://romsfun.com/download/saints-row-undercover-168984/2","https://www.gamingalexandria.com/wp/2025/12/sega-channel-prototype-sega-genesis-roms/","https://www.gamesthatwerent.com/2025/03/sensible-soccer/","https://hiddenpalace.org/Sonic_Crackers_%28Apr_1,_1994_prototype%29","https://www.gamesthatwerent.com/2024/12/team-sas/","https://www.gamesthatwerent.com/2025/05/the-addams-family-pugsleys-scavenger-hunt-nes-prototypes/","https://hiddenpalace.org/The_Elder_Scrolls_Travels:_Oblivion_%28Apr_27,_2007_prototype%29","https://romsfun.com/download/thrill-kill-25889","https://nesninja.com/game/nes/time-diver-eon-man?rom=Time%20Diver%20Eon%20Man%20%28U%29%20%28Prototype%29%20%5Ba1%5D.nes","https://archive.org/details/tripitaka_win_mac","https://hiddenpalace.org/Viewpoint_2064_%28Apr_13,_2000_prototype%29","https://www.gamesthatwerent.com/2020/10/virtua-hamster/","https://collectionchamber.blogspot.com/2016/09/warcraft-adventures-lord-of-clans.html","https://hiddenpalace.org/Yoshi_Sample_%28GBA_Tech_Demo%29","https://www.romhacking.net/translations/2176/","https://github.com/hitomi2500/airs-patch","https://krokodyl.github.io/post/2025/05/america-oudan/","https://www.romhacking.net/translations/5773/","https://www.romhacking.net/translations/7001/","https://romhack.ing/database/content/entry/TAD0OP-qTqGOKtW0lsVeVg","https://cdromance.org/ps2-iso/battle-stadium-d-o-n-jpn/","https://github.com/Eight-Mansions/Belzerion/releases/tag/Release","https://www.romhacking.net/translations/1384/","https://www.romhacking.net/translations/5603/","https://cdromance.org/ps2-iso/captain-tsubasa-jpn/","https://www.romhacking.net/translations/1182/","https://www.romhacking.net/translations/846/","https://cdromance.org/windows/cave-story-dokutsu-monogatari-english-patched/","https://www.romhacking.net/translations/6412/","https://www.romhacking.net/translations/6722/","https://www.romhacking.net/translations/7425/","https://www.romhacking.net/translations/2337/","https://romhack.ing/database/content/entry/M8qjG9lMSY2TafBciQMHaA/cookie-s-bustle-english-translation","https://www.romhacking.net/translations/5999/","https://github.com/SONICMAN69/Bebop-PS2-English","https://github.com/FeiYenKn/Virtual-On-PS3-English-Translation","https://www.romhacking.net/translations/2344/","https://www.segasaturnshiro.com/2025/04/24/english-patch-for-dark-seed-is-available-now/","https://romhack.ing/database/game/entry/PdNs5JQBNs8FWu0CmDSo/dead-of-the-brain","https://romhack.ing/database/content/entry/8mqdySG4SSmYlPYefdKZpQ","https://www.romhacking.net/translations/6514/","https://cdromance.org/psp/digi-adventure-english-patched/","https://cdromance.org/psp/digimon-world-redigitize-full-english-patched/","https://www.romhacking.net/translations/2287/","https://www.romhacking.net/translations/326/","https://segaxtreme.net/threads/dragon-ball-z-the-legend-english-translation.37310/","https://www.romhacking.net/translations/1622/","https://www.romhacking.net/translations/1323/","https://www.romhacking.net/translations/344/","https://www.romhacking.net/translations/1482/","https://www.romhacking.net/translations/1252/","https://segaxtreme.net/resources/dungeons-dragons-tower-of-doom-english-patch.426/","https://www.romhacking.net/translations/5571/","https://stargood.org/trans/emdr.php","https://cdromance.org/windows/farland-symphony-english-patched/","https://cdromance.org/psp/final-fantasy-type-0-english-patched/","https://romhack.ing/database/content/entry/js0cv7y6TyyPoaPNwQ2qWw","https://cdromance.org/gba-roms/fire-emblem-fuuin-no-tsurugi/","https://www.romhacking.net/translations/1445/","https://www.romhacking.net/translations/961/","https://www.romhacking.net/translations/5621/","https://www.romhacking.net/translations/1593/","https://www.romhacking.net/translations/1764/","https://www.romhacking.net/translations/4653/","https://www.romhacking.net/translations/1750/","https://www.romhacking.net/translations/1297/","https://www.romhacking.net/translations/2015/","https://cdromance.org/psp/god-eater-2-jpn/","https://cdromance.org/psp/grand-knights-history-english-patched/","https://www.romhacking.net/translations/2260/","https://www.romhacking.net/translations/7416/","https://sites.google.com/view/imas-sp-en-tl/home","https://www.romhacking.net/translations/5575/","https://msxtranslations.com/ic.php","https://www.romhacking.net/forum/index.php?topic=39629.0&fbclid=IwY2xjawHkbdJleHRuA2FlbQIxMAABHRHnrkmq2x9QiVciGQYl_2_Ew9eyDf02rNwB1NZ7UNnNP4F9Jgyn8afZiQ_aem_Do3UbOAI_1z5wwUGm5XRSg","https://www.romhacking.net/translations/7056/","https://www.romhacking.net/translations/1043/","https://www.timeextension.com/news/2025/06/you-can-now-play-the-japan-exclusive-ps1-cult-classic-jingle-cats-in-english","https://www.romhacking.net/translations/3956/","https://www.romhacking.net/translations/1636/","https://www.romhacking.net/translations/1623/","https://cdromance.org/psp/kidou-senshi-gundam-gundam-vs-gundam-next-plus-english-patched/","https://www.romhacking.net/translations/1067/","https://cdromance.org/ps2-iso/kingdom-hearts-ii-final-mix-2/","https://www.romhacking.net/translations/6640/","https://cdromance.org/psp/kurohyou-ryu-ga-gotoku-shinshou/","https://www.romhacking.net/translations/1079/","https://www.romhacking.net/translations/2130/","https://www.romhacking.net/translations/1711/","https://www.romhacking.net/translations/4143/","https://www.romhacking.net/translations/381/","https://www.romhacking.net/translations/5387/","https://www.romhacking.net/translations/5523/","https://www.romhacking.net/translations/7464/","https://cdromance.org/windows/magna-carta-the-phantom-of-avalanche-english-patched-windows/","https://gbatemp.net/threads/maplestory-ds-2025-full-english-translation-complete.677209/","https://www.romhacking.net/translations/3494/","https://www.romhacking.net/translations/842/","https://www.romhacking.net/translations/6027/","https://www.romhacking.net/translations/2043/","https://www.romhacking.net/translations/1609/","https://www.romhacking.net/translations/1333/","https://romhack.ing/database/content/entry/KLsCYW2oSgeSD9DiIEGgvw","https://www.romhacking.net/translations/1270/","https://www.romhacking.net/translations/5809/","https://www.romhacking.net/translations/3560/","https://cdromance.org/psp/romance-dawn-english-patched/","https://www.romhacking.net/translations/7282/","https://romhack.ing/database/content/entry/XN_BmXoyS2qWekII82Q87Q/patlabor-english-translation","https://www.romhacking.net/translations/1249/","https://www.romhacking.net/translations/1629/","https://www.romhacking.net/translations/1736/","https://www.romhacking.net/translations/5518/","https://www.romhacking.net/translations/1422/","https://romhackplaza.org/translations/popolocrois-monogatari-ii-english-translation-playstation/","https://github.com/Lost-Okina/popolocrois-translation-tool/releases/tag/v1.0-poporogue","https://github.com/eadmaster/pcrown/releases","https://romhack.ing/database/content/entry/wE3wXKn-RHW8lcesg7lG_g/progenitor-english-translation","https://www.romhacking.net/translations/6680/","https://www.romhacking.net/translations/7408/","https://www.romhacking.net/translations/6198/","https://www.romhacking.net/translations/404/","https://www.romhacking.net/translations/6925/","https://www.romhacking.net/translations/621/","https://www.romhacking.net/translations/5601/","https://www.romhacking.net/translations/1762/","https://segaxtreme.net/resources/sakura-wars-2-english-translation.412/","https://aeongenesis.net/projects/paranoiascape","https://www.romhacking.net/translations/440/","https://www.romhacking.net/translations/2042/","https://www.romhacking.net/translations/6610/","https://www.romhacking.net/translations/571/","https://www.romhacking.net/translations/687/","https://www.romhacking.net/translations/3951/","https://www.romhacking.net/translations/3283/","https://www.romhacking.net/translations/1569/","https://github.com/ExxistanceDC/Shinrei-Jusatsushi-Taromaru-English-Patch","https://www.romhacking.net/translations/7060/","https://www.romhacking.net/translations/6521/","https://www.romhacking.net/translations/6340/","https://romhack.ing/database/content/entry/uz8qKfAyQo2GkTX_DHwt6g","https://www.romhacking.net/translations/3354/","https://www.romhacking.net/translations/3658/","https://www.romhacking.net/translations/6105/","https://www.romhacking.net/translations/1577/","https://www.romhacking.net/translations/5817/","https://cdromance.org/psp/sao-infinity-moment-english-patched/","https://www.romhacking.net/translations/6560/","https://www.romhacking.net/translations/1501/","https://www.romhacking.net/translations/1214/","https://romhack.ing/database/content/entry/LjjufdifRv66ITK_3u_VWA","https://www.romhacking.net/translations/2812/","https://www.romhacking.net/translations/3243/","https://www.romhacking.net/translations/7432","https://nebulous.group/index.php/projects/translations/hybrid-front/#cmtoc_anchor_id_4","https://cdromance.org/windows/the-legend-of-sword-and-fairy-english-patched-v3-3-windows-pc/","https://fantranslators.info/2025/02/01/time-travelers-english-translation-patch/","https://www.romhacking.net/translations/7435/","https://cdromance.org/nds-roms/tomodachi-collection-english-patched/","https://www.romhacking.net/translations/2228/","https://cdromance.org/psp/toukiden-kiwami-english-patched-v2/","https://cdromance.org/windows/tsukihime-english-patched/","https://www.romhacking.net/translations/5623/","https://romhack.ing/database/content/entry/xeLw9oQGSluBM5YGZVJnZg","https://www.timeextension.com/news/2025/05/a-japan-exclusive-puyo-puyo-dungeon-crawler-for-saturn-has-just-received-a-fan-translation","https://romhackplaza.org/translations/welcome-house-2-keaton-and-his-uncle-english-translation-playstation/","https://segaxtreme.net/resources/wizardry-vi-vii-complete-english-translation-patch.457/","https://romhackplaza.org/translations/wonder-trek-english-translation-playstation/","https://romhackplaza.org/translations/misfortune-a-story-of-suspicious-friendships-english-translation-playstation/","https://cdromance.org/psp/yu-gi-oh-5ds-tag-force-6-english-patched-2/","https://cdromance.org/psp/yu-gi-oh-arc-v-tag-force-special-jpn-2/","https://www.romhacking.net/translations/6025/","https://www.romhacking.net/translations/5700/","https://www.romhacking.net/translations/2044/","https://www.romhacking.net/translations/6799/","https://www.reddit.com/r/steamdeckhq/s/7Xc1vsIx1O","https://www.gamingonlinux.com/guides/view/alternatives-to-popular-games-that-dont-work-on-linux-steam-deck-and-steamos/","https://romhackplaza.org/tutorials/a-hackers-essential-toolkit/","https://www.gamingonlinux.com/guides/view/an-idiots-guide-to-setting-up-minecraft-on-steam-deck-steamos-with-controller-support/","https://romhackplaza.org/tutorials/an-introduction-to-understanding-hacking-8-bit-graphics/","https://mdk.cab/","https://romhackplaza.org/tutorials/absolute-beginners-snes-hacking-guide/","https://www.reddit.com/r/shadps4/comments/1lee438/full_guide_how_to_play_bloodborne_on_pc_for_n00bs/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button","https://romhackplaza.org/tutorials/the-definitive-guide-to-rom-hacking-for-complete-beginners/","https://www.youtube.com/watch?v=M1JwSQMINnU&ab_channel=MonroeWorld","https://manual.emudeck.com/","https://www.reddit.com/r/SteamDeck/s/385ijbinDk","https://www.reddit.com/r/SteamDeck/s/H0Wmni7DJ9","https://romhackplaza.org/tutorials/gba-and-ds-rom-hacking-guide/","https://romhackplaza.org/tutorials/hacking-games-in-hex-sega-genesis-edition/","https://dumping.guide/start","https://youtu.be/H6P7N4po1hM?si=V-_3Iyn9YvEOa0RG","https://www.gamingonlinux.com/guides/view/how-to-get-battlefield-3-and-battlefield-4-online-working-on-linux-steamos-steam-deck/","https://www.youtube.com/watch?v=ICc0mWPJdUM&ab_channel=WarpedPolygon","https://www.youtube.com/watch?v=kGf5t5U5Ays&ab_channel=GeniusBug","https://www.youtube.com/watch?v=YvSXzC2c3pg&ab_channel=GeniusBug","https://www.gamingonlinux.com/guides/view/how-to-install-hollow-knight-silksong-mods-on-linux-steamos-and-steam-deck/","https://www.gamingonlinux.com/guides/view/how-to-play-games-from-gog-and-epic-games-on-linux-steamos-and-steam-deck/","https://www.gamingonlinux.com/guides/view/how-to-setup-openmw-for-modern-morrowind-on-linux-steamos-and-steam-deck/","https://youtu.be/WRwJ8c4bTpA?si=NsC7lUIZ2JPLGWGQ","https://steamcommunity.com/sharedfiles/filedetails/?id=2780134576","https://romhackplaza.org/tutorials/romhacking-101/","https://romhackplaza.org/tutorials/romhacking102-fontsprites/","https://romhackplaza.org/tutorials/romhacking-103-script-insertion/","https://romhackplaza.org/tutorials/romhacking-104-compression-scheme-re/","https://romhackplaza.org/tutorials/romhacking-psp_basics/","https://www.reddit.com/r/SteamDeck/comments/16lnsg6/psa_solution_to_slow_steam_downloads_on_deck/?share_id=YSfT6PmFF1o5ap6fl0FPS&utm_content=1&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1","https://www.reddit.com/r/SteamDeck/comments/11yjs1s/comment/jm1irbr/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button","https://romhackplaza.org/tutorials/the-playstation-translation-doc/","https://decky.net/en-eu/blogs/news/android-auf-dem-steam-deck","https://github.com/BanjoRecomp/BanjoRecomp/releases/tag/v1.0.0","https://github.com/HarbourMasters/Ghostship","https://monkeyball-online.pages.dev/","https://github.com/ArmchairDevelopers/Kyber","https://www.nexusmods.com/witcher3/mods/11590?tab=description","https://www.nexusmods.com/newvegas/mods/95615","https://www.moddb.com/mods/black-mesa-military/downloads/black-mesa-military-2026-version-full","https://www.nexusmods.com/fallout3/mods/27207?tab=description","https://www.nexusmods.com/starfield/mods/15877?tab=description","https://www.moddb.com/mods/assassins-creed-victory-project-version-10/downloads/assassins-creed-victory-project-version-10","https://github.com/matiaszanolli/sega-vr-disasm","https://github.com/mmzret/rmz3","https://github.com/nsmbu/decomp","https://github.com/MegaMan64Recomp/MegaMan64Recompiled/releases/tag/v0.1.0-alpha","https://agentratelimit.github.io/Mobhold/","https://beep8.org/","https://segaxtreme.net/resources/sonic-r-the-r-r-mod.479/","https://github.com/BodbDearg/PsyDoom/releases/tag/preview-builds%2F1.2.0-preview1","https://github.com/clockworklabs/BitCraftPublic","https://romhack.ing/database/content/entry/yBy69HXSTe2eXhS1y4DyiA/shizuku-english-translation","https://daves-retro-forge.itch.io/bubble-bobble-lost-cave-c64","https://www.moddb.com/mods/morrowind-rebirth/downloads","https://www.luanti.org/en/","https://alemart.itch.io/opensurge","https://romhacking.com/hack/substance-wars-64","https://www.nexusmods.com/newvegas/mods/95967?tab=description","https://www.romhacking.net/hacks/7492/","https://www.romhacking.net/hacks/4477/","https://www.romhacking.net/hacks/3784/","https://www.romhacking.net/hacks/6683/","https://www.romhacking.net/hacks/4388/","https://www.romhacking.net/hacks/8673/","https://www.romhacking.net/hacks/6076/","https://www.romhacking.net/hacks/6866/","https://www.romhacking.net/translations/1757/","https://www.romhacking.net/hacks/1385/","https://www.romhacking.net/hacks/7480/","https://www.romhacking.net/hacks/8297/","https://www.romhacking.net/translations/2573/","https://www.romhacking.net/hacks/6510/","https://www.romhacking.net/hacks/6657/","https://www.romhacking.net/hacks/6781/","https://www.romhacking.net/hacks/6797/","https://www.romhacking.net/hacks/5281/","https://www.romhacking.net/hacks/6541/","https://jappawakka.itch.io/zeldas-adventure-remastered","https://hiddenpalace.org/Beavis_and_Butt-Head_Do_Hollywood_(Nov_10,_1998_prototype)","https://github.com/snaku/Persona3-FES-Decompilation","https://github.com/pret/pokeheartgold","https://mourilo.itch.io/the-last-of-us-demastered?ref=retrododo.com","https://github.com/Kaisaan/lostkefin","https://virtual-adventures.itch.io/star-quest-1-in-the-27th-century","https://play2048.co/","https://plutonium.pw/","https://horizonmw.org/","https://www.belltreeforums.com/threads/animal-crossing-deluxe-mod.638259/","https://tf2classified.com/","https://archive.org/details/mamono-hunter-mai","https://archive.org/details/harry-potter-and-the-order-of-the-phoenix-ibm-pc-usa","https://iso-city.com/","https://iso-coaster.com/","https://shattered-pixel.itch.io/shattered-pixel-dungeon","https://unvanquished.net/","https://warsow.net/","https://indieastaroth.itch.io/ghosts-and-goblins-2","https://github.com/lifebottle/Tales-of-Phantasia-X/releases/tag/v1.0","https://thunderstore.io/c/banjo-recompiled/","https://www.nexusmods.com/princeofpersiathesandsoftime/mods/14?tab=posts","https://osu.ppy.sh/home/download","https://www.redeclipse.net/","https://www.themanaworld.org/","https://te4.org/","https://openspades.yvt.jp/","https://www.supertux.org/","https://www.openclonk.org/","https://www.simutrans.com/en/","https://github.com/akarnokd/open-ig","http://www.openarena.ws/smfnews.php","https://www.freedroid.org/","https://cryham.org/stuntrally/","https://spring1944.net/","https://megaglest.org/","https://www.bzflag.org/","https://github.com/freegish/freegish","https://rephial.org/","https://www.planeshift.it/","https://www.rigsofrods.org/","https://www.etlegacy.com/","https://pingus.seul.org/","https://tuxemon.org/","https://triplea-game.org/","https://www.alienarena.org/","https://github.com/magarena/magarena","https://github.com/BlindMindStudios/StarRuler2-Source","https://ryzom.com/","https://bayat.itch.io/red-runner","https://dzierzan.itch.io/opensa","https://github.com/Ruin0x11/ElonaPlusCustom-GX","https://rayfowler.itch.io/remnants-of-the-precursors","https://tremulous.net/","https://terasology.org/","https://blackgrain.itch.io/dead-ascend","https://github.com/Limit-Theory-Redux/ltheory","https://neverball.org/screenshots","https://mk48.io/","https://repo.openpandora.org/?page=detail&app=friking-shark-ptitseb","https://gofile.io/d/oI3bEg","https://mordorwi.de/","https://www.shadowsofthepast.org/","https://deadrising2mods.proboards.com/thread/3637","https://romhack.ing/database/content/entry/-JIdj-dSReyb69bQ1d0aCw/all-japan-women-s-pro-wrestling-queen-of-queens-english","https://www.nexusmods.com/fallout4/mods/23273","https://cdromance.org/pc-98/crw-metal-jacket-english-patched/","https://cdromance.org/pc-98/tuned-heart-english-patched/","https://www.pokecommunity.com/threads/pok%C3%A9mon-inritum.532504/?ref=retrododo.com","https://store.steampowered.com/app/3376480/Delivery__Beyond/","https://cdromance.org/nds-roms/lode-runner-japan/","https://cdromance.org/snes-rom/rockman-forte-player-switching-multiple-equipment-hack/","https://cdromance.org/nds-roms/dragon-ball-kai-ultimate-butouden-jpn-english-patched/","https://github.com/sam8457/Chobits-Translation-Project","https://github.com/lambertjamesd/n64brew2025","https://github.com/tmewett/BrogueCE","https://github.com/Attnam/ivan","https://codeberg.org/anaseto/shamogu","https://codeberg.org/anaseto/harmonist","https://github.com/kiedtl/roguelike","https://www.shadowofthewyrm.org/","https://github.com/sil-quirk/sil-q","https://github.com/zenorogue/hyperrogue/","https://barotraumagame.com/","https://mindustrygame.github.io/","https://usdx.eu/","https://www.stepmania.com/","https://github.com/Cellenseres/SSSV_Recomp","https://afska.itch.io/emudevz","https://ashgb.itch.io/station-heroes-for-hire","https://github.com/mmatyas/openblok","https://pysolfc.sourceforge.io/","https://github.com/Keriew/augustus","https://www.reddit.com/r/oni/comments/1qvy35h/oni_remaster_mod_link/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button","https://www.nexusmods.com/reddeadredemption2/mods/8021?tab=description","https://www.nexusmods.com/residentevilbiohazardhdremaster/mods/169?tab=description","https://edsmithy.itch.io/supertux-3d","https://reemax.itch.io/open-realm-of-stars","https://evilgames.eu/texture-packs/sm64-reloaded.htm","https://www.nexusmods.com/witcher3/mods/11831?tab=description","https://feneric.itch.io/minima","https://feneric.itch.io/anteform","https://mother-encore.itch.io/mother-encore","https://leef6010.itch.io/projectkat","https://garula.itch.io/the-freak-circus","https://discord.com/invite/tRVhfWSkf2","https://sonicmegamixmania.github.io/","https://www.indieretronews.com/2026/02/final-fight-enhanced-enhanced-amiga.html?spref=tw","https://segaxtreme.net/resources/cold-case.237/","https://gtaforums.com/topic/986492-grand-theft-auto-ready2play-full-game-windows-version/","https://agentratelimit.github.io/Orbhold/","https://github.com/LLONSIT-glitch/wonder","https://old-pirate.itch.io/kula-world-32x","https://www.romhacking.net/hacks/9409/?ref=retrododo.com","https://github.com/streetpea/chiaki-ng","https://github.com/mikeroyal/Steam-Deck-Guide","https://github.com/airscripts/awesome-steam-deck","https://baldsealion.com/","https://old-pirate.itch.io/heart-of-the-alien-n64","https://cdromance.org/n64-roms/super-mario-64-remake-hack-n64/","https://www.nexusmods.com/assassinscreed/mods/152?tab=description","https://walfie.itch.io/walfies-nonograms","https://bonnie-games.itch.io/celeste-classic-psx","https://github.com/luksamuk/engine-psx","https://github.com/OldUnreal/FullGameInstallers/releases/tag/windows-game-installers","https://youtu.be/ogc-BAuQEGw?si=biUDDwz2ln5BR0qY","https://zhamul.itch.io/friends-adrift-ps1","http://netyaroze.com/Media/Magic-Castle","https://gamebanana.com/mods/594415","https://www.romhacking.net/translations/7509/","https://openciv3.org/","https://cyangmou.itch.io/isometric-games-dont-exist","https://github.com/ValakTurtle/Xenosaga-I-Decomp","https://github.com/GensokyoClub/th06","https://youtu.be/KY5X0G_05h0?si=-1DM55tQkS3nQvB8","https://www.nexusmods.com/cyberpunk2077/mods/25999","https://www.myabandonware.com/game/black-white-2-bem","https://www.myabandonware.com/game/zoo-tycoon-complete-collection-dzx","https://www.myabandonware.com/game/black-white-a33","https://www.myabandonware.com/game/simant-197","https://www.myabandonware.com/game/mechwarrior-4-mercenaries-3ak","https://www.myabandonware.com/game/the-movies-bcv","https://www.myabandonware.com/game/harry-potter-and-the-sorcerer-s-stone-e3o","https://www.myabandonware.com/game/sonic-heroes-cm5","https://www.myabandonware.com/game/disney-s-tarzan-49p","https://archive.org/details/the-lord-of-the-rings-the-battle-for-middle-earth-ii-repack","https://www.myabandonware.com/game/adidas-power-soccer-dsf","https://www.myabandonware.com/game/spider-man-web-of-shadows-gmb","https://www.myabandonware.com/game/spider-man-shattered-dimensions-rbo","https://www.romhacking.net/hacks/6803/","https://www.romhacking.net/hacks/6311/","https://archive.org/details/ghost-recon-advanced-warfighter","https://github.com/MarxMustermann/OfMiceAndMechs/","https://pikhacker.github.io/","https://forum.nhl94.com/index.php?/topic/38026-nhl94-fight-edition/","https://www.romhacking.net/hacks/4913/","https://archive.org/details/Snoopy_vs._The_Red_Baron_USA","https://archive.org/details/state-of-emergency-repack","https://archive.org/details/rise-of-nations-rise-of-legends-2006-microsoft-big-huge-games-4-cd-set","https://www.pokecommunity.com/threads/super-mariomon.535764/","https://www.romhacking.net/hacks/8885/","https://www.romhacking.net/hacks/8027/","https://goodboygalaxy.com/wiki/doku.php?id=rumble","https://www.romhacking.net/hacks/8287/","https://www.romhacking.net/hacks/8204/","https://www.romhacking.net/hacks/8289/","https://feuniverse.us/t/fe8-sacred-stones-reforged-v1-0-4/28486?page=11","https://github.com/ShaffySwitcher/RhythmHeavenSilver","https://www.romhacking.net/hacks/167/","https://www.smwcentral.net/?p=section&a=details&id=40597","https://www.romhacking.net/hacks/9299/","https://www.romhacking.net/hacks/8425/","https://www.romhacking.net/hacks/8805/","https://www.romhacking.net/hacks/797/","https://will319.itch.io/super-luigi-rpg-star-powered","https://metroidconstruction.com/hack.php?id=357","https://www.romhacking.net/hacks/6292/","https://retrohackers.net/hack-details.php?id=5656/","https://www.romhacking.net/hacks/8639/","https://www.romhacking.net/hacks/8239/","https://www.romhacking.net/hacks/6550/","https://www.myabandonware.com/game/close-combat-first-to-fight-dj8","https://www.romhacking.net/hacks/2235/","https://www.myabandonware.com/game/wwf-raw-e6z","https://www.romhacking.net/hacks/2248/","https://www.myabandonware.com/game/turok-evolution-amg","https://www.myabandonware.com/game/paraworld-f3y","https://gitlab.com/PiKeyAr/dreamcast-image-builder/","https://github.com/X-Hax/dreamcast-mods","https://github.com/Kelsidavis/WoWee","https://github.com/klorfmorf/MNSGRecompRedubMod/releases/tag/1.0.0","https://www.myabandonware.com/game/harry-potter-and-the-deathly-hallows-part-1-f6c","https://www.myabandonware.com/game/shaun-white-skateboarding-wra","https://www.myabandonware.com/game/sol-survivor-xpy","https://www.myabandonware.com/game/tom-clancy-s-h-a-w-x-2-n5j","https://www.myabandonware.com/game/wrc-fia-world-rally-championship-t59","https://www.myabandonware.com/game/harry-potter-and-the-deathly-hallows-part-2-f6d","https://www.myabandonware.com/game/jurassic-park-the-game-yfz","https://www.myabandonware.com/game/virtua-tennis-4-r0g","https://www.myabandonware.com/game/farming-simulator-2009-re1","https://www.myabandonware.com/game/heroes-over-europe-qml","https://www.romhacking.net/hacks/8109/","https://www.romhacking.net/hacks/3945/","https://www.romhacking.net/hacks/3038/","https://www.romhacking.net/hacks/2767/","https://metroidconstruction.com/hack.php?id=716","https://kainetertainment.home.blog/2022/11/09/super-gng-hacks/","https://www.romhacking.net/hacks/7358/","https://www.myabandonware.com/game/terminator-salvation-lkf","https://www.myabandonware.com/game/the-warriors-street-brawl-f1w","https://www.myabandonware.com/game/tom-clancy-s-h-a-w-x-jte","https://archive.org/details/motocross-madness-repack-v-2","https://archive.org/details/motocross-madness-2-repack-v-2","https://github.com/StraDaMa/PoN_PC","https://www.myabandonware.com/game/pariah-enq","https://www.myabandonware.com/game/onimusha-3-demon-siege-bhb","https://www.myabandonware.com/game/gunners-heart-lbu","https://www.myabandonware.com/game/dynasty-warriors-5-special-cnf","https://www.myabandonware.com/game/dynasty-warriors-4-l4c","https://www.myabandonware.com/game/driv3r-eq2","https://archive.org/details/conflict-global-terror-repack","https://www.myabandonware.com/game/true-crime-new-york-city-e37","https://www.myabandonware.com/game/sonic-riders-cng","https://www.myabandonware.com/game/micro-machines-v4-dze","https://archive.org/details/blazing-angels-squadrons-of-wwii-repack","https://www.myabandonware.com/game/bionicle-heroes-cnb","https://www.myabandonware.com/game/billy-hatcher-and-the-giant-egg-cnk","https://www.myabandonware.com/game/universe-at-war-earth-assault-f3x","https://www.myabandonware.com/game/soeldner-x-himmelsstuermer-limited-edition-lq6","https://www.myabandonware.com/game/phantasy-star-universe-ambition-of-the-illuminus-co5","https://www.myabandonware.com/game/infernal-cki","https://www.myabandonware.com/game/enemy-territory-quake-wars-ixd","https://www.myabandonware.com/game/blacksite-area-51-e2g","https://www.myabandonware.com/game/assault-heroes-ioq","https://www.myabandonware.com/game/a-farewell-to-dragons-nh7","https://www.myabandonware.com/game/zoo-tycoon-2-ultimate-collection-tal","https://www.myabandonware.com/game/turning-point-fall-of-liberty-mmx","https://www.myabandonware.com/game/the-incredible-hulk-td5","https://www.myabandonware.com/game/shaun-white-snowboarding-vs3","https://www.myabandonware.com/game/samurai-warriors-2-gyg","https://www.myabandonware.com/game/rayman-raving-rabbids-2-fm0","https://www.myabandonware.com/game/kung-fu-panda-nr2","https://www.myabandonware.com/game/dynasty-warriors-6-ixg","https://archive.org/details/lotus-challenge-win-7-to-11-compat","https://archive.org/details/south-park-chefs-luv-shack-win-7-to-11-compat","https://archive.org/details/frogger-returns-win-7-to-11-compatible-a-wb-installer","https://archive.org/details/flash_traffic_-_city_of_angels_windows_10_compatible","https://archive.org/details/jimmy-whites-cueball-world-windows-10-compatible","https://archive.org/details/CrazyCarsIIIInstaller","https://archive.org/details/bloodwings-pumpkinheads-revenge-7-to-11-compat","https://archive.org/details/piratesgoldwindows10compatible","https://archive.org/details/grand-prix-500-2-win-7-11-compatible","https://archive.org/details/DreamWebCDVersionInstallerWin10","https://archive.org/details/pga-tour-golf-486-windows-10-compatible","https://archive.org/details/MadDogIITheLostGold_201905","https://archive.org/details/WhoShotJohnnyRockWindows10Compatible","https://archive.org/details/secretmissionwindows10silentinstallerbywhitebob","https://archive.org/details/paperboy-2-win-7-11-compatible-installer","https://archive.org/details/monkey-island-2-lechucks-revenge-ultimate-talkie-dos-edition-win-7-to-11-compat","https://archive.org/details/jimmy-whites-2-cueball-windows-10-compatible","https://archive.org/details/InternationalSensibleSoccerSetup","https://archive.org/details/HellACyberpunkThrillerWindows10","https://archive.org/details/ChampionshipManager97-98-18-19_Mod","https://archive.org/details/Speedball2BrutalDeluxeInstallerWindows10Compatible","https://archive.org/details/cool-spot-windows-10-compatible","https://archive.org/details/time-gal-win-7-to-11-compatible","https://archive.org/details/project-x-special-edition-93-amiga-version-windows-10-compatible","https://archive.org/details/GhostlyDesiresWindows10","https://archive.org/details/monopoly_casino_windows_10_compatible","https://archive.org/details/RipperWindows10Compatible","https://archive.org/details/wolfpack-gold-edition-cd-rom-windows-7-11-compat","https://archive.org/details/LotusTheUltimateChallengeInstaller","https://archive.org/details/BeavisButt-HeadMiniGamesForWindows10Compatible","https://archive.org/details/wormsthedirectorscutwindows10compatible","https://archive.org/details/star-wars-chess-win-7-11-compatible","https://archive.org/details/VoyeurIIWindows10Compatible","https://archive.org/details/SpaceInvadersWindows10Compatible","https://archive.org/details/star-wars-episode-i-battle-for-naboo-windows-7-11-compat","https://archive.org/details/NightTrapDirectorsCut","https://archive.org/details/MadDogMcCree","https://archive.org/details/harvester-windows-10-compat","https://archive.org/details/crashtimeiii3Windows10Compatible","https://archive.org/details/worms-remastered-win-7-11-compat-a-white-bob-installer","https://archive.org/details/star-wars-force-commander-windows-10-compatible","https://archive.org/details/MONKEYISLAND_201903","https://archive.org/details/crashtime4thesyndicateinstalleWindows10Compatible","https://archive.org/details/star-wars-trilogy-arcade-win-7-11-compatible-installer","https://archive.org/details/HooligansStormOverEuropeWindows10Compatible","https://archive.org/details/007NightfireWindows10Compatible","https://archive.org/details/OutRun2006Coast2CoastSetupWindows10","https://archive.org/details/CallOfDutyGOYEditionWindows10Compatible","https://www.old-games.com/download/9162/gore-ultimate-soldier","https://oldgamesdownload.com/global-operations/","https://archive.org/details/TheWheelOfTime-ZombsLair","https://archive.org/details/TheDayTheWorldBroke-ZombsLair","https://archive.org/details/TheDarkEye-ZombsLair","https://archive.org/details/TakeNoPrisoners-ZombsLair","https://archive.org/details/Synnergist-ZombsLair","https://archive.org/details/Stratosphere-ZombsLair","https://archive.org/details/StarTrekTheNextGenerationAFinalUnity-ZombsLair","https://archive.org/details/SpaceshipWarlock-ZombsLair","https://archive.org/details/ShadowOfTheBeastCollection-ZombsLair","https://archive.org/details/PerihelionTheProphecy-ZombsLair","https://archive.org/details/AlienLegacy-ZombsLair","https://archive.org/details/Nightlong-ZombsLair/Nightlong%20-%20Cover.jpg","https://archive.org/details/MummyTombOfThePharaoh-ZombsLair","https://archive.org/details/MasterOfDimensions-ZombsLair","https://archive.org/details/MartianGothic-ZombsLair","https://archive.org/details/LifeforceTenka-ZombsLair","https://archive.org/details/IronAssault-ZombsLair","https://archive.org/details/GunmanChronicles-ZombsLair","https://archive.org/details/Gothos-ZombsLair","https://archive.org/details/GadgetCollection-ZombsLair","https://archive.org/details/FutureCopLAPD-ZombsLair","https://archive.org/details/FrankensteinThroughTheEyesOfTheMonster-ZombsLair","https://archive.org/details/Faust-ZombsLair","https://archive.org/details/EvilDeadHailToTheKing-ZombsLair","https://archive.org/details/ElviraCollection-ZombsLair","https://archive.org/details/DrownedGod-ZombsLair","https://archive.org/details/DeathGate-ZombsLair","https://archive.org/details/DaughterOfSerpents-ZombsLair","https://archive.org/details/CompanionsOfXanth-ZombsLair","https://archive.org/details/CommanderBlood-ZombsLair","https://archive.org/details/Biosys-ZombsLair","https://archive.org/details/BlackDahlia-ZombsLair","https://archive.org/details/BurnCycle-ZombsLair","https://archive.org/details/BlueHeat-ZombsLair","https://archive.org/details/Abomination-ZombsLair","https://archive.org/details/NightmareCreatures-ZombsLair","https://archive.org/details/pro-evolution-soccer-collection","https://archive.org/details/f-1-2014_202512","https://archive.org/details/007-legends","https://archive.org/details/fifa-17-super-deluxe-edition","https://archive.org/details/fifa-15-1.4.0.0-v-3","https://archive.org/details/fifa-08-el-amigos","https://archive.org/details/fifa-13-v-1.7-12.02.2013","https://archive.org/details/euro-2012-video-game","https://archive.org/details/fifa-11-full-reloaded-pc-game-setup-torrent","https://archive.org/details/wings-of-glory-mr-abandonware","https://archive.org/details/vengeance-of-excalibur-mr-abandonware","https://archive.org/details/twilight-2000-mr-abandonware","https://archive.org/details/touche-the-adventures-of-the-fifth-musketeer-mr-abandonware","https://archive.org/details/total-distortion-1-mr-abandonware","https://archive.org/details/tom-clancys-ssn-mr-abandonware_202208","https://archive.org/details/times-of-lore-mr-abandonware","https://archive.org/details/their-finest-hour-mr-abandonware","https://archive.org/details/the-terminator-skynet-mr-abandonware","https://archive.org/details/the-terminator-future-shock-mr-abandonware","https://archive.org/details/the-terminator-2029-deluxe-cd-edition-mr-abandonware","https://archive.org/details/the-scroll-mr-abandonware","https://archive.org/details/the-orion-conspiracy-mr-abandonware","https://archive.org/details/the-lost-vikings-mr-abandonware","https://archive.org/details/the-lost-files-of-sherlock-holmes-the-case-of-the-serrated-scalpel-mr-abandonware","https://archive.org/details/the-lost-files-of-sherlock-holmes-the-case-of-the-rose-tattoo-mr-abandonware","https://archive.org/details/the-gene-machine-mr-abandonware","https://archive.org/details/the-daedalus-encounter-mr-abandonware","https://archive.org/details/the-clue-mr-abandonware","https://archive.org/details/spirit-of-excalibur-mr-abandonware","https://archive.org/details/space-hulk-mr-abandonware","https://archive.org/details/silent-hunter-mr-abandonware","https://archive.org/details/secret-weapons-of-the-luftwaffe-mr-abandonware","https://archive.org/details/seal-team-mr-abandonware","https://archive.org/details/ringworld-revenge-of-the-patriarch-mr-abandonware","https://archive.org/details/return-to-ringworld-mr-abandonware","https://archive.org/details/reach-for-the-skies-mr-abandonware","https://archive.org/details/rama-mr-abandonware","https://archive.org/details/private-eye-1-mr-abandonware","https://archive.org/details/premier-manager-3-mr-abandonware","https://archive.org/details/plan-9-from-outer-space-mr-abandonware","https://archive.org/details/pacific-strike-mr-abandonware","https://archive.org/details/operation-stealth-mr-abandonware","https://archive.org/details/oh-no-more-lemmings-mr-abandonware","https://archive.org/details/noir-a-shadowy-thriller-mr-abandonware","https://archive.org/details/neuromancer-mr-abandonware","https://archive.org/details/nascar-racing-2-mr-abandonware","https://archive.org/details/nascar-racing-mr-abandonware_202207","https://archive.org/details/jungle-strike-mr-abandonware","https://archive.org/details/midwinter-ii-flames-of-freedom-mr-abandonware","https://archive.org/details/midwinter-mr-abandonware","https://archive.org/details/microsoft-flight-simulator-v-5-1-mr-abandonware","https://archive.org/details/metaltech-earthsiege-complete-mr-abandonware","https://archive.org/details/mechwarrior-2-mercenaries-mr-abandonware","https://archive.org/details/mech-warrior-2-ghost-bears-legacy-mr-abandonware","https://archive.org/details/mech-warrior-2-mr-abandonware","https://archive.org/details/mech-warrior-mr-abandonware","https://archive.org/details/lost-in-time-mr-abandonware","https://archive.org/details/lemmings-2-mr-abandonware","https://archive.org/details/lemmings-mr-abandonware","https://archive.org/details/kgb-conspiracy-mr-abandonware","https://archive.org/details/journey-the-quest-begins-mr-abandonware","https://archive.org/details/jcs-longbow-gold-mr-abandonware","https://archive.org/details/lord-of-the-rings-volume-2-mr-abandonware","https://archive.org/details/lord-of-the-rings-volume-1-mr-abandonware","https://drive.google.com/drive/folders/1Mmmn8SDJpXTMhsulMMcmPwlNwZXOlDGc","https://drive.google.com/drive/folders/1WJqEH3WGSPDOp3MaHPs99iTb03OjU5X-","https://archive.org/details/innocent-until-caught-2-presumed-guilty-mr-abandonware","https://archive.org/details/innocent-until-caught-mr-abandonware","https://archive.org/details/indycar-racing-2-mr-abandonware","https://archive.org/details/indy-car-racing-mr-abandonware","https://archive.org/details/inca-2-mr-abandonware","https://archive.org/details/inca-mr-abandonware","https://archive.org/details/hopkins-fbi-mr-abandonware","https://archive.org/details/ghosts-1-mr-abandonware","https://archive.org/details/geisha-mr-abandonware","https://archive.org/details/future-wars-mr-abandonware","https://archive.org/details/fascination-mr-abandonware","https://archive.org/details/fade-to-black-mr-abandonware","https://archive.org/details/fable-mr-abandonware","https://archive.org/details/athens-2004-repack","https://archive.org/details/ecstatica-ii-mr-abandonware","https://archive.org/details/ecstatica-mr-abandonware","https://archive.org/details/dungeon-master-ii-mr-abandonware","https://archive.org/details/dungeon-master-mr-abandonware","https://archive.org/details/dune-2-mr-abandonware","https://archive.org/details/dune-2000-mr-abandonware","https://archive.org/details/dune-mr-abandonware","https://archive.org/details/druid-daemons-of-the-mind-mr-abandonware","https://archive.org/details/dreamweb-mr-abandonware","https://archive.org/details/discworld-2-mr-abandonware","https://archive.org/details/discworld-mr-abandonware","https://archive.org/details/destruction-derby-mr-abandonware","https://archive.org/details/desert-strike-mr-abandonware","https://archive.org/details/dark-seed-ii-mr-abandonware","https://archive.org/details/dark-seed-mr-abandonware","https://archive.org/details/conan-the-cimmerian-mr-abandonware","https://archive.org/details/circuits-edge-mr-abandonware","https://archive.org/details/chuck-yeagers-air-combat-mr-abandonware","https://archive.org/details/buck-rogers-matrix-cubed-mr-abandonware","https://archive.org/details/buck-rogers-countdown-to-doomsday-mr-abandonware","https://archive.org/details/beavis-and-butt-head-in-virtual-stupidity-mr-abandonware","https://archive.org/details/alien-virus-mr-abandonware","https://archive.org/details/alien-logic-mr-abandonware","https://archive.org/details/aces-over-europe-mr-abandonware","https://archive.org/details/aces-of-the-pacific-mr-abandonware","https://archive.org/details/aces-of-the-deep-mr-abandonware","https://archive.org/details/a-10-tank-killer-mr-abandonware","https://archive.org/details/warcraft-iii-complete-edition-repack-v-3","https://archive.org/details/the-sims-complete-edition-repack-v-4","https://archive.org/details/the-lord-of-the-rings-the-battle-for-middle-earth-repack","https://archive.org/details/the-house-of-the-dead-repack-v-3","https://archive.org/details/the-house-of-the-dead-3-repack","https://archive.org/details/the-house-of-the-dead-2-repack-v-3","https://archive.org/details/teenage-mutant-ninja-turtles-2-battle-nexus-repack","https://archive.org/details/sydney-2000-repack","https://archive.org/details/star-craft-repack","https://archive.org/details/spider-man-the-sinister-six-repack","https://archive.org/details/spider-man-2-activity-center-repack","https://archive.org/details/sega-worldwide-soccer-pc-repack","https://archive.org/details/reservoir-dogs-repack","https://archive.org/details/re-volt-repack-v-2","https://archive.org/details/pac-man-all-stars-repack","https://archive.org/details/nba-live-2004-repack","https://archive.org/details/microsoft-train-simulator-repack","https://archive.org/details/microsoft-combat-flight-simulator-2-ww-ii-pacific-theater-repack","https://archive.org/details/manx-tt-super-bike-repack","https://archive.org/details/lotus-challenge-repack","https://archive.org/details/age-of-mythology-repack","https://archive.org/details/fear-repack","https://archive.org/details/dave-mirra-freestyle-bmx-repack","https://archive.org/details/cyber-troopers-virtual-on-repack","https://archive.org/details/crazy-taxi-repack-v-3","https://archive.org/details/colin-mc-rae-rally-04-repack","https://archive.org/details/blazing-angels-2-secret-missions-of-wwii-repack","https://archive.org/details/beetle-crazy-cup-repack","https://archive.org/details/atlanta-1996-repack","https://romhack.ing/database/content/entry/YtNv5JQBNs8FWu0C14As/secret-of-mana-english-translation","https://github.com/crowded-street/3sx","https://github.com/WistfulHopes/DBZ1","https://github.com/rexglue/reblue","https://github.com/HailToDodongo/pyrite64","https://romhackplaza.org/romhacks/streets-of-rage-2-andores-rampage-genesis/","https://www.youtube.com/watch?v=ucsGdmTjS2M","https://ralshi.itch.io/what-a-mario-world","https://github.com/mental-os/Aurora-OS.js","https://www.moddb.com/mods/fallout-vault-666/downloads/fallout-vault-666","https://drive.google.com/file/d/1vkpnS3YYhGw5A1ul4kxQtEmlkjEVhhDT/view","https://www.smwcentral.net/?p=viewthread&t=131870&page=1&pid=1661675","https://www.romhacking.net/hacks/9447/","https://community.pcgamingwiki.com/files/file/3924-star-wars-jedi-survivor-camera-and-animation-stutter-fix/","https://github.com/binary-knight/usurper-reborn","https://www.youtube.com/watch?v=Q959IdFo6_g","https://youtu.be/iEXDW2_4ffw?si=9zKyApbJwq75U0R1","https://www.romhacking.net/hacks/7002/","https://github.com/eonlynx/pokecrossroads","https://github.com/giraffekey/tetermino","https://archive.org/details/prize-fighter-heavyweight-edition-saturn","https://www.nexusmods.com/metalgearsolidvtpp/mods/2402","https://romhack.ing/database/content/entry/sHfHRZI6QEKlylE337Gnng/the-tairyou-jigoku-english-translation","https://keitaiarchive.org/","https://dnzh-fps.netlify.app/","https://www.nexusmods.com/newvegas/mods/96464","https://www.nexusmods.com/bloodborne/mods/462?tab=description","https://www.nexusmods.com/cyberpunk2077/mods/22745","https://elvies.itch.io/castlevania-order-of-shadows-gbc","https://www.nxoptimizer.com/","https://1fichier.com/?1dhd3mekh0837olx6yot","https://1fichier.com/?1viocrz3hdst8ly3owns","https://1fichier.com/?q5vvq6l5hs1pg82acj3g","https://1fichier.com/?hr37ifchtddf8khxdbsx","https://1fichier.com/?9o8go8y8d0tv9vbibal3","https://1fichier.com/?8w5n2wg4h902r260o6ek","https://1fichier.com/?mzlp40gh9oyna4h4dvd3","https://1fichier.com/?g4qsvikj1n17hicmob9g","https://www.ready.mp/","https://www.smwcentral.net/?p=viewthread&t=131734","https://github.com/celophi/lom-decomp","https://github.com/dreamingmoths/memory-of-alessa","https://github.com/jdperos/chrono-cross-decomp","https://github.com/bluisblu/cttr","https://github.com/Swiftshine/kdc","https://github.com/IWILLCRAFT-M0d/dogcomp","https://github.com/ChimpsAtSea/Reach","https://github.com/TeamOrre/xd-decomp","https://youtu.be/j2JTcDY9LI4?si=DJCiIOeU5CAbjZ4w","https://www.nexusmods.com/residentevilrequiem/mods/510?tab=description","https://discord.com/invite/XqQ6Je4muy","https://en83.itch.io/celeste-classic-for-sega-saturn","https://www.nexusmods.com/riseofthetombraider/mods/214?tab=description","https://cylonicboom.itch.io/friends-of-joanna","https://youtu.be/SEDNNMH2DSk?si=IZFkSKdYzYMq0YhK","https://github.com/jorio/Bugdom?tab=readme-ov-file","https://github.com/jorio/Bugdom2","https://github.com/jorio/BillyFrontier","https://github.com/jorio/MightyMike","https://github.com/jorio/Nanosaur","https://github.com/jorio/Nanosaur2","https://github.com/jorio/OttoMatic","https://dk-browser.tiiny.site/","https://docs.google.com/spreadsheets/d/e/2PACX-1vSV41AswEt3EpzSyd85YRVtoJaIIXWjtBy347dISJg4fs6xSNPqcgfsh76TxX_l-mnT7pjMlSqTW-87/pubhtml","https://www.romhacking.net/hacks/7597/","https://www.romhacking.net/hacks/9157/","https://www.nexusmods.com/starfield/mods/16155?tab=description","https://www.nexusmods.com/fallout4/mods/101772?tab=description","https://www.nexusmods.com/residentevilvillage/mods/643?tab=description","https://www.nexusmods.com/witcher3/mods/11934","https://store.steampowered.com/app/3825360/Zombie_Panic/","https://romhack.ing/database/content/entry/XJ5SNtjQSvK5-CLf2YUFeg/lupin-iii-the-sage-of-pyramid-english-translation","https://geon3.itch.io/buddies","https://github.com/flyngmt/ACGC-PC-Port","https://www.nexusmods.com/reddeadredemption2/mods/8332","https://youtu.be/b4pVjv1u8Hk?si=8rvPGGjV_NCF1J44","https://arnismc.com/","https://www.nexusmods.com/baldursgate3/mods/18315","https://gamebanana.com/mods/download/406291#FileInfo_875424","https://www.nexusmods.com/residentevilrequiem/mods/1017","https://github.com/GalvarinoDev/DeckOps","https://www.nexusmods.com/oblivionremastered/mods/5330","https://www.nexusmods.com/oblivionremastered/mods/5347","https://github.com/Dream-Atelier/kl-eod-decomp","https://github.com/openblack/bw1-decomp","https://github.com/tclamb/mhp2g-decomp","https://github.com/projectPiki/pik1wii","https://github.com/projectPiki/pik2wii","https://mehmetmhy.github.io/tetris/","https://www.nexusmods.com/crimsondesert/mods/47","https://github.com/RevoSucks/BM64Recomp","https://crypto137.github.io/MHServerEmu/blog/2026/03/20/mhserveremu-1-0-0.html","https://github.com/m-x-d/Heretic2R","https://www.moddb.com/mods/reenhance-re1/news/reenhance-re1-version-20-is-out","https://www.nexusmods.com/batmanarkhamorigins/mods/451?tab=description","https://github.com/FE8Dev/FE9-Decomp-Project","https://github.com/spacefarergames/AloneInTheDarkReHaunted","https://github.com/lace22l/sheep-wolf-n-dog-decomp","https://www.henrikomagnifico.com/wind-waker-4k","https://zeichigames.itch.io/friday-the-13th-revisited-for-gbc","https://romhack.ing/database/content/entry/CqaRmZaFQNS1JX1zpGFNSQ/blaze-and-blade-busters-english-translation","https://github.com/jype0/dw_decomp","https://github.com/zeldaret/st","https://github.com/Nintendocustom/Lego-City-Undercover-Decompilation","https://youtu.be/ciFdfj3D_NA?si=t3tWaHm_CB9mQGzY","https://www.nexusmods.com/newvegas/mods/97105","https://archive.org/details/40-winks-game-boy-color","https://teknoparrot.com/wiki/index.html","https://www.nexusmods.com/monsterhunterstories3twistedreflection/mods/131?tab=description","https://github.com/gcsmith/Pilotwings64Decomp","https://github.com/rexglue/rexglue-sdk?ref=readonlymemo.com","https://github.com/masterspike52/reNut?ref=readonlymemo.com","https://github.com/Mystixor?tab=overview&from=2026-03-01&to=2026-03-31","https://github.com/twist84/halo3_cache_release_recomp/?ref=readonlymemo.com","https://github.com/SolarCookies/TiP-Recomp?ref=readonlymemo.com","https://www.nexusmods.com/newvegas/mods/97155","https://danilolc.itch.io/pekka-kana-2","https://linux.tlk.fr/games/TecnoballZ/","http://www.irrgheist.com/games.htm","https://sourceforge.net/projects/allacrost/","https://github.com/ValyriaTear","https://github.com/gondur/tenmado","https://github.com/HurricanGame/Hurrican","https://secretchronicles.org/en/","https://blendogames.itch.io/gravitybone","https://github.com/enigma-game/enigma","https://sites.google.com/site/starflighttlc/downloads","https://github.com/SerVB/pph","https://github.com/santiontanon/transballgl","https://github.com/lksj/einstein-puzzle","https://gamejolt.com/games/surge-the-rabbit/747310","https://www.q3rally.com/","https://github.com/vittorioromeo/SSVOpenHexagon","https://ddamnation.com/","https://solaris.games/#/","https://naikari.github.io/","https://github.com/opensoldat/opensoldat","https://powdertoy.co.uk/","https://opendungeons.org/","https://github.com/tobspr-games/shapez.io","https://www.smspower.org/Homebrew/SuperMarioBrosSmsPort-SMS","https://github.com/demmis98/3s-psp","https://blackdemeter.com/adventure-on-eos","https://github.com/paavohuhtala/OpenWA","https://github.com/cflavio/yorg","http://www.scorched3d.co.uk/","https://www.vega-strike.org/","https://linleyh.itch.io/liberation-circuit","https://devcarpet.itch.io/deer-portal","https://github.com/juzzlin/DustRacing2D","https://thindil.itch.io/steam-sky","https://viewizard.com/","https://worldofpadman.net/en/","https://github.com/andwn/cave-story-md","https://youtu.be/eNtb8myubnI?si=iKcoY4kzkVWN64CK","https://decomp.dev/dreamingmoths/mirror-of-alessa","https://barcode-studia.ru/mods/silc/","https://www.nexusmods.com/starfield/mods/16354","https://www.asc-hq.org/","https://github.com/mgerhardy/caveexpress","https://andrettin.github.io/","https://btco.itch.io/shadow-over-the-twelve-lands","https://www.boswars.org/","https://retux-game.github.io/","https://github.com/libsdl-org/Maelstrom?tab=readme-ov-file","https://www.macintoshrepository.org/77329-sdl-scavenger","https://sdl-asylum.sourceforge.net/main.html","https://github.com/jorisvddonk/Noctis-IV-Plus","https://github.com/SwagSoftware/kisak-thug","https://github.com/hogsy/OniFoxed","https://github.com/M-HT/MagicalBroomExtreme","https://github.com/HoverRace/HoverRace?tab=readme-ov-file","https://github.com/codehard123/RoadFighter","https://github.com/ptitSeb/f1spirit","https://github.com/rombust/Methane","https://github.com/GardensOfKadesh/Homeworld","https://www.nexusmods.com/skyrimspecialedition/mods/176693?tab=description","https://github.com/ieee802dot11ac/fnv","https://github.com/verhoevenv/OpenNotrium","https://github.com/kugelrund/Elite-Reinforce","https://7kfans.com/","https://github.com/lethal-guitar/RigelEngine","https://github.com/TambourineReindeer/open-iw","https://freesynd.sourceforge.io/dl.php","https://github.com/jonof/jftekwar","https://github.com/gerstrong/Commander-Genius","https://github.com/dethrace-labs/dethrace","https://www.nexusmods.com/bioshock/mods/143?tab=description","https://www.nexusmods.com/skyrimspecialedition/mods/176402","https://github.com/amit221/compi","https://youtu.be/SLqWCiGk1rs?si=2RgrAJ9aWYtcT2M-","https://www.rinnegatamante.eu/vitadb/#/info/1384","https://www.rinnegatamante.eu/vitadb/#/info/1377","https://www.rinnegatamante.eu/vitadb/#/info/1276","https://www.rinnegatamante.eu/vitadb/#/info/1381","https://www.rinnegatamante.eu/vitadb/#/info/1357","https://www.rinnegatamante.eu/vitadb/#/info/1242","https://www.rinnegatamante.eu/vitadb/#/info/1367","https://www.rinnegatamante.eu/vitadb/#/info/1280","https://www.rinnegatamante.eu/vitadb/#/info/1215","https://www.rinnegatamante.eu/vitadb/#/info/1273","https://www.rinnegatamante.eu/vitadb/#/info/993","https://github.com/portforge/portforge-app","https://github.com/roengstrom/ff8-decomp","https://github.com/bigyoshi51/1080-decomp","https://github.com/Kuruyia/pokeranger2","https://github.com/ZhangZhuoSJTU/tiny-dec","https://www.rinnegatamante.eu/vitadb/#/info/1387","https://www.rinnegatamante.eu/vitadb/#/info/1388","https://www.rinnegatamante.eu/vitadb/#/info/1386","https://romhacking.com/hack/mario-s-modules-2","https://tomycase.itch.io/megaman-dxtreme","https://www.rinnegatamante.eu/vitadb/#/info/1390","https://pokehacking.com/fangames/light-platinum/","https://romhackplaza.org/translations/tiny-bullets-english-translation-playstation/","https://github.com/JRickey/BattleShip","https://github.com/RevoSucks/BMHeroRecomp","https://www.rinnegatamante.eu/vitadb/#/info/1393","https://trcustoms.org/levels/3883","https://github.com/999sian/tmc","https://librelancer.net/","https://www.nexusmods.com/residentevilrequiem/mods/1976","https://nictuber.itch.io/paper-mario-star-nova","https://github.com/GabeRealB/parasite-eve-2-decomp","https://github.com/ShaffySwitcher/wariowareinc","https://turtlekiosk.github.io/slider/","https://flarerpg.org/2026/05/03/flare-1-15/","https://github.com/DerekPascarella/TriggerheartExelica-EnglishPatchDreamcast","https://twilitrealm.dev/","https://github.com/marijnvdwerf/paperboy-n64","https://github.com/mkst/esa","https://github.com/wonst719/u5d","https://github.com/lhsazevedo/tbg-decomp","https://cdromance.org/ps2-iso/armored-trooper-votoms-english-patched/","https://cdromance.org/ps2-iso/racing-battle-c1-grand-prix-japan/","https://gamebanana.com/mods/676609","https://www.pokecommunity.com/threads/unity-engine-3ds-pok%C3%A9mon-snap-3ds-new-nintendo-3ds-esp-eng-it-fr-pt-de-jap-beta-v0-3-1.542188/#post-10987188","https://github.com/wanszai/Ace-Driver-Collection-X360-Releases","https://youtu.be/OlHIwUhjvnM?si=OREN0jkPBm5OXQvC","https://github.com/yancharkin/SpelunkyClassicHD","https://www.nexusmods.com/starfield/mods/16954?tab=description","https://github.com/TheMrIron2/sf64-psp","https://www.rinnegatamante.eu/vitadb/#/info/1056","https://www.rinnegatamante.eu/vitadb/#/info/877","https://github.com/DerekPascarella/UniversalDreamcastPatcher","https://archive.org/details/r.-c.-pro-am","https://goopie.xyz/","https://github.com/birabittoh/KameoRePowered","https://github.com/MaxDeadBear/Re-Cherry","https://github.com/MaxDeadBear/NaughtyBear_ReStuff","https://github.com/masterspike52/redahm","https://github.com/spacefarergames/EcstaticaRecompiled","https://github.com/mstan/nesrecomp","https://richterwilker.itch.io/castlevania-gospel-of-belmont","https://richterwilker.itch.io/animal-forest-gb-folk","https://fjpolo.itch.io/blasnesmous","https://github.com/regratka/mkp","https://www.rinnegatamante.eu/vitadb/#/info/459","https://github.com/ran-j/PS2Recomp","https://www.romhacking.net/hacks/8939/","https://gamejolt.com/games/fnaf3wii/1071424","https://quetoo.org/news/quetoo-is-here/","https://patcher.aki.guide/revse.html","https://www.moddb.com/mods/gta-carcer-city","https://www.gta5-mods.com/scripts/squid-game-mod","https://www.saintsrowmods.com/forum/threads/sr2-pc-dlc.24993/","https://github.com/TechnicallyComputers/BattleShip/releases/tag/Netplay-Alpha-1","https://romhack.ing/database/content/entry/8ffEsSDoTrabAI5gVzclNg/real-robots-final-attack-english-translation","https://astromuseum.org/sonicZone/sonicmods/sonicadvance3","https://github.com/HollywoodAkeem/SVR07-Recomp","https://github.com/SMCGames/Paper-Mario-ReCut","https://www.romhacking.net/hacks/9694/","https://github.com/mstan/snesrecomp","https://github.com/mstan/SuperMarioWorldRecomp","https://github.com/mstan/ZeldaAlttPSNESRecomp","https://github.com/mstan/MegaManXSNESRecomp","https://github.com/DanZC/suiCune","https://github.com/oneup03/BanjoRecomp3D/releases","https://github.com/oneup03/perfect_dark_3D/releases","https://cdromance.org/ps2-iso/sega-ages-2500-series-vol-17-phantasy-star-generation2-english-patched/","https://github.com/Subarasheese/daytona-xbla-recomp/","https://www.nexusmods.com/morrowind/mods/59081","https://github.com/portingpete/skate3-recomp","https://github.com/mchughalex/skate3recomp","https://github.com/Graine25/reodyssey","https://github.com/DohmBoy64Bit/TheOutFit","https://github.com/testdriveupgrade/TDURE","https://github.com/ihatecompvir/band3_recomp","https://github.com/birabittoh/EternalSonataReprise","https://github.com/fliperama86/cvlod_recomp","https://www.rinnegatamante.eu/vitadb/#/info/1399","https://www.rinnegatamante.eu/vitadb/#/info/1402","https://www.rinnegatamante.eu/vitadb/#/info/1409","https://www.rinnegatamante.eu/vitadb/#/info/1410","https://www.nexusmods.com/marvelsspiderman2/mods/1993?tab=description","https://github.com/flafmg/RecompOne","https://romhack.ing/database/content/entry/ecw_olT_SyWuzHzrJz_tPg/soul-blazer-relocalization","https://romhack.ing/database/content/entry/iiKVVaitQxSE0Lfm2I0Xkw/rushing-beate-shura-the-eternal-conflict-english-translation","https://www.patreon.com/posts/160555525","https://dusklight.pages.dev/","https://github.com/mstan/PokemonStadiumRecomp","https://github.com/SunJaycy/GoldenEye-Recomp","https://github.com/MinusBros/downbadeditionsource/releases","https://github.com/Dax-Dot/SNES-Cheat-Patcher-Studio","https://github.com/SlickAmogus/silent-hill-decomp","https://github.com/TobiasFriedly/sm64-nds","https://ebbr.neocities.org/downloads","https://github.com/laqieer/fireemblem8j","https://github.com/AARosson48/rogue-leader-decomp","https://github.com/HaydnTrigg/Homeworld2Classic","https://drive.google.com/drive/folders/11Mq1f8bDg_ZH8Z9DtjH5dC1-cCsP8ycZ","https://hiddenpalace.org/Ironclad_(Dec_16,_2008_prototype)","https://www.nexusmods.com/residentevil42023/mods/6539?tab=description","https://www.rinnegatamante.eu/vitadb/#/info/1415","https://www.rinnegatamante.eu/vitadb/#/info/1413","https://archive.org/details/colin-mcrae-rally-2.0-repack","https://archive.org/details/colin-mcrae-rally-repack?","https://github.com/cdlewis/snowboardkids-decomp","https://github.com/LucasPicoli/god-hand-decomp","https://archive.org/details/wwe-2k16","https://archive.org/details/wwe-2k17","https://archive.org/details/wwe-2k18","https://archive.org/details/wwe-2k19","https://archive.org/details/wwe-2k20","https://archive.org/details/wwe-2k22_202603","https://archive.org/details/wwe-2k23","https://archive.org/details/starship-troopers-terran-ascendancy","https://archive.org/details/ghostbusters-the-video-game_202603","https://archive.org/details/dexter-the-game.-7z_202603","https://archive.org/details/house-m.-d.-7z","https://archive.org/details/mechcommander-gold","https://archive.org/details/mechcommander-2","https://archive.org/details/onimusha-3-demon-siege_202603","https://archive.org/details/forza-horizon-4_20260322","https://archive.org/details/colin-mcrae-dirt_202603","https://archive.org/details/ghost-recon-advanced-warfighter_202603","https://archive.org/details/ghost-recon-advanced-warfighter-2","https://archive.org/details/star-trek_202603","https://archive.org/details/the-lord-of-the-rings-war-of-the-ring_202603","https://archive.org/details/peaky-blinders-mastermind","https://archive.org/details/tony-hawks-pro-skater-2_202604","https://archive.org/details/tony-hawks-pro-skater-3_202604","https://archive.org/details/tony-hawks-underground","https://archive.org/details/tony-hawks-underground-2_202604","https://archive.org/details/tony-hawks-pro-skater-hd_202604","https://archive.org/details/grand-theft-auto-2_202604","https://archive.org/details/mlb-2-k-9","https://archive.org/details/mlb-2k10","https://archive.org/details/mlb-2k11","https://archive.org/details/prison-break_202604","https://archive.org/details/tonic-trouble.-7z","https://archive.org/details/the-neverhood_202604","https://archive.org/details/disneys-g-force","https://archive.org/details/sheep-dog-n-wolf-repack","https://archive.org/details/csi-3-dimensions-of-murder-repack","https://archive.org/details/star-trek-legacy-repack","https://archive.org/details/lost-via-domus-repack","https://archive.org/details/nba-playgrounds-repack","https://archive.org/details/nba-2k-playgrounds-2-repack","https://archive.org/details/deep-black-reloaded-repack","https://archive.org/details/cabelas-dangerous-hunts-2013-repack","https://archive.org/details/pirates-of-the-caribbean-at-worlds-end-repack","https://archive.org/details/friday-the-13th-killer-puzzle-repack","https://archive.org/details/lego-2k-drive-repack","https://archive.org/details/madden-nfl-08_20260525","https://archive.org/details/fuser-repack","https://archive.org/details/x2-wolverines-revenge-repack","https://archive.org/details/pro-evolution-soccer-2014-repack","https://archive.org/details/pro-evolution-soccer-2015-repack","https://archive.org/details/pro-evolution-soccer-2016-repack","https://archive.org/details/pro-evolution-soccer-2017-repack","https://archive.org/details/pro-evolution-soccer-2018-repack","https://archive.org/details/pro-evolution-soccer-2019-repack","https://archive.org/details/e-football-pes-2020-repack","https://archive.org/details/e-football-pes-2021-repack","https://github.com/AurelioB/BanjoRecomp-Android/releases","https://github.com/Pixelplix93/Alundra-Definitive-Edition","https://github.com/GhaleonX/Ys","https://github.com/LittleBitUA/DPRecomp","https://github.com/LittleBitUA/DownpourRecomp","https://github.com/cdlewis/snowboardkids2-recomp/releases/tag/v1.0.5","https://github.com/CTR-tools/ctr-native/releases","https://github.com/ExpansionPak/DolRecomp","https://www.youtube.com/watch?v=LIvRGQ0mZB8","https://github.com/themuffinator/OpenPREY","https://github.com/roborich/Shipwright/releases/tag/v0.3-cel-shade","https://www.rinnegatamante.eu/vitadb/#/info/1420","https://github.com/eboody/Castlevania-ReVamped-Open-Source-Edition/releases","https://github.com/sp00nznet/ps3recomp","https://www.dreamcast-talk.com/forum/viewtopic.php?t=19255&__cf_chl_rt_tk=YJ0o21txXUMYJtgIvVfTSG_hjnIMcIAKErnX7wQTYI8-1782419778-1.0.1.1-vsZKSi9MQisA6rmf0lb5RARZJcGT02X2VJkBBqGOxV4","https://github.com/HarvestMoon64Recomp/HarvestMoon64Recomp","https://www.rinnegatamante.eu/vitadb/#/info/1425","https://www.rinnegatamante.eu/vitadb/#/info/1421","https://archive.org/download/ResistanceOnline","https://archive.org/details/damnation-repack","https://archive.org/details/lego-star-wars-repack","https://archive.org/details/lego-star-wars-ii-repack","https://archive.org/details/horizon-chase-turbo-repack","https://github.com/sal063/AC6_recomp","https://archive.org/details/Resistance2-RPCS3","https://github.com/SirDiabo/GithubLauncher","https://github.com/birabittoh/NocturneRecomp","https://github.com/FluffyQuack/rexglue-MetalSlugXX","https://github.com/Alex-LeTux/perfect_dark_VR/releases","https://thunderstore.io/c/harvest-moon-64-recompiled/","https://github.com/Boron853/Souls-of-the-Reaper/releases/tag/beta-1.2","https://github.com/Yokimitsuro/khdays-decomp","https://github.com/ivanno4317/dw4-gc","https://steamcommunity.com/sharedfiles/filedetails/?id=3663541185","https://github.com/mstan/MegaManX6Recomp","https://discovery.onl/Grix/a1ac11ed-e635-4c5f-959e-2716d6c3fdd0","https://github.com/mstan/TombaRecomp","https://github.com/jessetbh/WCWvsNWOWorldTourRecomp","https://libertycity.net/files/gta-3/191140-liberty-extended-october-2025-update.html","https://libertycity.net/files/gta-vice-city/167639-vice-extended-october-2025-update.html","https://github.com/mstan/MegaManX4Recomp","https://github.com/wanszai/Virtua-Racing---XBOXONE-Windows","https://github.com/wanszai/Virtua-Fighter---XboxOne-Windows","https://romhack.ing/database/content/entry/gNAq0phlTYqaYSpT_kY1XQ/zool-majy-charmer-legend-english-translation","https://github.com/ExpansionPak/ModernGekko-Template","https://github.com/linkzenic/Zelda64Recomp-Android","https://github.com/2Tie/mh1j","https://github.com/vonhoff/lemball-decomp","https://github.com/GoldieLeGenie/DQIV-DECOMP","https://github.com/denzi-gh/crashwoc-decomp-ps2","https://github.com/Fuuzetsu/tenchu-decomp","https://www.rinnegatamante.eu/vitadb/#/info/1431","https://www.rinnegatamante.eu/vitadb/#/info/1433","https://www.moddb.com/mods/gears-of-war-2-hollow/downloads/gears-of-war-2-hollow-launcher","https://github.com/ThiagoLira/trouble-makers-pc-recomp","https://github.com/Rainchus/ChameleonTwist1-JP-Recomp","https://github.com/jessetbh/WWFWrestleMania2000Recomp","https://github.com/jessetbh/WCWnWoRevengeRecomp","https://github.com/jessetbh/WWFNoMercyRecomp","https://github.com/jessetbh/VPW64Recomp","https://github.com/jessetbh/AkiLauncher","https://archive.org/details/INFAMOUS1RPCS3","https://transfer.it/t/4GqbvrpB2DCI","https://archive.org/details/MOTORSTORMPACIFICRIFTRPCS3","https://transfer.it/t/sv5gYVknSZia","https://transfer.it/t/AnylMJ1XXTKa","https://github.com/eandis/SDOJ-Recomp","https://github.com/Day-OS/green-vita","https://github.com/bryanthaboi/pokemon-gen1-recomp-project","https://github.com/ExpansionPak/ModernGekko/releases/tag/kirby","https://github.com/guimaraf/3sxw","https://archive.org/details/heavenly-sword-rpcs-3","https://gofile.io/d/pxeLJ3","https://archive.org/details/TOKYOJUNGLERPCS3","https://archive.org/details/folklore_rpcs3","https://pepsiman.ol.mr/","https://github.com/wanszai/Sega-Rally-Championship-PC-Xbox360-Series-X-/releases/tag/1.0.0","https://github.com/Tokatta007/Starcraft-64-Co-Op-Mod","https://gamejolt.com/games/UnderMobile/1086330","https://agtteam.net/fma/","https://vl.mr/","https://github.com/tgeorgiadis/quiver","https://github.com/Matteo842/CrashBandicoot-Launcher/releases","https://github.com/joaorb64/smashremix-plus-extra/releases/tag/0.5.0","https://archive.org/details/saw_20251012","https://archive.org/details/crazy-taxi-3_202601","https://archive.org/details/spider-man-friend-or-foe-repack","https://archive.org/details/halo-2-repack","https://archive.org/details/resident-evil-dead-aim_20260610","https://github.com/YesterMester/TheSimpsonsGameRecomp","https://archive.org/details/hollow-knight-android","https://github.com/ManIsCat2/sm64coopdx/releases/tag/Av1.5.1","https://github.com/diasurgical/DevilutionX","https://github.com/Waterdish/Shipwright-Android","https://drive.google.com/file/d/1x6tEy9skIO84Xu8QYPCkg9APf4qJ_4yw/view","https://drive.google.com/drive/u/0/folders/1T33HnJ7Q6oKTEoOngEO7HaYKvC9O2Vdl","http://opentouchgaming.com/delta-touch/","http://opentouchgaming.com/zeta-touch/","https://vcmi.eu/","http://opentouchgaming.com/quad-touch/","http://opentouchgaming.com/alpha-touch/","https://gitlab.com/duron27/alpha3","https://github.com/SansNope/UnleashedRecomp-Android","https://github.com/mariopartyrd/marioparty4","https://github.com/GabeConway/OpenCrossing-Anbernic/releases","http://opentouchgaming.com/sigma-touch/","https://github.com/JRickey/BattleShip/releases","https://github.com/Carlox33/The-Simpsons-Hit-and-Run-Android/releases","https://github.com/izzy2lost/perfect_dark/releases/tag/1.0","https://github.com/bryanthaboi/gen1recomp","https://github.com/DramaticShape/DramaticShapeVoxelMod/releases","https://github.com/bryanthaboi/gen1recomp","https://github.com/DramaticShape/DramaticShapeVoxelMod/releases","https://github.com/samyost1/tmc-android/releases","https://archive.org/details/links-awakening-dx-hd-v-1.7.0-windows-direct-x.-7z","https://github.com/get-starboard/starboard","https://github.com/ImranR98/Obtainium","https://github.com/Blade-Punisher/SwitchNOW","https://archive.org/download/am-2-rlauncher-2.2.0-win-android/","https://archive.org/details/gt-2_20260509","https://archive.org/details/forza-horizon","https://archive.org/details/fh-2_20260510","https://archive.org/details/fm-3_20260510","https://archive.org/details/fm-4_20260510","https://archive.org/details/dirge-of-cerberus-final-fantasy-vii","https://archive.org/details/midnight-club-la-complete-edition","https://archive.org/details/gears-of-war-2_202605","https://archive.org/details/vigilante-8-arcade","https://archive.org/details/gears-of-war-3.7z","https://archive.org/details/gun.-7z","https://archive.org/details/midnight-club-3-dub-edition-remix.-7z","https://archive.org/details/pirates-of-the-caribbean-at-worlds-end.-7z","https://archive.org/details/gear-of-war-judgment-brasil.-7z","https://archive.org/details/fist-of-the-north-star-kens-rage-2.7z","https://archive.org/details/fist-of-the-north-star-kens-rage.-7z","https://archive.org/details/naruto-the-broken-bond.-7z","https://archive.org/details/naruto-rise-of-a-ninja.-7z","https://archive.org/details/dragon-ball-z-ultimate-tenkaichi.-7z","https://archive.org/details/dragon-ball-raging-blast-2.7z","https://archive.org/details/dragon-ball-raging-blast.-7z","https://archive.org/details/dragon-ball-z-burst-limit.-7z","https://archive.org/details/re-code-veronica-x","https://archive.org/details/fable-ii_20260615","https://archive.org/details/sly-collection","https://archive.org/details/sly-4_202607","https://archive.org/details/drakengard-1-2","https://archive.org/details/ico_20260704","https://archive.org/details/ninja-gaiden-2","https://archive.org/details/drakengard-3_202607","https://archive.org/details/fatal-frame-trilogy_202607","https://archive.org/details/splatterhouse_202607","https://archive.org/details/haunting-ground_202607","https://archive.org/details/captain-america-super-soldier_202607","https://archive.org/details/dantes-inferno_20260727","https://archive.org/details/gravity-rush_202607","https://archive.org/details/2010-fifa-world-cup-south-africa_202607","https://archive.org/details/asuras-wrath_20260727","https://archive.org/details/gravity-rush-2","https://archive.org/details/lost-odyssey_202607","https://archive.org/details/blue-dragon_202607","https://github.com/udarmolota/RimDroid","https://github.com/alondero/automobililamborghini-recomp/releases/tag/v0.5.0","https://www.nexusmods.com/halocampaignevolved/mods/53","https://www.romhacking.net/translations/7660/","https://www.mediafire.com/file/j1hc0cg224ghiky/Golden_Balloon_1.0_%25281%2529.apk/file","https://github.com/Madxbio97/SF-pc-port","https://github.com/teknogods/TeknoParrotUI/releases/tag/TeknoParrotUI-android","https://github.com/rockenrooster/Smash64DS_Port","https://archive.org/details/croc64-1.3.0-setup","https://mmr.quarkrobot.com/","https://rohit.itch.io/dominatrix","https://aperture-software.github.io/colditz-escape/","https://cxong.github.io/cdogs-sdl/","https://github.com/EstebanPdN/zelda-alttp-3ds","https://github.com/Waterdish/zelda3-android","https://github.com/Simon358/ctr-native-android/releases","https://dos.zone/offline/warcraft-ii-android/","https://dos.zone/offline/dune-2-android/","https://github.com/fwgs/xash3d-fwgs","https://github.com/jeffory/GoldenEye-Recomp/releases","https://github.com/akratch/golden-balloon","https://github.com/glKarin/com.n0n3m4.diii4a","https://github.com/HarbourMasters/Lighthouse/releases/tag/1.0.0","https://arumoon.github.io/source-engine-download/","https://github.com/OpenRCT2/OpenRCT2/releases","https://github.com/pelya/openttd-android/releases","https://github.com/alanwoolley/CorsixTH-Android/releases","https://github.com/XProger/OpenLara","https://github.com/udarmolota/zomdroid/releases","https://github.com/RohanBhattacharyya/oSBM/releases","https://gamejolt.com/games/Supermariomakerapk/704972","https://github.com/Velaron/cs16-client","https://unturned.en.uptodown.com/android","https://gamenative.app/","https://f-droid.org/en/packages/net.warsmash.phone/","https://github.com/alexbatalov/fallout1-ce/releases/tag/v1.1.0","https://github.com/alexbatalov/fallout2-ce/releases/tag/v1.3.0","https://github.com/Vwing/daggerfall-unity-android","https://github.com/sandstranger/com.mobilerpgpack.phone","https://www.mobygames.com/game/23431/holotzs-castle/","https://github.com/shinyquagsire23/OpenJKDF2","https://github.com/sfalexrog/openxcom-android","https://exult.sourceforge.io/","https://obfusk.gitlab.io/jekyll-fdroid/packages/com.arxlibertatis/","https://ja2-stracciatella.github.io/download/","https://github.com/bvschaik/julius/releases/tag/v1.8.0","https://github.com/Keriew/augustus/releases/tag/v4.0.0","https://github.com/zielmicha/freeciv-android","https://github.com/cybervisi0n/pokeplatinum","https://files.workbench.network/srceng/TF2RC%20(TF2L)/","https://rexuiz.itch.io/rexuiz-fps","https://github.com/mircowuffwuff/super-mario-bros.-remastered-android/releases","https://ksylvestre.itch.io/space-cadet-pinball","https://play.google.com/store/apps/details?id=com.zenstudios.ZenPinballWorld&hl=en_US","https://github.com/bitten2up/SRB2-Android/releases","https://www.mediafire.com/folder/kbbg5zosc7v9j/ChewAPKbackup","https://github.com/imjustadudegamer/VoyagerSP-Android","https://github.com/imjustadudegamer/VoyagerHM-Android","https://play.google.com/store/apps/details?id=de.fpsclasico.sdlioq3a&hl=en_IN","https://gamejolt.com/games/sonicmaniaplusports/892889","https://gamejolt.com/games/Sonic1ForeverAndroid/817792","https://gamejolt.com/games/gamejolt1234/955225","https://gamejolt.com/games/RestoredCDAndroid/1086519","https://www.reddit.com/r/AynThor/s/JlKfJ41tDC","https://github.com/izzy2lost/SpaghettiKart/releases/tag/v1.0.0","https://github.com/izzy2lost/Starship/releases/tag/v1.0.3","https://github.com/izzy2lost/Ghostship/releases/tag/1.0.1","https://easyrpg.org/player/downloads/","https://codeberg.org/cowomaly/pizzalegacy","https://github.com/BlackLabelHQ/SymphonyRecomp","https://bocasretrostuff.itch.io/robocop-md","https://transfer.it/t/fR1Ii9oFRBgY","https://archive.org/details/wipeout-hd-rpcs3","https://transfer.it/t/B9VUf1hxGLAY","https://transfer.it/t/AvPCovlnwJpa","https://transfer.it/t/cTfVUEwhELjR","https://transfer.it/t/KnnoEQh30ZxQ","https://archive.org/details/spider-man-3-repack","https://transfer.it/t/XQwOnn5TmBya","https://transfer.it/t/KuTvpZsBlDzC","https://transfer.it/t/zhB2zuoVhRQR","https://archive.org/details/rpcs-3-latest-mod-nation-racers-online","https://archive.org/details/DemonsSoulsRPCS3","https://transfer.it/t/RMgcNyhBmJwa","https://gofile.io/d/SN3T1I","https://transfer.it/t/lMaFbPg1TBRD","https://gofile.io/d/MmVHsU","https://transfer.it/t/UkkS9qsBXLrR","https://store.steampowered.com/app/2195910/Darkenstein_3D/","https://github.com/HalmyLyseas/VandalHearts-PcPort","https://www.mobileuo.com/","https://pokeeverworldonline.com/","https://github.com/daniele-rapagnani/alephone-android","https://www.faforever.com/","https://rainbowdevs.com/title/brown-3d/","https://github.com/igawa6/HarvestMoon64Recomp/releases/","https://github.com/TwilitRealm/dusklight/releases","https://gamejolt.com/games/sonictripletrouble16bit/322794","https://github.com/psxrestore/Condemned2Recomp","https://undreamedpanic.itch.io/gamma-emerald#download","https://github.com/bigbanana23/london-seirei-tanteidan","https://transfer.it/t/mtvSiTgXDbQK","https://github.com/Alexbeav/syphon-filter-2-recompiled/releases/tag/v0.1.1-alpha","https://github.com/am2r-android/AM2R-Autopatcher-Android","https://github.com/PalindromicBreadLoaf/Docklight","https://www.gamebrew.org/wiki/Doom64EX_Switch","https://github.com/fgsfdsfgs/sm64ex","https://github.com/YoshiCrystal9/2ship2harkinian-Switch","https://github.com/HarbourMasters/2ship2harkinian-WiiU","https://github.com/TheMrIron2/sf64-psp","https://github.com/z2442/perfect_dark-PSP","https://github.com/mindfreakdev/sm64-ps4-osirizx","https://archive.org/details/perfectdark3ds","https://github.com/mkst/sm64-port/tree/3ds-port","https://github.com/Hydr8gon/sm64","https://github.com/RaYRoD-TV/BanjoKazooie-VR","https://github.com/RaYRoD-TV/sm64coopdx-vr","https://github.com/RaYRoD-TV/MarioKart64-VR","https://github.com/RaYRoD-TV/StarFox64-VR","https://github.com/RaYRoD-TV/SRB2-VR","https://github.com/RaYRoD-TV/RingRacers-VR","https://github.com/Team-Beef-Studios/Lambda1VR","https://github.com/Team-Beef-Studios/QuakeQuest","https://github.com/Team-Beef-Studios/Quake2Quest","https://github.com/Team-Beef-Studios/Doom3Quest","https://github.com/Team-Beef-Studios/RTCWQuest","https://github.com/Team-Beef-Studios/JKXR","https://github.com/Team-Beef-Studios/JKXR","https://github.com/Team-Beef-Studios/BeefRaiderXR","https://sidequestvr.com/app/23478/prey-vr","https://github.com/Team-Beef-Studios/RazeXR","https://github.com/Team-Beef-Studios/QuestZDoom?utm_source=chatgpt.com","https://youtu.be/VgvFT43zUYI?si=y7qVvSA_xKXbZ4kd","https://github.com/ShinyWindow/Shipwright-VR","https://4cydestudios.com/game/sega-vs-capcom","https://archive.org/details/infinity-blade-android","https://eeveeexpo.com/threads/9603/","https://eeveeexpo.com/threads/9603/","https://github.com/Kaisaan/wanderers/releases/tag/v1.0","https://github.com/Kaisaan/lostkefin","https://messenger.abeto.co/","https://dk-browser.tiiny.site/?utm_source=chatgpt.com","https://dusklight.pages.dev/","https://morrowind.virtastic.app/","https://hl2.slqnt.dev/","https://yikes.pw/portal/","https://d07riv.github.io/diabloweb/","https://ksylvestre.itch.io/space-cadet-pinball","https://phoboslab.org/wipegame/","https://raz0red.github.io/webprboom/","https://wasm.continuation-labs.com/d3demo/","https://qwasm.m-h.org.uk/","https://qwasm2.m-h.org.uk/","https://wasm.continuation-labs.com/arxdemo/","https://gardens-of-kadesh.gitlab.io/gardens-of-kadesh/","https://midzer.de/wasm/cavestory/","https://www.jamesfmackenzie.com/chocolatekeen/","https://midzer.de/wasm/cromagrally/","https://midzer.de/wasm/descent1/","https://midzer.de/wasm/duke3d/","https://fallout-nevada.ru/#/en","https://midzer.de/wasm/heroes2/","https://princejs.com/","https://midzer.de/wasm/opentyrian/","http://xproger.info/projects/OpenLara/","https://monkeyball-online.pages.dev/","https://mehmetmhy.github.io/tetris/","https://mirtilowgames.itch.io/the-last-of-us-demastered","https://www.nexusmods.com/cyberpunk2077/mods/30093","https://github.com/jplakon/CallOfDuty4_VR/releases","https://github.com/mohamad-balouza/bioshock-vr","https://www.nexusmods.com/skyrimspecialedition/mods/107333","https://www.nexusmods.com/residentevilrequiem/mods/1017?tab=videos","https://github.com/jbusfield/SH2_UEVR/releases/tag/v1.0.0","https://github.com/birabittoh/EternalSonataReprise","https://github.com/eugene373/COD-BOZ-Partially-Decompiled/releases/tag/v0.3-s3e-tools","https://drive.google.com/file/d/1bvBYmbFtw1q-0lG1tKivm3c610-pCS4P/view","https://github.com/Crementif/BotW-BetterVR","https://generals.wasm.com.br/","https://www.moddb.com/mods/doom-ii-for-doom-3","https://web.zquestclassic.com/play/","https://demensdeum.com/demos/SurrealEngine/","https://github.com/Zorkats/G-Diffuser","https://github.com/ThatGuyMcd/DKR-R","https://github.com/praydog/FEAR2VR","https://store.steampowered.com/app/4505440/Asobi_Remote_Play/","https://ut99vr.pages.dev/","https://tangos.dev/downloads","https://github.com/Player124413/MarathonRecomp_android-test-edition/releases","https://github.com/bryanthaboi/gen1recomp","https://github.com/bryanthaboi/gen1recomp","https://github.com/JayBiggsGMG/BFVR-Battlefield-1942-VR-Mod/releases/tag/v1.0.0","https://github.com/sal063/AC6_recomp","https://www.reddit.com/r/Metroid/s/23ukkKGon4","https://www.romhacking.net/hacks/9882/","https://openpete.com/","https://github.com/TechnicallyComputers/TwistedMetal4Recomp","https://github.com/EstebanPdN/zelda-tmc-3ds","https://github.com/RaYRoD-TV/MVRH","https://liquafusion.itch.io/untitled-sonic-fangame","https://github.com/EstebanPdN/mario-kart-64-3ds","https://github.com/TechnicallyComputers/Street-Fighter-Alpha-3-Recomp","https://github.com/MetalSyntax/zenonia3-psvita-port","https://github.com/Matteo842/CrashBandicoot-Launcher/releases","https://github.com/marcocastignoli/wow-mobile","https://github.com/sal063/Ace-Combat-X-Recompilation","https://github.com/jessicanataliagta/PSPRecomp/tree/main/profiles/vcs","https://github.com/ExxistanceDC/Tama-English-Translation","https://github.com/ExxistanceDC/Hissatsu-English-Translation","https://youtu.be/oY_3Uvyjy_k?si=xjiXCeK6Tx15zW20","https://github.com/wanszai/Ridge-Racer-Collection","https://trackeditor.goodhouseinc.com/","https://www.rinnegatamante.eu/vitadb/#/info/1454","https://apkvision.org/games/action/hollow-knight-silksong-130787/","https://gamejolt.com/games/jzelda_woohoo/1043660","https://gamejolt.com/games/outertale/643082","https://gamejolt.com/games/frickbears3/930477","https://gamejolt.com/games/frickbears3/930477","https://undreamedpanic.itch.io/gamma-emerald-ea","https://www.nexusmods.com/prey2017/mods/218?tab=description","https://github.com/sergiomanzur/SymphonyRecomp/releases/tag/android-v0.9b","https://www.moddb.com/mods/random-eye-the-true-randomizer","https://www.patreon.com/dhalcyon/posts/nowhere-to-hide-165840706","https://mine64.c0di.com/","https://github.com/JamesIV4/sim-copter-remake","https://github.com/JoeyAW/dusklight-vr/releases/","https://github.com/khasinski/rage-racer-pc","https://pdod.dev/","https://github.com/mstan/MetroidPrimeHuntersRecomp","https://github.com/mstan/DragonBallZBuusFuryRecomp","https://chonkbase.net/chonkcraft/","https://github.com/updeshxp/SF3TSOEReborn","https://github.com/GABRIELNNK/ReChan","https://github.com/GABRIELNNK/ReChan/releases/tag/ReChan_v1.0.2-beta_Steamdeck","https://taleoftwowastelands.com/","https://wamwoowam.co.uk/sonic4/","https://sonic-the-hedgehog.en.uptodown.com/android","https://sonic-the-hedgehog-2-classic.en.uptodown.com/android","https://github.com/izzy2lost/Lighthouse/releases/tag/1.0.2","https://www.rinnegatamante.eu/vitadb/#/info/1468","https://github.com/theokyr/Project8Recomp","https://mmxregenesis.itch.io/mega-man-x-regenesis","https://github.com/dubrovskiy-yevhen-stakelogic/vice-city-vr-quest/tree/master","https://github.com/LeZergan/mcsm-vita","https://github.com/RaYRoD-TV/MVRH","https://retrohackers.net/hack-details.php?id=5243","https://re4vr.com/","https://github.com/GTTeancum/OpenJKDF2ogx","https://github.com/Unchiga/YuGiOhForbiddenMemoriesRecomp","https://rickygdev.itch.io/dontforget","https://rickygdev.itch.io/dontforget","https://gamejolt.com/games/ribbitmod/671888","https://gamejolt.com/games/KBB/578480","https://mm8bdm.net/home","https://off.fandom.com/wiki/Downloads#Version_3.0_Downloads","https://webciv.org/webclient/?action=new&type=singleplayer&utm","https://dune2js.com/","https://transmutrix.itch.io/kiki-the-nanobot","https://mors-games.itch.io/moon-child-fe","https://pep.itch.io/undertale-2","https://interdream.teamcinnabun.com/other/","https://github.com/Buku313/Skate3-Mobile","https://www.moddb.com/games/castlevania-mx","https://github.com/beatrixzy/PGR4-Recomp","https://www.romhacking.net/forum/index.php?topic=34365.msg443220#msg443220","https://www.romhacking.net/forum/index.php?topic=34365.msg426869#msg426869","https://createam.itch.io/sclerosis","https://createam.itch.io/antumbra","https://revc.wasm.ltd/","https://github.com/NeuralF/Rea-Virtua-Cop-2-VR","https://github.com/TheRumble/OpenXCOM-3DS","https://cnc3dgame.com/","https://github.com/TechnicallyComputers/MastersOfTerasKasiRecomp","https://github.com/TechnicallyComputers/Rampage---Through-Time-Recomp","https://github.com/raposomiguel50/system-shock-android","https://github.com/CactusVRStudios/alpinefactionVR","https://romhackplaza.org/translations/rpg-maker-ds-create-the-new-world-english-translation-nintendo-ds","https://github.com/jakobkhansen/SilksongAndroid","https://github.com/jlrouzies-fr/doom64-rt","https://github.com/novapowers0/BloodyRoar2Recomp","https://terraria.mercurywork.shop/","https://celeste.r58playz.dev/"],"s":["advance-wars-returns","age-of-the-ring","alleys-of-anime-2","all-hell-unleashed","altered-beast-remake","am2r","amc-squad","awful-emblem","banjo-kazooie-nostalgia-64","banjo-kazooie-the-corrupted-jiggys","banjo-kazooie-the-lair-witch-project","barkley-gaiden-the-son-of-dark-draker","barkley-shut-up-and-jam-gaiden","battle-stormer-classics","bit-of-war-god-of-war-demake","blaster-master-snes-port","blink-182-n64","bloodborne-psx-demake","bound-to-the-dark-world","bubble-bobble-c64-remastered","capcom-vs-square-parallel-destinies","capoeira-fighter-3-legacy-edition","captain-america-and-the-avengers-remake","card-miner","castlemania-2","castlevania-aga","castlevania-alternate-scarlet-symphony","castlevania-chronicles-ii-simon-s-quest","castlevania-chronicles-iii-dracula-s-curse","castlevania-eternity-of-sorrow","castlevania-haunted-castle-2","castlevania-haunted-castle-3-trevor-s-quest","castlevania-maria-renard-s-revenge-for-sega-saturn","castlevania-revamped","castlevania-rondo-of-the-night","castlevania-snes-port","castlevania-ii-simon-s-quest-snes-port","castlevania-symphony-of-the-night-ultimate","castlevania-the-lecarde-chronicles","castlevania-the-lecarde-chronicles-2","celeste-64","celeste-mario-s-zap-dash-deluxe","chainsawman","chip-n-dale-snes-port","chrono-trigger-prophet-s-guile","clock-tower-advance","club-penguin-journey","color-a-dinosaur-snes-port","command-conquer-combined-arms","contra-force-snes-port","contra-snes-port","crash-team-racing-retro-fueled","cry-of-fear","dc-task-force","dc-vs-marvel-2025","dead-space-demake","digimon-world-2-alternative","discworld-noir","donkey-kong-country-4-nes","doom-roguelike","doom-rpg","doom-2-rpg","doomscroll-browse-preview-and-play-thousands-of-user-made-doom-wads","doom-32x-resurrection","double-dragon-one","double-dragon-snes-port","double-dragon-2-snes-port","dr-mario-mania","dr-robotnik-s-ring-racer-editor","dragons-dogma-online","dragon-quest-1-remake","driving-strikers-n64-port","duck-tales-snes-port","earthbound-halloween-hack","elden-ring-gameboy-demake","fable-20th-anniversary-demake","famicom-fighters","famidash","fightcade-a-matchmaking-application-for-playing-retro-games-online","final-fantasy-6-brave-new-world","final-fantasy-renaissance","final-fantasy-tactics-1-3","final-fight-md","fire-emblem-the-four-kings","fire-emblem-the-last-promise","fire-emblem-vision-quest","five-nights-at-freddy-s-playstation-demake","five-nights-at-freddy-s-2-playstation-demake","five-nights-at-freddy-s-2-wii-u-port","fso-freespace-2-open","f-zero-beginnings","f-zero-deluxe","f-zero-x-climax","g-zero","game-over-elysium","ghosts-n-demons","goldfinger-64","golden-axe-returns","gta-2-configuration-guide-steam-deck","guitar-hero-world-tour-definitive-edition","halo-zero","harry-potter-unreal","hayato-s-journey","he-man","holocure","hyper-dragon-ball-z","infested-island","infinity-nikki-on-steam-deck","invincible","jedi-knight-dark-forces-2-unreal-engine","jumping-flash-doom-2-0","kid-icarus-snes-port","kirby-air-ride-deluxe","kirby-s-dream-land-dx","kirby-s-dream-land-2-dx","labyrinth-of-the-dragon","left-4-dead-2-beta-restoration-project","lethalmon","licar","life-force-salamander-snes-port","life-is-strange-love-is-strange","ufo-alien-invasion","n64recomplauncher","make-a-good-mega-man-level","maldita-castilla","manic-miners-a-lego-rock-raiders-remake","mari0","mario-adventure3","mario-builder-64","mario-s-final-adventure","mario-golf-n64-pro-edition-1-1","mario-kart-wii-deluxe","mario-s-modules","mario-party-netplay","mario-syndrome","marvel-heroes-omega-project-tahiti","marvel-heroes-server-emulator","marvel-infinity-war","maximum-carnage-remake","mega-man-snes-port","mega-man-2-5d","mega-man-2-snes-port","mega-man-3-snes-port","mega-man-4-snes-port","mega-man-5-snes-port","mega-man-6-snes-port","mega-man-8x-demake-16bit","mega-man-arena","mega-man-legends-rockman-dash-great-adventureon-5-islands","mega-man-maker","mega-man-revamped","mega-man-2-revamped","mega-man-3-revamped","mega-man-rock-n-roll","mega-man-unlimited","mega-man-world-3-dx","mega-man-world-4-dx","mega-man-world-5-dx","mega-man-x-omega-blaster-ultimate-edition","mega-man-x4-knot-beret","mega-pang-megadrive-genesis-port-of-super-pang","mega-serval","mega-splatterhouse","metal-gear-mega-drive-port","metal-slug-counter","metroid-desolation","metroid-snes-port","metroid-super-zero-mission","mighty-final-fight-forever","mike-tyson-s-punch-out-snes-port","mini-doom-2","mole-mania-dx","monster-hunter-freedom-unite-complete","monster-hunter-frontier-z-steam-deck-guide","moonring","mortal-kombat-ii-arkade-edition-nes","mortal-kombat-defenders-of-the-earth","mother-2-deluxe","mushroom-kingdom-fusion","mystery-of-solarus-dx-zelda-link-to-the-past-fan-game-nb-game-needs-to-be-in-zip-format-when-adding-to-solarus-launcher","nba-jam-50","need-for-speed-3-hot-pursuit-next-gen-patch","need-for-speed-most-wanted-redux-v3","newer-super-mario-bros-wii","nfl-blitz-2026","nfl-street-reborn","nhl-94-2024-edition","nightmare-kart","nightvein","ninja-gaiden-shadow-dx","ninja-gaiden-trilogy-snes-port","not-tetris-2","order-66-a-fire-emblem-hack","outrun-cannonball","outrun-gameboy-colour-port","paratopic-wii-u-port","phantasy-star-online-blue-burst-on-steam-deck","playstation-home","pokemmo","pokemon-dark-rising","pokemon-emerald-seaglass","pokemon-gadir-deluxe","pokemon-gamma-emerald","pokemon-infinite-black-2","pokemon-infinite-fusion","pokemon-lazarus","pokemon-luminescent-platinum","pokemon-super-mystery-dungeon-story-echoes-of-yesterday","pokemon-odyssey","pokemon-prism","pokemon-rejuvenation","pokemon-scrambled-scarlet","pokemon-stadium-club","pokemon-unbound","pokemon-unbreakable-ties","pokemon-uranium","power-bomberman","power-rangers-it-s-morphin-time","argentum-age","quake-brutalist-jam-3-standalone-mod","rayman-lum-o-grams","rayman-redemption","resident-evil-2-fps","resident-evil-4-hd-project","resident-evil-the-mercenaries-3d-hd-project","residentvania","rick-dangerous-dx-megadrive-genesis-port","rockband-3-deluxe","rygar-snes-port","secret-of-mana-plus","sega-rally-2-25th-anniversary-edition","sega-vs-capcom-the-next-level","shenmue-dreams-of-saturn","shin-megami-tensei-nocturne-hardtype","silent-hill-2-enhanced-edition","signalis-gameboy-demake","skies-of-arcadia-legends-maeson","slippi-super-smash-brothers-melee-online-pvp-with-rollback-netcode","smash-64-remix","snk-vs-capcom-c64-c128-port","sonic-1-forever","sonic-2-absolute","sonic-2-gear-shift","sonic-2-hd","sonic-and-the-hedgehogs","sonic-3-angel-island-revisited","sonic-after-the-sequel-dx","sonic-amiga-tech-demo","sonic-the-moon-facility","sonic-classic-heroes","sonic-daybreak","sonic-erazor","sonic-galactic","sonic-gt","sonic-gx","sonic-j-online-physics-demo","sonic-master-system-remake","sonic-omens","sonic-project-06","sonic-project-forestation","sonic-the-hedgehog-rpg","sonic-riders-tournament-edition","sonic-robo-blast-2","sonic-robo-blast-32x","sonic-robo-blast-2-kart","sonic-smackdown","sonic-time-twisted","sonic-triple-trouble-16-bit","sonic-ultrasaturn","sonic-utopia","soul-calibur-swords-of-destiny","space-quest-ii-vga-deluxe","spartan-survivors","squid-games-gameboy-fan-game","star-fox-event-horizon","star-fox-ex-snes","starship-troopers-2005","street-fighter-one-remake","street-fighter-z","street-fighter-x-mega-man","streets-of-rage-remake","streets-of-rage-2-final-fight-crossover","streets-of-rage-2-new-era","streets-of-rage-2-teenage-mutant-ninja-turtles-hack","sugar-ghouls","super-dodgeball-snes-port","super-freaks-ultimate-edition-turbo","super-mario-3-mario-forever","super-mario-3d-all-stars-deluxe-launcher-pack","super-mario-64-coopware","super-mario-64-last-impact","super-mario-64-splitscreen-multiplayer","super-mario-all-stars-launcher-for-super-mario-world","super-mario-the-rainbow-stars","super-mario-brothers-3-level-design-contest","super-mario-bros-cd","super-mario-brothers-flashback","super-mario-brothers-hack-portal","super-mario-brothers-movie","super-mario-bros-wonder-demake","super-mario-buys-bread","super-mario-galaxy-63","super-mario-kart-zx","super-mario-meltdown","super-mario-star-road","super-mario-sunburn","super-mario-sunshine-definitive-edition","super-mario-unimaker","super-mario-war","pro-evolution-soccer-5","super-mario-world-return-to-dinosaur-land","super-mario-world-random-revolution","super-mario-world-simpatico","super-mario-world-the-princess-rescue-3","super-metroid-x-fusion","super-smash-brothers-brawl-project","super-smash-bros-crusade","super-smash-flash-2","super-smash-land","super-star-wars-holiday-special","super-star-wars-redux","super-star-wars-return-of-the-jedi-redux","super-star-wars-the-empire-strikes-back-redux","sven-co-op","tango-mega-man-battle-network-with-rollback-netcode","tanks-rebirth","tecmo-super-bowl-2024","teenage-mutant-ninja-turtles-snes-port","teenage-mutant-ninja-turtles-shredder-s-re-revenge","tetris-rosy-retrospection-dx","the-ark","the-bells-of-arietta","the-driver-syndicate","the-goonies-msx-remake","the-legend-of-banjo-kazooie-the-bear-waker-deluxe","the-legend-of-banjo-kazooie-the-jiggies-of-time","the-legend-of-zelda-ganon-s-deception","the-legend-of-zelda-master-of-time","the-legend-of-zelda-mirror-of-worlds","the-legend-of-zelda-ocarina-of-time-ultimate-trial","the-legend-of-zelda-reality-estate","the-legend-of-zelda-sealed-palace","the-legend-of-zelda-snes-port","the-legend-of-zelda-the-missing-link","the-legend-of-zelda-voyager-of-time","the-lost-vikings-ragnarok-edition","the-patchmaker-s-workshop","thief-the-black-parade","tiny-toon-adventures-dx","tmnt-rescue-palooza","tony-hawk-s-american-wasteland-rethawed","toontown-rewritten","turrican-128k-remaster","ultimate-doom-32x-resurrection","ultimate-sonic-smackdown","ultimate-trial","undefeated","undertale-yellow-an-undertale-prequel","wario-s-conquest-super-mario-land-2-reclaimed","warzone-2100","wega-the-lost-media","wolfenstein-rpg","x-men-arcade-remake","x-men-mutant-apocalypse-remake","xenosaga-pied-piper-fan-recreation","yarg-yet-another-rhythm-game","yume-nikki-ps","zelda3-parallel-worlds","zelda-dungeons-of-infinity","zelda-s-adventuredx","zelda-ii-the-adventures-of-link-snes-port","zelda-ocarina-of-time-unreal-engine-remake","zelda-oni-link-begins","zenless-zone-zero-on-steam-deck","zombies-ate-my-neighbours-escape-the-house","zquest-classic-zelda","zquest-classic-zelda-quest-lists","0-a-d","2-ship-2-harkinian-the-legend-of-zelda-majora-s-mask-pc-port","the-legend-of-zelda-majora-s-mask-recompilation","r-e-l-i-v-e-abe-s-odyssey-exodus-pc-port","acemulator-asheron-s-call-server-emulator","aleph-one-marathon-trilogy","ambermoon-decompilation","anarch","apotris","arkhenaten","arx-libertatis-arx-fatalis-port","assaultcube","balatro-gba-demake","barbarian","beyond-all-reason","boneforge-battlegrounds","bstone-port-of-blake-stone-aliens-of-gold-and-blake-stone-planet-strike","castlevania-symphony-of-the-night-play-as-maria","cataclysm-dark-days-ahead","cave-story-port","c-evo","citybound","civctp2-apolyton-version-of-call-to-power-ii","clangen","classicube","command-conquer-remastered-collection","conflict-3049","corsixth-theme-hospital-port","cortex-command-community-project","counter-strike-football","cro-mag-rally","cube-2-sauerbraten","cubyz","cuphead-wii-u-port","cytopia","daggerfall-unity","ddracenetwork","dxx-rebirth-open-descent","descent-3-port","devilution-x-open-diablo-for-steam-deck","devilution-x-open-diablo","dinosaur-planet-recompilation","dinosaur-planet-recompilation-rom-patcher","dinosaur-planet-recompilation-mods-page","dogwalk","doom-64-dreamcast-port","doom-64-ex","dr-mario-64-recompilation","duke-nukem-zero-hour-recompilation","dungeon-crawl-stone-soup","dungeonfx-dungeon-keeper-port","opendune","dune-2-the-maker","ecwolf-wolfenstein-3d-port","eduke32-duke-nukem-3d-port","exult-ultima-vii-reimplementation","fallout-community-edition","fallout-2-community-edition","fheroes2-heroes-of-might-magic-2-recreation","fish-folk-jumpy","flashback-sega-saturn-port","flightgear","fpc-atomic-atomic-bomberman-reimplimentation","freeciv","freecol","freedoom","freeorion","freeserf-settlers-1-clone","freespace-open","fs2open-open-freespace-2","frets-on-fire","friday-night-funkin","gemrb-implementation-of-infinity-engine-baldur-s-gate-icewind-dale-planescape-torment","glsmac-sid-meier-s-alpha-centauri-port","grand-theft-auto-3-dreamcast-port","grand-theft-auto-vice-city-dreamcast-port","half-life-decay-pc-port","hedgewars","hurry-curry","hypersomnia","infinity-blade","infinity-blade-2","ioquake3-quake-3-arena-port","jagged-alliance-2-stracciatella","opengoal-jak-daxter-jak-2-and-jak-3-native-pc-ports","jazz-resurrection-native-pc-port-jazz-jackrabbit-2","julius-caesar-iii-remake","kam-remake","kindergarten-wii-u-port","kkrieger","legend-of-dragoon-port-severed-chains","lego-island-pc-port","lego-island-web-port","lemmini-lemmings-port","liblast","lincity-ng","link-faces-of-evil-zelda-wand-of-gamelon-remastered","lsd-revamped-lsd-dream-emulator-remake","mario-kart-64-dreamcast-port","mario-kart-64-recompilation","maze-of-galious-port","mbhaxe-marble-blast-port","mega-man-legends-pc-port","memoria-tools-for-final-fantasy-ix","meritous","micropolis-js","mute-crimson-dx-dreamcast-port","myst-online-uru-live","mystical-ninja-starring-goemon-recompilation","naev","endless-sky","nakedavp-aliens-vs-predator-classic-2000-port","nblood-blood-exhumed-port","nethack","omohaaa-open-medal-of-honour-allied-assault","oolite-an-open-world-space-opera","open1560-midtown-madness","openage","opendaoc-dark-age-of-camelot-server-emulator","openenroth-open-reimplementation-of-might-and-magic-6-7-8-engine","open-fodder","opengothic-gothic-2-port","openhcl","openhv","openloco-chris-sawyer-s-locomotion-port","openmw-morrowind-port","opennox","openomf-one-must-fall-2097","openra-command-conquer-red-alert-tiberian-dawn-dune-2000","openrct2-roller-coaster-tycoon-2","openrw-gta-iii-reimplementation","opentesarena-elder-scrolls-arena-open-source-reimplementation","openttd-port-of-transports-tycoon-deluxe","opentyrian-2000","openxcom","pcexhumed-exhumed-powerslave-port","perfect-dark-pc-port","pioneer-space-sim","pixel-dungeon","playable3dmaze","pooltool","portal64-still-alive","portal-still-alive-pc-port","prince-of-persia-original-trilogy-port","project-alice-victoria-2-port","project-diablo-2","projectr-san-francisco-rush-the-rock-and-san-francisco-rush-2049-ports","puzzlemoppet-port","quest-64-recompilation","quick-dungeon-crawler","redriver2-driver-2-pc-port","return-to-the-roots-settlers-ii-remake","rota-bend-gravity","rvgl-re-volt-port","ship-of-harkinian-zelda-ocarina-of-time-port","ship-of-harkinian-mods","the-simpsons-hit-run-pc-port","sonic-mania-decompilation","sonic-the-hedgehog-2013-and-sonic-the-hedgehog-2-2013-decompilation","sonic-unleashed-recompilation","spacecadetpinball","space-station-14","spaghetti-kart-mario-kart-64-pc-port","speed-dreams","the-ur-quan-masters-star-control-2-port","star-fox-64-dreamcast-port","star-fox-64-dreamcast-port-builder-guide","star-fox-64-recompilation","starship-star-fox-64-pc-port","starship-star-fox-64-pc-port-mods","stunt-car-remake","super-mario-64-co-op-deluxe","super-mario-64-pc-port","super-mario-64-render96","super-mario-bros-remastered","super-mario-bros-remastered-mods","super-mario-bros-remastered-custom-levels","super-tux-kart","super-tux-war","teeworlds","the-battle-for-wesnoth","the-force-engine-dark-forces-reimplementation","the-labyrinth-of-time-s-edge","the-legend-of-zelda-a-link-to-the-past-decompilation","the-legend-of-zelda-link-s-awakening-dx-hd-pc-port","the-world-ends-with-you-solo-remix-recompilation","thextech-open-source-game-engine","thrive-open-source-evolution-sim","timesplitters-rewind","trx-tomb-raider-1-2-reimplementation","ultima-vii-revisited","unciv","undertale-decompilation","unknown-horizons","vcmi-heroes-of-might-magic-3-open-source-recreation","veloren","voxelibre-formerly-mineclone2","warzone-2100","wasted-a-destruction-derby-online-game","widelands","wipeout-dreamcast-port","wipeout-phantom-edition-pc-port","xonotic","yknytt","zelda-2-enhanced-pc-edition","zelda-64-recompiled-majora-s-mask-with-mod-support","zelda-classic","zero-k","zork-open-source-port","zork-ii-open-source-port","zork-iii-open-source-port","aero-gauge-decompilation","aidyn-chronicles-the-first-mage-decompilation","alice-in-wonderland-wii-decompilation","am64-another-metroid-64","animal-crossing-gamecube-decompilation","baku-bomberman-2-jp-decompilation","banjo-kazooie-n64-decompilation","banjo-kazooie-xbox-360-decompilation","banjo-kazooie-grunty-s-revenge-decompilation","banjo-tooie-decompilation","blast-corps-decompilation","body-harvest-decompilation","bomberman-hero-decompilation","boom-street-decompilation","breath-of-fire-decompilation","the-legend-of-zelda-breath-of-the-wild-decompilation","bully-online","burnout-3-takedown-decompilation","castlevania-64-decompilation","castlevania-order-of-ecclesia-decompilation","castlevania-symphony-of-the-night-decompilation","castlevania-symphony-of-the-night-megadrive-genesis-port-demo","chameleon-twist-recompilation","chameleon-twist-2-decompilation","chibi-robo-pia-decompilation","colin-mcrae-rally-2-0-decompilation","conker-s-bad-fur-day-decompilation","contra-decompilation","cosmo-s-cosmic-adventure-decompilation","crash-bandicoot-decompilation","crash-bandicoot-2-cortex-strikes-back-decompilation","crash-team-racing-decompilation","crash-twinsanity-remake","croc-legend-of-the-gobbos-decompilation","crystalis-decompilation","dance-central-3-decompilation","dark-cloud-decompilation","dark-rift-decompilation","demon-s-crest-decompilation","deus-ex-human-revolution-decompilation","diddy-kong-racing-decompilation","disney-s-piglet-s-big-game-decompilation","donkey-kong-64-decompilation","doraemon-nobita-to-mittsu-no-seireiseki-decompilation","doshin-the-giant-decompilation","dragon-quest-monsters-decompilation","dragon-quest-ix-decompilation","dragon-warrior-decompilation","earthbound-beginnings-remake","elden-ring-morrowind-overhaul-mod","fable-2-recompilation","fallout-bakersfield-doom-total-conversion-mod-gzdoom-wad","fatal-frame-decompilation","fatal-frame-2-decompilation","final-fantasy-crystal-chronicles-decompilation","final-fantasy-mystic-quest-megadrive-port","final-fantasy-vii-decompilation","fire-emblem-shadow-dragon-decompilation","fire-emblem-the-blazing-blade-decompilation","frogger-decompilation","f-zero-x-decompilation","gauntlet-legends-decompilation","gex-64-decompilation","glover-decompilation","goldeneye-007-decompilation","golden-sun-decompilation","goof-troop-decompilation","gran-turismo-2-decompilation","gta-2-decompilation","guilty-gear-x-series-decompilation","halo-decompilation","harvest-moon-64-decompilation","harvest-moon-a-wonderful-life-decompilation","harvest-moon-friends-of-mineral-town-decompilation","ice-climber-decompilation","ico-decompilation","inazuma-eleven-strikers-decompilation","jet-force-gemini-decompilation","jet-set-radio-future-decompilation","kid-chameleon-decompilation","kingdom-hearts-decompilation","kirby-64-the-crystal-shards-decompilation","kirby-the-amazing-mirror-decompilation","kirby-air-ride-decompilation","kirby-s-epic-yarn-decompilation","klonoa-2-lunatea-s-veil-decompilation","knife-edge-nose-gunner-decompilation","legacy-of-kain-soul-reaver-decompilation","legend-of-legaia-decompilation","lego-racers-decompilation","lego-star-wars-iii-the-clone-wars-decompilation","lsd-dream-emulator-decompilation","luigi-s-mansion-decompilation","lunar-2-eternal-blue-complete-decompilation","mario-luigi-partners-in-time-decompilation","mario-luigi-superstar-saga-decompilation","mario-golf-64-decompilation","mario-kart-double-dash-decompilation","mario-kart-wii-decompilation","mario-party-4-decompilation","mario-party-5-decompilation","mario-superstar-baseball-decompilation","mario-tennis-decompilation","medievel-decompilation","mega-castlevania-iv","mega-man-x-viral-nightmare","metal-gear-solid-decompilation","metal-gear-solid-2-decompilation","metal-gear-solid-3-decompilation","metal-gear-solid-the-twin-snakes-decompilation","metroid-fusion-decompilation","metroid-prime-decompilation","metroid-prime-2-echoes-decompilation","metroid-zero-mission-decompilation","minecraft-legacy-console-edition-decompilation","minicraft-minecraft-gba-port","mischief-makers-decompilation","naruto-gekitou-ninja-taisen-4-decompilation","need-for-speed-high-stakes-decompilation","need-for-speed-most-wanted-decompilation","need-for-speed-underground-decompilation","neon-genesis-evanglion-64-decompilation","new-super-mario-bros-wii-decompilation","onegai-monsters-decompilation","opentdu-source-port-of-test-drive-unlimited","panzer-dragoon-saga-decompilation","paper-mario-decompilation","paper-mario-sticker-star-decompilation","paper-mario-the-thousand-year-door-decompilation","parappa-the-rapper-2-decompilation","pikmin-decompilation","pikmin-2-decompilation","plants-vs-zombies-goty-decompilation","pokemon-battle-revolution-decompilation","pokemon-mystery-dungeon-red-rescue-team-decompilation","pokemon-pinball-decompilation","pokemon-puzzleleague-decompilation","pokemon-snap-decompilation","pokemon-stadium-decompilation","pokemon-stadium-2-decompilation","pokemon-tcg-deompilation","pokemon-tcg-2-deompilation","pokepark-wii-pikachu-s-adventure-decompilation","prey-2006-port","project-green","quake-4-source-port","ratatouille-decompilation","rayman-2-redreamed","rayman-3-havok-reignited-remake","render-98-for-ship-of-harkinian","resident-evil-code-veronica-x-game-cube-decompilation","resident-evil-code-veronica-x-ps2-decompilation","return-to-yoshi-s-island","rhythm-heaven-decompilation","rock-band-3-decompilation","rocket-robot-on-wheels-decompilation","secret-of-mana-pc-engine-port","shadowgate-64-decompilation","shadow-of-the-colossus-decompilation","shin-megami-tensei-decompilation","silent-hill-decompilation","skyblivion","skys-of-arcadia-legends-decompilation","skywind","sly-cooper-and-the-thievius-raccoonus-decompilation","snowboard-kids-2-decompilation","sonic-advance-2-decompilation","sonic-advance-trilogy-decompilation","sonic-and-the-secret-rings-pc-port-project-reignition","sonic-riders-decompilation","sonic-riders-zero-gravity-decompilation","sonic-runners-decompilation","sonic-rush-rerun-pc-port","sonic-the-fighters-decompilation","sonic-the-hedgehog-2006-recompilation","space-station-silicon-valley-decompilation","spider-man-2001-decompilation","spongebob-squarepants-battle-for-bikini-bottom-decompilation","spyro-the-dragon-decompilation","star-fox-adventures-decompilation","star-wars-shadows-of-the-empire-decompilation","street-fighter-iii-3rd-strike-decompilation","summoner-a-goddess-reborn-decompilation","super-ghouls-n-ghosts-decompilation","super-mario-3d-land-decompilation","super-mario-3d-world-bowser-s-fury-decompilation","super-mario-64-playstation-port","super-mario-galaxy-decompilation","super-mario-galaxy-2-decompilation","super-mario-odyssey-a-galaxy-story","super-mario-odyssey-decompilation","super-mario-strikers-decompilation","super-mario-sunshine-decompilation","super-metroid-decompilation","super-monkey-ball-decompilation","super-paper-mario-decompilation","super-smash-bros-64-decompilation","super-smash-bros-brawl-decompilation","super-smash-bros-melee-decompilation","the-legend-of-zelda-phantom-hourglass-decompilation","the-legend-of-zelda-skyward-sword-decompilation","the-legend-of-zelda-tears-of-the-kingdom-online","the-legend-of-zelda-the-wind-waker-decompilation","the-legend-of-zelda-twilight-princess-decompilation","the-sims-2-castaway-decompilation","the-spongebob-squarepants-movie-decompilation","the-world-ends-with-you-decompilation","tomba-decompilation","tomb-raider-chronicles-decompilation","twisted-metal-decompilation","twisted-metal-black-decompilation","twisted-metal-harbor-city-decompilation","ty-the-tasmanian-tiger-decompilation","unreal-redux","vagrant-story-decompilation","vandal-hearts-decompilation","virtual-pro-wrestling-2-decompilation","wave-race-64-decompilation","wcw-nwo-revenge-decompilation","wii-sports-decompilation","xenoblade-jp-decompilation","xenogears-decompilation","xenosaga-episode-i-decompilation","yakuza-1-decompilation","yoshi-s-story-decompilation","yu-gi-oh-reshef-of-destruction-decompilation","zombieland-mmo","zone-of-the-enders-decompilation","zone-of-the-enders-the-2nd-runner-decompilation","animal-crossing-city-folk-deluxe-animal-crossing-city-folk-let-s-go-to-the-city-mod","ashes-series-2063-dead-man-walking-afterglow-hard-reset-doom-2-mod","baldur-s-gate-3-brawl-real-time-combat-mod","baldur-s-gate-3-chivalry-expansion","baldur-s-gate-3-forsaken","baldur-s-gate-3-ultimate-cut-content-restoration-mod","battlefield-1942-desert-combat","bioshock-native-hdr-mod","black-reliquary-total-conversion-mod-for-darkest-dungeon","bloodborne-shadps4-60fps-patch","bloodborne-shadps4-visual-overhaul-mod","brutal-doom-doom-mod","castlevania-simon-s-destiny-a-total-conversion-doom-mod","castlevania-symphony-of-the-night-randomizer-mod","caveman-2-cosmos-civilization-4-total-overhaul-mod","celeste-strawberry-jam-mod","chrono-trigger-pixel-demaster-mod","contra-c-c-generals-zero-hour-mod","crusader-kings-2-a-song-of-ice-fire-mod","cyberpunk-2077-battle-axe","cyberpunk-2077-night-city-traffic-overhaul-mod","cyberpunk-2077-take-a-breather-pace-reputation-overhaul-mod","dark-souls-2-firelink-edition","dark-souls-3-seamless-co-op-mod","dark-souls-remastered-seamless-co-op-mod","dbz-budokai-4-dragonball-z-infinite-world-ps2-mod","deus-ex-nihilum","dmc3-crimson-devil-may-cry-3-hd-collection-mod","dhwem3-doom-3-mod","doom-voxel-doom-replace-2d-sprites-with-3d-voxels","doom-2-voxel-doom-replace-2d-sprites-with-3d-voxels","doom-3-realdoom","doom-infinite-doom-2-mod","dragon-ballz-dio-moveset","dragon-ballz-yamiyugi-moveset","duke-nukem-3d-voxel-duke","dyson-sphere-program-co-op-mod","elden-ring-nightreign-seamless-two-player-co-op-mod","elden-ring-seamless-co-op-mod","elden-ring-the-convergence-overhaul-mod","elden-ring-the-witcher-moveset-mod","skyrim-enderal","half-life-2-entropy-zero-2","factorio-space-exploration","civilisation-5-faerun","fallout-4-fsr3-mod","fallout-4-imperial-attack-on-the-commonwealth","fallout-4-london-mod-guide","fallout-4-loreout-the-modern-roleplaying-modlist","fallout-4-misery-island-isles-of-new-england","fallout-4-the-order-of-the-third-eye","fallout-4-upscaling","fallout-new-vegas-autumn-leaves","fallout-new-vegas-long-15-expansion","fallout-new-vegas-vanilla-plus-ao","f-e-a-r-echo-patch","fifa-14-and-16-classic-patch","final-fantasy-7-7th-heaven-mod","final-fantasy-7-rebirth-playable-dyne-mod","final-fantasy-7-rebirth-playable-rufus-mod","final-fantasy-7-satsuki-yatoshi-syw-mod","final-fantasy-9-moguri-mod","final-fantasy-tactics-the-lion-war-of-the-lions-mod","battlefield-2-forgotten-hope-2","mount-blade-warband-gekokujo","oblivion-remastered-glock-functional-gun-mod","half-life-2-goldeneye-source","gta-iv-fusionfix","gta-v-large-pedestrian-crowds-mod","gta-v-superman-mod","gta-vice-city-actual-nextgen-edition-modpack","guitar-hero-world-tour-definitive-edition","resident-evil-requiem-merchant","half-life-2-episode-two-raising-the-bar-redux","half-life-black-mesa-blue-shift-caretaking-update","half-life-diffusion","half-life-element-64","half-life-legacy","the-legend-of-zelda-ocarina-of-time-hero-of-law","hollow-knight-silksong-multiplayer-mod","heroes-of-might-and-magic-iii-horn-of-the-abyss","icewind-dale-2-enhanced-edition-icewind-dale-2-mod","just-cause-3-unlimited-edition","kingdom-hearts-refined-a-mod-for-kingdom-hearts-1-5-2-5-remix","lies-of-p-co-op-mod","luigi-s-mansion-louie-mansion-pikmin-overhaul-mod","mario-kart-64-amped-up","mario-kart-8-deluxe-ctgp-deluxe","mario-kart-super-circuit-60-fps-patch","marvel-vs-capcom-infinite-beyond-mod","max-payne-remix","medal-of-honor-airborne-redux","medieval-2-total-war-kingdoms-mod-third-age-total-war","command-conquer-red-alert-2-mental-omega","elder-scrolls-iii-morrowind-morrowind-rebirth","nba-jam-legends-on-fire-edition","need-for-speed-most-wanted-2005-mod-pack-for-steam-deck-and-pc-guide","need-for-speed-pro-street-mod-pack-for-steam-deck-and-pc-guide","need-for-speed-underground-mod-pack-for-steam-deck-and-pc-guide","half-life-2-no-more-room-in-hell","oblivion-oscuro-s-overhaul","paper-mario-the-thousand-year-door-encore","paper-mario-tower-of-trials","persona-3-fes-hd-overhaul-mod-widescreen-patch","pillars-of-eternity-2-deadfire-font-increase-mod","super-smash-brothers-brawl-pmex-remix","portal-2-portal-stories-mel","portal-2-portal-reloaded","portal-2-portal-revolution","doom-2-project-brutality","quake-arcane-dimensions","rainbow-six-black-ops","doom-3-bfg-edition-rbdoom3bfg","red-dead-redemption-2-metal-gear-solid-3-recreation-mod","star-wars-empire-at-war-forces-of-corruption-republic-at-war","resident-evil-2-re-enhance-mod","resident-evil-2-thomas-the-tank-engine-mod","resident-evil-4-remake-tactical-first-person-mod","mario-kart-wii-retro-rewind","mario-kart-wii-retro-rewind-wheel-wizard-launcher","rimworld-a-rimworld-of-magic","rimworld-android-tiers","rimworld-pokeworld","rimworld-save-our-ship-2","rimworld-vanilla-expanded","rimworld-zombieland","saints-row-2-juiced-patch","sekiro-resurrection-overhaul-mod","skyrim-a-ghibli-skyrim-landscapes-mod","skyrim-a-ghibli-skyrim-whiterun-mod","skyrim-midnight-sun","skyrim-skypal","skyrim-skyparkour-v3-mod","skyrim-special-edition-azeroth-reborn","skyrim-special-edition-lordbound","skyrim-special-edition-norden-ui","skyrim-together-reborn","skyrim-tuxborn-overhaul-mod","slay-the-spire-downfall","sonic-robo-blast-2-generations-mod","sphinx-and-the-cursed-mummy-pc-mod","spiderman-multiplayer-mod","splinter-cell-enhanced","s-t-a-l-k-e-r-shadow-of-chernobyl-radiophobia-3","s-t-a-l-k-e-r-2-heart-of-chernobyl-zone-unchained","stardew-valley-a-voice-over-mod-for-all-love-interests","starfield-star-wars-classes","starfield-steam-deck-essentials-mod-install-guide","starfield-star-wars-genesis-total-conversion","star-fox-snes-force-feedback-patch","star-wars-battlefront-2-remaster-mod","x4-foundations-star-wars-interworlds","jedi-knight-jedi-academy-star-wars-movie-duels","super-mario-sunshine-super-mario-eclipse","super-mario-3d-land-super-mario-expedition-2","super-mario-odyssey-online","super-smash-bros-brawl-rex","super-smash-bros-melee-akaneia-build","terraria-calamity-mod","terraria-tmodloader","the-binding-of-isaac-external-items-description-mod","gothic-2-gold-edition-the-chronicles-of-myrtana-archolos","half-life-2-the-citizen","thief-the-dark-mod","the-legend-of-zelda-breath-of-the-wild-bettervr","the-legend-of-zelda-breath-of-the-wild-fov-shoulder-cam-mod","the-legend-of-zelda-tears-of-the-kingdom-ultracam-mod","mount-blade-2-bannerlord-the-old-realms","the-simpsons-hit-run-futurama-overhaul-mod","the-witcher-3-brothers-in-arms-mod","the-witcher-3-brothers-in-arms-ultimate-edition","the-witcher-3-hd-reworked-project-next-gen-edition","the-witcher-3-let-there-be-light","the-witcher-3-wild-monster-hunt","s-t-a-l-k-e-r-call-of-pripyat-misery","tony-hawk-s-underground-2-thugpro","dungeon-siege-ultima-v-lazarus","undertale-undertale-together","unreal-unrealrtx-mod","watch-dogs-living-city","wolfenstein-blade-of-agony","xcom-enemy-unknown-long-war","star-wars-x-wing-special-edition-xwvm","yakuza-0-co-op-mod","007-quantum-of-solace","ace-combat-assault-horizon-enhanced-edition","afterfall-insanity-extended-edition","aladdin-in-nasira-s-revenge","alien-trilogy","alien-vs-predor-2-gold-edition","america-mcgee-s-alice-remastered","area-51","assassin-s-creed-iii","atlantis-the-lost-empire-trial-by-fire","back-to-the-future-the-game","batman-vengeance","battlefield-1942-the-complete-collection","battlefield-2142","battlefield-2-complete-collection","battlefield-vietnam","battlefield-bad-company-2","bedlam","blair-witch-trilogy","blur","celebrity-deathmatch","clive-barker-s-jericho","colin-mcrae-dirt-2","condemned-criminal-origins","contract-j-a-c-k","crazy-taxi-3-high-roller","cryostasis","darksiders-ii","dead-man-s-hand","dead-to-rights","dead-to-rights-2","deadpool","die-hard-nakatomi-plaza","dirt-3","dreamkiller","driver-san-francisco","enter-the-matrix","evil-dead-regeneration","f1-2010","f1-2011","f1-2012","f1-2013","f1-2020","f1-race-stars","fable-iii","family-guy-back-to-the-multiverse","fantastic-four","fuel","gears-of-war","gore-ultimate-soldier","grid-2","grid-autosports","guardians-of-the-galaxy-the-telltale-series","halo-combat-evolved","heavy-metal-f-a-k-k-2","heretic-ii","hulk","iron-man","james-bond-007-blood-stone","james-cameron-s-avatar-the-game","juiced","juiced-2-hot-import-nights","kiss-psycho-circus","lost-planet-extreme-condition-colonies-edition","lost-planet-2","manhunt-2","marvel-ultimate-alliance","marvel-ultimate-alliance-2","mercenaries-2-world-in-flames","midnight-club-2","mortal-kombat-komplete-edition","need-for-speed-ii-special-edition","need-for-speed-iii-hot-pursuit","need-for-speed-carbon","need-for-speed-high-stakes","need-for-speed-hot-pursuit-2","need-for-speed-most-wanted","need-for-speed-porsche-unleashed","need-for-speed-prostreet","need-for-speed-shift","need-for-speed-shift-2-unleashed","need-for-speed-the-run","need-for-speed-undercover","need-for-speed-underground","need-for-speed-underground-2","no-one-lives-forever-2-a-spy-in-h-a-r-m-s-way","nocturne","oni-anniversary-edition","operation-flashpoint-dragon-rising","operation-flashpoint-red-river","outrun-2006-coast-2-coast","pac-man-world-2","peter-jackson-s-king-kong-the-official-game-of-the-movie","poker-night-double-pack","prey","project-cars-goty-edition","project-cars-2","project-cars-3","project-i-g-i-i-m-going-in","psi-ops-the-mindgate-conspiracy","psychotoxic","pure","race-driver-grid","rambo-the-videogame","resident-evil-operation-racoon-city","rethawed","road-rash","saw","sanity-aiken-s-artifact","scarface-the-world-is-yours","scratches-director-s-cut","sega-dreamcast-collection","sega-rally-revo","shrak","silent-hill-2-enhanced-edition","silent-hill-3","sonic-cd-miracle-edition","sonic-r-the-definitive-edition","south-park","spec-ops-the-line","spider-man-2-the-game","splinter-cell-pandora-tomorrow","starlancer","street-fighter-x-tekken","syndicate","teenage-mutant-ninja-turtles-mutants-in-manhattan","test-drive-unlimited","test-drive-unlimited-2","the-chronicles-of-riddick-assault-on-dark-athena","the-chronicles-of-riddick-escape-from-butcher-bay","the-crew","the-godfather-part-ii","the-godfather-the-game","the-last-remnant","the-legend-of-korra","the-lord-of-the-rings-war-in-the-north","the-matrix-path-of-neo","the-need-for-speed-special-edition","the-operative-no-one-lives-forever","the-polar-express","the-punisher","the-simpsons-hit-run","the-suffering","the-suffering-ties-that-bind","the-walking-dead-survival-instinct","toca-race-driver","toca-race-driver-2","toca-race-driver-3","toy-story-2-buzz-lightyear-to-the-rescue","transformers-devastation","transformers-fall-of-cybertron","transformers-revenge-of-the-fallen","transformers-the-game","transformers-war-for-cybertron","tron-evolution","true-crime-streets-of-la","turok","ultimate-spider-man","unreal-tournament-2004-editor-s-choice-edition","unreal-tournament-3-black-edition","vietcong","vietcong-2","viva-pinata","vivisector-beast-within","will-rock","william-shatner-s-tekwar","wipeout-portable-collection","wolfenstein","world-racing","x-men-legends-ii-rise-of-apocalypse","x-men-origins-wolverine-uncaged-edition","you-are-empty","archive-of-texture-packs-for-psone-playstation-2-psp-ps-vita-gamecube-n64-3ds-wii-dreamcast","animal-crossing-city-folk-hd-texture-pack","baldur-s-gate-3-hd-texture-pack","batman-arkham-asylum-hd-texture-pack","batman-arkham-city-hd-texture-pack","batman-arkham-knight-hd-texture-pack","blood-2-upscale-texture-pack","dark-souls-2-hd-texture-pack","fallout-new-vegas-texture-upscale-project","fallout-4-landscape-textures-overhaul","far-cry-3-hd-texture-pack","final-fantasy-7-remake-4k-8k-texture-collection","final-fantasy-7-remake-hd-texture-pack","god-of-war-decked-edition","goldeneye-4k-textures","grand-theft-auto-5-enhanced-edition-4k-texture-pack","grand-theft-auto-liberty-city-stories-decked-edition","luigis-mansion","mario-kart-64","mario-kart-double-dash","mass-effect-legendary-edition","nier-automata-4k-texture-pack","palworld-texture-pack","paper-mario-64","pokemon-scarlet-violet-4k-texture-pack","prince-of-persia-decked-edition","resident-evil-5-texture-pack","resident-evil-revelations-hd-texture-pack","resident-evil-revelations-2-hd-texture-pack","secret-agent-clank","soul-reaver-dreamcast","ssx-3","super-mario-3d-land","super-mario-galaxy-63-hd-texture-pack","super-mario-sunshine","the-legend-of-zelda-breath-of-the-wild-4k-texture-pack","the-legend-of-zelda-tears-of-the-kingdom-4k-texture-pack","the-witcher-3-wild-hunt-immersion-pack","tomb-raider-legend-hd-texture-pack","ultimate-spiderman-ps2-decked-edition","vagrant-story-on-duckstation","zelda-majora-s-mask-3d","majora-s-mask-n64","zelda-ocarina-of-time-3d","dusklight-the-legend-of-zelda-twilight-princess-pc-port-texture-pack-2","zelda-a-link-between-worlds","zelda-skyward-sword","hidden-palace-archive-of-playable-unreleased-games-prototypes","akira-genesis-megadrive","aladdin-ntsc-nes-prototype","animaniacs-hollywood-hypnotics-gameboy-advance","apocalypse-2-snes","batman-revenge-of-the-joker-snes","big-brother","bio-force-ape-nes","beyond-zero-tolerance-genesis-mega-drive","blue-angelo-angels-from-the-shrine-gameboy-advance","california-raisins-grape-escape-nes","castlevania-resurrection-dreamcast","dancing-eyes-playstation-3","daredevil-the-man-without-fear-playstation-2","dark-castle-msx2","dark-empires-genesis-mega-drive","dracula-hunter-arcade","dinosaur-planet-n64","duke-nukem-d-day-ps2","eddie-s-puzzletime-gameboy","frog-dude-megadrive","frogger-2-swampy-s-revenge-dreamcast","it-came-from-the-desert-megadrive","jet-set-radio-dreamcast-prototype","mario-kart-xxl-gameboy-advance","mechanoids-2-snes","mia-hamm-soccer-64-prototypes","nigel-mansell-world-championship-c64","paprium-genesis-mega-drive","populous-nes","porky-pig-s-haunted-holiday-snes","putty-squad-megadrive","rayman-snes","resident-evil-1-5-psone","resident-evil-gameboy-colour","robocop-psone","saints-row-undercover-psp","sega-channel-144-preserved-roms-megadrive-genesis","sensible-soccer-nes","sonic-crackers-genesis-megadrive","team-sas-xbox","the-addams-family-pugsley-s-scavanger-hunt-nes-prototypes","the-elder-scrolls-travels-oblivion-psp","thrill-kill-psone","time-diver-eon-man-nes","tripitaka-windows","viewpoint-2064-n64","virtua-hamster-sega-32x","warcraft-adventures-lord-of-the-clans-pc-scummvm","yoshi-gameboy-advance","7th-dragon-nintendo-ds","airs-adventure-sega-saturn","american-oudan-ultra-quiz-super-nintendo","ao-no-6-go-saigetsufutai-hito-time-and-tide-dreamcast","baroque-sega-saturn","battle-master-kykyoku-no-senshitachi-snes","battle-stadium-d-o-n-playstation-2","belzerion-3do","breath-of-fire-ii-super-nintendo","captain-rainbow-wii","captain-tsubasa-ps2","captain-tsubasa-vol-ii-super-striker-nintendo-entertainment-system","castlevania-rondo-of-blood-turbografx-cd","cave-story-dokutsu-monogatari-pc","chaos-field-dreamcast","chibi-robo-wii","chobits-gameboy-advance","clock-tower-the-first-fear-playstation","cookie-s-bustle-pc","cotton-2-sega-saturn","cowboy-bebop-tsuioku-no-serenade-playstation-2","cyber-troopers-virtual-on-playstation-3","dark-half-super-nintendo","dark-seed-sega-saturn","dead-of-the-brain-pc98","dead-of-the-brain-2-pc98","densetsu-no-ogre-battle-the-march-of-the-black-queen-sega-saturn","digimon-adventure-psp","digimon-world-re-digitize-playstation-portable","digital-devil-monogatari-megami-tensei-nes","dragon-ball-z-super-saiya-densetsu-super-nintendo","dragon-ball-z-the-legend-sega-saturn","dragon-force-ii-kamisarishi-daichi-ni-sega-saturn","dragon-quest-iii-soshite-densetsu-e-super-nintendo","dragon-quest-vi-maboroshi-no-daichi-super-nintendo","dragon-quest-v-tenkuu-no-hanayome-playstation-2","dragon-quest-monsters-caravan-heart","dungeons-dragons-tower-of-doom-sega-saturn","earth-seeker-wii","emerald-dragon-pc-engine-cd","farland-symphony-pc","final-fantasy-type-0-psp","final-fantasy-x-2-last-mission-ps2","fire-emblem-fuuin-no-tsurugi-game-boy-advance","fire-emblem-gaiden-nintendo-entertainment-system","fire-emblem-monshou-no-nazo-super-nintendo","fire-emblem-path-of-radiance-nintendo-gamecube","fire-emblem-shadow-dragon-and-the-blade-of-light-nintendo-entertainment-system","fire-emblem-shin-monshou-no-nazo-hikari-to-kage-no-eiyuu-nintendo-ds","fire-emblem-thracia-776-super-nintendo","front-mission-2-playstation","front-mission-5-scars-of-the-war-playstation-2","fushigi-no-dungeon-fuurai-no-shiren-3-portable-playstation-portabl","god-eater-2-psp","grand-knights-history-psp","gyakuten-kenji-2-nintendo-ds","hybrid-front-sega-genesis-mega-drive","idolmaster-sp-perfect-sun-wondering-star-missing-moon-psp","ikenie-no-yoru-wii","illusion-city-msx","illusion-of-gaia-super-nintendo","j-b-harold-blue-chicago-blues-sega-saturn","jesus-kyoufu-no-bio-monster-nintendo-entertainment-system","jingle-cats-playstation","jojo-no-kimyou-na-bouken-ougon-no-kaze-playstation-2","jump-ultimate-stars-nintendo-ds","kaeru-no-tame-ni-kane-wa-naru-game-boy","kidou-senshi-gundam-gundam-vs-gundam-next-plus-psp","king-s-field-playstation","kingdom-hearts-ii-final-mix-playstation-2","konjiki-no-gash-bell-go-go-mamono-fight-nintendo-gamecube","kurohyou-ryu-ga-gotoku-shinshou-psp","la-mulana-pc","la-pucelle-ragnarok-playstation-portable","langrisser-iv-playstation","linkle-liver-story-sega-saturn","live-a-live-super-nintendo","l-o-l-lack-of-love-dreamcast","lsd-dream-emulator-playstation","magical-date-operation-heart-throb-playstation","magna-carta-the-phantom-of-avalanche-pc","maple-story-ds-nintendo-ds","marie-to-elie-no-atelier-salburg-no-renkinjutsushi-1-2-playstation-2","metal-gear-msx2-msx","mizzurna-falls-playstation","monster-hunter-portable-3rd-playstation-portable","mother-1-2-game-boy-advance","mother-3-game-boy-advance","mushishi-amefuru-sato-nintendo-ds","namco-x-capcom-playstation-2","nanatsu-no-hikan-senritsu-no-bishou-dreamcast","nayuta-no-kiseki-psp","one-piece-romance-dawn-psp","ougon-no-kizuna-wii","patlabor-mega-drive-genesis","persona-2-innocent-sin-playstation","pocket-monsters-green-version-game-boy","pokemon-trading-card-game-2-game-boy","pokemon-fushigi-no-dungeon-ikuzo-arashi-no-boukendan-wii","policenauts-playstation","popolocrois-monogatari-2-playstation","poporogue-playstation","princess-crown-sega-saturn","progenitor-pc98","puyo-puyo-n-dreamcast","radirgy-generic-nintendo-gamecube","rainbow-cotton-dreamcast","ranma-1-2-akanekodan-teki-hihou-super-nintendo","rent-a-hero-no-1-dreamcast","rockman-forte-super-nintendo","rogue-hearts-dungeon-playstation-2","rhythm-tengoku-game-boy-advance","sakura-wars-2-sega-saturn","screaming-mad-george-s-paranoiascape-playstation","seiken-densetsu-3-super-nintendo","shadow-tower-abyss-playstation-2","shin-megami-tensei-playstation","shin-megami-tensei-super-nintendo","shin-megami-tensei-ii-super-nintendo","shin-megami-tensei-if-super-nintendo","shin-megami-tensei-nocturne-playstation-2","shining-force-iii-scenario-1-sega-saturn","shinrei-jusatsushi-taroumaru-sega-saturn","silhouette-mirage-sega-saturn","soul-eater-battle-resonance-playstation-2","soul-eater-monotone-princess-wii","splatter-world-nes","super-famicom-wars-super-nintendo","super-robot-taisen-a-portable-playstation-portable","super-robot-taisen-gc-nintendo-gamecube","super-robot-taisen-j-game-boy-advance","super-robot-taisen-og-original-generations-playstation-2","sword-art-online-infinity-moment-psp","sword-of-the-berserk-guts-rage-dreamcast","tactics-ogre-let-us-cling-together-super-nintendo","tales-of-phantasia-playstation","tales-of-rebirth-playstation-2","tear-ring-saga-yutona-eiyuu-senki-playstation","tengai-makyou-zero-super-nintendo","the-human-weapon-dead-fox-nes","the-hybrid-front-genesis-mega-drive","the-legend-of-sword-fairy-pc","time-travelers-3ds","tobal-2-playstation","tomodachi-collection-nintendo-ds","toradora-portable-playstation-portable","toukiden-kiwami-psp","tsukihime-pc","vampire-panic-playstation-2","variable-geo-pc98","waku-waku-puyo-puyo-dungeon-sega-saturn","welcome-house-2-keaton-and-his-uncle-playstation","wizardry-vi-bane-of-the-cosmic-forge-sega-saturn","wonder-trek-playstation","yaku-playstation","yu-gi-oh-5d-s-tag-force-6-psp","yu-gi-oh-arc-v-tag-force-special-psp","zangeki-no-reginleiv-wii","zanma-chouougi-valhollian-sega-saturn","zero-tsukihami-no-kamen-wii","zoids-vs-iii-nintendo-gamecube","link-to-darkuni-mega-list-of-steam-deck-video-tutorials","alternatives-to-popular-games-that-don-t-work-on-linux-steamos-and-steam-deck","a-hacker-s-essential-toolkit","an-idiots-guide-to-setting-up-minecraft-on-steam-deck-steamos-with-controller-support","an-introduction-to-understanding-hacking-8-bit-graphics-a-tutorial","arcade-roms-with-actual-names","beginner-s-snes-hacking-guide","bloodborne-on-pc-a-guide","definitive-guide-to-rom-hacking-for-complete-beginners","emudeck-beginners-guide","emudeck-help-site","emulation-guide-1-by-sahbito","emulation-guide-2-by-sahbito","gba-and-ds-rom-hacksing-guide","hacking-games-in-hex-sega-genesis-edition","how-to-dump-roms-all-systems","how-to-patch-a-rom","how-to-get-battlefield-3-and-battlefield-4-online-working-on-linux-steamos-steam-deck","how-to-install-hd-textures-for-duckstation","how-to-install-hd-textures-for-pcsx2","how-to-install-hd-textures-for-ppsspp","how-to-install-hollow-knight-silksong-modson-linux-steamos-and-steam-deck","how-to-play-games-from-gog-and-epic-games-on-linux-steamos-and-steam-deck","how-to-setup-openmw-for-modern-morrowind-on-linux-steamos-and-steam-deck","minecraft-on-steam-deck","physx-fix-for-linux-steam-deck","rom-hacking-101","rom-hacking-102-font-and-sprites","rom-hacking-103-script-insertion","rom-hacking-104-compression-scheme","rom-hacking-psp-basics","solution-to-slow-download-speeds-on-steam-deck-1","solution-to-slow-download-speeds-on-steam-deck-2","the-playstation-translation-doc","waydroid-on-steamos-android-on-steam-deck","banjo-kazooie-recompilation","ghostship-mario-64-pc-port","super-monkey-ball-web-browser-game","star-wars-battlefront-ii-private-server-and-mod-launcher","the-witcher-3-witcher-online","fallout-new-vegas-talk-of-the-town-relationships-marriage-and-more","black-mesa-military","fallout-3-fallout-legends","starfield-lakin-ik","assassin-s-creed-victory-project","virtua-racing-recompilation","mega-man-zero-3-decompilation","new-super-mario-bros-u-decompilation","mega-man-64-recompilation","mobhold","beep-8","sonic-r-r-r","psydoom","bitcraft-mmorpg-open-source-server-code","shizuku-pc98","bubble-bobble-lost-cave-c64","elder-scrolls-iii-morrowind-rebirth","luanti","surge-engine","substance-wars-64","fallout-new-vegas-enhanced-animations-3rd-person-movement","mega-man-world-dr-wily-s-revenge-dx","super-mario-land-dx","super-mario-land-2-dx","wario-land-super-mario-land-3-dx","metroid-ii-ejrtq-colorization","final-fantasy-adventure-dx","donkey-kong-land-dx","donkey-kong-land-2-dx","donkey-kong-land-3-dx","pokemon-red-dx","revenge-of-the-gator-gold-dx","spanky-s-quest-dx","balloon-kid-dx","alleyway-dx","snoopy-s-magic-show-dx","bomb-jack-dx","amazing-penguin-dx","dr-mario-dx","galaga-galaxian-dx","zelda-s-adventure-remastered","beavis-and-butt-head-do-hollywood-playstation","persona-3-fes-decompilation","pokemon-heartgold-soulsilver-decompilation","the-last-of-us-demake-browser-game","ys-v-lost-kefin-kingdom-of-sand-playstation-2","star-quest-1-in-the-27th-century","2048","cod-community-launcher-plutonium","cod-community-launcher-horizonmw","animal-crossing-deluxe","team-fortress-2-classified","mamono-hunter-mai","harry-potter-and-the-order-of-the-phoenix","isocity","isocoaster","shattered-pixel-dungeon","unvanquished","warsow","ghosts-n-goblins-2","tales-of-phantasia-x-psp","banjo-kazooie-recompilation-mods","prince-of-persia-the-sands-of-time-remastered","osu-lazer","red-eclipse","the-mana-world","tales-of-maj-eyal","openspades","supertux","openclonk","simutrans","open-imperium-galactica","openarena","freedroidrpg","stunt-rally","spring-1944","megaglest","bzflag","freegish","angband","planeshift","rigs-of-rods","enemy-territory-legacy","pingus","tuxemon","triplea","alien-arena","magarena","star-ruler-2","ryzom","red-runner","opensa","elona","remnants-of-the-precursors","tremulous","terasology","dead-ascend","limit-theory-redux","neverball","mk48-io","friking-shark","the-lord-of-the-rings-conquest-dlc-modded-online-support","the-lord-of-the-rings-conquest-mordorwide-online-servers","shadows-of-the-past-formerly-the-lord-of-the-rings-conquest-reimagined","dead-rising-prototype","all-japan-women-s-pro-wrestling-queen-of-queens-pcfx","fallout-4-heather-companion-mod","crw-metal-jacket-pc98","tuned-heart-pc98","pokemon-inritum","delivery-beyond","lode-runner-nintendo-ds","rockman-forte-snes","dragon-ball-kai-ultimate-butouden-nintendo-ds","chobits-chiidake-no-hito-ps2","junk-runner-64","brogue-community-edition","ivan","shamogu","harmonist-dayoriah-clan-infiltration","oathbreaker","shadow-of-the-wyrm","sil-q","hyperroque","barotrauma","mindustry","ultrastar-deluxw","stepmania","space-station-silicon-valley-recompilation","emudevz","station-heroes-for-hire","openblok","pysol-fan-club-edition","augustus","oni-remaster-mod","red-dead-redemption-2-texture-pack","resident-evil-hd-remaster-4k-texture-pack","supertux-3d","open-realm-of-stars","ghostship-mario-64-pc-port-hd-texture-pack","the-witcher-3-dawn-over-kovir","minima","anteform","mother-encore","project-kat","the-freak-circus","mario-kart-wii-deluxex","sonic-megamix-mania","final-fight-enhanced-edition-amiga","cold-case","grand-theft-auto-ready2play","orbhold","wonder-project-j2-decompilation","kula-world-32x-port","castlevania-1-fortified-army","chiaki-ng","steam-deck-guide","awesome-steam-deck","rog-ally-steam-deck-ultimate-windows-guides","heart-of-the-alien-n64-port","super-mario-64-remake","assassin-s-creed-director-s-cut-remastered","walfie-s-nonograms","celeste-classic-psx","sonic-the-hedgehog-xa","oldunreal-game-installers","super-mario-cd-super-mario-64-for-the-ps1","friends-adrift","magic-castle","mario-kart-double-dash-retro-track-grand-prix","bangai-o-n64","openciv3","isometric-games-don-t-exist","xenosaga-episode-i-der-wille-zur-macht-decompilation","touhou-koumakyou-the-embodiment-of-scarlet-devil-decompilation","fallout-the-new-west","cyberpunk-2077-the-apex-sonora-canyon-and-safehouse-mod","black-white-2","zoo-tycoon-complete-collection","black-white","sim-ant","mechwarrior-4-mercenaries","the-movies","harry-potter-and-the-sorcerer-s-stone","sonic-heroes","disney-s-tarzan","the-lord-of-the-rings-the-battle-for-middle-earth-ii","adidas-power-soccer","spiderman-web-of-shadows","spiderman-shattered-dimensions","mushroom-heaven","the-beatles-adventures-in-pepperland","ghost-recon-advanced-warfighter-1-and-2","of-mice-and-mechs","pikmin-12","nhl-94-fight-edition","sword-of-mana-quickmenu","snoopy-vs-the-red-baron","state-of-emergency","rise-of-nations-rise-of-legends","super-mariomon","wario-land-4-perfect-version","wario-land-4-jungle-rumble","goodboy-galaxy-emulator-rumble-patch","a-more-modern-amazing-mirror","a-more-modern-amazing-mirror-with-coloured-outlines","a-more-modern-nightmare-in-dream-land","fire-emblem-sacred-stones-reforged","rhythm-heaven-silver-gameboy-advance","smas-smb-lost-levels-brick-fix","super-mario-world-mix","yu-gi-oh-the-eternal-duelist-soul-hack","castlevania-aria-of-sorrow-reprise","castlevania-aria-of-sorrow-definitive-edition","contra-hard-corps-hit-points-restoration-hack","super-luigi-rpg-star-powered","super-metroid-arcade","zelda-ii-amida-s-curse","zelda-ii-resurrection-of-ganon","super-mario-kart-horizons","the-legend-of-zelda-allhallows-eve","legend-of-the-mana-sword","close-combat-first-to-fight","the-legend-of-zelda-spirit-tracks-d-pad-controls","wwf-raw","the-legend-of-zelda-phantom-hourglass-d-pad-patch","turok-evolution","paraworld","dreamcast-image-builder-for-modding-patching-dreamcast-games","dreamcast-image-builder-mods","wowee-world-of-warcraft-engine-experiment","mystical-ninja-starring-goemon-recompilation-mods","harry-potter-and-the-deathly-hallows-part-1","shaun-white-skateboarding","sol-survivor","tom-clancy-s-h-a-w-x-2","wrc-fia-world-rally-championship","harry-potter-and-the-deathly-hallows-part-2","jurassic-park-the-game","virtua-tennis-4","farming-simulator-2009","heroes-over-europe","super-junkoid-dx","yoshi-s-island-no-crying-improved-sfx-and-red-coins","hyper-metroid","super-metroid-project-base","super-metroid-subversion","super-ghouls-n-ghosts-restoration-and-super-arthur","the-legend-of-zelda-ancient-dungeon","terminator-salvation","the-warriors-street-brawl","tom-clancy-s-h-a-w-x","motocross-madness","motocross-madness-2","rockman-exe-phantom-of-network-pc-port","pariah","onimusha-3-demon-siege","gunners-heart","dynasty-warriors-5","dynasty-warriors-4","driv3r","conflict-global-terror","true-crime-new-york-city","sonic-riders","micro-machines-v4","blazing-angels-squadrons-of-wwii","bionicle-heroes","billy-hatcher-and-the-giant-egg","universe-at-war-earth-assault","mercenary-x-sky-striker","phantasy-star-universe-ambition-of-the-illuminus","infernal","enemy-territory-quake-wars","blacksite-area-51","assault-heroes","a-farewell-to-dragons","zoo-tycoon-2-ultimate-collection","turning-point-fall-of-liberty","the-incredible-hulk","shaun-white-snowboarding","samurai-warriors-2","rayman-raving-rabbids-2","kung-fu-panda","dynasty-warriors-6","lotus-challenge","south-park-chef-s-luv-shack","frogger-returns","flash-traffic-city-of-angels","jimmy-white-s-cueball-world","crazy-cars-iii","bloodwings-pumpkinhead-s-revenge","pirates-gold","grand-prix-500-2","dreamweb","pga-tour-golf-486","mad-dog-ii-the-lost-gold","who-shot-johnny-rock","secret-mission","paperboy-2","monkey-island-2-lechuck-s-revenge-ultimate-talkie-dos-edition","jimmy-white-s-2-cueball","international-sensible-soccer","hell-a-cyberpunk-thriller","championship-manager-97-98-with-18-19-updatemod","speedball-2-brutal-deluxe","cool-spot","time-gal","project-x-special-edition-93","ghostly-desires","monopoly-casino","ripper","wolfpack","lotus-the-ultimate-challenge","beavis-butt-head-mini-games","worms-the-director-s-cut","star-wars-chess","voyeur-ii-watching-is-not-enough","space-invaders","star-wars-episode-i-battle-for-naboo","night-trap","mad-dog-mccree","harvester","crash-time-iii","worms-remastered","star-wars-force-commander","the-secret-of-monkey-island-1-2-original-versions-with-speech-mod","crash-time-4-the-syndicate","star-wars-trilogy-arcade","hooligans-storm-over-europe","007-nightfire","outrun-2006-coast-2-coast","call-of-duty-goy-edition","gore-ultimate-soldier","global-operations","the-wheel-of-time","the-day-the-world-broke","the-dark-eye","take-no-prisoners","synnergist","stratosphere-conquest-of-the-skies","star-trek-the-next-generation-a-final-unity","spaceship-warlock","shadow-of-the-beast-collection","perihelion-the-prophecy","alien-legacy","nightlong-union-city-conspiracy","mummy-tomb-of-the-pharaoh","master-of-dimensions","martian-gothic-unification","lifeforce-tenka","iron-assault","gunman-chronicles","gothos","gadget-collection","future-cop-lapd","frankenstein-through-the-eyes-of-the-monster","faust-seven-games-of-the-soul","evil-dead-hail-to-the-king","elvira-collection","drowned-god","death-gate","daughter-of-serpents","companions-of-xanth","commander-blood","biosys","black-dahlia","burn-cycle","blue-heat","abomination-the-nemesis-project","nightmare-creatures","pro-evolution-soccer-collection","f1-2014","007-legends","fifa-17-super-deluxe-edition","fifa-15","fifa-08","fifa-13","fifa-12-euro-2012","fifa-11","wings-of-glory","vengeance-of-excalibur","twilight-2000","touche-the-adventures-of-the-fifth-musketeer","total-distortion","tom-clancy-s-ssn","times-of-lore","their-finest-hour-the-battle-of-britain-complete","the-terminator-skynet","the-terminator-future-shock","the-terminator-2029-deluxe-cd-edition","the-scroll","the-orion-conspiracy","the-lost-vikings","the-lost-files-of-sherlock-holmes-the-case-of-the-serrated-scalpel","the-lost-files-of-sherlock-holmes-the-case-of-the-rose-tattoo","the-gene-machine","the-daedalus-encounter","the-clue","spirit-of-excalibur","space-hulk","silent-hunter-commander-s-edition","secret-weapons-of-the-luftwaffe-complete","seal-team","ringworld-revenge-of-the-patriarch","return-to-ringworld","reach-for-the-skies","rama","private-eye","premier-manager-3","plan-9-from-outer-space","pacific-strike-complete","operation-stealth-james-bond-007-the-stealth-affair","oh-no-more-lemmings","noir-a-shadowy-thriller","neuromancer","nascar-racing-2","nascar-racing","jungle-strike","midwinter-ii-flames-of-freedom","midwinter","microsoft-flight-simulator-v5-1-complete","metaltech-earthsiege-complete","mechwarrior-2-mercenaries","mechwarrior-2-ghost-bear-s-legacy","mechwarrior-2-31st-century-combat","mechwarrior","lost-in-time","lemmings-2-the-tribes","lemmings","kgb-conspiracy","journey-the-quest-begins","jane-s-combat-simulations-longbow-gold","j-r-r-tolkien-s-the-lord-of-the-rings-vol-ii","j-r-r-tolkien-s-the-lord-of-the-rings-vol-i","burnout-2-point-of-impact","burnout-3-takedown","innocent-until-caught-2-presumed-guilty","innocent-until-caught","indycar-racing-ii","indycar-racing-complete","inca-ii-nations-of-immortality","inca","hopkins-fbi","ghosts","geisha","future-wars-adventures-in-time","fascination","fade-to-black","fable","athens-2004","ecstatica-ii","ecstatica","dungeon-master-ii-the-legend-of-skullkeep","dungeon-master","dune-ii-the-battle-for-arrakis","dune-2000","dune","druid-daemons-of-the-mind","dreamweb","discworld-ii-missing-presumed","discworld","destruction-derby","desert-strike-return-to-the-gulf","dark-seed-ii","dark-seed","conan-the-cimmerian","circuit-s-edge","chuck-yeager-s-air-combat","buck-rogers-matrix-cubed","buck-rogers-countdown-to-doomsday","beavis-and-butt-head-in-virtual-stupidity","alien-virus","alien-logic","aces-over-europe","aces-of-the-pacific-complete","aces-of-the-deep-complete","a-10-tank-killer","warcraft-iii-complete-edition","the-sims","the-lord-of-the-rings-the-battle-for-middle-earth","the-house-of-the-dead","the-house-of-the-dead-3","the-house-of-the-dead-2","teenage-mutant-ninja-turtles-2-battle-nexus","sydney-2000","starcraft","spiderman-the-sinister-six","spiderman-2-activity-center","sega-worldwide-soccer","reservoir-dogs","re-volt","pac-man-all-stars","nba-live-2004","microsoft-train-simulator","microsoft-combat-flight-simulator-2-ww-ii","manx-tt-super-bike","lotus-challenge","age-of-mythology","fear","dave-mirra-freestyle-bmx","cyber-troopers-virtual-on","crazy-taxi","colin-mcrae-rally-04","blazing-angels-2-secret-missions-of-wwii","beetle-crazy-cup","atlanta-1996","secret-of-mana-reborn","the-third-of-the-third-street-fighter-iii-3rd-strike-decompilation","dragon-ball-z-budokai-hd-recompiled","blue-dragon-recompilation","pyrite64-n64-game-engine-and-editor-using-libdragon-tiny3d","streets-of-rage-2-andore-s-rampage","monster-hunter-portable-3rd-psp","what-a-mario-world","aurora-os-js","fallout-vault-666","ikemen","pasta-la-vista-super-mario-bros","embers-of-mana","star-wars-jedi-survivor-camera-and-animation-stutter-fix","usurper-reborn","valkyria-chronicles-3-psp","ninja-gaiden-ii-recompilation","the-wind-waker-rewritten","pokemon-crossroads","tetrominos","prize-fighter-heavyweight-edition","metal-gear-solid-v-the-phantom-pain-ground-zeroes","the-tairyou-jigoku-ps2","keitai-world-launcher","duke-nukem-zero-hour-recompilation-first-person-mod","fallout-new-vegas-for-a-few-brahmin-more","bloodborne-hardborne-overhaul-mod","cyberpunk-2077-unofficial-dlc-2","castlevania-order-of-shadows-golden-belmont","nx-optimizer","forza-motorsport-2","forza-motorsport-3","forza-motorsport-4","forza-horizon","forza-horizon-2","forza-horizon-2-presents-fast-and-furious","forza-horizon-3","forza-motorsport-7","readym","a-super-mario-world","legend-of-mana-decompilation","silent-hill-3-decompilation","chrono-cross-decompilation","crash-tag-team-racing-gamecube-decompilation","kirby-s-dream-collection-decompilation","dog-s-life-decompilation","halo-reach-decompilation","pokemon-xd-gale-of-darkness-decompilation","the-legend-of-zelda-ocarina-of-time-dreamcast-port","resident-evil-requiem-xenomorph-mod","star-wars-first-assault","celeste-classic-sega-saturn-port","rise-of-the-tomb-raider-hd-4k-8k-texture-collection","perfect-dark-pc-port-friends-of-joanna-4-player-counter-co-operative-mod","pokemon-aether-white-2","bugdom","bugdom-2","billy-frontier","mighty-mike-power-pete","nanosaur","nanosaur-2","otto-matic","dungeon-keeper-in-browser","multiplayer-mods-mega-list","breath-of-fire-definitive-edition","breath-of-fire-ii-definitive-edition","starfield-stfi-hd-landscape-4k","fallout-4-padre-mateo-a-quest-mod","resident-evil-village-high-textures-mod","the-witcher-3-kaer-morhen-extended-edition","zombie-panic","lupin-iii-the-sage-of-pyramid-sega-saturn","bubble-buddies","animal-crossing-pc-port","red-dead-redemption-2-blurbs-pokemon-rpg","paprium-online-multiplayer","minecraft-arnis","baldur-s-gate-3-baldur-s-gate-1-remake-demo","animal-crossing-pc-port-hd-texture-pack","resident-evil-requiem-vr-mod","deckops","oblivion-remastered-citylord-series-the-fight-club","oblivion-remastered-battlehorn-castle-expansion","klonoa-empire-of-dreams-decompilation","black-white-decompilation","monster-hunter-portable-2nd-g-decompilation","new-play-control-pikmin-decompilation","new-play-control-pikmin-2-decompilation","tetris-browser-based","crimson-desert-ahk-hotkeys-for-jogging-sprint-and-esc-menus","bomberman-64-recompilation","mhserveremu-marvel-heroes-mmo-fan-server","heretic-ii-source-port","re-enhance","batman-arkham-origins-advanced-graphics","fire-emblem-path-of-radiance-decompilation","alone-in-the-dark-decompilation","sheep-wolf-n-dog-decompilation","the-legend-of-zelda-the-wind-waker-4k-texture-pack","friday-the-13th-revisited","blaze-and-blade-busters-playstation","digimon-world-decompilation","the-legend-of-zelda-spirit-tracks-decompilation","lego-city-undercover-decompilation","mortal-kombat-2-3do-port","fallout-new-vegas-the-unforgiven-redux","40-winks-gameboy-colour","teknoparrot","monster-hunter-stories-3-twisted-reflection-hd-texture-pack","pilotwings-64-decompilation","rexglue-xbox-360-recompilation-runtime-and-toolkit","banjo-kazooie-nuts-and-bolts-recompilation","ninja-gaiden-2-recompilation","halo-3-delta-recompilation","viva-pinata-trouble-in-paradise-recompilation","fallout-new-vegas-retribution-redux","pekka-kana-2","tecnoballz","h-craft-championship","hero-of-allacrost","valyria-tear","tenmado","hurrican","the-secret-chronicles-of-dr-m","gravity-bone","enigma","starflight-the-lost-colony","pocket-palm-heroes","transball-gl","einstein-puzzle","surge-the-rabbit","q3rally","open-hexagon","double-damnation","solaris","naikari","opensoldat","the-powder-toy","opendungeonsplus","shapez","super-mario-bros-sega-master-system-port","street-fighter-iii-3rd-strike-psp-port","adventure-on-eos","worms-armageddon-open-source-re-implementation","yorg","scorched3d","vega-strike","liberation-circuit","deer-portal","dust-racing-2d","steam-sky","astromenace","world-of-padman","cave-story-sega-megadrive-port","ridge-racer-collection-with-online-play","silent-hill-2-decompilation","seen-in-liberty-city-gta-3-psp-remake","starfield-neonexpansion","advanced-strategic-command","caveexpress","wyrmsun","shadow-over-the-twelve-lands","bos-wars","retux","maelstrom","sdl-scavenger","sdl-asylum","noctis-iv-plus","tony-hawk-s-underground","onifoxed","magical-broom-extreme","hoverrace","roadfighter","f1-spirit","super-methane-brothers","gardens-of-kadesh","skyrim-special-edition-new-dawn-redux-modlist","fallout-new-vegas-decompilation","opennotrium","elite-reinforce","seven-kingdoms-ancient-adversaries","rigelengine-re-implementation-duke-nukem-ii","open-iw","freesynd-re-implementation-of-syndicate","jftekwar-tekwar-port","commander-genius","dethrace-labs","bioshock-the-war-in-rapture","skyrim-special-edition-through-fire-and-war-a-morrowind-inspired-quest","terminal-breeder","tomb-raider-n64-port","the-legend-of-zelda-majora-s-mask-ps-vita-port","devil-may-cry-4-refrain-vita","the-legend-of-zelda-ocarina-of-time-ps-vita-port","animal-crossing-ps-vita-port","baldur-s-gate-dark-alliance-ps-vita-port","unreal-ps-vita-port","arx-libertatis-ps-vita-port","super-mario-all-stars-ps-vita-port","super-mario-world-ps-vita-port","perfect-dark-ps-vita-port","the-legend-of-zelda-a-link-to-the-past-ps-vita-port","portforge-a-de-recompilation-port-manager","final-fantasy-viii-decompilation","1080-snowboarding-decompilation","pokemon-ranger-shadows-of-almia-decompilation","tiny-dec-educational-decompiler-that-helps-people-understand-how-decompilation-works","ghostship-mario-64-ps-vita-port","starship-starfox-64-ps-vita-port","star-warfare-alien-invasion-ps-vita-port","mario-s-modules-2","mega-man-dxtreme","openmw-morrowind-ps-vita-port","pokemon-light-platinum-ds","tiny-bullets-playstation","battleship-smash-brothers-64-pc-port","bomberman-hero-recompilation","mario-kart-64-ps-vita-port","tomb-raider-side-scroller-edition","the-legend-of-zelda-the-minish-cap-pc-port","librelancer","resident-evil-requiem-for-ravenholm","paper-mario-star-nova","parasite-eve-2-decompilation","warioware-inc-decompilation","animal-crossing-gamecube-web-port","flare","triggerheart-exelica-dreamcast","dusklight-the-legend-of-zelda-twilight-princess-pc-port","paperboy-64-decompilation","evos-space-adventures-decompilation","ultima-v-warriors-of-destiny-decompilation","tokyo-bus-guide-decompilation","armored-trooper-votoms-playstation-2","racing-battle-c1-grand-prix-playstation-2","dusklight-the-legend-of-zelda-twilight-princess-pc-port-texture-pack-1","pokemon-snap-3ds-port","ace-driver-arcade-emulator-for-xbox-360","castlevania-sega-master-system-port","spelunkyclassichd","starfield-star-wars-resources-galaxy","star-fox-64-psp-port","beat-hazard-2-ps-vita-port","vitadb-downloader","universal-dreamcast-patcher","r-c-pro-am-snes-port","goopie-xbox-360-recompilation-launcher","kameo-elements-of-power-recompilation","lollipop-chainsaw-recompilation","naughty-bear-recompilation","destroy-all-humans-path-of-the-furon-recompilation","ecstatica-1-and-2-recompilation","nesrecomp-nes-recompiler-project","castlevania-symphony-of-the-night-gbc","animal-crossing-gbc","blasnesmous-blasphemous-nes-demake","magiczna-kula-papatki-decompilation","return-to-castle-wolfenstein-ps-vita-port","ps2recomp-playstation-2-static-recompiler-runtime-tool-to-make-native-pc-ports","terranigma-redux","five-nights-at-freddy-s-3-wii-edition","quetoo","wcw-nwo-revenge-starrcade-edition","grand-theft-auto-san-andreas-carcer-city","grand-theft-auto-5-squid-games","saints-row-2-console-dlc-for-pc","battleship-smash-brothers-64-pc-port-netplay","real-robots-final-attack-playstation","sonic-advance-3-sp","wwe-smackdown-vs-raw-2007-recompilation","recut-paper-mario-recompilation","gradius-generation-black-label","snesrecomp","super-mario-world-recompilation","the-legend-of-zelda-a-link-to-the-past-recompilation","mega-man-x-recompilation","pokemon-crystal-pc-port","banjo-kazooie-recompiled-stereoscopic-3d","perfect-dark-recompiled-stereoscopic-3d","phantasy-star-generation-2-ps2","daytona-usa-recompilation","morrowind-muffinwind-rebaked","skate-3-recompilation-1","skate-3-recompilation-2","lost-odyssey-recompilation","the-outfit-recompilation","test-drive-unlimited-recompilation","rock-band-3-recompilation","eternal-sonata-recompilation","castlevania-legacy-of-darkness-recompilation","unreal-tournament-ps-vita-port","resident-evil-4-mobile-ps-vita-port","pac-man-championship-edition-dx-ps-vita-port","call-of-duty-black-ops-zombies-ps-vita-port","marvel-s-spider-man-2-first-person-camera-mod","recompone-static-psone-recompiler","soul-blazer-snes","rushing-beat-shura-the-eternal-conflict-snes","kowloon-s-gate-playstation","dusklight-the-legend-of-zelda-twilight-princess-pc-port-web-browser-build","pokemon-stadium-recompilation","goldeneye-xbla-recompilation","paper-mario-down-bad-edition","snes-cheat-patcher-studio-apply-game-genie-cheats-to-snes-roms","silent-hill-pc-port","super-mario-64-nintendo-ds-port-with-multiplayer","earthbound-beginnings-remake","fire-emblem-seima-no-kouseki-decompilation","star-wars-rogue-squadron-ii-rogue-leader-decompilation","homeworld-2-classic-decompilation","wolfenstein-3d-atari-lynx-port","ironclad-xbox-360","resident-evil-4-multiplayer-mod","dariusburst-sp-ps-vita-port","a-bite-at-freddy-s-ps-vita-port","colin-mcrae-rally-2-0","colin-mcrae-rally","snowboard-kids-decompilation","god-hand-decompilation","wwe-2k16","wwe-2k17","wwe-2k18","wwe-2k19","wwe-2k20","wwe-2k22","wwe-2k23","starship-troopers-terran-ascendancy","ghostbusters-the-video-game","dexter-the-game","house-m-d","mechcommander-gold","mechcommander-2","onimusha-3-demon-siege","forza-horizon-4","colin-mcrae-dirt","tom-clancy-s-ghost-recon-advanced-warfighter","tom-clancy-s-ghost-recon-advanced-warfighter-2","star-trek","the-lord-of-the-rings-war-of-the-ring","peaky-blinders-mastermind","tony-hawk-s-pro-skater-2","tony-hawk-s-pro-skater-3","tony-hawk-s-underground","tony-hawk-s-underground-2","tony-hawk-s-pro-skater-hd","grand-theft-auto-2","mlb-2k9","mlb-2k10","mlb-2k11","prison-break-the-conspiracy","tonic-trouble","the-neverhood","disney-s-g-force","sheep-dog-n-wolf","csi-3-dimensions-of-murder","star-trek-legacy","lost-via-domus","nba-playgrounds","nba-2k-playgrounds-2","deep-black-reloaded","cabela-s-dangerous-hunts-2013","pirates-of-the-caribbean-at-worlds-end","friday-the-13th-killer-puzzle","lego-2k-drive","madden-nfl-08","fuser","x2-wolverine-s-revenge","pro-evolution-soccer-2014","pro-evolution-soccer-2015","pro-evolution-soccer-2016","pro-evolution-soccer-2017","pro-evolution-soccer-2018","pro-evolution-soccer-2019","efootball-pes-2020","efootball-pes-2021","banjo-kazooie-recompilation-for-android","alundra-definitive-edition","ancient-ys-vanished-omen-pc-98","deadly-premonition-recompilation","silent-hill-downpour-recompilation","snowboard-kids-2-recompilation","crash-team-racing-pc-port","dolrecomp-a-static-recompiler-for-gamecube-wii-and-experimental-wii-u-cpu-code","smash-remix-project-galleon","openprey","ship-of-harkinian-zelda-ocarina-of-time-port-cel-shaded-model-mod","monster-hunter-dynamic-hunting-ps-vita-port","castlevania-revamped-android-port","ps3recomp-static-recompilation-runtime-libraries-for-playstation-3-titles","premier-eleven-dreamcast","harvest-moon-64-recompilation","dark-lands-ps-vita-port","aleph-one-ps-vita-port","resistance-fall-of-man-resistanceonline","damnation","lego-star-wars-the-video-game","lego-star-wars-ii-the-original-trilogy","horizon-chase-turbo","ace-combat-6-fires-of-liberation-recompilation","resistance-2-rpcs-3-patched-build","1-githublauncher-universal-launcher-for-recompilations-and-pc-ports","nocturnerecomp-castlevania-symphony-of-the-night-xbla-recompilation","metal-slug-xx-recompilation","perfect-dark-vr-port","harvest-moon-64-recompilation-mods","diablo-3-xbox-360-recompilation","kingdom-hearts-358-2-days-decompilation","digimon-world-4-decompilation","halo-3-permafrost","mega-man-x6-recompilation","virtual-pro-wrestling-2-recompilation","tomba-recompilation","wcw-vs-nwo-world-tour-recompilation","grand-theft-auto-3-liberty-extended","grand-theft-auto-vice-city-vice-extended","mega-man-x4-recompilation","virtua-racing-pc-emulation","virtua-fighter-pc-emulation","zool-majyu-charmer-legend-n64","moderngekko-static-recompilation-pipeline-for-gamecube-and-wii-games","the-legend-of-zelda-majora-s-mask-recompilation-for-android","monster-hunter-decompilation","lemmings-paintball-decompilation","dragon-quest-iv-decompilation","crash-bandicoot-the-wrath-of-cortex-decompilation","tenchu-decompilation","mother-encore-ps-vita-port","after-burner-climax-ps-vita-port","gears-of-war-2-pc-port","mischief-makers-recompilation","chameleon-twist-recompilation","wwf-wrestlemania-2000-recompilation","wcw-nwo-revenge-recompilation","wwf-no-mercy-recompilation","virtual-pro-wrestling-64-recompilation","akilauncher-launcher-for-the-aki-engine-n64-wrestling-recompilations","infamous-rpcs-3-patched-build","uncharted-rpcs-3-patched-build","motorstorm-pacific-rift-rpcs-3-patched-build","uncharted-2-rpcs-3-patched-build","wet-rpcs-3-patched-build","dodonpachi-saidaioujou-recompilation","greenvita-xbox-cloud-gaming-on-playstation-vita","pokemon-red-recompilation","kirby-s-return-to-dream-land-recompilation","street-fighter-iii-third-strike-pc-port","heavenly-sword-rpcs-3-build","rain-rpcs-3-build","tokyo-jungle-rpcs-3-build","folklore","pepsiman-recompilation","sega-rally-championship-pc-emulation","starcraft-64-campaign-co-op-mod","undermobile-undertale-android-port","fullmetal-alchemist-3-the-girl-who-succeeds-god-playstation-2","vl-mr-hub-for-browser-based-recompilation-projects","2-quiver-recompilation-launcher","crash-bandicoot-pc-port","smash-remix-extra","saw-pc-patched","crazy-taxi-3-pc-patched","spider-man-friend-or-foe-pc-patched","halo-2-pc-patched","resident-evil-dead-aim-pc-patched","the-simpsons-game-recompilation","hollow-knight-android-port","super-mario-64-android-port","devilutionx-diablo-1-android-port","ship-of-harkinian-the-legend-of-zelda-ocarina-of-time-android-port","brotato-android-port","the-case-of-the-golden-idol-android-port","delta-touch-doom-engine-source-ports-for-android","zeta-touch-raze-and-eduke32-engines-for-android","vcmi-open-heroes-3-heroes-of-might-and-magic-3-for-android","quad-touch-pc-quake-engines-for-android","alpha-touch-90-s-classic-fps-shooters-for-android","openmw-morrowind-for-android","sonic-unleashed-recompilation-for-android","partyboard-mario-party-4-for-android","opencrossing-animal-crossing-for-android","sigma-touch-unreal-and-unreal-tournament-99-engine-for-android","battleship-super-smash-brothers-64-for-android","the-simpsons-hit-run-for-android","perfect-dark-for-android","pokemon-red-blue-and-yellow-recompilation","pokemon-red-blue-and-yellow-recompilation-dramatic-shape-voxel-mod","pokemon-red-blue-and-yellow-recompilation","pokemon-red-blue-and-yellow-recompilation-dramatic-shape-voxel-mod","the-legend-of-zelda-the-minish-cap-for-android","link-s-awakening-dx-hd-for-android","2-starboard-play-games-from-the-portmaster-library-on-your-android-handheld","1-obtainium","switchnow-a-native-nintendo-switch-homebrew-client-for-geforce-now","am2r-for-android","gran-turismo-2-pc-patched","forza-horizon-pc-patched","forza-horizon-2-pc-patched","forza-motorsport-3-pc-patched","forza-motorsport-4-pc-patched","dirge-of-cerberus-final-fantasy-vii-pc-patched","midnight-club-la-complete-edition-pc-patched","gears-of-war-2-pc-patched","vigilante-8-arcade-pc-patched","gears-of-war-3-pc-patched","gun-pc-patched","midnight-club-3-dub-edition-remix-pc-patched","pirates-of-the-caribbean-at-worlds-end-pc-patched","gear-of-war-judgment-pc-patched","fist-of-the-north-star-kens-rage-2-pc-patched","fist-of-the-north-star-kens-rage-pc-patched","naruto-the-broken-bond-pc-patched","naruto-rise-of-a-ninja-pc-patched","dragon-ball-z-ultimate-tenkaichi-pc-patched","dragon-ball-raging-blast-2-pc-patched","dragon-ball-raging-blast-pc-patched","dragon-ball-z-burst-limit-pc-patched","resident-evil-code-veronica-x-pc-patched","fable-ii-game-of-the-year-edition-pc-patched","the-sly-collection-pc-patched","sly-cooper-thieves-in-time-pc-patched","drakengard-1-2-pc-patched","ico-pc-patched","ninja-gaiden-ii-pc-patched","drakengard-3-pc-patched","fatal-frame-trilogy-pc-patched","splatterhouse-pc-patched","haunting-ground-pc-patched","captain-america-super-soldier-pc-patched","dante-s-inferno-pc-patched","gravity-rush-remastered-pc-patched","2010-fifa-world-cup-south-africa-pc-patched","asura-s-wrath-pc-patched","gravity-rush-2-pc-patched","lost-odyssey-pc-patched","blue-dragon-pc-patched","rimdroid-rimworld-launcher-for-android","automobili-lamborghini-recompilation","halo-campaign-evolved-split-screen-co-op-mod","surging-aura-sega-megadrive","diddy-kong-racing-webgpu-android-port","syphon-filter-pc-port","teknoparrot-for-android","super-smash-bros-64-nintendo-ds-port","croc-definitive-edition","mad-monks-revenge-definitive-edition","dominatrix-port-of-sin","colditz-escape","c-dogs-sdl","the-legend-of-zelda-a-link-to-the-past-dual-screen-nintendo-3ds-port","the-legend-of-zelda-a-link-to-the-past-for-android","crash-team-racing-for-android","warcraft-ii-for-android","dune-2-for-android","xash3d-fwgs-engine-for-half-life-blue-shift-opposing-force","goldeneye-recompilation-for-android","golden-balloon-diddy-kong-racing-recompilation","idtech4a-engine-for-doom-iii-quake-4-prey-2006-on-android","lighthouse-banjo-kazooie-pc-port","source-engine-for-android","openrct2-rollercoaster-tycoon-2-for-android","openttd-for-android","corsixth-theme-hospital-for-android","openlara-tomb-raider-engine-for-android","zomdroid-unofficial-project-zomboid-launcher-for-android","openstarbound-for-android","super-mario-maker-world-engine-for-android","counter-strike-1-6-for-android","unturned-for-android","gamenative-run-supported-steam-epic-and-gog-games-locally-on-android","warsmash-warcraft-3-for-android","fallout-community-edition-for-android","fallout-2-community-edition-for-android","daggerfall-for-android","classic-core-unofficial-android-ports-of-classic-game-engines","holotz-s-castle","openjkdf2-dark-forces-2-for-android","openxcom-for-android","exult-ultima-vii-for-android","arx-libertatis-arx-fatalis-for-android","jagged-alliance-2-stracciatella-for-android","julius-caesar-iii-for-android","augustus-caesar-iii-for-android","freeciv-for-android","pokemon-platinum-pc-port","team-fortress-2-reclassic-for-android","rexuiz-for-android","super-mario-bros-remastered-for-android","space-cadet-pinball-for-android","pinball-fx-go-for-android","sonic-roboblast-2-for-android","game-collection-portal-beta-cuphead-buckshot-roulette-and-smm-we-for-android","star-trek-voyager-elite-force-single-player-for-android","star-trek-voyager-elite-force-holomatch-for-android","sdlioq3a-quake-iii-for-android","sonic-mania-plus-for-android","sonic-the-hedgehog-forever-for-android","sonic-2-absolute-for-android","sonic-cd-restored-for-android","render96-for-android","spaghetti-kart-mario-kart-64-recompilation-for-android","starship-starfox-64-recompilation-for-android","ghostship-mario-64-recompilation-for-android","easyrpg-player-for-android","pizza-legacy-pizza-tycoon-port","castlevania-symphony-of-the-night-recompilation","robocop-megadrive-port","teenage-mutant-ninja-turtles-out-of-the-shadows-pc-patched","wipeout-hd-fury-with-multiplayer-pc-patched","jump-force-pc-patched","siren-blood-curse-pc-patched","the-legend-of-spyro-dawn-of-the-dragon-pc-patched","ratchet-and-clank-quest-for-booty-pc-patched","spiderman-3-pc-patched","fight-night-champion-pc-patched","soul-calibur-iv-pc-patched","disgaea-d2-a-brighter-darkness-pc-patched","modnation-racers-pc-patched","demon-s-souls-pc-patched","guitar-hero-metallica-pc-patched","bloodborne-pc-patched","never-dead-pc-patched","god-of-war-3-pc-patched","dragon-s-crown-pc-patched","darkenstein-3d","vandal-hearts-pc-port","mobileuo-ultima-online-mobile-port","pokemon-everworld-online","aleph-one-marathon-trilogy-for-android","supreme-commander-forged-alliance-forged-alliance-forever","pokemon-brown-3d","harvest-moon-64-recompilation-with-dual-screen-support-for-android","dusklight-the-legend-of-zelda-twilight-princess-recompilation-for-android","sonic-triple-trouble-for-android","condemned-2-bloodshot-recompilation","pokemon-gamma-emerald","london-seirei-tanteidan-playstation","godzilla-pc-patched","syphon-filter-2-recompilation","am2r-autopatcher-for-android","banjo-kazooie-switch-port","doom-64-switch-port","super-mario-64-switch-port","the-legend-of-zelda-majoras-mask-switch-port","the-legend-of-zelda-majoras-mask-wii-u-port","star-fox-64-psp-port","perfect-dark-psp-port","super-mario-64-ps4-port","perfect-dark-3ds-port","super-mario-64-3ds-port","super-mario-64-nintendo-dsi-port","banjo-kazooie-vr","super-mario-64-vr","mario-kart-64-vr","star-fox-64-vr","sonic-robo-blast-2-vr","dr-robotnik-s-ring-racers-vr","port-of-the-xash3d-fwgs-half-life-engine-to-oculus-quest","quake-vr","quake-2-on-the-oculus-quest","doom-3-vr","return-to-castle-wolfenstein-for-the-oculus-quest","jedi-knight-games-on-openxr-devices","jedi-knight-games-on-openxr-devices","tomb-raider-vr","prey-vr","razexr-duke-nukem-3d-blood-shadow-warrior-etc","questzdoom-doom-heretic-hexen-strife-etc","metal-gear-solid-fan-remake","the-legend-of-zelda-ocarina-of-time-vr","sega-vs-capcom","infinity-blade-for-android","pokemon-dark-rising-remake","pokemon-dark-rising-remake","ys-iii-wanderers-playstation-2","ys-v-lost-kefin-playstation-2","messenger","dungeon-keeper-in-browser","dusklight-the-legend-of-zelda-twilight-princess-recompilation-in-browser","the-elder-scrolls-iii-morrowind-openmw-in-browser","half-life-2-in-browser","portal-in-browser","diablo-in-browser","3d-pinball-space-cadet-in-browser","wipeout-in-browser","doom-webprboom-in-browser","doom-3-demo-in-browser","quake-quake-wasm-in-browser","quake-2-quake-wasm2-in-browser","arx-fatalis-arxwasm-demo-in-browser","homeworld-gardens-of-kadesh-demo-in-browser","cave-story-in-browser","commander-keen-in-browser","cro-mag-rally-in-browser","descent-descent-ii-dxx-rebirth-in-browser","duke-nukem-3d-belgian-chocolate-duke3d-in-browser","fallout-nevada-sonora-in-browser","might-and-magic-ii-fheroes2-in-browser","prince-of-persia-in-browser","tyrian-opentyrian-in-browser","tomb-raider-in-browser","super-monkey-ball-in-browser","tetris-in-browser","the-last-of-us-demake-in-browser","cyberpunk-2077-vr","call-of-duty-4-modern-warfare-vr","bioshock-remastered-vr","skyrim-vr","resident-evil-requiem-vr","silent-hill-2-vr","eternal-sonata-recompilation","call-of-duty-black-ops-zombies-for-android","donkey-kong-land-pc-remake","the-legend-of-zelda-breath-of-the-wild-vr","command-conquer-generals-in-browser","doom-2-in-doom-3","zquest-classic-in-browser","surreal-engine-web-unreal-ut99-in-browser","f-zero-x-pc-port","diddy-kong-racing-recompilation","f-e-a-r-2-project-origin-vr-mod","asobi-remote-play-stream-ps-plus-games-to-steam-deck-or-steam-machine","unreal-tournament-vr","super-mario-64-ds-pc-port","sonic-the-hedgehog-2006-android-port","pokemon-gold-pc-port","pokemon-gold-port-for-android","battlefield-1942-vr","ace-combat-6-recompilation","metroid-prime-origins","the-legend-of-zelda-z-for-2-two-player-simultaneous-co-op","spyro-the-dragon-recompilation","twisted-metal-4-recompilation","the-legend-of-zelda-the-minish-cap-3ds-port","1-the-multiverse-vr-hub","untitled-sonic-fangame","mario-kart-64-3ds-port","street-fighter-aplha-3-recompilation","zenonia-3-ps-vita-port","crash-bandicoot-for-android","world-of-warcraft-for-android","ace-combat-x-recompilation","gta-vice-city-stories-recompilation","tama-adventurous-ball-in-giddy-labyrinth-sega-saturn","hissatsu-sega-saturn","pokemon-blue-vr","ridge-racer-collection","spaghetti-kart-mario-kart-64-pc-port-track-editor","baldur-s-gate-2-enhanced-edition-ps-vita-port","hollow-knight-silksong-for-android","jeb-s-legend-of-zelda","outertale-project-spacetime","five-nights-at-frickbear-s-3","five-nights-at-frickbear-s-3","pokemon-gamma-emerald-early-access","prey-2017-co-op","castlevania-symphony-of-the-night-for-android","goldeneye-007-random-eye-zer-mod","outlast-vr","mine64-minecraft-for-n64-in-browser","sim-copter-reimplementation","dusklight-the-legend-of-zelda-twilight-princess-vr","rage-racer-pc-port","pokemon-dawn-of-darkness-mmorpg","metroid-prime-hunters-recompilation","dragon-ball-z-buu-s-fury-recompilation","chonkcraft-warcraft-2-rebuilt","street-fighter-3-3rd-strike-online-edition-recompilation","jackie-chan-stuntmaster-pc-port","jackie-chan-stuntmaster-pc-port-steam-deck-fork","fallout-new-vegas-tale-of-two-wastelands","sonic-4-episode-1-in-browser","sonic-the-hedgehog-for-android","sonic-the-hedgehog-2-for-android","lighthouse-banjo-kazooie-port-for-android","lighthouse-banjo-kazooie-ps-vita-port","tony-hawk-s-project-8-recompilation","mega-man-x-regenesis","grand-theft-auto-vice-city-vr","minecraft-story-mode-ps-vita-port","1-the-multiverse-vr-hub","zelda-ii-the-adventure-of-link-co-op","resident-evil-4-vr","jedi-knight-dark-forces-ii-xbox-port","yu-gi-oh-forbidden-memories-recompilation","dontforget","dontforget","ribbit-the-deltarune-mod","kirby-battle-blitz","mega-man-8-bit-deathmatch","off","freeciv-in-browser","dune-2-in-browser","kiki-the-nano-bot-in-browser","moon-child-fe-in-browser","undertale-2","deltatraveler-deltarune-interdream","skate-3-recompilation-for-android","castlevania-mx","project-gotham-racing-4-recompilation","dragon-quest-viii-masterpiece-reborn-pc-port","dragon-quest-viii-masterpiece-reborn-for-android","amnesia-the-dark-descent-for-android","penumbra-black-plague-for-android","grand-theft-auto-vice-city-in-browser","virtua-cop-2-vr","openxcom-nintendo-3ds-port","command-conquer-64-pc-port","star-wars-masters-of-teras-kasi-recompilation","rampage-through-time-recompilation","system-shock-for-android","red-faction-vr","rpg-maker-ds-create-the-new-world-nintendo-ds","hollow-knight-silksong-dual-screen-android-port","doom-64-ray-tracing","bloody-roar-2-recompilation","terraria-in-browser","celeste-in-browser"],"c":[0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,0,1,1,1,1,1,0,1,0,1,1,0,1,1,2,1,0,2,2,0,1,1,1,0,1,2,0,2,1,2,1,2,2,1,1,1,1,1,0,1,1,1,3,3,1,1,1,2,2,1,1,1,1,2,2,0,1,1,1,1,4,0,1,0,1,0,0,0,1,1,2,5,0,0,0,1,0,1,0,1,6,7,1,8,1,1,1,1,1,6,1,1,8,2,0,0,0,1,1,1,1,2,1,5,9,1,1,1,1,0,1,1,0,1,0,4,1,4,4,1,1,2,1,2,2,2,2,2,1,1,1,1,0,0,0,1,1,0,0,0,1,1,2,1,1,2,1,0,2,0,1,2,1,0,0,6,1,0,1,0,1,1,0,8,8,1,0,1,0,1,1,0,2,1,0,9,1,2,6,4,0,0,0,1,1,0,1,0,0,0,0,0,1,0,1,0,1,1,1,1,5,1,1,1,1,10,10,1,2,8,2,0,11,1,1,0,8,1,0,4,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,5,1,1,1,1,1,1,1,1,1,1,1,1,0,11,1,1,1,1,0,0,0,1,2,1,1,4,1,0,0,4,1,0,0,1,0,1,1,1,0,1,0,0,1,0,1,1,11,0,0,0,0,0,8,1,1,1,1,0,0,0,1,1,1,0,2,0,0,1,1,1,1,0,0,0,0,0,0,0,0,2,0,0,0,0,1,0,1,8,1,1,0,1,0,1,1,1,5,1,3,1,1,1,1,1,0,1,1,2,1,1,6,0,1,1,5,9,9,9,4,5,5,5,1,5,5,5,1,5,5,5,5,8,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,2,5,5,5,5,5,6,5,9,9,9,5,2,5,9,9,5,5,5,5,5,5,5,5,5,5,5,2,5,5,5,5,5,5,5,5,5,5,5,5,5,2,2,3,5,5,5,3,3,5,5,9,5,5,5,2,5,9,5,5,5,5,5,3,5,2,9,5,5,3,5,5,5,2,5,9,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,9,5,5,5,5,2,3,5,5,5,9,5,9,5,9,5,5,5,9,9,3,9,9,9,5,5,9,5,5,2,2,9,9,9,5,9,9,9,9,9,9,5,5,5,5,5,5,9,9,9,4,5,1,5,5,5,5,5,5,5,5,5,5,5,2,9,5,5,1,9,5,5,5,5,5,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,1,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,7,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,6,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,3,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,9,10,10,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,6,9,9,1,4,8,8,8,8,8,8,9,12,12,9,1,1,0,3,4,14,1,8,5,4,0,8,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,1,13,12,12,1,14,1,1,4,4,8,8,11,11,5,5,5,5,5,1,14,9,8,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,11,11,12,13,14,8,14,14,1,1,14,14,14,14,1,5,5,5,5,5,5,5,5,5,5,5,5,9,5,1,5,5,5,8,10,10,5,5,9,8,5,5,1,1,1,1,1,2,1,1,5,12,2,0,4,6,6,6,2,0,10,1,1,5,4,12,1,1,8,14,5,6,12,12,12,8,11,11,11,11,11,11,11,11,11,11,11,11,11,0,0,11,5,0,0,0,11,11,11,0,0,0,0,0,0,0,0,14,0,0,0,0,0,0,0,0,0,0,0,0,0,11,0,11,0,11,11,4,4,5,9,11,11,11,11,11,11,11,11,11,11,0,0,0,0,0,0,0,11,11,11,11,11,3,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,0,12,9,12,4,0,14,1,5,8,1,1,0,8,5,14,12,0,0,5,13,8,14,4,9,8,8,8,1,4,11,11,11,11,11,11,11,11,4,1,12,12,12,12,12,12,12,12,12,8,13,2,10,9,0,5,5,5,5,5,5,5,1,8,0,0,10,8,10,8,8,14,1,9,8,8,5,8,9,8,4,8,8,12,12,12,12,12,5,8,9,4,5,8,10,12,12,12,10,2,14,12,12,12,2,8,13,4,10,12,4,12,12,12,12,8,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,2,2,1,12,5,5,5,5,5,5,5,5,5,2,1,12,8,8,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,12,5,5,5,5,5,5,5,5,5,8,8,5,12,2,2,2,2,2,2,2,2,2,2,2,4,12,12,12,4,2,2,2,0,1,2,0,14,9,9,2,1,9,5,8,8,12,12,1,5,14,9,12,12,12,12,14,14,9,2,4,2,5,8,12,2,4,4,2,4,9,12,12,9,9,9,1,1,1,12,2,4,0,2,5,0,8,8,8,9,14,0,9,9,0,4,9,9,9,9,9,9,14,9,8,9,9,12,12,12,12,12,9,2,2,2,2,8,4,14,14,14,9,9,9,0,4,9,2,0,12,12,12,2,13,8,2,2,11,11,12,12,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,15,0,14,9,9,9,9,4,0,5,9,2,15,4,13,9,2,2,11,11,11,11,11,12,11,9,9,9,2,9,9,12,12,8,9,9,9,9,8,8,9,3,3,14,4,15,12,12,12,12,12,2,2,3,9,9,9,9,9,9,4,11,11,11,11,11,9,4,9,9,9,11,11,11,11,9,3,0,15,14,9,9,9,8,11,11,11,11,11,9,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,9,9,15,15,15,15,15,15,4,15,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,15,9,8,14,15,3,15,2,11,1,5,9,5,2,15,15,15,15,15,15,9,15,9,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,1,15,15,15,15,15,15,15,15,9,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,5,9,2,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,1,9,15,1,15,5,1,15,15,15,9,1,14,11,9,15,2,2,2,2,2,2,2,2,2,2,2,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,1,16,1,15,0,0,14,14,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,17,16,16,16,16,16,16,9,15,1,16,17,8,17,17,9,9,16,4,16,9,15,9,15,16,9,1,0,9,9,2,16,1,2,9,2,15,15,9,9,14,14,16,3,9,2,15,1,1,1,1,1,8,15,8,16,17,9,16,9,1,9,9,5,9,3,3,8,17,15,15,15,2,9,1,16,2,16,0,16,2,9,1,1,8,1,1,5,17,17,17,17,1,1,15,1,9,9,15,15,15,17,16,2,3,9,9,15,16,14,15,8,9,17,17],"cats":["rom-hacks","fan-games","console-ports","console-to-pc-port","utility","open-source","guides","","mods","decompilations-recompilations","texture-packs","abandonware","in-the-works","preserved-games","english-translation-patches","android-ports","vr-ports","browser-based"],"catLabels":["ROM Hacks","Fan Games & Homebrew","Console To Console Ports","Console To PC Ports","Utilities","Open Source","Guides","","Mods","Decompilations & Recompilations","Texture Packs","Abandonware","In The Works","Preserved Games","English Translation Patches","Android Ports","VR","Browser Based"],"k":[[27,"castlevania-chronicles-ii-simons-quest"],[28,"castlevania-chronicles-iii-draculas-curse"],[31,"castlevania-haunted-castle-3-trevors-quest"],[32,"castlevania-maria-renards-revenge-for-sega-saturn"],[36,"castlevania-ii-simons-quest-snes-port"],[41,"celeste-mario-s-zap-and-dash-deluxe"],[41,"celeste-marios-zap-dash-deluxe"],[44,"chrono-trigger-prophets-guile"],[48,"command-and-conquer-combined-arms"],[67,"dr.-mario-mania"],[68,"dr.-robotniks-ring-racer-+-editor"],[81,"final-fantasy-tactics-1.3"],[86,"five-nights-at-freddys-playstation-demake"],[87,"five-nights-at-freddys-2-playstation-demake"],[88,"five-nights-at-freddys-2-wii-u-port"],[102,"hayatos-journey"],[110,"jumping-flash-doom-2.0"],[113,"kirbys-dream-land-dx"],[114,"kirbys-dream-land-2-dx"],[129,"marios-final-adventure"],[130,"mario-golf-n64-pro-edition-1.1"],[132,"marios-modules"],[140,"mega-man-2.5d"],[169,"mike-tysons-punch-out-snes-port"],[179,"mystery-of-solarus-dx-zelda-link-to-the-past-fan-game-nb-game-needs-to-be-in-.zip-format-when-adding-to-solarus-launcher"],[183,"newer-super-mario-bros.-wii"],[217,"power-rangers-its-morphin-time"],[219,"quake-brutalist-jam-3-standalone-and-mod"],[220,"rayman-lumograms"],[248,"sonic-and-the-moon-facility"],[293,"super-mario-and-the-rainbow-stars"],[295,"super-mario-bros.-cd"],[299,"super-mario-bros.-wonder-demake"],[315,"super-smash-brothers-brawl-project+"],[316,"super-smash-bros.-crusade"],[328,"teenage-mutant-ninja-turtles-shredders-re-revenge"],[336,"the-legend-of-zelda-ganons-deception"],[346,"the-patchmakers-workshop"],[350,"tony-hawks-american-wasteland-rethawed"],[358,"warios-conquest-super-mario-land-2-reclaimed"],[360,"wega-and-the-lost-media"],[369,"zeldas-adventuredx"],[377,"0-a.d."],[378,"2-ship-2-harkinian-the-legend-of-zelda-majoras-mask-pc-port"],[379,"the-legend-of-zelda-majoras-mask-recompilation"],[380,"r.e.l.i.v.e.-abes-odyssey-exodus-pc-port"],[381,"acemulator-asherons-call-server-emulator"],[402,"command-and-conquer-remastered-collection"],[424,"dr.-mario-64-recompilation"],[435,"fheroes2-heroes-of-might-and-magic-2-recreation"],[449,"gemrb-implementation-of-infinity-engine-baldurs-gate-icewind-dale-planescape-torment"],[450,"glsmac-sid-meiers-alpha-centauri-port"],[461,"opengoal-jak-and-daxter-jak-2-and-jak-3-native-pc-ports"],[473,"link-faces-of-evil-and-zelda-wand-of-gamelon-remastered"],[496,"openenroth-open-reimplementation-of-might-and-magic-6-7-and-8-engine"],[501,"openloco-chris-sawyers-locomotion-port"],[505,"openra-command-and-conquer-red-alert-tiberian-dawn-dune-2000"],[505,"openra-command-conquer-red-alert-+-tiberian-dawn-+-dune-2000"],[533,"the-simpsons-hit-and-run-pc-port"],[551,"super-mario-bros.-remastered"],[552,"super-mario-bros.-remastered-mods"],[553,"super-mario-bros.-remastered-custom-levels"],[559,"the-labyrinth-of-times-edge"],[561,"the-legend-of-zelda-links-awakening-dx-hd-pc-port"],[566,"trx-tomb-raider-1-and-2-reimplementation"],[571,"vcmi-heroes-of-might-and-magic-3-open-source-recreation"],[582,"zelda-64-recompiled-majoras-mask-with-mod-support"],[596,"banjo-kazooie-gruntys-revenge-decompilation"],[613,"colin-mcrae-rally-2.0-decompilation"],[614,"conkers-bad-fur-day-decompilation"],[616,"cosmos-cosmic-adventure-decompilation"],[626,"demons-crest-decompilation"],[629,"disneys-piglets-big-game-decompilation"],[670,"kirby-and-the-amazing-mirror-decompilation"],[672,"kirbys-epic-yarn-decompilation"],[673,"klonoa-2-lunateas-veil-decompilation"],[680,"luigis-mansion-decompilation"],[682,"mario-and-luigi-partners-in-time-decompilation"],[683,"mario-and-luigi-superstar-saga-decompilation"],[710,"new-super-mario-bros.-wii-decompilation"],[730,"pokepark-wii-pikachus-adventure-decompilation"],[740,"return-to-yoshis-island"],[773,"super-mario-3d-world-+-bowsers-fury-decompilation"],[784,"super-smash-bros.-64-decompilation"],[785,"super-smash-bros.-brawl-decompilation"],[786,"super-smash-bros.-melee-decompilation"],[812,"yoshis-story-decompilation"],[817,"animal-crossing-city-folk-deluxe-animal-crossing-city-folk-lets-go-to-the-city-mod"],[819,"baldurs-gate-3-brawl-real-time-combat-mod"],[820,"baldurs-gate-3-chivalry-expansion"],[821,"baldurs-gate-3-forsaken"],[822,"baldurs-gate-3-ultimate-cut-content-restoration-mod"],[829,"castlevania-simons-destiny-a-total-conversion-doom-mod"],[834,"contra-c-and-c-generals-zero-hour-mod"],[834,"contra-cc-generals-zero-hour-mod"],[835,"crusader-kings-2-a-song-of-ice-and-fire-mod"],[838,"cyberpunk-2077-take-a-breather-pace-and-reputation-overhaul-mod"],[872,"f.e.a.r.-echo-patch"],[881,"mount-and-blade-warband-gekokujo"],[900,"kingdom-hearts-refined-a-mod-for-kingdom-hearts-1.5-+-2.5-remix"],[902,"luigis-mansion-louie-mansion-pikmin-overhaul-mod"],[906,"marvel-vs-capcom-infinite-and-beyond-mod"],[910,"command-and-conquer-red-alert-2-mental-omega"],[917,"oblivion-oscuros-overhaul"],[920,"persona-3-fes-hd-overhaul-mod-and-widescreen-patch"],[960,"s.t.a.l.k.e.r.-shadow-of-chernobyl-radiophobia-3"],[961,"s.t.a.l.k.e.r.-2-heart-of-chernobyl-zone-unchained"],[973,"super-smash-bros.-brawl-rex"],[974,"super-smash-bros.-melee-akaneia-build"],[982,"the-legend-of-zelda-breath-of-the-wild-fov-and-shoulder-cam-mod"],[984,"mount-and-blade-2-bannerlord-the-old-realms"],[985,"the-simpsons-hit-and-run-futurama-overhaul-mod"],[991,"s.t.a.l.k.e.r.-call-of-pripyat-misery"],[992,"tony-hawks-underground-2-thugpro"],[1004,"aladdin-in-nasiras-revenge"],[1007,"america-mcgees-alice-remastered"],[1009,"assassins-creed-iii"],[1022,"clive-barkers-jericho"],[1025,"contract-j.a.c.k."],[1029,"dead-mans-hand"],[1055,"heavy-metal-f.a.k.k.-2"],[1060,"james-camerons-avatar-the-game"],[1086,"no-one-lives-forever-2-a-spy-in-h.a.r.m.s-way"],[1093,"peter-jacksons-king-kong-the-official-game-of-the-movie"],[1099,"project-i.g.i.-im-going-in"],[1109,"sanity-aikens-artifact"],[1111,"scratches-directors-cut"],[1142,"the-simpsons-hit-and-run"],[1159,"unreal-tournament-2004-editors-choice-edition"],[1166,"william-shatners-tekwar"],[1173,"archive-of-texture-packs-for-psone-playstation-2-psp-ps-vita-gamecube-n64-3ds-wii-and-dreamcast"],[1175,"baldurs-gate-3-hd-texture-pack"],[1197,"pokemon-scarlet-and-violet-4k-texture-pack"],[1214,"zelda-majoras-mask-3d"],[1215,"majoras-mask-n64"],[1239,"eddies-puzzletime-gameboy"],[1241,"frogger-2-swampys-revenge-dreamcast"],[1250,"porky-pigs-haunted-holiday-snes"],[1253,"resident-evil-1.5-psone"],[1261,"the-addams-family-pugsleys-scavanger-hunt-nes-prototypes"],[1276,"battle-stadium-d.o.n.-playstation-2"],[1281,"captain-tsubasa-vol.-ii-super-striker-nintendo-entertainment-system"],[1288,"cookies-bustle-pc"],[1298,"digimon-world-redigitize-playstation-portable"],[1303,"dragon-quest-iii-soshite-densetsu-e...-super-nintendo"],[1307,"dungeons-and-dragons-tower-of-doom-sega-saturn"],[1327,"idolmaster-sp-perfect-sun-wondering-star-and-missing-moon-psp"],[1331,"j.b.-harold-blue-chicago-blues-sega-saturn"],[1337,"kidou-senshi-gundam-gundam-vs.-gundam-next-plus-psp"],[1338,"kings-field-playstation"],[1347,"l.o.l-lack-of-love-dreamcast"],[1352,"marie-to-elie-no-atelier-salburg-no-renkinjutsushi-1-and-2-playstation-2"],[1356,"mother-1+2-game-boy-advance"],[1374,"puyo-puyo~n-dreamcast"],[1378,"rent-a-hero-no.1-dreamcast"],[1379,"rockman-and-forte-super-nintendo"],[1383,"screaming-mad-georges-paranoiascape-playstation"],[1389,"shin-megami-tensei-if...-super-nintendo"],[1411,"the-legend-of-sword-and-fairy-pc"],[1425,"yu-gi-oh-5ds-tag-force-6-psp"],[1432,"alternatives-to-popular-games-that-dont-work-on-linux-steamos-and-steam-deck"],[1433,"a-hackers-essential-toolkit"],[1437,"beginners-snes-hacking-guide"],[1475,"assassins-creed-victory-project"],[1482,"sonic-r-r-and-r"],[1492,"mega-man-world-dr.-wilys-revenge-dx"],[1503,"spankys-quest-dx"],[1506,"snoopys-magic-show-dx"],[1509,"dr.-mario-dx"],[1510,"galaga-and-galaxian-dx"],[1511,"zeldas-adventure-remastered"],[1537,"tales-of-majeyal"],[1563,"elona+"],[1570,"mk48.io"],[1576,"all-japan-womens-pro-wrestling-queen-of-queens-pcfx"],[1581,"delivery-and-beyond"],[1583,"rockman-and-forte-snes"],[1629,"rog-ally-and-steam-deck-ultimate-windows-guides"],[1632,"assassins-creed-directors-cut-remastered"],[1633,"walfies-nonograms"],[1643,"isometric-games-dont-exist"],[1648,"black-and-white-2"],[1650,"black-and-white"],[1654,"harry-potter-and-the-sorcerers-stone"],[1656,"disneys-tarzan"],[1665,"pikmin-1"],[1666,"nhl94-fight-edition"],[1688,"zelda-ii-amidas-curse"],[1706,"tom-clancys-h.a.w.x-2"],[1714,"yoshis-island-no-crying-improved-sfx-and-red-coins"],[1722,"tom-clancys-h.a.w.x"],[1756,"south-park-chefs-luv-shack"],[1759,"jimmy-whites-cueball-world"],[1761,"bloodwings-pumpkinheads-revenge"],[1770,"monkey-island-2-lechucks-revenge-ultimate-talkie-dos-edition"],[1771,"jimmy-whites-2-cueball"],[1784,"beavis-and-butt-head-mini-games"],[1785,"worms-the-directors-cut"],[1796,"the-secret-of-monkey-island-1-and-2-original-versions-with-speech-mod"],[1848,"fifa-12-+-euro-2012"],[1855,"tom-clancys-ssn"],[1871,"silent-hunter-commanders-edition"],[1891,"microsoft-flight-simulator-v5.1-complete"],[1894,"mechwarrior-2-ghost-bears-legacy"],[1902,"janes-combat-simulations-longbow-gold"],[1903,"j.r.r.-tolkiens-the-lord-of-the-rings-vol.-ii"],[1904,"j.r.r.-tolkiens-the-lord-of-the-rings-vol.-i"],[1937,"circuits-edge"],[1938,"chuck-yeagers-air-combat"],[1981,"pyrite64-n64-game-engine-and-editor-using-libdragon-and-tiny3d"],[1982,"streets-of-rage-2-andores-rampage"],[1985,"aurora-os.js"],[1988,"pasta-la-vista-super-mario-bros."],[2021,"kirbys-dream-collection-decompilation"],[2022,"dogs-life-decompilation"],[2030,"perfect-dark-pc-port-friends-of-joanna-4-player-counter-+-co-operative-mod"],[2054,"baldurs-gate-3-baldurs-gate-1-remake-demo"],[2061,"black-and-white-decompilation"],[2070,"reenhance"],[2100,"the-secret-chronicles-of-dr.-m."],[2117,"super-mario-bros.-sega-master-system-port"],[2145,"tony-hawks-underground"],[2168,"the-legend-of-zelda-majoras-mask-ps-vita-port"],[2172,"baldurs-gate-dark-alliance-ps-vita-port"],[2187,"marios-modules-2"],[2201,"warioware-inc.-decompilation"],[2222,"r.-c.-pro-am-snes-port"],[2235,"ps2recomp-playstation-2-static-recompiler-and-runtime-tool-to-make-native-pc-ports"],[2237,"five-nights-at-freddys-3-wii-edition"],[2246,"wwe-smackdown-vs.-raw-2007-recompilation"],[2256,"phantasy-star-generation2-ps2"],[2271,"marvels-spider-man-2-first-person-camera-mod"],[2275,"kowloons-gate-playstation"],[2291,"a-bite-at-freddys-ps-vita-port"],[2292,"colin-mcrae-rally-2.0"],[2306,"house-m.d."],[2312,"tom-clancys-ghost-recon-advanced-warfighter"],[2313,"tom-clancys-ghost-recon-advanced-warfighter-2"],[2317,"tony-hawks-pro-skater-2"],[2318,"tony-hawks-pro-skater-3"],[2319,"tony-hawks-underground"],[2320,"tony-hawks-underground-2"],[2321,"tony-hawks-pro-skater-hd"],[2329,"disneys-g-force"],[2337,"cabelas-dangerous-hunts-2013"],[2343,"x2-wolverines-revenge"],[2389,"wcw-vs.-nwo-world-tour-recompilation"],[2397,"the-legend-of-zelda-majoras-mask-recompilation-for-android"],[2421,"kirbys-return-to-dream-land-recompilation"],[2432,"vl.mr-hub-for-browser-based-recompilation-projects"],[2435,"smash-remix-+extra"],[2452,"alpha-touch-90s-classic-fps-shooters-for-android"],[2459,"the-simpsons-hit-and-run-for-android"],[2466,"links-awakening-dx-hd-for-android"],[2497,"drakengard-1-and-2-pc-patched"],[2505,"dantes-inferno-pc-patched"],[2508,"asuras-wrath-pc-patched"],[2519,"super-smash-bros.-64-nintendo-ds-port"],[2533,"idtech4a++-engine-for-doom-iii-quake-4-prey-2006-on-android"],[2543,"counter-strike-1.6-for-android"],[2551,"holotzs-castle"],[2567,"game-collection-portal-beta-cuphead-buckshot-roulette-and-smm_we-for-android"],[2594,"demons-souls-pc-patched"],[2599,"dragons-crown-pc-patched"],[2632,"dr.-robotniks-ring-racers-vr"],[2690,"command-and-conquer-generals-in-browser"],[2696,"f.e.a.r.-2-project-origin-vr-mod"],[2724,"baldurs-gate-2-enhanced-edition-ps-vita-port"],[2726,"jebs-legend-of-zelda"],[2728,"five-nights-at-frickbears-3"],[2729,"five-nights-at-frickbears-3"],[2741,"dragon-ball-z-buus-fury-recompilation"],[2752,"tony-hawks-project-8-recompilation"],[2783,"command-and-conquer-64-pc-port"],[2788,"rpg-maker-ds+-create-the-new-world-nintendo-ds"]],"hidden":[122,202,610,784,1049,1091,1169,2611,2648,2728],"searchHidden":true,"featureHidden":false,"gems":[0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,276,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,308,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,333,334,335,336,337,338,339,340,341,342,343,344,345,346,347,348,349,350,351,352,353,354,355,356,357,358,359,360,361,362,363,364,365,366,367,368,369,370,371,372,373,374,375,376,377,378,379,380,381,382,383,384,385,386,387,388,389,390,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,410,411,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,432,433,434,435,436,437,438,439,440,441,442,443,444,445,446,447,448,449,450,451,452,453,454,455,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,471,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,490,491,492,493,494,495,496,497,498,499,500,501,502,503,504,505,506,507,508,509,510,511,512,513,514,515,516,517,518,519,520,521,522,523,524,525,526,527,528,529,530,531,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,554,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,574,575,576,577,578,579,580,581,582,583,584,585,586,587,588,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,604,605,606,607,608,609,611,612,613,614,615,616,617,618,619,620,621,622,623,624,625,626,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650,651,652,653,654,655,656,657,658,659,660,661,662,663,664,665,666,667,668,669,670,671,672,673,674,675,676,677,678,679,680,681,682,683,684,685,686,687,688,689,690,691,692,693,694,695,696,697,698,699,700,701,702,703,704,705,706,707,708,709,710,711,712,713,714,715,716,717,718,719,720,721,722,723,724,725,726,727,728,729,730,731,732,733,734,735,736,737,738,739,740,741,742,743,744,745,746,747,748,749,750,751,752,753,754,755,756,757,758,759,760,761,762,763,764,765,766,767,768,769,770,771,772,773,774,775,776,777,778,779,780,781,782,783,785,786,787,788,789,790,791,792,793,794,795,796,797,798,799,800,801,802,803,804,805,806,807,808,809,810,811,812,813,814,815,816,817,818,819,820,821,822,823,824,825,826,827,828,829,830,831,832,833,834,835,836,837,838,839,840,841,842,843,844,845,846,847,848,849,850,851,852,853,854,855,856,857,858,859,860,861,862,863,864,865,866,867,868,869,870,871,872,873,874,875,876,877,878,879,880,881,882,883,884,885,886,887,888,889,890,891,892,893,894,895,896,897,898,899,900,901,902,903,904,905,906,907,908,909,910,911,912,913,914,915,916,917,918,919,920,921,922,923,924,925,926,927,928,929,930,931,932,933,934,935,936,937,938,939,940,941,942,943,944,945,946,947,948,949,950,951,952,953,954,955,956,957,958,959,960,961,962,963,964,965,966,967,968,969,970,971,972,973,974,975,976,977,978,979,980,981,982,983,984,985,986,987,988,989,990,991,992,993,994,995,996,997,998,999,1000,1001,1002,1003,1004,1005,1006,1007,1008,1009,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024,1025,1026,1027,1028,1029,1030,1031,1032,1033,1034,1035,1036,1037,1038,1039,1040,1041,1042,1043,1044,1045,1046,1047,1048,1050,1051,1052,1053,1054,1055,1056,1057,1058,1059,1060,1061,1062,1063,1064,1065,1066,1067,1068,1069,1070,1071,1072,1073,1074,1075,1076,1077,1078,1079,1080,1081,1082,1083,1084,1085,1086,1087,1088,1089,1090,1092,1093,1094,1095,1096,1097,1098,1099,1100,1101,1102,1103,1104,1105,1106,1107,1108,1109,1110,1111,1112,1113,1114,1115,1116,1117,1118,1119,1120,1121,1122,1123,1124,1125,1126,1127,1128,1129,1130,1131,1132,1133,1134,1135,1136,1137,1138,1139,1140,1141,1142,1143,1144,1145,1146,1147,1148,1149,1150,1151,1152,1153,1154,1155,1156,1157,1158,1159,1160,1161,1162,1163,1164,1165,1166,1167,1168,1170,1171,1172,1173,1174,1175,1176,1177,1178,1179,1180,1181,1182,1183,1184,1185,1186,1187,1188,1189,1190,1191,1192,1193,1194,1195,1196,1197,1198,1199,1200,1201,1202,1203,1204,1205,1206,1207,1208,1209,1210,1211,1212,1213,1214,1215,1216,1217,1218,1219,1220,1221,1222,1223,1224,1225,1226,1227,1228,1229,1230,1231,1232,1233,1234,1235,1236,1237,1238,1239,1240,1241,1242,1243,1244,1245,1246,1247,1248,1249,1250,1251,1252,1253,1254,1255,1256,1257,1258,1259,1260,1261,1262,1263,1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277,1278,1279,1280,1281,1282,1283,1284,1285,1286,1287,1288,1289,1290,1291,1292,1293,1294,1295,1296,1297,1298,1299,1300,1301,1302,1303,1304,1305,1306,1307,1308,1309,1310,1311,1312,1313,1314,1315,1316,1317,1318,1319,1320,1321,1322,1323,1324,1325,1326,1327,1328,1329,1330,1331,1332,1333,1334,1335,1336,1337,1338,1339,1340,1341,1342,1343,1344,1345,1346,1347,1348,1349,1350,1351,1352,1353,1354,1355,1356,1357,1358,1359,1360,1361,1362,1363,1364,1365,1366,1367,1368,1369,1370,1371,1372,1373,1374,1375,1376,1377,1378,1379,1380,1381,1382,1383,1384,1385,1386,1387,1388,1389,1390,1391,1392,1393,1394,1395,1396,1397,1398,1399,1400,1401,1402,1403,1404,1405,1406,1407,1408,1409,1410,1411,1412,1413,1414,1415,1416,1417,1418,1419,1420,1421,1422,1423,1424,1425,1426,1427,1428,1429,1430,1431,1432,1433,1434,1435,1436,1437,1438,1439,1440,1441,1442,1443,1444,1445,1446,1447,1448,1449,1450,1451,1452,1453,1454,1455,1456,1457,1458,1459,1460,1461,1462,1463,1464,1465,1466,1467,1468,1469,1470,1471,1472,1473,1474,1475,1476,1477,1478,1479,1480,1481,1482,1483,1484,1485,1486,1487,1488,1489,1490,1491,1492,1493,1494,1495,1496,1497,1498,1499,1500,1501,1502,1503,1504,1505,1506,1507,1508,1509,1510,1511,1512,1513,1514,1515,1516,1517,1518,1519,1520,1521,1522,1523,1524,1525,1526,1527,1528,1529,1530,1531,1532,1533,1534,1535,1536,1537,1538,1539,1540,1541,1542,1543,1544,1545,1546,1547,1548,1549,1550,1551,1552,1553,1554,1555,1556,1557,1558,1559,1560,1561,1562,1563,1564,1565,1566,1567,1568,1569,1570,1571,1572,1573,1574,1575,1576,1577,1578,1579,1580,1581,1582,1583,1584,1585,1586,1587,1588,1589,1590,1591,1592,1593,1594,1595,1596,1597,1598,1599,1600,1601,1602,1603,1604,1605,1606,1607,1608,1609,1610,1611,1612,1613,1614,1615,1616,1617,1618,1619,1620,1621,1622,1623,1624,1625,1626,1627,1628,1629,1630,1631,1632,1633,1634,1635,1636,1637,1638,1639,1640,1641,1642,1643,1644,1645,1646,1647,1648,1649,1650,1651,1652,1653,1654,1655,1656,1657,1658,1659,1660,1661,1662,1663,1664,1665,1666,1667,1668,1669,1670,1671,1672,1673,1674,1675,1676,1677,1678,1679,1680,1681,1682,1683,1684,1685,1686,1687,1688,1689,1690,1691,1692,1693,1694,1695,1696,1697,1698,1699,1700,1701,1702,1703,1704,1705,1706,1707,1708,1709,1710,1711,1712,1713,1714,1715,1716,1717,1718,1719,1720,1721,1722,1723,1724,1725,1726,1727,1728,1729,1730,1731,1732,1733,1734,1735,1736,1737,1738,1739,1740,1741,1742,1743,1744,1745,1746,1747,1748,1749,1750,1751,1752,1753,1754,1755,1756,1757,1758,1759,1760,1761,1762,1763,1764,1765,1766,1767,1768,1769,1770,1771,1772,1773,1774,1775,1776,1777,1778,1779,1780,1781,1782,1783,1784,1785,1786,1787,1788,1789,1790,1791,1792,1793,1794,1795,1796,1797,1798,1799,1800,1801,1802,1803,1804,1805,1806,1807,1808,1809,1810,1811,1812,1813,1814,1815,1816,1817,1818,1819,1820,1821,1822,1823,1824,1825,1826,1827,1828,1829,1830,1831,1832,1833,1834,1835,1836,1837,1838,1839,1840,1841,1842,1843,1844,1845,1846,1847,1848,1849,1850,1851,1852,1853,1854,1855,1856,1857,1858,1859,1860,1861,1862,1863,1864,1865,1866,1867,1868,1869,1870,1871,1872,1873,1874,1875,1876,1877,1878,1879,1880,1881,1882,1883,1884,1885,1886,1887,1888,1889,1890,1891,1892,1893,1894,1895,1896,1897,1898,1899,1900,1901,1902,1903,1904,1905,1906,1907,1908,1909,1910,1911,1912,1913,1914,1915,1916,1917,1918,1919,1920,1921,1922,1923,1924,1925,1926,1927,1928,1929,1930,1931,1932,1933,1934,1935,1936,1937,1938,1939,1940,1941,1942,1943,1944,1945,1946,1947,1948,1949,1950,1951,1952,1953,1954,1955,1956,1957,1958,1959,1960,1961,1962,1963,1964,1965,1966,1967,1968,1969,1970,1971,1972,1973,1974,1975,1976,1977,1978,1979,1980,1981,1982,1983,1984,1985,1986,1987,1988,1989,1990,1991,1992,1993,1994,1995,1996,1997,1998,1999,2000,2001,2002,2003,2004,2005,2006,2007,2008,2009,2010,2011,2012,2013,2014,2015,2016,2017,2018,2019,2020,2021,2022,2023,2024,2025,2026,2027,2028,2029,2030,2031,2032,2033,2034,2035,2036,2037,2038,2039,2040,2041,2042,2043,2044,2045,2046,2047,2048,2049,2050,2051,2052,2053,2054,2055,2056,2057,2058,2059,2060,2061,2062,2063,2064,2065,2066,2067,2068,2069,2070,2071,2072,2073,2074,2075,2076,2077,2078,2079,2080,2081,2082,2083,2084,2085,2086,2087,2088,2089,2090,2091,2092,2093,2094,2095,2096,2097,2098,2099,2100,2101,2102,2103,2104,2105,2106,2107,2108,2109,2110,2111,2112,2113,2114,2115,2116,2117,2118,2119,2120,2121,2122,2123,2124,2125,2126,2127,2128,2129,2130,2131,2132,2133,2134,2135,2136,2137,2138,2139,2140,2141,2142,2143,2144,2145,2146,2147,2148,2149,2150,2151,2152,2153,2154,2155,2156,2157,2158,2159,2160,2161,2162,2163,2164,2165,2166,2167,2168,2169,2170,2171,2172,2173,2174,2175,2176,2177,2178,2179,2180,2181,2182,2183,2184,2185,2186,2187,2188,2189,2190,2191,2192,2193,2194,2195,2196,2197,2198,2199,2200,2201,2202,2203,2204,2205,2206,2207,2208,2209,2210,2211,2212,2213,2214,2215,2216,2217,2218,2219,2220,2221,2222,2223,2224,2225,2226,2227,2228,2229,2230,2231,2232,2233,2234,2235,2236,2237,2238,2239,2240,2241,2242,2243,2244,2245,2246,2247,2248,2249,2250,2251,2252,2253,2254,2255,2256,2257,2258,2259,2260,2261,2262,2263,2264,2265,2266,2267,2268,2269,2270,2271,2272,2273,2274,2275,2276,2277,2278,2279,2280,2281,2282,2283,2284,2285,2286,2287,2288,2289,2290,2291,2292,2293,2294,2295,2296,2297,2298,2299,2300,2301,2302,2303,2304,2305,2306,2307,2308,2309,2310,2311,2312,2313,2314,2315,2316,2317,2318,2319,2320,2321,2322,2323,2324,2325,2326,2327,2328,2329,2330,2331,2332,2333,2334,2335,2336,2337,2338,2339,2340,2341,2342,2343,2344,2345,2346,2347,2348,2349,2350,2351,2352,2353,2354,2355,2356,2357,2358,2359,2360,2361,2362,2363,2364,2365,2366,2367,2368,2369,2370,2371,2372,2373,2374,2375,2376,2377,2378,2379,2380,2381,2382,2383,2384,2385,2386,2387,2388,2389,2390,2391,2392,2393,2394,2395,2396,2397,2398,2399,2400,2401,2402,2403,2404,2405,2406,2407,2408,2409,2410,2411,2412,2413,2414,2415,2416,2417,2418,2419,2420,2421,2422,2423,2424,2425,2426,2427,2428,2429,2430,2431,2432,2433,2434,2435,2436,2437,2438,2439,2440,2441,2442,2443,2444,2445,2446,2447,2448,2449,2450,2451,2452,2453,2454,2455,2456,2457,2458,2459,2460,2461,2462,2463,2464,2465,2466,2467,2468,2469,2470,2471,2472,2473,2474,2475,2476,2477,2478,2479,2480,2481,2482,2483,2484,2485,2486,2487,2488,2489,2490,2491,2492,2493,2494,2495,2496,2497,2498,2499,2500,2501,2502,2503,2504,2505,2506,2507,2508,2509,2510,2511,2512,2513,2514,2515,2516,2517,2518,2519,2520,2521,2522,2523,2524,2525,2526,2527,2528,2529,2530,2531,2532,2533,2534,2535,2536,2537,2538,2539,2540,2541,2542,2543,2544,2545,2546,2547,2548,2549,2550,2551,2552,2553,2554,2555,2556,2557,2558,2559,2560,2561,2562,2563,2564,2565,2566,2567,2568,2569,2570,2571,2572,2573,2574,2575,2576,2577,2578,2579,2580,2581,2582,2583,2584,2585,2586,2587,2588,2589,2590,2591,2592,2593,2594,2595,2596,2597,2598,2599,2600,2601,2602,2603,2604,2605,2606,2607,2608,2609,2610,2612,2613,2614,2615,2616,2617,2618,2619,2620,2621,2622,2623,2624,2625,2626,2627,2628,2629,2630,2631,2632,2633,2634,2635,2636,2637,2638,2639,2640,2641,2642,2643,2644,2645,2646,2647,2649,2650,2651,2652,2653,2654,2655,2656,2657,2658,2659,2660,2661,2662,2663,2664,2665,2666,2667,2668,2669,2670,2671,2672,2673,2674,2675,2676,2677,2678,2679,2680,2681,2682,2683,2684,2685,2686,2687,2688,2689,2690,2691,2692,2693,2694,2695,2696,2697,2698,2699,2700,2701,2702,2703,2704,2705,2706,2707,2708,2709,2710,2711,2712,2713,2714,2715,2716,2717,2718,2719,2720,2721,2722,2723,2724,2725,2726,2727,2729,2730,2731,2732,2733,2734,2735,2736,2737,2738,2739,2740,2741,2742,2743,2744,2745,2746,2747,2748,2749,2750,2751,2752,2753,2754,2755,2756,2757,2758,2759,2760,2761,2762,2763,2764,2765,2766,2767,2768,2769,2770,2771,2772,2773,2774,2775,2776,2777,2778,2779,2780,2781,2782,2783,2784,2785,2786,2787,2788,2789,2790,2791,2792,2793],"stats":{"totalProjects":2784,"addedThisMonth":0,"categoryCounts":[{"slug":"abandonware","label":"Abandonware","count":609},{"slug":"android-ports","label":"Android Ports","count":106},{"slug":"browser-based","label":"Browser Based","count":40},{"slug":"console-ports","label":"Console To Console Ports","count":113},{"slug":"console-to-pc-port","label":"Console To PC Ports","count":22},{"slug":"decompilations-recompilations","label":"Decompilations & Recompilations","count":144},{"slug":"english-translation-patches","label":"English Translation Patches","count":197},{"slug":"fan-games","label":"Fan Games & Homebrew","count":270},{"slug":"guides","label":"Guides","count":46},{"slug":"in-the-works","label":"In The Works","count":299},{"slug":"mods","label":"Mods","count":253},{"slug":"open-source","label":"Open Source","count":308},{"slug":"preserved-games","label":"Preserved Games","count":57},{"slug":"rom-hacks","label":"ROM Hacks","count":180},{"slug":"texture-packs","label":"Texture Packs","count":57},{"slug":"utility","label":"Utilities","count":44},{"slug":"vr-ports","label":"VR","count":37}]},"facets":"/js/tge-facets.f6464492d59e.json"};
@@ -1 +0,0 @@
-window.__GAME_INDEX__ = [{"title": "Advance Wars Returns", "url": "https://www.romhacking.net/hacks/6012/"}, {"title": "Age of the Ring", "url": "https://www.moddb.com/mods/the-horse-lords-a-total-modification-for-bfme/news/age-of-the-ring-goes-standalone"}, {"title": "Alleys of Anime 2", "url": "https://romhackplaza.org/romhacks/alleys-of-anime-2-genesis/"}, {"title": "All Hell Unleashed", "url": "https://8bitslasher.itch.io/ahu666"}, {"title": "Altered Beast Remake", "url": "https://gamejolt.com/games/alteredbeastremake/954814"}, {"title": "AM2R", "url": "https://archive.org/details/am-2-r"}, {"title": "AMC Squad", "url": "https://amcsquad.itch.io/game"}, {"title": "Awful Emblem", "url": "https://feuniverse.us/t/awful-emblem-version-1-0-release/3987/33"}, {"title": "Banjo Kazooie Nostalgia 64", "url": "https://youtu.be/-niehkOWOKg?si=Na1yDdAOiR7URSDP"}, {"title": "Banjo Kazooie The Corrupted Jiggys", "url": "https://youtu.be/d5lUT7SSAgg?si=OVsXeH6AOXAxka8k"}, {"title": "Banjo Kazooie The Lair Witch Project", "url": "https://youtu.be/dfOERKSm_UE?si=PQOBo8Oj9y1mpraa"}, {"title": "Barkley Gaiden: The Son of Dark Draker", "url": "https://tunicate.itch.io/barkley"}, {"title": "Barkley: Shut Up and Jam! Gaiden", "url": "https://archive.org/details/BarkleyShutUpAndJamGaiden"}, {"title": "Battle Stormer Classics", "url": "https://gamejolt.com/games/battle-stormer-classics/14507"}, {"title": "Bit of War - God of War Demake", "url": "https://holmadegames.itch.io/bit-of-war?ref=retrododo.com"}, {"title": "Blaster Master SNES Port", "url": "https://archive.org/details/blaster-master-snes"}, {"title": "Blink 182 N64", "url": "https://alarconos.itch.io/videogame182"}, {"title": "Bloodborne PSX Demake", "url": "https://archive.org/details/bloodborne-psx-demake-v-1.05"}, {"title": "Bound to the Dark World", "url": "https://chromadeline.itch.io/bound-to-the-dark-world"}, {"title": "Bubble Bobble C64 Remastered", "url": "https://daves-retro-forge.itch.io/bubble-bobble-c64-remastered"}, {"title": "Capcom Vs Square: Parallel Destinies", "url": "https://sites.google.com/view/cvsqfangame/home?authuser=0"}, {"title": "Capoeira Fighter 3 Legacy Edition", "url": "https://rubbersharkman.itch.io/capoeira-fighter-3-legacy-edition"}, {"title": "Captain America and The Avengers Remake", "url": "https://gamejolt.com/games/capa/1006805"}, {"title": "Card Miner", "url": "https://www.bxfoundry.com/cardminer/"}, {"title": "Castlemania 2", "url": "https://www.smwcentral.net/?p=section&a=details&id=40149"}, {"title": "Castlevania AGA", "url": "https://danteretrodev.itch.io/akumajou-dracula-aga"}, {"title": "Castlevania: Alternate Scarlet Symphony", "url": "https://romhackplaza.org/romhacks/castlevania-alternate-scarlet-symphony-playstation/"}, {"title": "Castlevania Chronicles II: Simon's Quest", "url": "https://cdromance.org/windows/castlevania-chronicles-ii-simons-quest-fan-made-remake-2/"}, {"title": "Castlevania Chronicles III: Dracula's Curse", "url": "https://cdromance.org/windows/castlevania-chronicles-iii-draculas-curse-fan-game-windows-pc/"}, {"title": "Castlevania - Eternity of Sorrow", "url": "https://www.romhacking.net/hacks/9309/"}, {"title": "Castlevania Haunted Castle 2", "url": "https://retrolorean.com/en/castlevania-haunted-castle-2-10730"}, {"title": "Castlevania Haunted Castle 3 Trevor's Quest", "url": "https://archive.org/details/hauntedcastle3"}, {"title": "Castlevania Maria Renard's Revenge for Sega Saturn", "url": "https://z-team.itch.io/maria-renards-revenge-sega-saturn"}, {"title": "Castlevania ReVamped", "url": "https://archive.org/details/castlevania-re-vamped-ubuntu"}, {"title": "Castlevania: Rondo of the Night", "url": "https://www.romhacking.net/hacks/7919/"}, {"title": "Castlevania SNES Port", "url": "https://archive.org/details/castlevania-snes"}, {"title": "Castlevania II Simon's Quest SNES Port", "url": "https://archive.org/details/castlevania-2_202511"}, {"title": "Castlevania Symphony of the Night Ultimate", "url": "https://sotn2018br.blogspot.com/2025/11/original-name-japanese-dracula-x-gekka.html?m=1"}, {"title": "Castlevania The Lecarde Chronicles", "url": "https://castlevania-the-lecarde-chronicles.en.uptodown.com/windows"}, {"title": "Castlevania The Lecarde Chronicles 2", "url": "https://www.dsogaming.com/news/castlevania-the-lecarde-chronicles-2-is-a-new-2d-castlevania-fan-game-that-is-available-for-download/"}, {"title": "Celeste 64", "url": "https://maddymakesgamesinc.itch.io/celeste64"}, {"title": "Celeste Mario's Zap & Dash DELUXE!", "url": "https://romhackplaza.org/romhacks/celeste-marios-zap-dash-deluxe-nes/"}, {"title": "Chainsawman", "url": "https://www.reddit.com/r/SteamDeck/comments/1k0xxae/chainsawman_fan_game_by_swammy_on_deck/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, {"title": "Chip N Dale SNES Port", "url": "https://archive.org/details/chipn-dale-snes"}, {"title": "Chrono Trigger: Prophet's Guile", "url": "https://www.romhacking.net/hacks/362/"}, {"title": "Clock Tower Advance", "url": "https://romhackplaza.org/homebrew/clock-tower-advance-game-boy-advance/"}, {"title": "Club Penguin Journey", "url": "https://play.cpjourney.net/"}, {"title": "Color A Dinosaur SNES Port", "url": "https://archive.org/details/color-adinosaur-snes"}, {"title": "Command & Conquer Combined Arms", "url": "https://www.moddb.com/mods/command-conquer-combined-arms"}, {"title": "Contra Force SNES Port", "url": "https://archive.org/details/contra-force-snes-beta"}, {"title": "Contra SNES Port", "url": "https://archive.org/details/contra-snes_20251012"}, {"title": "Crash Team racing: Retro Fueled", "url": "https://romsfun.com/roms/playstation/crash-team-racing-retro-fueled.html"}, {"title": "Cry of Fear", "url": "https://store.steampowered.com/app/223710/Cry_of_Fear/"}, {"title": "DC Task Force", "url": "https://gamejolt.com/games/DCTASKFORCE/962995"}, {"title": "DC Vs Marvel 2025", "url": "https://www.reddit.com/r/superman/comments/1p8a432/dc_vs_marvel_2025_game_final_version_release/"}, {"title": "Dead Space Demake", "url": "https://brumley53.itch.io/dead-space-demake"}, {"title": "Digimon World 2 Alternative", "url": "https://www.romhacking.net/hacks/7272/"}, {"title": "Discworld Noir", "url": "https://collectionchamber.blogspot.com/2015/03/discworld-noir.html?m=1"}, {"title": "Donkey Kong Country 4 NES", "url": "https://www.romhacking.net/hacks/9084/"}, {"title": "Doom roguelike", "url": "https://github.com/chaosforgeorg/drl"}, {"title": "Doom RPG", "url": "https://www.doomworld.com/forum/topic/129997-doom-rpg-port-reverse-engineering-update-version-022-source-code-release/"}, {"title": "Doom 2 RPG", "url": "https://www.doomworld.com/forum/topic/135602-doom-ii-rpg-port-reverse-engineering-version-01-source-code-release/"}, {"title": "DoomScroll - Browse, Preview and Play Thousands of User-Made Doom WADS", "url": "https://doomscroll.cx/"}, {"title": "Doom 32X Resurrection", "url": "https://www.doomworld.com/forum/topic/119202-doom-32x-resurrection/"}, {"title": "Double Dragon One", "url": "https://ozzyouzo.itch.io/double-dragon"}, {"title": "Double Dragon SNES Port", "url": "https://archive.org/details/double-dragon-snes"}, {"title": "Double Dragon 2 SNES Port", "url": "https://archive.org/details/double-dragon-ii-snes"}, {"title": "Dr. Mario Mania", "url": "https://toadfangames.itch.io/dr-mario-mania"}, {"title": "Dr. Robotnik's Ring Racer + Editor", "url": "https://www.kartkrew.org/news/2024-05-21_dr-robotniks-ring-racers-version-23.html"}, {"title": "Dragons' Dogma Online", "url": "https://www.reddit.com/r/SteamDeck/comments/13ps9cv/dragons_dogma_online_working_on_steam_deck/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, {"title": "Dragon Quest 1 Remake", "url": "https://www.woodus.com/den/resources/dq+nightfly.php"}, {"title": "Driving Strikers N64 Port", "url": "https://github.com/SpookyIluha/driving-Strikers-64"}, {"title": "Duck Tales SNES Port", "url": "https://archive.org/details/duck-tales-snes_20250430"}, {"title": "Earthbound Halloween Hack", "url": "https://web.archive.org/web/20190314101907/https://www.romhacking.net/hacks/1882/"}, {"title": "Elden Ring Gameboy Demake", "url": "https://shin.itch.io/elden-ring-gb"}, {"title": "Fable 20th Anniversary Demake", "url": "https://james222.itch.io/fable-gameboy-color-demake"}, {"title": "Famicom Fighters", "url": "https://mcjimmy.net/famicomfighters.html"}, {"title": "Famidash", "url": "https://kandowontu.itch.io/famidash"}, {"title": "Fightcade - a matchmaking application for playing retro games online", "url": "https://www.fightcade.com/"}, {"title": "Final Fantasy 6 Brave New World", "url": "http://ngplus.net/index.php?/forums/topic/1262-brave-new-world-21-is-now-available/"}, {"title": "Final Fantasy Renaissance", "url": "https://www.rengames.us/ffr"}, {"title": "Final Fantasy Tactics 1.3", "url": "https://www.romhacking.net/hacks/465/"}, {"title": "Final Fight MD", "url": "https://mxretrodev.itch.io/final-fight-md"}, {"title": "Fire Emblem: The Four Kings", "url": "https://feuniverse.us/t/fe8-complete-fire-emblem-the-four-kings-4-11-24-update-now-with-weapon-reversal/7030"}, {"title": "Fire Emblem: The Last Promise", "url": "https://www.feshrine.net/thelastpromise/"}, {"title": "Fire Emblem: Vision Quest", "url": "https://feuniverse.us/t/fe8-complete-fire-emblem-vision-quest-v3-by-pushwall-1-oct-22/3815"}, {"title": "Five Nights At Freddy's - Playstation Demake", "url": "https://gamejolt.com/games/FNAF-ps1/832993"}, {"title": "Five Nights At Freddy's 2 - Playstation Demake", "url": "https://gamejolt.com/games/FNAF2PSX/864126"}, {"title": "Five Nights At Freddy's 2 - Wii U Port", "url": "https://the-latte-macchiato.itch.io/fnaf2-wiiu-edition"}, {"title": "FSO - Freespace 2 Open", "url": "https://wiki.hard-light.net/index.php/Manually_Installing_FreeSpace_2_Open"}, {"title": "F-Zero Beginnings", "url": "https://romhackplaza.org/romhacks/f-zero-beginnings-snes/"}, {"title": "F-Zero Deluxe", "url": "https://www.romhacking.net/hacks/8437/"}, {"title": "F-Zero X Climax", "url": "https://www.romhacking.net/hacks/1487/"}, {"title": "G-Zero", "url": "https://gasega68k.itch.io/g-zero"}, {"title": "Game Over: Elysium", "url": "https://romhacking.com/hack/game-over--elysium"}, {"title": "Ghosts n Demons", "url": "https://bonusjz.itch.io/ghostsn-demons"}, {"title": "Goldfinger 64", "url": "http://n64vault.com/ge-campaigns:goldfinger-64"}, {"title": "Golden Axe Returns", "url": "https://golden-axe-returns.en.uptodown.com/windows#google_vignette"}, {"title": "GTA 2 Configuration Guide - Steam Deck", "url": "https://www.reddit.com/r/SteamDeck/comments/1ehk1ef/grand_theft_auto_2_on_steam_deck_configuration/?share_id=MYnhCG7TMdreb0dxTE5pK&utm_content=1&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1"}, {"title": "Guitar Hero World Tour Definitive Edition", "url": "https://ghwt.de/"}, {"title": "Halo Zero", "url": "https://halo-zero.en.download.it/#google_vignette"}, {"title": "Harry Potter Unreal", "url": "https://github.com/metallicafan212/HarryPotterUnrealWiki"}, {"title": "Hayato's Journey", "url": "https://master-linkuei.itch.io/hayatos-journey"}, {"title": "He-Man", "url": "https://gamejolt.com/games/he-man/19434"}, {"title": "Holocure", "url": "https://kay-yu.itch.io/holocure"}, {"title": "Hyper Dragon Ball Z", "url": "https://network.mugenguild.com/balthazar/hyperdbz/"}, {"title": "Infested Island", "url": "https://boss1995.itch.io/infestedisland"}, {"title": "Infinity Nikki on Steam Deck", "url": "https://www.reddit.com/r/InfinityNikki/comments/1h6bqgf/how_i_installed_infinity_nikki_on_the_steam_deck/?share_id=F16A_DbjmheRIVUNcZZJC&utm_content=1&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1"}, {"title": "Invincible", "url": "https://www.reddit.com/r/SteamDeck/comments/1k0weqf/invincible_fan_game_wip_by_swammys_on_deck/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, {"title": "Jedi Knight Dark Forces 2 Unreal Engine", "url": "https://www.patreon.com/posts/dark-forces-2-v1-78228910?utm_medium=clipboard_copy&utm_source=copyLink&utm_campaign=postshare_creator&utm_content=join_link"}, {"title": "Jumping Flash Doom 2.0", "url": "https://forum.zdoom.org/viewtopic.php?t=75591"}, {"title": "Kid Icarus SNES Port", "url": "https://archive.org/details/kid-icarusnes-revb"}, {"title": "Kirby Air Ride Deluxe", "url": "https://github.com/UnclePunch/KAR-Deluxe/releases"}, {"title": "Kirby's Dream Land DX", "url": "https://www.romhacking.net/hacks/5213/"}, {"title": "Kirby's Dream Land 2 DX", "url": "https://www.romhacking.net/hacks/7724/"}, {"title": "Labyrinth of the Dragon", "url": "https://neshacker.itch.io/labyrinth-of-the-dragon"}, {"title": "Left 4 Dead 2 Beta Restoration Project", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=413903495"}, {"title": "Lethalmon", "url": "https://lethalmon-fangame.com/"}, {"title": "Licar", "url": "https://drummyfish.itch.io/licar"}, {"title": "Life Force Salamander SNES Port", "url": "https://archive.org/details/life-force-snes-v-1"}, {"title": "Life is Strange Love is Strange", "url": "https://teamrumblebee.itch.io/lisvn"}, {"title": "UFO: Alien Invasion", "url": "https://sourceforge.net/projects/ufoai/"}, {"title": "N64RecompLauncher", "url": "https://github.com/SirDiabo/N64RecompLauncher"}, {"title": "Make a Good Mega Man Level", "url": "https://www.magmmlcontest.com/games.php"}, {"title": "Maldita Castilla", "url": "https://locomalito.com/games/maldita-castilla"}, {"title": "Manic Miners - A LEGO Rock Raiders Remake", "url": "https://baraklava.itch.io/manic-miners"}, {"title": "Mari0", "url": "https://stabyourself.net/mari0/"}, {"title": "Mario Adventure3", "url": "https://marioadventure3.com/"}, {"title": "Mario Builder 64", "url": "https://gamebanana.com/mods/514361"}, {"title": "Mario's Final Adventure", "url": "https://gamebanana.com/wips/65286"}, {"title": "Mario Golf N64 - Pro Edition 1.1", "url": "https://youtu.be/JCBegP3cCtk?si=kkOcvmFp-9A-099B"}, {"title": "Mario Kart Wii Deluxe", "url": "https://wiki.tockdom.com/wiki/Mario_Kart_Wii_Deluxe"}, {"title": "Mario's Modules", "url": "https://romhacking.com/hack/mario-s-modules"}, {"title": "Mario Party Netplay", "url": "https://www.reddit.com/r/SteamDeck/comments/141ghq0/new_releases_of_mario_party_netplay_for_pj64_and/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, {"title": "Mario Syndrome", "url": "https://www.smwcentral.net/?p=viewthread&t=130911&page=1&pid=1656762#p1656762"}, {"title": "Marvel Heroes Omega Project TAHITI", "url": "https://mhtahiti.com/"}, {"title": "Marvel Heroes Server Emulator", "url": "https://github.com/Crypto137/MHServerEmu"}, {"title": "Marvel Infinity War", "url": "https://gamejolt.com/games/marvel-infinity-war/201435"}, {"title": "Maximum Carnage Remake", "url": "https://gamejolt.com/games/MaximumCarnage/985396"}, {"title": "Mega Man SNES Port", "url": "https://archive.org/details/mega-man-i-snes"}, {"title": "Mega Man 2.5D", "url": "https://petersjostrand.com/"}, {"title": "Mega Man 2 SNES Port", "url": "https://archive.org/details/mega-man-ii-snes_202510"}, {"title": "Mega Man 3 SNES Port", "url": "https://archive.org/details/mega-man-iii-snes_202510"}, {"title": "Mega Man 4 SNES Port", "url": "https://archive.org/details/mega-man-iv-snes-8-21-21-infidelity"}, {"title": "Mega Man 5 SNES Port", "url": "https://archive.org/details/mega-man-v-snes_202510"}, {"title": "Mega Man 6 SNES Port", "url": "https://archive.org/details/mega-man-vi-snes_202510"}, {"title": "Mega Man 8X Demake 16bit", "url": "https://sonicfangameshq.com/forums/showcase/mega-man-x8-16-bit.2184/"}, {"title": "Mega Man Arena", "url": "https://www.megamanarena.com/"}, {"title": "Mega Man Legends - Rockman DASH: Great adventureon 5 Islands", "url": "https://www.rockman-corner.com/2025/03/rockman-dash-great-adventure-on-5.html?m=1"}, {"title": "Mega Man Maker", "url": "https://megamanmaker.com/"}, {"title": "Mega Man Revamped", "url": "https://www.romhacking.net/hacks/9269/"}, {"title": "Mega Man 2 Revamped", "url": "https://www.romhacking.net/hacks/6983/"}, {"title": "Mega Man 3 Revamped", "url": "https://www.romhacking.net/hacks/4773/"}, {"title": "Mega Man Rock N Roll", "url": "https://dennisengelhard.com/rock-n-roll/"}, {"title": "Mega Man Unlimited", "url": "https://megaphilx.com/index.php/home/games/mega-man-unlimited/"}, {"title": "Mega Man World 3 DX", "url": "https://www.marcrobledo.com/game-boy/mega-man-world-3-dx/"}, {"title": "Mega Man World 4 DX", "url": "https://www.marcrobledo.com/game-boy/mega-man-world-4-dx/"}, {"title": "Mega Man World 5 DX", "url": "https://www.marcrobledo.com/game-boy/mega-man-world-5-dx/"}, {"title": "Mega Man X: Omega Blaster Ultimate Edition", "url": "https://gamejolt.com/games/MMX-OmegaBlaster/438452"}, {"title": "Mega Man X4 Knot Beret", "url": "https://ts02014553.itch.io/megaman-x4-kb"}, {"title": "Mega Pang - Megadrive Genesis Port of Super Pang", "url": "https://rcampeador.itch.io/megapang"}, {"title": "Mega Serval", "url": "https://store.steampowered.com/app/2009720/Mega_Serval/"}, {"title": "Mega Splatterhouse", "url": "https://monsterbathchris.itch.io/mega-splatterhouse-demo"}, {"title": "Metal Gear - Mega Drive Port", "url": "https://h0ffman.itch.io/metal-gear-md"}, {"title": "Metal Slug Counter", "url": "https://gamejolt.com/games/MetalSlugCounter/926766"}, {"title": "Metroid Desolation", "url": "https://metroidconstruction.com/hack.php?id=732"}, {"title": "Metroid SNES Port", "url": "https://archive.org/details/metroid-snes_202504"}, {"title": "Metroid Super Zero Mission", "url": "https://www.romhacking.net/hacks/742/"}, {"title": "Mighty Final Fight Forever", "url": "https://bouncergames.com/project-forever/"}, {"title": "Mike Tyson's Punch Out!!! SNES Port", "url": "https://archive.org/details/mike-tysons-punch-out-snes_202510"}, {"title": "Mini Doom 2", "url": "https://calaverastudio.itch.io/minidoom2"}, {"title": "Mole Mania DX", "url": "https://www.marcrobledo.com/game-boy/mole-mania-dx/"}, {"title": "Monster Hunter Freedom Unite Complete", "url": "https://fucomplete.github.io/"}, {"title": "Monster Hunter Frontier Z - Steam Deck Guide", "url": "https://mholdschool.com/viewtopic.php?t=675"}, {"title": "Moonring", "url": "https://dene.itch.io/moonring"}, {"title": "Mortal Kombat II Arkade Edition NES", "url": "https://www.romhacking.net/hacks/9073/"}, {"title": "Mortal Kombat Defenders of The Earth", "url": "https://mortal-kombat-defenders-of-the-earth.en.uptodown.com/windows"}, {"title": "Mother 2 Deluxe", "url": "https://romsfun.com/roms/super-nintendo/mother-2-deluxe.html"}, {"title": "Mushroom Kingdom Fusion", "url": "https://fusion-fangaming.itch.io/mushroom-kingdom-fusion"}, {"title": "Mystery of Solarus DX - Zelda Link to the Past fan game - NB game needs to be in .zip format when adding to Solarus Launcher!!", "url": "https://www.solarus-games.org/games/the-legend-of-zelda-mystery-of-solarus-dx/"}, {"title": "NBA Jam 50", "url": "https://www.romhacking.net/hacks/9097/"}, {"title": "Need For Speed 3 Hot Pursuit Next Gen Patch", "url": "https://rejzor.wordpress.com/need-for-speed-3-nextgen/"}, {"title": "Need For Speed Most Wanted Redux V3", "url": "https://youtu.be/9nnmeXzm1oQ?si=wwp4CJAIuCJT_Pld"}, {"title": "Newer Super Mario Bros. Wii", "url": "https://newerteam.com/wii/"}, {"title": "NFL Blitz 2026", "url": "https://x.com/NFL_Blitz_Rez/status/1963389204106547573?s=20"}, {"title": "NFL Street Reborn", "url": "https://www.reddit.com/r/NFLStreet/comments/159u73n/announcing_nfl_street_reborn/?share_id=mSXOT9YUPIo6Ar_b2oG0i&utm_content=1&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1"}, {"title": "NHL '94 2024 Edition", "url": "https://www.romhacking.net/hacks/8267/"}, {"title": "Nightmare Kart", "url": "https://b0tster.itch.io/nmkart"}, {"title": "NightVein", "url": "https://retrohammer.com/#games"}, {"title": "Ninja Gaiden Shadow DX", "url": "https://www.marcrobledo.com/game-boy/ninja-gaiden-shadow-dx/"}, {"title": "Ninja Gaiden Trilogy SNES Port", "url": "https://archive.org/details/ninja-gaiden-trilogy-snes_202511"}, {"title": "Not Tetris 2", "url": "https://stabyourself.net/nottetris2/"}, {"title": "Order 66: A Fire Emblem Hack", "url": "https://feuniverse.us/t/fe8-order-66-a-fire-emblem-hack-v1-0-complete/33929"}, {"title": "Outrun - Cannonball", "url": "https://github.com/djyt/cannonball/wiki/Cannonball-Manual#getting-started"}, {"title": "Outrun - Gameboy Colour Port", "url": "https://rocketshippark.itch.io/what-if-outrun"}, {"title": "Paratopic - Wii U Port", "url": "https://thelatteteam.itch.io/paratopic-wii-u"}, {"title": "Phantasy Star Online Blue Burst on Steam Deck", "url": "https://www.pioneer2.net/community/threads/ephinea-pso-bb-on-steam-deck-official-thread.24850/"}, {"title": "PlayStation Home", "url": "https://github.com/NagatoDEV/PlayStation-Home-Master-Archive"}, {"title": "PokeMMO", "url": "https://pokemmo.com/en/downloads/"}, {"title": "Pokemon Dark Rising", "url": "https://www.pokeharbor.com/2021/04/pokemon-dark-rising-1-kaizo/"}, {"title": "Pokemon Emerald Seaglass", "url": "https://ko-fi.com/s/4a1535f351"}, {"title": "Pokemon Gadir Deluxe", "url": "https://www.pokecommunity.com/threads/pok%C3%A9mon-gadir-deluxe-complete-v-1-1.539451/"}, {"title": "Pokemon Gamma Emerald", "url": "https://gammaemerald.org/"}, {"title": "Pokemon Infinite Black 2", "url": "https://frostfalcon.github.io/NCB2/"}, {"title": "Pokemon Infinite Fusion", "url": "https://www.pokemoncoders.com/pokemon-infinite-fusion/"}, {"title": "Pokemon Lazarus", "url": "https://ko-fi.com/s/9ae89c2476"}, {"title": "Pokemon Luminescent Platinum", "url": "https://www.reddit.com/r/EmuDeck/comments/1hpi1a9/pok%C3%A9mon_luminescent_platinum_a_guide_ver_10/?share_id=OSwJMWi-KH-OlAQtSbJl1&utm_content=2&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1"}, {"title": "Pokemon Super Mystery Dungeon Story: Echoes of Yesterday", "url": "https://hacks.skytemple.org/h/echoes_yesterday?ref=retrododo.com"}, {"title": "Pokemon Odyssey", "url": "https://www.pokecommunity.com/threads/pokemon-odyssey-complete-v4-1-1.488536/"}, {"title": "Pokemon Prism", "url": "https://rainbowdevs.com/title/prism/"}, {"title": "Pokemon Rejuvenation", "url": "https://www.rebornevo.com/rejuvenation/"}, {"title": "Pokemon Scrambled Scarlet", "url": "https://www.reddit.com/r/PokemonROMhacks/comments/1lz2rwv/pokemon_scrambled_scarlet_violet_emerald_a_gba/"}, {"title": "Pokemon Stadium Club", "url": "https://eeveeexpo.com/threads/8185/"}, {"title": "Pokemon Unbound", "url": "https://www.pokeharbor.com/2022/08/pokemon-unbound/"}, {"title": "Pokemon Unbreakable Ties", "url": "https://pokehostel.com/pokemon-unbreakable-ties/"}, {"title": "Pokemon Uranium", "url": "https://www.reddit.com/r/pokemonuranium/comments/m9yvd6/download_links/?utm%5C_source=share&utm%5C_medium=android%5C_app&utm%5C_name=androidcss&utm%5C_term=1&utm%5C_content=share%5C_button"}, {"title": "Power Bomberman", "url": "https://www.bombermanboard.com/viewtopic.php?t=1925"}, {"title": "Power Rangers: It's Morphin' Time", "url": "https://popherogames.com/"}, {"title": "Argentum Age", "url": "http://argentumage.com/"}, {"title": "Quake Brutalist Jam 3 - Standalone & Mod", "url": "https://qbj3.slipseer.com/"}, {"title": "Rayman Lum'o'Grams", "url": "https://sonicfangameshq.com/forums/showcase/rayman-lumograms-30th-anniversary-demo.2637/puzzle"}, {"title": "Rayman Redemption", "url": "https://gamejolt.com/p/version-1-1-4-has-been-released-this-update-only-fixes-one-bug-tha-un2pthix"}, {"title": "Resident Evil 2 FPS", "url": "https://perroautonomo.itch.io/biohazard-2"}, {"title": "Resident Evil 4 HD Project", "url": "https://re4hd.com/?page%5C_id=9654"}, {"title": "Resident Evil: The Mercenaries 3D HD Project", "url": "https://residentevilmodding.boards.net/thread/20599/resident-evil-mercenaries-3d-project"}, {"title": "Residentvania", "url": "https://oco.itch.io/residentvania?ac=qfCyYFQF-yt"}, {"title": "Rick Dangerous DX - Megadrive Genesis Port", "url": "https://z-team.itch.io/rick-dangerous-dx"}, {"title": "Rockband 3 Deluxe", "url": "https://rb3dx.milohax.org/"}, {"title": "Rygar SNES Port", "url": "https://archive.org/details/rygar-v-1.0"}, {"title": "Secret of Mana Plus", "url": "https://www.romhacking.net/hacks/8491/"}, {"title": "Sega Rally 2 - 25th Anniversary Edition", "url": "https://archive.org/details/sega-rally-2-25th-anniversary"}, {"title": "Sega vs Capcom: The Next Level", "url": "https://makingthecrossover.fandom.com/wiki/SEGA_vs._Capcom:_The_Next_Level"}, {"title": "Shenmue - Dreams of Saturn", "url": "https://www.shenmuedojo.com/forum/index.php?threads/a-shenmue-story-new-shenmue-journey-from-george-kitchen.5470/"}, {"title": "Shin Megami Tensei: Nocturne - Hardtype", "url": "https://www.romhacking.net/hacks/3299/"}, {"title": "Silent Hill 2 Enhanced Edition", "url": "https://enhanced.townofsilenthill.com/SH2/about.htm"}, {"title": "Signalis Gameboy Demake", "url": "https://jayjay-1992.itch.io/signalis-gb"}, {"title": "Skies of Arcadia: Legends Maeson", "url": "https://www.romhacking.net/hacks/2859/"}, {"title": "Slippi - Super Smash Brothers Melee Online PvP with Rollback Netcode", "url": "https://slippi.gg/"}, {"title": "Smash 64 Remix", "url": "https://smash64.online/remix/"}, {"title": "SNK vs Capcom C64 C128 Port", "url": "https://c64universe.com/2025/06/07/snk-vs-capcom-stronger-edition-for-c64-c128-new-demo/"}, {"title": "Sonic 1 Forever", "url": "https://teamforeveronline.wixsite.com/home/sonic-1-forever"}, {"title": "Sonic 2 Absolute", "url": "https://teamforeveronline.wixsite.com/home/sonic-2-absolute"}, {"title": "Sonic 2 Gear Shift", "url": "https://hedgehogtechnicalinstitute.com/forum/viewtopic.php?t=199&sid=5f8ee328149e8550e942b1dae1303948"}, {"title": "Sonic 2 HD", "url": "https://sonic2hd.com/download/"}, {"title": "Sonic And The Hedgehogs", "url": "https://evilbritishguy.itch.io/sonic-and-the-hedgehogs"}, {"title": "Sonic 3 Angel Island Revisited", "url": "https://sonic3air.org/"}, {"title": "Sonic After The Sequel DX", "url": "https://forums.sonicretro.org/threads/sonic-after-the-sequel-dx.37097/"}, {"title": "Sonic Amiga Tech Demo", "url": "https://retroric.itch.io/sonic-the-hedgehog-amiga-tech-demo"}, {"title": "Sonic & the Moon Facility", "url": "https://gamejolt.com/games/sonicmoonfacility/975042"}, {"title": "Sonic Classic Heroes", "url": "https://gamejolt.com/games/scheroes/884938"}, {"title": "Sonic Daybreak", "url": "https://gamejolt.com/games/sonicdaybreak/1015062"}, {"title": "Sonic ERaZor", "url": "https://sonic-erazor.selbi.club/"}, {"title": "Sonic Galactic", "url": "https://sonicgalactic.github.io/"}, {"title": "Sonic GT", "url": "https://gamejolt.com/games/Sonic-GT/533291"}, {"title": "Sonic GX", "url": "https://www.pouet.net/prod.php?which=105245"}, {"title": "Sonic J Online Physics Demo", "url": "https://gamejolt.com/games/sonic_j/261887"}, {"title": "Sonic Master System Remake", "url": "https://gamejolt.com/games/sonicsmsremake/639432"}, {"title": "Sonic Omens", "url": "https://gamejolt.com/games/SonicOmens/469351"}, {"title": "Sonic Project 06", "url": "https://archive.org/details/project-06-update-3.5"}, {"title": "Sonic Project Forestation", "url": "https://gamejolt.com/games/forestation/918619"}, {"title": "Sonic the Hedgehog rpg", "url": "https://www.sonic-rpg.com/"}, {"title": "Sonic Riders Tournament Edition", "url": "https://www.sonicriders.org/"}, {"title": "Sonic Robo Blast 2", "url": "https://www.srb2.org/"}, {"title": "Sonic Robo Blast 32X", "url": "https://ssntails.srb2.org/srb32x/"}, {"title": "Sonic Robo Blast 2 Kart", "url": "https://mb.srb2.org/addons/srb2kart.2435/"}, {"title": "Sonic Smackdown", "url": "https://arcforged.itch.io/sonic-smackdown"}, {"title": "Sonic Time Twisted", "url": "https://overboundn.itch.io/sonic-time-twisted"}, {"title": "Sonic Triple Trouble 16-bit", "url": "https://gamejolt.com/games/sonictripletrouble16bit/322794"}, {"title": "Sonic UltraSaturn", "url": "https://www.sonicfangameshq.com/forums/showcase/sonic-ultrasaturn.2059/"}, {"title": "Sonic Utopia", "url": "https://sonicfangameshq.com/forums/showcase/sonic-utopia-early-demo.33/"}, {"title": "Soul Calibur: Swords of Destiny", "url": "https://gamejolt.com/games/Soul_Calibur_Swords_of_Destiny/910254"}, {"title": "Space Quest II - VGA Deluxe", "url": "https://infamousadventures.itch.io/space-quest-ii-vga-remake"}, {"title": "Spartan Survivors", "url": "https://store.steampowered.com/app/3997630/Spartan_Survivors/"}, {"title": "Squid Games - Gameboy Fan Game", "url": "https://64bitsanimation.itch.io/squid-game-boy?ref=retrododo.com"}, {"title": "Star Fox: Event Horizon", "url": "https://starfoxeh.weebly.com/"}, {"title": "Star Fox EX (SNES)", "url": "https://romhackplaza.org/romhacks/starfox-ex-super-nintendo/"}, {"title": "Starship Troopers 2005", "url": "https://www.reddit.com/r/SteamDeck/comments/13t36hr/starship_troopers_2005_on_deck_how_to_setup_etc/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, {"title": "Street Fighter One Remake", "url": "https://gamejolt.com/games/StreetFighterone/690503"}, {"title": "Street Fighter Z", "url": "https://juegosdemugen.com/en/street-fighter-z-mugen-2"}, {"title": "Street Fighter x Mega Man", "url": "https://gamebanana.com/mods/402226"}, {"title": "Streets of Rage Remake", "url": "https://street-rage-remake.en.uptodown.com/windows#google_vignette"}, {"title": "Streets of Rage 2 - Final Fight Crossover", "url": "https://www.romhacking.net/hacks/4527/"}, {"title": "Streets of Rage 2 - New Era", "url": "https://www.sor2newera.com/"}, {"title": "Streets of Rage 2 - Teenage Mutant Ninja Turtles hack", "url": "https://www.romhacking.net/hacks/7399/"}, {"title": "Sugar Ghouls", "url": "https://sodaraptor.itch.io/sugar-ghouls"}, {"title": "Super Dodgeball SNES Port", "url": "https://archive.org/details/super-super-dodgeball"}, {"title": "Super Freaks Ultimate Edition Turbo", "url": "https://mr-freaks.itch.io/super-freaks-1-ultimate-edition"}, {"title": "Super Mario 3 Mario Forever", "url": "https://super-mario-3-mario-forever.en.uptodown.com/windows"}, {"title": "Super Mario 3D All-Stars Deluxe Launcher Pack", "url": "https://gitlab.com/Minibattle/super-mario-3d-all-stars-deluxe"}, {"title": "Super Mario 64: CoopWare", "url": "https://mods.sm64coopdx.com/mods/coopware.993/"}, {"title": "Super Mario 64: Last Impact", "url": "https://www.romhacking.net/hacks/5964/"}, {"title": "Super Mario 64 Splitscreen Multiplayer", "url": "https://romhacking.com/hack/multiplayer-64-splitscreen-multiplayer"}, {"title": "Super Mario All-stars Launcher For Super Mario World", "url": "https://github.com/qurious-pixel/SMAS_Launcher"}, {"title": "Super Mario & the Rainbow Stars", "url": "https://superstarshi.github.io/smatrs/download"}, {"title": "Super Mario Brothers 3 Level Design Contest", "url": "https://www.romhacking.net/hacks/9082/"}, {"title": "Super Mario Bros. CD", "url": "https://famicomcd.org/smbcd"}, {"title": "Super Mario Brothers Flashback", "url": "https://mfgg.net/index.php?act=resdb&param=02&c=2&id=37605"}, {"title": "Super Mario Brothers Hack Portal", "url": "https://smbarena.com/search?p=0"}, {"title": "Super Mario Brothers Movie", "url": "https://speedymcfly.itch.io/the-super-mario-bros-movie-video-game"}, {"title": "Super Mario Bros. Wonder Demake", "url": "https://shafox.itch.io/super-mario-bros-wonder"}, {"title": "Super Mario Buys Bread", "url": "https://hedgehogtechnicalinstitute.com/forum/viewtopic.php?t=193&sid=5f8ee328149e8550e942b1dae1303948"}, {"title": "Super Mario Galaxy 63", "url": "https://gamebanana.com/mods/619649"}, {"title": "Super Mario Kart ZX", "url": "https://srperez.itch.io/smk-zx"}, {"title": "Super Mario Meltdown", "url": "https://romhacking.com/hack/super-mario-meltdown"}, {"title": "Super Mario Star Road", "url": "https://www.romhacking.net/hacks/873/"}, {"title": "Super Mario Sunburn", "url": "https://romsfun.com/roms/gamecube/super-mario-sunburn.html"}, {"title": "Super Mario Sunshine Definitive Edition", "url": "https://www.reddit.com/r/SteamDeck/comments/xhybbd/super_mario_sunshine_definitive_edition/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, {"title": "Super Mario UniMaker", "url": "https://ninstars.itch.io/unimaker"}, {"title": "Super Mario War", "url": "http://smwstuff.net/game"}, {"title": "Pro Evolution Soccer 5​", "url": "https://www.myabandonware.com/game/world-soccer-winning-eleven-9-g2k"}, {"title": "Super Mario World Return to Dinosaur Land", "url": "https://www.smwcentral.net/?a=details&id=4990&p=section"}, {"title": "Super Mario World Random Revolution", "url": "https://www.smwcentral.net/?p=viewthread&t=104877"}, {"title": "Super Mario World - Simpatico", "url": "https://www.smwcentral.net/?p=section&a=details&id=38712"}, {"title": "Super Mario World - The Princess Rescue 3", "url": "https://www.smwcentral.net/?p=section&a=details&id=35294"}, {"title": "Super Metroid: X-Fusion", "url": "https://metroidconstruction.com/hack.php?id=837"}, {"title": "Super Smash Brothers Brawl - Project+", "url": "https://projectplusgame.com/"}, {"title": "Super Smash Bros. Crusade", "url": "https://smash-crusade.itch.io/crusade"}, {"title": "Super Smash Flash 2", "url": "https://www.supersmashflash.com/play/ssf2/"}, {"title": "Super Smash Land", "url": "https://www.supersmashland.com/"}, {"title": "Super Star Wars Holiday Special", "url": "https://master-linkuei.itch.io/super-star-wars-holiday-special"}, {"title": "Super Star Wars Redux", "url": "https://romhackplaza.org/romhacks/super-star-wars-redux-snes/"}, {"title": "Super Star Wars - Return of the Jedi Redux", "url": "https://romhackplaza.org/romhacks/super-star-wars-return-of-the-jedi-redux-snes/"}, {"title": "Super Star Wars - The Empire Strikes Back Redux", "url": "https://romhackplaza.org/romhacks/super-star-wars-the-empire-strikes-back-redux-snes/"}, {"title": "Sven Co-op", "url": "https://store.steampowered.com/app/225840/Sven_Coop/"}, {"title": "Tango - Mega Man Battle Network with Rollback Netcode", "url": "https://tango.n1gp.net/"}, {"title": "Tanks Rebirth", "url": "https://github.com/RighteousRyan1/TanksRebirth/releases"}, {"title": "Tecmo Super Bowl 2024", "url": "https://tecmobowl.org/files/file/868-tecmo-super-bowl-2024-final-edition/"}, {"title": "Teenage Mutant Ninja Turtles SNES Port", "url": "https://archive.org/details/teenage-mutant-ninja-turtles-snes_202511"}, {"title": "Teenage Mutant Ninja Turtles: Shredder's Re-Revenge", "url": "https://www.romhacking.net/hacks/7399/"}, {"title": "Tetris Rosy Retrospection DX", "url": "https://www.romhacking.net/hacks/8259/"}, {"title": "The Ark", "url": "https://www.aeriform.io/0232a57db92c1c62161124a6ed855f96/ark"}, {"title": "The Bells of Arietta", "url": "https://www.mediafire.com/file/a0s5xczjzfz2ku0/The+Bells+Arietta+v1.2.0.zip/file"}, {"title": "The Driver Syndicate", "url": "https://driver-syndicate.com/"}, {"title": "The Goonies MSX Remake", "url": "https://goonies.jorito.net/"}, {"title": "The Legend of Banjo-Kazooie The Bear Waker Deluxe", "url": "https://youtu.be/lBObk1gfPaY?si=_vb4c14JIBFqMZD7"}, {"title": "The Legend of Banjo-Kazooie - The Jiggies of Time", "url": "https://www.romhacking.net/hacks/6398/"}, {"title": "The Legend of Zelda: Ganon's Deception", "url": "https://www.romhacking.net/hacks/2476/"}, {"title": "The Legend of Zelda: Master of Time", "url": "https://www.romhacking.net/hacks/5801/"}, {"title": "The Legend of Zelda: Mirror of Worlds", "url": "https://www.romhacking.net/hacks/9203/"}, {"title": "The Legend of Zelda: Ocarina of Time Ultimate Trial", "url": "https://www.romhacking.net/hacks/8640/"}, {"title": "The Legend of Zelda: Reality Estate", "url": "https://www.romhacking.net/hacks/9117/"}, {"title": "The Legend of Zelda: Sealed Palace", "url": "https://www.romhacking.net/hacks/7663/"}, {"title": "The Legend of Zelda SNES Port", "url": "https://archive.org/details/the-legend-of-zelda-snes_202510"}, {"title": "The Legend of Zelda: The Missing Link", "url": "https://www.romhacking.net/hacks/5334/"}, {"title": "The Legend of Zelda: Voyager of Time", "url": "https://www.romhacking.net/hacks/5797/"}, {"title": "The Lost Vikings: Ragnarok Edition", "url": "https://www.romhacking.net/hacks/8985/"}, {"title": "The Patchmaker's Workshop", "url": "https://romhacking.com/hack/the-patchmaker-s-workshop"}, {"title": "Thief The Black Parade", "url": "https://www.thiefguild.com/fanmissions/26275/thief-the-black-parade?campaign_details=t#campaign-details"}, {"title": "Tiny Toon adventures DX", "url": "https://romhackplaza.org/romhacks/tiny-toon-adventures-dx-babs-big-break-colorization-patch-for-game-boy-color-game-boy/"}, {"title": "TMNT Rescue Palooza", "url": "https://gamejolt.com/games/TMNT-Rescue-Palooza/39658"}, {"title": "Tony Hawk's American Wasteland reTHAWed", "url": "https://rethawed.com/"}, {"title": "Toontown Rewritten", "url": "https://www.toontownrewritten.com/"}, {"title": "Turrican 128K Remaster", "url": "https://www.moodler.pl/download/turrican-128kb/"}, {"title": "Ultimate Doom 32X Resurrection", "url": "https://www.doomworld.com/forum/topic/155631-ultimate-doom-32x-resurrection/"}, {"title": "Ultimate Sonic Smackdown", "url": "https://arcforged.itch.io/ultimatesonicsmackdown"}, {"title": "Ultimate Trial", "url": "https://github.com/RichieUltimate/ultimate-trial/tree/main"}, {"title": "Undefeated", "url": "https://store.steampowered.com/app/1116960/UNDEFEATED/"}, {"title": "Undertale Yellow - An Undertale Prequel", "url": "https://gamejolt.com/games/UndertaleYellow/136925"}, {"title": "Wario's Conquest - Super Mario Land 2 Reclaimed", "url": "https://gamejolt.com/games/SML2WCremake/895658"}, {"title": "Warzone 2100", "url": "https://wz2100.net/"}, {"title": "Wega & The Lost Media", "url": "https://team-lost-media.github.io/Pages/watlm.html#About_section"}, {"title": "Wolfenstein RPG", "url": "https://www.doomworld.com/forum/topic/151475"}, {"title": "X-Men Arcade Remake", "url": "https://gamejolt.com/games/XMKO/994483"}, {"title": "X-Men Mutant Apocalypse Remake", "url": "https://gamejolt.com/games/XMENMA/978953"}, {"title": "Xenosaga Pied Piper - Fan Recreation", "url": "https://cyclonefox.itch.io/xenosaga-pied-piper"}, {"title": "YARG - Yet Another Rhythm Game", "url": "https://yarg.in/"}, {"title": "Yume Nikki PS", "url": "https://eliasdaler.itch.io/yume-nikki-ps1"}, {"title": "Zelda3 Parallel Worlds", "url": "https://www.romhacking.net/hacks/197/"}, {"title": "Zelda Dungeons of Infinity", "url": "https://justinbohemier.wixsite.com/portfolio/game-design"}, {"title": "Zelda's adventureDX", "url": "https://john-lay.itch.io/zeldas-adventure/devlog/1107281/major-update"}, {"title": "Zelda II The adventures of Link SNES Port", "url": "https://archive.org/details/zelda-ii-the-adventure-of-link-snes_202510"}, {"title": "Zelda Ocarina of Time - Unreal Engine Remake", "url": "https://www.patreon.com/collection/912225?view=expanded"}, {"title": "Zelda: Oni Link Begins", "url": "https://sourceforge.net/projects/zeldaolb/"}, {"title": "Zenless Zone Zero on Steam Deck", "url": "https://youtu.be/uZEZy7jxj30?si=yJFMHmmYkM1buZz6"}, {"title": "Zombies Ate My Neighbours: Escape The House!", "url": "https://romhackplaza.org/romhacks/escape-the-house-genesis/"}, {"title": "ZQuest Classic (Zelda)", "url": "https://www.purezc.net/forums/index.php?showtopic=78707"}, {"title": "ZQuest Classic (Zelda) - Quest Lists", "url": "https://www.purezc.net/index.php?page=featured"}, {"title": "0 A.D.", "url": "https://play0ad.com/"}, {"title": "2 Ship 2 Harkinian - The Legend of Zelda Majora's Mask PC Port", "url": "https://github.com/HarbourMasters/2ship2harkinian"}, {"title": "The Legend of Zelda: Majora's Mask Recompilation", "url": "https://github.com/Zelda64Recomp/Zelda64Recomp"}, {"title": "R.E.L.I.V.E. - Abe's Odyssey Exodus PC Port", "url": "https://aliveteam.github.io/"}, {"title": "ACEmulator - Asheron's Call Server Emulator", "url": "https://github.com/ACEmulator/ACE"}, {"title": "Aleph One - Marathon Trilogy", "url": "https://github.com/Aleph-One-Marathon/alephone"}, {"title": "Ambermoon Decompilation", "url": "https://github.com/Pyrdacor/Ambermoon.net"}, {"title": "Anarch", "url": "https://drummyfish.gitlab.io/anarch/"}, {"title": "Apotris", "url": "https://akouzoukos.com/apotris"}, {"title": "Arkhenaten", "url": "https://dalerank.itch.io/akhenaten"}, {"title": "Arx Libertatis - Arx Fatalis Port", "url": "https://arx-libertatis.org/"}, {"title": "AssaultCube", "url": "https://assault.cubers.net/"}, {"title": "Balatro - GBA Demake", "url": "https://github.com/GBALATRO/balatro-gba"}, {"title": "Barbarian", "url": "http://barbarian.1987.free.fr/indexEN.htm"}, {"title": "Beyond All Reason", "url": "https://www.beyondallreason.info/"}, {"title": "Boneforge Battlegrounds", "url": "https://matty77.itch.io/boneforge-battlegrounds"}, {"title": "BStone - Port of Blake Stone: Aliens of Gold and Blake Stone: Planet Strike", "url": "https://bibendovsky.github.io/bstone/"}, {"title": "Castlevania Symphony of the Night - Play as Maria", "url": "https://github.com/Xeeynamo/sotn-decomp/wiki/Maria-PSP-for-PSX-%E2%80%90-How-to-install"}, {"title": "Cataclysm: Dark Days Ahead", "url": "https://cataclysmdda.org/"}, {"title": "Cave Story Port", "url": "https://github.com/doukutsu-rs/doukutsu-rs"}, {"title": "C-Evo", "url": "http://c-evo.org/"}, {"title": "Citybound", "url": "https://aeplay.org/citybound"}, {"title": "Civctp2 - Apolyton version of Call To Power II", "url": "https://github.com/civctp2/civctp2/"}, {"title": "ClanGen", "url": "https://sablesteel.itch.io/clan-gen-fan-edit"}, {"title": "ClassiCube", "url": "https://www.classicube.net/"}, {"title": "Command & Conquer Remastered Collection", "url": "https://github.com/electronicarts/CnC_Remastered_Collection"}, {"title": "Conflict 3049", "url": "https://matty77.itch.io/conflict-3049"}, {"title": "CorsixTH - Theme Hospital Port", "url": "https://github.com/CorsixTH/CorsixTH"}, {"title": "Cortex Command Community Project", "url": "https://cortex-command-community.github.io/"}, {"title": "Counter-Strike: Football", "url": "https://github.com/solcloud/Counter-Strike"}, {"title": "Cro-Mag Rally", "url": "https://jorio.itch.io/cromagrally"}, {"title": "Cube 2: Sauerbraten", "url": "http://sauerbraten.org/"}, {"title": "Cubyz", "url": "https://github.com/PixelGuys/Cubyz"}, {"title": "Cuphead - Wii U Port", "url": "https://thelatteteam.itch.io/cuphead-wii-u"}, {"title": "Cytopia", "url": "https://cytopia.itch.io/cytopia"}, {"title": "Daggerfall Unity", "url": "https://www.dfworkshop.net/"}, {"title": "DDraceNetwork", "url": "https://ddnet.org/"}, {"title": "DXX-Rebirth: Open Descent", "url": "https://www.dxx-rebirth.com/"}, {"title": "Descent 3 Port", "url": "https://github.com/DescentDevelopers/Descent3/releases/tag/v1.5.0"}, {"title": "Devilution X - Open Diablo for Steam Deck", "url": "https://www.reddit.com/r/SteamDeck/comments/w9epsg/guide_diablo_1_on_steam_deck_using_devilutionx/?utm%5C_source=share&utm%5C_medium=android%5C_app&utm%5C_name=androidcss&utm%5C_term=1&utm%5C_content=share%5C_button%5D%28https%3A%2F%2Fwww.reddit.com%2Fr%2FSteamDeck%2Fcomments%2Fw9epsg%2Fguide_diablo_1_on_steam_deck_using_devilutionx%2F%3Futm_source%3Dshare&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, {"title": "Devilution X - Open Diablo", "url": "https://github.com/diasurgical/devilutionX"}, {"title": "Dinosaur Planet Recompilation", "url": "https://github.com/DinosaurPlanetRecomp/dino-recomp"}, {"title": "Dinosaur Planet Recompilation ROM Patcher", "url": "https://dinosaurpla.net/"}, {"title": "Dinosaur Planet Recompilation Mods Page", "url": "https://thunderstore.io/c/dinosaur-planet-recompiled/"}, {"title": "Dogwalk", "url": "https://blenderstudio.itch.io/dogwalk"}, {"title": "Doom 64 - Dreamcast Port", "url": "https://dreamcast.gameplayer.club/index.php/downloads/summary/58-disk-images/493-doom-64-2025-02-15-incl-nightdive-studios-levels-cdi"}, {"title": "Doom 64 EX", "url": "https://www.pcgamingwiki.com/wiki/Doom_64_EX#google_vignette"}, {"title": "Dr. Mario 64 Recompilation", "url": "https://github.com/theboy181/drmario64_recomp_plus"}, {"title": "Duke Nukem Zero Hour Recompilation", "url": "https://github.com/sonicdcer/DNZHRecomp/releases"}, {"title": "Dungeon Crawl Stone Soup", "url": "https://crawl.develz.org/"}, {"title": "DungeonFX - Dungeon Keeper Port", "url": "https://keeperfx.net/"}, {"title": "OpenDUNE", "url": "https://github.com/OpenDUNE/OpenDUNE"}, {"title": "Dune 2 The Maker", "url": "https://dune2themaker.fundynamic.com/"}, {"title": "ECWolf - Wolfenstein 3D Port", "url": "https://maniacsvault.net/ecwolf/"}, {"title": "EDuke32 - Duke Nukem 3D Port", "url": "https://www.eduke32.com/"}, {"title": "Exult - Ultima VII Reimplementation", "url": "https://exult.sourceforge.io/"}, {"title": "Fallout Community Edition", "url": "https://github.com/alexbatalov/fallout1-ce"}, {"title": "Fallout 2 Community Edition", "url": "https://github.com/alexbatalov/fallout2-ce"}, {"title": "Fheroes2 - Heroes of Might & Magic 2 Recreation", "url": "https://github.com/ihhub/fheroes2"}, {"title": "Fish Folk: Jumpy", "url": "https://fishfolk.org/games/jumpy/"}, {"title": "Flashback - Sega Saturn Port", "url": "https://segaxtreme.net/threads/flashback-macintosh-version-reminiscence-for-sega-saturn-beta.37965/"}, {"title": "FlightGear", "url": "https://www.flightgear.org/"}, {"title": "FPC Atomic - Atomic Bomberman Reimplimentation", "url": "https://github.com/PascalCorpsman/fpc_atomic"}, {"title": "FreeCiv", "url": "https://www.freeciv.org/"}, {"title": "FreeCol", "url": "https://www.freecol.org/"}, {"title": "Freedoom", "url": "https://freedoom.github.io/about.html"}, {"title": "FreeOrion", "url": "https://www.freeorion.org/index.php/Main_Page"}, {"title": "Freeserf - Settlers 1 Clone", "url": "https://github.com/Pyrdacor/freeserf.net"}, {"title": "FreeSpace Open", "url": "https://www.hard-light.net/"}, {"title": "FS2Open - Open Freespace 2", "url": "https://scp.indiegames.us/bnr_fs2open.php"}, {"title": "Frets on Fire", "url": "https://fretsonfire.sourceforge.net/"}, {"title": "Friday Night Funkin'", "url": "https://ninja-muffin24.itch.io/funkin"}, {"title": "GemRB - Implementation of Infinity Engine - Baldur's Gate, Icewind Dale, Planescape: Torment", "url": "https://gemrb.org/Features.html"}, {"title": "GLSMAC - Sid Meier's Alpha Centauri Port", "url": "https://github.com/afwbkbc/glsmac"}, {"title": "Grand Theft Auto 3 Dreamcast Port", "url": "https://dca3.net/liberty/"}, {"title": "Grand Theft Auto Vice City Dreamcast Port", "url": "https://dca3.net/miami/"}, {"title": "Half-Life: Decay PC Port", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=376774460"}, {"title": "Hedgewars", "url": "https://hedgewars.itch.io/hedgewars"}, {"title": "Hurry Curry!", "url": "https://hurrycurry.org/"}, {"title": "Hypersomnia", "url": "https://github.com/TeamHypersomnia/Hypersomnia"}, {"title": "Infinity Blade", "url": "https://infinity-blade-pc.en.uptodown.com/windows"}, {"title": "Infinity Blade 2", "url": "https://infinity-blade-ii-pc.en.uptodown.com/windows"}, {"title": "ioquake3 - Quake 3: Arena Port", "url": "https://ioquake3.org/"}, {"title": "Jagged Alliance 2 Stracciatella", "url": "https://ja2-stracciatella.github.io/"}, {"title": "OpenGoal - Jak & Daxter, Jak 2 and Jak 3 Native PC Ports", "url": "https://github.com/open-goal/jak-project"}, {"title": "Jazz Resurrection - native-pc-port Jazz Jackrabbit 2", "url": "https://flathub.org/en/apps/tk.deat.Jazz2Resurrection"}, {"title": "Julius - Caesar III Remake", "url": "https://github.com/bvschaik/julius"}, {"title": "KaM Remake", "url": "https://www.kamremake.com/download/"}, {"title": "Kindergarten - Wii U Port", "url": "https://thelatteteam.itch.io/kindergarten-1-wiiu"}, {"title": "kkrieger", "url": "https://gamejolt.com/games/kkrieger/878950"}, {"title": "Legend of Dragoon Port - Severed Chains", "url": "https://legendofdragoon.org/projects/severed-chains/"}, {"title": "Lego Island PC Port", "url": "https://github.com/isledecomp/isle-portable"}, {"title": "Lego Island Web Port", "url": "https://isle.pizza/"}, {"title": "Lemmini - Lemmings Port", "url": "https://github.com/mjfwalsh/lemmini?tab=readme-ov-file"}, {"title": "Liblast", "url": "https://libla.st/"}, {"title": "LinCity-NG", "url": "https://github.com/lincity-ng/lincity-ng/releases"}, {"title": "Link: Faces of Evil & Zelda: Wand of Gamelon Remastered", "url": "https://archive.org/details/FOER-and-WOGR"}, {"title": "LSD: Revamped - LSD: Dream Emulator Remake", "url": "https://github.com/figglewatts/LSDRevamped?hl=en-IE"}, {"title": "Mario Kart 64 - Dreamcast Port", "url": "https://github.com/jnmartin84/mk64-dc"}, {"title": "Mario Kart 64 Recompilation", "url": "https://github.com/sonicdcer/MarioKart64Recomp?reddit"}, {"title": "Maze of Galious Port", "url": "https://cdromance.org/windows/maze-of-galious-windows/"}, {"title": "MBHaxe - Marble Blast Port", "url": "https://github.com/RandomityGuy/MBHaxe"}, {"title": "Mega Man Legends PC Port", "url": "https://www.rockman-corner.com/2025/08/mega-man-legends-pc-port-gets.html?m=1"}, {"title": "Memoria - Tools for Final Fantasy IX", "url": "https://github.com/Albeoris/Memoria"}, {"title": "Meritous", "url": "https://www.asceai.net/meritous/"}, {"title": "micropolis-JS", "url": "https://github.com/graememcc/micropolisJS"}, {"title": "Mute Crimson DX Dreamcast Port", "url": "https://icedlizardgames.itch.io/mute-crimson-dc"}, {"title": "Myst Online: Uru Live", "url": "https://mystonline.com/en/"}, {"title": "Mystical Ninja Starring Goemon Recompilation", "url": "https://github.com/klorfmorf/Goemon64Recomp"}, {"title": "Naev", "url": "https://naev.org/"}, {"title": "Endless Sky", "url": "https://endless-sky.github.io/"}, {"title": "NakedAVP: Aliens vs Predator Classic (2000) Port", "url": "https://github.com/atsb/NakedAVP"}, {"title": "NBlood - Blood Exhumed Port", "url": "https://github.com/NBlood/NBlood"}, {"title": "NetHack", "url": "https://nethack.org/"}, {"title": "OMoHAAA - Open Medal of Honour Allied Assault", "url": "https://github.com/openmoh/openmohaa?tab=readme-ov-file"}, {"title": "Oolite: An Open-World Space Opera", "url": "https://oolite.space/"}, {"title": "Open1560 - Midtown Madness", "url": "https://0x1f9f1.github.io/Open1560/"}, {"title": "OpenAge", "url": "https://openage.sft.lol/"}, {"title": "OpenDAoC - Dark Age of Camelot Server Emulator", "url": "https://github.com/OpenDAoC/OpenDAoC-Core"}, {"title": "OpenEnroth - Open reimplementation of Might and Magic 6, 7 & 8 Engine", "url": "https://github.com/OpenEnroth/OpenEnroth"}, {"title": "Open Fodder", "url": "https://openfodder.com/"}, {"title": "OpenGothic - Gothic 2 Port", "url": "https://github.com/Try/OpenGothic"}, {"title": "OpenHCL", "url": "https://wiibrew.org/wiki/OpenHCL"}, {"title": "OpenHV", "url": "https://www.openhv.net/"}, {"title": "OpenLoco - Chris Sawyer's Locomotion Port", "url": "https://openloco.io/download/"}, {"title": "OpenMW - Morrowind Port", "url": "https://openmw.org/"}, {"title": "OpenNox", "url": "https://opennox.github.io/docs/index.html"}, {"title": "OpenOMF - One Must Fall 2097", "url": "https://openomf.org/"}, {"title": "OpenRA - Command & Conquer Red Alert + Tiberian Dawn + Dune 2000", "url": "https://www.openra.net/download/"}, {"title": "OpenRCT2 - Roller Coaster Tycoon 2", "url": "https://openrct2.io/"}, {"title": "OpenRW - GTA III Reimplementation", "url": "https://openrw.org/"}, {"title": "OpenTESArena - Elder Scrolls Arena Open-source Reimplementation", "url": "https://github.com/afritz1/OpenTESArena"}, {"title": "OpenTTD - Port of Transports Tycoon Deluxe", "url": "https://www.openttd.org/"}, {"title": "OpenTyrian 2000", "url": "https://github.com/KScl/opentyrian2000"}, {"title": "OpenXcom", "url": "https://openxcom.org/"}, {"title": "PCExhumed - Exhumed Powerslave Port", "url": "https://pcex.retrohost.net/"}, {"title": "Perfect Dark PC Port", "url": "https://github.com/fgsfdsfgs/perfect_dark"}, {"title": "Pioneer Space Sim", "url": "https://pioneerspacesim.net/#slide0"}, {"title": "Pixel Dungeon", "url": "https://watabou.itch.io/pixel-dungeon"}, {"title": "Playable3DMaze", "url": "https://github.com/x86matthew/Playable3DMaze"}, {"title": "PoolTool", "url": "https://github.com/ekiefl/pooltool"}, {"title": "Portal64 Still Alive", "url": "https://github.com/VideogameSources/portal64-still-alive"}, {"title": "Portal: Still Alive PC Port", "url": "https://www.moddb.com/mods/still-alive-for-steam-deck"}, {"title": "Prince of Persia Original Trilogy Port", "url": "https://www.popot.org/get_the_games.php?game=SDLPoP"}, {"title": "Project Alice - Victoria 2 Port", "url": "https://github.com/schombert/Project-Alice"}, {"title": "Project Diablo 2", "url": "https://www.projectdiablo2.com/download"}, {"title": "ProjectR - San Francisco Rush: The Rock and San Francisco Rush 2049 Ports", "url": "https://t3hd0gg.com/project-r/"}, {"title": "puzzleMoppet Port", "url": "https://github.com/karjonas/puzzle-Moppet"}, {"title": "Quest 64 Recompilation", "url": "https://github.com/Rainchus/Quest64-Recomp"}, {"title": "Quick Dungeon Crawler", "url": "https://www.reddit.com/r/opensourcegames/comments/1owrr8q/timekiller_roguelite_quick_dungeon_crawler_v360/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, {"title": "ReDriver2 - Driver 2 PC Port", "url": "https://github.com/OpenDriver2/REDRIVER2"}, {"title": "Return to the Roots - Settlers II Remake", "url": "https://www.siedler25.org/index.php?com=dynamic&mod=1&lang=en&PHPSESSID=g41c6ln3b8qajolf9d25uv1418"}, {"title": "ROTA: Bend Gravity", "url": "https://harmonymonroe.itch.io/rota"}, {"title": "RVGL - Re-Volt Port", "url": "https://rvgl.org/"}, {"title": "Ship of Harkinian - Zelda Ocarina of Time Port", "url": "https://github.com/HarbourMasters/Shipwright"}, {"title": "Ship of Harkinian mods", "url": "https://gamebanana.com/mods/games/16121"}, {"title": "The Simpsons Hit & Run PC Port", "url": "https://youtu.be/QV-70fe4hWc?si=F0Ne5n0lMlxeUhth"}, {"title": "Sonic Mania Decompilation", "url": "https://gamebanana.com/tuts/15290"}, {"title": "Sonic the Hedgehog (2013) and Sonic the Hedgehog 2 (2013) Decompilation", "url": "https://github.com/RSDKModding/RSDKv4-Decompilation"}, {"title": "Sonic Unleashed Recompilation", "url": "https://github.com/hedge-dev/UnleashedRecomp"}, {"title": "SpaceCadetpinball", "url": "https://github.com/k4zmu2a/SpaceCadetpinball"}, {"title": "Space Station 14", "url": "https://spacestation14.com/"}, {"title": "Spaghetti Kart - Mario Kart 64 PC Port", "url": "https://github.com/HarbourMasters/SpaghettiKart/releases"}, {"title": "Speed Dreams", "url": "https://www.speed-dreams.net/en"}, {"title": "The Ur-Quan Masters - Star Control 2 Port", "url": "https://sc2.sourceforge.net/"}, {"title": "Star Fox 64 Dreamcast Port", "url": "https://github.com/jnmartin84/sf64-dc"}, {"title": "Star Fox 64 Dreamcast Port Builder Guide", "url": "https://colab.research.google.com/drive/1jn7SPKeHwZ-0qXIvA4uzdF-ykeh6xtNL"}, {"title": "Star Fox 64 Recompilation", "url": "https://github.com/sonicdcer/Starfox64Recomp"}, {"title": "Starship - Star Fox 64 PC Port", "url": "https://github.com/HarbourMasters/Starship/releases"}, {"title": "Starship - Star Fox 64 PC Port Mods", "url": "https://gamebanana.com/mods/games/21612"}, {"title": "Stunt Car Remake", "url": "https://pyra-handheld.com/boards/threads/stunt-car-remake.79671/"}, {"title": "Super Mario 64 Co-op Deluxe", "url": "https://sm64coopdx.com/"}, {"title": "Super Mario 64 PC Port", "url": "https://archive.org/details/sm64-source-playable"}, {"title": "Super Mario 64 Render96", "url": "https://www.reddit.com/r/SteamDeck/comments/11nfzw5/comment/jbnau5g/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, {"title": "Super Mario Bros. Remastered", "url": "https://github.com/JHDev2006/Super-Mario-Bros.-Remastered-Public"}, {"title": "Super Mario Bros. Remastered Mods", "url": "https://gamebanana.com/mods/games/22798"}, {"title": "Super Mario Bros. Remastered Custom Levels", "url": "https://levelsharesquare.com/SMBR/levels"}, {"title": "Super Tux Kart", "url": "https://supertuxkart.net/Main_Page"}, {"title": "Super Tux War", "url": "https://github.com/tuxx/super-tux-war"}, {"title": "Teeworlds", "url": "https://www.teeworlds.com/"}, {"title": "The Battle for Wesnoth", "url": "https://www.wesnoth.org/"}, {"title": "The Force Engine - Dark Forces Reimplementation", "url": "https://theforceengine.github.io/"}, {"title": "The Labyrinth Of Time's Edge", "url": "https://the-ventureweaver.itch.io/tlote4111"}, {"title": "The Legend of Zelda A Link To The Past Decompilation", "url": "https://github.com/snesrev/zelda3"}, {"title": "The Legend of Zelda: Link's Awakening DX HD PC Port", "url": "https://gitlab.com/bighead.0/ladxhd_updated"}, {"title": "The World Ends With You Solo Remix Recompilation", "url": "https://www.reddit.com/r/TWEWY/comments/1n58gtx/twewy_solo_remix_is_on_pc/"}, {"title": "TheXTech - Open Source Game Engine", "url": "https://wohlsoft.ru/projects/TheXTech/"}, {"title": "Thrive: Open Source Evolution Sim", "url": "https://github.com/Revolutionary-Games/Thrive/releases/tag/v0.8.3"}, {"title": "Timesplitters Rewind", "url": "https://www.timesplittersrewind.com/"}, {"title": "TRX: Tomb Raider 1 & 2 Reimplementation", "url": "https://github.com/LostArtefacts/TRX"}, {"title": "Ultima VII Revisited", "url": "https://www.u7revisited.com/"}, {"title": "Unciv", "url": "https://yairm210.itch.io/unciv"}, {"title": "Undertale Decompilation", "url": "https://github.com/kittibyte/UndertaleDecomp"}, {"title": "Unknown Horizons", "url": "https://unknown-horizons.org/"}, {"title": "VCMI - Heroes of Might & Magic 3 Open Source Recreation", "url": "https://github.com/vcmi/vcmi"}, {"title": "Veloren", "url": "https://www.veloren.net/"}, {"title": "VoxeLibre (formerly MineClone2)", "url": "https://content.luanti.org/packages/Wuzzy/mineclone2/"}, {"title": "Warzone 2100", "url": "https://wz2100.net/"}, {"title": "Wasted! A Destruction-Derby Online Game", "url": "https://wastedgames.codeberg.page/"}, {"title": "Widelands", "url": "https://www.widelands.org/"}, {"title": "Wipeout Dreamcast Port", "url": "https://github.com/jnmartin84/wipeout-dc/"}, {"title": "Wipeout Phantom Edition PC Port", "url": "https://github.com/wipeout-phantom-edition"}, {"title": "Xonotic", "url": "https://xonotic.org/"}, {"title": "YKnytt", "url": "https://youkaicountry.itch.io/yknytt"}, {"title": "Zelda 2 Enhanced PC Edition", "url": "https://portmaster.games/detail.html?name=ziiaol"}, {"title": "Zelda 64 Recompiled Majora's Mask with Mod Support", "url": "https://github.com/Zelda64Recomp/Zelda64Recomp"}, {"title": "Zelda Classic", "url": "https://www.zeldaclassic.com/about/"}, {"title": "Zero-K", "url": "https://zero-k.info/"}, {"title": "Zork Open Source Port", "url": "https://github.com/historicalsource/zork1"}, {"title": "Zork II Open Source Port", "url": "https://github.com/historicalsource/zork2"}, {"title": "Zork III Open Source Port", "url": "https://github.com/historicalsource/zork3"}, {"title": "Aero Gauge Decompilation", "url": "https://github.com/LLONSIT/AeroGauge"}, {"title": "Aidyn Chronicles The First Mage Decompilation", "url": "https://github.com/blackgamma7/Aidyn"}, {"title": "Alice in Wonderland (Wii) Decompilation", "url": "https://github.com/Alice-2010/Decomp"}, {"title": "AM64 - Another Metroid 64", "url": "https://www.patreon.com/posts/am64-v3-0-0-1-136207928"}, {"title": "Animal Crossing (Gamecube) Decompilation", "url": "https://github.com/ACreTeam/ac-decomp"}, {"title": "Baku Bomberman 2 (JP) Decompilation", "url": "https://github.com/bomberhackers/tsa"}, {"title": "Banjo-Kazooie (N64) Decompilation", "url": "https://github.com/n64decomp/banjo-kazooie"}, {"title": "Banjo-Kazooie (Xbox 360) Decompilation", "url": "https://github.com/banjo360/bk360"}, {"title": "Banjo-Kazooie Grunty's Revenge Decompilation", "url": "https://github.com/jellees/bkgr"}, {"title": "Banjo-Tooie Decompilation", "url": "https://github.com/Mr-Wiseguy/banjo-tooie"}, {"title": "Blast Corps Decompilation", "url": "https://github.com/retroplastic/blastcorps"}, {"title": "Body Harvest Decompilation", "url": "https://github.com/jaytheham/body-harvest-decompilation"}, {"title": "Bomberman Hero Decompilation", "url": "https://github.com/Bomberhackers/bmhero"}, {"title": "Boom Street Decompilation", "url": "https://github.com/FortuneStreetModding/boom-street-decomp"}, {"title": "Breath of Fire Decompilation", "url": "https://github.com/Normmatt/bof"}, {"title": "The Legend of Zelda: Breath of the Wild Decompilation", "url": "https://github.com/zeldaret/botw"}, {"title": "Bully Online", "url": "https://youtu.be/2J0_BnWKvEA?si=6W-N4UdbE67sWjDk"}, {"title": "Burnout 3: Takedown Decompilation", "url": "https://github.com/reburndev/reburn3"}, {"title": "Castlevania 64 Decompilation", "url": "https://github.com/k64ret/cv64"}, {"title": "Castlevania Order of Ecclesia Decompilation", "url": "https://github.com/LagoLunatic/ooe"}, {"title": "Castlevania Symphony of the Night Decompilation", "url": "https://github.com/Xeeynamo/sotn-decomp"}, {"title": "Castlevania Symphony of the Night - Megadrive Genesis Port - Demo", "url": "https://youtu.be/GoPpWU7y70w?si=A13ivHXfmWDOz3Xe"}, {"title": "Chameleon Twist Recompilation", "url": "https://github.com/Rainchus/ChameleonTwist1-JP-Recomp"}, {"title": "Chameleon Twist 2 Decompilation", "url": "https://github.com/chameleontwistret/chameleontwist2v1.0-jp"}, {"title": "Chibi-Robo: PIA Decompilation", "url": "https://github.com/eavpsp/cbr_decomp"}, {"title": "Colin McRae Rally 2.0 Decompilation", "url": "https://github.com/CMR2Decomp/CMR2Decomp"}, {"title": "Conker's Bad Fur Day Decompilation", "url": "https://github.com/mkst/conker"}, {"title": "Contra Decompilation", "url": "https://github.com/vermiceli/nes-contra-us/"}, {"title": "Cosmo's Cosmic Adventure Decompilation", "url": "https://github.com/smitelli/cosmore"}, {"title": "Crash Bandicoot Decompilation", "url": "https://github.com/wurlyfox/c1"}, {"title": "Crash Bandicoot 2: Cortex Strikes Back Decompilation", "url": "https://github.com/ughman/c2c"}, {"title": "Crash Team racing Decompilation", "url": "https://github.com/mkst/ctr"}, {"title": "Crash: Twinsanity Remake", "url": "https://youtu.be/7y3MXMaWWug?si=jMgS0GkZtigdUvX5"}, {"title": "Croc: Legend of the Gobbos Decompilation", "url": "https://github.com/xeeynamo/croc"}, {"title": "Crystalis Decompilation", "url": "https://github.com/crystalisdisassembly/crystalisdisassembly"}, {"title": "Dance Central 3 Decompilation", "url": "https://github.com/rjkiv/dc3-decomp"}, {"title": "Dark Cloud Decompilation", "url": "https://github.com/adubbz/dcdecomp"}, {"title": "Dark Rift Decompilation", "url": "https://github.com/unnunu/darkrift"}, {"title": "Demon's Crest Decompilation", "url": "https://github.com/FredYeye/various-game-disassembly/blob/main/SNES/demons_crest.asm"}, {"title": "Deus-Ex: Human Revolution Decompilation", "url": "https://github.com/rrika/cdcEngineDXHR"}, {"title": "Diddy Kong racing Decompilation", "url": "https://github.com/DavidSM64/Diddy-Kong-racing"}, {"title": "Disney's Piglet's Big Game Decompilation", "url": "https://github.com/tgsm/pbg"}, {"title": "Donkey Kong 64 Decompilation", "url": "https://github.com/0xGlitchbyte/dk64re"}, {"title": "Doraemon: Nobita to Mittsu no Seireiseki Decompilation", "url": "https://github.com/soracode6/doraemon1"}, {"title": "Doshin the Giant Decompilation", "url": "https://github.com/break-core/doshin-gc"}, {"title": "Dragon Quest Monsters Decompilation", "url": "https://github.com/Ebernacher90/DragonQuestMonstersGerman"}, {"title": "Dragon Quest IX Decompilation", "url": "https://github.com/DQIX/dqix-decomp"}, {"title": "Dragon Warrior Decompilation", "url": "https://github.com/nmikstas/dragon-warrior-disassembly"}, {"title": "EarthBound Beginnings Remake", "url": "https://youtu.be/h9ppmP7eG2Q?si=llithvZsPJ_Li4oN"}, {"title": "Elden Ring: Morrowind Overhaul Mod", "url": "https://youtu.be/n89NFtIUWDI?si=fNfYg_4YLM_Blk1-"}, {"title": "Fable 2 Recompilation", "url": "https://github.com/Fable2Recomp/Fable2Recomp"}, {"title": "Fallout: Bakersfield - Doom total conversion Mod (GZDoom Wad)", "url": "https://youtu.be/6e8WrmOibpM?si=I-YCVDzgAUP_bodh"}, {"title": "Fatal Frame Decompilation", "url": "https://github.com/Mikompilation/Himuro"}, {"title": "Fatal Frame 2 Decompilation", "url": "https://github.com/mikompilation/minakami"}, {"title": "Final Fantasy Crystal Chronicles Decompilation", "url": "https://github.com/zcanann/FFCC-Decomp"}, {"title": "Final Fantasy Mystic Quest Megadrive Port", "url": "https://github.com/nicomegadrive/SGDK-ROMS/tree/main/MysticQuest"}, {"title": "Final Fantasy VII Decompilation", "url": "https://github.com/Xeeynamo/ff7-decomp"}, {"title": "Fire Emblem: Shadow Dragon Decompilation", "url": "https://github.com/Eebit/fe11-us"}, {"title": "Fire Emblem: The Blazing Blade Decompilation", "url": "https://github.com/MokhaLeee/FireEmblem7J"}, {"title": "Frogger Decompilation", "url": "https://github.com/HighwayFrogs/frogger-psx"}, {"title": "F-Zero X Decompilation", "url": "https://github.com/inspectredc/fzerox"}, {"title": "Gauntlet Legends Decompilation", "url": "https://github.com/drahsid/gauntlet-legends"}, {"title": "Gex 64 Decompilation", "url": "https://github.com/matbourgon/gex64decomp"}, {"title": "Glover Decompilation", "url": "https://github.com/rainchus/glover"}, {"title": "Goldeneye 007 Decompilation", "url": "https://github.com/n64decomp/007"}, {"title": "Golden Sun Decompilation", "url": "https://github.com/gsret/goldensun"}, {"title": "Goof Troop Decompilation", "url": "https://github.com/Yoshifanatic1/Goof-Troop-Disassembly"}, {"title": "Gran Turismo 2 Decompilation", "url": "https://github.com/ginryuoku/gt2-reversing"}, {"title": "GTA 2 Decompilation", "url": "https://github.com/CriminalRETeam/gta2_re"}, {"title": "Guilty Gear X Series Decompilation", "url": "https://github.com/MoonSquaredd/ggx"}, {"title": "Halo Decompilation", "url": "https://github.com/halo-re/halo"}, {"title": "Harvest Moon 64 Decompilation", "url": "https://github.com/harvestwhisperer/hm64-decomp"}, {"title": "Harvest Moon: A Wonderful Life Decompilation", "url": "https://github.com/ChrisNonyminus/hmawl"}, {"title": "Harvest Moon: Friends of Mineral Town Decompilation", "url": "https://github.com/StanHash/fomt"}, {"title": "Ice Climber Decompilation", "url": "https://github.com/cyneprepou4uk/NES-Games-Disassembly/tree/main/Ice%20Climber"}, {"title": "ICO Decompilation", "url": "https://github.com/rossydoubleunderscore/ico-decomp"}, {"title": "Inazuma Eleven Strikers Decompilation", "url": "https://github.com/SwareJonge/IEStrikers"}, {"title": "Jet Force Gemini Decompilation", "url": "https://github.com/ryan-myers/jet-force-gemini"}, {"title": "Jet Set Radio Future Decompilation", "url": "https://github.com/dplewis/jsrf"}, {"title": "Kid Chameleon Decompilation", "url": "https://github.com/sonicretro/kid-chameleon-disasm"}, {"title": "Kingdom Hearts Decompilation", "url": "https://github.com/ethteck/kh1"}, {"title": "Kirby 64: The Crystal Shards Decompilation", "url": "https://github.com/kirby64ret/kirby64"}, {"title": "Kirby & the Amazing Mirror Decompilation", "url": "https://github.com/jiangzhengwenjz/katam"}, {"title": "Kirby Air Ride Decompilation", "url": "https://github.com/doldecomp/kar"}, {"title": "Kirby's Epic Yarn Decompilation", "url": "https://github.com/swiftshine/key"}, {"title": "Klonoa 2: Lunatea's Veil Decompilation", "url": "https://github.com/entriphy/kl2_lv_decomp"}, {"title": "Knife Edge - Nose Gunner Decompilation", "url": "https://github.com/disi33/KE-NG_Reversing"}, {"title": "Legacy of Kain: Soul Reaver Decompilation", "url": "https://github.com/fmil95/soul-re"}, {"title": "Legend of Legaia Decompilation", "url": "https://github.com/dacodechick/legaia-decomp"}, {"title": "Lego Racers Decompilation", "url": "https://github.com/marijnvdwerf/lego-racers"}, {"title": "Lego Star Wars III: The Clone Wars Decompilation", "url": "https://github.com/ThePlayerRolo/LegoCloneWarsWii"}, {"title": "LSD: Dream Emulator Decompilation", "url": "https://github.com/FirecatFG/lsddecomp"}, {"title": "Luigi's Mansion Decompilation", "url": "https://github.com/ThePlayerRolo/lm-decomp"}, {"title": "Lunar 2: Eternal Blue Complete Decompilation", "url": "https://github.com/Zackmon/lunar2-psx-decomp"}, {"title": "Mario & Luigi: Partners in Time Decompilation", "url": "https://github.com/rainchus/partnersintime-decomp"}, {"title": "Mario & Luigi: Superstar Saga Decompilation", "url": "https://github.com/nstearns96/MLSuperstarSaga"}, {"title": "Mario Golf 64 Decompilation", "url": "https://github.com/monde-lointain/mariogolf64"}, {"title": "Mario Kart Double Dash!! Decompilation", "url": "https://github.com/doldecomp/mkdd"}, {"title": "Mario Kart Wii Decompilation", "url": "https://github.com/doldecomp/mkw"}, {"title": "Mario Party 4 Decompilation", "url": "https://github.com/mariopartyrd/marioparty4"}, {"title": "Mario Party 5 Decompilation", "url": "https://github.com/mariopartyrd/marioparty5"}, {"title": "Mario Superstar Baseball Decompilation", "url": "https://github.com/mariopartyrd/marioparty5"}, {"title": "Mario Tennis Decompilation", "url": "https://github.com/dellm-79/mariotennisn64"}, {"title": "MediEvel Decompilation", "url": "https://github.com/medievildecompilation/medievil-decomp"}, {"title": "Mega Castlevania IV", "url": "https://youtu.be/5PPOKBR3bQk?si=sxKPeItjeypAylaV"}, {"title": "Mega Man X: Viral Nightmare​", "url": "https://sonicfangameshq.com/forums/showcase/mega-man-x-viral-nightmare.2866/"}, {"title": "Metal Gear Solid Decompilation", "url": "https://github.com/FoxdieTeam/mgs_reversing"}, {"title": "Metal Gear Solid 2 Decompilation", "url": "https://github.com/GirianSeed/mgs2"}, {"title": "Metal Gear Solid 3 Decompilation", "url": "https://github.com/GirianSeed/mgs3"}, {"title": "Metal Gear Solid: The Twin Snakes Decompilation", "url": "https://github.com/GirianSeed/mgstts"}, {"title": "Metroid Fusion Decompilation", "url": "https://github.com/metroidret/mf"}, {"title": "Metroid Prime Decompilation", "url": "https://github.com/PrimeDecomp/prime"}, {"title": "Metroid Prime 2: Echoes Decompilation", "url": "https://github.com/PrimeDecomp/echoes"}, {"title": "Metroid Zero Mission Decompilation", "url": "https://github.com/metroidret/mzm"}, {"title": "Minecraft: Legacy Console Edition Decompilation", "url": "https://github.com/GRAnimated/MinecraftLCE"}, {"title": "Minicraft - Minecraft GBA Port", "url": "https://github.com/TobiasFriedly/minicraft_3d"}, {"title": "Mischief Makers Decompilation", "url": "https://github.com/drahsid/mischief-makers"}, {"title": "Naruto: Gekitou Ninja Taisen! 4 Decompilation", "url": "https://github.com/doldecomp/gnt4"}, {"title": "Need For Speed: High Stakes Decompilation", "url": "https://github.com/OpenNFS/NFSHSX"}, {"title": "Need For Speed: Most Wanted Decompilation", "url": "https://github.com/dbalatoni13/nfsmw"}, {"title": "Need For Speed: Underground Decompilation", "url": "https://github.com/dbalatoni13/nfsug"}, {"title": "Neon Genesis Evanglion 64 Decompilation", "url": "https://github.com/farisawan-2000/evangelion"}, {"title": "New Super Mario Bros. Wii Decompilation", "url": "https://github.com/NSMBW-Community/NSMBW-Decomp"}, {"title": "Onegai Monsters Decompilation", "url": "https://github.com/ryan-myers/onegaimonsters"}, {"title": "OpenTDU - Source Port of Test Drive Unlimited", "url": "https://github.com/opentestdriveunlimited/OpenTestDriveUnlimited"}, {"title": "Panzer Dragoon Saga Decompilation", "url": "https://github.com/yaz0r/Azel"}, {"title": "Paper Mario Decompilation", "url": "https://papermar.io/"}, {"title": "Paper Mario: Sticker Star Decompilation", "url": "https://github.com/darxoon/leaflitter"}, {"title": "Paper Mario: The Thousand Year Door Decompilation", "url": "https://github.com/doldecomp/ttyd"}, {"title": "PaRappa the Rapper 2 Decompilation", "url": "https://github.com/parappadev/parappa2"}, {"title": "Pikmin Decompilation", "url": "https://github.com/projectPiki/pikmin"}, {"title": "Pikmin 2 Decompilation", "url": "https://github.com/projectPiki/pikmin2"}, {"title": "Plants vs Zombies GOTY Decompilation", "url": "https://github.com/Patoke/re-plants-vs-zombies"}, {"title": "Pokemon Battle Revolution Decompilation", "url": "https://github.com/bgsamm/pbr-dtk"}, {"title": "Pokemon Mystery Dungeon: Red Rescue Team Decompilation", "url": "https://github.com/pret/pmd-red"}, {"title": "Pokemon pinball Decompilation", "url": "https://github.com/pret/pokepinball"}, {"title": "Pokemon puzzleLeague Decompilation", "url": "https://github.com/AngheloAlf/puzzleleague64"}, {"title": "Pokemon Snap Decompilation", "url": "https://github.com/ethteck/pokemonsnap"}, {"title": "Pokemon Stadium Decompilation", "url": "https://github.com/pret/pokestadium"}, {"title": "Pokemon Stadium 2 Decompilation", "url": "https://github.com/pret/pokestadiumgs"}, {"title": "Pokemon TCG Deompilation", "url": "https://github.com/pret/poketcg"}, {"title": "Pokemon TCG 2 Deompilation", "url": "https://github.com/pret/poketcg2"}, {"title": "Pokepark Wii: Pikachu's Adventure Decompilation", "url": "https://github.com/SephDB/pokepark-wii-decomp"}, {"title": "Prey 2006 Port", "url": "https://krispy-the-goat.itch.io/prey-2006"}, {"title": "Project Green", "url": "https://youtu.be/e393g4U4xUU?si=rTY788C-KdflwLch"}, {"title": "Quake 4 source-port", "url": "https://github.com/jmarshall23/Quake4Doom"}, {"title": "Ratatouille Decompilation", "url": "https://github.com/ZounaModding/RatDecomp"}, {"title": "Rayman 2: Redreamed", "url": "https://newdawn.games/rayman-2-redreamed/"}, {"title": "Rayman 3: Havok Reignited Remake", "url": "https://youtu.be/XjeTYHk9c5c?si=dQyFhBhOywMb88KL"}, {"title": "Render 98 for Ship of Harkinian", "url": "https://youtube.com/shorts/4cAWo32Xix4?si=NtC2O68PgiFTqw28"}, {"title": "Resident Evil: Code Veronica X (Game Cube) Decompilation", "url": "https://github.com/fmil95/recvx-gc-decomp"}, {"title": "Resident Evil: Code Veronica X (PS2) Decompilation", "url": "https://github.com/fmil95/recvx-decomp"}, {"title": "Return to Yoshi's Island", "url": "https://romhacking.com/hack/return-to-yoshi-s-island-demo-2"}, {"title": "Rhythm Heaven Decompilation", "url": "https://github.com/patataofcourse/rhgold"}, {"title": "Rock Band 3 Decompilation", "url": "https://github.com/DarkRTA/rb3"}, {"title": "Rocket: Robot on Wheels Decompilation", "url": "https://github.com/RocketRet/Rocket-Robot-On-Wheels"}, {"title": "Secret of Mana PC-Engine Port", "url": "https://kaffeeware.itch.io/secret-of-mana-pce"}, {"title": "Shadowgate 64 Decompilation", "url": "https://github.com/rainchus/shadowgate64"}, {"title": "Shadow of the Colossus Decompilation", "url": "https://github.com/Fantaskink/SOTC"}, {"title": "Shin Megami Tensei Decompilation", "url": "https://codeberg.org/Chickenzes/smt-decomp"}, {"title": "Silent Hill Decompilation", "url": "https://github.com/Vatuu/silent-hill-decomp"}, {"title": "Skyblivion", "url": "https://youtu.be/LwUibq6wBn4?si=RzqLY7QaIEZjBOBj"}, {"title": "Skys of Arcadia Legends Decompilation", "url": "https://github.com/rainchus/SkiesofArcadiaLegends"}, {"title": "Skywind", "url": "https://tesrskywind.com/"}, {"title": "Sly Cooper and the Thievius Raccoonus Decompilation", "url": "https://github.com/TheOnlyZac/sly1"}, {"title": "Snowboard Kids 2 Decompilation", "url": "https://github.com/cdlewis/snowboardkids2-decomp"}, {"title": "Sonic Advance 2 Decompilation", "url": "https://github.com/SAT-R/sa2"}, {"title": "Sonic Advance Trilogy Decompilation", "url": "https://github.com/SAT-R"}, {"title": "Sonic and the Secret Rings PC Port - Project Reignition", "url": "https://sonicfangameshq.com/forums/showcase/project-reignition-sage-2025-demo.2540/#itemDownloads"}, {"title": "Sonic Riders Decompilation", "url": "https://github.com/doldecomp/sonicriders"}, {"title": "Sonic Riders: Zero Gravity Decompilation", "url": "https://github.com/KidWizardOfTheWeb/SRZGDecomp"}, {"title": "Sonic Runners Decompilation", "url": "https://github.com/itsmattkc/RunnersDecomp"}, {"title": "Sonic Rush Rerun - PC Port", "url": "https://youtu.be/I5mGwM-uikw?si=w0LLmprSc0FLeIzI"}, {"title": "Sonic the Fighters Decompilation", "url": "https://github.com/biggestsonicfan/stfdecomp"}, {"title": "Sonic the Hedgehog (2006) Recompilation", "url": "https://github.com/sonicnext-dev/MarathonRecomp"}, {"title": "Space Station Silicon Valley Decompilation", "url": "https://github.com/mkst/sssv"}, {"title": "Spider-Man 2001 Decompilation", "url": "https://github.com/krystalgamer/spidey-decomp"}, {"title": "Spongebob Squarepants: Battle for Bikini Bottom Decompilation", "url": "https://github.com/bfbbdecomp/bfbb"}, {"title": "Spyro the Dragon Decompilation", "url": "https://github.com/TheMobyCollective/spyro-1"}, {"title": "Star Fox adventures Decompilation", "url": "https://github.com/renakunisaki/sfadebug"}, {"title": "Star Wars: Shadows of the Empire Decompilation", "url": "https://github.com/eltalelibrarian/sote"}, {"title": "Street Fighter III 3rd Strike Decompilation", "url": "https://github.com/crowded-street/3s-decomp"}, {"title": "Summoner: A Goddess Reborn Decompilation", "url": "https://decomp.dev/Charlese2/sgr"}, {"title": "Super Ghouls 'n Ghosts Decompilation", "url": "https://github.com/fredyeye/super-ghouls-n-ghosts-disassembly"}, {"title": "Super Mario 3D Land Decompilation", "url": "https://github.com/3dsdecomp/redpepper"}, {"title": "Super Mario 3D World + Bowser's Fury Decompilation", "url": "https://github.com/3DWCommunity/3dcomp"}, {"title": "Super Mario 64 - PlayStation Port", "url": "https://github.com/malucard/sm64-psx"}, {"title": "Super Mario Galaxy Decompilation", "url": "https://github.com/snailspeed3/SMGDecompilation"}, {"title": "Super Mario Galaxy 2 Decompilation", "url": "https://github.com/SMGCommunity/Garigari"}, {"title": "Super Mario Odyssey - A Galaxy Story", "url": "https://youtu.be/KnslfMOZ5dY?si=n2Is3Od8bCXdC1Ph"}, {"title": "Super Mario Odyssey Decompilation", "url": "https://github.com/MonsterDruide1/OdysseyDecomp"}, {"title": "Super Mario Strikers Decompilation", "url": "https://github.com/yannicksuter/smstrikers-decomp"}, {"title": "Super Mario Sunshine Decompilation", "url": "https://github.com/doldecomp/sms"}, {"title": "Super Metroid Decompilation", "url": "https://github.com/snesrev/sm"}, {"title": "Super Monkey Ball Decompilation", "url": "https://github.com/camthesaxman/smb-decomp/"}, {"title": "Super Paper Mario Decompilation", "url": "https://github.com/SeekyCt/spm-decomp"}, {"title": "Super Smash Bros. 64 Decompilation", "url": "https://github.com/VetriTheRetri/ssb-decomp-re"}, {"title": "Super Smash Bros. Brawl Decompilation", "url": "https://github.com/doldecomp/brawl"}, {"title": "Super Smash Bros. Melee Decompilation", "url": "https://github.com/doldecomp/melee"}, {"title": "The Legend of Zelda: Phantom Hourglass Decompilation", "url": "https://github.com/zeldaret/ph"}, {"title": "The Legend of Zelda: Skyward Sword Decompilation", "url": "https://github.com/zeldaret/ss"}, {"title": "The Legend of Zelda: Tears of the Kingdom Online", "url": "https://youtu.be/XbymS6mbg48?si=KFNXWmiYHKlPtGQs"}, {"title": "The Legend of Zelda: The Wind Waker Decompilation", "url": "https://github.com/zeldaret/tww"}, {"title": "The Legend of Zelda: Twilight Princess Decompilation", "url": "https://github.com/zeldaret/tp"}, {"title": "The Sims 2: Castaway Decompilation", "url": "https://github.com/HaydnTrigg/Castaway"}, {"title": "The Spongebob Squarepants Movie Decompilation", "url": "https://decomp.dev/bfbbdecomp/tssm?sort=updated"}, {"title": "The World Ends With You Decompilation", "url": "https://decomp.dev/Yotona/twewy"}, {"title": "Tomba! Decompilation", "url": "https://github.com/hansbonini/psx_tomba"}, {"title": "Tomb Raider Chronicles Decompilation", "url": "https://github.com/TOMB5/TOMB5"}, {"title": "Twisted Metal Decompilation", "url": "https://github.com/abelbriggs1/tm1_decomp"}, {"title": "Twisted Metal Black Decompilation", "url": "https://github.com/abelbriggs1/tmb_decomp"}, {"title": "Twisted Metal: Harbor City Decompilation", "url": "https://github.com/jacobleeharris/tmhc"}, {"title": "Ty The Tasmanian Tiger Decompilation", "url": "https://github.com/1superchip/ty-decomp"}, {"title": "Unreal Redux", "url": "https://youtu.be/Pw8zyKdyQsQ?si=78Pc4S6ln60wqiDa"}, {"title": "Vagrant Story Decompilation", "url": "https://github.com/ser-pounce/rood-reverse"}, {"title": "Vandal Hearts Decompilation", "url": "https://github.com/shao113/vh"}, {"title": "Virtual Pro-wrestling 2 Decompilation", "url": "https://github.com/aki-club/vpw2"}, {"title": "Wave Race 64 Decompilation", "url": "https://github.com/LLONSIT/Wave-Race-64"}, {"title": "WCW NWO Revenge Decompilation", "url": "https://github.com/svinsmoke212/revenge"}, {"title": "Wii Sports Decompilation", "url": "https://github.com/doldecomp/ogws"}, {"title": "Xenoblade (JP) Decompilation", "url": "https://github.com/xbret/xenoblade"}, {"title": "Xenogears Decompilation", "url": "https://github.com/ladysilverberg/xenogears-decomp"}, {"title": "Xenosaga Episode I Decompilation", "url": "https://github.com/squareman/xenosaga"}, {"title": "Yakuza 1 Decompilation", "url": "https://github.com/hamzaxx370/ogre-decomp"}, {"title": "Yoshi's Story Decompilation", "url": "https://github.com/decompals/yoshis-story"}, {"title": "Yu-Gi-Oh! Reshef of Destruction Decompilation", "url": "https://github.com/shinny456/ygodm8"}, {"title": "Zombieland MMO", "url": "https://github.com/andreamonaco/zombieland"}, {"title": "Zone of the Enders Decompilation", "url": "https://github.com/GirianSeed/zoe1"}, {"title": "Zone of the Enders: The 2nd Runner Decompilation", "url": "https://github.com/GirianSeed/zoe2"}, {"title": "Animal Crossing: City Folk Deluxe - Animal Crossing City Folk Let's Go To The City Mod", "url": "https://aurumsmods.com/accfdeluxe/"}, {"title": "Ashes Series (2063 - Dead Man Walking - Afterglow - Hard Reset) - Doom 2 Mod", "url": "https://www.moddb.com/mods/ashes-2063/downloads/ashes-stand-alone-version-101"}, {"title": "Baldur's Gate 3: Brawl - Real Time Combat Mod", "url": "https://www.nexusmods.com/baldursgate3/mods/12614"}, {"title": "Baldur's Gate 3: Chivalry Expansion", "url": "https://www.nexusmods.com/baldursgate3/mods/19120"}, {"title": "Baldur's Gate 3: Forsaken", "url": "https://www.nexusmods.com/baldursgate3/mods/14844?tab=description"}, {"title": "Baldur's Gate 3: Ultimate Cut Content Restoration Mod", "url": "https://www.nexusmods.com/baldursgate3/mods/20353"}, {"title": "Battlefield 1942: Desert Combat", "url": "https://www.moddb.com/mods/desert-combat"}, {"title": "Bioshock - Native HDR Mod", "url": "https://www.nexusmods.com/bioshock/mods/94"}, {"title": "Black Reliquary - Total conversion mod for Darkest Dungeon", "url": "https://store.steampowered.com/app/2119270/Black_Reliquary/"}, {"title": "Bloodborne - shadPS4 - 60fps Patch", "url": "https://www.nexusmods.com/bloodborne/mods/252"}, {"title": "Bloodborne - shadPS4 - Visual Overhaul Mod", "url": "https://www.nexusmods.com/bloodborne/mods/45?tab=files"}, {"title": "Brutal Doom - Doom Mod", "url": "https://www.moddb.com/mods/brutal-doom"}, {"title": "Castlevania Simon's Destiny - a total conversion Doom mod", "url": "https://batandy.itch.io/simonsdestiny"}, {"title": "Castlevania Symphony of the Night Randomizer Mod", "url": "https://github.com/MottZilla/SotN_Integrated_Rando"}, {"title": "Caveman 2 Cosmos - Civilization 4 total overhaul mod", "url": "https://forums.civfanatics.com/forums/civ4-caveman-2-cosmos.449/"}, {"title": "Celeste Strawberry Jam mod", "url": "https://gamebanana.com/mods/424541"}, {"title": "Chrono Trigger Pixel Demaster Mod", "url": "https://www.nexusmods.com/chronotrigger/mods/8"}, {"title": "Contra - C&C: Generals Zero Hour Mod", "url": "https://www.moddb.com/mods/contra"}, {"title": "Crusader Kings 2 A Song of Ice & Fire Mod", "url": "https://www.moddb.com/mods/crusader-kings-2-a-game-of-thrones-ck2agot"}, {"title": "Cyberpunk 2077: Battle Axe", "url": "https://www.nexusmods.com/cyberpunk2077/mods/24895?tab=description"}, {"title": "Cyberpunk 2077: Night City Traffic Overhaul Mod", "url": "https://www.nexusmods.com/cyberpunk2077/mods/25552"}, {"title": "Cyberpunk 2077: Take a Breather - Pace & Reputation Overhaul Mod", "url": "https://www.nexusmods.com/cyberpunk2077/mods/23290"}, {"title": "Dark Souls 2 Firelink Edition", "url": "https://www.nexusmods.com/darksouls2/mods/1498"}, {"title": "Dark Souls 3 Seamless Co-op Mod", "url": "https://www.nexusmods.com/darksouls3/mods/1895"}, {"title": "Dark Souls Remastered Seamless Co-op Mod", "url": "https://www.nexusmods.com/darksoulsremastered/mods/899"}, {"title": "DBZ Budokai 4 - Dragonball Z Infinite World (PS2) Mod", "url": "https://www.moddb.com/games/dragon-ball-z-budokai-4"}, {"title": "Deus Ex: Nihilum", "url": "https://www.moddb.com/mods/nihilum"}, {"title": "DMC3 Crimson - Devil May Cry 3 HD Collection Mod", "url": "https://dmc3crimson.github.io/"}, {"title": "Dhwem3 - Doom 3 Mod", "url": "https://dhewm3.org/mods.html"}, {"title": "Doom - Voxel Doom - Replace 2D Sprites with 3D Voxels", "url": "https://www.moddb.com/mods/doom-voxel-project/addons/voxel-doom"}, {"title": "Doom 2 - Voxel Doom - Replace 2D Sprites with 3D Voxels", "url": "https://www.moddb.com/mods/voxel-doom-ii/addons/voxel-doomii-v2-1"}, {"title": "Doom 3: RealDOOM", "url": "https://www.moddb.com/mods/realdoom-3/downloads/realdoom-3-50"}, {"title": "Doom Infinite - Doom 2 Mod", "url": "https://www.moddb.com/mods/doom-infinite"}, {"title": "Dragon BallZ - DIO Moveset", "url": "https://gamebanana.com/mods/564409"}, {"title": "Dragon BallZ - YamiYugi Moveset", "url": "https://gamebanana.com/mods/641650"}, {"title": "Duke Nukem 3D - Voxel Duke", "url": "https://www.moddb.com/mods/voxel-duke-nukem-3d/addons/voxel-duke-3d"}, {"title": "Dyson Sphere Program - Co-op Mod", "url": "https://thunderstore.io/c/dyson-sphere-program/p/nebula/NebulaMultiplayerMod/"}, {"title": "Elden Ring Nightreign Seamless Two Player Co-op Mod", "url": "https://www.nexusmods.com/eldenringnightreign/mods/3?tab=files&file_id=14"}, {"title": "Elden Ring Seamless Co-op Mod", "url": "https://www.nexusmods.com/eldenring/mods/510"}, {"title": "Elden Ring: The Convergence - Overhaul Mod", "url": "https://www.nexusmods.com/eldenring/mods/3419"}, {"title": "Elden Ring: The Witcher Moveset Mod", "url": "https://www.nexusmods.com/eldenring/mods/8707?tab=description"}, {"title": "Skyrim - Enderal", "url": "https://www.nexusmods.com/skyrim/mods/77868"}, {"title": "Half Life 2 - Entropy Zero 2", "url": "https://store.steampowered.com/app/1583720/Entropy__Zero_2/"}, {"title": "Factorio - Space Exploration", "url": "https://mods.factorio.com/mod/space-exploration"}, {"title": "Civilisation 5 - Faerun", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=217840547"}, {"title": "Fallout 4: FSR3 Mod", "url": "https://www.nexusmods.com/fallout4/mods/98208"}, {"title": "Fallout 4: Imperial Attack on the Commonwealth", "url": "https://www.nexusmods.com/fallout4/mods/95285"}, {"title": "Fallout 4 London Mod Guide", "url": "https://steamdeckhq.com/tips-and-guides/how-to-play-the-fallout-london-steam-deck/"}, {"title": "Fallout 4: LoreOut - The Modern Roleplaying Modlist", "url": "https://www.nexusmods.com/fallout4/mods/99136"}, {"title": "Fallout 4 Misery Island - Isles of New England", "url": "https://www.nexusmods.com/fallout4/mods/87983"}, {"title": "Fallout 4 The Order of the Third Eye", "url": "https://www.nexusmods.com/fallout4/mods/97675"}, {"title": "Fallout 4: Upscaling", "url": "https://www.nexusmods.com/fallout4/mods/99130"}, {"title": "Fallout New Vegas: Autumn Leaves", "url": "https://www.nexusmods.com/newvegas/mods/50146"}, {"title": "Fallout New Vegas: Long 15 Expansion", "url": "https://www.nexusmods.com/newvegas/mods/94306"}, {"title": "Fallout New Vegas: Vanilla Plus AO", "url": "https://www.nexusmods.com/newvegas/mods/94824"}, {"title": "F.E.A.R. - Echo Patch", "url": "https://github.com/Wemino/EchoPatch"}, {"title": "Fifa 14 and 16 Classic Patch", "url": "https://fifaclassicpatch.altervista.org/"}, {"title": "Final Fantasy 7 7th Heaven Mod", "url": "https://youtu.be/wNguRldtIqk?si=fNjXSMn9buolXYYc"}, {"title": "Final Fantasy 7 Rebirth Playable Dyne Mod", "url": "https://www.nexusmods.com/finalfantasy7rebirth/mods/1655?tab=description"}, {"title": "Final Fantasy 7 Rebirth Playable Rufus Mod", "url": "https://www.nexusmods.com/finalfantasy7rebirth/mods/1598"}, {"title": "Final Fantasy 7 Satsuki Yatoshi SYW Mod", "url": "https://youtu.be/4aaaDnCE82g?si=mAFFS_zu-alAn3pk"}, {"title": "Final Fantasy 9 Moguri Mod", "url": "https://sites.google.com/view/moguri-mod/home"}, {"title": "Final Fantasy Tactics The Lion War of the Lions Mod", "url": "https://www.reddit.com/r/finalfantasytactics/comments/xi0l6t/mod_release_the_lion_war_of_the_lions_tlwotl/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, {"title": "Battlefield 2 - Forgotten Hope 2", "url": "https://www.moddb.com/mods/forgotten-hope-2"}, {"title": "Mount & Blade: Warband - Gekokujo", "url": "https://www.moddb.com/mods/gekokujo"}, {"title": "Oblivion Remastered - Glock Functional Gun Mod", "url": "https://www.nexusmods.com/oblivionremastered/mods/4681"}, {"title": "Half-Life 2 - GoldenEye: Source", "url": "https://www.moddb.com/mods/goldeneye-source"}, {"title": "GTA IV FusionFix", "url": "https://www.reddit.com/r/SteamDeck/comments/1nzene8/gta_iv_with_fusionfix_is_awesome/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, {"title": "GTA V: Large Pedestrian Crowds Mod", "url": "https://www.nexusmods.com/gta5enhanced/mods/296?tab=description"}, {"title": "GTA V: Superman Mod", "url": "https://www.patreon.com/posts/superman-v2-2-0-146533832"}, {"title": "GTA Vice City Actual NextGen Edition Modpack", "url": "https://www.mediafire.com/file/1i2gqml81umjugt/GTA+Vice+City+Actual+Next-Gen+Edition+v6.0.7z/file"}, {"title": "Guitar Hero World Tour Definitive Edition", "url": "https://ghwt.de/"}, {"title": "Resident Evil Requiem - Merchant", "url": "https://www.nexusmods.com/residentevilrequiem/mods/1920?tab=description"}, {"title": "Half-Life 2: Episode Two - Raising The Bar: Redux", "url": "https://www.moddb.com/mods/half-life-2-raising-the-bar-redux"}, {"title": "Half-Life Black Mesa: Blue Shift - Caretaking Update", "url": "https://www.moddb.com/mods/black-mesa-blue-shift-remake/news/chapters-1-5-caretaking-update-release"}, {"title": "Half-Life Diffusion", "url": "https://www.moddb.com/mods/diffusion"}, {"title": "Half-Life: Element 64", "url": "https://store.steampowered.com/app/1625220/HalfLife_Element_64/"}, {"title": "Half-Life Legacy", "url": "https://store.steampowered.com/app/3619040/HalfLife_Legacy/"}, {"title": "The Legend of Zelda Ocarina of Time - Hero of Law", "url": "https://newerteam.com/en/hol/index.html"}, {"title": "Hollow Knight: Silksong Multiplayer Mod", "url": "https://www.nexusmods.com/hollowknightsilksong/mods/90?tab=description"}, {"title": "Heroes of Might and Magic III - Horn of the Abyss", "url": "https://www.moddb.com/mods/horn-of-the-abyss"}, {"title": "Icewind Dale 2 Enhanced Edition - Icewind Dale 2 Mod", "url": "https://forums.beamdog.com/discussion/87952/icewind-dale-2-enhanced-edition-is-released/p1"}, {"title": "Just Cause 3 Unlimited Edition", "url": "https://videogamemods.com/vgm/justcause3/mods/just-cause-3-unlimited-edition-1001082"}, {"title": "Kingdom Hearts ReFined - a mod for Kingdom Hearts 1.5 + 2.5 ReMix", "url": "https://github.com/KH-ReFined/KH-ReFined"}, {"title": "Lies of P - Co-op Mod", "url": "https://www.nexusmods.com/liesofp/mods/368?tab=description"}, {"title": "Luigi's Mansion - Louie' Mansion Pikmin Overhaul Mod", "url": "https://gamebanana.com/mods/551672"}, {"title": "Mario Kart 64 - Amped Up", "url": "https://youtu.be/vvg20Gd58WA?si=-3Rx0-7ekPZct7n4"}, {"title": "Mario Kart 8 Deluxe - CTGP Deluxe", "url": "https://www.ctgpdx.com/home"}, {"title": "Mario Kart Super Circuit - 60 FPS Patch", "url": "https://romhack.ing/database/content/entry/xlruT_gHReWVM1HtQL3Lmg/mario-kart-super-circuit-60-fps-patch"}, {"title": "Marvel vs Capcom Infinite & Beyond Mod", "url": "https://steamdeckhq.com/tips-and-guides/how-to-install-marvel-vs-capcom-infinite-beyond-mod-on-steam-deck/"}, {"title": "Max Payne: Remix", "url": "https://www.moddb.com/mods/max-payne-remix"}, {"title": "Medal of Honor Airborne Redux", "url": "https://www.moddb.com/mods/medal-of-honor-airborne-redux/downloads"}, {"title": "Medieval 2: Total War Kingdoms Mod: Third Age Total War", "url": "https://www.moddb.com/mods/third-age-total-war"}, {"title": "Command & Conquer Red Alert 2 - Mental Omega", "url": "https://www.moddb.com/mods/mental-omega"}, {"title": "Elder Scrolls III: Morrowind - Morrowind Rebirth", "url": "https://www.moddb.com/mods/morrowind-rebirth"}, {"title": "NBA Jam Legends on Fire Edition", "url": "https://forums.nba-live.com/viewtopic.php?f=72&t=114923"}, {"title": "Need for Speed Most Wanted 2005 - Mod Pack for Steam Deck and PC Guide", "url": "https://greatondeck.net/ready-mod-for-need-for-speed-most-wanted-2005-enhanced-graphics-for-steam-deck-and-pc-guide/"}, {"title": "Need for Speed Pro Street - Mod Pack for Steam Deck and PC Guide", "url": "https://greatondeck.net/need-for-speed-pro-street-is-easy-on-steam-deck-with-this-guide/"}, {"title": "Need for Speed Underground - Mod Pack for Steam Deck and PC Guide", "url": "https://greatondeck.net/how-to-run-need-for-speed-underground-on-steam-deck-and-modern-pc-guide-with-modpack/"}, {"title": "Half-Life 2 - No More Room in Hell", "url": "https://www.moddb.com/mods/no-more-room-in-hell"}, {"title": "Oblivion - Oscuro's Overhaul", "url": "https://www.moddb.com/mods/oscuros-oblivion-overhaul/downloads"}, {"title": "Paper Mario: The Thousand-Year Door Encore", "url": "https://gamebanana.com/mods/590058"}, {"title": "Paper Mario: Tower of Trials", "url": "https://github.com/jdaster64/ttyd-tot"}, {"title": "Persona 3 FES HD Overhaul Mod & Widescreen Patch", "url": "https://youtu.be/deFqMs1tBYo?si=suNlZLJ4J0aL0pU1"}, {"title": "Pillars of Eternity 2 Deadfire - Font Increase Mod", "url": "https://www.reddit.com/r/SteamDeck/comments/149rbhs/i_made_a_mod_that_increases_the_dialogue_font/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, {"title": "Super Smash Brothers Brawl - PMEX Remix", "url": "https://theoutcastersnotebook.com/post/set-up-pmex-remix-on-deck/"}, {"title": "Portal 2 - Portal Stories: Mel", "url": "https://store.steampowered.com/app/317400/Portal_Stories_Mel/"}, {"title": "Portal 2 - Portal Reloaded", "url": "https://store.steampowered.com/app/1255980/Portal_Reloaded/"}, {"title": "Portal 2 - Portal Revolution", "url": "https://store.steampowered.com/app/601360/Portal_Revolution/"}, {"title": "Doom 2 - Project Brutality", "url": "https://www.moddb.com/mods/project-brutality"}, {"title": "Quake - Arcane Dimensions", "url": "https://www.moddb.com/mods/arcane-dimensions"}, {"title": "Rainbow Six Black Ops", "url": "https://www.moddb.com/mods/rainbow-six-black-ops-20/downloads/rainbow-six-black-ops-20-release"}, {"title": "Doom 3 BFG Edition - Rbdoom3BFG", "url": "https://www.moddb.com/mods/rbdoom-3-bfg"}, {"title": "Red Dead Redemption 2 - Metal Gear Solid 3 Recreation Mod", "url": "https://www.nexusmods.com/reddeadredemption2/mods/7152?tab=description"}, {"title": "Star Wars: Empire at War: Forces of Corruption - Republic at War", "url": "https://www.moddb.com/mods/republic-at-war"}, {"title": "Resident Evil 2 - RE-Enhance Mod", "url": "https://www.moddb.com/mods/reenhance-re2/downloads/re-enhance-re2-v20-for-gog-version"}, {"title": "Resident Evil 2 - Thomas the Tank Engine Mod", "url": "https://www.nexusmods.com/residentevil22019/mods/62"}, {"title": "Resident Evil 4 Remake Tactical First Person Mod", "url": "https://www.nexusmods.com/residentevil42023/mods/5458?tab=description"}, {"title": "Mario Kart Wii - Retro Rewind", "url": "https://wiki.tockdom.com/wiki/Retro_Rewind"}, {"title": "Mario Kart Wii - Retro Rewind Wheel Wizard Launcher", "url": "https://github.com/TeamWheelWizard/WheelWizard"}, {"title": "RimWorld - A Rimworld of Magic", "url": "https://steamcommunity.com/workshop/filedetails/?id=1201382956"}, {"title": "RimWorld - Android Tiers", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=1386412863"}, {"title": "RimWorld - PokeWorld", "url": "https://steamcommunity.com/workshop/filedetails/?id=2652029657"}, {"title": "RimWorld - Save Our Ship 2", "url": "https://steamcommunity.com/workshop/filedetails/?id=1909914131"}, {"title": "RimWorld - Vanilla Expanded", "url": "https://steamcommunity.com/workshop/filedetails/?id=1884025115"}, {"title": "RimWorld - Zombieland", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=928376710"}, {"title": "Saints Row 2 - Juiced Patch", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=3291739005"}, {"title": "Sekiro Resurrection - Overhaul Mod", "url": "https://www.nexusmods.com/sekiro/mods/723"}, {"title": "Skyrim - A Ghibli Skyrim Landscapes Mod", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/166859"}, {"title": "Skyrim - A Ghibli Skyrim Whiterun Mod", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/164600"}, {"title": "Skyrim - Midnight Sun", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/163295?tab=description"}, {"title": "Skyrim - Skypal", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/154740#:~:text=This%20mod%2C%20as%20the%20name,and%20grow%20together%20with%20them."}, {"title": "Skyrim - SkyParkour v3 Mod", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/132292"}, {"title": "Skyrim Special Edition - Azeroth Reborn", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/160339"}, {"title": "Skyrim Special Edition - Lordbound", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/160493"}, {"title": "Skyrim Special Edition - Norden UI", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/166086"}, {"title": "Skyrim - Together Reborn", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/69993"}, {"title": "Skyrim - Tuxborn Overhaul Mod", "url": "https://www.reddit.com/r/SteamDeck/comments/1gaiwbi/if_you_want_to_get_back_into_skyrim_there_is_an/?share_id=a3AXVrJPRuFcYljWxp19g&utm_content=1&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1"}, {"title": "Slay the Spire - Downfall", "url": "https://store.steampowered.com/app/1865780/Downfall__A_Slay_the_Spire_Fan_Expansion/"}, {"title": "Sonic Robo Blast 2 - Generations Mod", "url": "https://mb.srb2.org/addons/srb2-generations.8725/"}, {"title": "Sphinx and the Cursed Mummy - PC Mod", "url": "https://www.reddit.com/r/pcgaming/comments/1kl27um/sphinx_and_the_cursed_mummy_pc_mod/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, {"title": "Spiderman - Multiplayer Mod", "url": "https://www.patreon.com/hbgda/home"}, {"title": "Splinter Cell Enhanced", "url": "https://github.com/Joshhhuaaa/EnhancedSC"}, {"title": "S.T.A.L.K.E.R.: Shadow of Chernobyl - Radiophobia 3", "url": "https://www.moddb.com/mods/radiophobia"}, {"title": "S.T.A.L.K.E.R. 2: Heart of Chernobyl - Zone Unchained", "url": "https://www.nexusmods.com/stalker2heartofchornobyl/mods/1767"}, {"title": "Stardew Valley - A Voice Over Mod For All Love Interests", "url": "https://www.nexusmods.com/stardewvalley/mods/22550"}, {"title": "Starfield - Star Wars Classes", "url": "https://www.nexusmods.com/starfield/mods/14984?tab=description"}, {"title": "Starfield - Steam Deck Essentials Mod Install Guide", "url": "https://youtu.be/T5rQBbcV_AY?si=38PNEz8T3WE4RFtZ"}, {"title": "Starfield - Star Wars Genesis Total Conversion", "url": "https://www.nexusmods.com/starfield/mods/11114"}, {"title": "Star Fox SNES Force Feedback Patch", "url": "https://romhackplaza.org/romhacks/star-fox-shindou-edition-snes/"}, {"title": "Star Wars Battlefront 2 - Remaster Mod", "url": "https://www.moddb.com/mods/hd-graphics-mod"}, {"title": "X4 Foundations - Star Wars Interworlds", "url": "https://www.nexusmods.com/x4foundations/mods/349"}, {"title": "Jedi Knight: Jedi Academy - Star Wars Movie Duels", "url": "https://www.reddit.com/r/SteamDeck/comments/1336a12/how_to_get_the_best_jedi_experience_on_the_steam/?utm%5C_source=share&utm%5C_medium=android%5C_app&utm%5C_name=androidcss&utm%5C_term=1&utm%5C_content=share%5C_button"}, {"title": "Super Mario Sunshine - Super Mario Eclipse", "url": "https://youtu.be/8zABT16mGuY?si=WP1zK92GIvLqmFkL"}, {"title": "Super Mario 3D Land - Super Mario Expedition 2", "url": "https://youtu.be/Ko2ChgbARnU?si=xX_6YhMwIvBN6Lw4"}, {"title": "Super Mario Odyssey Online", "url": "https://smoo.it/#/"}, {"title": "Super Smash Bros. Brawl - REX", "url": "https://www.rexbuild.site/"}, {"title": "Super Smash Bros. Melee - Akaneia Build", "url": "https://github.com/akaneia/akaneia-build"}, {"title": "Terraria - Calamity Mod", "url": "https://forums.terraria.org/index.php?threads/calamity-mod.44065/"}, {"title": "Terraria - tModLoader", "url": "https://store.steampowered.com/app/1281930/tModLoader/"}, {"title": "The Binding of Isaac - External Items Description mod", "url": "https://github.com/wofsauge/External-Item-Descriptions/wiki/How-to-install-the-mod"}, {"title": "Gothic 2 Gold Edition - The Chronicles Of Myrtana Archolos", "url": "https://store.steampowered.com/app/1467450/The_Chronicles_Of_Myrtana_Archolos"}, {"title": "Half Life 2 - The Citizen", "url": "https://www.moddb.com/mods/the-citizen"}, {"title": "Thief - The Dark Mod", "url": "https://www.thedarkmod.com/main/"}, {"title": "The Legend of Zelda: Breath of the Wild - BetterVR", "url": "https://github.com/Crementif/BotW-BetterVR"}, {"title": "The Legend of Zelda: Breath of the Wild - FOV & Shoulder Cam Mod", "url": "https://gamebanana.com/mods/49627"}, {"title": "The Legend of Zelda: Tears of the Kingdom - Ultracam Mod", "url": "https://www.nxoptimizer.com/games/tears-of-the-kingdom/"}, {"title": "Mount & Blade 2: Bannerlord - The Old Realms", "url": "https://www.moddb.com/mods/the-old-realms"}, {"title": "The Simpsons Hit & Run - Futurama Overhaul Mod", "url": "https://youtu.be/JKPz3PE7_4s?si=NJxOrfo5alaNzB9C"}, {"title": "The Witcher 3 - Brothers in Arms Mod", "url": "https://www.nexusmods.com/witcher3/mods/7329"}, {"title": "The Witcher 3 - Brothers in Arms Ultimate Edition", "url": "https://www.nexusmods.com/witcher3/mods/11260?tab=description"}, {"title": "The Witcher 3 - HD Reworked Project Next Gen Edition", "url": "https://www.nexusmods.com/witcher3/mods/9963?tab=description"}, {"title": "The Witcher 3 - Let There Be Light", "url": "https://www.nexusmods.com/witcher3/mods/11246?tab=description"}, {"title": "The Witcher 3 - Wild Monster Hunt", "url": "https://www.reddit.com/r/ItsAllAboutGames/comments/1o9v7wi/the_witcher_3_turned_into_a_survival_game_with/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, {"title": "S.T.A.L.K.E.R. Call of Pripyat - Misery", "url": "https://www.moddb.com/mods/stalker-misery"}, {"title": "Tony Hawk's Underground 2 - THUGPro", "url": "https://www.reddit.com/r/THPS/comments/tjrwgw/thug_pro_on_steam_deck/?utm_source=share&utm_medium=android_app&utm_name=androidcss&utm_term=1&utm_content=share_button"}, {"title": "Dungeon Siege - Ultima V Lazarus", "url": "https://www.u5lazarus.com/Downloads.html"}, {"title": "Undertale - Undertale Together", "url": "https://www.moddb.com/mods/undertale-together"}, {"title": "Unreal - UnrealRTX Mod", "url": "https://www.dsogaming.com/pc-performance-analyses/unreal-rtx-remix-path-tracing-mod-fully-released/"}, {"title": "Watch Dogs - Living City", "url": "https://www.nexusmods.com/watchdogs/mods/81"}, {"title": "Wolfenstein - Blade of Agony", "url": "https://boa.realm667.com/"}, {"title": "XCOM: Enemy Unknown - Long War", "url": "https://www.nexusmods.com/xcom/mods/88"}, {"title": "Star Wars X-Wing Special Edition - XWVM", "url": "https://www.moddb.com/mods/xwvm"}, {"title": "Yakuza 0 - Co-op Mod", "url": "https://www.nexusmods.com/yakuza0/mods/1276?tab=description"}, {"title": "007: Quantum of Solace", "url": "https://archive.org/details/quantum-of-solace_202509"}, {"title": "Ace Combat: Assault Horizon Enhanced Edition", "url": "https://archive.org/details/ace-combat-assault-horizon_202512"}, {"title": "Afterfall InSanity: Extended Edition", "url": "https://archive.org/details/Afterfall"}, {"title": "Aladdin In Nasira's Revenge", "url": "https://archive.org/details/aladdin-in-nasiras-revenge-repack"}, {"title": "Alien Trilogy", "url": "https://archive.org/details/at_20251025"}, {"title": "Alien vs Predor 2: Gold Edition", "url": "https://archive.org/details/avp-2-gold-edition"}, {"title": "America McGee's Alice: Remastered", "url": "https://archive.org/details/american-mc-gee-alice"}, {"title": "Area 51", "url": "https://archive.org/details/area-51.7z_202506"}, {"title": "Assassin's Creed III", "url": "https://archive.org/details/assassins-creed-iii-deluxe-edition"}, {"title": "Atlantis: The Lost Empire - Trial By Fire", "url": "https://archive.org/details/atlantis-trial-by-fire-repack"}, {"title": "Back to the Future: The Game", "url": "https://archive.org/details/back-to-the-future-the-game_202508"}, {"title": "Batman: Vengeance", "url": "https://archive.org/details/batman-vengeance.-7z"}, {"title": "Battlefield 1942: The Complete Collection", "url": "https://archive.org/details/battlefield-1942-repack"}, {"title": "Battlefield 2142", "url": "https://archive.org/details/bf-2142_202509"}, {"title": "Battlefield 2: Complete Collection", "url": "https://archive.org/details/battlefield-2_202509"}, {"title": "Battlefield Vietnam", "url": "https://archive.org/details/battlefield-vietnam-repack"}, {"title": "Battlefield: Bad Company 2", "url": "https://archive.org/details/battlefield-bad-company-2_202509"}, {"title": "Bedlam", "url": "https://archive.org/details/bedlam_202509"}, {"title": "Blair Witch Trilogy", "url": "https://archive.org/details/blair-witch-trilogy"}, {"title": "Blur", "url": "https://archive.org/details/blur.-7z_202506"}, {"title": "Celebrity Deathmatch", "url": "https://archive.org/details/celebrity-deathmatch_202601"}, {"title": "Clive Barker's Jericho", "url": "https://archive.org/details/clive-barkers-jericho_202509"}, {"title": "Colin McRae: DiRT 2", "url": "https://archive.org/details/di-rt-2.7z"}, {"title": "Condemned: Criminal Origins", "url": "https://archive.org/details/condemned_20251104"}, {"title": "Contract J.A.C.K.", "url": "https://archive.org/details/contract-j.-a.-c.-k."}, {"title": "Crazy Taxi 3: High Roller", "url": "https://archive.org/details/crazy-taxi-3-repack"}, {"title": "Cryostasis", "url": "https://archive.org/details/cryostasis_202510"}, {"title": "Darksiders II", "url": "https://archive.org/details/darks2"}, {"title": "Dead Man's Hand", "url": "https://archive.org/details/dmh_20250928"}, {"title": "Dead To Rights", "url": "https://archive.org/details/dead-to-rights.-7z"}, {"title": "Dead To Rights 2", "url": "https://archive.org/details/dead-to-rights-2.7z"}, {"title": "Deadpool", "url": "https://archive.org/details/deadpool.-7z"}, {"title": "Die Hard: Nakatomi Plaza", "url": "https://archive.org/details/die-hard-nakatomi-plaza-repack"}, {"title": "DiRT 3", "url": "https://archive.org/details/dirt-3_202511"}, {"title": "Dreamkiller", "url": "https://archive.org/details/dreamkiller_202509"}, {"title": "Driver: San Francisco", "url": "https://archive.org/details/driver-san-francisco.-7z"}, {"title": "Enter The Matrix", "url": "https://archive.org/details/enter-the-matrix_202511"}, {"title": "Evil Dead Regeneration", "url": "https://archive.org/details/evil-dead-regeneration_202510"}, {"title": "F1 2010", "url": "https://archive.org/details/f-1-2010_202512"}, {"title": "F1 2011", "url": "https://archive.org/details/f-1-2011_202512"}, {"title": "F1 2012", "url": "https://archive.org/details/f-1-2012_202512"}, {"title": "F1 2013", "url": "https://archive.org/details/f-1-2013_202512"}, {"title": "F1 2020", "url": "https://archive.org/details/f-1-2020"}, {"title": "F1 Race Stars", "url": "https://archive.org/details/f-1-race-stars_202512"}, {"title": "Fable III", "url": "https://archive.org/details/fable_202508"}, {"title": "Family Guy: Back to the Multiverse", "url": "https://archive.org/details/Family_Guy_BTTM"}, {"title": "Fantastic Four", "url": "https://archive.org/details/fantastic-four_the_game"}, {"title": "Fuel", "url": "https://archive.org/details/fuel_20251222"}, {"title": "Gears of War", "url": "https://archive.org/details/gow_20251116"}, {"title": "Gore: Ultimate Soldier", "url": "https://archive.org/details/gore-ultimate-soldier.-7z"}, {"title": "GRID 2", "url": "https://archive.org/details/grid-2_202511"}, {"title": "GRID Autosports", "url": "https://archive.org/details/grid-autosports_202601"}, {"title": "Guardians of the Galaxy: The Telltale Series", "url": "https://archive.org/details/guardians-of-the-galaxy.telltale-series"}, {"title": "Halo: Combat Evolved", "url": "https://archive.org/details/halo_20251027"}, {"title": "Heavy Metal: F.A.K.K. 2", "url": "https://archive.org/details/heavy-metal-fakk-2.7z"}, {"title": "Heretic II", "url": "https://archive.org/details/heretic-ii_202601"}, {"title": "Hulk", "url": "https://archive.org/details/hulk.-7z_202506"}, {"title": "Iron Man", "url": "https://archive.org/details/iron-man-pc-repack"}, {"title": "James Bond 007: Blood Stone", "url": "https://archive.org/details/james-bond-007-blood-stone_202511"}, {"title": "James Cameron's Avatar: The Game", "url": "https://archive.org/details/james-camerons-avatar-the-game_202512"}, {"title": "Juiced", "url": "https://archive.org/details/juiced.-7z_202506"}, {"title": "Juiced 2: Hot Import Nights", "url": "https://archive.org/details/j-2-hin.-7z"}, {"title": "Kiss Psycho Circus", "url": "https://archive.org/details/kiss-psycho-circus-repack_202511"}, {"title": "Lost Planet: Extreme Condition Colonies Edition", "url": "https://archive.org/details/lost-planet-1"}, {"title": "Lost Planet 2", "url": "https://archive.org/details/lost-planet-2_202510"}, {"title": "Manhunt 2", "url": "https://archive.org/details/manhunt-2_202510"}, {"title": "Marvel Ultimate Alliance", "url": "https://archive.org/details/marvel-ultimate-alliance_202506"}, {"title": "Marvel Ultimate Alliance 2", "url": "https://archive.org/details/marvel-ultimate-alliance-2_202506"}, {"title": "Mercenaries 2: World in Flames", "url": "https://archive.org/details/mc-2_20251112"}, {"title": "Midnight Club 2", "url": "https://archive.org/details/midnight-club-2-repack"}, {"title": "Mortal Kombat: Komplete Edition", "url": "https://archive.org/details/template_202508"}, {"title": "Need For Speed II: Special Edition", "url": "https://archive.org/details/need-for-speed-ii-special-edition_202512"}, {"title": "Need For Speed III: Hot Pursuit", "url": "https://archive.org/details/need-for-speed-iii-hot-pursuit.-7z_202512"}, {"title": "Need For Speed: Carbon", "url": "https://archive.org/details/need-for-speed-carbon_202512"}, {"title": "Need For Speed: High Stakes", "url": "https://archive.org/details/need-for-speed-iv-high-stakes.-7z"}, {"title": "Need For Speed: Hot Pursuit 2", "url": "https://archive.org/details/need-for-speed-vi-hot-pursuit-2.7z"}, {"title": "Need For Speed: Most Wanted", "url": "https://archive.org/details/need-for-speed-most-wanted-hd-version"}, {"title": "Need For Speed: Porsche Unleashed", "url": "https://archive.org/details/need-for-speed-v-porsche-unleashed.-7z"}, {"title": "Need For Speed: ProStreet", "url": "https://archive.org/details/need-for-speed-pro-street_202512"}, {"title": "Need For Speed: SHIFT", "url": "https://archive.org/details/need-for-speed-shift_202512"}, {"title": "Need For Speed: SHIFT 2 Unleashed", "url": "https://archive.org/details/need-for-speed-shift-2-unleashed_202512"}, {"title": "Need For Speed: The Run", "url": "https://archive.org/details/need-for-speed-the-run_202512"}, {"title": "Need For Speed: Undercover", "url": "https://archive.org/details/need-for-speed-undercover_20251214"}, {"title": "Need For Speed: Underground", "url": "https://archive.org/details/need-for-speed-underground_202512"}, {"title": "Need For Speed: Underground 2", "url": "https://archive.org/details/need-for-speed-underground-2_202512"}, {"title": "No One Lives Forever 2: A Spy in H.A.R.M.'s Way", "url": "https://archive.org/details/no-one-lives-forever-2-a-spy-in-h.a.r.m.s-way_202509"}, {"title": "Nocturne", "url": "https://archive.org/details/nocturne_202510"}, {"title": "Oni: Anniversary Edition", "url": "https://archive.org/details/oni-anniversary-edition.-7z"}, {"title": "Operation Flashpoint: Dragon Rising", "url": "https://archive.org/details/of-dragon-rising.-7z"}, {"title": "Operation Flashpoint: Red River", "url": "https://archive.org/details/operation-flashpoint-red-river.-7z"}, {"title": "Outrun 2006: Coast 2 Coast", "url": "https://archive.org/details/out-run-2006-coast-2-coast.-7z"}, {"title": "Pac Man World 2", "url": "https://archive.org/details/pac-man-world-2.7z"}, {"title": "Peter Jackson's King Kong: The Official Game of the Movie", "url": "https://archive.org/details/king_20251110"}, {"title": "Poker Night Double Pack", "url": "https://archive.org/details/poker-night_202508"}, {"title": "Prey", "url": "https://archive.org/details/prey_20250628"}, {"title": "Project CARS: GOTY Edition", "url": "https://archive.org/details/project-cars_202508"}, {"title": "Project CARS 2", "url": "https://archive.org/details/project-cars-2_202508"}, {"title": "Project CARS 3", "url": "https://archive.org/details/project-cars-3"}, {"title": "Project I.G.I.: I'm Going In", "url": "https://archive.org/details/project-i.-g.-i-im-going-in"}, {"title": "Psi-Ops: The Mindgate Conspiracy", "url": "https://archive.org/details/psi-ops-the-mindgate-conspiracy.-7z"}, {"title": "Psychotoxic", "url": "https://archive.org/details/psychotoxic_202509"}, {"title": "Pure", "url": "https://archive.org/details/pure.-7z"}, {"title": "Race Driver: GRID", "url": "https://archive.org/details/race-driver-grid.-7z"}, {"title": "Rambo: The Videogame", "url": "https://archive.org/details/rambo-the-video-game_202601"}, {"title": "Resident Evil: Operation Racoon City", "url": "https://archive.org/details/resident-evil_202510"}, {"title": "reTHAWed", "url": "https://archive.org/details/reTHAWed.7z"}, {"title": "Road Rash", "url": "https://archive.org/details/road-rash_202511"}, {"title": "Saw", "url": "https://archive.org/details/saw_20251012"}, {"title": "Sanity: Aiken's Artifact", "url": "https://archive.org/details/sanity-aikens-artifact-repack"}, {"title": "Scarface: The World is Yours", "url": "https://archive.org/details/scarface-the-world-is-yours-repack-v-3"}, {"title": "Scratches Director's Cut", "url": "https://archive.org/details/scratches-directors-cut"}, {"title": "SEGA Dreamcast Collection", "url": "https://archive.org/details/ni-ghts-into-dreams_202511"}, {"title": "SEGA Rally Revo", "url": "https://archive.org/details/sega-rally-revo.-7z_202506"}, {"title": "SHRAK", "url": "https://archive.org/details/shrak_202511"}, {"title": "Silent Hill 2: Enhanced Edition", "url": "https://archive.org/details/silent-hill-2.7z_202506"}, {"title": "Silent Hill 3", "url": "https://archive.org/details/silent-hill-3_202510"}, {"title": "Sonic CD: Miracle Edition", "url": "https://archive.org/details/sonic-cd-miracle-edition.-7z_202508"}, {"title": "Sonic R: The Definitive Edition", "url": "https://archive.org/details/sonic-r.-7z_202503"}, {"title": "South Park", "url": "https://archive.org/details/south-park-pc-repack"}, {"title": "Spec Ops: The Line", "url": "https://archive.org/details/spec-ops-the-line.-7z"}, {"title": "Spider-Man 2: The Game", "url": "https://archive.org/details/spider-man-2-pc-repack"}, {"title": "Splinter Cell: Pandora Tomorrow", "url": "https://archive.org/details/scpt.-7z"}, {"title": "Starlancer", "url": "https://archive.org/details/starlancer_202511"}, {"title": "Street Fighter X Tekken", "url": "https://archive.org/details/street-fighter-x-tekken_202508"}, {"title": "Syndicate", "url": "https://archive.org/details/syndicate_202509"}, {"title": "Teenage Mutant Ninja Turtles: Mutants in Manhattan", "url": "https://archive.org/details/teenage-mutant-ninja-turtles-mutants-in-manhattan_202508"}, {"title": "Test Drive Unlimited", "url": "https://archive.org/details/test-drive-unlimited.-7z_202506"}, {"title": "Test Drive Unlimited 2", "url": "https://archive.org/details/test-drive-unlimited-2.7z"}, {"title": "The Chronicles of Riddick: Assault on Dark Athena", "url": "https://archive.org/details/the-chronicles-of-riddick-assault-on-dark-athena.-7z"}, {"title": "The Chronicles of Riddick: Escape From Butcher Bay", "url": "https://archive.org/details/the-chronicles-of-riddick-escape-from-butcher-bay-repack-v-2"}, {"title": "The Crew", "url": "https://archive.org/details/tcu_20250916"}, {"title": "The Godfather Part II", "url": "https://archive.org/details/the-godfather-part-ii"}, {"title": "The Godfather: The Game", "url": "https://archive.org/details/the-godfather_20250816"}, {"title": "The Last Remnant", "url": "https://archive.org/details/square_enix_2025"}, {"title": "The Legend of Korra", "url": "https://archive.org/details/the-legend-of-korra_202508"}, {"title": "The Lord of the Rings: War in the North", "url": "https://archive.org/details/lord-of-the-rings-war-in-the-north_202512"}, {"title": "The Matrix: Path of Neo", "url": "https://archive.org/details/path-of-neo"}, {"title": "The Need For Speed: Special Edition", "url": "https://archive.org/details/the-need-for-speed-special-edition.-7z_202512"}, {"title": "The Operative: No One Lives Forever", "url": "https://archive.org/details/no-one-lives-forever_202509"}, {"title": "The Polar Express", "url": "https://archive.org/details/the-polar-express_202512"}, {"title": "The Punisher", "url": "https://archive.org/details/the-punisher.-7z_202506"}, {"title": "The Simpsons Hit & Run", "url": "https://archive.org/details/the-simpsons-hit-and-run.-7z_202506"}, {"title": "The Suffering", "url": "https://archive.org/details/the-suffering_202510"}, {"title": "The Suffering: Ties That Bind", "url": "https://archive.org/details/the-suffering-2_202510"}, {"title": "The Walking Dead: Survival Instinct", "url": "https://archive.org/details/the-walking-dead-survival-instinct_202601"}, {"title": "ToCA Race Driver", "url": "https://archive.org/details/to-ca-race-driver"}, {"title": "ToCA Race Driver 2", "url": "https://archive.org/details/to-ca-race-driver-2"}, {"title": "ToCA Race Driver 3", "url": "https://archive.org/details/to-ca-race-driver-3_202601"}, {"title": "Toy Story 2: Buzz Lightyear to the Rescue", "url": "https://archive.org/details/toy-story-2-repack"}, {"title": "Transformers: Devastation", "url": "https://archive.org/details/transformers-devastation_202507"}, {"title": "Transformers: Fall of Cybertron", "url": "https://archive.org/details/fall_of_cybertron"}, {"title": "Transformers: Revenge of the Fallen", "url": "https://archive.org/details/transformers-revenge-of-the-fallen.-7z"}, {"title": "Transformers: The Game", "url": "https://archive.org/details/transformers-the-game.-7z"}, {"title": "Transformers: War for Cybertron", "url": "https://archive.org/details/transformers-war-for-cybertron.-7z"}, {"title": "Tron Evolution", "url": "https://archive.org/details/tron-evolution-repack"}, {"title": "True Crime: Streets of LA", "url": "https://archive.org/details/true-crime-streets-of-la.-7z_202506"}, {"title": "Turok", "url": "https://archive.org/details/turok-repack-video-game-2008"}, {"title": "Ultimate Spider Man", "url": "https://archive.org/details/ultimate-spider-man.-7z"}, {"title": "Unreal Tournament 2004: Editor's Choice Edition", "url": "https://archive.org/details/ut-2004_202509"}, {"title": "Unreal Tournament 3: Black Edition", "url": "https://archive.org/details/ue-3_20251113"}, {"title": "Vietcong", "url": "https://archive.org/details/v-1_20250920"}, {"title": "Vietcong 2", "url": "https://archive.org/details/v-2_20250920"}, {"title": "Viva Pinata", "url": "https://archive.org/details/viva-pinata_202512"}, {"title": "Vivisector: Beast Within", "url": "https://archive.org/details/vivisector_202509"}, {"title": "Will Rock", "url": "https://archive.org/details/will-rock.-7z"}, {"title": "William Shatner's TekWar", "url": "https://archive.org/details/william-shatners-tekwar_202601"}, {"title": "WipEout Portable Collection", "url": "https://archive.org/details/wip-eout-portable-collection.-7z"}, {"title": "Wolfenstein", "url": "https://archive.org/details/wolfenstein.-7z"}, {"title": "World racing", "url": "https://archive.org/details/world-racing.-7z"}, {"title": "X-Men Legends II: Rise of Apocalypse", "url": "https://archive.org/details/x-men-legends-ii_202601"}, {"title": "X-Men Origins: Wolverine - Uncaged Edition", "url": "https://archive.org/details/x-men-origins-wolverine.-7z"}, {"title": "You Are EMPTY", "url": "https://archive.org/details/you-are-empty_202510"}, {"title": "Archive of texture-packs for PSone, PlayStation 2, PSP, PS Vita, Gamecube, N64, 3DS, Wii & Dreamcast", "url": "https://docs.google.com/spreadsheets/d/1sif8FeRGJRbytK8wFRXgF6Hke9V6GUFs/edit?gid=431767549#gid=431767549"}, {"title": "Animal Crossing City Folk HD Texture Pack", "url": "https://gamebanana.com/mods/470260"}, {"title": "Baldur's Gate 3 HD Texture Pack", "url": "https://www.nexusmods.com/baldursgate3/mods/18252"}, {"title": "Batman: Arkham Asylum HD Texture Pack", "url": "https://www.nexusmods.com/batmanarkhamasylum/mods/177?tab=description"}, {"title": "Batman: Arkham City HD Texture Pack", "url": "https://www.nexusmods.com/batmanarkhamcity/mods/407?tab=description"}, {"title": "Batman: Arkham Knight HD Texture Pack", "url": "https://www.nexusmods.com/batmanarkhamknight/mods/2671"}, {"title": "Blood 2 Upscale Texture Pack", "url": "https://www.moddb.com/mods/blood-ii-the-chosen-upscale-pack/addons/blood-ii-the-chosen-upscale-pack-v13"}, {"title": "Dark Souls 2 HD Texture Pack", "url": "https://www.nexusmods.com/darksouls2/mods/1160?tab=description"}, {"title": "Fallout New Vegas Texture Upscale Project", "url": "https://www.nexusmods.com/newvegas/mods/93775?tab=description"}, {"title": "Fallout 4 Landscape Textures Overhaul", "url": "https://www.nexusmods.com/fallout4/mods/98692?tab=description"}, {"title": "Far Cry 3 HD Texture Pack", "url": "https://www.nexusmods.com/farcry3/mods/291"}, {"title": "Final Fantasy 7 Remake 4K 8K Texture Collection", "url": "https://www.nexusmods.com/finalfantasy7remake/mods/1977?tab=description"}, {"title": "Final Fantasy 7 Remake HD Texture Pack", "url": "https://www.nexusmods.com/finalfantasy7remake/mods/764?tab=files"}, {"title": "God of War - Decked Edition", "url": "https://www.reddit.com/r/SteamDeck/s/9CczeTYUGk"}, {"title": "Goldeneye 4K Textures", "url": "https://evilgames.eu/texture-packs/ge007-hd.htm#instructions"}, {"title": "Grand Theft Auto 5 Enhanced Edition 4K Texture Pack", "url": "https://www.nexusmods.com/gta5enhanced/mods/272"}, {"title": "Grand Theft Auto Liberty City Stories - Decked Edition", "url": "https://www.reddit.com/r/SteamDeck/s/bNCOrjHbWg"}, {"title": "Luigis Mansion", "url": "https://www.henrikomagnifico.com/luigis-mansion-4k"}, {"title": "Mario Kart 64", "url": "https://evilgames.eu/texture-packs/mario-kart-64-hd.htm"}, {"title": "Mario Kart Double Dash", "url": "https://forums.dolphin-emu.org/Thread-mario-kart-double-dash-re-rendered-hd-texture-pack-v1-2"}, {"title": "Mass Effect Legendary Edition", "url": "https://www.nexusmods.com/masseffectlegendaryedition/mods/1825?tab=description"}, {"title": "NieR Automata 4K Texture Pack", "url": "https://www.nexusmods.com/nierautomata/mods/759?tab=files"}, {"title": "Palworld Texture Pack", "url": "https://www.nexusmods.com/palworld/mods/2723?tab=files"}, {"title": "Paper Mario 64", "url": "https://m.youtube.com/watch?v=fO0Hqhk7qxA"}, {"title": "Pokemon Scarlet & Violet 4K Texture Pack", "url": "https://www.nexusmods.com/pokemonscarletandviolet/mods/52?tab=files"}, {"title": "Prince of Persia Decked Edition", "url": "https://www.reddit.com/r/SteamDeck/s/2XAd4zeIz3"}, {"title": "Resident Evil 5 Texture Pack", "url": "https://www.nexusmods.com/residentevil5goldedition/mods/737?tab=description"}, {"title": "Resident Evil: Revelations HD Texture Pack", "url": "https://www.nexusmods.com/residentevilrevelations/mods/90"}, {"title": "Resident Evil: Revelations 2 HD Texture Pack", "url": "https://www.nexusmods.com/residentevilrevelations/mods/90"}, {"title": "Secret Agent Clank", "url": "https://www.reddit.com/r/RatchetAndClank/s/12ydQ6unl0"}, {"title": "Soul Reaver Dreamcast", "url": "https://www.sr1hdremaster.com/"}, {"title": "SSX 3", "url": "https://leonelvidals.blogspot.com/2020/03/ssx-3-hd-texture-pack.html?m=1"}, {"title": "Super Mario 3D Land", "url": "https://www.henrikomagnifico.com/super-mario-3d-land-hd"}, {"title": "Super Mario Galaxy 63 HD Texture Pack", "url": "https://github.com/iZePlayzYT/SuperMarioGalaxy63-TexturePack/releases"}, {"title": "Super Mario Sunshine", "url": "https://www.henrikomagnifico.com/super-mario-sunshine-4k"}, {"title": "The Legend of Zelda: Breath of the Wild 4K Texture Pack", "url": "https://www.nexusmods.com/legendofzeldabreathofthewild/mods/61?tab=description"}, {"title": "The Legend of Zelda: Tears of the Kingdom 4K Texture Pack", "url": "https://www.nexusmods.com/legendofzeldatearsofthekingdom/mods/161"}, {"title": "The Witcher 3 Wild Hunt Immersion Pack", "url": "https://www.nexusmods.com/witcher3/mods/11259"}, {"title": "Tomb Raider: Legend HD Texture Pack", "url": "https://www.nexusmods.com/tombraiderlegend/mods/97?tab=description"}, {"title": "Ultimate Spiderman (PS2) Decked Edition", "url": "https://www.reddit.com/r/SteamDeck/s/zX3CemaACh"}, {"title": "Vagrant Story on Duckstation", "url": "https://www.youtube.com/watch?v=ouLFjGqcgRQ&t=43s&ab_channel=IceBullet"}, {"title": "Zelda Majora's Mask 3D", "url": "https://www.henrikomagnifico.com/zelda-majoras-mask-3d-4k"}, {"title": "Majora's Mask N64", "url": "https://github.com/Nerrel/MMHD/releases/tag/v1.1b"}, {"title": "Zelda Ocarina of Time 3D", "url": "https://www.henrikomagnifico.com/zelda-ocarina-of-time-3d-4k"}, {"title": "Dusklight - The Legend of Zelda Twilight Princess PC Port Texture Pack 2", "url": "https://www.henrikomagnifico.com/zelda-twilight-princess-4k"}, {"title": "Zelda A Link Between Worlds", "url": "https://www.henrikomagnifico.com/zelda-a-link-between-worlds-4k"}, {"title": "Zelda Skyward Sword", "url": "https://www.henrikomagnifico.com/zelda-skyward-sword-4k"}, {"title": "HIDDEN PALACE ARCHIVE OF PLAYABLE UNRELEASED GAMES PROTOTYPES", "url": "https://hiddenpalace.org/Category:Unreleased_game_prototypes"}, {"title": "Akira - Genesis Megadrive", "url": "https://hiddenpalace.org/Akira_%28Prototype%29"}, {"title": "Aladdin (NTSC) NES Prototype", "url": "https://www.gamesthatwerent.com/2025/07/aladdin-nes-prototype/"}, {"title": "Animaniacs: Hollywood Hypnotics - Gameboy Advance", "url": "https://hiddenpalace.org/News/Animaniacs_-_Hollywood_Hypnotics"}, {"title": "Apocalypse 2 - SNES", "url": "https://www.gamesthatwerent.com/2013/02/apocalypse-super-nintendo/"}, {"title": "Batman: Revenge of the Joker - SNES", "url": "https://hiddenpalace.org/Batman:_Revenge_of_the_Joker_%28Prototype%29"}, {"title": "Big Brother", "url": "https://archive.org/details/BigBrother19990401"}, {"title": "Bio Force Ape - NES", "url": "https://tcrf.net/Bio_Force_Ape"}, {"title": "Beyond Zero Tolerance - Genesis Mega Drive", "url": "https://wowroms.com/en/roms/sega-genesis-megadrive/beyond-zero-tolerance-usa-proto/25311.html"}, {"title": "Blue Angelo: Angels from the Shrine - Gameboy Advance", "url": "https://hiddenpalace.org/Blue_Angelo:_Angels_from_the_Shrine_%28Late_prototype%29"}, {"title": "California Raisins: Grape Escape - NES", "url": "https://wowroms.com/en/roms/nintendo-entertainment-system/california-raisins-the-grape-escape-usa-proto/21805.html"}, {"title": "Castlevania: Resurrection - Dreamcast", "url": "https://hiddenpalace.org/Castlevania:_Resurrection_%28Nov_5,_1999_prototype%29"}, {"title": "Dancing Eyes - Playstation 3", "url": "https://hiddenpalace.org/Dancing_Eyes_(Mar_10,_2011_Prototype)"}, {"title": "Daredevil: The Man Without Fear - Playstation 2", "url": "https://hiddenpalace.org/Daredevil:_The_Man_Without_Fear_%28Mar_22,_2004_prototype%29"}, {"title": "Dark Castle - MSX2", "url": "https://archive.org/details/dark-castle-msx"}, {"title": "Dark Empires - Genesis Mega Drive", "url": "https://hiddenpalace.org/Dark_Empires_%28prototype%29"}, {"title": "Dracula Hunter - Arcade", "url": "https://arlagames.itch.io/dracula-hunter"}, {"title": "Dinosaur Planet - N64", "url": "https://romsfun.com/roms/nintendo-64/dinosaur-planet-dinomod-enhanced.html"}, {"title": "Duke Nukem D-Day - PS2", "url": "https://archive.org/details/duke-dday-ps2-2001-06-04"}, {"title": "Eddie's puzzleTime - Gameboy", "url": "https://www.gamesthatwerent.com/2019/11/eddies-puzzle-time-nintendo-game-boy-released/"}, {"title": "Frog Dude - Megadrive", "url": "https://www.gamesthatwerent.com/2014/02/frog-dude-megadrive-and-alfred-chicken-amiga-prototypes-released/"}, {"title": "Frogger 2: Swampy's Revenge - Dreamcast", "url": "https://hiddenpalace.org/Frogger_2:_Swampy%27s_Revenge_%28October_10,_2000_prototype%29"}, {"title": "It Came From The Desert - Megadrive", "url": "https://www.gamesthatwerent.com/2024/10/it-came-from-the-desert/"}, {"title": "Jet Set Radio Dreamcast Prototype", "url": "https://www.sega-dreamcast-info-games-preservation.com/en/jet-set-radio-dreamcast-early-us-prototype-iso"}, {"title": "Mario Kart XXL - Gameboy Advance", "url": "https://hiddenpalace.org/Mario_Kart_XXL_%28Apr_17,_2004_Tech_Demo%29"}, {"title": "mechanoids 2 - SNES", "url": "https://www.gamesthatwerent.com/2025/04/mechanoids-2-the-final-conflict/"}, {"title": "Mia Hamm Soccer 64 Prototypes", "url": "https://www.gamesthatwerent.com/2025/08/mia-hamm-soccer-64-prototypes/"}, {"title": "Nigel Mansell World Championship - C64", "url": "https://www.gamesthatwerent.com/gtw64/nigel-mansell-world-championship/#tabs-downloads"}, {"title": "Paprium - Genesis Mega Drive", "url": "https://www.emu-land.net/en/consoles/genesis/roms/paprium"}, {"title": "Populous - NES", "url": "https://www.gamesthatwerent.com/2025/03/populous/"}, {"title": "Porky Pig's Haunted Holiday - SNES", "url": "https://www.gamesthatwerent.com/2025/07/porky-pigs-haunted-holiday-snes-prototypes/"}, {"title": "Putty Squad - Megadrive", "url": "https://www.gamesthatwerent.com/2020/12/putty-squad/"}, {"title": "Rayman - SNES", "url": "https://hiddenpalace.org/Rayman_%28SNES_prototype%29"}, {"title": "Resident Evil 1.5 - PSone", "url": "https://archive.org/details/ResidentEvil1.5"}, {"title": "Resident Evil - Gameboy Colour", "url": "https://www.gamesthatwerent.com/2025/12/resident-evil/"}, {"title": "Robocop - PSone", "url": "https://www.gamesthatwerent.com/2012/01/exclusive-tech-demos-for-robocop-and-gen-13-on-the-ps-one-available-to-download/"}, {"title": "Saints Row Undercover - PSP", "url": "https://romsfun.com/download/saints-row-undercover-168984/2"}, {"title": "Sega Channel - 144 Preserved ROMs - Megadrive Genesis", "url": "https://www.gamingalexandria.com/wp/2025/12/sega-channel-prototype-sega-genesis-roms/"}, {"title": "Sensible Soccer - NES", "url": "https://www.gamesthatwerent.com/2025/03/sensible-soccer/"}, {"title": "Sonic Crackers - Genesis Megadrive", "url": "https://hiddenpalace.org/Sonic_Crackers_%28Apr_1,_1994_prototype%29"}, {"title": "Team SAS - Xbox", "url": "https://www.gamesthatwerent.com/2024/12/team-sas/"}, {"title": "The Addams Family: Pugsley's Scavanger Hunt (NES) Prototypes", "url": "https://www.gamesthatwerent.com/2025/05/the-addams-family-pugsleys-scavenger-hunt-nes-prototypes/"}, {"title": "The Elder Scrolls Travels: Oblivion - PSP", "url": "https://hiddenpalace.org/The_Elder_Scrolls_Travels:_Oblivion_%28Apr_27,_2007_prototype%29"}, {"title": "Thrill Kill - PSone", "url": "https://romsfun.com/download/thrill-kill-25889"}, {"title": "Time Diver Eon Man - NES", "url": "https://nesninja.com/game/nes/time-diver-eon-man?rom=Time%20Diver%20Eon%20Man%20%28U%29%20%28Prototype%29%20%5Ba1%5D.nes"}, {"title": "Tripitaka - Windows", "url": "https://archive.org/details/tripitaka_win_mac"}, {"title": "Viewpoint 2064 - N64", "url": "https://hiddenpalace.org/Viewpoint_2064_%28Apr_13,_2000_prototype%29"}, {"title": "Virtua Hamster - Sega 32X", "url": "https://www.gamesthatwerent.com/2020/10/virtua-hamster/"}, {"title": "Warcraft adventures: Lord of the Clans - PC ScummVM", "url": "https://collectionchamber.blogspot.com/2016/09/warcraft-adventures-lord-of-clans.html"}, {"title": "Yoshi - Gameboy Advance", "url": "https://hiddenpalace.org/Yoshi_Sample_%28GBA_Tech_Demo%29"}, {"title": "7th Dragon - Nintendo DS", "url": "https://www.romhacking.net/translations/2176/"}, {"title": "Airs adventure- Sega Saturn", "url": "https://github.com/hitomi2500/airs-patch"}, {"title": "American Oudan Ultra quiz - Super Nintendo", "url": "https://krokodyl.github.io/post/2025/05/america-oudan/"}, {"title": "Ao no 6-go Saigetsufutai Hito: Time and Tide - Dreamcast", "url": "https://www.romhacking.net/translations/5773/"}, {"title": "Baroque - Sega Saturn", "url": "https://www.romhacking.net/translations/7001/"}, {"title": "Battle Master: Kykyoku no Senshitachi - SNES", "url": "https://romhack.ing/database/content/entry/TAD0OP-qTqGOKtW0lsVeVg"}, {"title": "Battle Stadium D.O.N. - PlayStation 2", "url": "https://cdromance.org/ps2-iso/battle-stadium-d-o-n-jpn/"}, {"title": "Belzerion - 3DO", "url": "https://github.com/Eight-Mansions/Belzerion/releases/tag/Release"}, {"title": "Breath of Fire II - Super Nintendo", "url": "https://www.romhacking.net/translations/1384/"}, {"title": "Captain Rainbow - Wii", "url": "https://www.romhacking.net/translations/5603/"}, {"title": "Captain Tsubasa - PS2", "url": "https://cdromance.org/ps2-iso/captain-tsubasa-jpn/"}, {"title": "Captain Tsubasa Vol. II: Super Striker - Nintendo Entertainment System", "url": "https://www.romhacking.net/translations/1182/"}, {"title": "Castlevania: Rondo of Blood - Turbografx-CD", "url": "https://www.romhacking.net/translations/846/"}, {"title": "Cave Story Dokutsu Monogatari - PC", "url": "https://cdromance.org/windows/cave-story-dokutsu-monogatari-english-patched/"}, {"title": "Chaos Field - Dreamcast", "url": "https://www.romhacking.net/translations/6412/"}, {"title": "Chibi-Robo! - Wii", "url": "https://www.romhacking.net/translations/6722/"}, {"title": "Chobits - Gameboy Advance", "url": "https://www.romhacking.net/translations/7425/"}, {"title": "Clock Tower: The First Fear - PlayStation", "url": "https://www.romhacking.net/translations/2337/"}, {"title": "Cookie's Bustle - PC", "url": "https://romhack.ing/database/content/entry/M8qjG9lMSY2TafBciQMHaA/cookie-s-bustle-english-translation"}, {"title": "Cotton 2 - Sega Saturn", "url": "https://www.romhacking.net/translations/5999/"}, {"title": "Cowboy Bebop: Tsuioku no Serenade - Playstation 2", "url": "https://github.com/SONICMAN69/Bebop-PS2-English"}, {"title": "Cyber Troopers Virtual-On - PlayStation 3", "url": "https://github.com/FeiYenKn/Virtual-On-PS3-English-Translation"}, {"title": "Dark Half - Super Nintendo", "url": "https://www.romhacking.net/translations/2344/"}, {"title": "Dark Seed - Sega Saturn", "url": "https://www.segasaturnshiro.com/2025/04/24/english-patch-for-dark-seed-is-available-now/"}, {"title": "Dead of the Brain - PC98", "url": "https://romhack.ing/database/game/entry/PdNs5JQBNs8FWu0CmDSo/dead-of-the-brain"}, {"title": "Dead of the Brain 2 - PC98", "url": "https://romhack.ing/database/content/entry/8mqdySG4SSmYlPYefdKZpQ"}, {"title": "Densetsu no Ogre Battle: The March of the Black Queen - Sega Saturn", "url": "https://www.romhacking.net/translations/6514/"}, {"title": "Digimon adventure- PSP", "url": "https://cdromance.org/psp/digi-adventure-english-patched/"}, {"title": "Digimon World Re:Digitize - PlayStation Portable", "url": "https://cdromance.org/psp/digimon-world-redigitize-full-english-patched/"}, {"title": "Digital Devil Monogatari: Megami Tensei - NES", "url": "https://www.romhacking.net/translations/2287/"}, {"title": "Dragon Ball Z: Super Saiya Densetsu - Super Nintendo", "url": "https://www.romhacking.net/translations/326/"}, {"title": "Dragon Ball Z: The Legend - Sega Saturn", "url": "https://segaxtreme.net/threads/dragon-ball-z-the-legend-english-translation.37310/"}, {"title": "Dragon Force II: Kamisarishi Daichi ni - Sega Saturn", "url": "https://www.romhacking.net/translations/1622/"}, {"title": "Dragon Quest III: Soshite Densetsu e... - Super Nintendo", "url": "https://www.romhacking.net/translations/1323/"}, {"title": "Dragon Quest VI: Maboroshi no Daichi - Super Nintendo", "url": "https://www.romhacking.net/translations/344/"}, {"title": "Dragon Quest V: Tenkuu no Hanayome - PlayStation 2", "url": "https://www.romhacking.net/translations/1482/"}, {"title": "Dragon Quest Monsters: Caravan Heart", "url": "https://www.romhacking.net/translations/1252/"}, {"title": "Dungeons & Dragons: Tower of Doom - Sega Saturn", "url": "https://segaxtreme.net/resources/dungeons-dragons-tower-of-doom-english-patch.426/"}, {"title": "Earth Seeker - Wii", "url": "https://www.romhacking.net/translations/5571/"}, {"title": "Emerald Dragon - PC Engine CD", "url": "https://stargood.org/trans/emdr.php"}, {"title": "Farland Symphony - PC", "url": "https://cdromance.org/windows/farland-symphony-english-patched/"}, {"title": "Final Fantasy Type-0 - PSP", "url": "https://cdromance.org/psp/final-fantasy-type-0-english-patched/"}, {"title": "Final Fantasy X-2: Last Mission - PS2", "url": "https://romhack.ing/database/content/entry/js0cv7y6TyyPoaPNwQ2qWw"}, {"title": "Fire Emblem: Fuuin no Tsurugi - Game Boy Advance", "url": "https://cdromance.org/gba-roms/fire-emblem-fuuin-no-tsurugi/"}, {"title": "Fire Emblem Gaiden - Nintendo Entertainment System", "url": "https://www.romhacking.net/translations/1445/"}, {"title": "Fire Emblem: Monshou no Nazo - Super Nintendo", "url": "https://www.romhacking.net/translations/961/"}, {"title": "Fire Emblem: Path of Radiance - Nintendo GameCube", "url": "https://www.romhacking.net/translations/5621/"}, {"title": "Fire Emblem: Shadow Dragon and the Blade of Light - Nintendo Entertainment System", "url": "https://www.romhacking.net/translations/1593/"}, {"title": "Fire Emblem: Shin Monshou no Nazo - Hikari to Kage no Eiyuu - Nintendo DS", "url": "https://www.romhacking.net/translations/1764/"}, {"title": "Fire Emblem: Thracia 776 - Super Nintendo", "url": "https://www.romhacking.net/translations/4653/"}, {"title": "Front Mission 2 - PlayStation", "url": "https://www.romhacking.net/translations/1750/"}, {"title": "Front Mission 5: Scars of the War - PlayStation 2", "url": "https://www.romhacking.net/translations/1297/"}, {"title": "Fushigi no Dungeon: Fuurai no Shiren 3 Portable - PlayStation Portabl", "url": "https://www.romhacking.net/translations/2015/"}, {"title": "God Eater 2 - PSP", "url": "https://cdromance.org/psp/god-eater-2-jpn/"}, {"title": "Grand Knights History - PSP", "url": "https://cdromance.org/psp/grand-knights-history-english-patched/"}, {"title": "Gyakuten Kenji 2 - Nintendo DS", "url": "https://www.romhacking.net/translations/2260/"}, {"title": "Hybrid Front - Sega Genesis Mega Drive", "url": "https://www.romhacking.net/translations/7416/"}, {"title": "Idolmaster SP: Perfect Sun, Wondering Star & Missing Moon - PSP", "url": "https://sites.google.com/view/imas-sp-en-tl/home"}, {"title": "Ikenie no Yoru - Wii", "url": "https://www.romhacking.net/translations/5575/"}, {"title": "Illusion City - MSX", "url": "https://msxtranslations.com/ic.php"}, {"title": "Illusion of Gaia - Super Nintendo", "url": "https://www.romhacking.net/forum/index.php?topic=39629.0&fbclid=IwY2xjawHkbdJleHRuA2FlbQIxMAABHRHnrkmq2x9QiVciGQYl_2_Ew9eyDf02rNwB1NZ7UNnNP4F9Jgyn8afZiQ_aem_Do3UbOAI_1z5wwUGm5XRSg"}, {"title": "J.B. Harold: Blue Chicago Blues - Sega Saturn", "url": "https://www.romhacking.net/translations/7056/"}, {"title": "Jesus: Kyoufu no Bio Monster - Nintendo Entertainment System", "url": "https://www.romhacking.net/translations/1043/"}, {"title": "Jingle Cats - Playstation", "url": "https://www.timeextension.com/news/2025/06/you-can-now-play-the-japan-exclusive-ps1-cult-classic-jingle-cats-in-english"}, {"title": "JoJo no Kimyou na Bouken: Ougon no Kaze - PlayStation 2", "url": "https://www.romhacking.net/translations/3956/"}, {"title": "Jump Ultimate Stars - Nintendo DS", "url": "https://www.romhacking.net/translations/1636/"}, {"title": "Kaeru no Tame ni Kane wa Naru - Game Boy", "url": "https://www.romhacking.net/translations/1623/"}, {"title": "Kidou Senshi Gundam: Gundam vs. Gundam NEXT PLUS - PSP", "url": "https://cdromance.org/psp/kidou-senshi-gundam-gundam-vs-gundam-next-plus-english-patched/"}, {"title": "King's Field - PlayStation", "url": "https://www.romhacking.net/translations/1067/"}, {"title": "Kingdom Hearts II: Final Mix - Playstation 2", "url": "https://cdromance.org/ps2-iso/kingdom-hearts-ii-final-mix-2/"}, {"title": "Konjiki no Gash Bell!! Go! Go! Mamono Fight!! - Nintendo GameCube", "url": "https://www.romhacking.net/translations/6640/"}, {"title": "Kurohyou: Ryu ga Gotoku Shinshou - PSP", "url": "https://cdromance.org/psp/kurohyou-ryu-ga-gotoku-shinshou/"}, {"title": "La Mulana - PC", "url": "https://www.romhacking.net/translations/1079/"}, {"title": "La Pucelle: Ragnarok - PlayStation Portable", "url": "https://www.romhacking.net/translations/2130/"}, {"title": "Langrisser IV - PlayStation", "url": "https://www.romhacking.net/translations/1711/"}, {"title": "Linkle Liver Story - Sega Saturn", "url": "https://www.romhacking.net/translations/4143/"}, {"title": "Live a Live - Super Nintendo", "url": "https://www.romhacking.net/translations/381/"}, {"title": "L.O.L Lack of Love - Dreamcast", "url": "https://www.romhacking.net/translations/5387/"}, {"title": "LSD - Dream Emulator - PlayStation", "url": "https://www.romhacking.net/translations/5523/"}, {"title": "Magical Date: Operation Heart-Throb - PlayStation", "url": "https://www.romhacking.net/translations/7464/"}, {"title": "Magna Carta: The Phantom of Avalanche - PC", "url": "https://cdromance.org/windows/magna-carta-the-phantom-of-avalanche-english-patched-windows/"}, {"title": "Maple Story DS - Nintendo DS", "url": "https://gbatemp.net/threads/maplestory-ds-2025-full-english-translation-complete.677209/"}, {"title": "Marie to Elie no Atelier: Salburg no Renkinjutsushi 1 & 2 - PlayStation 2", "url": "https://www.romhacking.net/translations/3494/"}, {"title": "Metal Gear (MSX2) - MSX", "url": "https://www.romhacking.net/translations/842/"}, {"title": "Mizzurna Falls - PlayStation", "url": "https://www.romhacking.net/translations/6027/"}, {"title": "Monster Hunter Portable 3rd - PlayStation Portable", "url": "https://www.romhacking.net/translations/2043/"}, {"title": "Mother 1+2 - Game Boy Advance", "url": "https://www.romhacking.net/translations/1609/"}, {"title": "Mother 3 - Game Boy Advance", "url": "https://www.romhacking.net/translations/1333/"}, {"title": "Mushishi: Amefuru Sato - Nintendo DS", "url": "https://romhack.ing/database/content/entry/KLsCYW2oSgeSD9DiIEGgvw"}, {"title": "Namco x Capcom - PlayStation 2", "url": "https://www.romhacking.net/translations/1270/"}, {"title": "Nanatsu no Hikan: Senritsu no Bishou - Dreamcast", "url": "https://www.romhacking.net/translations/5809/"}, {"title": "Nayuta no Kiseki - PSP", "url": "https://www.romhacking.net/translations/3560/"}, {"title": "One Piece: Romance Dawn - PSP", "url": "https://cdromance.org/psp/romance-dawn-english-patched/"}, {"title": "Ougon no Kizuna - Wii", "url": "https://www.romhacking.net/translations/7282/"}, {"title": "Patlabor - Mega Drive Genesis", "url": "https://romhack.ing/database/content/entry/XN_BmXoyS2qWekII82Q87Q/patlabor-english-translation"}, {"title": "Persona 2: Innocent Sin - PlayStation", "url": "https://www.romhacking.net/translations/1249/"}, {"title": "Pocket Monsters: Green Version - Game Boy", "url": "https://www.romhacking.net/translations/1629/"}, {"title": "Pokemon Trading Card Game 2 - Game Boy", "url": "https://www.romhacking.net/translations/1736/"}, {"title": "Pokemon Fushigi no Dungeon: Ikuzo! Arashi no Boukendan - Wii", "url": "https://www.romhacking.net/translations/5518/"}, {"title": "Policenauts - PlayStation", "url": "https://www.romhacking.net/translations/1422/"}, {"title": "Popolocrois Monogatari 2 - Playstation", "url": "https://romhackplaza.org/translations/popolocrois-monogatari-ii-english-translation-playstation/"}, {"title": "PopoRogue - PlayStation", "url": "https://github.com/Lost-Okina/popolocrois-translation-tool/releases/tag/v1.0-poporogue"}, {"title": "Princess Crown - Sega Saturn", "url": "https://github.com/eadmaster/pcrown/releases"}, {"title": "Progenitor - PC98", "url": "https://romhack.ing/database/content/entry/wE3wXKn-RHW8lcesg7lG_g/progenitor-english-translation"}, {"title": "Puyo Puyo~n - Dreamcast", "url": "https://www.romhacking.net/translations/6680/"}, {"title": "Radirgy GeneriC - Nintendo GameCube", "url": "https://www.romhacking.net/translations/7408/"}, {"title": "Rainbow Cotton - Dreamcast", "url": "https://www.romhacking.net/translations/6198/"}, {"title": "Ranma 1 2: Akanekodan Teki Hihou - Super Nintendo", "url": "https://www.romhacking.net/translations/404/"}, {"title": "Rent-A-Hero No.1 - Dreamcast", "url": "https://www.romhacking.net/translations/6925/"}, {"title": "Rockman & Forte - Super Nintendo", "url": "https://www.romhacking.net/translations/621/"}, {"title": "Rogue Hearts Dungeon - PlayStation 2", "url": "https://www.romhacking.net/translations/5601/"}, {"title": "Rhythm Tengoku - Game Boy Advance", "url": "https://www.romhacking.net/translations/1762/"}, {"title": "Sakura Wars 2 - Sega Saturn", "url": "https://segaxtreme.net/resources/sakura-wars-2-english-translation.412/"}, {"title": "Screaming Mad George's Paranoiascape - PlayStation", "url": "https://aeongenesis.net/projects/paranoiascape"}, {"title": "Seiken Densetsu 3 - Super Nintendo", "url": "https://www.romhacking.net/translations/440/"}, {"title": "Shadow Tower: Abyss - PlayStation 2", "url": "https://www.romhacking.net/translations/2042/"}, {"title": "Shin Megami Tensei - PlayStation", "url": "https://www.romhacking.net/translations/6610/"}, {"title": "Shin Megami Tensei - Super Nintendo", "url": "https://www.romhacking.net/translations/571/"}, {"title": "Shin Megami Tensei II - Super Nintendo", "url": "https://www.romhacking.net/translations/687/"}, {"title": "Shin Megami Tensei if... - Super Nintendo", "url": "https://www.romhacking.net/translations/3951/"}, {"title": "Shin Megami Tensei: Nocturne - PlayStation 2", "url": "https://www.romhacking.net/translations/3283/"}, {"title": "Shining Force III: Scenario 1 - Sega Saturn", "url": "https://www.romhacking.net/translations/1569/"}, {"title": "Shinrei Jusatsushi Taroumaru - Sega Saturn", "url": "https://github.com/ExxistanceDC/Shinrei-Jusatsushi-Taromaru-English-Patch"}, {"title": "Silhouette Mirage - Sega Saturn", "url": "https://www.romhacking.net/translations/7060/"}, {"title": "Soul Eater: Battle Resonance - PlayStation 2", "url": "https://www.romhacking.net/translations/6521/"}, {"title": "Soul Eater: Monotone Princess - Wii", "url": "https://www.romhacking.net/translations/6340/"}, {"title": "Splatter World - NES", "url": "https://romhack.ing/database/content/entry/uz8qKfAyQo2GkTX_DHwt6g"}, {"title": "Super Famicom Wars - Super Nintendo", "url": "https://www.romhacking.net/translations/3354/"}, {"title": "Super Robot Taisen A Portable - PlayStation Portable", "url": "https://www.romhacking.net/translations/3658/"}, {"title": "Super Robot Taisen GC - Nintendo GameCube", "url": "https://www.romhacking.net/translations/6105/"}, {"title": "Super Robot Taisen J - Game Boy Advance", "url": "https://www.romhacking.net/translations/1577/"}, {"title": "Super Robot Taisen OG: Original Generations - PlayStation 2", "url": "https://www.romhacking.net/translations/5817/"}, {"title": "Sword Art Online: Infinity Moment - PSP", "url": "https://cdromance.org/psp/sao-infinity-moment-english-patched/"}, {"title": "Sword of the Berserk: Guts' Rage - Dreamcast", "url": "https://www.romhacking.net/translations/6560/"}, {"title": "Tactics Ogre: Let Us Cling Together - Super Nintendo", "url": "https://www.romhacking.net/translations/1501/"}, {"title": "Tales of Phantasia - PlayStation", "url": "https://www.romhacking.net/translations/1214/"}, {"title": "Tales of Rebirth - PlayStation 2", "url": "https://romhack.ing/database/content/entry/LjjufdifRv66ITK_3u_VWA"}, {"title": "Tear Ring Saga: Yutona Eiyuu Senki - PlayStation", "url": "https://www.romhacking.net/translations/2812/"}, {"title": "Tengai Makyou Zero - Super Nintendo", "url": "https://www.romhacking.net/translations/3243/"}, {"title": "The Human Weapon: Dead Fox - NES", "url": "https://www.romhacking.net/translations/7432"}, {"title": "The Hybrid Front - Genesis Mega Drive", "url": "https://nebulous.group/index.php/projects/translations/hybrid-front/#cmtoc_anchor_id_4"}, {"title": "The Legend of Sword & Fairy - PC", "url": "https://cdromance.org/windows/the-legend-of-sword-and-fairy-english-patched-v3-3-windows-pc/"}, {"title": "Time Travelers - 3DS", "url": "https://fantranslators.info/2025/02/01/time-travelers-english-translation-patch/"}, {"title": "Tobal 2 - PlayStation", "url": "https://www.romhacking.net/translations/7435/"}, {"title": "Tomodachi Collection - Nintendo DS", "url": "https://cdromance.org/nds-roms/tomodachi-collection-english-patched/"}, {"title": "Toradora Portable! - PlayStation Portable", "url": "https://www.romhacking.net/translations/2228/"}, {"title": "Toukiden Kiwami - PSP", "url": "https://cdromance.org/psp/toukiden-kiwami-english-patched-v2/"}, {"title": "Tsukihime - PC", "url": "https://cdromance.org/windows/tsukihime-english-patched/"}, {"title": "Vampire Panic - PlayStation 2", "url": "https://www.romhacking.net/translations/5623/"}, {"title": "Variable Geo - PC98", "url": "https://romhack.ing/database/content/entry/xeLw9oQGSluBM5YGZVJnZg"}, {"title": "Waku Waku Puyo Puyo Dungeon - Sega Saturn", "url": "https://www.timeextension.com/news/2025/05/a-japan-exclusive-puyo-puyo-dungeon-crawler-for-saturn-has-just-received-a-fan-translation"}, {"title": "Welcome House 2 - Keaton and his Uncle - PlayStation", "url": "https://romhackplaza.org/translations/welcome-house-2-keaton-and-his-uncle-english-translation-playstation/"}, {"title": "Wizardry VI: Bane of the Cosmic Forge - Sega Saturn", "url": "https://segaxtreme.net/resources/wizardry-vi-vii-complete-english-translation-patch.457/"}, {"title": "Wonder Trek - Playstation", "url": "https://romhackplaza.org/translations/wonder-trek-english-translation-playstation/"}, {"title": "Yaku - Playstation", "url": "https://romhackplaza.org/translations/misfortune-a-story-of-suspicious-friendships-english-translation-playstation/"}, {"title": "Yu-Gi-Oh! 5D's Tag Force 6 - PSP", "url": "https://cdromance.org/psp/yu-gi-oh-5ds-tag-force-6-english-patched-2/"}, {"title": "Yu-Gi-Oh! ARC-V Tag Force Special - PSP", "url": "https://cdromance.org/psp/yu-gi-oh-arc-v-tag-force-special-jpn-2/"}, {"title": "Zangeki no Reginleiv - Wii", "url": "https://www.romhacking.net/translations/6025/"}, {"title": "Zanma Chouougi Valhollian - Sega Saturn", "url": "https://www.romhacking.net/translations/5700/"}, {"title": "Zero: Tsukihami no Kamen - Wii", "url": "https://www.romhacking.net/translations/2044/"}, {"title": "Zoids VS III - Nintendo GameCube", "url": "https://www.romhacking.net/translations/6799/"}, {"title": "LINK TO darkuni MEGA LIST OF STEAM DECK VIDEO TUTORIALS", "url": "https://www.reddit.com/r/steamdeckhq/s/7Xc1vsIx1O"}, {"title": "Alternatives to popular games that don't work on Linux SteamOS and Steam Deck", "url": "https://www.gamingonlinux.com/guides/view/alternatives-to-popular-games-that-dont-work-on-linux-steam-deck-and-steamos/"}, {"title": "A Hacker's Essential Toolkit", "url": "https://romhackplaza.org/tutorials/a-hackers-essential-toolkit/"}, {"title": "An idiots guide to setting up Minecraft on Steam Deck  SteamOS with controller support", "url": "https://www.gamingonlinux.com/guides/view/an-idiots-guide-to-setting-up-minecraft-on-steam-deck-steamos-with-controller-support/"}, {"title": "An Introduction to Understanding Hacking 8 Bit Graphics A Tutorial", "url": "https://romhackplaza.org/tutorials/an-introduction-to-understanding-hacking-8-bit-graphics/"}, {"title": "Arcade ROMs with actual names", "url": "https://mdk.cab/"}, {"title": "Beginner's SNES Hacking Guide", "url": "https://romhackplaza.org/tutorials/absolute-beginners-snes-hacking-guide/"}, {"title": "BloodBorne on PC - A Guide", "url": "https://www.reddit.com/r/shadps4/comments/1lee438/full_guide_how_to_play_bloodborne_on_pc_for_n00bs/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, {"title": "Definitive Guide to rom-hacking for Complete Beginners", "url": "https://romhackplaza.org/tutorials/the-definitive-guide-to-rom-hacking-for-complete-beginners/"}, {"title": "Emudeck beginners guide", "url": "https://www.youtube.com/watch?v=M1JwSQMINnU&ab_channel=MonroeWorld"}, {"title": "Emudeck Help Site", "url": "https://manual.emudeck.com/"}, {"title": "Emulation guide (1) by Sahbito", "url": "https://www.reddit.com/r/SteamDeck/s/385ijbinDk"}, {"title": "Emulation guide (2) by Sahbito", "url": "https://www.reddit.com/r/SteamDeck/s/H0Wmni7DJ9"}, {"title": "GBA and DS rom-hacksing Guide", "url": "https://romhackplaza.org/tutorials/gba-and-ds-rom-hacking-guide/"}, {"title": "Hacking Games in Hex (Sega Genesis Edition)", "url": "https://romhackplaza.org/tutorials/hacking-games-in-hex-sega-genesis-edition/"}, {"title": "How to Dump ROMs - All Systems", "url": "https://dumping.guide/start"}, {"title": "How to patch a ROM", "url": "https://youtu.be/H6P7N4po1hM?si=V-_3Iyn9YvEOa0RG"}, {"title": "How to get Battlefield 3 and Battlefield 4 online working on Linux, SteamOS, Steam Deck", "url": "https://www.gamingonlinux.com/guides/view/how-to-get-battlefield-3-and-battlefield-4-online-working-on-linux-steamos-steam-deck/"}, {"title": "How to install HD Textures for DuckStation", "url": "https://www.youtube.com/watch?v=ICc0mWPJdUM&ab_channel=WarpedPolygon"}, {"title": "How to install HD Textures for PCSX2", "url": "https://www.youtube.com/watch?v=kGf5t5U5Ays&ab_channel=GeniusBug"}, {"title": "How to install HD Textures for PPSSPP", "url": "https://www.youtube.com/watch?v=YvSXzC2c3pg&ab_channel=GeniusBug"}, {"title": "How to install Hollow Knight: Silksong modson Linux, SteamOS and Steam Deck", "url": "https://www.gamingonlinux.com/guides/view/how-to-install-hollow-knight-silksong-mods-on-linux-steamos-and-steam-deck/"}, {"title": "How to play games from GOG and Epic Games on Linux, SteamOS and Steam Deck", "url": "https://www.gamingonlinux.com/guides/view/how-to-play-games-from-gog-and-epic-games-on-linux-steamos-and-steam-deck/"}, {"title": "How to setup OpenMW for modern Morrowind on Linux SteamOS and Steam Deck", "url": "https://www.gamingonlinux.com/guides/view/how-to-setup-openmw-for-modern-morrowind-on-linux-steamos-and-steam-deck/"}, {"title": "Minecraft on Steam Deck", "url": "https://youtu.be/WRwJ8c4bTpA?si=NsC7lUIZ2JPLGWGQ"}, {"title": "PhysX fix for Linux Steam Deck", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=2780134576"}, {"title": "Rom Hacking 101", "url": "https://romhackplaza.org/tutorials/romhacking-101/"}, {"title": "Rom Hacking 102 Font and Sprites", "url": "https://romhackplaza.org/tutorials/romhacking102-fontsprites/"}, {"title": "Rom Hacking 103 Script Insertion", "url": "https://romhackplaza.org/tutorials/romhacking-103-script-insertion/"}, {"title": "Rom Hacking 104 Compression Scheme", "url": "https://romhackplaza.org/tutorials/romhacking-104-compression-scheme-re/"}, {"title": "Rom Hacking PSP Basics", "url": "https://romhackplaza.org/tutorials/romhacking-psp_basics/"}, {"title": "Solution to slow download speeds on Steam Deck (1)", "url": "https://www.reddit.com/r/SteamDeck/comments/16lnsg6/psa_solution_to_slow_steam_downloads_on_deck/?share_id=YSfT6PmFF1o5ap6fl0FPS&utm_content=1&utm_medium=android_app&utm_name=androidcss&utm_source=share&utm_term=1"}, {"title": "Solution to slow download speeds on Steam Deck (2)", "url": "https://www.reddit.com/r/SteamDeck/comments/11yjs1s/comment/jm1irbr/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, {"title": "The Playstation Translation Doc", "url": "https://romhackplaza.org/tutorials/the-playstation-translation-doc/"}, {"title": "Waydroid on SteamOS - Android on Steam Deck", "url": "https://decky.net/en-eu/blogs/news/android-auf-dem-steam-deck"}, {"title": "Banjo Kazooie Recompilation", "url": "https://github.com/BanjoRecomp/BanjoRecomp/releases/tag/v1.0.0"}, {"title": "Ghostship - Mario 64 PC Port", "url": "https://github.com/HarbourMasters/Ghostship"}, {"title": "Super Monkey Ball - Web Browser Game", "url": "https://monkeyball-online.pages.dev/"}, {"title": "Star Wars Battlefront II Private Server and Mod Launcher", "url": "https://github.com/ArmchairDevelopers/Kyber"}, {"title": "The Witcher 3 - Witcher Online", "url": "https://www.nexusmods.com/witcher3/mods/11590?tab=description"}, {"title": "Fallout New Vegas - Talk of the Town - Relationships, Marriage and more", "url": "https://www.nexusmods.com/newvegas/mods/95615"}, {"title": "Black Mesa - Military", "url": "https://www.moddb.com/mods/black-mesa-military/downloads/black-mesa-military-2026-version-full"}, {"title": "Fallout 3 - Fallout Legends", "url": "https://www.nexusmods.com/fallout3/mods/27207?tab=description"}, {"title": "Starfield - Lakin-Ik", "url": "https://www.nexusmods.com/starfield/mods/15877?tab=description"}, {"title": "Assassin's Creed Victory Project", "url": "https://www.moddb.com/mods/assassins-creed-victory-project-version-10/downloads/assassins-creed-victory-project-version-10"}, {"title": "Virtua Racing Recompilation", "url": "https://github.com/matiaszanolli/sega-vr-disasm"}, {"title": "Mega Man Zero 3 Decompilation", "url": "https://github.com/mmzret/rmz3"}, {"title": "New Super Mario Bros U Decompilation", "url": "https://github.com/nsmbu/decomp"}, {"title": "Mega Man 64 Recompilation", "url": "https://github.com/MegaMan64Recomp/MegaMan64Recompiled/releases/tag/v0.1.0-alpha"}, {"title": "Mobhold", "url": "https://agentratelimit.github.io/Mobhold/"}, {"title": "Beep-8", "url": "https://beep8.org/"}, {"title": "Sonic R - R & R", "url": "https://segaxtreme.net/resources/sonic-r-the-r-r-mod.479/"}, {"title": "PsyDoom", "url": "https://github.com/BodbDearg/PsyDoom/releases/tag/preview-builds%2F1.2.0-preview1"}, {"title": "BitCraft MMORPG Open Source Server Code", "url": "https://github.com/clockworklabs/BitCraftPublic"}, {"title": "Shizuku - PC98", "url": "https://romhack.ing/database/content/entry/yBy69HXSTe2eXhS1y4DyiA/shizuku-english-translation"}, {"title": "Bubble Bobble Lost Cave C64", "url": "https://daves-retro-forge.itch.io/bubble-bobble-lost-cave-c64"}, {"title": "Elder Scrolls III - Morrowind Rebirth", "url": "https://www.moddb.com/mods/morrowind-rebirth/downloads"}, {"title": "Luanti", "url": "https://www.luanti.org/en/"}, {"title": "Surge Engine", "url": "https://alemart.itch.io/opensurge"}, {"title": "Substance Wars 64", "url": "https://romhacking.com/hack/substance-wars-64"}, {"title": "Fallout New Vegas - Enhanced Animations - 3rd Person Movement", "url": "https://www.nexusmods.com/newvegas/mods/95967?tab=description"}, {"title": "Mega Man World: Dr. Wily's Revenge DX", "url": "https://www.romhacking.net/hacks/7492/"}, {"title": "Super Mario Land DX", "url": "https://www.romhacking.net/hacks/4477/"}, {"title": "Super Mario Land 2 DX", "url": "https://www.romhacking.net/hacks/3784/"}, {"title": "Wario Land: Super Mario Land 3 DX", "url": "https://www.romhacking.net/hacks/6683/"}, {"title": "Metroid II - EJRTQ Colorization", "url": "https://www.romhacking.net/hacks/4388/"}, {"title": "Final Fantasy Adventure DX", "url": "https://www.romhacking.net/hacks/8673/"}, {"title": "Donkey Kong Land DX", "url": "https://www.romhacking.net/hacks/6076/"}, {"title": "Donkey Kong Land 2 DX", "url": "https://www.romhacking.net/hacks/6866/"}, {"title": "Donkey Kong Land 3 DX", "url": "https://www.romhacking.net/translations/1757/"}, {"title": "Pokemon Red DX", "url": "https://www.romhacking.net/hacks/1385/"}, {"title": "Revenge Of The Gator Gold DX", "url": "https://www.romhacking.net/hacks/7480/"}, {"title": "Spanky's Quest DX", "url": "https://www.romhacking.net/hacks/8297/"}, {"title": "Balloon Kid DX", "url": "https://www.romhacking.net/translations/2573/"}, {"title": "Alleyway DX", "url": "https://www.romhacking.net/hacks/6510/"}, {"title": "Snoopy's Magic Show DX", "url": "https://www.romhacking.net/hacks/6657/"}, {"title": "Bomb Jack DX", "url": "https://www.romhacking.net/hacks/6781/"}, {"title": "Amazing Penguin DX", "url": "https://www.romhacking.net/hacks/6797/"}, {"title": "Dr. Mario DX", "url": "https://www.romhacking.net/hacks/5281/"}, {"title": "Galaga & Galaxian DX", "url": "https://www.romhacking.net/hacks/6541/"}, {"title": "Zelda's Adventure Remastered", "url": "https://jappawakka.itch.io/zeldas-adventure-remastered"}, {"title": "Beavis and Butt-Head Do Hollywood - Playstation", "url": "https://hiddenpalace.org/Beavis_and_Butt-Head_Do_Hollywood_(Nov_10,_1998_prototype)"}, {"title": "Persona 3 FES Decompilation", "url": "https://github.com/snaku/Persona3-FES-Decompilation"}, {"title": "Pokemon HeartGold SoulSilver Decompilation", "url": "https://github.com/pret/pokeheartgold"}, {"title": "The Last of Us Demake Browser Game", "url": "https://mourilo.itch.io/the-last-of-us-demastered?ref=retrododo.com"}, {"title": "Ys V: Lost Kefin - Kingdom of Sand - Playstation 2", "url": "https://github.com/Kaisaan/lostkefin"}, {"title": "Star Quest 1 in the 27th Century", "url": "https://virtual-adventures.itch.io/star-quest-1-in-the-27th-century"}, {"title": "2048", "url": "https://play2048.co/"}, {"title": "CoD Community Launcher - Plutonium", "url": "https://plutonium.pw/"}, {"title": "CoD Community Launcher - HorizonMW", "url": "https://horizonmw.org/"}, {"title": "Animal Crossing Deluxe", "url": "https://www.belltreeforums.com/threads/animal-crossing-deluxe-mod.638259/"}, {"title": "Team Fortress 2 Classified", "url": "https://tf2classified.com/"}, {"title": "Mamono Hunter Mai", "url": "https://archive.org/details/mamono-hunter-mai"}, {"title": "Harry Potter and the Order of the Phoenix", "url": "https://archive.org/details/harry-potter-and-the-order-of-the-phoenix-ibm-pc-usa"}, {"title": "IsoCity", "url": "https://iso-city.com/"}, {"title": "IsoCoaster", "url": "https://iso-coaster.com/"}, {"title": "Shattered Pixel Dungeon", "url": "https://shattered-pixel.itch.io/shattered-pixel-dungeon"}, {"title": "Unvanquished", "url": "https://unvanquished.net/"}, {"title": "Warsow", "url": "https://warsow.net/"}, {"title": "Ghosts n' Goblins 2", "url": "https://indieastaroth.itch.io/ghosts-and-goblins-2"}, {"title": "Tales of Phantasia X - PSP", "url": "https://github.com/lifebottle/Tales-of-Phantasia-X/releases/tag/v1.0"}, {"title": "Banjo Kazooie Recompilation Mods", "url": "https://thunderstore.io/c/banjo-recompiled/"}, {"title": "Prince Of Persia The Sands of Time Remastered", "url": "https://www.nexusmods.com/princeofpersiathesandsoftime/mods/14?tab=posts"}, {"title": "Osu! Lazer", "url": "https://osu.ppy.sh/home/download"}, {"title": "Red Eclipse", "url": "https://www.redeclipse.net/"}, {"title": "The Mana World", "url": "https://www.themanaworld.org/"}, {"title": "Tales of Maj'Eyal", "url": "https://te4.org/"}, {"title": "OpenSpades", "url": "https://openspades.yvt.jp/"}, {"title": "SuperTux", "url": "https://www.supertux.org/"}, {"title": "OpenClonk", "url": "https://www.openclonk.org/"}, {"title": "SimuTrans", "url": "https://www.simutrans.com/en/"}, {"title": "Open Imperium Galactica", "url": "https://github.com/akarnokd/open-ig"}, {"title": "OpenArena", "url": "http://www.openarena.ws/smfnews.php"}, {"title": "FreedroidRPG", "url": "https://www.freedroid.org/"}, {"title": "Stunt Rally", "url": "https://cryham.org/stuntrally/"}, {"title": "Spring: 1944", "url": "https://spring1944.net/"}, {"title": "MegaGlest", "url": "https://megaglest.org/"}, {"title": "BZFlag", "url": "https://www.bzflag.org/"}, {"title": "FreeGish", "url": "https://github.com/freegish/freegish"}, {"title": "Angband", "url": "https://rephial.org/"}, {"title": "PlaneShift", "url": "https://www.planeshift.it/"}, {"title": "Rigs of Rods", "url": "https://www.rigsofrods.org/"}, {"title": "Enemy Territory: Legacy", "url": "https://www.etlegacy.com/"}, {"title": "Pingus", "url": "https://pingus.seul.org/"}, {"title": "Tuxemon", "url": "https://tuxemon.org/"}, {"title": "TripleA", "url": "https://triplea-game.org/"}, {"title": "Alien Arena", "url": "https://www.alienarena.org/"}, {"title": "Magarena", "url": "https://github.com/magarena/magarena"}, {"title": "Star Ruler 2", "url": "https://github.com/BlindMindStudios/StarRuler2-Source"}, {"title": "Ryzom", "url": "https://ryzom.com/"}, {"title": "Red Runner", "url": "https://bayat.itch.io/red-runner"}, {"title": "OpenSA", "url": "https://dzierzan.itch.io/opensa"}, {"title": "Elona+", "url": "https://github.com/Ruin0x11/ElonaPlusCustom-GX"}, {"title": "Remnants of the Precursors", "url": "https://rayfowler.itch.io/remnants-of-the-precursors"}, {"title": "Tremulous", "url": "https://tremulous.net/"}, {"title": "Terasology", "url": "https://terasology.org/"}, {"title": "Dead Ascend", "url": "https://blackgrain.itch.io/dead-ascend"}, {"title": "Limit Theory Redux", "url": "https://github.com/Limit-Theory-Redux/ltheory"}, {"title": "Neverball", "url": "https://neverball.org/screenshots"}, {"title": "Mk48.io", "url": "https://mk48.io/"}, {"title": "Friking Shark", "url": "https://repo.openpandora.org/?page=detail&app=friking-shark-ptitseb"}, {"title": "The Lord of the Rings Conquest - DLC Modded - Online Support", "url": "https://gofile.io/d/oI3bEg"}, {"title": "The Lord of the Rings Conquest - MordorWide Online Servers", "url": "https://mordorwi.de/"}, {"title": "Shadows of the Past - Formerly The Lord of the Rings Conquest Reimagined", "url": "https://www.shadowsofthepast.org/"}, {"title": "Dead Rising Prototype", "url": "https://deadrising2mods.proboards.com/thread/3637"}, {"title": "All Japan Women's Pro Wrestling Queen of Queens - PCFX", "url": "https://romhack.ing/database/content/entry/-JIdj-dSReyb69bQ1d0aCw/all-japan-women-s-pro-wrestling-queen-of-queens-english"}, {"title": "Fallout 4 - Heather Companion Mod", "url": "https://www.nexusmods.com/fallout4/mods/23273"}, {"title": "CRW: Metal Jacket - PC98", "url": "https://cdromance.org/pc-98/crw-metal-jacket-english-patched/"}, {"title": "Tuned Heart - PC98", "url": "https://cdromance.org/pc-98/tuned-heart-english-patched/"}, {"title": "Pokemon Inritum", "url": "https://www.pokecommunity.com/threads/pok%C3%A9mon-inritum.532504/?ref=retrododo.com"}, {"title": "Delivery & Beyond", "url": "https://store.steampowered.com/app/3376480/Delivery__Beyond/"}, {"title": "Lode Runner - Nintendo DS", "url": "https://cdromance.org/nds-roms/lode-runner-japan/"}, {"title": "Rockman & Forte - SNES", "url": "https://cdromance.org/snes-rom/rockman-forte-player-switching-multiple-equipment-hack/"}, {"title": "Dragon Ball Kai: Ultimate Butouden - Nintendo DS", "url": "https://cdromance.org/nds-roms/dragon-ball-kai-ultimate-butouden-jpn-english-patched/"}, {"title": "Chobits: Chiidake no Hito - PS2", "url": "https://github.com/sam8457/Chobits-Translation-Project"}, {"title": "Junk Runner 64", "url": "https://github.com/lambertjamesd/n64brew2025"}, {"title": "Brogue: Community Edition", "url": "https://github.com/tmewett/BrogueCE"}, {"title": "IVAN", "url": "https://github.com/Attnam/ivan"}, {"title": "Shamogu", "url": "https://codeberg.org/anaseto/shamogu"}, {"title": "Harmonist: Dayoriah Clan Infiltration", "url": "https://codeberg.org/anaseto/harmonist"}, {"title": "Oathbreaker", "url": "https://github.com/kiedtl/roguelike"}, {"title": "Shadow of the Wyrm", "url": "https://www.shadowofthewyrm.org/"}, {"title": "Sil-Q", "url": "https://github.com/sil-quirk/sil-q"}, {"title": "Hyperroque", "url": "https://github.com/zenorogue/hyperrogue/"}, {"title": "Barotrauma", "url": "https://barotraumagame.com/"}, {"title": "Mindustry", "url": "https://mindustrygame.github.io/"}, {"title": "UltraStar Deluxw", "url": "https://usdx.eu/"}, {"title": "StepMania", "url": "https://www.stepmania.com/"}, {"title": "Space Station Silicon Valley Recompilation", "url": "https://github.com/Cellenseres/SSSV_Recomp"}, {"title": "EmuDevz", "url": "https://afska.itch.io/emudevz"}, {"title": "Station - Heroes for Hire", "url": "https://ashgb.itch.io/station-heroes-for-hire"}, {"title": "OpenBlok", "url": "https://github.com/mmatyas/openblok"}, {"title": "PySol Fan Club Edition", "url": "https://pysolfc.sourceforge.io/"}, {"title": "Augustus", "url": "https://github.com/Keriew/augustus"}, {"title": "ONI Remaster Mod", "url": "https://www.reddit.com/r/oni/comments/1qvy35h/oni_remaster_mod_link/?utm_source=share&utm_medium=web3x&utm_name=web3xcss&utm_term=1&utm_content=share_button"}, {"title": "Red Dead Redemption 2 Texture Pack", "url": "https://www.nexusmods.com/reddeadredemption2/mods/8021?tab=description"}, {"title": "Resident Evil HD Remaster 4K Texture Pack", "url": "https://www.nexusmods.com/residentevilbiohazardhdremaster/mods/169?tab=description"}, {"title": "SuperTux 3D", "url": "https://edsmithy.itch.io/supertux-3d"}, {"title": "Open Realm of Stars", "url": "https://reemax.itch.io/open-realm-of-stars"}, {"title": "Ghostship - Mario 64 PC Port - HD Texture Pack", "url": "https://evilgames.eu/texture-packs/sm64-reloaded.htm"}, {"title": "The Witcher 3 - Dawn Over Kovir", "url": "https://www.nexusmods.com/witcher3/mods/11831?tab=description"}, {"title": "Minima", "url": "https://feneric.itch.io/minima"}, {"title": "Anteform", "url": "https://feneric.itch.io/anteform"}, {"title": "MOTHER: Encore", "url": "https://mother-encore.itch.io/mother-encore"}, {"title": "Project Kat", "url": "https://leef6010.itch.io/projectkat"}, {"title": "The Freak Circus", "url": "https://garula.itch.io/the-freak-circus"}, {"title": "Mario Kart Wii DeluxeX", "url": "https://discord.com/invite/tRVhfWSkf2"}, {"title": "Sonic Megamix Mania", "url": "https://sonicmegamixmania.github.io/"}, {"title": "Final Fight Enhanced Edition - Amiga", "url": "https://www.indieretronews.com/2026/02/final-fight-enhanced-enhanced-amiga.html?spref=tw"}, {"title": "Cold Case", "url": "https://segaxtreme.net/resources/cold-case.237/"}, {"title": "Grand Theft Auto: Ready2Play", "url": "https://gtaforums.com/topic/986492-grand-theft-auto-ready2play-full-game-windows-version/"}, {"title": "Orbhold", "url": "https://agentratelimit.github.io/Orbhold/"}, {"title": "Wonder Project J2 Decompilation", "url": "https://github.com/LLONSIT-glitch/wonder"}, {"title": "Kula World 32X Port", "url": "https://old-pirate.itch.io/kula-world-32x"}, {"title": "Castlevania 1 Fortified Army", "url": "https://www.romhacking.net/hacks/9409/?ref=retrododo.com"}, {"title": "Chiaki NG", "url": "https://github.com/streetpea/chiaki-ng"}, {"title": "Steam Deck Guide", "url": "https://github.com/mikeroyal/Steam-Deck-Guide"}, {"title": "Awesome Steam Deck", "url": "https://github.com/airscripts/awesome-steam-deck"}, {"title": "Rog Ally & Steam Deck Ultimate Windows Guides", "url": "https://baldsealion.com/"}, {"title": "Heart of the Alien N64 Port", "url": "https://old-pirate.itch.io/heart-of-the-alien-n64"}, {"title": "Super Mario 64 Remake", "url": "https://cdromance.org/n64-roms/super-mario-64-remake-hack-n64/"}, {"title": "Assassin's Creed Director's Cut Remastered", "url": "https://www.nexusmods.com/assassinscreed/mods/152?tab=description"}, {"title": "Walfie's Nonograms", "url": "https://walfie.itch.io/walfies-nonograms"}, {"title": "Celeste Classic PSX", "url": "https://bonnie-games.itch.io/celeste-classic-psx"}, {"title": "Sonic The Hedgehog XA", "url": "https://github.com/luksamuk/engine-psx"}, {"title": "OldUnreal Game Installers", "url": "https://github.com/OldUnreal/FullGameInstallers/releases/tag/windows-game-installers"}, {"title": "Super Mario CD Super Mario 64 for the PS1", "url": "https://youtu.be/ogc-BAuQEGw?si=biUDDwz2ln5BR0qY"}, {"title": "Friends Adrift", "url": "https://zhamul.itch.io/friends-adrift-ps1"}, {"title": "Magic Castle", "url": "http://netyaroze.com/Media/Magic-Castle"}, {"title": "Mario Kart Double Dash Retro Track Grand Prix", "url": "https://gamebanana.com/mods/594415"}, {"title": "Bangai-O - N64", "url": "https://www.romhacking.net/translations/7509/"}, {"title": "OpenCiv3", "url": "https://openciv3.org/"}, {"title": "Isometric Games Don't Exist", "url": "https://cyangmou.itch.io/isometric-games-dont-exist"}, {"title": "Xenosaga Episode I Der Wille zur Macht Decompilation", "url": "https://github.com/ValakTurtle/Xenosaga-I-Decomp"}, {"title": "Touhou Koumakyou The Embodiment of Scarlet Devil Decompilation", "url": "https://github.com/GensokyoClub/th06"}, {"title": "Fallout The New West", "url": "https://youtu.be/KY5X0G_05h0?si=-1DM55tQkS3nQvB8"}, {"title": "Cyberpunk 2077 The APEX Sonora Canyon and Safehouse Mod", "url": "https://www.nexusmods.com/cyberpunk2077/mods/25999"}, {"title": "Black & White 2", "url": "https://www.myabandonware.com/game/black-white-2-bem"}, {"title": "Zoo Tycoon Complete Collection", "url": "https://www.myabandonware.com/game/zoo-tycoon-complete-collection-dzx"}, {"title": "Black & White", "url": "https://www.myabandonware.com/game/black-white-a33"}, {"title": "Sim Ant", "url": "https://www.myabandonware.com/game/simant-197"}, {"title": "MechWarrior 4 Mercenaries", "url": "https://www.myabandonware.com/game/mechwarrior-4-mercenaries-3ak"}, {"title": "The Movies", "url": "https://www.myabandonware.com/game/the-movies-bcv"}, {"title": "Harry Potter and the Sorcerer's Stone", "url": "https://www.myabandonware.com/game/harry-potter-and-the-sorcerer-s-stone-e3o"}, {"title": "Sonic Heroes", "url": "https://www.myabandonware.com/game/sonic-heroes-cm5"}, {"title": "Disney's Tarzan", "url": "https://www.myabandonware.com/game/disney-s-tarzan-49p"}, {"title": "The Lord of the Rings The Battle for Middle-Earth II", "url": "https://archive.org/details/the-lord-of-the-rings-the-battle-for-middle-earth-ii-repack"}, {"title": "Adidas Power Soccer", "url": "https://www.myabandonware.com/game/adidas-power-soccer-dsf"}, {"title": "Spiderman Web of Shadows", "url": "https://www.myabandonware.com/game/spider-man-web-of-shadows-gmb"}, {"title": "Spiderman Shattered Dimensions", "url": "https://www.myabandonware.com/game/spider-man-shattered-dimensions-rbo"}, {"title": "Mushroom Heaven", "url": "https://www.romhacking.net/hacks/6803/"}, {"title": "The Beatles Adventures in Pepperland", "url": "https://www.romhacking.net/hacks/6311/"}, {"title": "Ghost Recon Advanced Warfighter 1 and 2", "url": "https://archive.org/details/ghost-recon-advanced-warfighter"}, {"title": "Of Mice and Mechs", "url": "https://github.com/MarxMustermann/OfMiceAndMechs/"}, {"title": "Pikmin 1²", "url": "https://pikhacker.github.io/"}, {"title": "NHL'94 Fight Edition", "url": "https://forum.nhl94.com/index.php?/topic/38026-nhl94-fight-edition/"}, {"title": "Sword of Mana QuickMenu​", "url": "https://www.romhacking.net/hacks/4913/"}, {"title": "Snoopy vs The Red Baron", "url": "https://archive.org/details/Snoopy_vs._The_Red_Baron_USA"}, {"title": "State of Emergency", "url": "https://archive.org/details/state-of-emergency-repack"}, {"title": "Rise of Nations Rise of Legends", "url": "https://archive.org/details/rise-of-nations-rise-of-legends-2006-microsoft-big-huge-games-4-cd-set"}, {"title": "Super Mariomon​", "url": "https://www.pokecommunity.com/threads/super-mariomon.535764/"}, {"title": "Wario Land 4 Perfect Version​", "url": "https://www.romhacking.net/hacks/8885/"}, {"title": "Wario Land 4 Jungle Rumble!​", "url": "https://www.romhacking.net/hacks/8027/"}, {"title": "Goodboy Galaxy Emulator Rumble Patch​", "url": "https://goodboygalaxy.com/wiki/doku.php?id=rumble"}, {"title": "A More Modern Amazing Mirror​", "url": "https://www.romhacking.net/hacks/8287/"}, {"title": "A More Modern Amazing Mirror with Coloured Outlines​", "url": "https://www.romhacking.net/hacks/8204/"}, {"title": "A More Modern Nightmare In Dream Land​", "url": "https://www.romhacking.net/hacks/8289/"}, {"title": "Fire Emblem Sacred Stones Reforged​", "url": "https://feuniverse.us/t/fe8-sacred-stones-reforged-v1-0-4/28486?page=11"}, {"title": "Rhythm Heaven Silver - Gameboy Advance​", "url": "https://github.com/ShaffySwitcher/RhythmHeavenSilver"}, {"title": "SMAS SMB Lost Levels Brick Fix​", "url": "https://www.romhacking.net/hacks/167/"}, {"title": "Super Mario World Mix​", "url": "https://www.smwcentral.net/?p=section&a=details&id=40597"}, {"title": "Yu-Gi-Oh! The Eternal Duelist Soul HACK​", "url": "https://www.romhacking.net/hacks/9299/"}, {"title": "Castlevania Aria of Sorrow Reprise​", "url": "https://www.romhacking.net/hacks/8425/"}, {"title": "Castlevania Aria of Sorrow Definitive Edition​", "url": "https://www.romhacking.net/hacks/8805/"}, {"title": "Contra Hard Corps Hit Points Restoration Hack​", "url": "https://www.romhacking.net/hacks/797/"}, {"title": "Super Luigi RPG Star Powered​", "url": "https://will319.itch.io/super-luigi-rpg-star-powered"}, {"title": "Super Metroid Arcade​", "url": "https://metroidconstruction.com/hack.php?id=357"}, {"title": "Zelda II Amida's Curse​", "url": "https://www.romhacking.net/hacks/6292/"}, {"title": "Zelda II Resurrection of Ganon​", "url": "https://retrohackers.net/hack-details.php?id=5656/"}, {"title": "Super Mario Kart Horizons​", "url": "https://www.romhacking.net/hacks/8639/"}, {"title": "The Legend of Zelda Allhallows Eve​", "url": "https://www.romhacking.net/hacks/8239/"}, {"title": "Legend of the Mana Sword​", "url": "https://www.romhacking.net/hacks/6550/"}, {"title": "Close Combat: First to Fight​", "url": "https://www.myabandonware.com/game/close-combat-first-to-fight-dj8"}, {"title": "The Legend of Zelda Spirit Tracks D-Pad Controls​", "url": "https://www.romhacking.net/hacks/2235/"}, {"title": "WWF Raw​", "url": "https://www.myabandonware.com/game/wwf-raw-e6z"}, {"title": "The Legend of Zelda Phantom Hourglass D-Pad Patch​", "url": "https://www.romhacking.net/hacks/2248/"}, {"title": "Turok: Evolution​", "url": "https://www.myabandonware.com/game/turok-evolution-amg"}, {"title": "ParaWorld​", "url": "https://www.myabandonware.com/game/paraworld-f3y"}, {"title": "Dreamcast Image Builder For Modding Patching Dreamcast Games​", "url": "https://gitlab.com/PiKeyAr/dreamcast-image-builder/"}, {"title": "Dreamcast Image Builder Mods​", "url": "https://github.com/X-Hax/dreamcast-mods"}, {"title": "WoWee World Of Warcraft Engine Experiment​", "url": "https://github.com/Kelsidavis/WoWee"}, {"title": "Mystical Ninja Starring Goemon Recompilation Mods​", "url": "https://github.com/klorfmorf/MNSGRecompRedubMod/releases/tag/1.0.0"}, {"title": "Harry Potter and the Deathly Hallows: Part 1​", "url": "https://www.myabandonware.com/game/harry-potter-and-the-deathly-hallows-part-1-f6c"}, {"title": "Shaun White Skateboarding​", "url": "https://www.myabandonware.com/game/shaun-white-skateboarding-wra"}, {"title": "Sol Survivor​", "url": "https://www.myabandonware.com/game/sol-survivor-xpy"}, {"title": "Tom Clancy's H.A.W.X 2​", "url": "https://www.myabandonware.com/game/tom-clancy-s-h-a-w-x-2-n5j"}, {"title": "WRC FIA World Rally Championship​", "url": "https://www.myabandonware.com/game/wrc-fia-world-rally-championship-t59"}, {"title": "Harry Potter and the Deathly Hallows: Part 2​", "url": "https://www.myabandonware.com/game/harry-potter-and-the-deathly-hallows-part-2-f6d"}, {"title": "Jurassic Park: The Game​", "url": "https://www.myabandonware.com/game/jurassic-park-the-game-yfz"}, {"title": "Virtua Tennis 4​", "url": "https://www.myabandonware.com/game/virtua-tennis-4-r0g"}, {"title": "Farming Simulator 2009​", "url": "https://www.myabandonware.com/game/farming-simulator-2009-re1"}, {"title": "Heroes Over Europe​", "url": "https://www.myabandonware.com/game/heroes-over-europe-qml"}, {"title": "Super Junkoid DX​", "url": "https://www.romhacking.net/hacks/8109/"}, {"title": "Yoshi's Island - No Crying, Improved SFX and Red Coins​", "url": "https://www.romhacking.net/hacks/3945/"}, {"title": "Hyper Metroid​", "url": "https://www.romhacking.net/hacks/3038/"}, {"title": "Super Metroid Project Base​", "url": "https://www.romhacking.net/hacks/2767/"}, {"title": "Super Metroid: Subversion​", "url": "https://metroidconstruction.com/hack.php?id=716"}, {"title": "Super Ghouls N Ghosts - Restoration and Super Arthur​", "url": "https://kainetertainment.home.blog/2022/11/09/super-gng-hacks/"}, {"title": "The Legend of Zelda: Ancient Dungeon​", "url": "https://www.romhacking.net/hacks/7358/"}, {"title": "Terminator: Salvation​", "url": "https://www.myabandonware.com/game/terminator-salvation-lkf"}, {"title": "The Warriors: Street Brawl​", "url": "https://www.myabandonware.com/game/the-warriors-street-brawl-f1w"}, {"title": "Tom Clancy's H.A.W.X​", "url": "https://www.myabandonware.com/game/tom-clancy-s-h-a-w-x-jte"}, {"title": "Motocross Madness​", "url": "https://archive.org/details/motocross-madness-repack-v-2"}, {"title": "Motocross Madness 2​", "url": "https://archive.org/details/motocross-madness-2-repack-v-2"}, {"title": "Rockman EXE Phantom of Network PC Port​", "url": "https://github.com/StraDaMa/PoN_PC"}, {"title": "Pariah​", "url": "https://www.myabandonware.com/game/pariah-enq"}, {"title": "Onimusha 3: Demon Siege​", "url": "https://www.myabandonware.com/game/onimusha-3-demon-siege-bhb"}, {"title": "Gunners Heart​", "url": "https://www.myabandonware.com/game/gunners-heart-lbu"}, {"title": "Dynasty Warriors 5​", "url": "https://www.myabandonware.com/game/dynasty-warriors-5-special-cnf"}, {"title": "Dynasty Warriors 4​", "url": "https://www.myabandonware.com/game/dynasty-warriors-4-l4c"}, {"title": "Driv3r​", "url": "https://www.myabandonware.com/game/driv3r-eq2"}, {"title": "Conflict: Global Terror​", "url": "https://archive.org/details/conflict-global-terror-repack"}, {"title": "True Crime: New York City​", "url": "https://www.myabandonware.com/game/true-crime-new-york-city-e37"}, {"title": "Sonic Riders​", "url": "https://www.myabandonware.com/game/sonic-riders-cng"}, {"title": "Micro Machines V4​", "url": "https://www.myabandonware.com/game/micro-machines-v4-dze"}, {"title": "Blazing Angels: Squadrons of WWII​", "url": "https://archive.org/details/blazing-angels-squadrons-of-wwii-repack"}, {"title": "Bionicle Heroes​", "url": "https://www.myabandonware.com/game/bionicle-heroes-cnb"}, {"title": "Billy Hatcher and the Giant Egg​", "url": "https://www.myabandonware.com/game/billy-hatcher-and-the-giant-egg-cnk"}, {"title": "Universe at War: Earth Assault​", "url": "https://www.myabandonware.com/game/universe-at-war-earth-assault-f3x"}, {"title": "Mercenary-X: Sky Striker​", "url": "https://www.myabandonware.com/game/soeldner-x-himmelsstuermer-limited-edition-lq6"}, {"title": "Phantasy Star Universe: Ambition of the Illuminus​", "url": "https://www.myabandonware.com/game/phantasy-star-universe-ambition-of-the-illuminus-co5"}, {"title": "Infernal​", "url": "https://www.myabandonware.com/game/infernal-cki"}, {"title": "Enemy Territory: Quake Wars​", "url": "https://www.myabandonware.com/game/enemy-territory-quake-wars-ixd"}, {"title": "BlackSite: Area 51​", "url": "https://www.myabandonware.com/game/blacksite-area-51-e2g"}, {"title": "Assault Heroes​", "url": "https://www.myabandonware.com/game/assault-heroes-ioq"}, {"title": "A Farewell to Dragons​", "url": "https://www.myabandonware.com/game/a-farewell-to-dragons-nh7"}, {"title": "Zoo Tycoon 2: Ultimate Collection​", "url": "https://www.myabandonware.com/game/zoo-tycoon-2-ultimate-collection-tal"}, {"title": "Turning Point: Fall of Liberty​", "url": "https://www.myabandonware.com/game/turning-point-fall-of-liberty-mmx"}, {"title": "The Incredible Hulk​", "url": "https://www.myabandonware.com/game/the-incredible-hulk-td5"}, {"title": "Shaun White Snowboarding​", "url": "https://www.myabandonware.com/game/shaun-white-snowboarding-vs3"}, {"title": "Samurai Warriors 2​", "url": "https://www.myabandonware.com/game/samurai-warriors-2-gyg"}, {"title": "Rayman: Raving Rabbids 2​", "url": "https://www.myabandonware.com/game/rayman-raving-rabbids-2-fm0"}, {"title": "Kung Fu Panda​", "url": "https://www.myabandonware.com/game/kung-fu-panda-nr2"}, {"title": "Dynasty Warriors 6​", "url": "https://www.myabandonware.com/game/dynasty-warriors-6-ixg"}, {"title": "Lotus Challenge​", "url": "https://archive.org/details/lotus-challenge-win-7-to-11-compat"}, {"title": "South Park - Chef's Luv Shack​", "url": "https://archive.org/details/south-park-chefs-luv-shack-win-7-to-11-compat"}, {"title": "Frogger Returns​", "url": "https://archive.org/details/frogger-returns-win-7-to-11-compatible-a-wb-installer"}, {"title": "Flash Traffic - City Of Angels​", "url": "https://archive.org/details/flash_traffic_-_city_of_angels_windows_10_compatible"}, {"title": "Jimmy White's Cueball World​", "url": "https://archive.org/details/jimmy-whites-cueball-world-windows-10-compatible"}, {"title": "Crazy Cars III​", "url": "https://archive.org/details/CrazyCarsIIIInstaller"}, {"title": "Bloodwings - Pumpkinhead's Revenge​", "url": "https://archive.org/details/bloodwings-pumpkinheads-revenge-7-to-11-compat"}, {"title": "Pirates! Gold​", "url": "https://archive.org/details/piratesgoldwindows10compatible"}, {"title": "Grand Prix 500 2​", "url": "https://archive.org/details/grand-prix-500-2-win-7-11-compatible"}, {"title": "DreamWeb​", "url": "https://archive.org/details/DreamWebCDVersionInstallerWin10"}, {"title": "PGA Tour Golf 486​", "url": "https://archive.org/details/pga-tour-golf-486-windows-10-compatible"}, {"title": "Mad Dog II The Lost Gold​", "url": "https://archive.org/details/MadDogIITheLostGold_201905"}, {"title": "Who Shot Johnny Rock?​", "url": "https://archive.org/details/WhoShotJohnnyRockWindows10Compatible"}, {"title": "Secret Mission​", "url": "https://archive.org/details/secretmissionwindows10silentinstallerbywhitebob"}, {"title": "Paperboy 2​", "url": "https://archive.org/details/paperboy-2-win-7-11-compatible-installer"}, {"title": "Monkey Island 2 - LeChuck's Revenge Ultimate Talkie DOS Edition​", "url": "https://archive.org/details/monkey-island-2-lechucks-revenge-ultimate-talkie-dos-edition-win-7-to-11-compat"}, {"title": "Jimmy White's 2 - Cueball​", "url": "https://archive.org/details/jimmy-whites-2-cueball-windows-10-compatible"}, {"title": "International Sensible Soccer​", "url": "https://archive.org/details/InternationalSensibleSoccerSetup"}, {"title": "Hell - A Cyberpunk Thriller​", "url": "https://archive.org/details/HellACyberpunkThrillerWindows10"}, {"title": "Championship Manager 97-98 with 18-19 UpdateMod​", "url": "https://archive.org/details/ChampionshipManager97-98-18-19_Mod"}, {"title": "Speedball 2 - Brutal Deluxe​", "url": "https://archive.org/details/Speedball2BrutalDeluxeInstallerWindows10Compatible"}, {"title": "Cool Spot​", "url": "https://archive.org/details/cool-spot-windows-10-compatible"}, {"title": "Time Gal​", "url": "https://archive.org/details/time-gal-win-7-to-11-compatible"}, {"title": "Project-X Special Edition '93​", "url": "https://archive.org/details/project-x-special-edition-93-amiga-version-windows-10-compatible"}, {"title": "Ghostly Desires​", "url": "https://archive.org/details/GhostlyDesiresWindows10"}, {"title": "Monopoly Casino​", "url": "https://archive.org/details/monopoly_casino_windows_10_compatible"}, {"title": "Ripper​", "url": "https://archive.org/details/RipperWindows10Compatible"}, {"title": "Wolfpack​", "url": "https://archive.org/details/wolfpack-gold-edition-cd-rom-windows-7-11-compat"}, {"title": "Lotus - The Ultimate Challenge​", "url": "https://archive.org/details/LotusTheUltimateChallengeInstaller"}, {"title": "Beavis & Butt-Head Mini Games​", "url": "https://archive.org/details/BeavisButt-HeadMiniGamesForWindows10Compatible"}, {"title": "Worms - The Director's Cut​", "url": "https://archive.org/details/wormsthedirectorscutwindows10compatible"}, {"title": "Star Wars Chess​", "url": "https://archive.org/details/star-wars-chess-win-7-11-compatible"}, {"title": "Voyeur II - Watching Is Not Enough​", "url": "https://archive.org/details/VoyeurIIWindows10Compatible"}, {"title": "Space Invaders​", "url": "https://archive.org/details/SpaceInvadersWindows10Compatible"}, {"title": "Star Wars Episode I - Battle For Naboo​", "url": "https://archive.org/details/star-wars-episode-i-battle-for-naboo-windows-7-11-compat"}, {"title": "Night Trap​", "url": "https://archive.org/details/NightTrapDirectorsCut"}, {"title": "Mad Dog McCree​", "url": "https://archive.org/details/MadDogMcCree"}, {"title": "Harvester​", "url": "https://archive.org/details/harvester-windows-10-compat"}, {"title": "Crash Time III​", "url": "https://archive.org/details/crashtimeiii3Windows10Compatible"}, {"title": "Worms Remastered​", "url": "https://archive.org/details/worms-remastered-win-7-11-compat-a-white-bob-installer"}, {"title": "Star Wars - Force Commander​", "url": "https://archive.org/details/star-wars-force-commander-windows-10-compatible"}, {"title": "The Secret Of Monkey Island 1 & 2 - Original Versions With Speech Mod​", "url": "https://archive.org/details/MONKEYISLAND_201903"}, {"title": "Crash Time 4 - The Syndicate​", "url": "https://archive.org/details/crashtime4thesyndicateinstalleWindows10Compatible"}, {"title": "Star Wars Trilogy Arcade​", "url": "https://archive.org/details/star-wars-trilogy-arcade-win-7-11-compatible-installer"}, {"title": "Hooligans - Storm Over Europe​", "url": "https://archive.org/details/HooligansStormOverEuropeWindows10Compatible"}, {"title": "007 - Nightfire​", "url": "https://archive.org/details/007NightfireWindows10Compatible"}, {"title": "OutRun 2006 - Coast 2 Coast​", "url": "https://archive.org/details/OutRun2006Coast2CoastSetupWindows10"}, {"title": "Call Of Duty GOY Edition​", "url": "https://archive.org/details/CallOfDutyGOYEditionWindows10Compatible"}, {"title": "Gore: Ultimate Soldier​", "url": "https://www.old-games.com/download/9162/gore-ultimate-soldier"}, {"title": "Global Operations​", "url": "https://oldgamesdownload.com/global-operations/"}, {"title": "The Wheel Of Time​", "url": "https://archive.org/details/TheWheelOfTime-ZombsLair"}, {"title": "The Day The World Broke​", "url": "https://archive.org/details/TheDayTheWorldBroke-ZombsLair"}, {"title": "The Dark Eye​", "url": "https://archive.org/details/TheDarkEye-ZombsLair"}, {"title": "Take No Prisoners​", "url": "https://archive.org/details/TakeNoPrisoners-ZombsLair"}, {"title": "Synnergist​", "url": "https://archive.org/details/Synnergist-ZombsLair"}, {"title": "Stratosphere: Conquest of the Skies​", "url": "https://archive.org/details/Stratosphere-ZombsLair"}, {"title": "Star Trek: The Next Generation - A Final Unity​", "url": "https://archive.org/details/StarTrekTheNextGenerationAFinalUnity-ZombsLair"}, {"title": "Spaceship Warlock​", "url": "https://archive.org/details/SpaceshipWarlock-ZombsLair"}, {"title": "Shadow Of The Beast Collection​", "url": "https://archive.org/details/ShadowOfTheBeastCollection-ZombsLair"}, {"title": "Perihelion: The Prophecy​", "url": "https://archive.org/details/PerihelionTheProphecy-ZombsLair"}, {"title": "Alien Legacy​", "url": "https://archive.org/details/AlienLegacy-ZombsLair"}, {"title": "Nightlong: Union City Conspiracy​", "url": "https://archive.org/details/Nightlong-ZombsLair/Nightlong%20-%20Cover.jpg"}, {"title": "Mummy: Tomb Of The Pharaoh​", "url": "https://archive.org/details/MummyTombOfThePharaoh-ZombsLair"}, {"title": "Master of Dimensions​", "url": "https://archive.org/details/MasterOfDimensions-ZombsLair"}, {"title": "Martian Gothic: Unification​", "url": "https://archive.org/details/MartianGothic-ZombsLair"}, {"title": "Lifeforce Tenka​", "url": "https://archive.org/details/LifeforceTenka-ZombsLair"}, {"title": "Iron Assault​", "url": "https://archive.org/details/IronAssault-ZombsLair"}, {"title": "Gunman Chronicles​", "url": "https://archive.org/details/GunmanChronicles-ZombsLair"}, {"title": "Gothos​", "url": "https://archive.org/details/Gothos-ZombsLair"}, {"title": "Gadget Collection​", "url": "https://archive.org/details/GadgetCollection-ZombsLair"}, {"title": "Future Cop: LAPD​", "url": "https://archive.org/details/FutureCopLAPD-ZombsLair"}, {"title": "Frankenstein: Through the Eyes of the Monster​", "url": "https://archive.org/details/FrankensteinThroughTheEyesOfTheMonster-ZombsLair"}, {"title": "Faust: Seven Games of the Soul​", "url": "https://archive.org/details/Faust-ZombsLair"}, {"title": "Evil Dead: Hail To The King​", "url": "https://archive.org/details/EvilDeadHailToTheKing-ZombsLair"}, {"title": "Elvira Collection​", "url": "https://archive.org/details/ElviraCollection-ZombsLair"}, {"title": "Drowned God​", "url": "https://archive.org/details/DrownedGod-ZombsLair"}, {"title": "Death Gate​", "url": "https://archive.org/details/DeathGate-ZombsLair"}, {"title": "Daughter Of Serpents​", "url": "https://archive.org/details/DaughterOfSerpents-ZombsLair"}, {"title": "Companions Of Xanth​", "url": "https://archive.org/details/CompanionsOfXanth-ZombsLair"}, {"title": "Commander Blood​", "url": "https://archive.org/details/CommanderBlood-ZombsLair"}, {"title": "Biosys​", "url": "https://archive.org/details/Biosys-ZombsLair"}, {"title": "Black Dahlia​", "url": "https://archive.org/details/BlackDahlia-ZombsLair"}, {"title": "Burn: Cycle​", "url": "https://archive.org/details/BurnCycle-ZombsLair"}, {"title": "Blue Heat​", "url": "https://archive.org/details/BlueHeat-ZombsLair"}, {"title": "Abomination: The Nemesis Project​", "url": "https://archive.org/details/Abomination-ZombsLair"}, {"title": "Nightmare Creatures​", "url": "https://archive.org/details/NightmareCreatures-ZombsLair"}, {"title": "Pro Evolution Soccer Collection​", "url": "https://archive.org/details/pro-evolution-soccer-collection"}, {"title": "F1 2014​", "url": "https://archive.org/details/f-1-2014_202512"}, {"title": "007 Legends​", "url": "https://archive.org/details/007-legends"}, {"title": "FIFA 17 Super Deluxe Edition​", "url": "https://archive.org/details/fifa-17-super-deluxe-edition"}, {"title": "FIFA 15​", "url": "https://archive.org/details/fifa-15-1.4.0.0-v-3"}, {"title": "FIFA 08​", "url": "https://archive.org/details/fifa-08-el-amigos"}, {"title": "FIFA 13​", "url": "https://archive.org/details/fifa-13-v-1.7-12.02.2013"}, {"title": "FIFA 12 + Euro 2012​", "url": "https://archive.org/details/euro-2012-video-game"}, {"title": "FIFA 11​", "url": "https://archive.org/details/fifa-11-full-reloaded-pc-game-setup-torrent"}, {"title": "Wings Of Glory", "url": "https://archive.org/details/wings-of-glory-mr-abandonware"}, {"title": "Vengeance Of Excalibur", "url": "https://archive.org/details/vengeance-of-excalibur-mr-abandonware"}, {"title": "Twilight 2000", "url": "https://archive.org/details/twilight-2000-mr-abandonware"}, {"title": "Touche: The Adventures Of The Fifth Musketeer", "url": "https://archive.org/details/touche-the-adventures-of-the-fifth-musketeer-mr-abandonware"}, {"title": "Total Distortion", "url": "https://archive.org/details/total-distortion-1-mr-abandonware"}, {"title": "Tom Clancy's SSN", "url": "https://archive.org/details/tom-clancys-ssn-mr-abandonware_202208"}, {"title": "Times Of Lore", "url": "https://archive.org/details/times-of-lore-mr-abandonware"}, {"title": "Their Finest Hour: The Battle of Britain - Complete", "url": "https://archive.org/details/their-finest-hour-mr-abandonware"}, {"title": "The Terminator: SkyNET", "url": "https://archive.org/details/the-terminator-skynet-mr-abandonware"}, {"title": "The Terminator: Future Shock", "url": "https://archive.org/details/the-terminator-future-shock-mr-abandonware"}, {"title": "The Terminator 2029: Deluxe CD Edition", "url": "https://archive.org/details/the-terminator-2029-deluxe-cd-edition-mr-abandonware"}, {"title": "The Scroll", "url": "https://archive.org/details/the-scroll-mr-abandonware"}, {"title": "The Orion Conspiracy", "url": "https://archive.org/details/the-orion-conspiracy-mr-abandonware"}, {"title": "The Lost Vikings", "url": "https://archive.org/details/the-lost-vikings-mr-abandonware"}, {"title": "The Lost Files Of Sherlock Holmes: The Case Of The Serrated Scalpel", "url": "https://archive.org/details/the-lost-files-of-sherlock-holmes-the-case-of-the-serrated-scalpel-mr-abandonware"}, {"title": "The Lost Files Of Sherlock Holmes: The Case Of The Rose Tattoo", "url": "https://archive.org/details/the-lost-files-of-sherlock-holmes-the-case-of-the-rose-tattoo-mr-abandonware"}, {"title": "The Gene Machine", "url": "https://archive.org/details/the-gene-machine-mr-abandonware"}, {"title": "The Daedalus Encounter", "url": "https://archive.org/details/the-daedalus-encounter-mr-abandonware"}, {"title": "The Clue!", "url": "https://archive.org/details/the-clue-mr-abandonware"}, {"title": "Spirit Of Excalibur", "url": "https://archive.org/details/spirit-of-excalibur-mr-abandonware"}, {"title": "Space Hulk", "url": "https://archive.org/details/space-hulk-mr-abandonware"}, {"title": "Silent Hunter: Commander's Edition", "url": "https://archive.org/details/silent-hunter-mr-abandonware"}, {"title": "Secret Weapons Of The Luftwaffe - Complete", "url": "https://archive.org/details/secret-weapons-of-the-luftwaffe-mr-abandonware"}, {"title": "Seal Team", "url": "https://archive.org/details/seal-team-mr-abandonware"}, {"title": "Ringworld: Revenge Of The Patriarch", "url": "https://archive.org/details/ringworld-revenge-of-the-patriarch-mr-abandonware"}, {"title": "Return To Ringworld", "url": "https://archive.org/details/return-to-ringworld-mr-abandonware"}, {"title": "Reach for the Skies", "url": "https://archive.org/details/reach-for-the-skies-mr-abandonware"}, {"title": "Rama", "url": "https://archive.org/details/rama-mr-abandonware"}, {"title": "Private Eye", "url": "https://archive.org/details/private-eye-1-mr-abandonware"}, {"title": "Premier Manager 3", "url": "https://archive.org/details/premier-manager-3-mr-abandonware"}, {"title": "Plan 9 From Outer Space", "url": "https://archive.org/details/plan-9-from-outer-space-mr-abandonware"}, {"title": "Pacific Strike - Complete", "url": "https://archive.org/details/pacific-strike-mr-abandonware"}, {"title": "Operation Stealth - James Bond 007: The Stealth Affair", "url": "https://archive.org/details/operation-stealth-mr-abandonware"}, {"title": "Oh No! More Lemmings", "url": "https://archive.org/details/oh-no-more-lemmings-mr-abandonware"}, {"title": "Noir: A Shadowy Thriller", "url": "https://archive.org/details/noir-a-shadowy-thriller-mr-abandonware"}, {"title": "Neuromancer", "url": "https://archive.org/details/neuromancer-mr-abandonware"}, {"title": "NASCAR Racing 2", "url": "https://archive.org/details/nascar-racing-2-mr-abandonware"}, {"title": "NASCAR Racing", "url": "https://archive.org/details/nascar-racing-mr-abandonware_202207"}, {"title": "Jungle Strike", "url": "https://archive.org/details/jungle-strike-mr-abandonware"}, {"title": "Midwinter II: Flames Of Freedom", "url": "https://archive.org/details/midwinter-ii-flames-of-freedom-mr-abandonware"}, {"title": "Midwinter", "url": "https://archive.org/details/midwinter-mr-abandonware"}, {"title": "Microsoft Flight Simulator v5.1 - Complete", "url": "https://archive.org/details/microsoft-flight-simulator-v-5-1-mr-abandonware"}, {"title": "Metaltech Earthsiege - Complete", "url": "https://archive.org/details/metaltech-earthsiege-complete-mr-abandonware"}, {"title": "MechWarrior 2: Mercenaries", "url": "https://archive.org/details/mechwarrior-2-mercenaries-mr-abandonware"}, {"title": "MechWarrior 2: Ghost Bear's Legacy", "url": "https://archive.org/details/mech-warrior-2-ghost-bears-legacy-mr-abandonware"}, {"title": "MechWarrior 2: 31st Century Combat", "url": "https://archive.org/details/mech-warrior-2-mr-abandonware"}, {"title": "MechWarrior", "url": "https://archive.org/details/mech-warrior-mr-abandonware"}, {"title": "Lost In Time", "url": "https://archive.org/details/lost-in-time-mr-abandonware"}, {"title": "Lemmings 2: The Tribes", "url": "https://archive.org/details/lemmings-2-mr-abandonware"}, {"title": "Lemmings", "url": "https://archive.org/details/lemmings-mr-abandonware"}, {"title": "KGB - Conspiracy", "url": "https://archive.org/details/kgb-conspiracy-mr-abandonware"}, {"title": "Journey: The Quest Begins", "url": "https://archive.org/details/journey-the-quest-begins-mr-abandonware"}, {"title": "Jane's Combat Simulations: Longbow - Gold", "url": "https://archive.org/details/jcs-longbow-gold-mr-abandonware"}, {"title": "J.R.R. Tolkien's The Lord of the Rings Vol. II", "url": "https://archive.org/details/lord-of-the-rings-volume-2-mr-abandonware"}, {"title": "J.R.R. Tolkien's The Lord of the Rings Vol. I", "url": "https://archive.org/details/lord-of-the-rings-volume-1-mr-abandonware"}, {"title": "Burnout 2 - Point of Impact", "url": "https://drive.google.com/drive/folders/1Mmmn8SDJpXTMhsulMMcmPwlNwZXOlDGc"}, {"title": "Burnout 3 - Takedown", "url": "https://drive.google.com/drive/folders/1WJqEH3WGSPDOp3MaHPs99iTb03OjU5X-"}, {"title": "Innocent Until Caught 2: Presumed Guilty", "url": "https://archive.org/details/innocent-until-caught-2-presumed-guilty-mr-abandonware"}, {"title": "Innocent Until Caught", "url": "https://archive.org/details/innocent-until-caught-mr-abandonware"}, {"title": "IndyCar Racing II", "url": "https://archive.org/details/indycar-racing-2-mr-abandonware"}, {"title": "IndyCar Racing - Complete", "url": "https://archive.org/details/indy-car-racing-mr-abandonware"}, {"title": "Inca II: Nations of Immortality", "url": "https://archive.org/details/inca-2-mr-abandonware"}, {"title": "Inca", "url": "https://archive.org/details/inca-mr-abandonware"}, {"title": "Hopkins FBI", "url": "https://archive.org/details/hopkins-fbi-mr-abandonware"}, {"title": "Ghosts", "url": "https://archive.org/details/ghosts-1-mr-abandonware"}, {"title": "Geisha", "url": "https://archive.org/details/geisha-mr-abandonware"}, {"title": "Future Wars: Adventures In Time", "url": "https://archive.org/details/future-wars-mr-abandonware"}, {"title": "Fascination", "url": "https://archive.org/details/fascination-mr-abandonware"}, {"title": "Fade To Black", "url": "https://archive.org/details/fade-to-black-mr-abandonware"}, {"title": "Fable", "url": "https://archive.org/details/fable-mr-abandonware"}, {"title": "Athens 2004", "url": "https://archive.org/details/athens-2004-repack"}, {"title": "Ecstatica II", "url": "https://archive.org/details/ecstatica-ii-mr-abandonware"}, {"title": "Ecstatica", "url": "https://archive.org/details/ecstatica-mr-abandonware"}, {"title": "Dungeon Master II: The Legend of Skullkeep", "url": "https://archive.org/details/dungeon-master-ii-mr-abandonware"}, {"title": "Dungeon Master", "url": "https://archive.org/details/dungeon-master-mr-abandonware"}, {"title": "Dune II: The Battle for Arrakis", "url": "https://archive.org/details/dune-2-mr-abandonware"}, {"title": "Dune 2000", "url": "https://archive.org/details/dune-2000-mr-abandonware"}, {"title": "Dune", "url": "https://archive.org/details/dune-mr-abandonware"}, {"title": "Druid: Daemons Of The Mind", "url": "https://archive.org/details/druid-daemons-of-the-mind-mr-abandonware"}, {"title": "Dreamweb", "url": "https://archive.org/details/dreamweb-mr-abandonware"}, {"title": "Discworld II: Missing Presumed!?", "url": "https://archive.org/details/discworld-2-mr-abandonware"}, {"title": "Discworld", "url": "https://archive.org/details/discworld-mr-abandonware"}, {"title": "Destruction Derby", "url": "https://archive.org/details/destruction-derby-mr-abandonware"}, {"title": "Desert Strike: Return to the Gulf", "url": "https://archive.org/details/desert-strike-mr-abandonware"}, {"title": "Dark Seed II", "url": "https://archive.org/details/dark-seed-ii-mr-abandonware"}, {"title": "Dark Seed", "url": "https://archive.org/details/dark-seed-mr-abandonware"}, {"title": "Conan: The Cimmerian", "url": "https://archive.org/details/conan-the-cimmerian-mr-abandonware"}, {"title": "Circuit's Edge", "url": "https://archive.org/details/circuits-edge-mr-abandonware"}, {"title": "Chuck Yeager's Air Combat", "url": "https://archive.org/details/chuck-yeagers-air-combat-mr-abandonware"}, {"title": "Buck Rogers: Matrix Cubed", "url": "https://archive.org/details/buck-rogers-matrix-cubed-mr-abandonware"}, {"title": "Buck Rogers: Countdown To Doomsday", "url": "https://archive.org/details/buck-rogers-countdown-to-doomsday-mr-abandonware"}, {"title": "Beavis And Butt Head In Virtual Stupidity", "url": "https://archive.org/details/beavis-and-butt-head-in-virtual-stupidity-mr-abandonware"}, {"title": "Alien Virus", "url": "https://archive.org/details/alien-virus-mr-abandonware"}, {"title": "Alien Logic", "url": "https://archive.org/details/alien-logic-mr-abandonware"}, {"title": "Aces Over Europe", "url": "https://archive.org/details/aces-over-europe-mr-abandonware"}, {"title": "Aces Of The Pacific - Complete", "url": "https://archive.org/details/aces-of-the-pacific-mr-abandonware"}, {"title": "Aces Of The Deep - Complete", "url": "https://archive.org/details/aces-of-the-deep-mr-abandonware"}, {"title": "A-10 Tank Killer", "url": "https://archive.org/details/a-10-tank-killer-mr-abandonware"}, {"title": "Warcraft III Complete Edition", "url": "https://archive.org/details/warcraft-iii-complete-edition-repack-v-3"}, {"title": "The Sims", "url": "https://archive.org/details/the-sims-complete-edition-repack-v-4"}, {"title": "The Lord Of The Rings The Battle For Middle Earth", "url": "https://archive.org/details/the-lord-of-the-rings-the-battle-for-middle-earth-repack"}, {"title": "The House Of The Dead", "url": "https://archive.org/details/the-house-of-the-dead-repack-v-3"}, {"title": "The House Of The Dead 3", "url": "https://archive.org/details/the-house-of-the-dead-3-repack"}, {"title": "The House Of The Dead 2", "url": "https://archive.org/details/the-house-of-the-dead-2-repack-v-3"}, {"title": "Teenage Mutant Ninja Turtles 2 Battle Nexus", "url": "https://archive.org/details/teenage-mutant-ninja-turtles-2-battle-nexus-repack"}, {"title": "Sydney 2000", "url": "https://archive.org/details/sydney-2000-repack"}, {"title": "StarCraft", "url": "https://archive.org/details/star-craft-repack"}, {"title": "Spiderman The Sinister Six", "url": "https://archive.org/details/spider-man-the-sinister-six-repack"}, {"title": "Spiderman 2 Activity Center", "url": "https://archive.org/details/spider-man-2-activity-center-repack"}, {"title": "SEGA Worldwide Soccer", "url": "https://archive.org/details/sega-worldwide-soccer-pc-repack"}, {"title": "Reservoir Dogs", "url": "https://archive.org/details/reservoir-dogs-repack"}, {"title": "Re-Volt", "url": "https://archive.org/details/re-volt-repack-v-2"}, {"title": "Pac Man All Stars", "url": "https://archive.org/details/pac-man-all-stars-repack"}, {"title": "NBA Live 2004", "url": "https://archive.org/details/nba-live-2004-repack"}, {"title": "Microsoft Train Simulator", "url": "https://archive.org/details/microsoft-train-simulator-repack"}, {"title": "Microsoft Combat Flight Simulator 2 WW II", "url": "https://archive.org/details/microsoft-combat-flight-simulator-2-ww-ii-pacific-theater-repack"}, {"title": "Manx TT Super Bike", "url": "https://archive.org/details/manx-tt-super-bike-repack"}, {"title": "Lotus Challenge", "url": "https://archive.org/details/lotus-challenge-repack"}, {"title": "Age Of Mythology", "url": "https://archive.org/details/age-of-mythology-repack"}, {"title": "FEAR", "url": "https://archive.org/details/fear-repack"}, {"title": "Dave Mirra Freestyle BMX", "url": "https://archive.org/details/dave-mirra-freestyle-bmx-repack"}, {"title": "Cyber Troopers Virtual On", "url": "https://archive.org/details/cyber-troopers-virtual-on-repack"}, {"title": "Crazy Taxi", "url": "https://archive.org/details/crazy-taxi-repack-v-3"}, {"title": "Colin McRae Rally 04", "url": "https://archive.org/details/colin-mc-rae-rally-04-repack"}, {"title": "Blazing Angels 2 - Secret Missions Of WWII", "url": "https://archive.org/details/blazing-angels-2-secret-missions-of-wwii-repack"}, {"title": "Beetle Crazy Cup", "url": "https://archive.org/details/beetle-crazy-cup-repack"}, {"title": "Atlanta 1996", "url": "https://archive.org/details/atlanta-1996-repack"}, {"title": "Secret of Mana: Reborn", "url": "https://romhack.ing/database/content/entry/YtNv5JQBNs8FWu0C14As/secret-of-mana-english-translation"}, {"title": "The Third of the Third - Street Fighter III: 3rd Strike Decompilation", "url": "https://github.com/crowded-street/3sx"}, {"title": "Dragon Ball Z Budokai HD Recompiled", "url": "https://github.com/WistfulHopes/DBZ1"}, {"title": "Blue Dragon Recompilation", "url": "https://github.com/rexglue/reblue"}, {"title": "Pyrite64 - N64 Game-Engine and Editor using libdragon & tiny3d", "url": "https://github.com/HailToDodongo/pyrite64"}, {"title": "Streets of Rage 2: Andore’s Rampage", "url": "https://romhackplaza.org/romhacks/streets-of-rage-2-andores-rampage-genesis/"}, {"title": "Monster Hunter Portable 3rd - PSP", "url": "https://www.youtube.com/watch?v=ucsGdmTjS2M"}, {"title": "What A Mario World!", "url": "https://ralshi.itch.io/what-a-mario-world"}, {"title": "Aurora OS.js", "url": "https://github.com/mental-os/Aurora-OS.js"}, {"title": "Fallout: Vault 666", "url": "https://www.moddb.com/mods/fallout-vault-666/downloads/fallout-vault-666"}, {"title": "IKEMEN", "url": "https://drive.google.com/file/d/1vkpnS3YYhGw5A1ul4kxQtEmlkjEVhhDT/view"}, {"title": "Pasta La Vista Super Mario Bros.", "url": "https://www.smwcentral.net/?p=viewthread&t=131870&page=1&pid=1661675"}, {"title": "Embers of Mana", "url": "https://www.romhacking.net/hacks/9447/"}, {"title": "Star Wars Jedi: Survivor - Camera and Animation Stutter Fix", "url": "https://community.pcgamingwiki.com/files/file/3924-star-wars-jedi-survivor-camera-and-animation-stutter-fix/"}, {"title": "Usurper Reborn", "url": "https://github.com/binary-knight/usurper-reborn"}, {"title": "Valkyria Chronicles 3 - PSP", "url": "https://www.youtube.com/watch?v=Q959IdFo6_g"}, {"title": "Ninja Gaiden II Recompilation", "url": "https://youtu.be/iEXDW2_4ffw?si=9zKyApbJwq75U0R1"}, {"title": "The Wind Waker Rewritten", "url": "https://www.romhacking.net/hacks/7002/"}, {"title": "Pokemon Crossroads", "url": "https://github.com/eonlynx/pokecrossroads"}, {"title": "Tetrominos", "url": "https://github.com/giraffekey/tetermino"}, {"title": "Prize Fighter Heavyweight Edition", "url": "https://archive.org/details/prize-fighter-heavyweight-edition-saturn"}, {"title": "Metal Gear Solid V: The Phantom Pain - Ground Zeroes", "url": "https://www.nexusmods.com/metalgearsolidvtpp/mods/2402"}, {"title": "The Tairyou Jigoku - PS2", "url": "https://romhack.ing/database/content/entry/sHfHRZI6QEKlylE337Gnng/the-tairyou-jigoku-english-translation"}, {"title": "Keitai World Launcher", "url": "https://keitaiarchive.org/"}, {"title": "Duke Nukem Zero Hour Recompilation First Person Mod", "url": "https://dnzh-fps.netlify.app/"}, {"title": "Fallout New Vegas - For A Few Brahmin More", "url": "https://www.nexusmods.com/newvegas/mods/96464"}, {"title": "Bloodborne - HardBorne Overhaul Mod", "url": "https://www.nexusmods.com/bloodborne/mods/462?tab=description"}, {"title": "Cyberpunk 2077 Unofficial DLC 2", "url": "https://www.nexusmods.com/cyberpunk2077/mods/22745"}, {"title": "Castlevania Order of Shadows Golden Belmont", "url": "https://elvies.itch.io/castlevania-order-of-shadows-gbc"}, {"title": "NX-Optimizer", "url": "https://www.nxoptimizer.com/"}, {"title": "Forza Motorsport 2", "url": "https://1fichier.com/?1dhd3mekh0837olx6yot"}, {"title": "Forza Motorsport 3", "url": "https://1fichier.com/?1viocrz3hdst8ly3owns"}, {"title": "Forza Motorsport 4", "url": "https://1fichier.com/?q5vvq6l5hs1pg82acj3g"}, {"title": "Forza Horizon", "url": "https://1fichier.com/?hr37ifchtddf8khxdbsx"}, {"title": "Forza Horizon 2", "url": "https://1fichier.com/?9o8go8y8d0tv9vbibal3"}, {"title": "Forza Horizon 2 Presents Fast And Furious", "url": "https://1fichier.com/?8w5n2wg4h902r260o6ek"}, {"title": "Forza Horizon 3", "url": "https://1fichier.com/?mzlp40gh9oyna4h4dvd3"}, {"title": "Forza Motorsport 7", "url": "https://1fichier.com/?g4qsvikj1n17hicmob9g"}, {"title": "ReadyM", "url": "https://www.ready.mp/"}, {"title": "A Super Mario World", "url": "https://www.smwcentral.net/?p=viewthread&t=131734"}, {"title": "Legend of Mana Decompilation", "url": "https://github.com/celophi/lom-decomp"}, {"title": "Silent Hill 3 Decompilation", "url": "https://github.com/dreamingmoths/memory-of-alessa"}, {"title": "Chrono Cross Decompilation", "url": "https://github.com/jdperos/chrono-cross-decomp"}, {"title": "Crash Tag Team Racing Gamecube Decompilation", "url": "https://github.com/bluisblu/cttr"}, {"title": "Kirby's Dream Collection Decompilation", "url": "https://github.com/Swiftshine/kdc"}, {"title": "Dog's Life Decompilation", "url": "https://github.com/IWILLCRAFT-M0d/dogcomp"}, {"title": "Halo Reach Decompilation", "url": "https://github.com/ChimpsAtSea/Reach"}, {"title": "Pokemon XD: Gale of Darkness Decompilation", "url": "https://github.com/TeamOrre/xd-decomp"}, {"title": "The Legend of Zelda: Ocarina Of Time Dreamcast Port", "url": "https://youtu.be/j2JTcDY9LI4?si=DJCiIOeU5CAbjZ4w"}, {"title": "Resident Evil Requiem - Xenomorph Mod", "url": "https://www.nexusmods.com/residentevilrequiem/mods/510?tab=description"}, {"title": "Star Wars: First Assault", "url": "https://discord.com/invite/XqQ6Je4muy"}, {"title": "Celeste Classic Sega Saturn Port", "url": "https://en83.itch.io/celeste-classic-for-sega-saturn"}, {"title": "Rise Of The Tomb Raider HD 4K 8K Texture Collection", "url": "https://www.nexusmods.com/riseofthetombraider/mods/214?tab=description"}, {"title": "Perfect Dark PC Port - Friends of Joanna 4-Player Counter + Co-Operative Mod", "url": "https://cylonicboom.itch.io/friends-of-joanna"}, {"title": "Pokemon Aether White 2", "url": "https://youtu.be/SEDNNMH2DSk?si=IZFkSKdYzYMq0YhK"}, {"title": "Bugdom", "url": "https://github.com/jorio/Bugdom?tab=readme-ov-file"}, {"title": "Bugdom 2", "url": "https://github.com/jorio/Bugdom2"}, {"title": "Billy Frontier", "url": "https://github.com/jorio/BillyFrontier"}, {"title": "Mighty Mike - Power Pete", "url": "https://github.com/jorio/MightyMike"}, {"title": "Nanosaur", "url": "https://github.com/jorio/Nanosaur"}, {"title": "Nanosaur 2", "url": "https://github.com/jorio/Nanosaur2"}, {"title": "Otto Matic", "url": "https://github.com/jorio/OttoMatic"}, {"title": "Dungeon Keeper In Browser", "url": "https://dk-browser.tiiny.site/"}, {"title": "Multiplayer Mods Mega List", "url": "https://docs.google.com/spreadsheets/d/e/2PACX-1vSV41AswEt3EpzSyd85YRVtoJaIIXWjtBy347dISJg4fs6xSNPqcgfsh76TxX_l-mnT7pjMlSqTW-87/pubhtml"}, {"title": "Breath of Fire Definitive Edition", "url": "https://www.romhacking.net/hacks/7597/"}, {"title": "Breath of Fire II Definitive Edition", "url": "https://www.romhacking.net/hacks/9157/"}, {"title": "Starfield STFI HD Landscape 4K", "url": "https://www.nexusmods.com/starfield/mods/16155?tab=description"}, {"title": "Fallout 4 Padre Mateo - A Quest Mod", "url": "https://www.nexusmods.com/fallout4/mods/101772?tab=description"}, {"title": "Resident Evil Village - High Textures Mod", "url": "https://www.nexusmods.com/residentevilvillage/mods/643?tab=description"}, {"title": "The Witcher 3 Kaer Morhen Extended Edition", "url": "https://www.nexusmods.com/witcher3/mods/11934"}, {"title": "Zombie Panic!", "url": "https://store.steampowered.com/app/3825360/Zombie_Panic/"}, {"title": "Lupin III: The Sage of Pyramid - Sega Saturn", "url": "https://romhack.ing/database/content/entry/XJ5SNtjQSvK5-CLf2YUFeg/lupin-iii-the-sage-of-pyramid-english-translation"}, {"title": "Bubble Buddies", "url": "https://geon3.itch.io/buddies"}, {"title": "Animal Crossing PC Port", "url": "https://github.com/flyngmt/ACGC-PC-Port"}, {"title": "Red Dead Redemption 2 - Blurbs Pokemon RPG", "url": "https://www.nexusmods.com/reddeadredemption2/mods/8332"}, {"title": "Paprium - Online Multiplayer", "url": "https://youtu.be/b4pVjv1u8Hk?si=8rvPGGjV_NCF1J44"}, {"title": "Minecraft - Arnis", "url": "https://arnismc.com/"}, {"title": "Baldur's Gate 3 - Baldur's Gate 1 Remake Demo", "url": "https://www.nexusmods.com/baldursgate3/mods/18315"}, {"title": "Animal Crossing PC Port HD Texture Pack", "url": "https://gamebanana.com/mods/download/406291#FileInfo_875424"}, {"title": "Resident Evil Requiem VR Mod", "url": "https://www.nexusmods.com/residentevilrequiem/mods/1017"}, {"title": "DeckOps", "url": "https://github.com/GalvarinoDev/DeckOps"}, {"title": "Oblivion Remastered CityLord Series The Fight Club", "url": "https://www.nexusmods.com/oblivionremastered/mods/5330"}, {"title": "Oblivion Remastered Battlehorn Castle Expansion", "url": "https://www.nexusmods.com/oblivionremastered/mods/5347"}, {"title": "Klonoa: Empire of Dreams Decompilation", "url": "https://github.com/Dream-Atelier/kl-eod-decomp"}, {"title": "Black & White Decompilation", "url": "https://github.com/openblack/bw1-decomp"}, {"title": "Monster Hunter Portable 2nd G Decompilation", "url": "https://github.com/tclamb/mhp2g-decomp"}, {"title": "New Play Control! Pikmin Decompilation", "url": "https://github.com/projectPiki/pik1wii"}, {"title": "New Play Control! Pikmin 2 Decompilation", "url": "https://github.com/projectPiki/pik2wii"}, {"title": "Tetris Browser Based", "url": "https://mehmetmhy.github.io/tetris/"}, {"title": "Crimson Desert AHK Hotkeys for Jogging Sprint and Esc Menus", "url": "https://www.nexusmods.com/crimsondesert/mods/47"}, {"title": "Bomberman 64 Recompilation", "url": "https://github.com/RevoSucks/BM64Recomp"}, {"title": "MHServerEmu - Marvel Heroes MMO Fan Server", "url": "https://crypto137.github.io/MHServerEmu/blog/2026/03/20/mhserveremu-1-0-0.html"}, {"title": "Heretic II Source Port", "url": "https://github.com/m-x-d/Heretic2R"}, {"title": "RE:Enhance", "url": "https://www.moddb.com/mods/reenhance-re1/news/reenhance-re1-version-20-is-out"}, {"title": "Batman Arkham Origins Advanced Graphics", "url": "https://www.nexusmods.com/batmanarkhamorigins/mods/451?tab=description"}, {"title": "Fire Emblem: Path of Radiance Decompilation", "url": "https://github.com/FE8Dev/FE9-Decomp-Project"}, {"title": "Alone In The Dark Decompilation", "url": "https://github.com/spacefarergames/AloneInTheDarkReHaunted"}, {"title": "Sheep Wolf N Dog Decompilation", "url": "https://github.com/lace22l/sheep-wolf-n-dog-decomp"}, {"title": "The Legend of Zelda: The Wind Waker 4K Texture Pack", "url": "https://www.henrikomagnifico.com/wind-waker-4k"}, {"title": "Friday the 13th Revisited", "url": "https://zeichigames.itch.io/friday-the-13th-revisited-for-gbc"}, {"title": "Blaze and Blade Busters - Playstation", "url": "https://romhack.ing/database/content/entry/CqaRmZaFQNS1JX1zpGFNSQ/blaze-and-blade-busters-english-translation"}, {"title": "Digimon World Decompilation", "url": "https://github.com/jype0/dw_decomp"}, {"title": "The Legend of Zelda: Spirit Tracks Decompilation", "url": "https://github.com/zeldaret/st"}, {"title": "Lego City Undercover Decompilation", "url": "https://github.com/Nintendocustom/Lego-City-Undercover-Decompilation"}, {"title": "Mortal Kombat 2 3DO Port", "url": "https://youtu.be/ciFdfj3D_NA?si=t3tWaHm_CB9mQGzY"}, {"title": "Fallout New Vegas - The Unforgiven REDUX", "url": "https://www.nexusmods.com/newvegas/mods/97105"}, {"title": "40 Winks Gameboy Colour", "url": "https://archive.org/details/40-winks-game-boy-color"}, {"title": "TeknoParrot", "url": "https://teknoparrot.com/wiki/index.html"}, {"title": "Monster Hunter Stories 3 Twisted Reflection HD Texture Pack", "url": "https://www.nexusmods.com/monsterhunterstories3twistedreflection/mods/131?tab=description"}, {"title": "Pilotwings 64 Decompilation", "url": "https://github.com/gcsmith/Pilotwings64Decomp"}, {"title": "RexGlue - Xbox 360 Recompilation Runtime and Toolkit", "url": "https://github.com/rexglue/rexglue-sdk?ref=readonlymemo.com"}, {"title": "Banjo-Kazooie Nuts and Bolts Recompilation", "url": "https://github.com/masterspike52/reNut?ref=readonlymemo.com"}, {"title": "Ninja Gaiden 2 Recompilation", "url": "https://github.com/Mystixor?tab=overview&from=2026-03-01&to=2026-03-31"}, {"title": "Halo 3 Delta Recompilation", "url": "https://github.com/twist84/halo3_cache_release_recomp/?ref=readonlymemo.com"}, {"title": "Viva Pinata: Trouble In Paradise Recompilation", "url": "https://github.com/SolarCookies/TiP-Recomp?ref=readonlymemo.com"}, {"title": "Fallout New Vegas - Retribution REDUX", "url": "https://www.nexusmods.com/newvegas/mods/97155"}, {"title": "Pekka Kana 2", "url": "https://danilolc.itch.io/pekka-kana-2"}, {"title": "TecnoballZ", "url": "https://linux.tlk.fr/games/TecnoballZ/"}, {"title": "H-Craft Championship", "url": "http://www.irrgheist.com/games.htm"}, {"title": "Hero of Allacrost", "url": "https://sourceforge.net/projects/allacrost/"}, {"title": "Valyria Tear", "url": "https://github.com/ValyriaTear"}, {"title": "tenmado", "url": "https://github.com/gondur/tenmado"}, {"title": "Hurrican", "url": "https://github.com/HurricanGame/Hurrican"}, {"title": "The Secret Chronicles of Dr. M.", "url": "https://secretchronicles.org/en/"}, {"title": "Gravity Bone", "url": "https://blendogames.itch.io/gravitybone"}, {"title": "Enigma", "url": "https://github.com/enigma-game/enigma"}, {"title": "Starflight - The Lost Colony", "url": "https://sites.google.com/site/starflighttlc/downloads"}, {"title": "Pocket Palm Heroes", "url": "https://github.com/SerVB/pph"}, {"title": "Transball GL", "url": "https://github.com/santiontanon/transballgl"}, {"title": "Einstein Puzzle", "url": "https://github.com/lksj/einstein-puzzle"}, {"title": "Surge the Rabbit", "url": "https://gamejolt.com/games/surge-the-rabbit/747310"}, {"title": "Q3Rally", "url": "https://www.q3rally.com/"}, {"title": "Open Hexagon", "url": "https://github.com/vittorioromeo/SSVOpenHexagon"}, {"title": "Double Damnation", "url": "https://ddamnation.com/"}, {"title": "Solaris", "url": "https://solaris.games/#/"}, {"title": "Naikari", "url": "https://naikari.github.io/"}, {"title": "OpenSoldat", "url": "https://github.com/opensoldat/opensoldat"}, {"title": "The Powder Toy", "url": "https://powdertoy.co.uk/"}, {"title": "OpenDungeonsPlus", "url": "https://opendungeons.org/"}, {"title": "shapez", "url": "https://github.com/tobspr-games/shapez.io"}, {"title": "Super Mario Bros. Sega Master System Port", "url": "https://www.smspower.org/Homebrew/SuperMarioBrosSmsPort-SMS"}, {"title": "Street Fighter III: 3rd Strike PSP Port", "url": "https://github.com/demmis98/3s-psp"}, {"title": "Adventure on Eos", "url": "https://blackdemeter.com/adventure-on-eos"}, {"title": "Worms Armageddon Open Source Re-implementation", "url": "https://github.com/paavohuhtala/OpenWA"}, {"title": "Yorg", "url": "https://github.com/cflavio/yorg"}, {"title": "Scorched3D", "url": "http://www.scorched3d.co.uk/"}, {"title": "Vega Strike", "url": "https://www.vega-strike.org/"}, {"title": "Liberation Circuit", "url": "https://linleyh.itch.io/liberation-circuit"}, {"title": "Deer Portal", "url": "https://devcarpet.itch.io/deer-portal"}, {"title": "Dust Racing 2D", "url": "https://github.com/juzzlin/DustRacing2D"}, {"title": "Steam Sky", "url": "https://thindil.itch.io/steam-sky"}, {"title": "AstroMenace", "url": "https://viewizard.com/"}, {"title": "World of PADMAN", "url": "https://worldofpadman.net/en/"}, {"title": "Cave Story Sega Megadrive Port", "url": "https://github.com/andwn/cave-story-md"}, {"title": "Ridge Racer Collection with Online Play", "url": "https://youtu.be/eNtb8myubnI?si=iKcoY4kzkVWN64CK"}, {"title": "Silent Hill 2 Decompilation", "url": "https://decomp.dev/dreamingmoths/mirror-of-alessa"}, {"title": "Seen in Liberty City - GTA 3 PSP Remake", "url": "https://barcode-studia.ru/mods/silc/"}, {"title": "Starfield - NeonExpansion", "url": "https://www.nexusmods.com/starfield/mods/16354"}, {"title": "Advanced Strategic Command", "url": "https://www.asc-hq.org/"}, {"title": "CaveExpress", "url": "https://github.com/mgerhardy/caveexpress"}, {"title": "Wyrmsun", "url": "https://andrettin.github.io/"}, {"title": "Shadow Over the Twelve Lands", "url": "https://btco.itch.io/shadow-over-the-twelve-lands"}, {"title": "Bos Wars", "url": "https://www.boswars.org/"}, {"title": "reTux", "url": "https://retux-game.github.io/"}, {"title": "Maelstrom", "url": "https://github.com/libsdl-org/Maelstrom?tab=readme-ov-file"}, {"title": "SDL Scavenger", "url": "https://www.macintoshrepository.org/77329-sdl-scavenger"}, {"title": "SDL Asylum", "url": "https://sdl-asylum.sourceforge.net/main.html"}, {"title": "Noctis IV Plus", "url": "https://github.com/jorisvddonk/Noctis-IV-Plus"}, {"title": "Tony Hawk's Underground", "url": "https://github.com/SwagSoftware/kisak-thug"}, {"title": "OniFoxed", "url": "https://github.com/hogsy/OniFoxed"}, {"title": "Magical Broom Extreme", "url": "https://github.com/M-HT/MagicalBroomExtreme"}, {"title": "HoverRace", "url": "https://github.com/HoverRace/HoverRace?tab=readme-ov-file"}, {"title": "RoadFighter", "url": "https://github.com/codehard123/RoadFighter"}, {"title": "F1-Spirit", "url": "https://github.com/ptitSeb/f1spirit"}, {"title": "Super Methane Brothers", "url": "https://github.com/rombust/Methane"}, {"title": "Gardens of Kadesh", "url": "https://github.com/GardensOfKadesh/Homeworld"}, {"title": "Skyrim Special Edition - NEW DAWN Redux Modlist", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/176693?tab=description"}, {"title": "Fallout: New Vegas Decompilation", "url": "https://github.com/ieee802dot11ac/fnv"}, {"title": "OpenNotrium", "url": "https://github.com/verhoevenv/OpenNotrium"}, {"title": "Elite-Reinforce", "url": "https://github.com/kugelrund/Elite-Reinforce"}, {"title": "Seven Kingdoms: Ancient Adversaries", "url": "https://7kfans.com/"}, {"title": "RigelEngine - Re-implementation Duke Nukem II", "url": "https://github.com/lethal-guitar/RigelEngine"}, {"title": "Open-IW", "url": "https://github.com/TambourineReindeer/open-iw"}, {"title": "FreeSynd - Re-implementation of Syndicate", "url": "https://freesynd.sourceforge.io/dl.php"}, {"title": "jftekwar - TekWar Port", "url": "https://github.com/jonof/jftekwar"}, {"title": "Commander Genius", "url": "https://github.com/gerstrong/Commander-Genius"}, {"title": "Dethrace Labs", "url": "https://github.com/dethrace-labs/dethrace"}, {"title": "Bioshock - The War In Rapture", "url": "https://www.nexusmods.com/bioshock/mods/143?tab=description"}, {"title": "Skyrim Special Edition - Through Fire and War - A Morrowind Inspired Quest", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/176402"}, {"title": "Terminal Breeder", "url": "https://github.com/amit221/compi"}, {"title": "Tomb Raider N64 Port", "url": "https://youtu.be/SLqWCiGk1rs?si=2RgrAJ9aWYtcT2M-"}, {"title": "The Legend of Zelda: Majora's Mask PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1384"}, {"title": "Devil May Cry 4 Refrain Vita", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1377"}, {"title": "The Legend of Zelda: Ocarina of Time PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1276"}, {"title": "Animal Crossing PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1381"}, {"title": "Baldur's Gate: Dark Alliance PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1357"}, {"title": "Unreal PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1242"}, {"title": "Arx Libertatis PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1367"}, {"title": "Super Mario All-Stars PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1280"}, {"title": "Super Mario World PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1215"}, {"title": "Perfect Dark PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1273"}, {"title": "The Legend of Zelda: A Link to The Past PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/993"}, {"title": "PortForge - A De-Recompilation Port Manager", "url": "https://github.com/portforge/portforge-app"}, {"title": "Final Fantasy VIII Decompilation", "url": "https://github.com/roengstrom/ff8-decomp"}, {"title": "1080 Snowboarding Decompilation", "url": "https://github.com/bigyoshi51/1080-decomp"}, {"title": "Pokemon Ranger: Shadows of Almia Decompilation", "url": "https://github.com/Kuruyia/pokeranger2"}, {"title": "Tiny Dec - Educational decompiler that helps people understand how decompilation works", "url": "https://github.com/ZhangZhuoSJTU/tiny-dec"}, {"title": "Ghostship - Mario 64 PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1387"}, {"title": "Starship - Starfox 64 PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1388"}, {"title": "Star Warfare: Alien Invasion PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1386"}, {"title": "Mario's Modules 2", "url": "https://romhacking.com/hack/mario-s-modules-2"}, {"title": "Mega Man DXtreme", "url": "https://tomycase.itch.io/megaman-dxtreme"}, {"title": "OpenMW - Morrowind PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1390"}, {"title": "Pokemon Light Platinum DS", "url": "https://pokehacking.com/fangames/light-platinum/"}, {"title": "Tiny Bullets - Playstation", "url": "https://romhackplaza.org/translations/tiny-bullets-english-translation-playstation/"}, {"title": "Battleship - Smash Brothers 64 PC Port", "url": "https://github.com/JRickey/BattleShip"}, {"title": "Bomberman Hero Recompilation", "url": "https://github.com/RevoSucks/BMHeroRecomp"}, {"title": "Mario Kart 64 PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1393"}, {"title": "Tomb Raider: Side-Scroller Edition", "url": "https://trcustoms.org/levels/3883"}, {"title": "The Legend of Zelda: The Minish Cap PC Port", "url": "https://github.com/999sian/tmc"}, {"title": "Librelancer", "url": "https://librelancer.net/"}, {"title": "Resident Evil - Requiem for Ravenholm", "url": "https://www.nexusmods.com/residentevilrequiem/mods/1976"}, {"title": "Paper Mario: Star Nova", "url": "https://nictuber.itch.io/paper-mario-star-nova"}, {"title": "Parasite Eve 2 Decompilation", "url": "https://github.com/GabeRealB/parasite-eve-2-decomp"}, {"title": "WarioWare Inc. Decompilation", "url": "https://github.com/ShaffySwitcher/wariowareinc"}, {"title": "Animal Crossing Gamecube Web Port", "url": "https://turtlekiosk.github.io/slider/"}, {"title": "Flare", "url": "https://flarerpg.org/2026/05/03/flare-1-15/"}, {"title": "Triggerheart Exelica - Dreamcast", "url": "https://github.com/DerekPascarella/TriggerheartExelica-EnglishPatchDreamcast"}, {"title": "Dusklight - The Legend of Zelda Twilight Princess PC Port", "url": "https://twilitrealm.dev/"}, {"title": "Paperboy 64 Decompilation", "url": "https://github.com/marijnvdwerf/paperboy-n64"}, {"title": "Evos Space Adventures Decompilation", "url": "https://github.com/mkst/esa"}, {"title": "Ultima V Warriors of Destiny Decompilation", "url": "https://github.com/wonst719/u5d"}, {"title": "Tokyo Bus Guide Decompilation", "url": "https://github.com/lhsazevedo/tbg-decomp"}, {"title": "Armored Trooper Votoms - Playstation 2", "url": "https://cdromance.org/ps2-iso/armored-trooper-votoms-english-patched/"}, {"title": "Racing Battle: C1 Grand Prix - Playstation 2", "url": "https://cdromance.org/ps2-iso/racing-battle-c1-grand-prix-japan/"}, {"title": "Dusklight - The Legend of Zelda Twilight Princess PC Port Texture Pack 1", "url": "https://gamebanana.com/mods/676609"}, {"title": "Pokemon Snap 3DS Port", "url": "https://www.pokecommunity.com/threads/unity-engine-3ds-pok%C3%A9mon-snap-3ds-new-nintendo-3ds-esp-eng-it-fr-pt-de-jap-beta-v0-3-1.542188/#post-10987188"}, {"title": "Ace Driver - Arcade Emulator for Xbox 360", "url": "https://github.com/wanszai/Ace-Driver-Collection-X360-Releases"}, {"title": "Castlevania - Sega Master System Port", "url": "https://youtu.be/OlHIwUhjvnM?si=OREN0jkPBm5OXQvC"}, {"title": "SpelunkyClassicHD", "url": "https://github.com/yancharkin/SpelunkyClassicHD"}, {"title": "Starfield - Star Wars Resources - Galaxy", "url": "https://www.nexusmods.com/starfield/mods/16954?tab=description"}, {"title": "Star Fox 64 PSP Port", "url": "https://github.com/TheMrIron2/sf64-psp"}, {"title": "Beat Hazard 2 PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1056"}, {"title": "VitaDB Downloader", "url": "https://www.rinnegatamante.eu/vitadb/#/info/877"}, {"title": "Universal Dreamcast Patcher", "url": "https://github.com/DerekPascarella/UniversalDreamcastPatcher"}, {"title": "R. C. Pro Am SNES Port", "url": "https://archive.org/details/r.-c.-pro-am"}, {"title": "Goopie - Xbox 360 Recompilation Launcher", "url": "https://goopie.xyz/"}, {"title": "Kameo: Elements of Power Recompilation", "url": "https://github.com/birabittoh/KameoRePowered"}, {"title": "Lollipop Chainsaw Recompilation", "url": "https://github.com/MaxDeadBear/Re-Cherry"}, {"title": "Naughty Bear Recompilation", "url": "https://github.com/MaxDeadBear/NaughtyBear_ReStuff"}, {"title": "Destroy All Humans: Path of the Furon Recompilation", "url": "https://github.com/masterspike52/redahm"}, {"title": "Ecstatica 1 and 2 Recompilation", "url": "https://github.com/spacefarergames/EcstaticaRecompiled"}, {"title": "nesrecomp - NES Recompiler Project", "url": "https://github.com/mstan/nesrecomp"}, {"title": "Castlevania - Symphony of the Night GBC", "url": "https://richterwilker.itch.io/castlevania-gospel-of-belmont"}, {"title": "Animal Crossing GBC", "url": "https://richterwilker.itch.io/animal-forest-gb-folk"}, {"title": "BlasNESmous - Blasphemous NES Demake", "url": "https://fjpolo.itch.io/blasnesmous"}, {"title": "Magiczna kula Papatki Decompilation", "url": "https://github.com/regratka/mkp"}, {"title": "Return to Castle Wolfenstein PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/459"}, {"title": "PS2Recomp - Playstation 2 Static Recompiler & Runtime Tool to make native PC Ports", "url": "https://github.com/ran-j/PS2Recomp"}, {"title": "Terranigma Redux", "url": "https://www.romhacking.net/hacks/8939/"}, {"title": "Five Nights At Freddy's 3: Wii Edition", "url": "https://gamejolt.com/games/fnaf3wii/1071424"}, {"title": "Quetoo", "url": "https://quetoo.org/news/quetoo-is-here/"}, {"title": "WCW nWo Revenge Starrcade Edition", "url": "https://patcher.aki.guide/revse.html"}, {"title": "Grand Theft Auto: San Andreas - Carcer City", "url": "https://www.moddb.com/mods/gta-carcer-city"}, {"title": "Grand Theft Auto 5 - Squid Games", "url": "https://www.gta5-mods.com/scripts/squid-game-mod"}, {"title": "Saints Row 2 - Console DLC For PC", "url": "https://www.saintsrowmods.com/forum/threads/sr2-pc-dlc.24993/"}, {"title": "Battleship - Smash Brothers 64 PC Port Netplay", "url": "https://github.com/TechnicallyComputers/BattleShip/releases/tag/Netplay-Alpha-1"}, {"title": "Real Robots Final Attack - Playstation", "url": "https://romhack.ing/database/content/entry/8ffEsSDoTrabAI5gVzclNg/real-robots-final-attack-english-translation"}, {"title": "Sonic Advance 3 SP", "url": "https://astromuseum.org/sonicZone/sonicmods/sonicadvance3"}, {"title": "WWE SmackDown vs. Raw 2007 Recompilation", "url": "https://github.com/HollywoodAkeem/SVR07-Recomp"}, {"title": "ReCut - Paper Mario Recompilation", "url": "https://github.com/SMCGames/Paper-Mario-ReCut"}, {"title": "Gradius Generation BLACK LABEL", "url": "https://www.romhacking.net/hacks/9694/"}, {"title": "SNESRecomp", "url": "https://github.com/mstan/snesrecomp"}, {"title": "Super Mario World Recompilation", "url": "https://github.com/mstan/SuperMarioWorldRecomp"}, {"title": "The Legend of Zelda: A Link to the Past Recompilation", "url": "https://github.com/mstan/ZeldaAlttPSNESRecomp"}, {"title": "Mega Man X Recompilation", "url": "https://github.com/mstan/MegaManXSNESRecomp"}, {"title": "Pokemon Crystal PC Port", "url": "https://github.com/DanZC/suiCune"}, {"title": "Banjo Kazooie Recompiled Stereoscopic 3D", "url": "https://github.com/oneup03/BanjoRecomp3D/releases"}, {"title": "Perfect Dark Recompiled Stereoscopic 3D", "url": "https://github.com/oneup03/perfect_dark_3D/releases"}, {"title": "Phantasy Star Generation:2 - PS2", "url": "https://cdromance.org/ps2-iso/sega-ages-2500-series-vol-17-phantasy-star-generation2-english-patched/"}, {"title": "Daytona USA Recompilation", "url": "https://github.com/Subarasheese/daytona-xbla-recomp/"}, {"title": "Morrowind - Muffinwind Rebaked", "url": "https://www.nexusmods.com/morrowind/mods/59081"}, {"title": "Skate 3 Recompilation 1", "url": "https://github.com/portingpete/skate3-recomp"}, {"title": "Skate 3 Recompilation 2", "url": "https://github.com/mchughalex/skate3recomp"}, {"title": "Lost Odyssey Recompilation", "url": "https://github.com/Graine25/reodyssey"}, {"title": "The Outfit Recompilation", "url": "https://github.com/DohmBoy64Bit/TheOutFit"}, {"title": "Test Drive Unlimited Recompilation", "url": "https://github.com/testdriveupgrade/TDURE"}, {"title": "Rock Band 3 Recompilation", "url": "https://github.com/ihatecompvir/band3_recomp"}, {"title": "Eternal Sonata Recompilation", "url": "https://github.com/birabittoh/EternalSonataReprise"}, {"title": "Castlevania Legacy of Darkness Recompilation", "url": "https://github.com/fliperama86/cvlod_recomp"}, {"title": "Unreal Tournament PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1399"}, {"title": "Resident Evil 4 Mobile PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1402"}, {"title": "PAC-MAN Championship Edition DX PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1409"}, {"title": "Call of Duty Black Ops Zombies PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1410"}, {"title": "Marvel's Spider-Man 2 First Person Camera Mod", "url": "https://www.nexusmods.com/marvelsspiderman2/mods/1993?tab=description"}, {"title": "RecompOne - Static PSOne Recompiler", "url": "https://github.com/flafmg/RecompOne"}, {"title": "Soul Blazer - SNES", "url": "https://romhack.ing/database/content/entry/ecw_olT_SyWuzHzrJz_tPg/soul-blazer-relocalization"}, {"title": "Rushing Beat Shura The Eternal Conflict - SNES", "url": "https://romhack.ing/database/content/entry/iiKVVaitQxSE0Lfm2I0Xkw/rushing-beate-shura-the-eternal-conflict-english-translation"}, {"title": "Kowloon's Gate - Playstation", "url": "https://www.patreon.com/posts/160555525"}, {"title": "Dusklight - The Legend of Zelda Twilight Princess PC Port Web Browser Build", "url": "https://dusklight.pages.dev/"}, {"title": "Pokemon Stadium Recompilation", "url": "https://github.com/mstan/PokemonStadiumRecomp"}, {"title": "Goldeneye XBLA Recompilation", "url": "https://github.com/SunJaycy/GoldenEye-Recomp"}, {"title": "Paper Mario Down Bad Edition", "url": "https://github.com/MinusBros/downbadeditionsource/releases"}, {"title": "SNES Cheat Patcher Studio - Apply Game Genie Cheats To SNES Roms", "url": "https://github.com/Dax-Dot/SNES-Cheat-Patcher-Studio"}, {"title": "Silent Hill PC Port", "url": "https://github.com/SlickAmogus/silent-hill-decomp"}, {"title": "Super Mario 64 Nintendo DS Port with Multiplayer", "url": "https://github.com/TobiasFriedly/sm64-nds"}, {"title": "Earthbound Beginnings Remake", "url": "https://ebbr.neocities.org/downloads"}, {"title": "Fire Emblem: Seima no Kouseki Decompilation", "url": "https://github.com/laqieer/fireemblem8j"}, {"title": "Star Wars: Rogue Squadron II - Rogue Leader Decompilation", "url": "https://github.com/AARosson48/rogue-leader-decomp"}, {"title": "Homeworld 2 Classic Decompilation", "url": "https://github.com/HaydnTrigg/Homeworld2Classic"}, {"title": "Wolfenstein 3D Atari Lynx Port", "url": "https://drive.google.com/drive/folders/11Mq1f8bDg_ZH8Z9DtjH5dC1-cCsP8ycZ"}, {"title": "Ironclad - Xbox 360", "url": "https://hiddenpalace.org/Ironclad_(Dec_16,_2008_prototype)"}, {"title": "Resident Evil 4 - Multiplayer Mod", "url": "https://www.nexusmods.com/residentevil42023/mods/6539?tab=description"}, {"title": "DARIUSBURST SP PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1415"}, {"title": "A Bite at Freddy's PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1413"}, {"title": "Colin McRae Rally 2.0", "url": "https://archive.org/details/colin-mcrae-rally-2.0-repack"}, {"title": "Colin McRae Rally", "url": "https://archive.org/details/colin-mcrae-rally-repack?"}, {"title": "Snowboard Kids Decompilation", "url": "https://github.com/cdlewis/snowboardkids-decomp"}, {"title": "God Hand Decompilation", "url": "https://github.com/LucasPicoli/god-hand-decomp"}, {"title": "WWE 2K16", "url": "https://archive.org/details/wwe-2k16"}, {"title": "WWE 2K17", "url": "https://archive.org/details/wwe-2k17"}, {"title": "WWE 2K18", "url": "https://archive.org/details/wwe-2k18"}, {"title": "WWE 2K19", "url": "https://archive.org/details/wwe-2k19"}, {"title": "WWE 2K20", "url": "https://archive.org/details/wwe-2k20"}, {"title": "WWE 2K22", "url": "https://archive.org/details/wwe-2k22_202603"}, {"title": "WWE 2K23", "url": "https://archive.org/details/wwe-2k23"}, {"title": "Starship Troopers - Terran Ascendancy", "url": "https://archive.org/details/starship-troopers-terran-ascendancy"}, {"title": "Ghostbusters: The Video Game", "url": "https://archive.org/details/ghostbusters-the-video-game_202603"}, {"title": "Dexter: The Game", "url": "https://archive.org/details/dexter-the-game.-7z_202603"}, {"title": "House M.D.", "url": "https://archive.org/details/house-m.-d.-7z"}, {"title": "MechCommander: Gold", "url": "https://archive.org/details/mechcommander-gold"}, {"title": "MechCommander 2", "url": "https://archive.org/details/mechcommander-2"}, {"title": "Onimusha 3: Demon Siege", "url": "https://archive.org/details/onimusha-3-demon-siege_202603"}, {"title": "Forza Horizon 4", "url": "https://archive.org/details/forza-horizon-4_20260322"}, {"title": "Colin McRae: DiRT", "url": "https://archive.org/details/colin-mcrae-dirt_202603"}, {"title": "Tom Clancy's Ghost Recon Advanced Warfighter", "url": "https://archive.org/details/ghost-recon-advanced-warfighter_202603"}, {"title": "Tom Clancy's Ghost Recon Advanced Warfighter 2", "url": "https://archive.org/details/ghost-recon-advanced-warfighter-2"}, {"title": "Star Trek", "url": "https://archive.org/details/star-trek_202603"}, {"title": "The Lord Of The Rings - War Of The Ring", "url": "https://archive.org/details/the-lord-of-the-rings-war-of-the-ring_202603"}, {"title": "Peaky Blinders Mastermind", "url": "https://archive.org/details/peaky-blinders-mastermind"}, {"title": "Tony Hawk's Pro Skater 2", "url": "https://archive.org/details/tony-hawks-pro-skater-2_202604"}, {"title": "Tony Hawk's Pro Skater 3", "url": "https://archive.org/details/tony-hawks-pro-skater-3_202604"}, {"title": "Tony Hawk's Underground", "url": "https://archive.org/details/tony-hawks-underground"}, {"title": "Tony Hawk's Underground 2", "url": "https://archive.org/details/tony-hawks-underground-2_202604"}, {"title": "Tony Hawk's Pro Skater HD", "url": "https://archive.org/details/tony-hawks-pro-skater-hd_202604"}, {"title": "Grand Theft Auto 2", "url": "https://archive.org/details/grand-theft-auto-2_202604"}, {"title": "MLB 2K9", "url": "https://archive.org/details/mlb-2-k-9"}, {"title": "MLB 2K10", "url": "https://archive.org/details/mlb-2k10"}, {"title": "MLB 2K11", "url": "https://archive.org/details/mlb-2k11"}, {"title": "Prison Break: The Conspiracy", "url": "https://archive.org/details/prison-break_202604"}, {"title": "Tonic Trouble", "url": "https://archive.org/details/tonic-trouble.-7z"}, {"title": "The Neverhood", "url": "https://archive.org/details/the-neverhood_202604"}, {"title": "Disney's G-Force", "url": "https://archive.org/details/disneys-g-force"}, {"title": "Sheep, Dog, 'n' Wolf", "url": "https://archive.org/details/sheep-dog-n-wolf-repack"}, {"title": "CSI: 3 Dimensions Of Murder", "url": "https://archive.org/details/csi-3-dimensions-of-murder-repack"}, {"title": "Star Trek Legacy", "url": "https://archive.org/details/star-trek-legacy-repack"}, {"title": "Lost: Via Domus", "url": "https://archive.org/details/lost-via-domus-repack"}, {"title": "NBA Playgrounds", "url": "https://archive.org/details/nba-playgrounds-repack"}, {"title": "NBA 2K Playgrounds 2", "url": "https://archive.org/details/nba-2k-playgrounds-2-repack"}, {"title": "Deep Black: Reloaded", "url": "https://archive.org/details/deep-black-reloaded-repack"}, {"title": "Cabela's Dangerous Hunts 2013", "url": "https://archive.org/details/cabelas-dangerous-hunts-2013-repack"}, {"title": "Pirates Of The Caribbean: At Worlds End", "url": "https://archive.org/details/pirates-of-the-caribbean-at-worlds-end-repack"}, {"title": "Friday The 13th - Killer Puzzle", "url": "https://archive.org/details/friday-the-13th-killer-puzzle-repack"}, {"title": "LEGO 2K Drive", "url": "https://archive.org/details/lego-2k-drive-repack"}, {"title": "Madden NFL 08", "url": "https://archive.org/details/madden-nfl-08_20260525"}, {"title": "Fuser", "url": "https://archive.org/details/fuser-repack"}, {"title": "X2: Wolverine's Revenge", "url": "https://archive.org/details/x2-wolverines-revenge-repack"}, {"title": "Pro Evolution Soccer 2014", "url": "https://archive.org/details/pro-evolution-soccer-2014-repack"}, {"title": "Pro Evolution Soccer 2015", "url": "https://archive.org/details/pro-evolution-soccer-2015-repack"}, {"title": "Pro Evolution Soccer 2016", "url": "https://archive.org/details/pro-evolution-soccer-2016-repack"}, {"title": "Pro Evolution Soccer 2017", "url": "https://archive.org/details/pro-evolution-soccer-2017-repack"}, {"title": "Pro Evolution Soccer 2018", "url": "https://archive.org/details/pro-evolution-soccer-2018-repack"}, {"title": "Pro Evolution Soccer 2019", "url": "https://archive.org/details/pro-evolution-soccer-2019-repack"}, {"title": "eFootball PES 2020", "url": "https://archive.org/details/e-football-pes-2020-repack"}, {"title": "eFootball PES 2021", "url": "https://archive.org/details/e-football-pes-2021-repack"}, {"title": "Banjo-Kazooie Recompilation for Android", "url": "https://github.com/AurelioB/BanjoRecomp-Android/releases"}, {"title": "Alundra Definitive Edition", "url": "https://github.com/Pixelplix93/Alundra-Definitive-Edition"}, {"title": "Ancient Ys Vanished Omen - PC-98", "url": "https://github.com/GhaleonX/Ys"}, {"title": "Deadly Premonition Recompilation", "url": "https://github.com/LittleBitUA/DPRecomp"}, {"title": "Silent Hill: Downpour Recompilation", "url": "https://github.com/LittleBitUA/DownpourRecomp"}, {"title": "Snowboard Kids 2 Recompilation", "url": "https://github.com/cdlewis/snowboardkids2-recomp/releases/tag/v1.0.5"}, {"title": "Crash Team Racing PC Port", "url": "https://github.com/CTR-tools/ctr-native/releases"}, {"title": "DolRecomp - A static recompiler for GameCube, Wii, and experimental Wii U CPU code", "url": "https://github.com/ExpansionPak/DolRecomp"}, {"title": "Smash Remix: Project Galleon", "url": "https://www.youtube.com/watch?v=LIvRGQ0mZB8"}, {"title": "OpenPREY", "url": "https://github.com/themuffinator/OpenPREY"}, {"title": "Ship of Harkinian - Zelda Ocarina of Time Port - Cel Shaded Model Mod", "url": "https://github.com/roborich/Shipwright/releases/tag/v0.3-cel-shade"}, {"title": "Monster Hunter Dynamic Hunting PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1420"}, {"title": "Castlevania ReVamped Android Port", "url": "https://github.com/eboody/Castlevania-ReVamped-Open-Source-Edition/releases"}, {"title": "PS3Recomp - Static Recompilation Runtime Libraries for PlayStation 3 Titles", "url": "https://github.com/sp00nznet/ps3recomp"}, {"title": "Premier Eleven - Dreamcast", "url": "https://www.dreamcast-talk.com/forum/viewtopic.php?t=19255&__cf_chl_rt_tk=YJ0o21txXUMYJtgIvVfTSG_hjnIMcIAKErnX7wQTYI8-1782419778-1.0.1.1-vsZKSi9MQisA6rmf0lb5RARZJcGT02X2VJkBBqGOxV4"}, {"title": "Harvest Moon 64 Recompilation", "url": "https://github.com/HarvestMoon64Recomp/HarvestMoon64Recomp"}, {"title": "Dark Lands PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1425"}, {"title": "Aleph One PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1421"}, {"title": "Resistance Fall of Man - ResistanceOnline", "url": "https://archive.org/download/ResistanceOnline"}, {"title": "Damnation", "url": "https://archive.org/details/damnation-repack"}, {"title": "LEGO Star Wars: The Video Game", "url": "https://archive.org/details/lego-star-wars-repack"}, {"title": "LEGO Star Wars II: The Original Trilogy", "url": "https://archive.org/details/lego-star-wars-ii-repack"}, {"title": "Horizon Chase Turbo", "url": "https://archive.org/details/horizon-chase-turbo-repack"}, {"title": "Ace Combat 6: Fires of Liberation Recompilation", "url": "https://github.com/sal063/AC6_recomp"}, {"title": "Resistance 2 RPCS 3 Patched Build", "url": "https://archive.org/details/Resistance2-RPCS3"}, {"title": "1 GithubLauncher - Universal Launcher for Recompilations and PC Ports", "url": "https://github.com/SirDiabo/GithubLauncher"}, {"title": "NocturneRecomp - Castlevania Symphony of the Night XBLA Recompilation", "url": "https://github.com/birabittoh/NocturneRecomp"}, {"title": "Metal Slug XX Recompilation", "url": "https://github.com/FluffyQuack/rexglue-MetalSlugXX"}, {"title": "Perfect Dark VR Port", "url": "https://github.com/Alex-LeTux/perfect_dark_VR/releases"}, {"title": "Harvest Moon 64 Recompilation Mods", "url": "https://thunderstore.io/c/harvest-moon-64-recompiled/"}, {"title": "Diablo 3 Xbox 360 Recompilation", "url": "https://github.com/Boron853/Souls-of-the-Reaper/releases/tag/beta-1.2"}, {"title": "Kingdom Hearts 358 2 Days Decompilation", "url": "https://github.com/Yokimitsuro/khdays-decomp"}, {"title": "Digimon World 4 Decompilation", "url": "https://github.com/ivanno4317/dw4-gc"}, {"title": "Halo 3 Permafrost", "url": "https://steamcommunity.com/sharedfiles/filedetails/?id=3663541185"}, {"title": "Mega Man X6 Recompilation", "url": "https://github.com/mstan/MegaManX6Recomp"}, {"title": "Virtual Pro Wrestling 2 Recompilation", "url": "https://discovery.onl/Grix/a1ac11ed-e635-4c5f-959e-2716d6c3fdd0"}, {"title": "Tomba! Recompilation", "url": "https://github.com/mstan/TombaRecomp"}, {"title": "WCW vs. nWo World Tour Recompilation", "url": "https://github.com/jessetbh/WCWvsNWOWorldTourRecomp"}, {"title": "Grand Theft Auto 3 - Liberty Extended", "url": "https://libertycity.net/files/gta-3/191140-liberty-extended-october-2025-update.html"}, {"title": "Grand Theft Auto Vice City - Vice Extended", "url": "https://libertycity.net/files/gta-vice-city/167639-vice-extended-october-2025-update.html"}, {"title": "Mega Man X4 Recompilation", "url": "https://github.com/mstan/MegaManX4Recomp"}, {"title": "Virtua Racing PC Emulation", "url": "https://github.com/wanszai/Virtua-Racing---XBOXONE-Windows"}, {"title": "Virtua Fighter PC Emulation", "url": "https://github.com/wanszai/Virtua-Fighter---XboxOne-Windows"}, {"title": "Zool Majyu Charmer Legend - N64", "url": "https://romhack.ing/database/content/entry/gNAq0phlTYqaYSpT_kY1XQ/zool-majy-charmer-legend-english-translation"}, {"title": "ModernGekko - Static-Recompilation pipeline for GameCube and Wii games", "url": "https://github.com/ExpansionPak/ModernGekko-Template"}, {"title": "The Legend of Zelda Majora's Mask Recompilation for Android", "url": "https://github.com/linkzenic/Zelda64Recomp-Android"}, {"title": "Monster Hunter Decompilation", "url": "https://github.com/2Tie/mh1j"}, {"title": "Lemmings Paintball Decompilation", "url": "https://github.com/vonhoff/lemball-decomp"}, {"title": "Dragon Quest IV Decompilation", "url": "https://github.com/GoldieLeGenie/DQIV-DECOMP"}, {"title": "Crash Bandicoot The Wrath of Cortex Decompilation", "url": "https://github.com/denzi-gh/crashwoc-decomp-ps2"}, {"title": "Tenchu Decompilation", "url": "https://github.com/Fuuzetsu/tenchu-decomp"}, {"title": "MOTHER Encore PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1431"}, {"title": "After Burner Climax PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1433"}, {"title": "Gears of War 2 PC Port", "url": "https://www.moddb.com/mods/gears-of-war-2-hollow/downloads/gears-of-war-2-hollow-launcher"}, {"title": "Mischief Makers Recompilation", "url": "https://github.com/ThiagoLira/trouble-makers-pc-recomp"}, {"title": "Chameleon Twist Recompilation", "url": "https://github.com/Rainchus/ChameleonTwist1-JP-Recomp"}, {"title": "WWF WrestleMania 2000 Recompilation", "url": "https://github.com/jessetbh/WWFWrestleMania2000Recomp"}, {"title": "WCW nWo Revenge Recompilation", "url": "https://github.com/jessetbh/WCWnWoRevengeRecomp"}, {"title": "WWF No Mercy Recompilation", "url": "https://github.com/jessetbh/WWFNoMercyRecomp"}, {"title": "Virtual Pro Wrestling 64 Recompilation", "url": "https://github.com/jessetbh/VPW64Recomp"}, {"title": "AkiLauncher - Launcher for the AKI-engine N64 Wrestling Recompilations", "url": "https://github.com/jessetbh/AkiLauncher"}, {"title": "Infamous RPCS 3 Patched Build", "url": "https://archive.org/details/INFAMOUS1RPCS3"}, {"title": "Uncharted RPCS 3 Patched Build", "url": "https://transfer.it/t/4GqbvrpB2DCI"}, {"title": "Motorstorm Pacific Rift RPCS 3 Patched Build", "url": "https://archive.org/details/MOTORSTORMPACIFICRIFTRPCS3"}, {"title": "Uncharted 2 RPCS 3 Patched Build", "url": "https://transfer.it/t/sv5gYVknSZia"}, {"title": "Wet RPCS 3 Patched Build", "url": "https://transfer.it/t/AnylMJ1XXTKa"}, {"title": "Dodonpachi Saidaioujou Recompilation", "url": "https://github.com/eandis/SDOJ-Recomp"}, {"title": "GreenVita - Xbox Cloud Gaming on PlayStation Vita", "url": "https://github.com/Day-OS/green-vita"}, {"title": "Pokemon Red Recompilation", "url": "https://github.com/bryanthaboi/pokemon-gen1-recomp-project"}, {"title": "Kirby's Return to Dream Land Recompilation", "url": "https://github.com/ExpansionPak/ModernGekko/releases/tag/kirby"}, {"title": "Street Fighter III Third Strike PC Port", "url": "https://github.com/guimaraf/3sxw"}, {"title": "Heavenly Sword RPCS 3 Build", "url": "https://archive.org/details/heavenly-sword-rpcs-3"}, {"title": "Rain RPCS 3 Build", "url": "https://gofile.io/d/pxeLJ3"}, {"title": "Tokyo Jungle RPCS 3 Build", "url": "https://archive.org/details/TOKYOJUNGLERPCS3"}, {"title": "Folklore", "url": "https://archive.org/details/folklore_rpcs3"}, {"title": "Pepsiman Recompilation", "url": "https://pepsiman.ol.mr/"}, {"title": "Sega Rally Championship PC Emulation", "url": "https://github.com/wanszai/Sega-Rally-Championship-PC-Xbox360-Series-X-/releases/tag/1.0.0"}, {"title": "StarCraft 64 Campaign Co-Op Mod", "url": "https://github.com/Tokatta007/Starcraft-64-Co-Op-Mod"}, {"title": "UnderMobile - Undertale Android Port", "url": "https://gamejolt.com/games/UnderMobile/1086330"}, {"title": "Fullmetal Alchemist 3 The Girl Who Succeeds God - Playstation 2", "url": "https://agtteam.net/fma/"}, {"title": "VL.MR - Hub for Browser Based Recompilation Projects", "url": "https://vl.mr/"}, {"title": "2 Quiver - Recompilation Launcher", "url": "https://github.com/tgeorgiadis/quiver"}, {"title": "Crash Bandicoot PC Port", "url": "https://github.com/Matteo842/CrashBandicoot-Launcher/releases"}, {"title": "Smash Remix +Extra", "url": "https://github.com/joaorb64/smashremix-plus-extra/releases/tag/0.5.0"}, {"title": "Saw - PC Patched", "url": "https://archive.org/details/saw_20251012"}, {"title": "Crazy Taxi 3 - PC Patched", "url": "https://archive.org/details/crazy-taxi-3_202601"}, {"title": "Spider Man Friend Or Foe - PC Patched", "url": "https://archive.org/details/spider-man-friend-or-foe-repack"}, {"title": "Halo 2 - PC Patched", "url": "https://archive.org/details/halo-2-repack"}, {"title": "Resident Evil Dead Aim - PC Patched", "url": "https://archive.org/details/resident-evil-dead-aim_20260610"}, {"title": "The Simpsons Game Recompilation", "url": "https://github.com/YesterMester/TheSimpsonsGameRecomp"}, {"title": "Hollow Knight Android Port", "url": "https://archive.org/details/hollow-knight-android"}, {"title": "Super Mario 64 Android Port", "url": "https://github.com/ManIsCat2/sm64coopdx/releases/tag/Av1.5.1"}, {"title": "DevilutionX - Diablo 1 - Android Port", "url": "https://github.com/diasurgical/DevilutionX"}, {"title": "Ship of Harkinian - The Legend of Zelda Ocarina of Time Android Port", "url": "https://github.com/Waterdish/Shipwright-Android"}, {"title": "Brotato Android Port", "url": "https://drive.google.com/file/d/1x6tEy9skIO84Xu8QYPCkg9APf4qJ_4yw/view"}, {"title": "The Case of the Golden Idol Android Port", "url": "https://drive.google.com/drive/u/0/folders/1T33HnJ7Q6oKTEoOngEO7HaYKvC9O2Vdl"}, {"title": "Delta Touch - Doom Engine Source Ports for Android", "url": "http://opentouchgaming.com/delta-touch/"}, {"title": "Zeta Touch - Raze and EDuke32 Engines for Android", "url": "http://opentouchgaming.com/zeta-touch/"}, {"title": "VCMI - Open Heroes 3 - Heroes of Might and Magic 3 - for Android", "url": "https://vcmi.eu/"}, {"title": "Quad Touch PC Quake engines for Android", "url": "http://opentouchgaming.com/quad-touch/"}, {"title": "Alpha Touch 90’s classic FPS shooters for Android", "url": "http://opentouchgaming.com/alpha-touch/"}, {"title": "OpenMW - Morrowind for Android", "url": "https://gitlab.com/duron27/alpha3"}, {"title": "Sonic Unleashed Recompilation for Android", "url": "https://github.com/SansNope/UnleashedRecomp-Android"}, {"title": "PartyBoard - Mario Party 4 for Android", "url": "https://github.com/mariopartyrd/marioparty4"}, {"title": "OpenCrossing - Animal Crossing for Android", "url": "https://github.com/GabeConway/OpenCrossing-Anbernic/releases"}, {"title": "Sigma Touch - Unreal and Unreal Tournament 99 Engine for Android", "url": "http://opentouchgaming.com/sigma-touch/"}, {"title": "Battleship - Super Smash Brothers 64 for Android", "url": "https://github.com/JRickey/BattleShip/releases"}, {"title": "The Simpsons Hit & Run for Android", "url": "https://github.com/Carlox33/The-Simpsons-Hit-and-Run-Android/releases"}, {"title": "Perfect Dark for Android", "url": "https://github.com/izzy2lost/perfect_dark/releases/tag/1.0"}, {"title": "Pokemon Red, Blue and Yellow Recompilation", "url": "https://github.com/bryanthaboi/gen1recomp"}, {"title": "Pokemon Red, Blue and Yellow Recompilation Dramatic Shape Voxel Mod", "url": "https://github.com/DramaticShape/DramaticShapeVoxelMod/releases"}, {"title": "Pokemon Red Blue and Yellow Recompilation", "url": "https://github.com/bryanthaboi/gen1recomp"}, {"title": "Pokemon Red, Blue and Yellow Recompilation Dramatic Shape Voxel Mod", "url": "https://github.com/DramaticShape/DramaticShapeVoxelMod/releases"}, {"title": "The Legend of Zelda the Minish Cap for Android", "url": "https://github.com/samyost1/tmc-android/releases"}, {"title": "Link's Awakening DX HD for Android", "url": "https://archive.org/details/links-awakening-dx-hd-v-1.7.0-windows-direct-x.-7z"}, {"title": "2 Starboard Play Games From The Portmaster Library On Your Android Handheld", "url": "https://github.com/get-starboard/starboard"}, {"title": "1 Obtainium", "url": "https://github.com/ImranR98/Obtainium"}, {"title": "SwitchNow a Native Nintendo Switch Homebrew Client for Geforce Now", "url": "https://github.com/Blade-Punisher/SwitchNOW"}, {"title": "AM2R for Android", "url": "https://archive.org/download/am-2-rlauncher-2.2.0-win-android/"}, {"title": "Gran Turismo 2 PC Patched", "url": "https://archive.org/details/gt-2_20260509"}, {"title": "Forza Horizon PC Patched", "url": "https://archive.org/details/forza-horizon"}, {"title": "Forza Horizon 2 PC Patched", "url": "https://archive.org/details/fh-2_20260510"}, {"title": "Forza Motorsport 3 PC Patched", "url": "https://archive.org/details/fm-3_20260510"}, {"title": "Forza Motorsport 4 PC Patched", "url": "https://archive.org/details/fm-4_20260510"}, {"title": "Dirge Of Cerberus: Final Fantasy VII PC Patched", "url": "https://archive.org/details/dirge-of-cerberus-final-fantasy-vii"}, {"title": "Midnight Club LA Complete Edition PC Patched", "url": "https://archive.org/details/midnight-club-la-complete-edition"}, {"title": "Gears Of War 2 PC Patched", "url": "https://archive.org/details/gears-of-war-2_202605"}, {"title": "Vigilante 8 Arcade PC Patched", "url": "https://archive.org/details/vigilante-8-arcade"}, {"title": "Gears Of War 3 PC Patched", "url": "https://archive.org/details/gears-of-war-3.7z"}, {"title": "Gun PC Patched", "url": "https://archive.org/details/gun.-7z"}, {"title": "Midnight Club 3 Dub Edition Remix PC Patched", "url": "https://archive.org/details/midnight-club-3-dub-edition-remix.-7z"}, {"title": "Pirates Of The Caribbean At Worlds End PC Patched", "url": "https://archive.org/details/pirates-of-the-caribbean-at-worlds-end.-7z"}, {"title": "Gear Of War Judgment PC Patched", "url": "https://archive.org/details/gear-of-war-judgment-brasil.-7z"}, {"title": "Fist Of The North Star - Kens Rage 2 PC Patched", "url": "https://archive.org/details/fist-of-the-north-star-kens-rage-2.7z"}, {"title": "Fist Of The North Star - Kens Rage PC Patched", "url": "https://archive.org/details/fist-of-the-north-star-kens-rage.-7z"}, {"title": "Naruto - The Broken Bond PC Patched", "url": "https://archive.org/details/naruto-the-broken-bond.-7z"}, {"title": "Naruto - Rise Of A Ninja PC Patched", "url": "https://archive.org/details/naruto-rise-of-a-ninja.-7z"}, {"title": "Dragon Ball Z - Ultimate Tenkaichi PC Patched", "url": "https://archive.org/details/dragon-ball-z-ultimate-tenkaichi.-7z"}, {"title": "Dragon Ball - Raging Blast 2 PC Patched", "url": "https://archive.org/details/dragon-ball-raging-blast-2.7z"}, {"title": "Dragon Ball - Raging Blast PC Patched", "url": "https://archive.org/details/dragon-ball-raging-blast.-7z"}, {"title": "Dragon Ball Z - Burst Limit PC Patched", "url": "https://archive.org/details/dragon-ball-z-burst-limit.-7z"}, {"title": "Resident Evil - Code Veronica X PC Patched", "url": "https://archive.org/details/re-code-veronica-x"}, {"title": "Fable II - Game of The Year Edition PC Patched", "url": "https://archive.org/details/fable-ii_20260615"}, {"title": "The Sly Collection PC Patched", "url": "https://archive.org/details/sly-collection"}, {"title": "Sly Cooper - Thieves in Time PC Patched", "url": "https://archive.org/details/sly-4_202607"}, {"title": "Drakengard 1 & 2 PC Patched", "url": "https://archive.org/details/drakengard-1-2"}, {"title": "ICO PC Patched", "url": "https://archive.org/details/ico_20260704"}, {"title": "Ninja Gaiden II PC Patched", "url": "https://archive.org/details/ninja-gaiden-2"}, {"title": "Drakengard 3 PC Patched", "url": "https://archive.org/details/drakengard-3_202607"}, {"title": "Fatal Frame Trilogy PC Patched", "url": "https://archive.org/details/fatal-frame-trilogy_202607"}, {"title": "Splatterhouse PC Patched", "url": "https://archive.org/details/splatterhouse_202607"}, {"title": "Haunting Ground PC Patched", "url": "https://archive.org/details/haunting-ground_202607"}, {"title": "Captain America Super Soldier PC Patched", "url": "https://archive.org/details/captain-america-super-soldier_202607"}, {"title": "Dante's Inferno PC Patched", "url": "https://archive.org/details/dantes-inferno_20260727"}, {"title": "Gravity Rush Remastered PC Patched", "url": "https://archive.org/details/gravity-rush_202607"}, {"title": "2010 FIFA World Cup South Africa PC Patched", "url": "https://archive.org/details/2010-fifa-world-cup-south-africa_202607"}, {"title": "Asura's Wrath PC Patched", "url": "https://archive.org/details/asuras-wrath_20260727"}, {"title": "Gravity Rush 2 PC Patched", "url": "https://archive.org/details/gravity-rush-2"}, {"title": "Lost Odyssey PC Patched", "url": "https://archive.org/details/lost-odyssey_202607"}, {"title": "Blue Dragon PC Patched", "url": "https://archive.org/details/blue-dragon_202607"}, {"title": "RimDroid - RimWorld Launcher for Android", "url": "https://github.com/udarmolota/RimDroid"}, {"title": "Automobili Lamborghini Recompilation", "url": "https://github.com/alondero/automobililamborghini-recomp/releases/tag/v0.5.0"}, {"title": "Halo Campaign Evolved Split-Screen Co-op Mod", "url": "https://www.nexusmods.com/halocampaignevolved/mods/53"}, {"title": "Surging Aura - Sega Megadrive", "url": "https://www.romhacking.net/translations/7660/"}, {"title": "Diddy Kong Racing WebGPU Android Port", "url": "https://www.mediafire.com/file/j1hc0cg224ghiky/Golden_Balloon_1.0_%25281%2529.apk/file"}, {"title": "Syphon Filter PC Port", "url": "https://github.com/Madxbio97/SF-pc-port"}, {"title": "TeknoParrot for Android", "url": "https://github.com/teknogods/TeknoParrotUI/releases/tag/TeknoParrotUI-android"}, {"title": "Super Smash Bros. 64 Nintendo DS Port", "url": "https://github.com/rockenrooster/Smash64DS_Port"}, {"title": "Croc Definitive Edition", "url": "https://archive.org/details/croc64-1.3.0-setup"}, {"title": "Mad Monks Revenge Definitive Edition", "url": "https://mmr.quarkrobot.com/"}, {"title": "Dominatrix - Port of SiN", "url": "https://rohit.itch.io/dominatrix"}, {"title": "Colditz Escape", "url": "https://aperture-software.github.io/colditz-escape/"}, {"title": "C-Dogs SDL", "url": "https://cxong.github.io/cdogs-sdl/"}, {"title": "The Legend of Zelda A Link to the Past Dual Screen Nintendo 3DS Port", "url": "https://github.com/EstebanPdN/zelda-alttp-3ds"}, {"title": "The Legend of Zelda A Link to the Past for Android", "url": "https://github.com/Waterdish/zelda3-android"}, {"title": "Crash Team Racing for Android", "url": "https://github.com/Simon358/ctr-native-android/releases"}, {"title": "Warcraft II for Android", "url": "https://dos.zone/offline/warcraft-ii-android/"}, {"title": "Dune 2 For Android", "url": "https://dos.zone/offline/dune-2-android/"}, {"title": "Xash3D FWGS engine for Half-Life - Blue Shift - Opposing force", "url": "https://github.com/fwgs/xash3d-fwgs"}, {"title": "Goldeneye Recompilation for Android", "url": "https://github.com/jeffory/GoldenEye-Recomp/releases"}, {"title": "Golden Balloon - Diddy Kong Racing Recompilation", "url": "https://github.com/akratch/golden-balloon"}, {"title": "idTech4A++ - Engine for Doom III - Quake 4 - Prey 2006 on Android", "url": "https://github.com/glKarin/com.n0n3m4.diii4a"}, {"title": "Lighthouse - Banjo Kazooie PC Port", "url": "https://github.com/HarbourMasters/Lighthouse/releases/tag/1.0.0"}, {"title": "Source Engine for Android", "url": "https://arumoon.github.io/source-engine-download/"}, {"title": "OpenRCT2 - Rollercoaster Tycoon 2 for Android", "url": "https://github.com/OpenRCT2/OpenRCT2/releases"}, {"title": "OpenTTD for Android", "url": "https://github.com/pelya/openttd-android/releases"}, {"title": "CorsixTH - Theme Hospital for Android", "url": "https://github.com/alanwoolley/CorsixTH-Android/releases"}, {"title": "OpenLara - Tomb Raider Engine for Android", "url": "https://github.com/XProger/OpenLara"}, {"title": "Zomdroid - Unofficial Project Zomboid Launcher for Android", "url": "https://github.com/udarmolota/zomdroid/releases"}, {"title": "OpenStarbound for Android", "url": "https://github.com/RohanBhattacharyya/oSBM/releases"}, {"title": "Super Mario Maker World Engine for Android", "url": "https://gamejolt.com/games/Supermariomakerapk/704972"}, {"title": "Counter Strike 1.6 for Android", "url": "https://github.com/Velaron/cs16-client"}, {"title": "Unturned for Android", "url": "https://unturned.en.uptodown.com/android"}, {"title": "GameNative - run supported Steam, Epic and GOG games locally on Android", "url": "https://gamenative.app/"}, {"title": "Warsmash - Warcraft 3 for Android", "url": "https://f-droid.org/en/packages/net.warsmash.phone/"}, {"title": "Fallout Community Edition for Android", "url": "https://github.com/alexbatalov/fallout1-ce/releases/tag/v1.1.0"}, {"title": "Fallout 2 Community Edition for Android", "url": "https://github.com/alexbatalov/fallout2-ce/releases/tag/v1.3.0"}, {"title": "Daggerfall for Android", "url": "https://github.com/Vwing/daggerfall-unity-android"}, {"title": "Classic Core - Unofficial Android Ports of Classic Game Engines", "url": "https://github.com/sandstranger/com.mobilerpgpack.phone"}, {"title": "Holotz's Castle", "url": "https://www.mobygames.com/game/23431/holotzs-castle/"}, {"title": "OpenJKDF2 - Dark Forces 2 for Android", "url": "https://github.com/shinyquagsire23/OpenJKDF2"}, {"title": "OpenXcom for Android", "url": "https://github.com/sfalexrog/openxcom-android"}, {"title": "Exult - Ultima VII for Android", "url": "https://exult.sourceforge.io/"}, {"title": "Arx Libertatis - Arx Fatalis for Android", "url": "https://obfusk.gitlab.io/jekyll-fdroid/packages/com.arxlibertatis/"}, {"title": "Jagged Alliance 2 Stracciatella for Android", "url": "https://ja2-stracciatella.github.io/download/"}, {"title": "Julius - Caesar III for Android", "url": "https://github.com/bvschaik/julius/releases/tag/v1.8.0"}, {"title": "Augustus - Caesar III for Android", "url": "https://github.com/Keriew/augustus/releases/tag/v4.0.0"}, {"title": "Freeciv for Android", "url": "https://github.com/zielmicha/freeciv-android"}, {"title": "Pokemon Platinum PC Port", "url": "https://github.com/cybervisi0n/pokeplatinum"}, {"title": "Team Fortress 2 ReClassic for Android", "url": "https://files.workbench.network/srceng/TF2RC%20(TF2L)/"}, {"title": "Rexuiz for Android", "url": "https://rexuiz.itch.io/rexuiz-fps"}, {"title": "Super Mario Bros Remastered for Android", "url": "https://github.com/mircowuffwuff/super-mario-bros.-remastered-android/releases"}, {"title": "Space Cadet Pinball for Android", "url": "https://ksylvestre.itch.io/space-cadet-pinball"}, {"title": "Pinball FX GO for Android", "url": "https://play.google.com/store/apps/details?id=com.zenstudios.ZenPinballWorld&hl=en_US"}, {"title": "Sonic Roboblast 2 for Android", "url": "https://github.com/bitten2up/SRB2-Android/releases"}, {"title": "Game Collection - Portal Beta, Cuphead, Buckshot Roulette and SMM_WE for Android", "url": "https://www.mediafire.com/folder/kbbg5zosc7v9j/ChewAPKbackup"}, {"title": "Star Trek Voyager - Elite Force Single Player for Android", "url": "https://github.com/imjustadudegamer/VoyagerSP-Android"}, {"title": "Star Trek Voyager - Elite Force Holomatch for Android", "url": "https://github.com/imjustadudegamer/VoyagerHM-Android"}, {"title": "sdlioq3a - Quake III for Android", "url": "https://play.google.com/store/apps/details?id=de.fpsclasico.sdlioq3a&hl=en_IN"}, {"title": "Sonic Mania Plus for Android", "url": "https://gamejolt.com/games/sonicmaniaplusports/892889"}, {"title": "Sonic the Hedgehog Forever for Android", "url": "https://gamejolt.com/games/Sonic1ForeverAndroid/817792"}, {"title": "Sonic 2 Absolute for Android", "url": "https://gamejolt.com/games/gamejolt1234/955225"}, {"title": "Sonic CD Restored for Android", "url": "https://gamejolt.com/games/RestoredCDAndroid/1086519"}, {"title": "Render96 for Android", "url": "https://www.reddit.com/r/AynThor/s/JlKfJ41tDC"}, {"title": "Spaghetti Kart - Mario Kart 64 Recompilation for Android", "url": "https://github.com/izzy2lost/SpaghettiKart/releases/tag/v1.0.0"}, {"title": "Starship - Starfox 64 Recompilation for Android", "url": "https://github.com/izzy2lost/Starship/releases/tag/v1.0.3"}, {"title": "Ghostship - Mario 64 Recompilation for Android", "url": "https://github.com/izzy2lost/Ghostship/releases/tag/1.0.1"}, {"title": "EasyRPG Player for Android", "url": "https://easyrpg.org/player/downloads/"}, {"title": "Pizza Legacy - Pizza Tycoon Port", "url": "https://codeberg.org/cowomaly/pizzalegacy"}, {"title": "Castlevania Symphony of the Night Recompilation", "url": "https://github.com/BlackLabelHQ/SymphonyRecomp"}, {"title": "Robocop Megadrive Port", "url": "https://bocasretrostuff.itch.io/robocop-md"}, {"title": "Teenage Mutant Ninja Turtles - Out of the Shadows PC Patched", "url": "https://transfer.it/t/fR1Ii9oFRBgY"}, {"title": "Wipeout HD Fury with Multiplayer PC Patched", "url": "https://archive.org/details/wipeout-hd-rpcs3"}, {"title": "Jump Force PC Patched", "url": "https://transfer.it/t/B9VUf1hxGLAY"}, {"title": "Siren Blood Curse PC Patched", "url": "https://transfer.it/t/AvPCovlnwJpa"}, {"title": "The Legend of Spyro Dawn of the Dragon PC Patched", "url": "https://transfer.it/t/cTfVUEwhELjR"}, {"title": "Ratchet and Clank Quest For Booty PC Patched", "url": "https://transfer.it/t/KnnoEQh30ZxQ"}, {"title": "Spiderman 3 PC Patched", "url": "https://archive.org/details/spider-man-3-repack"}, {"title": "Fight Night: Champion PC Patched", "url": "https://transfer.it/t/XQwOnn5TmBya"}, {"title": "Soul Calibur IV PC Patched", "url": "https://transfer.it/t/KuTvpZsBlDzC"}, {"title": "Disgaea D2: A Brighter Darkness PC Patched", "url": "https://transfer.it/t/zhB2zuoVhRQR"}, {"title": "ModNation Racers PC Patched", "url": "https://archive.org/details/rpcs-3-latest-mod-nation-racers-online"}, {"title": "Demon's Souls PC Patched", "url": "https://archive.org/details/DemonsSoulsRPCS3"}, {"title": "Guitar Hero Metallica PC Patched", "url": "https://transfer.it/t/RMgcNyhBmJwa"}, {"title": "Bloodborne PC Patched", "url": "https://gofile.io/d/SN3T1I"}, {"title": "Never Dead PC Patched", "url": "https://transfer.it/t/lMaFbPg1TBRD"}, {"title": "God of War 3 PC Patched", "url": "https://gofile.io/d/MmVHsU"}, {"title": "Dragon's Crown PC Patched", "url": "https://transfer.it/t/UkkS9qsBXLrR"}, {"title": "Darkenstein 3D", "url": "https://store.steampowered.com/app/2195910/Darkenstein_3D/"}, {"title": "Vandal Hearts PC Port", "url": "https://github.com/HalmyLyseas/VandalHearts-PcPort"}, {"title": "MobileUO - Ultima Online Mobile Port", "url": "https://www.mobileuo.com/"}, {"title": "Pokemon Everworld Online", "url": "https://pokeeverworldonline.com/"}, {"title": "Aleph One - Marathon Trilogy for Android", "url": "https://github.com/daniele-rapagnani/alephone-android"}, {"title": "Supreme Commander Forged Alliance - Forged Alliance Forever", "url": "https://www.faforever.com/"}, {"title": "Pokemon Brown 3D", "url": "https://rainbowdevs.com/title/brown-3d/"}, {"title": "Harvest Moon 64 Recompilation with Dual Screen Support for Android", "url": "https://github.com/igawa6/HarvestMoon64Recomp/releases/"}, {"title": "Dusklight - The Legend of Zelda Twilight Princess Recompilation for Android", "url": "https://github.com/TwilitRealm/dusklight/releases"}, {"title": "Sonic Triple Trouble for Android", "url": "https://gamejolt.com/games/sonictripletrouble16bit/322794"}, {"title": "Condemned 2: Bloodshot Recompilation", "url": "https://github.com/psxrestore/Condemned2Recomp"}, {"title": "Pokemon Gamma Emerald", "url": "https://undreamedpanic.itch.io/gamma-emerald#download"}, {"title": "London Seirei Tanteidan - Playstation", "url": "https://github.com/bigbanana23/london-seirei-tanteidan"}, {"title": "Godzilla PC Patched", "url": "https://transfer.it/t/mtvSiTgXDbQK"}, {"title": "Syphon Filter 2 Recompilation", "url": "https://github.com/Alexbeav/syphon-filter-2-recompiled/releases/tag/v0.1.1-alpha"}, {"title": "AM2R Autopatcher for Android", "url": "https://github.com/am2r-android/AM2R-Autopatcher-Android"}, {"title": "Banjo Kazooie Switch Port", "url": "https://github.com/PalindromicBreadLoaf/Docklight"}, {"title": "Doom 64 Switch Port", "url": "https://www.gamebrew.org/wiki/Doom64EX_Switch"}, {"title": "Super Mario 64 Switch Port", "url": "https://github.com/fgsfdsfgs/sm64ex"}, {"title": "The Legend of Zelda Majoras Mask Switch Port", "url": "https://github.com/YoshiCrystal9/2ship2harkinian-Switch"}, {"title": "The Legend of Zelda Majoras Mask Wii U Port", "url": "https://github.com/HarbourMasters/2ship2harkinian-WiiU"}, {"title": "Star Fox 64 PSP Port", "url": "https://github.com/TheMrIron2/sf64-psp"}, {"title": "Perfect Dark PSP Port", "url": "https://github.com/z2442/perfect_dark-PSP"}, {"title": "Super Mario 64 PS4 Port", "url": "https://github.com/mindfreakdev/sm64-ps4-osirizx"}, {"title": "Perfect Dark 3DS Port", "url": "https://archive.org/details/perfectdark3ds"}, {"title": "Super Mario 64 3DS Port", "url": "https://github.com/mkst/sm64-port/tree/3ds-port"}, {"title": "Super Mario 64 Nintendo DSi Port", "url": "https://github.com/Hydr8gon/sm64"}, {"title": "Banjo Kazooie VR", "url": "https://github.com/RaYRoD-TV/BanjoKazooie-VR"}, {"title": "Super Mario 64 VR", "url": "https://github.com/RaYRoD-TV/sm64coopdx-vr"}, {"title": "Mario Kart 64 VR", "url": "https://github.com/RaYRoD-TV/MarioKart64-VR"}, {"title": "Star Fox 64 VR", "url": "https://github.com/RaYRoD-TV/StarFox64-VR"}, {"title": "Sonic Robo Blast 2 VR", "url": "https://github.com/RaYRoD-TV/SRB2-VR"}, {"title": "Dr. Robotnik's Ring Racers VR", "url": "https://github.com/RaYRoD-TV/RingRacers-VR"}, {"title": "Port of the Xash3D-FWGS Half Life Engine to Oculus Quest", "url": "https://github.com/Team-Beef-Studios/Lambda1VR"}, {"title": "Quake VR", "url": "https://github.com/Team-Beef-Studios/QuakeQuest"}, {"title": "Quake 2 on the Oculus Quest", "url": "https://github.com/Team-Beef-Studios/Quake2Quest"}, {"title": "Doom 3 VR", "url": "https://github.com/Team-Beef-Studios/Doom3Quest"}, {"title": "Return to Castle Wolfenstein for the Oculus Quest", "url": "https://github.com/Team-Beef-Studios/RTCWQuest"}, {"title": "Jedi Knight games on OpenXR Devices", "url": "https://github.com/Team-Beef-Studios/JKXR"}, {"title": "Jedi Knight games on OpenXR Devices", "url": "https://github.com/Team-Beef-Studios/JKXR"}, {"title": "Tomb Raider VR", "url": "https://github.com/Team-Beef-Studios/BeefRaiderXR"}, {"title": "Prey VR", "url": "https://sidequestvr.com/app/23478/prey-vr"}, {"title": "RazeXR - Duke Nukem 3D, Blood, Shadow Warrior, etc", "url": "https://github.com/Team-Beef-Studios/RazeXR"}, {"title": "QuestZDoom - DOOM, Heretic, Hexen, Strife, etc", "url": "https://github.com/Team-Beef-Studios/QuestZDoom?utm_source=chatgpt.com"}, {"title": "Metal Gear Solid Fan Remake", "url": "https://youtu.be/VgvFT43zUYI?si=y7qVvSA_xKXbZ4kd"}, {"title": "The Legend of Zelda Ocarina of Time VR", "url": "https://github.com/ShinyWindow/Shipwright-VR"}, {"title": "SEGA VS CAPCOM", "url": "https://4cydestudios.com/game/sega-vs-capcom"}, {"title": "Infinity Blade for Android", "url": "https://archive.org/details/infinity-blade-android"}, {"title": "Pokemon Dark Rising Remake", "url": "https://eeveeexpo.com/threads/9603/"}, {"title": "Pokemon Dark Rising Remake", "url": "https://eeveeexpo.com/threads/9603/"}, {"title": "Ys III Wanderers - Playstation 2", "url": "https://github.com/Kaisaan/wanderers/releases/tag/v1.0"}, {"title": "Ys V Lost Kefin - Playstation 2", "url": "https://github.com/Kaisaan/lostkefin"}, {"title": "Messenger", "url": "https://messenger.abeto.co/"}, {"title": "Dungeon Keeper in Browser", "url": "https://dk-browser.tiiny.site/?utm_source=chatgpt.com"}, {"title": "Dusklight - The Legend of Zelda Twilight Princess Recompilation in Browser", "url": "https://dusklight.pages.dev/"}, {"title": "The Elder Scrolls III Morrowind – OpenMW in Browser", "url": "https://morrowind.virtastic.app/"}, {"title": "Half-Life 2 in Browser", "url": "https://hl2.slqnt.dev/"}, {"title": "Portal in Browser", "url": "https://yikes.pw/portal/"}, {"title": "Diablo in Browser", "url": "https://d07riv.github.io/diabloweb/"}, {"title": "3D Pinball Space Cadet in Browser", "url": "https://ksylvestre.itch.io/space-cadet-pinball"}, {"title": "Wipeout in Browser", "url": "https://phoboslab.org/wipegame/"}, {"title": "Doom – WebPrBoom in Browser", "url": "https://raz0red.github.io/webprboom/"}, {"title": "Doom 3 Demo in Browser", "url": "https://wasm.continuation-labs.com/d3demo/"}, {"title": "Quake – Quake WASM in Browser", "url": "https://qwasm.m-h.org.uk/"}, {"title": "Quake 2 – Quake WASM2 in Browser", "url": "https://qwasm2.m-h.org.uk/"}, {"title": "Arx Fatalis – Arxwasm Demo in Browser", "url": "https://wasm.continuation-labs.com/arxdemo/"}, {"title": "Homeworld - Gardens of Kadesh Demo in Browser", "url": "https://gardens-of-kadesh.gitlab.io/gardens-of-kadesh/"}, {"title": "Cave Story in Browser", "url": "https://midzer.de/wasm/cavestory/"}, {"title": "Commander Keen in Browser", "url": "https://www.jamesfmackenzie.com/chocolatekeen/"}, {"title": "Cro-Mag Rally in Browser", "url": "https://midzer.de/wasm/cromagrally/"}, {"title": "Descent Descent II – DXX-Rebirth in Browser", "url": "https://midzer.de/wasm/descent1/"}, {"title": "Duke Nukem 3D – Belgian Chocolate Duke3D in Browser", "url": "https://midzer.de/wasm/duke3d/"}, {"title": "Fallout Nevada Sonora in Browser", "url": "https://fallout-nevada.ru/#/en"}, {"title": "Might and Magic II - fheroes2 in Browser", "url": "https://midzer.de/wasm/heroes2/"}, {"title": "Prince of Persia in Browser", "url": "https://princejs.com/"}, {"title": "Tyrian – OpenTyrian in Browser", "url": "https://midzer.de/wasm/opentyrian/"}, {"title": "Tomb Raider in Browser", "url": "http://xproger.info/projects/OpenLara/"}, {"title": "Super Monkey Ball in Browser", "url": "https://monkeyball-online.pages.dev/"}, {"title": "Tetris in Browser", "url": "https://mehmetmhy.github.io/tetris/"}, {"title": "The Last of Us Demake in Browser", "url": "https://mirtilowgames.itch.io/the-last-of-us-demastered"}, {"title": "Cyberpunk 2077 VR", "url": "https://www.nexusmods.com/cyberpunk2077/mods/30093"}, {"title": "Call of Duty 4 Modern Warfare VR", "url": "https://github.com/jplakon/CallOfDuty4_VR/releases"}, {"title": "BioShock Remastered VR", "url": "https://github.com/mohamad-balouza/bioshock-vr"}, {"title": "Skyrim VR", "url": "https://www.nexusmods.com/skyrimspecialedition/mods/107333"}, {"title": "Resident Evil Requiem VR", "url": "https://www.nexusmods.com/residentevilrequiem/mods/1017?tab=videos"}, {"title": "Silent Hill 2 VR", "url": "https://github.com/jbusfield/SH2_UEVR/releases/tag/v1.0.0"}, {"title": "Eternal Sonata Recompilation", "url": "https://github.com/birabittoh/EternalSonataReprise"}, {"title": "Call of Duty Black Ops Zombies for Android", "url": "https://github.com/eugene373/COD-BOZ-Partially-Decompiled/releases/tag/v0.3-s3e-tools"}, {"title": "Donkey Kong Land PC Remake", "url": "https://drive.google.com/file/d/1bvBYmbFtw1q-0lG1tKivm3c610-pCS4P/view"}, {"title": "The Legend of Zelda Breath of the Wild VR", "url": "https://github.com/Crementif/BotW-BetterVR"}, {"title": "Command & Conquer Generals in Browser", "url": "https://generals.wasm.com.br/"}, {"title": "Doom 2 in Doom 3", "url": "https://www.moddb.com/mods/doom-ii-for-doom-3"}, {"title": "ZQuest Classic in Browser", "url": "https://web.zquestclassic.com/play/"}, {"title": "Surreal Engine Web – Unreal UT99 in Browser", "url": "https://demensdeum.com/demos/SurrealEngine/"}, {"title": "F-Zero X PC Port", "url": "https://github.com/Zorkats/G-Diffuser"}, {"title": "Diddy Kong Racing Recompilation", "url": "https://github.com/ThatGuyMcd/DKR-R"}, {"title": "F.E.A.R. 2: Project Origin VR Mod", "url": "https://github.com/praydog/FEAR2VR"}, {"title": "Asobi: Remote Play - Stream PS Plus games to Steam Deck or Steam Machine", "url": "https://store.steampowered.com/app/4505440/Asobi_Remote_Play/"}, {"title": "Unreal Tournament VR", "url": "https://ut99vr.pages.dev/"}, {"title": "Super Mario 64 DS PC Port", "url": "https://tangos.dev/downloads"}, {"title": "Sonic the Hedgehog 2006 Android Port", "url": "https://github.com/Player124413/MarathonRecomp_android-test-edition/releases"}, {"title": "Pokemon Gold PC Port", "url": "https://github.com/bryanthaboi/gen1recomp"}, {"title": "Pokemon Gold Port for Android", "url": "https://github.com/bryanthaboi/gen1recomp"}, {"title": "Battlefield 1942 VR", "url": "https://github.com/JayBiggsGMG/BFVR-Battlefield-1942-VR-Mod/releases/tag/v1.0.0"}, {"title": "Ace Combat 6 Recompilation", "url": "https://github.com/sal063/AC6_recomp"}, {"title": "Metroid Prime Origins", "url": "https://www.reddit.com/r/Metroid/s/23ukkKGon4"}, {"title": "The Legend of Zelda: Z for 2 - Two Player Simultaneous Co-Op", "url": "https://www.romhacking.net/hacks/9882/"}, {"title": "Spyro the Dragon Recompilation", "url": "https://openpete.com/"}, {"title": "Twisted Metal 4 Recompilation", "url": "https://github.com/TechnicallyComputers/TwistedMetal4Recomp"}, {"title": "The Legend of Zelda The Minish Cap 3DS Port", "url": "https://github.com/EstebanPdN/zelda-tmc-3ds"}, {"title": "1 The Multiverse VR Hub", "url": "https://github.com/RaYRoD-TV/MVRH"}, {"title": "Untitled Sonic Fangame", "url": "https://liquafusion.itch.io/untitled-sonic-fangame"}, {"title": "Mario Kart 64 3DS Port", "url": "https://github.com/EstebanPdN/mario-kart-64-3ds"}, {"title": "Street Fighter Aplha 3 Recompilation", "url": "https://github.com/TechnicallyComputers/Street-Fighter-Alpha-3-Recomp"}, {"title": "Zenonia 3 PS Vita Port", "url": "https://github.com/MetalSyntax/zenonia3-psvita-port"}, {"title": "Crash Bandicoot for Android", "url": "https://github.com/Matteo842/CrashBandicoot-Launcher/releases"}, {"title": "World of Warcraft for Android", "url": "https://github.com/marcocastignoli/wow-mobile"}, {"title": "Ace Combat X Recompilation", "url": "https://github.com/sal063/Ace-Combat-X-Recompilation"}, {"title": "GTA: Vice City Stories Recompilation", "url": "https://github.com/jessicanataliagta/PSPRecomp/tree/main/profiles/vcs"}, {"title": "Tama: Adventurous Ball in Giddy Labyrinth - Sega Saturn", "url": "https://github.com/ExxistanceDC/Tama-English-Translation"}, {"title": "Hissatsu! - Sega Saturn", "url": "https://github.com/ExxistanceDC/Hissatsu-English-Translation"}, {"title": "Pokemon Blue VR", "url": "https://youtu.be/oY_3Uvyjy_k?si=xjiXCeK6Tx15zW20"}, {"title": "Ridge Racer Collection", "url": "https://github.com/wanszai/Ridge-Racer-Collection"}, {"title": "Spaghetti Kart - Mario Kart 64 PC Port Track Editor", "url": "https://trackeditor.goodhouseinc.com/"}, {"title": "Baldur's Gate 2: Enhanced Edition PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1454"}, {"title": "Hollow Knight: Silksong for Android", "url": "https://apkvision.org/games/action/hollow-knight-silksong-130787/"}, {"title": "Jeb's Legend of Zelda", "url": "https://gamejolt.com/games/jzelda_woohoo/1043660"}, {"title": "Outertale - Project Spacetime", "url": "https://gamejolt.com/games/outertale/643082"}, {"title": "Five Nights At Frickbear's 3", "url": "https://gamejolt.com/games/frickbears3/930477"}, {"title": "Five Nights At Frickbear's 3", "url": "https://gamejolt.com/games/frickbears3/930477"}, {"title": "Pokemon Gamma Emerald - Early Access", "url": "https://undreamedpanic.itch.io/gamma-emerald-ea"}, {"title": "Prey 2017 Co-op", "url": "https://www.nexusmods.com/prey2017/mods/218?tab=description"}, {"title": "Castlevania: Symphony of the Night for Android", "url": "https://github.com/sergiomanzur/SymphonyRecomp/releases/tag/android-v0.9b"}, {"title": "Goldeneye 007 Random-Eye-zer Mod", "url": "https://www.moddb.com/mods/random-eye-the-true-randomizer"}, {"title": "Outlast VR", "url": "https://www.patreon.com/dhalcyon/posts/nowhere-to-hide-165840706"}, {"title": "Mine64 - Minecraft for N64 in Browser", "url": "https://mine64.c0di.com/"}, {"title": "Sim Copter Reimplementation", "url": "https://github.com/JamesIV4/sim-copter-remake"}, {"title": "Dusklight - The Legend of Zelda Twilight Princess VR", "url": "https://github.com/JoeyAW/dusklight-vr/releases/"}, {"title": "Rage Racer PC Port", "url": "https://github.com/khasinski/rage-racer-pc"}, {"title": "Pokemon Dawn of Darkness MMORPG", "url": "https://pdod.dev/"}, {"title": "Metroid Prime Hunters Recompilation", "url": "https://github.com/mstan/MetroidPrimeHuntersRecomp"}, {"title": "Dragon Ball Z: Buu's Fury Recompilation", "url": "https://github.com/mstan/DragonBallZBuusFuryRecomp"}, {"title": "ChonkCraft - Warcraft 2 Rebuilt", "url": "https://chonkbase.net/chonkcraft/"}, {"title": "Street Fighter 3: 3rd Strike Online Edition Recompilation", "url": "https://github.com/updeshxp/SF3TSOEReborn"}, {"title": "Jackie Chan Stuntmaster PC Port", "url": "https://github.com/GABRIELNNK/ReChan"}, {"title": "Jackie Chan Stuntmaster PC Port - Steam Deck Fork", "url": "https://github.com/GABRIELNNK/ReChan/releases/tag/ReChan_v1.0.2-beta_Steamdeck"}, {"title": "Fallout New Vegas: Tale of Two Wastelands", "url": "https://taleoftwowastelands.com/"}, {"title": "Sonic 4 Episode 1 in Browser", "url": "https://wamwoowam.co.uk/sonic4/"}, {"title": "Sonic the Hedgehog for Android", "url": "https://sonic-the-hedgehog.en.uptodown.com/android"}, {"title": "Sonic the Hedgehog 2 for Android", "url": "https://sonic-the-hedgehog-2-classic.en.uptodown.com/android"}, {"title": "Lighthouse - Banjo Kazooie Port for Android", "url": "https://github.com/izzy2lost/Lighthouse/releases/tag/1.0.2"}, {"title": "Lighthouse - Banjo Kazooie PS Vita Port", "url": "https://www.rinnegatamante.eu/vitadb/#/info/1468"}, {"title": "Tony Hawk's Project 8 Recompilation", "url": "https://github.com/theokyr/Project8Recomp"}, {"title": "Mega Man X Regenesis", "url": "https://mmxregenesis.itch.io/mega-man-x-regenesis"}, {"title": "Grand Theft Auto Vice City VR", "url": "https://github.com/dubrovskiy-yevhen-stakelogic/vice-city-vr-quest/tree/master"}, {"title": "Minecraft: Story Mode PS Vita Port", "url": "https://github.com/LeZergan/mcsm-vita"}, {"title": "1 The Multiverse VR Hub", "url": "https://github.com/RaYRoD-TV/MVRH"}, {"title": "Zelda II: The Adventure of Link Co-op", "url": "https://retrohackers.net/hack-details.php?id=5243"}, {"title": "Resident Evil 4 VR", "url": "https://re4vr.com/"}, {"title": "Jedi Knight: Dark Forces II Xbox Port", "url": "https://github.com/GTTeancum/OpenJKDF2ogx"}, {"title": "Yu-Gi-Oh! Forbidden Memories Recompilation", "url": "https://github.com/Unchiga/YuGiOhForbiddenMemoriesRecomp"}, {"title": "DONTFORGET", "url": "https://rickygdev.itch.io/dontforget"}, {"title": "DONTFORGET", "url": "https://rickygdev.itch.io/dontforget"}, {"title": "RIBBIT - The Deltarune Mod", "url": "https://gamejolt.com/games/ribbitmod/671888"}, {"title": "Kirby Battle Blitz!", "url": "https://gamejolt.com/games/KBB/578480"}, {"title": "Mega Man 8-Bit Deathmatch", "url": "https://mm8bdm.net/home"}, {"title": "OFF", "url": "https://off.fandom.com/wiki/Downloads#Version_3.0_Downloads"}, {"title": "FreeCiv in Browser", "url": "https://webciv.org/webclient/?action=new&type=singleplayer&utm"}, {"title": "Dune 2 in Browser", "url": "https://dune2js.com/"}, {"title": "Kiki the Nano Bot in Browser", "url": "https://transmutrix.itch.io/kiki-the-nanobot"}, {"title": "Moon Child FE in Browser", "url": "https://mors-games.itch.io/moon-child-fe"}, {"title": "Undertale 2", "url": "https://pep.itch.io/undertale-2"}, {"title": "Deltatraveler - Deltarune Interdream", "url": "https://interdream.teamcinnabun.com/other/"}, {"title": "Skate 3 Recompilation for Android", "url": "https://github.com/Buku313/Skate3-Mobile"}, {"title": "Castlevania MX", "url": "https://www.moddb.com/games/castlevania-mx"}, {"title": "Project Gotham Racing 4 Recompilation", "url": "https://github.com/beatrixzy/PGR4-Recomp"}, {"title": "Dragon Quest VIII: Masterpiece Reborn PC Port", "url": "https://www.romhacking.net/forum/index.php?topic=34365.msg443220#msg443220"}, {"title": "Dragon Quest VIII: Masterpiece Reborn for Android", "url": "https://www.romhacking.net/forum/index.php?topic=34365.msg426869#msg426869"}, {"title": "Amnesia: The Dark Descent for Android", "url": "https://createam.itch.io/sclerosis"}, {"title": "Penumbra: Black Plague for Android", "url": "https://createam.itch.io/antumbra"}, {"title": "Grand Theft Auto Vice City in Browser", "url": "https://revc.wasm.ltd/"}, {"title": "Virtua Cop 2 VR", "url": "https://github.com/NeuralF/Rea-Virtua-Cop-2-VR"}, {"title": "OpenXCOM Nintendo 3DS Port", "url": "https://github.com/TheRumble/OpenXCOM-3DS"}, {"title": "Command & Conquer 64 PC Port", "url": "https://cnc3dgame.com/"}, {"title": "Star Wars: Masters of Teras Kasi Recompilation", "url": "https://github.com/TechnicallyComputers/MastersOfTerasKasiRecomp"}, {"title": "Rampage Through Time Recompilation", "url": "https://github.com/TechnicallyComputers/Rampage---Through-Time-Recomp"}, {"title": "System Shock for Android", "url": "https://github.com/raposomiguel50/system-shock-android"}, {"title": "Red Faction VR", "url": "https://github.com/CactusVRStudios/alpinefactionVR"}, {"title": "RPG Maker DS+ Create the New World - Nintendo DS", "url": "https://romhackplaza.org/translations/rpg-maker-ds-create-the-new-world-english-translation-nintendo-ds"}, {"title": "Hollow Knight: Silksong Dual-Screen Android Port", "url": "https://github.com/jakobkhansen/SilksongAndroid"}, {"title": "Doom 64 Ray Tracing", "url": "https://github.com/jlrouzies-fr/doom64-rt"}, {"title": "Bloody Roar 2 Recompilation", "url": "https://github.com/novapowers0/BloodyRoar2Recomp"}, {"title": "Terraria in Browser", "url": "https://terraria.mercurywork.shop/"}, {"title": "Celeste in Browser", "url": "https://celeste.r58playz.dev/"}];
\ No newline at end of file
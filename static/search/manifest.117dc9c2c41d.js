@@ -0,0 +1 @@
+window.__SEARCH_MANIFEST__ = {"count": 2794, "shards": {"0": "/search/0.0c2c501743d2.json", "1": "/search/1.f5a1be1af0ff.json", "2": "/search/2.7c24edc8273d.json", "3": "/search/3.7eeb44705ecd.json", "4": "/search/4.52e340dfd400.json", "5": "/search/5.1d6c758f98c3.json", "6": "/search/6.3ab6899b89df.json", "7": "/search/7.f52fb194c7ba.json", "8": "/search/8.7471eca924da.json", "9": "/search/9.f0c158089e23.json", "a": "/search/a.f842b947d687.json", "b": "/search/b.e38d908fab4d.json", "c": "/search/c.cf7424464919.json", "d": "/search/d.0470cf108c94.json", "e": "/search/e.055c9e26b300.json", "f": "/search/f.eddf24e16f71.json", "g": "/search/g.751f46198241.json", "h": "/search/h.10a0097625c4.json", "i": "/search/i.6dad6a2ec62b.json", "j": "/search/j.bb021553e4f3.json", "k": "/search/k.d678eff0ac9b.json", "l": "/search/l.8754ce4f9e48.json", "m": "/search/m.c9a20899b8e8.json", "n": "/search/n.93e970befdda.json", "o": "/search/o.34659334a3b8.json", "p": "/search/p.fa7c837b6d07.json", "q": "/search/q.ca12d701ea01.json", "r": "/search/r.daeefa3708ab.json", "s": "/search/s.b25fecf3950f.json", "t": "/search/t.44c2bd2cee64.json", "u": "/search/u.b4c6a9a30fc8.json", "v": "/search/v.1c44bdcfd256.json", "w": "/search/w.e1e0c046308e.json", "x": "/search/x.a3217402e59f.json", "y": "/search/y.0d7946af4a53.json", "z": "/search/z.2a19f552b6a9.json"}};
\ No newline at end of file
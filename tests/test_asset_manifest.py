@@ -0,0 +1,75 @@
+"""
+Previous versions in tools/asset_manifest.py.
+
+Run with: python3 -m unittest discover tests
+"""
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+import asset_manifest  # noqa: E402
+
+class PublishTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.static = Path(tmp.name) / "static"
+        self.manifest = Path(tmp.name) / "asset_manifest.json"
+        self.restored = []
+        for patch in (
+            mock.patch.object(asset_manifest, "STATIC_DIR", self.static),
+            mock.patch.object(asset_manifest, "MANIFEST_PATH", self.manifest),
+            mock.patch.object(asset_manifest, "_committed_manifest", None),
+            mock.patch.object(asset_manifest, "_git", self.fake_git),
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+        # What the live site serves: a deploy build of "v2", after "v1".
+        self.committed = {}
+        self.live = self.publish("v1")
+        self.previous, self.live = self.live, self.publish("v2")
+        self.committed = json.loads(self.manifest.read_text())
+        self.assertEqual(self.committed["previous"]["js/data.js"], self.previous)
+
+    def fake_git(self, *args):
+        if args[0] == "rev-parse":
+            return b"HEAD" if self.committed else None
+        if args[0] == "show":
+            return json.dumps(self.committed).encode()
+        if args[0] == "checkout":
+            self.restored.append(args[-1])
+            (self.static.parent / args[-1]).write_text("restored")
+        return b""
+
+    def publish(self, content):
+        asset_manifest._committed_manifest = None
+        return asset_manifest.publish("js/data.js", content)
+
+    def on_disk(self):
+        return sorted("/js/" + p.name for p in (self.static / "js").iterdir())
+
+    def test_preview_then_deploy_leaves_the_committed_state(self):
+        preview = self.publish("v2 with hidden features")
+        self.assertEqual(json.loads(self.manifest.read_text())["previous"]["js/data.js"], self.live)
+        self.assertEqual(self.on_disk(), sorted([preview, self.live]))
+
+        self.assertEqual(self.publish("v2"), self.live)
+        self.assertEqual(json.loads(self.manifest.read_text()), self.committed)
+        self.assertEqual(self.restored, ["static" + self.previous])
+        self.assertEqual(self.on_disk(), sorted([self.live, self.previous]))
+
+    def test_new_content_keeps_the_live_version_as_previous(self):
+        self.publish("v2 with hidden features")
+        url = self.publish("v3")
+        data = json.loads(self.manifest.read_text())
+        self.assertEqual(data["files"]["js/data.js"], url)
+        self.assertEqual(data["previous"]["js/data.js"], self.live)
+        self.assertEqual(self.on_disk(), sorted([url, self.live]))
+
+if __name__ == "__main__":
+    unittest.main()
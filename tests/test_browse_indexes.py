@@ -0,0 +1,42 @@
+"""
+Game positions in tools/generate_browse_indexes.py.
+
+Run with: python3 -m unittest discover tests
+"""
+import json
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+from catalog import Game  # noqa: E402
+from generate_browse_indexes import build_all, raw_positions  # noqa: E402
+
+class RawPositionsTest(unittest.TestCase):
+    def setUp(self):
+        # Hugo's site.Data.games keeps the null and the string; load_games() does not.
+        self.raw = [
+            {"id": 1, "title": "Beta", "link": "https://example.com/", "series": "Saga"},
+            None,
+            "not a game",
+            {"id": 2, "title": "Alpha", "link": "https://example.com/", "series": "Saga", "category": "utility"},
+        ]
+        self.games = [Game(x) for x in self.raw if isinstance(x, dict)]
+
+    def test_positions_skip_entries_load_games_skips(self):
+        self.assertEqual(raw_positions(json.dumps(self.raw).encode()), [0, 3])
+
+    def test_indexes_point_into_the_raw_array(self):
+        positions = raw_positions(json.dumps(self.raw).encode())
+        payload = build_all(self.games, positions)["all"]
+        titles = [self.raw[p]["title"] for p in payload["series_games"]["saga"]]
+        self.assertEqual(titles, ["Alpha", "Beta"])
+        self.assertEqual(payload["category_games"], {"utilities": [3]})
+
+    def test_default_positions_are_list_order(self):
+        payload = build_all(self.games)["all"]
+        self.assertEqual(payload["series_games"]["saga"], [1, 0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Id index and lazy records in tools/catalog_snapshot.py.
+
+Run with: python3 -m unittest discover tests
+"""
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+from catalog import Game  # noqa: E402
+from catalog_snapshot import Snapshot, compile_snapshot  # noqa: E402
+
+ENTRIES = [
+    {"id": 7, "title": "Alpha", "category": "Action", "date_added": "2026-01-02"},
+    {"id": 9, "title": "Beta", "hidden": True},
+    {"title": "No id"},
+    {"id": 7, "title": "Alpha again", "hidden": True},
+] + [{"id": 100 + i, "title": f"Game {i}", "hidden": i % 3 == 0} for i in range(50)]
+
+class SnapshotTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        src = Path(tmp.name) / "games.json"
+        src.write_text(json.dumps(ENTRIES), encoding="utf-8")
+        self.snap = Snapshot(compile_snapshot(src, Path(tmp.name) / "games.snapshot"))
+
+    def test_find_returns_the_first_record_for_an_id(self):
+        self.assertEqual(self.snap.find(7), 0)
+        self.assertFalse(self.snap.hidden(0))
+        self.assertEqual(self.snap.find(9), 1)
+        self.assertTrue(self.snap.hidden(1))
+        for i in range(50):
+            self.assertEqual(self.snap.find(100 + i), 4 + i)
+        self.assertIsNone(self.snap.find(8))
+        self.assertIsNone(self.snap.find(-1))
+
+    def test_visibility_matches_the_json(self):
+        expected = {}
+        for g in ENTRIES:
+            if "id" in g:
+                expected.setdefault(g["id"], g.get("hidden") is True)
+        self.assertEqual(self.snap.visibility(), expected)
+
+    def test_games_decode_lazily_to_the_same_records(self):
+        games = self.snap.games()
+        self.assertEqual(len(games), len(ENTRIES))
+        self.assertEqual(games._games.count(None), len(ENTRIES))
+        self.assertEqual(games[-1].title, "Game 49")
+        self.assertEqual(games._games.count(None), len(ENTRIES) - 1)
+        self.assertIs(games[-1], games[len(ENTRIES) - 1])
+        self.assertEqual([g.title for g in games[1:3]], ["Beta", "No id"])
+        for got, raw in zip(games, ENTRIES):
+            want = Game(raw)
+            for name in ("id", "title", "slug", "category", "hidden", "added"):
+                self.assertEqual(getattr(got, name), getattr(want, name))
+            self.assertEqual(got.raw, want.raw)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""
+Item images in tools/generate_rss_feed.py.
+
+Run with: python3 -m unittest discover tests
+"""
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+from catalog import Game  # noqa: E402
+from generate_rss_feed import build_item  # noqa: E402
+
+BASE = "https://example.com/"
+
+def game(title, **fields):
+    return Game({"id": 1, "title": title, "link": "https://example.com/", "date_added": "2026-01-02", **fields})
+
+class ItemImageTest(unittest.TestCase):
+    def test_manifest_is_looked_up_by_image_stem_not_page_slug(self):
+        # Page slug "0-a-d" and "castlevania-ii-simon-s-quest"; the files are named by urlize.
+        images = {
+            "0-a.d.": "/Images/Games/canonical.webp",
+            "castlevania-ii-simons-quest": "/Images/Games/castlevania-ii-simons-quest.png",
+        }
+        item = build_item(game("0 A.D."), BASE, images)
+        self.assertIn(f'<enclosure url="{BASE}Images/Games/canonical.webp"', item)
+        self.assertNotIn("0-a-d.webp", item)
+        item = build_item(game("Castlevania II: Simon's Quest"), BASE, images)
+        self.assertIn(f"{BASE}Images/Games/castlevania-ii-simons-quest.png", item)
+        self.assertIn('type="image/png"', item)
+
+    def test_superscript_digits_are_dropped_like_hugo(self):
+        item = build_item(game("Pikmin 1\u00b2"), BASE, {"pikmin-1": "/Images/Games/pikmin-1.webp"})
+        self.assertIn(f"{BASE}Images/Games/pikmin-1.webp", item)
+
+    def test_unknown_stem_falls_back_to_the_conventional_file(self):
+        item = build_item(game("Simon's Quest"), BASE, {})
+        self.assertIn(f"{BASE}Images/Games/simons-quest.webp", item)
+
+    def test_image_field_wins(self):
+        item = build_item(game("0 A.D.", image="/Images/Games/custom.jpg"), BASE, {"0-a.d.": "/Images/Games/other.webp"})
+        self.assertIn(f"{BASE}Images/Games/custom.jpg", item)
+        self.assertNotIn("other.webp", item)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""
+Word index and shards in tools/search_index.py.
+
+Run with: python3 -m unittest discover tests
+"""
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+from search_index import build_token_index, shard_keys, word_postings  # noqa: E402
+
+ENTRIES = [(0, "Minecraft"), (2, "Super Mario 64"), (5, "Mario Kart: Double Dash!!"), (9, "Pokémon Crystal")]
+
+def decode(deltas):
+    out, pos = [], 0
+    for d in deltas:
+        pos += d
+        out.append(pos)
+    return out
+
+class TokenIndexTest(unittest.TestCase):
+    def test_postings_are_delta_encoded_catalog_positions(self):
+        postings = word_postings(ENTRIES)
+        index = build_token_index(postings, postings)
+        self.assertEqual(index["w"], sorted(index["w"]))
+        self.assertNotIn("ids", index)
+        by_word = dict(zip(index["w"], map(decode, index["p"])))
+        self.assertEqual(by_word["mario"], [2, 5])
+        self.assertEqual(by_word["pokemon"], [9])
+
+    def test_a_word_is_in_the_shard_of_every_character_it_contains(self):
+        # "craft" (mid-word in "minecraft") and "ario" must both be answerable
+        # from the shard of their own first character.
+        self.assertIn("c", shard_keys("minecraft"))
+        self.assertIn("a", shard_keys("mario"))
+        self.assertEqual(shard_keys("64"), ["4", "6"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Record diffing in tools/watch.py.
+
+Run with: python3 -m unittest discover tests
+"""
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tools"))
+
+from catalog import Game  # noqa: E402
+from watch import diff_catalog  # noqa: E402
+
+def game(game_id, title, **fields):
+    return Game({"id": game_id, "title": title, "link": "https://example.com/", **fields})
+
+class DiffCatalogTest(unittest.TestCase):
+    def setUp(self):
+        # Like games.json, where id 2198 belongs to two different games.
+        self.old = [
+            game(1, "Alpha"),
+            game(2198, "Resident Evil Requiem - Merchant"),
+            game(2, "Beta"),
+            game(2198, "Animal Crossing Gamecube Web Port"),
+        ]
+
+    def test_no_change(self):
+        self.assertFalse(diff_catalog(self.old, list(self.old)))
+
+    def test_edit_first_of_duplicated_id(self):
+        new = list(self.old)
+        new[1] = game(2198, "Resident Evil Requiem - Merchant Mod")
+        diff = diff_catalog(self.old, new)
+        self.assertTrue(diff)
+        self.assertEqual(len(diff.changed), 1)
+        (old, edited, names), = diff.changed.values()
+        self.assertEqual(old.title, "Resident Evil Requiem - Merchant")
+        self.assertEqual(edited.title, "Resident Evil Requiem - Merchant Mod")
+        self.assertIn("title", names)
+        self.assertFalse(diff.added or diff.removed or diff.reordered)
+
+    def test_hide_second_of_duplicated_id(self):
+        new = list(self.old)
+        new[3] = game(2198, "Animal Crossing Gamecube Web Port", hidden=True)
+        diff = diff_catalog(self.old, new)
+        (_, edited, names), = diff.changed.values()
+        self.assertEqual(edited.title, "Animal Crossing Gamecube Web Port")
+        self.assertEqual(names, frozenset({"hidden"}))
+
+    def test_remove_one_of_duplicated_id(self):
+        new = self.old[:3]
+        diff = diff_catalog(self.old, new)
+        self.assertEqual([g.title for g in diff.removed], ["Animal Crossing Gamecube Web Port"])
+        self.assertFalse(diff.changed)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Content-hashed output files for the Python generators.
+
+Generators used to write fixed names into static/ (js/tge-catalog.js,
+search-index.js, search/*.json) and templates added `?v={{ now.Unix }}`,
+which changes on every build and so forces revalidation on every visit.
+publish() instead writes `<name>.<hash><ext>` and records it in
+data/asset_manifest.json, which layouts/partials/asset-url.html resolves:
+
+  {"files": {"js/tge-catalog.js": "/js/tge-catalog.3f2a9c1b7d4e.js", ...},
+   "previous": {"js/tge-catalog.js": "/js/tge-catalog.0b1c2d3e4f5a.js", ...}}
+
+A hashed file never changes, so static/_headers serves these with a
+year-long immutable Cache-Control.
+
+The hashed files and the manifest are committed: Netlify builds the site
+from the repository with Hugo alone, and deploy.sh commits what
+`build.py --search-include-hidden 1 --feature-include-hidden 0` writes.
+The committed manifest (git HEAD) is therefore what the live site serves,
+and "previous" is worked out from it rather than from the working copy:
+
+- if a build writes the committed version, the committed previous stays;
+- otherwise the committed version becomes "previous", so pages cached
+  from the live site still load their data after the next deploy.
+
+Any other version is deleted. A preview build (preview.sh, with hidden
+games in the features) thus leaves nothing behind once deploy.sh has
+rebuilt with the deploy settings, and a committed previous file it had
+removed is checked out again. Outside a git checkout the working manifest
+is used instead.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+import instrument
+from catalog import PROJECT_ROOT
+
+STATIC_DIR = PROJECT_ROOT / "static"
+MANIFEST_NAME = "data/asset_manifest.json"
+MANIFEST_PATH = PROJECT_ROOT / MANIFEST_NAME
+HASH_LEN = 12
+
+_lock = threading.Lock()
+_committed_manifest: Optional[Dict[str, Dict[str, str]]] = None
+
+def _git(*args: str) -> Optional[bytes]:
+    try:
+        done = subprocess.run(["git", *args], cwd=PROJECT_ROOT, capture_output=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return done.stdout
+
+def _committed() -> Optional[Dict[str, Dict[str, str]]]:
+    """data/asset_manifest.json at git HEAD, read once; None outside a git checkout."""
+    global _committed_manifest
+    if _committed_manifest is None:
+        if _git("rev-parse", "--verify", "-q", "HEAD") is None:
+            return None
+        raw = _git("show", "HEAD:" + MANIFEST_NAME)
+        try:
+            data = json.loads(raw) if raw else {}
+        except ValueError:
+            data = {}
+        _committed_manifest = {"files": dict(data.get("files") or {}), "previous": dict(data.get("previous") or {})}
+    return _committed_manifest
+
+def _read() -> Dict[str, Dict[str, str]]:
+    try:
+        data = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        data = {}
+    return {"files": dict(data.get("files") or {}), "previous": dict(data.get("previous") or {})}
+
+def _write(data: Dict[str, Dict[str, str]]) -> None:
+    data = {section: dict(sorted(items.items())) for section, items in data.items()}
+    payload = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+    if MANIFEST_PATH.exists() and MANIFEST_PATH.read_text(encoding="utf-8") == payload:
+        return
+    tmp = MANIFEST_PATH.with_suffix(".tmp")
+    tmp.write_text(payload, encoding="utf-8")
+    tmp.replace(MANIFEST_PATH)
+
+def _versions(logical: str) -> Iterable[Path]:
+    """Every hashed file on disk for a logical name."""
+    path = STATIC_DIR / logical
+    if not path.parent.is_dir():
+        return []
+    pattern = re.compile(re.escape(path.stem) + r"\.[0-9a-f]{%d}" % HASH_LEN + re.escape(path.suffix) + "$")
+    return [p for p in path.parent.iterdir() if pattern.match(p.name)]
+
+def _url(path: Path) -> str:
+    return "/" + path.relative_to(STATIC_DIR).as_posix()
+
+def publish(logical: str, content: Union[str, bytes]) -> str:
+    """Write `content` as static/<logical> with a content hash in its name; returns its URL."""
+    data = content.encode("utf-8") if isinstance(content, str) else content
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LEN]
+    target = STATIC_DIR / logical
+    hashed = target.with_name(f"{target.stem}.{digest}{target.suffix}")
+    if not hashed.exists():
+        hashed.parent.mkdir(parents=True, exist_ok=True)
+        tmp = hashed.with_name(hashed.name + ".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(hashed)
+        instrument.wrote(hashed)
+    else:
+        instrument.count("files_unchanged")
+    url = _url(hashed)
+
+    with _lock:
+        manifest = _read()
+        base = _committed() or manifest
+        live = base["files"].get(logical)
+        previous = base["previous"].get(logical) if live == url else live
+        manifest["files"][logical] = url
+        if previous:
+            manifest["previous"][logical] = previous
+            if not (STATIC_DIR / previous.lstrip("/")).exists():
+                _git("checkout", "HEAD", "--", "static" + previous)
+        else:
+            manifest["previous"].pop(logical, None)
+        _write(manifest)
+        keep = {url, previous}
+        for old in _versions(logical):
+            if _url(old) not in keep:
+                old.unlink()
+        # The unhashed name from before this manifest existed.
+        target.unlink(missing_ok=True)
+    return url
+
+def retire(logical: str) -> None:
+    """Drop a logical file and every hashed version of it."""
+    with _lock:
+        manifest = _read()
+        manifest["files"].pop(logical, None)
+        manifest["previous"].pop(logical, None)
+        _write(manifest)
+        for old in _versions(logical):
+            old.unlink()
+        (STATIC_DIR / logical).unlink(missing_ok=True)
+
+def published(prefix: str = "") -> Dict[str, str]:
+    """Current {logical: url} entries whose logical name starts with `prefix`."""
+    with _lock:
+        return {k: v for k, v in _read()["files"].items() if k.startswith(prefix)}
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Audit static/Images: duplicates, orphans, missing artwork and oversized files.
+
+static/Images is copied into public/ and uploaded on every deploy, so dead
+weight costs upload time and CDN storage. This hashes the whole tree in
+parallel (SHA-256) and reports:
+
+- duplicate groups: byte-identical files and the bytes they waste
+- unreferenced: Games/Series images that no catalog slug resolves to
+- missing: games and series (2+ games) that have no image
+- oversized: files whose byte size is large for their pixel count
+  (bytes per pixel above --max-bpp)
+
+With --dedupe, duplicates inside Games/ and Series/ are collapsed onto one
+canonical file: the others are deleted and recorded in
+data/image_aliases.json, which generate_image_manifest.py folds into
+data/image_manifest.json so templates still resolve every slug.
+
+Usage:
+  python3 tools/audit_images.py
+  python3 tools/audit_images.py --json audit.json
+  python3 tools/audit_images.py --dedupe
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+import generate_image_manifest
+from catalog import hugo_urlize, iter_games
+from generate_image_manifest import ALIASES_PATH, EXT_PRIORITY, IMAGES_DIR, SECTIONS, STATIC_DIR
+from image_info import image_dimensions
+
+IMAGE_SUFFIXES = {".webp", ".jpg", ".jpeg", ".png", ".gif"}
+
+def sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def list_images(root: Path) -> List[Path]:
+    out: List[Path] = []
+    for dirpath, _dirs, files in os.walk(root):
+        for name in files:
+            if Path(name).suffix.lower() in IMAGE_SUFFIXES:
+                out.append(Path(dirpath) / name)
+    return sorted(out)
+
+def hash_tree(paths: List[Path], jobs: int) -> Dict[Path, str]:
+    # hashlib releases the GIL on large buffers, so threads scale here.
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return dict(zip(paths, pool.map(sha256_file, paths)))
+
+def referenced_slugs() -> Tuple[Dict[str, Set[str]], Set[str], Dict[str, str], Counter]:
+    """({section: referenced stems}, explicit image paths, {card stem: title}, series key counts)."""
+    card_stems: Dict[str, str] = {}
+    game_refs: Set[str] = set()
+    explicit: Set[str] = set()
+    series_counts: Counter = Counter()
+    for g in iter_games():
+        stem = hugo_urlize(g.title)
+        if stem:
+            card_stems.setdefault(stem, g.title)
+            game_refs.add(stem)
+        if g.slug:
+            # /game/<slug>/ pages resolve their image by the page slug.
+            game_refs.add(g.slug)
+        if g.image and not g.image.startswith(("http://", "https://")):
+            explicit.add("/" + g.image.lstrip("/"))
+        if g.series_key:
+            series_counts[g.series_key] += 1
+    refs = {"games": game_refs, "series": set(series_counts)}
+    return refs, explicit, card_stems, series_counts
+
+def rel(path: Path) -> str:
+    return "/" + path.relative_to(STATIC_DIR).as_posix()
+
+def section_of(path: Path) -> Tuple[str, str]:
+    """(manifest section, stem) for files directly in a manifest folder, else ("", "")."""
+    parent = path.parent
+    for section, folder in SECTIONS.items():
+        if parent == IMAGES_DIR / folder:
+            return section, path.stem
+    return "", ""
+
+def audit(jobs: int, max_bpp: float) -> Dict[str, object]:
+    paths = list_images(IMAGES_DIR)
+    hashes = hash_tree(paths, jobs)
+    sizes = {p: p.stat().st_size for p in paths}
+
+    by_hash: Dict[str, List[Path]] = defaultdict(list)
+    for p, digest in hashes.items():
+        by_hash[digest].append(p)
+    duplicates = [sorted(group) for group in by_hash.values() if len(group) > 1]
+    duplicates.sort(key=lambda group: -sizes[group[0]] * (len(group) - 1))
+
+    refs, explicit, card_stems, series_counts = referenced_slugs()
+    present: Dict[str, Set[str]] = {section: set() for section in SECTIONS}
+    unreferenced: List[str] = []
+    for p in paths:
+        section, stem = section_of(p)
+        if not section or p.suffix.lower().lstrip(".") not in EXT_PRIORITY:
+            continue
+        present[section].add(stem)
+        if stem not in refs[section] and rel(p) not in explicit:
+            unreferenced.append(rel(p))
+
+    missing_games = sorted(title for stem, title in card_stems.items() if stem not in present["games"])
+    missing_series = sorted(key for key, n in series_counts.items() if n >= 2 and key not in present["series"])
+
+    oversized = []
+    for p in paths:
+        dims = image_dimensions(p)
+        if not dims or not dims[0] or not dims[1]:
+            continue
+        bpp = sizes[p] / (dims[0] * dims[1])
+        if bpp > max_bpp:
+            oversized.append({"path": rel(p), "bytes": sizes[p], "width": dims[0], "height": dims[1], "bpp": round(bpp, 3)})
+    oversized.sort(key=lambda x: -x["bytes"])
+
+    return {
+        "files": len(paths),
+        "bytes": sum(sizes.values()),
+        "duplicates": [
+            {"sha256": hashes[g[0]], "bytes": sizes[g[0]], "paths": [rel(p) for p in g]}
+            for g in duplicates
+        ],
+        "duplicate_waste_bytes": sum(sizes[g[0]] * (len(g) - 1) for g in duplicates),
+        "unreferenced": unreferenced,
+        "missing_games": missing_games,
+        "missing_series": missing_series,
+        "oversized": oversized,
+        "_refs": refs,
+        "_explicit": explicit,
+    }
+
+def dedupe(report: Dict[str, object]) -> Tuple[int, int]:
+    """Collapse duplicate groups inside the manifest folders. Returns (files removed, bytes saved)."""
+    refs: Dict[str, Set[str]] = report["_refs"]  # type: ignore[assignment]
+    explicit: Set[str] = report["_explicit"]  # type: ignore[assignment]
+    aliases: Dict[str, Dict[str, str]] = {}
+    if ALIASES_PATH.exists():
+        aliases = json.loads(ALIASES_PATH.read_text(encoding="utf-8"))
+
+    removed = saved = 0
+    moved: Dict[str, str] = {}
+    for group in report["duplicates"]:  # type: ignore[union-attr]
+        members = [(src, *section_of(STATIC_DIR / src.lstrip("/"))) for src in group["paths"]]
+        # Only files the manifest resolves can be replaced by an alias;
+        # explicit image paths in games.json must keep pointing at a real file.
+        managed = [m for m in members if m[1] and m[0] not in explicit]
+        if not managed:
+            continue
+        unmanaged = [m for m in members if m not in managed]
+        # Prefer a file that has to stay anyway, then one that is actually
+        # referenced, then the shortest path.
+        keep = min(
+            unmanaged or managed,
+            key=lambda m: (m[2] not in refs.get(m[1], set()), len(m[0]), m[0]),
+        )
+        for src, section, stem in managed:
+            if src == keep[0]:
+                continue
+            (STATIC_DIR / src.lstrip("/")).unlink()
+            aliases.setdefault(section, {})[stem] = keep[0]
+            moved[src] = keep[0]
+            removed += 1
+            saved += group["bytes"]
+
+    # Earlier aliases may point at a file that was just removed.
+    for items in aliases.values():
+        for stem, target in items.items():
+            items[stem] = moved.get(target, target)
+
+    if removed:
+        aliases = {section: dict(sorted(items.items())) for section, items in sorted(aliases.items())}
+        ALIASES_PATH.write_text(json.dumps(aliases, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        generate_image_manifest.main()
+    return removed, saved
+
+def print_report(report: Dict[str, object], limit: int) -> None:
+    def section(title: str, rows: List[str]) -> None:
+        print(f"\n{title} ({len(rows)})")
+        for row in rows[:limit]:
+            print(f"  {row}")
+        if len(rows) > limit:
+            print(f"  ... {len(rows) - limit} more")
+
+    mb = 1024 * 1024
+    print(f"Images: files={report['files']}, size={report['bytes'] / mb:.1f} MB")
+    section(
+        f"Duplicate groups, {report['duplicate_waste_bytes'] / mb:.1f} MB wasted",
+        [f"{g['bytes']:>9} B  " + "  ==  ".join(g["paths"]) for g in report["duplicates"]],
+    )
+    section("Unreferenced images", report["unreferenced"])
+    section("Games without an image", report["missing_games"])
+    section("Series (2+ games) without an image", report["missing_series"])
+    section(
+        "Oversized for their dimensions",
+        [f"{o['bytes']:>9} B  {o['width']}x{o['height']}  {o['bpp']} B/px  {o['path']}" for o in report["oversized"]],
+    )
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 4)
+    ap.add_argument("--max-bpp", type=float, default=0.4, help="flag files above this many bytes per pixel (default 0.4)")
+    ap.add_argument("--limit", type=int, default=25, help="rows to print per section")
+    ap.add_argument("--json", dest="json_out", help="also write the full report to this file")
+    ap.add_argument("--dedupe", action="store_true", help="delete duplicates in Games/ and Series/ and alias them")
+    args = ap.parse_args()
+
+    report = audit(max(1, args.jobs), args.max_bpp)
+    print_report(report, args.limit)
+    if args.json_out:
+        public = {k: v for k, v in report.items() if not k.startswith("_")}
+        Path(args.json_out).write_text(json.dumps(public, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"\nWrote {args.json_out}")
+    if args.dedupe:
+        removed, saved = dedupe(report)
+        print(f"\nDedupe: removed={removed}, saved={saved / (1024 * 1024):.1f} MB, aliases={ALIASES_PATH}")
+
+if __name__ == "__main__":
+    main()
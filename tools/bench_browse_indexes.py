@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Compare data/browse_indexes.json with the old embedded format.
+
+The old generator embedded a full copy of every game dict in series_games
+and genre_games, for both the "all" and "visible" variants. This rebuilds
+that layout in memory from the id-referenced payload (same games, same
+order) and reports, for both:
+
+- build time of the payload
+- file size (raw and gzip)
+- Python json.loads time, median of --repeat runs. Hugo decodes every
+  data/*.json file into site.Data at startup, so this estimates how that
+  part of the Hugo build scales with the file; it is not a Hugo timing.
+- category page selection: the old layouts/categories/single.html ran
+  `where` over the whole catalog (hidden filter, then category and its old
+  aliases) in both "main" and "preloads" for every category page; the new
+  one looks up category_games. Both are replayed in Python over the same
+  pages, with the number of games each one touches. Template timings from
+  `hugo --templateMetrics` are the real measure where Hugo is available;
+  bench_hugo_templates.py takes them for two revisions.
+
+Usage:
+  python3 tools/bench_browse_indexes.py
+  python3 tools/bench_browse_indexes.py --repeat 20
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from catalog import CATEGORY_ALIASES, PROJECT_ROOT, load_games
+from generate_browse_indexes import build_all
+
+def embedded(payload: Dict[str, dict], raw: List[dict]) -> Dict[str, dict]:
+    """The pre-id layout: every position replaced by the game dict itself."""
+    out = {}
+    for variant, idx in payload.items():
+        out[variant] = {
+            'series_catalog': idx['series_catalog'],
+            'series_games': {k: [raw[p] for p in ids] for k, ids in idx['series_games'].items()},
+            'genre_catalog': idx['genre_catalog'],
+            'genre_games': {k: [raw[p] for p in ids] for k, ids in idx['genre_games'].items()},
+        }
+    return out
+
+def category_pages() -> List[str]:
+    return sorted(p.stem for p in (PROJECT_ROOT / 'content' / 'categories').glob('*.md') if p.stem != '_index')
+
+def scan_categories(raw: List[dict], pages: List[str]) -> int:
+    """The old template work; returns games touched."""
+    touched = 0
+    for slug in pages:
+        accepted = {slug} | {old for old, new in CATEGORY_ALIASES.items() if new == slug}
+        for _ in ('main', 'preloads'):
+            shown = [g for g in raw if g.get('hidden') is not True]
+            [g for g in shown if g.get('category') in accepted]
+            touched += len(raw) + len(shown)
+    return touched
+
+def lookup_categories(raw: List[dict], index: Dict[str, List[int]], pages: List[str]) -> int:
+    touched = 0
+    for slug in pages:
+        for _ in ('main', 'preloads'):
+            games = [raw[p] for p in index.get(slug, [])]
+            touched += len(games)
+    return touched
+
+def median_time(fn: Callable[[], object], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times)
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--repeat', type=int, default=10)
+    args = ap.parse_args()
+
+    games = load_games()
+    raw = [g.raw for g in games]
+    build_secs = median_time(lambda: build_all(games), args.repeat)
+    payload = build_all(games)
+    variants = {
+        'embedded (old)': embedded(payload, raw),
+        'id lists (new)': payload,
+    }
+
+    print(f"games={len(games)}, repeat={args.repeat}, build_all={build_secs * 1000:.1f} ms")
+    print(f"{'format':<16}  {'bytes':>10}  {'gzip':>9}  {'est. decode ms':>14}")
+    for name, data in variants.items():
+        text = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        size = len(text.encode('utf-8'))
+        gz = len(gzip.compress(text.encode('utf-8')))
+        decode = median_time(lambda: json.loads(text), args.repeat)
+        print(f"{name:<16}  {size:>10}  {gz:>9}  {decode * 1000:>14.1f}")
+    print("(est. decode: Python json.loads, an estimate of Hugo's site.Data load, not measured in Hugo)")
+
+    pages = category_pages()
+    index = payload['visible']['category_games']
+    print(f"\ncategory pages={len(pages)} (main + preloads each, replayed in Python)")
+    print(f"{'selection':<16}  {'touched':>10}  {'py ms':>9}")
+    for name, fn in (
+        ('where scan (old)', lambda: scan_categories(raw, pages)),
+        ('lookup (new)', lambda: lookup_categories(raw, index, pages)),
+    ):
+        touched = fn()
+        print(f"{name:<16}  {touched:>10}  {median_time(fn, args.repeat) * 1000:>9.2f}")
+
+if __name__ == '__main__':
+    main()
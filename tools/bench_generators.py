@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Measure how the tools/ generators scale with the size of the catalog.
+
+For each size (3k, 30k and 300k entries by default) this builds a scratch
+project in a temporary directory holding a copy of tools/, config.toml, a
+synthetic data/games.json (synthetic_catalog.py, deterministic per seed)
+and one placeholder image per game. It then runs every generator build.py
+runs, each in a fresh interpreter, and records:
+
+- cold_s: first run into the empty tree (every output written)
+- warm_s: median of --repeat further runs (nothing changed, the no-op rebuild)
+- peak_mb: peak Python allocation of one more run, via tracemalloc
+
+"catalog" is catalog.load_games() itself: cold compiles the snapshot from
+games.json, warm reads the snapshot. The other stages are measured with
+the catalog already loaded, as in build.py, so peak_mb is what each
+generator adds on top of it. check_social_preview is left out; it reads
+layouts and one image, not the catalog.
+
+Results are compared against tools/bench_generators_baseline.json. A stage
+regresses when its warm_s or peak_mb is more than --tolerance above the
+baseline (and by more than a noise floor of 0.05 s / 1 MB); the script then
+exits non-zero. cold_s is reported but not checked: it is mostly the
+filesystem creating files and varies from run to run. Timings are only
+comparable on the machine that recorded the baseline, so re-record it with
+--update-baseline when moving machines.
+
+Placeholder images stop at 30,000 files: beyond that the image manifest
+measures the filesystem rather than the code.
+
+Usage:
+  python3 tools/bench_generators.py                         # 3k, 30k, 300k vs baseline
+  python3 tools/bench_generators.py --sizes 3000,30000 --stages game_pages,rss_feed
+  python3 tools/bench_generators.py --update-baseline       # record this machine's numbers
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import shutil
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import synthetic_catalog
+from catalog import PROJECT_ROOT, slugify_title
+
+TOOLS_DIR = Path(__file__).resolve().parent
+BASELINE_PATH = TOOLS_DIR / "bench_generators_baseline.json"
+
+SIZES = (3000, 30000, 300000)
+STAGES = (
+    "catalog", "game_pages", "series_pages", "browse_indexes",
+    "client_catalog", "rss_feed", "image_manifest",
+)
+IMAGE_CAP = 30000
+TOLERANCE = 0.25
+MIN_SECONDS = 0.05
+MIN_MB = 1.0
+
+# A 600x600 PNG as far as image_info.png_dimensions() reads it.
+PLACEHOLDER_PNG = b"\x89PNG\r\n\x1a\n" + struct.pack(">I4sIIBBBBB", 13, b"IHDR", 600, 600, 8, 6, 0, 0, 0)
+
+Result = Dict[str, float]
+
+def _stage(name: str) -> Callable[[], None]:
+    """The stage's entry point; imported here because it must run in the scratch tree."""
+    import catalog
+
+    if name == "catalog":
+        def load() -> None:
+            catalog._cache.clear()
+            catalog.load_games()
+        return load
+    if name == "client_catalog":
+        import generate_client_catalog
+        # build.py's default (SEARCH_SHARDS=1).
+        return lambda: generate_client_catalog.main(["--sharded"])
+    module = __import__(f"generate_{name}")
+    return module.main
+
+def measure(name: str, repeat: int) -> Result:
+    """Run one stage in this process (cwd = scratch tools/); called by run_stage()."""
+    import catalog
+    import catalog_snapshot
+
+    run = _stage(name)
+    if name == "catalog":
+        catalog_snapshot.SNAPSHOT_PATH.unlink(missing_ok=True)
+    else:
+        catalog.load_games()
+
+    def timed() -> float:
+        t0 = time.perf_counter()
+        run()
+        return time.perf_counter() - t0
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        cold = timed()
+        warm = statistics.median(timed() for _ in range(max(1, repeat)))
+        tracemalloc.start()
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {"cold_s": round(cold, 4), "warm_s": round(warm, 4), "peak_mb": round(peak / 2 ** 20, 2)}
+
+def make_tree(root: Path, size: int, seed: int) -> None:
+    (root / "tools").mkdir(parents=True)
+    for path in TOOLS_DIR.glob("*.py"):
+        shutil.copy2(path, root / "tools" / path.name)
+    shutil.copy2(PROJECT_ROOT / "config.toml", root / "config.toml")
+    games = synthetic_catalog.generate(size, seed)
+    synthetic_catalog.write(root / "data" / "games.json", games)
+    images = root / "static" / "Images" / "Games"
+    images.mkdir(parents=True)
+    for g in games[:IMAGE_CAP]:
+        (images / f"{slugify_title(g['title'])}.png").write_bytes(PLACEHOLDER_PNG)
+
+def run_stage(root: Path, name: str, repeat: int) -> Result:
+    code = f"import json, bench_generators; print(json.dumps(bench_generators.measure({name!r}, {repeat})))"
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=root / "tools", capture_output=True, text=True, check=False
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"Stage {name} failed:\n{proc.stderr.strip()}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+def compare(
+    results: Dict[str, Dict[str, Result]], baseline: Dict[str, Dict[str, Result]], tolerance: float
+) -> List[str]:
+    problems = []
+    for size, stages in results.items():
+        for name, now in stages.items():
+            then = baseline.get(size, {}).get(name)
+            if not then:
+                continue
+            for metric, floor in (("warm_s", MIN_SECONDS), ("peak_mb", MIN_MB)):
+                old, new = then.get(metric), now[metric]
+                if old is not None and new > old * (1 + tolerance) and new - old > floor:
+                    problems.append(f"{size} {name} {metric}: {old} -> {new} (+{(new / old - 1) * 100:.0f}%)")
+    return problems
+
+def print_table(size: str, stages: Dict[str, Result], baseline: Dict[str, Result]) -> None:
+    print(f"\n{int(size):,} games")
+    print(f"  {'stage':<16} {'cold s':>9} {'warm s':>9} {'peak MB':>9}   baseline cold/warm/peak")
+    for name, r in stages.items():
+        then = baseline.get(name)
+        ref = f"{then['cold_s']:.3f}/{then['warm_s']:.3f}/{then['peak_mb']:.1f}" if then else "-"
+        print(f"  {name:<16} {r['cold_s']:>9.3f} {r['warm_s']:>9.3f} {r['peak_mb']:>9.1f}   {ref}")
+
+def read_baseline(path: Path) -> Dict[str, object]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", default=",".join(str(s) for s in SIZES), help="comma-separated catalog sizes")
+    ap.add_argument("--stages", default=",".join(STAGES), help="comma-separated stages (default: all)")
+    ap.add_argument("--repeat", type=int, default=3, help="warm runs per stage (default 3)")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--baseline", default=str(BASELINE_PATH))
+    ap.add_argument("--update-baseline", action="store_true", help="store these results as the new baseline")
+    ap.add_argument("--tolerance", type=float, default=TOLERANCE, help="allowed slowdown/growth (default 0.25)")
+    ap.add_argument("--keep", help="build the scratch trees under this directory and leave them there")
+    args = ap.parse_args(argv)
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    stages = [s.strip() for s in args.stages.split(",") if s.strip()]
+    unknown = set(stages) - set(STAGES)
+    if unknown:
+        raise SystemExit(f"Unknown stage(s): {', '.join(sorted(unknown))}; choose from {', '.join(STAGES)}")
+    if "catalog" not in stages:
+        # Later stages read the snapshot it compiles.
+        stages.insert(0, "catalog")
+
+    baseline_path = Path(args.baseline)
+    stored = read_baseline(baseline_path)
+    if stored and stored.get("seed") != args.seed:
+        print(f"Note: baseline was recorded with seed {stored.get('seed')}, not {args.seed}")
+    baseline: Dict[str, Dict[str, Result]] = stored.get("results", {}) if stored else {}
+
+    results: Dict[str, Dict[str, Result]] = {}
+    for size in sizes:
+        with contextlib.ExitStack() as stack:
+            if args.keep:
+                root = Path(args.keep) / f"catalog-{size}"
+                shutil.rmtree(root, ignore_errors=True)
+            else:
+                root = Path(stack.enter_context(tempfile.TemporaryDirectory(prefix="tge-bench-"))) / "site"
+            t0 = time.perf_counter()
+            make_tree(root, size, args.seed)
+            print(f"Scratch tree for {size:,} games ready in {time.perf_counter() - t0:.1f}s ({root})")
+            results[str(size)] = {name: run_stage(root, name, args.repeat) for name in stages}
+        print_table(str(size), results[str(size)], baseline.get(str(size), {}))
+
+    problems = compare(results, baseline, args.tolerance)
+    if args.update_baseline:
+        # Keep sizes and stages this run did not cover.
+        merged = {size: dict(baseline.get(size, {})) for size in baseline}
+        for size, by_stage in results.items():
+            merged.setdefault(size, {}).update(by_stage)
+        payload = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "results": merged,
+        }
+        baseline_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"\nBaseline written to {baseline_path}")
+        return
+    if not baseline:
+        print(f"\nNo baseline at {baseline_path}; run with --update-baseline to record one")
+    elif problems:
+        raise SystemExit("\nRegressions against the baseline:\n  " + "\n  ".join(problems))
+    else:
+        print(f"\nNo regressions against the baseline (tolerance {args.tolerance:.0%})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Compare Hugo template render times between two git revisions.
+
+Checks each revision out into a temporary worktree, runs
+`hugo --templateMetrics --renderToMemory` there --repeat times
+(alternating between the two), and prints the median cumulative and
+average time per template for both, plus Hugo's total build time. The
+data/ files are whatever each revision committed, so both builds render
+the same catalog when the revisions share data/games.json.
+
+--hints adds --templateMetricsHints. Leave it off for timings: to rate
+caching, Hugo then hashes what every partial call returns, which makes
+partialCached "browse-index.html" (the whole browse index, ~2,400 calls)
+several times slower than in a real build.
+
+The Python benches (bench_browse_indexes.py, bench_generators.py) replay the
+template work; this measures it in Hugo itself, so it needs `hugo` on PATH.
+
+Usage:
+  python3 tools/bench_hugo_templates.py BEFORE AFTER
+  python3 tools/bench_hugo_templates.py HEAD~1 HEAD --match categories/ --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import shutil
+import statistics
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from catalog import PROJECT_ROOT
+
+_UNITS_MS = {"h": 3_600_000.0, "m": 60_000.0, "s": 1000.0, "ms": 1.0, "µs": 1e-3, "us": 1e-3, "ns": 1e-6}
+_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|µs|us|ns|h|m|s)")
+# Hugo prints durations as Go does ("1.390317062s") or, in newer releases,
+# rounded with a space before the unit ("7.01  s", "143.40 µs").
+_DURATION = r"(?:\d+(?:\.\d+)?\s*(?:ms|µs|us|ns|h|m|s))+"
+# cumulative, average, [maximum, cache hints ...], total count, template
+_ROW = re.compile(rf"^\s*({_DURATION})\s+({_DURATION})\s.*?(\d+)\s+(\S+)\s*$")
+_TOTAL = re.compile(r"^Total in (\d+) ms", re.M)
+
+def duration_ms(text: str) -> float:
+    """A Go time.Duration string ("1m2.5s", "850.2µs", "7.01 s") in milliseconds."""
+    text = "".join(text.split())
+    parts = _PART.findall(text)
+    if not parts or "".join(n + u for n, u in parts) != text:
+        raise ValueError(f"not a duration: {text!r}")
+    return sum(float(n) * _UNITS_MS[u] for n, u in parts)
+
+def parse_metrics(output: str) -> Tuple[Dict[str, Tuple[float, float, int]], float]:
+    """({template: (cumulative ms, average ms, count)}, total build ms) from Hugo's output."""
+    rows = {}
+    for line in output.splitlines():
+        m = _ROW.match(line)
+        if m:
+            rows[m.group(4)] = (duration_ms(m.group(1)), duration_ms(m.group(2)), int(m.group(3)))
+    total = _TOTAL.search(output)
+    if not rows or not total:
+        raise SystemExit("Could not read --templateMetrics output from hugo")
+    return rows, float(total.group(1))
+
+Metrics = Tuple[Dict[str, Tuple[float, float, int]], float]
+
+def median_metrics(runs: List[Metrics]) -> Metrics:
+    names = set().union(*(rows for rows, _ in runs))
+    rows = {}
+    for name in names:
+        seen = [r[name] for r, _ in runs if name in r]
+        rows[name] = (
+            statistics.median(c for c, _, _ in seen),
+            statistics.median(a for _, a, _ in seen),
+            seen[0][2],
+        )
+    return rows, statistics.median(t for _, t in runs)
+
+def measure(hugo: str, revs: Tuple[str, str], repeat: int, hints: bool = False) -> Tuple[Metrics, Metrics]:
+    """
+    Median metrics of `repeat` builds of each revision. Builds alternate
+    between the two, so load on the machine drifting during the run
+    weighs on both alike.
+    """
+    runs: Tuple[List[Metrics], List[Metrics]] = ([], [])
+    with tempfile.TemporaryDirectory(prefix="tge-bench-") as tmp:
+        trees = [Path(tmp) / "before", Path(tmp) / "after"]
+        try:
+            for tree, rev in zip(trees, revs):
+                subprocess.run(["git", "worktree", "add", "--detach", str(tree), rev], cwd=PROJECT_ROOT, check=True, capture_output=True)
+            for _ in range(repeat):
+                for tree, out in zip(trees, runs):
+                    done = subprocess.run(
+                        [hugo, "--templateMetrics", *(["--templateMetricsHints"] if hints else []), "--renderToMemory"],
+                        cwd=tree, check=True, capture_output=True, text=True,
+                    )
+                    out.append(parse_metrics(done.stdout + done.stderr))
+        finally:
+            for tree in trees:
+                if tree.exists():
+                    subprocess.run(["git", "worktree", "remove", "--force", str(tree)], cwd=PROJECT_ROOT, check=False)
+    return median_metrics(runs[0]), median_metrics(runs[1])
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("before", help="git revision to measure first")
+    ap.add_argument("after", help="git revision to compare against it")
+    ap.add_argument("--repeat", type=int, default=3, help="builds per revision; medians are reported (default 3)")
+    ap.add_argument("--match", default="", help="only list templates whose name contains this")
+    ap.add_argument("--hints", action="store_true", help="also pass --templateMetricsHints (slows partialCached calls)")
+    args = ap.parse_args()
+
+    hugo = shutil.which("hugo")
+    if not hugo:
+        raise SystemExit("hugo not found on PATH")
+    (before, before_total), (after, after_total) = measure(hugo, (args.before, args.after), args.repeat, args.hints)
+
+    names = sorted(
+        (n for n in before.keys() | after.keys() if args.match in n),
+        key=lambda n: -max(before.get(n, (0.0,))[0], after.get(n, (0.0,))[0]),
+    )
+    width = max([len("template"), *map(len, names)])
+    print(f"{'template':<{width}}  {'before cum ms':>13}  {'after cum ms':>12}  {'before avg ms':>13}  {'after avg ms':>12}  {'count':>6}")
+    print(f"{'-' * width}  {'-' * 13}  {'-' * 12}  {'-' * 13}  {'-' * 12}  {'-' * 6}")
+    def cell(row, i: int, w: int) -> str:
+        return f"{row[i]:>{w}.2f}" if row else f"{'-':>{w}}"
+    for name in names:
+        b = before.get(name)
+        a = after.get(name)
+        count = (a or b)[2]
+        print(f"{name:<{width}}  {cell(b, 0, 13)}  {cell(a, 0, 12)}  {cell(b, 1, 13)}  {cell(a, 1, 12)}  {count:>6}")
+    print(f"\nhugo total: before={before_total:.0f} ms, after={after_total:.0f} ms (median of {args.repeat})")
+
+if __name__ == "__main__":
+    main()
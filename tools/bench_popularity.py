@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Benchmark the /api/top queries against a year (or more) of synthetic traffic.
+
+Loads cloudflare/d1_schema_popularity.sql into local SQLite, fills it
+through popularity_standin.synthesize() and runs every query the worker
+sends (rising, hidden, trending and all, with and without an ids filter),
+reporting for each:
+
+- EXPLAIN QUERY PLAN
+- wall-clock time, median of --repeat runs
+
+Each query is then re-run with candidate indexes added one at a time, so
+the report shows which ones change the plan and how much they save. The
+candidates are not part of the schema; copy the ones worth having into
+d1_schema_popularity.sql.
+
+With --rollups it then runs the worker's scheduled refresh (rollup rebuild
+plus events_daily compaction) and checks that:
+
+- trending (7 and 30 days, with and without ids) and rising read from the
+  rollup give exactly the raw queries' answers
+- compaction changed no window's answer and lost no clicks
+  (events_daily + events_monthly)
+
+and times the rollup reads against the raw queries. Exits non-zero on any
+mismatch.
+
+Usage:
+  python3 tools/bench_popularity.py                       # 3k ids x 365 days
+  python3 tools/bench_popularity.py --ids 50000 --clicks-per-day 40000
+  python3 tools/bench_popularity.py --db /tmp/pop.sqlite  # keep the data for reuse
+  python3 tools/bench_popularity.py --rollups
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import time
+from datetime import date
+from typing import Dict, List, Tuple
+
+from popularity_standin import (
+    connect, game_ids, refresh_rollups, retention_cutoff, rollup_queries, synthesize, worker_queries,
+)
+
+# name -> statements; "schema" is the database as deployed.
+INDEX_VARIANTS: Dict[str, List[str]] = {
+    "schema": [],
+    "events_daily(day, id, clicks)": [
+        "CREATE INDEX bench_events_day_cover ON events_daily(day, id, clicks)",
+    ],
+    "events_daily(id, day, clicks)": [
+        "CREATE INDEX bench_events_id_cover ON events_daily(id, day, clicks)",
+    ],
+    "clicks(count)": [
+        "CREATE INDEX bench_clicks_count ON clicks(count)",
+    ],
+}
+
+# Report an index only when it saves at least this share of the time.
+WORTHWHILE = 0.2
+
+def plan(con: sqlite3.Connection, sql: str, params: Tuple[object, ...]) -> List[str]:
+    return [row[3] for row in con.execute("EXPLAIN QUERY PLAN " + sql, params)]
+
+def median_ms(con: sqlite3.Connection, sql: str, params: Tuple[object, ...], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        con.execute(sql, params).fetchall()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+# LIMIT large enough to compare whole answers rather than tie-broken top-Ns.
+EVERYTHING = 10_000_000
+
+def answers(con: sqlite3.Connection, filter_ids: List[str]) -> Dict[str, List[tuple]]:
+    """Complete raw answers for the modes the rollup serves, sorted."""
+    week = worker_queries(filter_ids, limit=EVERYTHING, days=7)
+    month = worker_queries(filter_ids, limit=EVERYTHING, days=30)
+    picked = {
+        "rising": week["rising"],
+        "trending": week["trending"],
+        "trending30": month["trending"],
+        "trending_ids": week["trending_ids"],
+    }
+    return {mode: sorted(con.execute(sql, params).fetchall()) for mode, (sql, params) in picked.items()}
+
+def check_rollups(con: sqlite3.Connection, filter_ids: List[str], repeat: int) -> None:
+    clicks_before = con.execute("SELECT SUM(clicks) FROM events_daily").fetchone()[0]
+    raw_before = answers(con, filter_ids)
+    raw_timed = worker_queries(filter_ids, days=7)
+    raw_ms = {mode: median_ms(con, *raw_timed[mode], repeat) for mode in ("rising", "trending", "trending_ids")}
+
+    rows_before = con.execute("SELECT COUNT(*) FROM events_daily").fetchone()[0]
+    t0 = time.perf_counter()
+    refresh_rollups(con, retention_cutoff(date.today()))
+    refresh_ms = (time.perf_counter() - t0) * 1000
+    rows_after = con.execute("SELECT COUNT(*) FROM events_daily").fetchone()[0]
+    monthly = con.execute("SELECT COUNT(*), COALESCE(SUM(clicks), 0) FROM events_monthly").fetchone()
+    clicks_after = con.execute("SELECT SUM(clicks) FROM events_daily").fetchone()[0] + monthly[1]
+    print(
+        f"\nrollup refresh: {refresh_ms:.0f} ms; events_daily rows {rows_before} -> {rows_after}, "
+        f"events_monthly rows={monthly[0]}"
+    )
+    problems = []
+    if clicks_after != clicks_before:
+        problems.append(f"compaction: {clicks_before} clicks before, {clicks_after} after")
+    if answers(con, filter_ids) != raw_before:
+        problems.append("compaction changed a raw window answer")
+
+    full = rollup_queries(filter_ids, limit=EVERYTHING)
+    timed = rollup_queries(filter_ids)
+    for mode, (sql, params) in full.items():
+        same = sorted(con.execute(sql, params).fetchall()) == raw_before[mode]
+        if not same:
+            problems.append(f"{mode}: rollup answer differs from the raw query")
+        ms = median_ms(con, *timed[mode], repeat)
+        before = f"{raw_ms[mode]:.2f} ms raw -> " if mode in raw_ms else ""
+        print(f"  {mode:<14} {before}{ms:.2f} ms rollup, {'identical' if same else 'DIFFERENT'}")
+    if problems:
+        raise SystemExit("\n".join(problems))
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--ids", type=int, default=3000, help="distinct games with clicks (default 3000)")
+    ap.add_argument("--days", type=int, default=365, help="days of history (default 365)")
+    ap.add_argument("--clicks-per-day", type=int, default=4000)
+    ap.add_argument("--filter-ids", type=int, default=50, help="ids in the category-page filter (worker max 50)")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--analyze", action="store_true", help="run ANALYZE first (D1 does not do this on its own)")
+    ap.add_argument("--db", help="SQLite file to build or reuse instead of an in-memory database")
+    ap.add_argument("--rollups", action="store_true", help="also check and time the scheduled rollups")
+    args = ap.parse_args()
+
+    reuse = bool(args.db) and os.path.exists(args.db)
+    con = connect(args.db or ":memory:")
+    t0 = time.perf_counter()
+    if reuse:
+        rows = con.execute("SELECT COUNT(*) FROM events_daily").fetchone()[0]
+        total = con.execute("SELECT COALESCE(SUM(count), 0) FROM clicks").fetchone()[0]
+    else:
+        rows, total = synthesize(con, args.ids, args.days, args.clicks_per_day, seed=args.seed)
+    if args.analyze:
+        con.execute("ANALYZE")
+    print(
+        f"events_daily rows={rows}, clicks={total}, "
+        f"{'reused ' + args.db if reuse else f'synthesized in {time.perf_counter() - t0:.1f}s'}"
+    )
+
+    filter_ids = random.Random(args.seed).sample(game_ids(args.ids), min(args.filter_ids, args.ids))
+    queries = worker_queries(filter_ids)
+    results: Dict[str, Dict[str, Tuple[float, List[str]]]] = {mode: {} for mode in queries}
+    for variant, statements in INDEX_VARIANTS.items():
+        for stmt in statements:
+            con.execute(stmt)
+        for mode, (sql, params) in queries.items():
+            results[mode][variant] = (median_ms(con, sql, params, args.repeat), plan(con, sql, params))
+        for stmt in statements:
+            con.execute("DROP INDEX " + stmt.split()[2])
+
+    for mode, by_variant in results.items():
+        base_ms, base_plan = by_variant["schema"]
+        print(f"\n{mode}: {base_ms:.2f} ms")
+        for line in base_plan:
+            print(f"  plan: {line}")
+        best = None
+        for variant, (ms, lines) in by_variant.items():
+            if variant == "schema":
+                continue
+            changed = lines != base_plan
+            print(f"  {variant:<30} {ms:>9.2f} ms{'' if changed else '  (same plan)'}")
+            if changed:
+                for line in lines:
+                    print(f"  {'':<30} plan: {line}")
+            if ms <= base_ms * (1 - WORTHWHILE) and (best is None or ms < best[1]):
+                best = (variant, ms)
+        if best:
+            print(f"  -> suggest {best[0]}: {base_ms:.2f} -> {best[1]:.2f} ms")
+        else:
+            print("  -> no candidate index helps")
+
+    if args.rollups:
+        check_rollups(con, filter_ids, args.repeat)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Single-process build: parse data/games.json once, then run every generator
+as a dependency graph.
+
+Replaces the old build.sh sequence, which started a fresh interpreter per
+generator (each re-reading games.json) and skipped the RSS feed and the
+feature data entirely.
+
+- The catalog is loaded up front in this process; every stage reads it
+  through catalog.load_games(), which returns the cached records.
+- Independent stages run in a thread pool.
+- Fail fast: once a required stage fails no new stages are started and
+  the build exits non-zero.
+- A per-stage timing table is printed at the end.
+- --profile (or $BUILD_TRACE) also records per-phase timings and counters
+  for every stage as a JSON trace, and --cprofile (or $BUILD_CPROFILE)
+  dumps one cProfile file per stage; see instrument.py.
+
+Usage:
+  python3 tools/build.py                      # generators + check-social + hugo
+  python3 tools/build.py --no-hugo            # generators + check-social only
+  python3 tools/build.py --search-include-hidden 1 --feature-include-hidden 0
+  python3 tools/build.py --no-hugo --profile /tmp/trace.json --cprofile /tmp/prof
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import catalog
+import check_social_preview
+import instrument
+import generate_browse_indexes
+import generate_client_catalog
+import generate_game_pages
+import generate_image_manifest
+import generate_rss_feed
+import generate_series_pages
+
+class Stage(NamedTuple):
+    name: str
+    deps: Tuple[str, ...]
+    run: Callable[[], None]
+    # Optional stages report failures but do not stop the build
+    # (deploy.sh used to run the RSS feed with `|| true`).
+    optional: bool = False
+
+class StageFailed(Exception):
+    pass
+
+def _call(fn: Callable[..., None], *args) -> Callable[[], None]:
+    def run() -> None:
+        try:
+            fn(*args)
+        except SystemExit as e:
+            # Generators and check_social_preview report errors via SystemExit.
+            if e.code not in (None, 0):
+                raise StageFailed(str(e.code)) from None
+    return run
+
+def hugo_command() -> Optional[str]:
+    # Same lookup order as tools/deploy.sh (Steam Deck friendly).
+    home_hugo = os.path.expanduser("~/bin/hugo")
+    if os.access(home_hugo, os.X_OK):
+        return home_hugo
+    return shutil.which("hugo")
+
+def run_hugo(extra_args: List[str]) -> None:
+    cmd = hugo_command()
+    if cmd is None:
+        raise StageFailed("Hugo not found. Install Hugo Extended, or place it at ~/bin/hugo")
+    subprocess.run([cmd, *extra_args], cwd=catalog.PROJECT_ROOT, check=True)
+
+def build_stages(args: argparse.Namespace) -> List[Stage]:
+    client_catalog_args = [
+        "--search-include-hidden", args.search_include_hidden,
+        "--feature-include-hidden", args.feature_include_hidden,
+    ]
+    if args.search_shards == "1":
+        client_catalog_args.append("--sharded")
+    generators = [
+        Stage("game_pages", ("catalog",), _call(generate_game_pages.main)),
+        Stage("series_pages", ("catalog",), _call(generate_series_pages.main)),
+        Stage("browse_indexes", ("catalog",), _call(generate_browse_indexes.main)),
+        Stage("client_catalog", ("catalog",), _call(generate_client_catalog.main, client_catalog_args)),
+        Stage("rss_feed", ("catalog", "image_manifest"), _call(generate_rss_feed.main), optional=True),
+        Stage("image_manifest", (), _call(generate_image_manifest.main)),
+        Stage("check_social", (), _call(check_social_preview.main)),
+    ]
+    stages = [Stage("catalog", (), _call(catalog.load_games))] + generators
+    if not args.no_hugo:
+        stages.append(Stage("hugo", tuple(s.name for s in generators), lambda: run_hugo(args.hugo_args)))
+    return stages
+
+def run_graph(stages: List[Stage], jobs: int) -> Tuple[bool, Dict[str, Tuple[str, float]]]:
+    """Run stages respecting deps. Returns (ok, {name: (status, seconds)})."""
+    by_name = {s.name: s for s in stages}
+    pending = list(stages)
+    done: Dict[str, bool] = {}
+    results: Dict[str, Tuple[str, float]] = {}
+    running: Dict[Future, Tuple[Stage, float]] = {}
+    failed = False
+
+    def timed(stage: Stage) -> float:
+        t0 = time.perf_counter()
+        with instrument.tool(stage.name):
+            stage.run()
+        return time.perf_counter() - t0
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        while pending or running:
+            if not failed:
+                for stage in list(pending):
+                    if all(done.get(d) is not None for d in stage.deps):
+                        pending.remove(stage)
+                        if not all(done[d] for d in stage.deps):
+                            results[stage.name] = ("skipped", 0.0)
+                            done[stage.name] = False
+                            continue
+                        running[pool.submit(timed, stage)] = (stage, time.perf_counter())
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                stage, started = running.pop(fut)
+                try:
+                    results[stage.name] = ("ok", fut.result())
+                    done[stage.name] = True
+                except Exception as e:
+                    elapsed = time.perf_counter() - started
+                    print(f"ERROR: stage {stage.name} failed: {e}", file=sys.stderr)
+                    # A failed optional stage still unblocks its dependants.
+                    done[stage.name] = stage.optional
+                    if stage.optional:
+                        results[stage.name] = ("failed*", elapsed)
+                    else:
+                        results[stage.name] = ("FAILED", elapsed)
+                        failed = True
+
+    for stage in pending:
+        results[stage.name] = ("not run", 0.0)
+    ordered = {name: results[name] for name in by_name if name in results}
+    return not failed, ordered
+
+def print_timings(results: Dict[str, Tuple[str, float]], total: float) -> None:
+    width = max([len(n) for n in results] + [len("total")])
+    print()
+    print(f"{'stage'.ljust(width)}  {'status':<8}  {'seconds':>8}")
+    print(f"{'-' * width}  {'-' * 8}  {'-' * 8}")
+    for name, (status, secs) in results.items():
+        print(f"{name.ljust(width)}  {status:<8}  {secs:>8.3f}")
+    print(f"{'total'.ljust(width)}  {'':<8}  {total:>8.3f}")
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 4)
+    ap.add_argument(
+        "--search-include-hidden",
+        choices=["0", "1"],
+        default=os.environ.get("INCLUDE_HIDDEN", "0"),
+        help="include hidden games in the search index (default: $INCLUDE_HIDDEN or 0)",
+    )
+    ap.add_argument(
+        "--search-shards",
+        choices=["0", "1"],
+        default=os.environ.get("SEARCH_SHARDS", "1"),
+        help="write the lazily loaded static/search/ shards instead of search-index.js (default: $SEARCH_SHARDS or 1)",
+    )
+    ap.add_argument("--feature-include-hidden", choices=["0", "1"], default="0")
+    ap.add_argument("--no-hugo", action="store_true", help="skip the final Hugo build")
+    ap.add_argument(
+        "--profile",
+        nargs="?",
+        const=str(instrument.DEFAULT_TRACE),
+        help="write a JSON trace of per-stage phases and counters (default path: .cache/build-trace.json)",
+    )
+    ap.add_argument("--cprofile", metavar="DIR", help="also dump one cProfile .prof file per stage into DIR")
+    ap.add_argument("hugo_args", nargs=argparse.REMAINDER, help="extra arguments passed to hugo after --")
+    args = ap.parse_args(argv)
+    if args.hugo_args and args.hugo_args[0] == "--":
+        args.hugo_args = args.hugo_args[1:]
+
+    if args.profile or args.cprofile:
+        instrument.enable(args.profile, args.cprofile)
+    if instrument.enabled() and (args.cprofile or os.environ.get(instrument.ENV_CPROFILE)):
+        # One profiler at a time: Python 3.12+ refuses concurrent cProfile sessions.
+        args.jobs = 1
+
+    os.chdir(catalog.PROJECT_ROOT)
+    t0 = time.perf_counter()
+    ok, results = run_graph(build_stages(args), args.jobs)
+    print_timings(results, time.perf_counter() - t0)
+    trace = instrument.write_trace()
+    if trace:
+        print(f"Trace written to {trace}")
+    if not ok:
+        raise SystemExit(1)
+    if not args.no_hugo:
+        print("Done. Output is in ./public")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Shared, normalized view of data/games.json for the tools/ generators.
+
+Every generator used to read games.json itself and then repeat the same
+`str(g.get(...) or "").strip()`, slugify, date parsing and hidden/abandonware
+checks on every entry. This module does that work once per record:
+
+- Game: a compact __slots__ record holding the stripped fields plus the
+  derived values (canonical slug, parsed date_added, category label,
+  series key, hidden and abandonware flags).
+- load_games(): parses games.json once per process and caches the result
+  until the file changes, so a build that runs several generators in one
+  interpreter only pays for it once.
+
+The original dict is kept on `Game.raw` for outputs that embed the full entry.
+
+iter_games() is the streaming counterpart of load_games() for generators
+that look at one game at a time, so their memory stays flat however large
+the catalog grows. It walks the catalog already loaded in this process
+(build.py, watch.py) if there is one, else an up-to-date snapshot record by
+record, else games.json itself, read incrementally by json_stream.py.
+
+load_games() reads through the compiled binary snapshot in catalog_snapshot.py
+when it can, so the normalization cost is paid once per change to games.json
+rather than once per process. It then returns a read-only sequence that
+decodes each Game the first time it is read: opening the catalog is a stat,
+a hash check and an mmap, and a tool that looks at a few games pays for
+those only.
+"""
+from __future__ import annotations
+
+import json
+import re
+import unicodedata
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import instrument
+from json_stream import NotAnArray, iter_array
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+GAMES_JSON = PROJECT_ROOT / "data" / "games.json"
+# Build state that is safe to delete (manifests, compiled snapshots).
+CACHE_DIR = PROJECT_ROOT / ".cache"
+
+ABANDONWARE = {"abandonware"}
+
+CATEGORY_LABELS = {
+    "console-to-pc-port": "Console To PC Ports",
+    "console-ports": "Console To Console Ports",
+    "in-the-works": "In The Works",
+    "decompilations-recompilations": "Decompilations & Recompilations",
+    "open-source": "Open Source",
+    "source-port": "Open Source",
+    "fan-games": "Fan Games & Homebrew",
+    "android-ports": "Android Ports",
+    "browser-based": "Browser Based",
+    "vr-ports": "VR",
+    "rom-hacks": "ROM Hacks",
+    "utilities": "Utilities",
+    "utility": "Utilities",
+}
+
+# Old category slugs still found in games.json -> the category page they belong to.
+CATEGORY_ALIASES = {
+    "utility": "utilities",
+    "source-port": "open-source",
+}
+
+def canonical_category(slug: str) -> str:
+    return CATEGORY_ALIASES.get(slug, slug)
+
+def category_label(slug: str) -> str:
+    if not slug:
+        return ""
+    if slug in CATEGORY_LABELS:
+        return CATEGORY_LABELS[slug]
+    text = str(slug).replace("-", " ").title()
+    return re.sub(r"\bPc\b", "PC", text)
+
+def slugify_title(title: str) -> str:
+    """Page slug used for /game/<slug>/ (matches the JS slugifyTitle() behaviour)."""
+    s = unicodedata.normalize("NFKD", title or "")
+    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    s = s.lower().strip()
+    s = re.sub(r"[^a-z0-9]+", "-", s)
+    return s.strip("-")
+
+def search_slugify(title: str) -> str:
+    """Mimic Hugo's urlize closely enough for the search slug map's tracking ids."""
+    s = (title or "").strip().lower()
+    s = s.replace("&", " and ")
+    s = re.sub(r"[^a-z0-9]+", " ", s)
+    s = re.sub(r"\s+", " ", s).strip()
+    return s.replace(" ", "-")
+
+def urlize(value: str) -> str:
+    """
+    Approximate Hugo's `urlize` as used for series and genre keys:
+    - lowercase
+    - strip apostrophes
+    - convert & to "and"
+    - replace non-alnum with hyphens
+    - collapse multiple hyphens
+    """
+    s = str(value or "").strip().lower()
+    s = s.replace("&", "and").replace("’", "'").replace("'", "")
+    s = re.sub(r"[^a-z0-9]+", "-", s)
+    return re.sub(r"-{2,}", "-", s).strip("-")
+
+def hugo_urlize(title: str) -> str:
+    """
+    Port of Hugo's `urlize` (PathSpec.UnicodeSanitize + lowercase), which
+    game-card.html uses to name /Images/Games/<slug>.webp. Unlike the page
+    slug it keeps ".", "_", "#", "+", "~" and "@". Digits are Go's
+    unicode.IsDigit (decimal digits only), so "Pikmin 1²" is "pikmin-1".
+    """
+    out: List[str] = []
+    prepend_hyphen = False
+    was_hyphen = False
+    for i, ch in enumerate(title or ""):
+        allowed = (
+            ch in "./\\_#+~-@"
+            or ch.isalpha()
+            or ch.isdecimal()
+            or unicodedata.category(ch).startswith("M")
+            or (ch == "%" and re.match(r"[0-9a-fA-F]{2}", title[i + 1:i + 3] or "") is not None)
+        )
+        if allowed:
+            was_hyphen = ch == "-"
+            if prepend_hyphen:
+                if not was_hyphen:
+                    out.append("-")
+                prepend_hyphen = False
+            out.append(ch)
+        elif out and not was_hyphen and ch.isspace():
+            prepend_hyphen = True
+    return "".join(out).lower()
+
+def series_key(value: str) -> str:
+    # Treat optional leading "The" as the same series (e.g. Lord of the Rings).
+    s = urlize(value)
+    return s[4:] if s.startswith("the-") else s
+
+def parse_date(value: str) -> Optional[date]:
+    raw = (value or "").strip().replace("/", "-")
+    if not raw:
+        return None
+    try:
+        return datetime.strptime(raw[:10], "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+def _text(value: Any) -> str:
+    return str(value or "").strip()
+
+class Game:
+    """One normalized games.json entry."""
+
+    __slots__ = (
+        "_raw",
+        "id",
+        "title",
+        "link",
+        "category",
+        "genre1",
+        "genre2",
+        "series",
+        "video_link",
+        "notes",
+        "date_added",
+        "image",
+        "title_slug",
+        "slug",
+        "search_slug",
+        "added",
+        "category_label",
+        "series_key",
+        "series_is_text",
+        "hidden",
+        "abandonware",
+    )
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self._raw: Any = raw
+        try:
+            self.id: Optional[int] = int(raw.get("id"))
+        except (TypeError, ValueError):
+            self.id = None
+        self.title = _text(raw.get("title"))
+        self.link = _text(raw.get("link"))
+        self.category = _text(raw.get("category"))
+        self.genre1 = _text(raw.get("genre1"))
+        self.genre2 = _text(raw.get("genre2"))
+        self.series = _text(raw.get("series"))
+        self.video_link = _text(raw.get("video_link"))
+        self.notes = _text(raw.get("notes"))
+        self.date_added = _text(raw.get("date_added"))
+        self.image = _text(raw.get("image"))
+
+        # Stable slug override support: allow "slug" in games.json.
+        override = _text(raw.get("slug"))
+        self.title_slug = slugify_title(self.title)
+        self.slug = override or self.title_slug
+        self.search_slug = override or search_slugify(self.title)
+
+        self.added = parse_date(self.date_added)
+        self.category_label = category_label(self.category)
+        self.series_key = series_key(self.series) if self.series else ""
+        # Some entries store a non-string series by mistake; series pages skip those.
+        self.series_is_text = isinstance(raw.get("series"), str)
+        self.hidden = raw.get("hidden") is True
+        self.abandonware = self.category.lower() in ABANDONWARE
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        # Snapshot-loaded records keep the entry as JSON text until first use.
+        if isinstance(self._raw, str):
+            self._raw = json.loads(self._raw)
+        return self._raw
+
+    @property
+    def genres(self) -> Tuple[str, ...]:
+        return tuple(g for g in (self.genre1, self.genre2) if g)
+
+    def __repr__(self) -> str:
+        return f"Game(id={self.id!r}, slug={self.slug!r})"
+
+_cache: Dict[Path, Tuple[Tuple[int, int], Sequence[Game]]] = {}
+
+def read_raw(path: Path = GAMES_JSON) -> List[Dict[str, Any]]:
+    if not path.exists():
+        raise SystemExit(f"Missing {path}")
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, list):
+        raise SystemExit("data/games.json must be a JSON array")
+    return [x for x in data if isinstance(x, dict)]
+
+def iter_raw(path: Path = GAMES_JSON) -> Iterator[Dict[str, Any]]:
+    """read_raw() one entry at a time, without holding the file or the list."""
+    if not path.exists():
+        raise SystemExit(f"Missing {path}")
+    try:
+        for x in iter_array(path):
+            if isinstance(x, dict):
+                yield x
+    except NotAnArray:
+        raise SystemExit("data/games.json must be a JSON array") from None
+
+def load_games(path: Path = GAMES_JSON) -> Sequence[Game]:
+    """Return the normalized catalog, re-parsing only when the file changed."""
+    path = Path(path)
+    if not path.exists():
+        raise SystemExit(f"Missing {path}")
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    # "read" rather than "load": generators time their load_games() call as "load".
+    with instrument.phase("read"):
+        try:
+            from catalog_snapshot import open_snapshot
+            games = open_snapshot(path).games()
+        except OSError:
+            # Read-only checkout or unwritable cache dir: normalize directly.
+            with instrument.phase("normalize"):
+                games = [Game(raw) for raw in read_raw(path)]
+    _cache[path] = (stamp, games)
+    return games
+
+def iter_games(path: Path = GAMES_JSON) -> Iterator[Game]:
+    """The catalog in file order, one Game at a time; see the module docstring."""
+    path = Path(path)
+    cached = _cache.get(path)
+    if cached is not None and path.exists():
+        st = path.stat()
+        if cached[0] == (st.st_mtime_ns, st.st_size):
+            from catalog_snapshot import SnapshotGames
+            games = cached[1]
+            yield from games.stream() if isinstance(games, SnapshotGames) else games
+            return
+    try:
+        from catalog_snapshot import current_snapshot
+        snap = current_snapshot(path)
+    except OSError:
+        snap = None
+    if snap is not None:
+        yield from snap.iter_games()
+        return
+    for raw in iter_raw(path):
+        yield Game(raw)
+
+def visible(games: Sequence[Game], include_hidden: bool = False) -> Sequence[Game]:
+    return games if include_hidden else [g for g in games if not g.hidden]
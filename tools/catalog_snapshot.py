@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Compiled binary snapshot of data/games.json, loaded through mmap.
+
+games.json is ~36k lines of indented JSON and every tool (plus the first
+/status reads in visibility_server.py) used to re-parse and re-normalize
+all of it. This compiles the normalized catalog (see catalog.Game) once
+into .cache/games.snapshot and keys it on the SHA-256 of games.json, so it
+rebuilds itself whenever the JSON changes.
+
+Layout (little-endian):
+
+  header     magic "TGEC", version, record size, source sha256,
+             section positions and counts (HEADER below)
+  strings    interned string table: (n + 1) u32 offsets, then UTF-8 data.
+             Categories, genres, series and empty values are stored once.
+  records    fixed-width records (RECORD below): id, flags, date_added
+             ordinal, then one string-table index per text field. Record i
+             lives at records_pos + i * record_size.
+  index      open-addressing id -> record table for O(1) lookup by id
+             (Snapshot.find). On duplicate ids the first record wins, as in
+             visibility_server.CatalogStore.
+
+Snapshot.games() decodes nothing up front: each record becomes a Game the
+first time it is read, so opening the catalog costs a stat, a hash check
+and an mmap whatever its size.
+
+Usage:
+  python3 tools/catalog_snapshot.py           # compile if stale, print stats
+  python3 tools/catalog_snapshot.py --force   # always recompile
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import instrument
+from catalog import CACHE_DIR, GAMES_JSON, Game, iter_raw
+
+SNAPSHOT_PATH = CACHE_DIR / "games.snapshot"
+
+MAGIC = b"TGEC"
+VERSION = 3
+
+# magic, version, record_size, source sha256,
+# n_strings, strings_pos, n_records, records_pos, index_slots, index_pos
+HEADER = struct.Struct("<4sHH32sIIIIII")
+
+# Text slots of catalog.Game, stored as string-table indexes. "_raw" is the
+# compact JSON of the original entry, decoded lazily by Game.raw.
+STR_FIELDS = (
+    "title",
+    "link",
+    "category",
+    "genre1",
+    "genre2",
+    "series",
+    "video_link",
+    "notes",
+    "date_added",
+    "image",
+    "title_slug",
+    "slug",
+    "search_slug",
+    "category_label",
+    "series_key",
+    "_raw",
+)
+
+# Which slots Snapshot.game() keeps decoded: all of them, or (when streaming)
+# only the values many games share, so the cache does not grow per game.
+SHARED_FIELDS = {"category", "genre1", "genre2", "series", "date_added", "category_label", "series_key"}
+CACHE_ALL = (True,) * len(STR_FIELDS)
+CACHE_SHARED = tuple(name in SHARED_FIELDS for name in STR_FIELDS)
+
+# id, flags, date_added ordinal (0 = none), string indexes
+RECORD = struct.Struct("<qII" + "I" * len(STR_FIELDS))
+# id, record number + 1 (0 = empty slot)
+INDEX_SLOT = struct.Struct("<qI4x")
+
+FLAG_HAS_ID = 1
+FLAG_HIDDEN = 2
+FLAG_ABANDONWARE = 4
+FLAG_SERIES_TEXT = 8
+
+def source_hash(path: Path) -> bytes:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.digest()
+
+def _slot(game_id: int, mask: int) -> int:
+    return ((game_id * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 32 & mask
+
+def compile_snapshot(src: Path = GAMES_JSON, out: Path = SNAPSHOT_PATH) -> Path:
+    """Parse and normalize games.json and write the binary snapshot atomically."""
+    digest = source_hash(src)
+    strings: List[bytes] = []
+    interned: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        idx = interned.get(value)
+        if idx is None:
+            idx = interned[value] = len(strings)
+            strings.append(value.encode("utf-8"))
+        return idx
+
+    records = bytearray()
+    id_to_rec: Dict[int, int] = {}
+    # Streamed: only the packed records and the interned strings stay in memory.
+    with instrument.phase("normalize"):
+        for i, g in enumerate(Game(raw) for raw in iter_raw(src)):
+            flags = 0
+            if g.id is not None:
+                flags |= FLAG_HAS_ID
+                id_to_rec.setdefault(g.id, i)
+            if g.hidden:
+                flags |= FLAG_HIDDEN
+            if g.abandonware:
+                flags |= FLAG_ABANDONWARE
+            if g.series_is_text:
+                flags |= FLAG_SERIES_TEXT
+            texts = [getattr(g, f) for f in STR_FIELDS[:-1]]
+            texts.append(json.dumps(g.raw, ensure_ascii=False, separators=(",", ":")))
+            records += RECORD.pack(
+                g.id if g.id is not None else 0,
+                flags,
+                g.added.toordinal() if g.added else 0,
+                *(intern(t) for t in texts),
+            )
+
+    slots = 1
+    while slots < max(8, len(id_to_rec) * 2):
+        slots <<= 1
+    table = [(0, 0)] * slots
+    for game_id, rec in id_to_rec.items():
+        pos = _slot(game_id, slots - 1)
+        while table[pos][1]:
+            pos = (pos + 1) & (slots - 1)
+        table[pos] = (game_id, rec + 1)
+
+    offsets = [0]
+    for b in strings:
+        offsets.append(offsets[-1] + len(b))
+    string_section = struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(strings)
+
+    strings_pos = HEADER.size
+    records_pos = strings_pos + len(string_section)
+    records_pos += -records_pos % 8
+    index_pos = records_pos + len(records)
+    header = HEADER.pack(
+        MAGIC, VERSION, RECORD.size, digest,
+        len(strings), strings_pos, len(records) // RECORD.size, records_pos, slots, index_pos,
+    )
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    # A temp file of its own: build.py, watch.py and the visibility server may compile at once.
+    fd, tmp_name = tempfile.mkstemp(dir=out.parent, prefix=out.name + ".", suffix=".tmp")
+    tmp = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(string_section)
+            f.write(b"\0" * (records_pos - strings_pos - len(string_section)))
+            f.write(records)
+            for game_id, rec in table:
+                f.write(INDEX_SLOT.pack(game_id, rec))
+        tmp.replace(out)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    instrument.wrote(out)
+    return out
+
+class Snapshot:
+    """Read-only view over a compiled snapshot file."""
+
+    def __init__(self, path: Path) -> None:
+        with path.open("rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, record_size, self.source_sha256,
+         self._n_strings, self._strings_pos, self._n_records, self._records_pos,
+         self._index_slots, self._index_pos) = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self._mm.close()
+            raise ValueError(f"{path} is not a compatible catalog snapshot")
+        self._data_pos = self._strings_pos + 4 * (self._n_strings + 1)
+        self._strings: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return self._n_records
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def _decode(self, idx: int) -> str:
+        start, end = struct.unpack_from("<II", self._mm, self._strings_pos + 4 * idx)
+        return self._mm[self._data_pos + start:self._data_pos + end].decode("utf-8")
+
+    def string(self, idx: int) -> str:
+        s = self._strings.get(idx)
+        if s is None:
+            s = self._strings[idx] = self._decode(idx)
+        return s
+
+    def _record(self, rec: int) -> Tuple[int, ...]:
+        return RECORD.unpack_from(self._mm, self._records_pos + rec * RECORD.size)
+
+    def find(self, game_id: int) -> Optional[int]:
+        """Record number for a games.json id (the first, if it repeats), or None."""
+        mask = self._index_slots - 1
+        pos = _slot(game_id, mask)
+        while True:
+            slot_id, rec = INDEX_SLOT.unpack_from(self._mm, self._index_pos + pos * INDEX_SLOT.size)
+            if rec == 0:
+                return None
+            if slot_id == game_id:
+                return rec - 1
+            pos = (pos + 1) & mask
+
+    def hidden(self, rec: int) -> bool:
+        """Hidden flag of record `rec`, without decoding any of its strings."""
+        return bool(self._record(rec)[1] & FLAG_HIDDEN)
+
+    def visibility(self) -> Dict[int, bool]:
+        """id -> hidden for every id, first record winning, without decoding strings."""
+        out: Dict[int, bool] = {}
+        for rec in range(self._n_records):
+            game_id, flags = self._record(rec)[:2]
+            if flags & FLAG_HAS_ID and game_id not in out:
+                out[game_id] = bool(flags & FLAG_HIDDEN)
+        return out
+
+    def game(self, rec: int, cached: Tuple[bool, ...] = CACHE_ALL) -> Game:
+        """Record `rec` as a Game; `cached` says per STR_FIELDS slot whether to keep the decoded string."""
+        fields = self._record(rec)
+        g = Game.__new__(Game)
+        game_id, flags, ordinal = fields[:3]
+        g.id = game_id if flags & FLAG_HAS_ID else None
+        g.hidden = bool(flags & FLAG_HIDDEN)
+        g.abandonware = bool(flags & FLAG_ABANDONWARE)
+        g.series_is_text = bool(flags & FLAG_SERIES_TEXT)
+        g.added = date.fromordinal(ordinal) if ordinal else None
+        for name, keep, idx in zip(STR_FIELDS, cached, fields[3:]):
+            setattr(g, name, self.string(idx) if keep else self._decode(idx))
+        return g
+
+    def games(self) -> "SnapshotGames":
+        """Every record as a read-only sequence of Games, each decoded on first access."""
+        return SnapshotGames(self)
+
+    def iter_games(self) -> Iterator[Game]:
+        """Every record in order, without keeping per-game strings, so memory stays flat."""
+        for i in range(self._n_records):
+            yield self.game(i, CACHE_SHARED)
+
+class SnapshotGames(Sequence[Game]):
+    """A snapshot's records as a list-like sequence that decodes each Game once, when first read."""
+
+    __slots__ = ("_snap", "_games")
+
+    def __init__(self, snap: Snapshot) -> None:
+        self._snap = snap
+        self._games: List[Optional[Game]] = [None] * len(snap)
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def __getitem__(self, i: Union[int, slice]) -> Union[Game, List[Game]]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self._games)))]
+        g = self._games[i]
+        if g is None:
+            rec = range(len(self._games))[i]
+            g = self._games[rec] = self._snap.game(rec)
+        return g
+
+    def __iter__(self) -> Iterator[Game]:
+        for i in range(len(self._games)):
+            yield self[i]
+
+    def stream(self) -> Iterator[Game]:
+        """Every record in order; ones not read yet are decoded without being kept."""
+        for i, g in enumerate(self._games):
+            yield g if g is not None else self._snap.game(i, CACHE_SHARED)
+
+# Snapshots are never closed explicitly once handed out: a SnapshotGames from
+# an older catalog (watch.py diffs against one) must stay readable after the
+# file is recompiled. The mmap goes away with the last reference.
+_open: Dict[Path, Tuple[Tuple[int, int], Snapshot]] = {}
+
+def _remember(src: Path, stamp: Tuple[int, int], snap: Snapshot) -> None:
+    _open[src] = (stamp, snap)
+
+def current_snapshot(src: Path = GAMES_JSON, path: Path = SNAPSHOT_PATH) -> Optional[Snapshot]:
+    """The snapshot if it matches `src`, else None; never compiles (see open_snapshot)."""
+    src = Path(src)
+    st = src.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _open.get(src)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    if not path.exists():
+        return None
+    try:
+        snap = Snapshot(path)
+    except ValueError:
+        return None
+    if snap.source_sha256 != source_hash(src):
+        snap.close()
+        return None
+    _remember(src, stamp, snap)
+    return snap
+
+def open_snapshot(src: Path = GAMES_JSON, path: Path = SNAPSHOT_PATH) -> Snapshot:
+    """
+    Return an up-to-date snapshot for `src`, recompiling when its hash changed.
+
+    Within one process an unchanged (mtime, size) skips even the hash check.
+    """
+    src = Path(src)
+    snap = current_snapshot(src, path)
+    if snap is None:
+        st = src.stat()
+        compile_snapshot(src, path)
+        snap = Snapshot(path)
+        _remember(src, (st.st_mtime_ns, st.st_size), snap)
+    return snap
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--force", action="store_true", help="recompile even if the snapshot is current")
+    args = ap.parse_args()
+    if args.force:
+        compile_snapshot()
+    snap = open_snapshot()
+    size = os.path.getsize(SNAPSHOT_PATH)
+    print(f"Catalog snapshot: records={len(snap)}, strings={snap._n_strings}, bytes={size}, path={SNAPSHOT_PATH}")
+
+if __name__ == "__main__":
+    instrument.run(main)
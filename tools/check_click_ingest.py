@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Check that batched click ingestion records the same totals as per-click.
+
+Replays one synthetic click stream into two local SQLite copies of the
+popularity schema (popularity_standin.py):
+
+- per-click: the old /api/click path, two statements per click
+- batched:   the click queue in assets/js/main.js (flushed every
+             MAX_QUEUE clicks, or earlier on a pause), posted to
+             /api/clicks and written with the worker's batched statements
+
+and compares clicks and events_daily row by row. Exits non-zero on any
+difference. Also reports requests and statements for each path.
+
+Usage:
+  python3 tools/check_click_ingest.py
+  python3 tools/check_click_ingest.py --clicks 50000 --ids 3000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import List
+
+from popularity_standin import connect, game_ids, ingest_batched, ingest_per_click, totals
+
+# Mirrors MAX_QUEUE in main.js.
+MAX_QUEUE = 20
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--clicks", type=int, default=20000)
+    ap.add_argument("--ids", type=int, default=3000)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    names = game_ids(args.ids)
+    weights = [1.0 / rank for rank in range(1, args.ids + 1)]
+    stream = rng.choices(names, weights=weights, k=args.clicks)
+
+    # Split into queues the way visitors produce them: bursts that end on a
+    # pause (timer flush) or when the queue is full.
+    batches: List[List[str]] = []
+    current: List[str] = []
+    for game_id in stream:
+        current.append(game_id)
+        if len(current) >= MAX_QUEUE or rng.random() < 0.3:
+            batches.append(current)
+            current = []
+    if current:
+        batches.append(current)
+
+    single = connect()
+    t0 = time.perf_counter()
+    single_statements = ingest_per_click(single, stream)
+    single_secs = time.perf_counter() - t0
+
+    batched = connect()
+    t0 = time.perf_counter()
+    batched_statements = ingest_batched(batched, batches)
+    batched_secs = time.perf_counter() - t0
+
+    expected, got = totals(single), totals(batched)
+    print(f"per-click: requests={len(stream)}, statements={single_statements}, {single_secs * 1000:.0f} ms")
+    print(f"batched:   requests={len(batches)}, statements={batched_statements}, {batched_secs * 1000:.0f} ms")
+    for name, a, b in (("clicks", expected[0], got[0]), ("events_daily", expected[1], got[1])):
+        diff = {k for k in a.keys() | b.keys() if a.get(k) != b.get(k)}
+        if diff:
+            sample = sorted(diff)[:5]
+            raise SystemExit(f"{name}: {len(diff)} rows differ, e.g. {[(k, a.get(k), b.get(k)) for k in sample]}")
+        print(f"{name}: {len(a)} rows, {sum(a.values())} clicks, identical")
+
+if __name__ == "__main__":
+    main()
@@ -4,10 +4,11 @@
 from __future__ import annotations
 
 import re
-import struct
 import sys
 from pathlib import Path
 
+import image_info
+
 EXPECTED_URL = "https://thegamingemporium.com/share-preview-final-2026.jpg"
 EXPECTED_IMAGE = Path("static/share-preview-final-2026.jpg")
 BASEOF = Path("layouts/_default/baseof.html")
@@ -30,51 +31,10 @@ def fail(message: str) -> None:
 
 def jpeg_dimensions(path: Path) -> tuple[int, int]:
     """Return JPEG width and height without Pillow or any other dependency."""
-    data = path.read_bytes()
-    if len(data) < 4 or data[:2] != b"\xff\xd8":
-        fail(f"{path} is not a valid JPEG file.")
-
-    sof_markers = {
-        0xC0, 0xC1, 0xC2, 0xC3,
-        0xC5, 0xC6, 0xC7,
-        0xC9, 0xCA, 0xCB,
-        0xCD, 0xCE, 0xCF,
-    }
-
-    offset = 2
-    while offset < len(data):
-        if data[offset] != 0xFF:
-            offset += 1
-            continue
-
-        while offset < len(data) and data[offset] == 0xFF:
-            offset += 1
-        if offset >= len(data):
-            break
-
-        marker = data[offset]
-        offset += 1
-
-        if marker in {0x01, *range(0xD0, 0xD9)}:
-            continue
-
-        if offset + 2 > len(data):
-            break
-
-        segment_length = struct.unpack(">H", data[offset:offset + 2])[0]
-        if segment_length < 2 or offset + segment_length > len(data):
-            fail(f"{path} contains an invalid JPEG segment.")
-
-        if marker in sof_markers:
-            if segment_length < 7:
-                fail(f"{path} contains an invalid JPEG size segment.")
-            height = struct.unpack(">H", data[offset + 3:offset + 5])[0]
-            width = struct.unpack(">H", data[offset + 5:offset + 7])[0]
-            return width, height
-
-        offset += segment_length
-
-    fail(f"Could not determine JPEG dimensions for {path}.")
+    try:
+        return image_info.jpeg_dimensions(path.read_bytes())
+    except ValueError as e:
+        fail(f"{path} {e}")
     raise AssertionError("unreachable")
 
 
@@ -12,18 +12,11 @@ else
   exit 1
 fi
 
-# Always regenerate derived content before building
-python3 tools/generate_game_pages.py
-python3 tools/generate_series_pages.py
-python3 tools/generate_browse_indexes.py
-python3 tools/generate_feature_data.py --include-hidden 0
-
+# Always regenerate derived content before building.
 # Live build: (you said you don't care if hidden appears in search)
-# If you ever want hidden excluded later, change INCLUDE_HIDDEN=1 -> 0
-INCLUDE_HIDDEN=1 python3 tools/generate_search_index.py
-python3 tools/generate_rss_feed.py || true
-
-./check-social
+# If you ever want hidden excluded later, change --search-include-hidden 1 -> 0
+# The RSS stage is optional in tools/build.py, so a feed failure does not stop a deploy.
+python3 tools/build.py --no-hugo --search-include-hidden 1 --feature-include-hidden 0
 
 # Build Hugo
 "$HUGO_CMD" --minify
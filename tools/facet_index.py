@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Facet bitsets over the client catalog, for combined filtering in the browser.
+
+Category, genre and series pages each compute their own membership and
+nothing can answer "decompilations that are platformers in the Mario
+series". This writes one bitset per facet value over the client catalog's
+game positions (see generate_client_catalog.py), so a combined filter is a
+few bitwise ANDs in assets/js/catalog.js instead of a scan of every game:
+
+  {"n": <games>,
+   "facets": {"category":   {"<slug>": "<rle>", ...},
+              "genre":      {...},
+              "series":     {...},
+              "visibility": {"visible": "<rle>", "hidden": "<rle>"}},
+   "labels": {"category": {"<slug>": "<label>"}, "genre": {...}, "series": {...}}}
+
+<rle> is base64 of LEB128 varints giving alternating run lengths of unset
+and set bits, starting with an unset run (which may be 0). Sparse sets such
+as a two-game series cost a few bytes; dense ones stay small as well.
+Keys match the site's URLs: category page slugs (old slugs folded in
+through catalog.canonical_category, as the category pages do),
+/genres/<key>/, /series/<key>/.
+"""
+from __future__ import annotations
+
+import base64
+from collections import defaultdict
+from typing import Dict, Iterable, List
+
+from catalog import Game, canonical_category, category_label, urlize
+
+def _varint(value: int, out: bytearray) -> None:
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+def encode_rle(positions: Iterable[int]) -> str:
+    """Run-length encode a set of ascending bit positions."""
+    out = bytearray()
+    next_bit = 0
+    run_start = None
+    prev = None
+    for pos in positions:
+        if run_start is not None and pos == prev + 1:
+            prev = pos
+            continue
+        if run_start is not None:
+            _varint(prev + 1 - run_start, out)
+            next_bit = prev + 1
+        _varint(pos - next_bit, out)
+        run_start = prev = pos
+    if run_start is not None:
+        _varint(prev + 1 - run_start, out)
+    return base64.b64encode(bytes(out)).decode("ascii")
+
+def decode_rle(data: str) -> List[int]:
+    """Inverse of encode_rle; the browser side lives in assets/js/catalog.js."""
+    raw = base64.b64decode(data)
+    positions: List[int] = []
+    bit = 0
+    set_run = False
+    value = shift = 0
+    for byte in raw:
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if byte & 0x80:
+            continue
+        if set_run:
+            positions.extend(range(bit, bit + value))
+        bit += value
+        set_run = not set_run
+        value = shift = 0
+    return positions
+
+class FacetBuilder:
+    """Facet index built one game at a time; the n-th add() is bit position n."""
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.members: Dict[str, Dict[str, List[int]]] = {
+            "category": defaultdict(list),
+            "genre": defaultdict(list),
+            "series": defaultdict(list),
+            "visibility": defaultdict(list),
+        }
+        self.labels: Dict[str, Dict[str, str]] = {"category": {}, "genre": {}, "series": {}}
+
+    def add(self, g: Game) -> None:
+        pos = self.n
+        self.n += 1
+        members, labels = self.members, self.labels
+        if g.category:
+            cat = canonical_category(g.category)
+            members["category"][cat].append(pos)
+            labels["category"].setdefault(cat, category_label(cat))
+        for key in sorted({urlize(genre) for genre in g.genres} - {""}):
+            members["genre"][key].append(pos)
+        for genre in g.genres:
+            labels["genre"].setdefault(urlize(genre), genre)
+        if g.series_key:
+            members["series"][g.series_key].append(pos)
+            labels["series"].setdefault(g.series_key, g.series)
+        members["visibility"]["hidden" if g.hidden else "visible"].append(pos)
+
+    def index(self) -> Dict[str, object]:
+        facets = {
+            facet: {key: encode_rle(values[key]) for key in sorted(values)}
+            for facet, values in self.members.items()
+        }
+        labels = {
+            facet: {key: items[key] for key in sorted(items) if key in self.members[facet]}
+            for facet, items in self.labels.items()
+        }
+        return {"n": self.n, "facets": facets, "labels": labels}
+
+def build_facets(games: Iterable[Game]) -> Dict[str, object]:
+    """Facet index over `games`, whose positions are the bit positions."""
+    builder = FacetBuilder()
+    for g in games:
+        builder.add(g)
+    return builder.index()
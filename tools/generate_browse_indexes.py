@@ -1,77 +1,142 @@
 #!/usr/bin/env python3
+"""
+Generate data/browse_indexes.json for the series and genre pages.
+
+Both variants ("all" for `hugo server`, "visible" for the live site) are
+built in one pass. Games are referenced by their position in the
+data/games.json array rather than embedded, so templates look them up with
+`index site.Data.games (int .)`. Positions count every array entry, as
+site.Data.games does, including any that load_games() skips for not being
+objects. They are only valid for the exact file they were built from, so
+its sha256 is stored too; layouts/partials/browse-index.html compares it
+with data/games.json. When the two disagree a production build stops, and
+`hugo server` warns and rebuilds the lists from data/games.json itself
+(browse-index-scan.html) until this script has run again:
+
+  {"source_sha256": "<hex sha256 of data/games.json>",
+   "all":     {"series_catalog": [{"slug", "name", "count"}, ...],
+               "series_games": {"<series key>": [position, ...]},
+               "genre_catalog": [...],
+               "genre_games": {"<genre key>": [position, ...]},
+               "category_games": {"<category page slug>": [position, ...]},
+               "category_counts": {"<category page slug>": count}},
+   "visible": {...}}
+
+Series and genre lists are sorted by title, like the embedded lists were.
+Category lists keep games.json order (the category page's default) and
+fold old slugs into their page (catalog.CATEGORY_ALIASES), so
+layouts/categories/ no longer filter the whole catalog per page.
+tools/bench_browse_indexes.py compares size and load time with the old
+embedded format.
+"""
 from __future__ import annotations
-import json, re
+import hashlib
+import json
 from collections import defaultdict
-from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import instrument
+from catalog import PROJECT_ROOT as ROOT, GAMES_JSON, Game, canonical_category, load_games, urlize
 
-ROOT = Path(__file__).resolve().parents[1]
-GAMES = ROOT / 'data' / 'games.json'
 OUT = ROOT / 'data' / 'browse_indexes.json'
 
+SERIES_EXCLUDE = {'disney','james bond','lego','marvel','nfl','spongebob squarepants','dragon ball fighterz'}
 
-def slugify(value: str) -> str:
-    s = str(value or '').strip().lower()
-    s = s.replace('&', 'and').replace('’', "'").replace("'", '')
-    s = re.sub(r'[^a-z0-9]+', '-', s)
-    return re.sub(r'-{2,}', '-', s).strip('-')
 
+def _catalog(members: Dict[str, List[int]], names: Dict[str, str], min_count: int, exclude=frozenset()):
+    out = [
+        {'slug': key, 'name': names[key], 'count': len(ids)}
+        for key, ids in members.items()
+        if len(ids) >= min_count and names[key].lower() not in exclude
+    ]
+    out.sort(key=lambda x: x['name'].lower())
+    return out
 
-def series_key(value: str) -> str:
-    s = slugify(value)
-    return s[4:] if s.startswith('the-') else s
 
+def raw_positions(source: bytes) -> List[int]:
+    """Index in the games.json array of each load_games() record, in order."""
+    return [i for i, x in enumerate(json.loads(source)) if isinstance(x, dict)]
 
-def build(games, include_hidden: bool):
-    selected = [g for g in games if include_hidden or not g.get('hidden', False)]
+
+def build_all(games: Sequence[Game], positions: Optional[Sequence[int]] = None) -> Dict[str, dict]:
+    """
+    {'all': ..., 'visible': ...} from a single pass over `games`.
+
+    `positions` maps each game to its index in the games.json array
+    (raw_positions()); by default the two are taken to be the same.
+    """
+    at = range(len(games)) if positions is None else positions
     series_games = defaultdict(list)
-    series_names = {}
     genre_games = defaultdict(list)
-    genre_names = {}
+    category_games = defaultdict(list)
+    # First name seen per key, per variant (a hidden game may be first).
+    names = {'all': ({}, {}), 'visible': ({}, {})}
 
-    for g in selected:
-        raw = str(g.get('series') or '').strip()
-        if raw:
-            key = series_key(raw)
+    for pos, g in enumerate(games):
+        variants = ('all',) if g.hidden else ('all', 'visible')
+        if g.category:
+            category_games[canonical_category(g.category)].append(pos)
+        key = g.series_key
+        if key:
+            series_games[key].append(pos)
+            for v in variants:
+                names[v][0].setdefault(key, g.series)
+        # Deduplicated, so a game whose genre1 and genre2 urlize alike is listed
+        # once; dict.fromkeys keeps genre1 first, where a set's order would
+        # change with PYTHONHASHSEED and so would the file.
+        for key in dict.fromkeys(urlize(rawg) for rawg in g.genres):
             if key:
-                series_names.setdefault(key, raw)
-                series_games[key].append(g)
-        for field in ('genre1','genre2'):
-            rawg = str(g.get(field) or '').strip()
-            if not rawg:
-                continue
-            key = slugify(rawg)
+                genre_games[key].append(pos)
+        for rawg in g.genres:
+            key = urlize(rawg)
             if key:
-                genre_names.setdefault(key, rawg)
-                # avoid same game twice if genre1 == genre2 variant
-                if not any(x.get('id') == g.get('id') for x in genre_games[key]):
-                    genre_games[key].append(g)
-
-    exclude = {'disney','james bond','lego','marvel','nfl','spongebob squarepants','dragon ball fighterz'}
-    series_catalog=[]
-    for key, vals in series_games.items():
-        name=series_names[key]
-        if len(vals) >= 2 and name.lower() not in exclude:
-            series_catalog.append({'slug':key,'name':name,'count':len(vals)})
-    series_catalog.sort(key=lambda x:x['name'].lower())
-
-    genre_catalog=[{'slug':k,'name':genre_names[k],'count':len(v)} for k,v in genre_games.items()]
-    genre_catalog.sort(key=lambda x:x['name'].lower())
+                for v in variants:
+                    names[v][1].setdefault(key, rawg)
 
-    for vals in series_games.values(): vals.sort(key=lambda g:str(g.get('title') or '').lower())
-    for vals in genre_games.values(): vals.sort(key=lambda g:str(g.get('title') or '').lower())
+    title_key = [g.title.lower() for g in games]
+    for ids in (*series_games.values(), *genre_games.values()):
+        ids.sort(key=title_key.__getitem__)
 
-    return {
-        'series_catalog': series_catalog,
-        'series_games': dict(series_games),
-        'genre_catalog': genre_catalog,
-        'genre_games': dict(genre_games),
-    }
+    payload = {}
+    for variant, (series_names, genre_names) in names.items():
+        keep = (lambda p: True) if variant == 'all' else (lambda p: not games[p].hidden)
+        series = {k: [at[p] for p in ids if keep(p)] for k, ids in series_games.items()}
+        genres = {k: [at[p] for p in ids if keep(p)] for k, ids in genre_games.items()}
+        categories = {k: [at[p] for p in ids if keep(p)] for k, ids in sorted(category_games.items())}
+        series = {k: ids for k, ids in series.items() if ids}
+        genres = {k: ids for k, ids in genres.items() if ids}
+        categories = {k: ids for k, ids in categories.items() if ids}
+        payload[variant] = {
+            'series_catalog': _catalog(series, series_names, 2, SERIES_EXCLUDE),
+            'series_games': series,
+            'genre_catalog': _catalog(genres, genre_names, 1),
+            'genre_games': genres,
+            'category_games': categories,
+            'category_counts': {k: len(ids) for k, ids in categories.items()},
+        }
+    return payload
 
 
 def main():
-    games=json.loads(GAMES.read_text(encoding='utf-8'))
-    payload={'all':build(games, True),'visible':build(games, False)}
-    OUT.write_text(json.dumps(payload, ensure_ascii=False, separators=(',',':')), encoding='utf-8')
-    print(f"Browse indexes: series={len(payload['all']['series_catalog'])}, genres={len(payload['all']['genre_catalog'])}")
+    with instrument.phase('load'):
+        games=load_games()
+        source=GAMES_JSON.read_bytes()
+        positions=raw_positions(source)
+    if len(positions) != len(games):
+        raise SystemExit("data/games.json changed while building the browse indexes; run again")
+    instrument.count('records', len(games))
+    with instrument.phase('build'):
+        payload={'source_sha256': hashlib.sha256(source).hexdigest(), **build_all(games, positions)}
+    with instrument.phase('serialize'):
+        text=json.dumps(payload, ensure_ascii=False, separators=(',',':'))
+    with instrument.phase('write'):
+        # Leave the file alone when nothing changed so Hugo does not reload site.Data.
+        changed = not (OUT.exists() and OUT.read_text(encoding='utf-8') == text)
+        if changed:
+            OUT.write_text(text, encoding='utf-8')
+            instrument.wrote(OUT)
+        else:
+            instrument.count('files_unchanged')
+    print(f"Browse indexes: series={len(payload['all']['series_catalog'])}, genres={len(payload['all']['genre_catalog'])}, bytes={OUT.stat().st_size}, changed={changed}")
 
-if __name__=='__main__': main()
+if __name__=='__main__': instrument.run(main)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Generate static/js/tge-catalog.<hash>.js and the search index from data/games.json.
+
+This replaces three payloads that each repeated titles and urls:
+games-slug-map.js (search slug -> title/url), search-index.js (title/url
+list) and tge-feature-data.js (surprise, favourites and gamesBySlug lists).
+The catalog is columnar and games are referred to by their position in it:
+
+  window.TGE_CATALOG_DATA = {
+    "t": [title, ...], "u": [url, ...], "s": [slug, ...],
+    "c": [category number, ...],           # into "cats" / "catLabels"
+    "cats": [slug, ...], "catLabels": [label, ...],
+    "k": [[position, alias], ...],          # other ids the game is looked up by
+    "hidden": [position, ...],              # hidden games kept for search only
+    "searchHidden": true,                   # whether search lists the hidden games
+    "featureHidden": false,
+    "gems": [position, ...],
+    "stats": {...},
+    "facets": "/js/tge-facets.<hash>.json"  # facet_index.py, fetched on demand
+  }
+
+assets/js/catalog.js decodes it into window.TGE_CATALOG for the search,
+favourites, surprise, hidden-gems, rising and popular scripts. The search
+token index is written by search_index.py over the same positions.
+
+Usage:
+  python3 tools/generate_client_catalog.py
+  python3 tools/generate_client_catalog.py --search-include-hidden 1 --feature-include-hidden 0 --sharded
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import asset_manifest
+import instrument
+from catalog import Game, category_label, hugo_urlize, iter_games
+from facet_index import FacetBuilder
+from search_index import write_search_index
+
+# Logical names in data/asset_manifest.json
+OUT_NAME = "js/tge-catalog.js"
+FACETS_NAME = "js/tge-facets.json"
+
+def build_stats(total: int, added_this_month: int, category_counts: Counter) -> Dict[str, object]:
+    category_stats = [
+        {"slug": slug, "label": category_label(slug), "count": count}
+        for slug, count in category_counts.items()
+    ]
+    category_stats.sort(key=lambda item: item["label"].casefold())
+    return {
+        "totalProjects": total,
+        "addedThisMonth": added_this_month,
+        "categoryCounts": category_stats,
+    }
+
+def build_catalog(
+    games: Iterable[Game], search_hidden: bool, feature_hidden: bool
+) -> Tuple[Dict[str, object], List[Tuple[int, str]], Dict[str, object]]:
+    """(catalog payload, search entries as (position, title), facet index), in one pass over `games`."""
+    gems_cutoff = (datetime.now() - timedelta(days=30)).date()
+    month_prefix = datetime.now().strftime("%Y-%m")
+    titles: List[str] = []
+    urls: List[str] = []
+    slugs: List[str] = []
+    cat_numbers: List[int] = []
+    cats: List[str] = []
+    cat_index: Dict[str, int] = {}
+    aliases: List[List[object]] = []
+    hidden: List[int] = []
+    gems: List[int] = []
+    search: List[Tuple[int, str]] = []
+    facets = FacetBuilder()
+    # Stats count every shown game, with or without a title and link.
+    total = added_this_month = 0
+    category_counts: Counter = Counter()
+
+    for g in games:
+        if not g.hidden or feature_hidden:
+            total += 1
+            if g.category:
+                category_counts[g.category] += 1
+            if g.date_added.startswith(month_prefix):
+                added_this_month += 1
+        if g.hidden and not (search_hidden or feature_hidden):
+            continue
+        # Every consumer needs a title and a link; entries without one were
+        # skipped by all of the old payloads.
+        if not g.title or not g.link:
+            continue
+        pos = len(titles)
+        facets.add(g)
+        titles.append(g.title)
+        urls.append(g.link)
+        slugs.append(g.slug)
+        if g.category not in cat_index:
+            cat_index[g.category] = len(cats)
+            cats.append(g.category)
+        cat_numbers.append(cat_index[g.category])
+        # Click ids come from Hugo's urlize in game-card.html; the old slug
+        # map was keyed by search_slug. Both keep resolving.
+        for alias in sorted({g.search_slug, hugo_urlize(g.title)} - {g.slug, ""}):
+            aliases.append([pos, alias])
+        if g.hidden:
+            hidden.append(pos)
+        if not g.hidden or search_hidden:
+            search.append((pos, g.title))
+        # Hidden Gems excludes entries known to be less than 30 days old.
+        # Legacy entries with no date are treated as established so older
+        # parts of the collection are not unfairly excluded.
+        if g.slug and (not g.hidden or feature_hidden) and not (g.added is not None and g.added > gems_cutoff):
+            gems.append(pos)
+
+    payload = {
+        "t": titles,
+        "u": urls,
+        "s": slugs,
+        "c": cat_numbers,
+        "cats": cats,
+        "catLabels": [category_label(c) if c else "" for c in cats],
+        "k": aliases,
+        "hidden": hidden,
+        "searchHidden": search_hidden,
+        "featureHidden": feature_hidden,
+        "gems": gems,
+        "stats": build_stats(total, added_this_month, category_counts),
+    }
+    return payload, search, facets.index()
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "--search-include-hidden",
+        choices=["0", "1"],
+        default=os.environ.get("INCLUDE_HIDDEN", "0"),
+        help="include hidden games in search (default: $INCLUDE_HIDDEN or 0)",
+    )
+    ap.add_argument("--feature-include-hidden", choices=["0", "1"], default="0")
+    ap.add_argument(
+        "--sharded",
+        action="store_true",
+        default=os.environ.get("SEARCH_SHARDS") == "1",
+        help="write static/search/ shards instead of search-index.js (default: $SEARCH_SHARDS)",
+    )
+    args = ap.parse_args(argv)
+    search_hidden = args.search_include_hidden == "1"
+    feature_hidden = args.feature_include_hidden == "1"
+
+    with instrument.phase("build"):
+        games = instrument.counted("records", iter_games())
+        payload, search, facet_index = build_catalog(games, search_hidden, feature_hidden)
+    with instrument.phase("serialize"):
+        facets = json.dumps(facet_index, ensure_ascii=False, separators=(",", ":"))
+    with instrument.phase("write"):
+        payload["facets"] = asset_manifest.publish(FACETS_NAME, facets)
+    with instrument.phase("serialize"):
+        compact = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    with instrument.phase("write"):
+        url = asset_manifest.publish(OUT_NAME, "window.TGE_CATALOG_DATA=" + compact + ";\n")
+    with instrument.phase("search"):
+        mode = write_search_index(search, args.sharded)
+    print(
+        f"Client catalog: games={len(payload['t'])}, search={len(search)} ({mode}), "
+        f"search_hidden={search_hidden}, feature_hidden={feature_hidden}, url={url}"
+    )
+
+if __name__ == "__main__":
+    instrument.run(main)
@@ -7,80 +7,49 @@ then choose the external link from that page.
 
 - Supports stable slug override via "slug" in games.json.
 - Skips Abandonware entries.
+- Incremental: a manifest of slug -> page hash (.cache/game_pages_manifest.json)
+  means only changed pages are rewritten and only removed/renamed slugs are
+  deleted, so a no-op rebuild touches no files and Hugo's change detection
+  keeps working.
+- Streams games.json (catalog.iter_games()) rather than holding every page,
+  so memory stays flat as the catalog grows.
+- update_pages() re-renders a given set of slugs only; tools/watch.py uses
+  it after an edit to a few games.
 """
 from __future__ import annotations
 
+import hashlib
 import json
-import re
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-GAMES_JSON = PROJECT_ROOT / "data" / "games.json"
-OUT_DIR = PROJECT_ROOT / "content" / "game"
-
-ABANDONWARE = {"abandonware"}
-
-def is_abandonware(game: Dict[str, Any]) -> bool:
-    cat = game.get("category")
-    if cat is None:
-        return False
-    return str(cat).strip().lower() in ABANDONWARE
+import instrument
+from catalog import CACHE_DIR, PROJECT_ROOT, Game, iter_games
 
-def slugify_title(title: str) -> str:
-    # Match the JS slugifyTitle() behaviour used elsewhere (close enough for URLs)
-    s = (title or "")
-    try:
-        import unicodedata
-        s = unicodedata.normalize("NFKD", s)
-        s = "".join(ch for ch in s if not unicodedata.combining(ch))
-    except Exception:
-        pass
-    s = s.lower().strip()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"^-+|-+$", "", s)
-    return s
-
-def read_games() -> List[Dict[str, Any]]:
-    if not GAMES_JSON.exists():
-        raise SystemExit(f"Missing {GAMES_JSON}")
-    data = json.loads(GAMES_JSON.read_text(encoding="utf-8"))
-    if not isinstance(data, list):
-        raise SystemExit("data/games.json must be a JSON array")
-    return [x for x in data if isinstance(x, dict)]
+OUT_DIR = PROJECT_ROOT / "content" / "game"
+MANIFEST = CACHE_DIR / "game_pages_manifest.json"
 
 def fm_escape(s: str) -> str:
     # Basic YAML-safe quoting
     s = (s or "").replace("\\", "\\\\").replace('"', '\\"')
     return f'"{s}"'
 
-def write_game_page(game: Dict[str, Any]) -> None:
-    title = str(game.get("title") or "").strip()
-    ext = str(game.get("link") or "").strip()
+def render_game_page(game: Game) -> Optional[Tuple[str, str]]:
+    """Return (slug, index.md text), or None if the entry gets no page."""
+    title = game.title
+    ext = game.link
     if not title or not ext:
-        return
+        return None
 
-    slug = str(game.get("slug") or "").strip() or slugify_title(title)
+    slug = game.slug
     if not slug:
-        return
-
-    cat = str(game.get("category") or "").strip()
-    genre1 = str(game.get("genre1") or "").strip()
-    genre2 = str(game.get("genre2") or "").strip()
-    series = str(game.get("series") or "").strip()
-    notes = str(game.get("notes") or "").strip()
-    video = str(game.get("video_link") or "").strip()
-    date_added = str(game.get("date_added") or "").strip()
-    image = str(game.get("image") or "").strip()
-
-    out_folder = OUT_DIR / slug
-    out_folder.mkdir(parents=True, exist_ok=True)
-    out_path = out_folder / "index.md"
+        return None
 
     # Keep body minimal; template renders everything from params.
     body = ""
-    if notes:
-        body = notes.strip() + "\n"
+    if game.notes:
+        body = game.notes + "\n"
 
     fm = [
         "---",
@@ -89,59 +58,160 @@ def write_game_page(game: Dict[str, Any]) -> None:
         "type: game",
         "params:",
         f"  external_link: {fm_escape(ext)}",
-        f"  category: {fm_escape(cat)}",
-        f"  genre1: {fm_escape(genre1)}",
-        f"  genre2: {fm_escape(genre2)}",
-        f"  series: {fm_escape(series)}",
-        f"  video_link: {fm_escape(video)}",
-        f"  date_added: {fm_escape(date_added)}",
-        f"  image: {fm_escape(image)}",
+        f"  category: {fm_escape(game.category)}",
+        f"  genre1: {fm_escape(game.genre1)}",
+        f"  genre2: {fm_escape(game.genre2)}",
+        f"  series: {fm_escape(game.series)}",
+        f"  video_link: {fm_escape(game.video_link)}",
+        f"  date_added: {fm_escape(game.date_added)}",
+        f"  image: {fm_escape(game.image)}",
         "---",
         "",
         body,
     ]
-    out_path.write_text("\n".join(fm), encoding="utf-8")
+    return slug, "\n".join(fm)
 
-def main() -> None:
-    OUT_DIR.mkdir(parents=True, exist_ok=True)
-    games = read_games()
-
-    # Clean previously generated pages (only the /content/game folder)
-    # but keep the folder itself.
-    if OUT_DIR.exists():
-        for child in OUT_DIR.iterdir():
-            if child.is_dir():
-                # Only remove folders that contain an index.md we generated
-                idx = child / "index.md"
-                if idx.exists():
-                    for p in child.rglob("*"):
-                        if p.is_file():
-                            p.unlink()
-                    # remove empty dirs bottom-up
-                    for p in sorted(child.rglob("*"), reverse=True):
-                        if p.is_dir():
-                            try:
-                                p.rmdir()
-                            except OSError:
-                                pass
-                    try:
-                        child.rmdir()
-                    except OSError:
-                        pass
-
-    written = 0
+def page_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+def read_manifest() -> Dict[str, str]:
+    try:
+        data = json.loads(MANIFEST.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def write_manifest(manifest: Dict[str, str]) -> None:
+    MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+    tmp = MANIFEST.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, sort_keys=True, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(MANIFEST)
+
+def remove_page_dir(child: Path) -> None:
+    for p in child.rglob("*"):
+        if p.is_file():
+            p.unlink()
+    # remove empty dirs bottom-up
+    for p in sorted(child.rglob("*"), reverse=True):
+        if p.is_dir():
+            try:
+                p.rmdir()
+            except OSError:
+                pass
+    try:
+        child.rmdir()
+    except OSError:
+        pass
+
+def write_page(slug: str, text: str) -> None:
+    out_path = OUT_DIR / slug / "index.md"
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(text, encoding="utf-8")
+    instrument.wrote(out_path)
+
+def update_pages(games: List[Game], slugs: Iterable[str]) -> Tuple[int, int]:
+    """Bring the pages for `slugs` up to date; returns (written, deleted).
+
+    Pass both the old and the new slug of a renamed game so the old page goes.
+    """
+    wanted = set(slugs) - {""}
+    pages: Dict[str, str] = {}
     for g in games:
-        if is_abandonware(g):
+        if g.slug in wanted and not g.abandonware:
+            page = render_game_page(g)
+            if page:
+                pages[page[0]] = page[1]
+
+    manifest = read_manifest()
+    before = dict(manifest)
+    written = deleted = 0
+    for slug in sorted(wanted):
+        text = pages.get(slug)
+        if text is None:
+            child = OUT_DIR / slug
+            if (child / "index.md").exists():
+                remove_page_dir(child)
+                deleted += 1
+            manifest.pop(slug, None)
+            continue
+        digest = page_hash(text)
+        if manifest.get(slug) == digest and (OUT_DIR / slug / "index.md").exists():
             continue
-        before = written
-        write_game_page(g)
-        # Count written if file exists
-        title = str(g.get("title") or "").strip()
-        slug = str(g.get("slug") or "").strip() or slugify_title(title)
-        if slug and (OUT_DIR / slug / "index.md").exists():
-            written += 1
+        write_page(slug, text)
+        manifest[slug] = digest
+        written += 1
+    if manifest != before:
+        write_manifest(manifest)
+    return written, deleted
+
+def main() -> None:
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    print(f"Generated {written} game pages into {OUT_DIR}")
+    # Streamed twice instead of holding every page: the first pass keeps only
+    # slug -> hash, the second re-renders the pages that have to be written.
+    # Later entries win on duplicate slugs, same as when every page was rewritten in order.
+    new_manifest: Dict[str, str] = {}
+    with instrument.phase("build"):
+        for g in instrument.counted("records", iter_games()):
+            if g.abandonware:
+                continue
+            page = render_game_page(g)
+            if page:
+                new_manifest[page[0]] = page_hash(page[1])
+
+    with instrument.phase("write"):
+        old_manifest = read_manifest()
+        # One directory scan instead of an exists() call per game.
+        existing = {e.name for e in os.scandir(OUT_DIR) if e.is_dir()}
+
+        stale: Set[str] = set()
+        created = updated = unchanged = deleted = 0
+        for slug, digest in new_manifest.items():
+            if slug not in existing:
+                stale.add(slug)
+                created += 1
+                continue
+            if old_manifest.get(slug) == digest:
+                unchanged += 1
+                continue
+            if slug not in old_manifest:
+                # No manifest entry (first run or lost cache): compare with what is on disk.
+                try:
+                    if page_hash((OUT_DIR / slug / "index.md").read_text(encoding="utf-8")) == digest:
+                        unchanged += 1
+                        continue
+                except OSError:
+                    pass
+            stale.add(slug)
+            updated += 1
+
+        if stale:
+            for g in iter_games():
+                if g.abandonware or g.slug not in stale:
+                    continue
+                page = render_game_page(g)
+                # Skip entries a later duplicate overrides.
+                if page and page_hash(page[1]) == new_manifest[page[0]]:
+                    write_page(*page)
+                    stale.discard(page[0])
+
+        # Remove folders for slugs that no longer exist (deleted or renamed games).
+        # Only remove folders that contain an index.md we generated.
+        for name in sorted(existing - new_manifest.keys()):
+            child = OUT_DIR / name
+            if (child / "index.md").exists():
+                remove_page_dir(child)
+                deleted += 1
+
+        if new_manifest != old_manifest:
+            write_manifest(new_manifest)
+    instrument.count("files_unchanged", unchanged)
+    instrument.count("files_deleted", deleted)
+
+    print(
+        f"Game pages: created={created}, updated={updated}, deleted={deleted}, "
+        f"unchanged={unchanged}, total={len(new_manifest)}"
+    )
 
 if __name__ == "__main__":
-    main()
+    instrument.run(main)
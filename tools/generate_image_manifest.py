@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Generate data/image_manifest.json from static/Images/Games and static/Images/Series.
+
+resolve-game-image.html used to probe .webp, .jpg and .png with fileExists
+for every game card on every listing page. This scans the image folders once
+per build and records, per slug, the file the templates would have picked
+(same priority order) plus its pixel size read from the file header.
+
+Slugs listed in data/image_aliases.json (written by `audit_images.py --dedupe`
+after collapsing byte-identical files) resolve to their canonical file.
+
+Output format:
+  {"games": {"<slug>": {"src": "/Images/Games/<slug>.webp", "width": 600, "height": 600}, ...},
+   "series": {...}}
+"""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Dict
+
+import instrument
+from catalog import PROJECT_ROOT
+from image_info import image_dimensions
+
+STATIC_DIR = PROJECT_ROOT / "static"
+IMAGES_DIR = STATIC_DIR / "Images"
+GAMES_DIR = IMAGES_DIR / "Games"
+OUT_PATH = PROJECT_ROOT / "data" / "image_manifest.json"
+ALIASES_PATH = PROJECT_ROOT / "data" / "image_aliases.json"
+
+# manifest section -> folder under static/Images
+SECTIONS = {"games": "Games", "series": "Series"}
+
+# Same priority as layouts/partials/resolve-game-image.html
+EXT_PRIORITY = ("webp", "jpg", "png")
+
+def entry_for(src: str) -> Dict[str, object]:
+    item: Dict[str, object] = {"src": src}
+    dims = image_dimensions(STATIC_DIR / src.lstrip("/"))
+    if dims:
+        item["width"], item["height"] = dims
+    return item
+
+def scan_folder(folder: Path) -> Dict[str, str]:
+    """slug -> file name, keeping the highest-priority extension."""
+    best: Dict[str, str] = {}
+    if not folder.is_dir():
+        return best
+    for entry in os.scandir(folder):
+        if not entry.is_file():
+            continue
+        stem, dot, ext = entry.name.rpartition(".")
+        if not dot or ext not in EXT_PRIORITY:
+            continue
+        current = best.get(stem)
+        if current is None or EXT_PRIORITY.index(ext) < EXT_PRIORITY.index(current.rpartition(".")[2]):
+            best[stem] = entry.name
+    return best
+
+def read_aliases() -> Dict[str, Dict[str, str]]:
+    if not ALIASES_PATH.exists():
+        return {}
+    data = json.loads(ALIASES_PATH.read_text(encoding="utf-8"))
+    return data if isinstance(data, dict) else {}
+
+def build_manifest() -> Dict[str, Dict[str, Dict[str, object]]]:
+    aliases = read_aliases()
+    manifest: Dict[str, Dict[str, Dict[str, object]]] = {}
+    for section, folder in SECTIONS.items():
+        found = scan_folder(IMAGES_DIR / folder)
+        items = {stem: entry_for(f"/Images/{folder}/{name}") for stem, name in found.items()}
+        for stem, src in (aliases.get(section) or {}).items():
+            # A real file always wins over an alias.
+            if stem not in items and (STATIC_DIR / src.lstrip("/")).is_file():
+                items[stem] = entry_for(src)
+        manifest[section] = {stem: items[stem] for stem in sorted(items)}
+    return manifest
+
+def main() -> None:
+    if not GAMES_DIR.is_dir():
+        raise SystemExit(f"Missing {GAMES_DIR}")
+    with instrument.phase("build"):
+        manifest = build_manifest()
+    instrument.count("records", sum(len(items) for items in manifest.values()))
+    with instrument.phase("serialize"):
+        payload = json.dumps(manifest, ensure_ascii=False, separators=(",", ":"))
+    with instrument.phase("write"):
+        # Leave the file alone when nothing changed so Hugo does not reload site.Data.
+        if OUT_PATH.exists() and OUT_PATH.read_text(encoding="utf-8") == payload:
+            changed = False
+            instrument.count("files_unchanged")
+        else:
+            OUT_PATH.write_text(payload, encoding="utf-8")
+            instrument.wrote(OUT_PATH)
+            changed = True
+    counts = ", ".join(f"{section}={len(items)}" for section, items in manifest.items())
+    print(f"Image manifest: {counts}, changed={changed}")
+
+if __name__ == "__main__":
+    instrument.run(main)
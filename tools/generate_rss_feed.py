@@ -1,53 +1,52 @@
 #!/usr/bin/env python3
 """
-Generate static/rss.xml (Recent Additions feed) from data/games.json.
+Generate static/rss.xml (Recent Additions feed) and per-section feeds from data/games.json.
 
 Feed design:
 - Last 50 items with a valid date_added (YYYY-MM-DD), newest first.
 - Item <link> points to internal /game/<slug>/ pages (traffic stays on-site).
 - Skips Abandonware.
 - Supports stable slug override via "slug" in games.json.
+- Item images come from data/image_manifest.json (run generate_image_manifest.py
+  first), so deduped or non-.webp artwork resolves to the file that exists.
+
+Section feeds carry the last 20 additions of one category, genre or series
+(keys as in the page URLs; old category slugs fold into their page):
+
+  static/feeds/category/<slug>.xml
+  static/feeds/genre/<key>.xml
+  static/feeds/series/<key>.xml
+
+All feeds come from one pass over the catalog, each keeping a bounded heap
+of its newest items rather than sorting every dated game. lastBuildDate is
+the newest item's date, not the time of the build, and a feed whose bytes
+have not changed is left untouched, so its mtime/ETag stay put and readers'
+conditional GETs keep getting 304. Feeds for sections that no longer have
+dated games are removed.
 """
 from __future__ import annotations
 
+import heapq
 import json
+import os
 import re
+import tempfile
 from datetime import datetime, timezone
 from email.utils import format_datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, TextIO, Tuple
+
+import instrument
+from catalog import PROJECT_ROOT, Game, canonical_category, category_label, hugo_urlize, iter_games, urlize
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-GAMES_JSON = PROJECT_ROOT / "data" / "games.json"
 CONFIG_TOML = PROJECT_ROOT / "config.toml"
 OUT_PATH = PROJECT_ROOT / "static" / "rss.xml"
+FEEDS_DIR = PROJECT_ROOT / "static" / "feeds"
+IMAGE_MANIFEST = PROJECT_ROOT / "data" / "image_manifest.json"
 
-ABANDONWARE = {"abandonware"}
-
-def is_abandonware(game: Dict[str, Any]) -> bool:
-    cat = game.get("category")
-    if cat is None:
-        return False
-    return str(cat).strip().lower() in ABANDONWARE
-
-def slugify_title(title: str) -> str:
-    s = (title or "")
-    try:
-        import unicodedata
-        s = unicodedata.normalize("NFKD", s)
-        s = "".join(ch for ch in s if not unicodedata.combining(ch))
-    except Exception:
-        pass
-    s = s.lower().strip()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"^-+|-+$", "", s)
-    return s
-
-def read_games() -> List[Dict[str, Any]]:
-    data = json.loads(GAMES_JSON.read_text(encoding="utf-8"))
-    if not isinstance(data, list):
-        raise SystemExit("data/games.json must be a JSON array")
-    return [x for x in data if isinstance(x, dict)]
+MAIN_ITEMS = 50
+SECTION_ITEMS = 20
+SECTIONS = ("category", "genre", "series")
 
 def read_base_url() -> str:
     # Very small TOML read: find baseURL = "..."
@@ -62,15 +61,10 @@ def read_base_url() -> str:
         url += "/"
     return url
 
-def parse_date(date_str: str) -> Optional[datetime]:
-    date_str = (date_str or "").strip()
-    if not date_str:
-        return None
-    try:
-        dt = datetime.strptime(date_str, "%Y-%m-%d")
-        return dt.replace(tzinfo=timezone.utc)
-    except Exception:
+def pub_datetime(game: Game) -> Optional[datetime]:
+    if game.added is None:
         return None
+    return datetime(game.added.year, game.added.month, game.added.day, tzinfo=timezone.utc)
 
 def xml_escape(s: str) -> str:
     return (s or "").replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
@@ -87,24 +81,32 @@ def mime_from_url(url: str) -> str:
         return "image/webp"
     return "image/*"
 
-def build_item(game: Dict[str, Any], base_url: str) -> Optional[str]:
-    title = str(game.get("title") or "").strip()
+def read_image_sources() -> Dict[str, str]:
+    """Image stem -> path from data/image_manifest.json, which knows deduped files."""
+    try:
+        data = json.loads(IMAGE_MANIFEST.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    games = data.get("games") if isinstance(data, dict) else None
+    return {slug: item["src"] for slug, item in (games or {}).items() if item.get("src")}
+
+def build_item(game: Game, base_url: str, images: Dict[str, str]) -> Optional[str]:
+    title = game.title
     if not title:
         return None
-    date_added = str(game.get("date_added") or "").strip()
-    dt = parse_date(date_added)
+    dt = pub_datetime(game)
     if dt is None:
         return None
 
-    slug = str(game.get("slug") or "").strip() or slugify_title(title)
+    slug = game.slug
     if not slug:
         return None
 
     internal = f"{base_url}game/{slug}/"
-    cat = str(game.get("category") or "").strip()
-    genre1 = str(game.get("genre1") or "").strip()
-    genre2 = str(game.get("genre2") or "").strip()
-    series = str(game.get("series") or "").strip()
+    cat = game.category
+    genre1 = game.genre1
+    genre2 = game.genre2
+    series = game.series
 
     parts = []
     if cat: parts.append(cat.replace("-", " ").title())
@@ -116,8 +118,13 @@ def build_item(game: Dict[str, Any], base_url: str) -> Optional[str]:
     pub = format_datetime(dt)
 
     # Image URL (absolute)
-    image_field = str(game.get("image") or "").strip().lstrip("/")
-    img_file = image_field if image_field else f"Images/Games/{slug}.webp"
+    image_field = game.image.lstrip("/")
+    # Game images are named by Hugo's urlize of the title, as in game-card.html,
+    # not by the page slug. The manifest has the real file (extension, or the
+    # canonical copy after `audit_images.py --dedupe`); unknown stems keep the
+    # conventional name.
+    stem = hugo_urlize(title)
+    img_file = image_field or images.get(stem, f"/Images/Games/{stem}.webp").lstrip("/")
     if img_file.startswith("http://") or img_file.startswith("https://"):
         img_url = img_file
     else:
@@ -148,53 +155,140 @@ def build_item(game: Dict[str, Any], base_url: str) -> Optional[str]:
     ]
     return "\n".join(lines)
 
-def main() -> None:
-    if not GAMES_JSON.exists():
-        raise SystemExit(f"Missing {GAMES_JSON}")
+# (date ordinal, -catalog position): the heap minimum is the oldest entry,
+# and among equal dates the later one in games.json, as the old stable sort.
+HeapEntry = Tuple[int, int, Game]
 
-    base_url = read_base_url()
-    now = datetime.now(timezone.utc)
-    last_build = format_datetime(now)
-
-    games = [g for g in read_games() if not is_abandonware(g)]
-    # Filter to dated items only, sort newest first
-    dated = []
-    for g in games:
-        dt = parse_date(str(g.get("date_added") or "").strip())
-        if dt is not None:
-            dated.append((dt, g))
-    dated.sort(key=lambda x: x[0], reverse=True)
-    top = [g for _, g in dated[:50]]
-
-    items = []
-    for g in top:
-        it = build_item(g, base_url)
-        if it:
-            items.append(it)
-
-    channel_title = "The Gaming Emporium — Recent Additions"
-    channel_link = base_url
-    channel_desc = "The 50 most recent additions to The Gaming Emporium (links go to the site first)."
-    self_link = f"{base_url}rss.xml"
-
-    xml = "\n".join([
+def _push(heap: List[HeapEntry], entry: HeapEntry, limit: int) -> None:
+    if len(heap) < limit:
+        heapq.heappush(heap, entry)
+    elif entry[:2] > heap[0][:2]:
+        heapq.heapreplace(heap, entry)
+
+def _newest(heap: List[HeapEntry]) -> List[Game]:
+    return [g for _, _, g in sorted(heap, key=lambda e: e[:2], reverse=True)]
+
+def select_items(games: Iterable[Game]) -> Tuple[List[Game], Dict[Tuple[str, str], List[Game]]]:
+    """(main feed games, {(section, key): games}), newest first, in one pass."""
+    main_heap: List[HeapEntry] = []
+    sections: Dict[Tuple[str, str], List[HeapEntry]] = {}
+    for pos, g in enumerate(games):
+        if g.abandonware or g.added is None or not g.title or not g.slug:
+            continue
+        entry = (g.added.toordinal(), -pos, g)
+        _push(main_heap, entry, MAIN_ITEMS)
+        keys = set()
+        if g.category:
+            keys.add(("category", canonical_category(g.category)))
+        keys.update(("genre", key) for key in {urlize(genre) for genre in g.genres} - {""})
+        if g.series_key:
+            keys.add(("series", g.series_key))
+        for key in keys:
+            _push(sections.setdefault(key, []), entry, SECTION_ITEMS)
+    return _newest(main_heap), {key: _newest(heap) for key, heap in sections.items()}
+
+def write_feed(
+    path: Path, items: List[Game], base_url: str, images: Dict[str, str],
+    title: str, description: str, self_url: str,
+) -> bool:
+    """Stream the feed to a temp file; replace `path` only if the bytes differ."""
+    # Stable across builds: the newest item's date, or the epoch for an empty feed.
+    newest = pub_datetime(items[0]) if items else datetime(1970, 1, 1, tzinfo=timezone.utc)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    tmp = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as out:
+            _write_channel(out, items, base_url, images, title, description, self_url, format_datetime(newest))
+        if path.exists() and path.stat().st_size == tmp.stat().st_size and path.read_bytes() == tmp.read_bytes():
+            tmp.unlink()
+            return False
+        tmp.replace(path)
+        instrument.wrote(path)
+        return True
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+def _write_channel(
+    out: TextIO, items: List[Game], base_url: str, images: Dict[str, str],
+    title: str, description: str, self_url: str, last_build: str,
+) -> None:
+    out.write("\n".join([
         "<?xml version=\"1.0\" encoding=\"UTF-8\"?>",
         "<rss version=\"2.0\" xmlns:atom=\"http://www.w3.org/2005/Atom\" xmlns:media=\"http://search.yahoo.com/mrss/\" xmlns:content=\"http://purl.org/rss/1.0/modules/content/\">",
         "  <channel>",
-        f"    <title>{xml_escape(channel_title)}</title>",
-        f"    <link>{xml_escape(channel_link)}</link>",
-        f"    <atom:link href=\"{xml_escape(self_link)}\" rel=\"self\" type=\"application/rss+xml\" />",
-        f"    <description>{xml_escape(channel_desc)}</description>",
+        f"    <title>{xml_escape(title)}</title>",
+        f"    <link>{xml_escape(base_url)}</link>",
+        f"    <atom:link href=\"{xml_escape(self_url)}\" rel=\"self\" type=\"application/rss+xml\" />",
+        f"    <description>{xml_escape(description)}</description>",
         f"    <lastBuildDate>{xml_escape(last_build)}</lastBuildDate>",
-        *items,
-        "  </channel>",
-        "</rss>",
         "",
-    ])
+    ]))
+    for g in items:
+        item = build_item(g, base_url, images)
+        if item:
+            out.write(item)
+            out.write("\n")
+    out.write("  </channel>\n</rss>\n")
 
-    OUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUT_PATH.write_text(xml, encoding="utf-8")
-    print(f"Wrote {OUT_PATH} with {len(items)} items")
+def section_title(section: str, key: str, items: List[Game]) -> str:
+    if section == "category":
+        return category_label(key)
+    sample = items[0]
+    if section == "series":
+        return sample.series
+    # Genre display name as written on the newest item.
+    return next((genre for genre in sample.genres if urlize(genre) == key), key)
+
+def main() -> None:
+    base_url = read_base_url()
+    images = read_image_sources()
+    with instrument.phase("build"):
+        # Streamed: only the bounded heaps of candidates are kept.
+        main_items, sections = select_items(instrument.counted("records", iter_games()))
+
+    written = unchanged = 0
+    def record(changed: bool) -> None:
+        nonlocal written, unchanged
+        if changed:
+            written += 1
+        else:
+            unchanged += 1
+
+    with instrument.phase("write"):
+        record(write_feed(
+            OUT_PATH, main_items, base_url, images,
+            "The Gaming Emporium — Recent Additions",
+            "The 50 most recent additions to The Gaming Emporium (links go to the site first).",
+            f"{base_url}rss.xml",
+        ))
+
+        keep = set()
+        for (section, key), items in sorted(sections.items()):
+            rel = f"feeds/{section}/{key}.xml"
+            keep.add(PROJECT_ROOT / "static" / rel)
+            name = section_title(section, key, items)
+            record(write_feed(
+                PROJECT_ROOT / "static" / rel, items, base_url, images,
+                f"The Gaming Emporium — {name}",
+                f"The {SECTION_ITEMS} most recent {name} additions to The Gaming Emporium (links go to the site first).",
+                f"{base_url}{rel}",
+            ))
+
+        removed = 0
+        for section in SECTIONS:
+            for path in sorted((FEEDS_DIR / section).glob("*.xml")):
+                if path not in keep:
+                    path.unlink()
+                    removed += 1
+    instrument.count("files_unchanged", unchanged)
+    instrument.count("files_deleted", removed)
+
+    print(
+        f"Wrote {OUT_PATH} with {len(main_items)} items; "
+        f"feeds={len(sections) + 1}, written={written}, unchanged={unchanged}, removed={removed}"
+    )
 
 if __name__ == "__main__":
-    main()
+    instrument.run(main)
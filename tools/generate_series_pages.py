@@ -8,57 +8,23 @@ if a matching content file exists at content/series/<slug>.md.
 
 from __future__ import annotations
 
-import json
-import os
-import re
 from collections import Counter
-from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Iterable, List, Sequence, Tuple
+
+import instrument
+from catalog import PROJECT_ROOT, Game, load_games, series_key
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-GAMES_JSON = PROJECT_ROOT / "data" / "games.json"
 SERIES_DIR = PROJECT_ROOT / "content" / "series"
 
 AUTO_MARKER = "AUTO-GENERATED: series page (do not edit manually)"
 
 def hugo_urlize(value: str) -> str:
-    """
-    Approximate Hugo's `urlize`:
-    - lowercase
-    - strip apostrophes
-    - convert & to "and"
-    - replace non-alnum with hyphens
-    - collapse multiple hyphens
-    """
-    s = value.strip().lower()
-    s = s.replace("&", "and")
-    s = s.replace("’", "'")
-    s = s.replace("'", "")
-    # Replace any non-alphanumeric with hyphen
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-{2,}", "-", s).strip("-")
-    # Treat optional leading "The" as the same series (e.g. Lord of the Rings).
-    if s.startswith("the-"):
-        s = s[4:]
-    return s or "series"
-
-def read_games(path: Path) -> List[Dict[str, Any]]:
-    with path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    if not isinstance(data, list):
-        raise ValueError("data/games.json must be a JSON array of objects")
-    return [x for x in data if isinstance(x, dict)]
-
-def extract_series(games: List[Dict[str, Any]]) -> List[str]:
-    out: List[str] = []
-    for g in games:
-        s = g.get("series")
-        if not s:
-            continue
-        # Some entries might accidentally store non-strings; ignore those safely.
-        if isinstance(s, str):
-            out.append(s.strip())
-    return [x for x in out if x]
+    """Series page slug: catalog.series_key() with a non-empty fallback."""
+    return series_key(value) or "series"
+
+def extract_series(games: Sequence[Game]) -> List[str]:
+    # Some entries might accidentally store non-strings; ignore those safely.
+    return [g.series for g in games if g.series and g.series_is_text]
 
 def should_overwrite(existing_text: str) -> bool:
     return AUTO_MARKER in existing_text
@@ -74,21 +40,15 @@ def make_content(series_name: str, slug: str) -> str:
         "---\n"
     )
 
-def main() -> None:
-    if not GAMES_JSON.exists():
-        raise SystemExit(f"Missing {GAMES_JSON}")
-
-    games = read_games(GAMES_JSON)
-    series_list = extract_series(games)
-
-    counts = Counter(series_list)
+def write_series_pages(names: Iterable[str]) -> Tuple[int, int, int]:
+    """Create or refresh the pages for `names`; returns (created, updated, skipped)."""
     SERIES_DIR.mkdir(parents=True, exist_ok=True)
 
     created = 0
     updated = 0
     skipped = 0
 
-    for series_name, _count in sorted(counts.items(), key=lambda kv: kv[0].lower()):
+    for series_name in sorted(names, key=str.lower):
         slug = hugo_urlize(series_name)
         path = SERIES_DIR / f"{slug}.md"
 
@@ -99,6 +59,7 @@ def main() -> None:
             if should_overwrite(old_text):
                 if old_text != new_text:
                     path.write_text(new_text, encoding="utf-8")
+                    instrument.wrote(path)
                     updated += 1
                 else:
                     skipped += 1
@@ -107,9 +68,21 @@ def main() -> None:
                 skipped += 1
         else:
             path.write_text(new_text, encoding="utf-8")
+            instrument.wrote(path)
             created += 1
+    return created, updated, skipped
+
+def main() -> None:
+    with instrument.phase("load"):
+        games = load_games()
+    instrument.count("records", len(games))
+    with instrument.phase("build"):
+        counts = Counter(extract_series(games))
+    with instrument.phase("write"):
+        created, updated, skipped = write_series_pages(counts)
+    instrument.count("files_unchanged", skipped)
 
     print(f"Series pages: created={created}, updated={updated}, skipped={skipped}, total_series={len(counts)}")
 
 if __name__ == "__main__":
-    main()
+    instrument.run(main)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Read image pixel dimensions from JPEG, PNG and WebP headers using only the standard library."""
+
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+from typing import Optional, Tuple
+
+JPEG_SOF_MARKERS = {
+    0xC0, 0xC1, 0xC2, 0xC3,
+    0xC5, 0xC6, 0xC7,
+    0xC9, 0xCA, 0xCB,
+    0xCD, 0xCE, 0xCF,
+}
+
+# Enough for the PNG IHDR chunk and every WebP variant (VP8, VP8L, VP8X).
+HEADER_BYTES = 32
+
+
+def jpeg_dimensions(data: bytes) -> Tuple[int, int]:
+    """Return (width, height) of a JPEG; raises ValueError when it cannot be read."""
+    if len(data) < 4 or data[:2] != b"\xff\xd8":
+        raise ValueError("is not a valid JPEG file.")
+
+    offset = 2
+    while offset < len(data):
+        if data[offset] != 0xFF:
+            offset += 1
+            continue
+
+        while offset < len(data) and data[offset] == 0xFF:
+            offset += 1
+        if offset >= len(data):
+            break
+
+        marker = data[offset]
+        offset += 1
+
+        if marker in {0x01, *range(0xD0, 0xD9)}:
+            continue
+
+        if offset + 2 > len(data):
+            break
+
+        segment_length = struct.unpack(">H", data[offset:offset + 2])[0]
+        if segment_length < 2 or offset + segment_length > len(data):
+            raise ValueError("contains an invalid JPEG segment.")
+
+        if marker in JPEG_SOF_MARKERS:
+            if segment_length < 7:
+                raise ValueError("contains an invalid JPEG size segment.")
+            height = struct.unpack(">H", data[offset + 3:offset + 5])[0]
+            width = struct.unpack(">H", data[offset + 5:offset + 7])[0]
+            return width, height
+
+        offset += segment_length
+
+    raise ValueError("has no JPEG size segment.")
+
+
+def png_dimensions(data: bytes) -> Tuple[int, int]:
+    if len(data) < 24 or data[:8] != b"\x89PNG\r\n\x1a\n" or data[12:16] != b"IHDR":
+        raise ValueError("is not a valid PNG file.")
+    width, height = struct.unpack(">II", data[16:24])
+    return width, height
+
+
+def webp_dimensions(data: bytes) -> Tuple[int, int]:
+    if len(data) < 30 or data[:4] != b"RIFF" or data[8:12] != b"WEBP":
+        raise ValueError("is not a valid WebP file.")
+    chunk = data[12:16]
+    if chunk == b"VP8 ":
+        # Lossy: 3-byte frame tag, start code 9d 01 2a, then 14-bit sizes.
+        if data[23:26] != b"\x9d\x01\x2a":
+            raise ValueError("contains an invalid VP8 frame header.")
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L":
+        # Lossless: signature 0x2f, then 14-bit (width - 1) and (height - 1).
+        if data[20] != 0x2F:
+            raise ValueError("contains an invalid VP8L header.")
+        bits = int.from_bytes(data[21:25], "little")
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X":
+        # Extended: 24-bit (canvas width - 1) and (canvas height - 1).
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return width, height
+    raise ValueError(f"has an unknown WebP chunk {chunk!r}.")
+
+
+def image_dimensions(path: Path) -> Optional[Tuple[int, int]]:
+    """(width, height) for a .jpg/.jpeg/.png/.webp file, or None if it cannot be read."""
+    suffix = path.suffix.lower()
+    try:
+        with path.open("rb") as f:
+            if suffix in (".jpg", ".jpeg"):
+                # The size segment can sit after large EXIF/ICC blocks, so scan the file.
+                return jpeg_dimensions(f.read())
+            head = f.read(HEADER_BYTES)
+    except OSError:
+        return None
+    except ValueError:
+        return None
+    try:
+        if suffix == ".png":
+            return png_dimensions(head)
+        if suffix == ".webp":
+            return webp_dimensions(head)
+    except ValueError:
+        return None
+    return None
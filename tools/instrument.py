@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Opt-in timings, counters and cProfile dumps for the tools/ generators.
+
+Off by default, and then every call here is a no-op. Turn it on with
+
+  BUILD_TRACE=1 python3 tools/generate_game_pages.py     # trace to .cache/build-trace.json
+  BUILD_TRACE=/tmp/a.json python3 tools/build.py --no-hugo
+  python3 tools/build.py --no-hugo --profile [PATH]      # same, from build.py
+  BUILD_CPROFILE=/tmp/prof python3 tools/build.py ...    # also one .prof per tool
+  python3 tools/build.py --no-hugo --cprofile /tmp/prof
+
+Generators mark their phases and count what they did:
+
+  with instrument.phase("serialize"):
+      text = json.dumps(payload)
+  instrument.count("records", len(games))
+  for g in instrument.counted("records", iter_games()):   # same, streamed
+  instrument.wrote(path)                 # files_written += 1, bytes_written += size
+
+Everything is grouped by tool: build.py opens one instrument.tool(<stage>)
+scope per stage (threads keep separate scopes), and a generator run on its
+own is grouped under its script name (`instrument.run(main)` in its
+`__main__` block, which is also what gets cProfiled). Phases may nest
+("build/facets"). The usual phase names are load, normalize, build,
+serialize and write.
+
+The trace is JSON with sorted keys, one entry per tool:
+
+  {"version": 1, "argv": [...], "wall_s": 1.23,
+   "tools": {"game_pages": {"wall_s": 0.05,
+                            "phases": {"load": {"s": 0.01, "calls": 1}, ...},
+                            "counters": {"records": 2794, "files_written": 3, ...}}}}
+
+and two of them can be compared:
+
+  python3 tools/instrument.py old.json new.json
+"""
+from __future__ import annotations
+
+import argparse
+import atexit
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+
+ENV_TRACE = "BUILD_TRACE"
+ENV_CPROFILE = "BUILD_CPROFILE"
+DEFAULT_TRACE = Path(__file__).resolve().parents[1] / ".cache" / "build-trace.json"
+VERSION = 1
+
+T = TypeVar("T")
+
+class _Tool:
+    __slots__ = ("wall_s", "phases", "counters")
+
+    def __init__(self) -> None:
+        self.wall_s = 0.0
+        self.phases: Dict[str, List[float]] = {}
+        self.counters: Dict[str, int] = {}
+
+_lock = threading.Lock()
+_local = threading.local()
+_tools: Dict[str, _Tool] = {}
+_trace_path: Optional[Path] = None
+_cprofile_dir: Optional[Path] = None
+_started = 0.0
+_written = False
+
+def enabled() -> bool:
+    return _trace_path is not None
+
+def enable(path: Optional[Path] = None, cprofile_dir: Optional[Path] = None) -> None:
+    """Start recording; the trace goes to `path` (default .cache/build-trace.json)."""
+    global _trace_path, _cprofile_dir, _started, _written
+    _trace_path = Path(path) if path else DEFAULT_TRACE
+    if cprofile_dir:
+        _cprofile_dir = Path(cprofile_dir)
+    _started = time.perf_counter()
+    _written = False
+
+def _stack() -> List[str]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        # Outside build.py: the script being run is the tool.
+        stack = _local.stack = [Path(sys.argv[0]).stem or "main"]
+    return stack
+
+def _record(tool: str) -> _Tool:
+    rec = _tools.get(tool)
+    if rec is None:
+        rec = _tools[tool] = _Tool()
+    return rec
+
+@contextmanager
+def tool(name: str) -> Iterator[None]:
+    """Group phases and counters under `name` for this thread; cProfiles it if asked."""
+    if not enabled():
+        yield
+        return
+    saved = getattr(_local, "stack", None)
+    _local.stack = [name]
+    prof = cProfile.Profile() if _cprofile_dir else None
+    t0 = time.perf_counter()
+    if prof:
+        prof.enable()
+    try:
+        yield
+    finally:
+        if prof:
+            prof.disable()
+        elapsed = time.perf_counter() - t0
+        with _lock:
+            _record(name).wall_s += elapsed
+        if prof:
+            _cprofile_dir.mkdir(parents=True, exist_ok=True)
+            prof.dump_stats(str(_cprofile_dir / f"{name}.prof"))
+        _local.stack = saved
+
+def run(fn: Callable[..., T], *args) -> T:
+    """Call a generator's main() as one tool, named after the script; for `__main__` blocks."""
+    with tool(Path(sys.argv[0]).stem or "main"):
+        return fn(*args)
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    if not enabled():
+        yield
+        return
+    stack = _stack()
+    stack.append(name)
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - t0
+        stack.pop()
+        key = "/".join(stack[1:] + [name])
+        with _lock:
+            entry = _record(stack[0]).phases.setdefault(key, [0.0, 0])
+            entry[0] += elapsed
+            entry[1] += 1
+
+def count(name: str, n: int = 1) -> None:
+    if not enabled():
+        return
+    tool_name = _stack()[0]
+    with _lock:
+        counters = _record(tool_name).counters
+        counters[name] = counters.get(name, 0) + n
+
+def counted(name: str, items: Iterable[T]) -> Iterator[T]:
+    """Pass `items` through, counting them under `name` once exhausted; for streamed input."""
+    if not enabled():
+        yield from items
+        return
+    n = 0
+    for item in items:
+        n += 1
+        yield item
+    count(name, n)
+
+def wrote(path: Path) -> None:
+    """Count `path` as written: files_written += 1, bytes_written += its size."""
+    if not enabled():
+        return
+    count("files_written")
+    count("bytes_written", path.stat().st_size)
+
+def snapshot() -> Dict[str, object]:
+    with _lock:
+        tools = {
+            name: {
+                "wall_s": round(rec.wall_s, 6),
+                "phases": {k: {"s": round(s, 6), "calls": calls} for k, (s, calls) in rec.phases.items()},
+                "counters": dict(rec.counters),
+            }
+            for name, rec in _tools.items()
+        }
+    return {
+        "version": VERSION,
+        "argv": sys.argv,
+        "wall_s": round(time.perf_counter() - _started, 6),
+        "tools": tools,
+    }
+
+def write_trace() -> Optional[Path]:
+    """Write the trace file; returns its path, or None when tracing is off."""
+    global _written
+    if not enabled():
+        return None
+    _trace_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _trace_path.with_name(_trace_path.name + ".tmp")
+    tmp.write_text(json.dumps(snapshot(), indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.replace(_trace_path)
+    _written = True
+    return _trace_path
+
+def _at_exit() -> None:
+    if enabled() and not _written:
+        path = write_trace()
+        print(f"Trace written to {path}", file=sys.stderr)
+
+def _from_env() -> None:
+    trace = os.environ.get(ENV_TRACE, "")
+    cprofile_dir = os.environ.get(ENV_CPROFILE, "")
+    if trace in ("", "0") and not cprofile_dir:
+        return
+    enable(None if trace in ("", "0", "1") else Path(trace), Path(cprofile_dir) if cprofile_dir else None)
+
+_from_env()
+atexit.register(_at_exit)
+
+def _flatten(trace: Dict[str, object]) -> Dict[str, float]:
+    out: Dict[str, float] = {}
+    for name, rec in (trace.get("tools") or {}).items():
+        out[f"{name} wall_s"] = rec.get("wall_s", 0.0)
+        for phase_name, entry in (rec.get("phases") or {}).items():
+            out[f"{name} {phase_name}"] = entry.get("s", 0.0)
+        for counter, value in (rec.get("counters") or {}).items():
+            out[f"{name} #{counter}"] = value
+    return out
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Compare two build traces (timings in seconds, #counters)")
+    ap.add_argument("old")
+    ap.add_argument("new")
+    ap.add_argument("--all", action="store_true", help="also list rows that did not change")
+    args = ap.parse_args()
+    old = _flatten(json.loads(Path(args.old).read_text(encoding="utf-8")))
+    new = _flatten(json.loads(Path(args.new).read_text(encoding="utf-8")))
+    width = max([len(k) for k in {**old, **new}] + [4])
+    print(f"{'':<{width}}  {'old':>12}  {'new':>12}  {'change':>8}")
+    for key in sorted(old.keys() | new.keys()):
+        a, b = old.get(key), new.get(key)
+        if a == b and not args.all:
+            continue
+        change = f"{(b / a - 1) * 100:+.0f}%" if a and b is not None else ""
+        print(f"{key:<{width}}  {'-' if a is None else a:>12}  {'-' if b is None else b:>12}  {change:>8}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Read the elements of a top-level JSON array one at a time.
+
+json.loads(path.read_text()) holds the whole file text and every decoded
+element at once. iter_array() reads the file in fixed-size chunks and hands
+each element to json's own decoder (JSONDecoder.raw_decode) as soon as it is
+complete, keeping only the unconsumed tail of the current chunk, so memory
+is bounded by the largest single element rather than the file:
+
+  for entry in iter_array(GAMES_JSON):
+      ...
+
+Elements come out exactly as json.loads would decode them. Malformed input
+raises ValueError (json.JSONDecodeError where the decoder finds the error);
+a file whose top level is not an array raises NotAnArray.
+
+Usage:
+  python3 tools/json_stream.py data/games.json     # count elements, check the file parses
+"""
+from __future__ import annotations
+
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Any, Iterator, TextIO
+
+CHUNK_SIZE = 1 << 16
+
+_WS = re.compile(r"[ \t\n\r]*")
+
+class NotAnArray(ValueError):
+    pass
+
+class _Buffer:
+    """The not-yet-consumed text of a file, refilled a chunk at a time."""
+
+    def __init__(self, f: TextIO, chunk_size: int) -> None:
+        self.f = f
+        self.chunk_size = chunk_size
+        self.text = ""
+        self.pos = 0
+
+    def fill(self) -> bool:
+        """Append the next chunk, dropping consumed text; False at end of file."""
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            return False
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it; '' at end of file."""
+        while True:
+            self.pos = _WS.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+def iter_array(path: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """Yield the elements of the JSON array stored in `path`, in order."""
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        buf = _Buffer(f, chunk_size)
+        if buf.peek() != "[":
+            raise NotAnArray(f"{path} is not a JSON array")
+        buf.pos += 1
+        if buf.peek() == "]":
+            buf.pos += 1
+        else:
+            while True:
+                if not buf.peek():
+                    raise ValueError(f"{path}: file ends inside the array")
+                while True:
+                    try:
+                        value, end = decoder.raw_decode(buf.text, buf.pos)
+                    except json.JSONDecodeError:
+                        # Most likely the element continues in the next chunk.
+                        if buf.fill():
+                            continue
+                        raise
+                    # A number cut at the chunk boundary ("-1.5" of "-1.5e10") still
+                    # decodes; only trust it once a separator follows in this chunk.
+                    after = _WS.match(buf.text, end).end()
+                    if (after == len(buf.text) or buf.text[after] not in ",]") and buf.fill():
+                        continue
+                    break
+                buf.pos = end
+                yield value
+                sep = buf.peek()
+                buf.pos += 1
+                if sep == "]":
+                    break
+                if sep != ",":
+                    raise ValueError(f"{path}: expected ',' or ']' between array elements")
+        if buf.peek():
+            raise ValueError(f"{path}: unexpected data after the array")
+
+def main() -> None:
+    if len(sys.argv) != 2:
+        raise SystemExit("Usage: python3 tools/json_stream.py <file.json>")
+    count = sum(1 for _ in iter_array(Path(sys.argv[1])))
+    print(f"{sys.argv[1]}: {count} elements")
+
+if __name__ == "__main__":
+    main()
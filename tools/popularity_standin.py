@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Local SQLite stand-in for the popularity D1 database.
+
+D1 is SQLite, so the schema in cloudflare/d1_schema_popularity.sql loads
+as-is into the sqlite3 module. This module gives the tools/ scripts:
+
+- connect(): a database with that schema applied
+- synthesize(): click history at a chosen scale. Game popularity follows a
+  Zipf curve (a few games take most clicks, most get a trickle), each day
+  samples --clicks-per-day clicks from it, and a small share of games
+  "surge" for a few days so the rising query has something to find. clicks
+  holds the all-time totals of the same history.
+- worker_queries(): the /api/top SQL read straight out of
+  cloudflare/worker_popularity.js, with the worker's parameter binding, so
+  measurements follow the deployed code rather than a copy of it.
+- ingest_per_click() / ingest_batched(): the old one-click-at-a-time
+  /api/click writes, and the worker's batched click statements
+  (clickStatements()), for checking that both give the same totals.
+- refresh_rollups() / rollup_queries(): the scheduled rollup rebuild and
+  events_daily compaction (rollupStatements()), and the rollup reads
+  (rollupRows()), again taken from the worker.
+
+tools/bench_popularity.py and tools/check_click_ingest.py are the
+command-line front ends.
+"""
+from __future__ import annotations
+
+import bisect
+import random
+import re
+import sqlite3
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from catalog import PROJECT_ROOT
+
+CLOUDFLARE_DIR = PROJECT_ROOT / "cloudflare"
+SCHEMA_PATH = CLOUDFLARE_DIR / "d1_schema_popularity.sql"
+WORKER_PATH = CLOUDFLARE_DIR / "worker_popularity.js"
+
+# Share of games that get a multi-day surge, and how strong it is.
+SURGE_SHARE = 0.01
+SURGE_FACTOR = 25.0
+
+def connect(path: str = ":memory:", schema: Path = SCHEMA_PATH) -> sqlite3.Connection:
+    con = sqlite3.connect(path)
+    con.executescript(schema.read_text(encoding="utf-8"))
+    return con
+
+def game_ids(n: int) -> List[str]:
+    # Click ids are urlized titles on the live site; their shape does not
+    # matter to the queries, only their count.
+    return [f"game-{i:06d}" for i in range(1, n + 1)]
+
+def synthesize(
+    con: sqlite3.Connection,
+    ids: int,
+    days: int,
+    clicks_per_day: int,
+    zipf: float = 1.1,
+    seed: int = 1,
+) -> Tuple[int, int]:
+    """Fill events_daily and clicks; returns (events_daily rows, total clicks)."""
+    rng = random.Random(seed)
+    names = game_ids(ids)
+    rng.shuffle(names)
+    weights = [1.0 / (rank ** zipf) for rank in range(1, ids + 1)]
+    today = date.today()
+
+    surges: Dict[int, List[int]] = {}
+    for _ in range(max(1, int(ids * SURGE_SHARE))):
+        game = rng.randrange(ids)
+        start = rng.randrange(days)
+        for d in range(start, min(days, start + rng.randint(2, 6))):
+            surges.setdefault(d, []).append(game)
+
+    base_total = sum(weights)
+    cumulative: List[float] = []
+    acc = 0.0
+    for w in weights:
+        acc += w
+        cumulative.append(acc)
+
+    totals: Counter = Counter()
+    rows = 0
+    for d in range(days):
+        day = (today - timedelta(days=days - 1 - d)).isoformat()
+        # Traffic grows a little over the year and dips at weekends.
+        volume = clicks_per_day * (0.7 + 0.6 * d / max(1, days - 1))
+        if (today - timedelta(days=days - 1 - d)).weekday() >= 5:
+            volume *= 0.8
+        picks = Counter(
+            bisect.bisect_left(cumulative, rng.random() * base_total)
+            for _ in range(int(volume))
+        )
+        for game in surges.get(d, ()):
+            picks[game] += int(SURGE_FACTOR * rng.uniform(0.5, 1.5))
+        con.executemany(
+            "INSERT INTO events_daily (day, id, clicks, views) VALUES (?, ?, ?, 0)",
+            ((day, names[game], n) for game, n in picks.items()),
+        )
+        rows += len(picks)
+        totals.update(picks)
+    con.executemany(
+        "INSERT INTO clicks (id, count) VALUES (?, ?)",
+        ((names[game], n) for game, n in totals.items()),
+    )
+    con.commit()
+    return rows, sum(totals.values())
+
+def _sql_literals(source: str) -> List[str]:
+    return [m.group(1) for m in re.finditer(r"`([^`]*\bSELECT\b[^`]*)`", source)]
+
+def _find(literals: Sequence[str], name: str, test: Callable[[str], bool]) -> str:
+    found = [sql for sql in literals if test(sql)]
+    if len(found) != 1:
+        raise SystemExit(f"Could not find the {name} query in {WORKER_PATH.name} ({len(found)} matches)")
+    return found[0]
+
+def worker_queries(
+    ids: Sequence[str], limit: int = 10, days: int = 7, hidden_limit: int = 100
+) -> Dict[str, Tuple[str, Tuple[object, ...]]]:
+    """{mode: (sql, params)} for every /api/top query, bound like the worker binds them."""
+    literals = _sql_literals(WORKER_PATH.read_text(encoding="utf-8"))
+    marks = ",".join("?" for _ in ids)
+    offset = f"{-(days - 1)} days"
+
+    rising = _find(literals, "rising", lambda q: "momentum" in q)
+    hidden = _find(literals, "hidden", lambda q: "ORDER BY count ASC" in q)
+    trending_ids = _find(literals, "trending (ids)", lambda q: "events_daily" in q and "${marks}" in q)
+    trending = _find(
+        literals, "trending",
+        lambda q: "events_daily" in q and "${marks}" not in q and "momentum" not in q and "INSERT" not in q,
+    )
+    all_ids = _find(literals, "all (ids)", lambda q: "FROM clicks WHERE id IN" in q)
+    all_top = _find(literals, "all", lambda q: q.strip() == "SELECT id, count FROM clicks ORDER BY count DESC LIMIT ?1")
+
+    # Same constants as the rising branch of the worker.
+    recent_days, baseline_days = 3, 14
+    return {
+        "rising": (rising, (
+            f"{-(recent_days - 1)} days",
+            f"{-(recent_days + baseline_days - 1)} days",
+            baseline_days,
+            recent_days,
+            limit,
+        )),
+        "hidden": (hidden, (hidden_limit,)),
+        "trending": (trending, (offset, limit)),
+        "trending_ids": (trending_ids.replace("${marks}", marks), (offset, *ids, limit)),
+        "all": (all_top, (limit,)),
+        "all_ids": (all_ids.replace("${marks}", marks), (*ids, limit)),
+    }
+
+# /api/click before batching: two awaited statements per click.
+PER_CLICK_SQL = (
+    """INSERT INTO clicks (id, count, updated_at)
+       VALUES (?1, 1, unixepoch())
+       ON CONFLICT(id) DO UPDATE SET
+         count = count + 1,
+         updated_at = unixepoch()""",
+    """INSERT INTO events_daily (day, id, clicks, views)
+       VALUES (date('now'), ?1, 1, 0)
+       ON CONFLICT(day, id) DO UPDATE SET
+         clicks = clicks + 1""",
+)
+
+def worker_click_sql() -> Tuple[str, str]:
+    """The (clicks, events_daily) upserts of clickStatements() in the worker."""
+    literals = re.findall(r"`([^`]*\bINSERT INTO\b[^`]*)`", WORKER_PATH.read_text(encoding="utf-8"))
+    return (
+        _find(literals, "clicks upsert", lambda q: "INSERT INTO clicks" in q),
+        _find(literals, "events_daily upsert", lambda q: "INSERT INTO events_daily" in q),
+    )
+
+def ingest_per_click(con: sqlite3.Connection, clicks: Iterable[str]) -> int:
+    """Record clicks one at a time; returns statements executed."""
+    statements = 0
+    for game_id in clicks:
+        for sql in PER_CLICK_SQL:
+            con.execute(sql, (game_id,))
+            statements += 1
+        con.commit()
+    return statements
+
+def ingest_batched(con: sqlite3.Connection, batches: Iterable[Sequence[str]]) -> int:
+    """Record queued clicks the way POST /api/clicks does: one batch per queue."""
+    all_time, daily = worker_click_sql()
+    statements = 0
+    for batch in batches:
+        counts = Counter(game_id for game_id in batch if game_id)
+        # env.DB.batch() runs as one transaction.
+        with con:
+            for game_id, n in counts.items():
+                con.execute(all_time, (game_id, n))
+                con.execute(daily, (game_id, n))
+                statements += 2
+    return statements
+
+def totals(con: sqlite3.Connection) -> Tuple[Dict[str, int], Dict[Tuple[str, str], int]]:
+    """({id: all-time count}, {(day, id): clicks})."""
+    return (
+        dict(con.execute("SELECT id, count FROM clicks")),
+        {(day, game_id): n for day, game_id, n in con.execute("SELECT day, id, clicks FROM events_daily")},
+    )
+
+# Mirrors TRENDING_PERIODS, RETAIN_DAILY_DAYS and the RISING_* constants in the worker.
+TRENDING_PERIODS = {7: "trending7", 30: "trending30"}
+RETAIN_DAILY_DAYS = 31
+RISING_RECENT_DAYS = 3
+RISING_BASELINE_DAYS = 14
+
+def _literals(marker: str) -> List[str]:
+    source = WORKER_PATH.read_text(encoding="utf-8")
+    return [m.group(1) for m in re.finditer(r"`([^`]*)`", source) if marker in m.group(1)]
+
+def retention_cutoff(today: date) -> str:
+    """First day kept in events_daily, as refreshRollups() computes it."""
+    return (today - timedelta(days=RETAIN_DAILY_DAYS)).isoformat()
+
+def refresh_rollups(con: sqlite3.Connection, cutoff: str) -> None:
+    """Run the worker's rollupStatements() batch, as one transaction."""
+    literals = _literals("")
+    compact = _find(literals, "events_monthly compaction", lambda q: "INSERT INTO events_monthly" in q)
+    prune = _find(literals, "events_daily prune", lambda q: q.startswith("DELETE FROM events_daily"))
+    clear = _find(literals, "rollup clear", lambda q: q.startswith("DELETE FROM popularity_rollup "))
+    stamp = _find(literals, "rollup stamp", lambda q: "INSERT INTO popularity_rollup_meta" in q)
+    trending = _find(literals, "trending rollup", lambda q: "INSERT INTO popularity_rollup " in q and "SELECT ?1" in q)
+    rising = _find(literals, "rising rollup", lambda q: "INSERT INTO popularity_rollup " in q and "'rising'" in q)
+    with con:
+        con.execute(compact, (cutoff,))
+        con.execute(prune, (cutoff,))
+        for days, period in TRENDING_PERIODS.items():
+            con.execute(clear, (period,))
+            con.execute(trending, (period, f"{-(days - 1)} days"))
+            con.execute(stamp, (period,))
+        con.execute(clear, ("rising",))
+        con.execute(rising, (
+            f"{-(RISING_RECENT_DAYS - 1)} days",
+            f"{-(RISING_RECENT_DAYS + RISING_BASELINE_DAYS - 1)} days",
+            RISING_BASELINE_DAYS,
+            RISING_RECENT_DAYS,
+        ))
+        con.execute(stamp, ("rising",))
+
+def rollup_queries(ids: Sequence[str], limit: int = 10) -> Dict[str, Tuple[str, Tuple[object, ...]]]:
+    """{mode: (sql, params)} for the rollup reads, named like worker_queries()."""
+    literals = [
+        q for q in _literals("FROM popularity_rollup")
+        if q.lstrip().startswith("SELECT") and "popularity_rollup_meta" not in q
+    ]
+    rising = _find(literals, "rising rollup read", lambda q: "recent_count" in q)
+    by_ids = _find(literals, "trending (ids) rollup read", lambda q: "${marks}" in q)
+    top = _find(literals, "trending rollup read", lambda q: "recent_count" not in q and "${marks}" not in q)
+    marks = ",".join("?" for _ in ids)
+    return {
+        "rising": (rising, ("rising", limit)),
+        "trending": (top, (TRENDING_PERIODS[7], limit)),
+        "trending30": (top, (TRENDING_PERIODS[30], limit)),
+        "trending_ids": (by_ids.replace("${marks}", marks), (TRENDING_PERIODS[7], *ids, limit)),
+    }
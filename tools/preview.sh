@@ -21,23 +21,26 @@ else
   HELPER_PID=$!
 fi
 
+WATCH_PID=""
+
 cleanup() {
   if [[ -n "${HELPER_PID}" ]]; then
     kill "$HELPER_PID" 2>/dev/null || true
   fi
+  if [[ -n "${WATCH_PID}" ]]; then
+    kill "$WATCH_PID" 2>/dev/null || true
+  fi
 }
 trap cleanup EXIT
 
-# Generate derived files/pages so preview matches deploy
-python3 tools/generate_game_pages.py
-python3 tools/generate_series_pages.py
-python3 tools/generate_browse_indexes.py
-python3 tools/generate_feature_data.py --include-hidden 1
-
-# Preview search can include hidden so you can still find + toggle them
-INCLUDE_HIDDEN=1 python3 tools/generate_search_index.py
+# Generate derived files/pages so preview matches deploy.
+# Preview search can include hidden so you can still find + toggle them.
+python3 tools/build.py --no-hugo --search-include-hidden 1 --feature-include-hidden 1
 
-./check-social
+# Keep them current while curating: games.json edits (by hand or via the
+# helper's /toggle) regenerate only the pages and indexes they affect.
+python3 tools/watch.py --search-include-hidden 1 --feature-include-hidden 1 &
+WATCH_PID=$!
 
 # Run hugo server (disableFastRender helps ensure data changes trigger updates)
 "$HUGO_CMD" server -D --disableFastRender
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Search index writers for the site-wide search dropdown.
+
+Titles and urls live in the client catalog (see generate_client_catalog.py);
+the search files only hold a word index over it and refer to games by
+their catalog position, so no title is shipped twice.
+
+Full mode writes one file that every page loads up front:
+  static/search-index.<hash>.js
+    window.__SEARCH_TOKENS__ = {"w": [...], "p": [...]}
+
+Sharded mode writes a small manifest plus one shard per character, which
+search.js fetches on first input:
+  static/search/manifest.<hash>.js
+    window.__SEARCH_MANIFEST__ = {"count": N, "shards": {"a": "/search/a.<hash>.json", ...}}
+  static/search/<key>.<hash>.json
+    {"w": [...], "p": [...]}
+
+All names carry a content hash and are recorded in data/asset_manifest.json
+(see asset_manifest.py).
+
+Shard <c> holds every title word (same normalization as search.js) that
+contains the character c anywhere, not only at the start. Any word matching
+a token that starts with c, by prefix or mid-word ("craft" in "Minecraft"),
+therefore sits in that token's shard, and search.js answers a query from the
+one shard of its first token: the other tokens are checked against the
+titles in the catalog. Only a query with no literal match at all (a typo,
+left to the fuzzy matching of full mode) is ranked over an index search.js
+builds from the catalog, which costs no further download.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+import asset_manifest
+import instrument
+
+# Logical names in data/asset_manifest.json
+INDEX_NAME = "search-index.js"
+SHARD_PREFIX = "search/"
+SHARD_MANIFEST_NAME = "search/manifest.js"
+
+_COMBINING = re.compile(r"[\u0300-\u036f]")
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+def normalize(text: str) -> str:
+    """Python port of normalize() in assets/js/search.js."""
+    text = _COMBINING.sub("", unicodedata.normalize("NFD", text.lower()))
+    return _NON_ALNUM.sub(" ", text).strip()
+
+def delta_encode(ids: List[int]) -> List[int]:
+    out: List[int] = []
+    prev = 0
+    for i in ids:
+        out.append(i - prev)
+        prev = i
+    return out
+
+def word_postings(entries: List[Tuple[int, str]]) -> Dict[str, List[int]]:
+    """Normalized title word -> ascending catalog positions of the entries containing it."""
+    postings: Dict[str, List[int]] = defaultdict(list)
+    for pos, title in entries:
+        for word in sorted(set(normalize(title).split())):
+            postings[word].append(pos)
+    return postings
+
+def build_token_index(postings: Dict[str, List[int]], words: Iterable[str]) -> Dict[str, object]:
+    """
+    Inverted index over `words`:
+
+      w    the words, sorted
+      p    per word, the catalog positions containing it, delta-encoded
+
+    search.js finds word-prefix matches by binary search over w and derives
+    a trigram map from w on demand for mid-word and typo-tolerant matches,
+    so that map is not shipped. Titles are normalized client-side, and only
+    for the games a query turns up.
+    """
+    words = sorted(words)
+    return {"w": words, "p": [delta_encode(postings[w]) for w in words]}
+
+def shard_keys(word: str) -> List[str]:
+    """Shards listing `word`: one per distinct character in it."""
+    return sorted(set(word))
+
+def retire_shards(keep: Tuple[str, ...] = ()) -> None:
+    for logical in asset_manifest.published(SHARD_PREFIX):
+        if logical not in keep:
+            asset_manifest.retire(logical)
+    shard_dir = asset_manifest.STATIC_DIR / SHARD_PREFIX
+    if not keep and shard_dir.is_dir() and not any(shard_dir.iterdir()):
+        shard_dir.rmdir()
+
+def write_shards(entries: List[Tuple[int, str]]) -> int:
+    """Publish one shard per character plus their manifest. Returns the number of shards."""
+    with instrument.phase("build"):
+        postings = word_postings(entries)
+        shards: Dict[str, List[str]] = defaultdict(list)
+        for word in postings:
+            for key in shard_keys(word):
+                shards[key].append(word)
+
+    urls: Dict[str, str] = {}
+    for key in sorted(shards):
+        with instrument.phase("build"):
+            index = build_token_index(postings, shards[key])
+        with instrument.phase("serialize"):
+            payload = json.dumps(index, ensure_ascii=False, separators=(",", ":"))
+        with instrument.phase("write"):
+            urls[key] = asset_manifest.publish(f"{SHARD_PREFIX}{key}.json", payload)
+    manifest = {"count": len(entries), "shards": urls}
+    asset_manifest.publish(
+        SHARD_MANIFEST_NAME,
+        "window.__SEARCH_MANIFEST__ = " + json.dumps(manifest, ensure_ascii=False) + ";",
+    )
+    retire_shards(keep=(SHARD_MANIFEST_NAME, *(f"{SHARD_PREFIX}{key}.json" for key in shards)))
+    return len(urls)
+
+def write_search_index(entries: List[Tuple[int, str]], sharded: bool) -> str:
+    """Write the search files for `entries`; returns a short mode description."""
+    # Only one mode's output may be published: layouts/partials/search-data.html
+    # picks the sharded manifest whenever it is listed.
+    if sharded:
+        shard_count = write_shards(entries)
+        asset_manifest.retire(INDEX_NAME)
+        return f"sharded, shards={shard_count}"
+    with instrument.phase("build"):
+        postings = word_postings(entries)
+        tokens = build_token_index(postings, postings)
+    asset_manifest.publish(
+        INDEX_NAME,
+        "window.__SEARCH_TOKENS__ = " + json.dumps(tokens, ensure_ascii=False, separators=(",", ":")) + ";",
+    )
+    retire_shards()
+    return "full"
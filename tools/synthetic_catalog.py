@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Deterministic synthetic games.json at any size, for scaling benchmarks.
+
+The shape follows the real catalog (measured at 2,794 entries):
+
+- categories in the same proportions, abandonware included (~22%)
+- genre1 on 98% of entries, genre2 on 37%, from the same long-tailed
+  genre list
+- a series on 90% of entries; series grow by preferential attachment, so
+  most have one entry and a few have dozens, as in the real data
+- date_added on 48% of entries, skewed towards recent months
+- hidden: true on 0.4%, an explicit hidden: false on a few more
+- video links on 12%, short notes on 7.5%
+
+The same size and seed always give the same file, so timings stay
+comparable between runs and machines.
+
+Usage:
+  python3 tools/synthetic_catalog.py 30000 --out /tmp/games.json
+  python3 tools/synthetic_catalog.py 300000 --seed 2 --out /tmp/games-300k.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+
+CATEGORY_WEIGHTS = {
+    "abandonware": 612, "open-source": 308, "in-the-works": 301, "fan-games": 273,
+    "mods": 253, "english-translation-patches": 197, "rom-hacks": 181,
+    "decompilations-recompilations": 145, "console-ports": 113, "android-ports": 106,
+    "texture-packs": 57, "preserved-games": 57, "guides": 46, "utility": 44,
+    "browser-based": 40, "vr-ports": 37, "console-to-pc-port": 22,
+}
+
+_TOP_GENRES = {
+    "action": 653, "rpg": 570, "platformer": 461, "adventure": 291, "first-person-shooter": 236,
+    "strategy": 209, "racing": 202, "puzzle": 114, "fighting": 101, "sports": 90,
+    "survival-horror": 84, "sandbox": 67, "utility": 63, "beat-em-up": 62,
+    "third-person-shooter": 62, "metroidvania": 35, "shoot-em-up": 35, "stealth": 33,
+    "creature-collector": 32, "roguelike": 29, "life-simulator": 26, "resource-management": 24,
+    "combat-flight-simulator": 21, "rhythm-based": 19, "rail-shooter": 18, "city-builder": 15,
+    "visual-novel": 12, "business-simulator": 12, "FMV": 12, "space-combat-simulator": 10,
+}
+# The real list has ~100 genres; the rest each cover a handful of games.
+GENRE_WEIGHTS = {**_TOP_GENRES, **{f"genre-{i:02d}": max(1, 9 - i // 8) for i in range(70)}}
+
+GENRE1_SHARE = 0.984
+GENRE2_SHARE = 0.369
+SERIES_SHARE = 0.897
+# Chance that an entry with a series starts a new one (1,083 series over 2,507 entries).
+NEW_SERIES_SHARE = 0.43
+DATED_SHARE = 0.48
+DATE_SPAN_DAYS = 6 * 365
+# Fixed, not today(), so the file does not change from one day to the next.
+NEWEST_DATE = date(2026, 8, 31)
+HIDDEN_SHARE = 0.004
+HIDDEN_FALSE_SHARE = 0.005
+VIDEO_SHARE = 0.12
+NOTES_SHARE = 0.075
+
+WORDS = (
+    "Advance Ancient Arcade Armored Astral Blade Blood Boulder Brave Bright Burning Castle "
+    "Chaos Chrono Cloud Cosmic Crimson Crystal Cyber Dark Dawn Dead Desert Dragon Dream "
+    "Dungeon Dust Echo Edge Empire Eternal Fallen Final Fire Forest Fortress Frontier Frost "
+    "Galaxy Ghost Giant Golden Gravity Harvest Hero Hidden Hollow Horizon Hunter Iron Island "
+    "Jungle Kingdom Knight Last Legend Light Lost Lunar Machine Magic Metal Midnight Mirror "
+    "Moon Mystic Neon Night Ninja Ocean Omega Outlaw Phantom Pixel Planet Power Prime Quest "
+    "Racer Rebel Red Rising Rogue Royal Runner Saga Shadow Silent Sky Soul Space Spirit Star "
+    "Steel Storm Street Sun Super Sword Tactics Temple Thunder Tiny Titan Tower Turbo Twilight "
+    "Ultra Valley Venom Void Warrior Wild Wind Winter Wizard World Zero"
+).split()
+SUFFIXES = ("2", "3", "II", "III", "64", "Advance", "DX", "Remastered", "Returns", "Origins", "Online", "Deluxe")
+
+def _weighted(rng: random.Random, weights: Dict[str, int]):
+    keys = list(weights)
+    cum: List[float] = []
+    total = 0.0
+    for k in keys:
+        total += weights[k]
+        cum.append(total)
+    return lambda: rng.choices(keys, cum_weights=cum)[0]
+
+def _slug(title: str) -> str:
+    # catalog.slugify_title() for ASCII titles, without the per-character Unicode checks.
+    return re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")
+
+def _words(rng: random.Random, lo: int, hi: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(lo, hi)))
+
+def generate(n: int, seed: int = 1) -> List[Dict[str, Any]]:
+    """`n` games.json entries with ids 1..n."""
+    rng = random.Random(seed)
+    category = _weighted(rng, CATEGORY_WEIGHTS)
+    genre = _weighted(rng, GENRE_WEIGHTS)
+    series_names: List[str] = []
+    # One slot per entry, so picking a slot picks a series by its size.
+    series_slots: List[int] = []
+    used = set()
+    taken: Dict[str, int] = {}
+    games: List[Dict[str, Any]] = []
+
+    for game_id in range(1, n + 1):
+        series = ""
+        if rng.random() < SERIES_SHARE:
+            if not series_slots or rng.random() < NEW_SERIES_SHARE:
+                series_names.append(_words(rng, 1, 3))
+                series_slots.append(len(series_names) - 1)
+            else:
+                series_slots.append(rng.choice(series_slots))
+            series = series_names[series_slots[-1]]
+
+        if series:
+            title = f"{series} {rng.choice(SUFFIXES)}" if rng.random() < 0.5 else f"{series}: {_words(rng, 1, 3)}"
+        else:
+            title = _words(rng, 2, 4)
+        base, slug = title, _slug(title)
+        while slug in used:
+            # Numbered like a sequel; counting on from the last number used for this base.
+            taken[base] = taken.get(base, 1) + 1
+            title = f"{base} {taken[base]}"
+            slug = _slug(title)
+        used.add(slug)
+
+        g1 = genre() if rng.random() < GENRE1_SHARE else ""
+        g2 = genre() if rng.random() < GENRE2_SHARE else ""
+        if g2 == g1:
+            g2 = ""
+        added = ""
+        if rng.random() < DATED_SHARE:
+            # Squaring skews towards recent additions.
+            added = (NEWEST_DATE - timedelta(days=int(DATE_SPAN_DAYS * rng.random() ** 2))).isoformat()
+        cat = category()
+        entry: Dict[str, Any] = {
+            "id": game_id,
+            "title": title,
+            "category": cat,
+            "link": f"https://example.com/{cat}/{game_id}/",
+            "genre1": g1,
+            "genre2": g2,
+            "series": series,
+            "video_link": f"https://youtu.be/v{game_id:07d}" if rng.random() < VIDEO_SHARE else "",
+            "notes": _words(rng, 3, 14) + "." if rng.random() < NOTES_SHARE else "",
+            "date_added": added,
+            "image": "",
+        }
+        roll = rng.random()
+        if roll < HIDDEN_SHARE:
+            entry["hidden"] = True
+        elif roll < HIDDEN_SHARE + HIDDEN_FALSE_SHARE:
+            entry["hidden"] = False
+        games.append(entry)
+    return games
+
+def write(path: Path, games: List[Dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Same layout as data/games.json (and visibility_server.py's writes).
+    path.write_text(json.dumps(games, indent=2, ensure_ascii=False), encoding="utf-8")
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("size", type=int, help="number of entries")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--out", required=True, help="where to write the games.json")
+    args = ap.parse_args()
+    games = generate(args.size, args.seed)
+    out = Path(args.out)
+    write(out, games)
+    print(f"Synthetic catalog: games={len(games)}, seed={args.seed}, bytes={out.stat().st_size}, path={out}")
+
+if __name__ == "__main__":
+    main()
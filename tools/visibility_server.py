@@ -1,27 +1,452 @@
 #!/usr/bin/env python3
+"""
+Preview-only helper for the admin visibility toggle (assets/js/admin-visibility.js).
+
+The catalog is held in memory (CatalogStore) with an id -> entry index, so
+/status and /toggle never re-read games.json. The file is reloaded only
+when its mtime/size changes and its SHA-256 differs from what was last
+loaded or written (an edit made by hand or by another tool).
+
+Until the first toggle, /status (and the /events poll) reads the compiled
+snapshot instead when it matches games.json (catalog_snapshot.py, kept
+current by build.py and watch.py): an O(1) Snapshot.find() plus a flag
+read, with no JSON parse. It never compiles one itself; without a current
+snapshot, or once a toggle needs the entries to edit, games.json is parsed
+as before.
+
+Toggles update memory immediately and mark the store dirty. Writes are
+debounced: the file is saved once no toggle has arrived for
+WRITE_DEBOUNCE_SECS, and at most WRITE_MAX_DELAY_SECS after the first
+unsaved change, so curating dozens of cards costs a handful of writes.
+Pending changes are also saved on shutdown (Ctrl+C or SIGTERM from
+preview.sh).
+
+Requests are served on a ThreadingHTTPServer, so a slow /popularity proxy
+call no longer blocks /status and /toggle.
+
+Endpoints (all JSON unless noted):
+
+  GET  /ping                     "OK"
+  GET  /status?id=12             {"id": 12, "hidden": false}
+  GET  /status?ids=12,13,99      {"version": "...", "hidden": {"12": false, "13": true},
+                                  "missing": [99]}
+                                 ETag is the store version; a matching
+                                 If-None-Match gets 304 Not Modified.
+  POST /toggle {"id": 12, "hidden": true}
+  POST /toggle {"changes": [{"id": 12, "hidden": true}, ...]}
+                                 {"version": "...", "hidden": {...}, "missing": [...]}
+  GET  /events                   Server-Sent Events. "visibility" events carry
+                                 {"version", "hidden": {"<id>": bool}} for every
+                                 change, including hand edits of games.json.
+                                 A reconnect with Last-Event-ID replays what was
+                                 missed, or sends "reset" when that is no longer
+                                 possible (the client then re-reads /status).
+
+Versions look like "<boot>.<n>" so ids from before a restart never match.
+
+  GET  /popularity?mode=&limit=&days=&ids=
+                                 Proxy for the live /api/top (PopularityCache).
+                                 Responses are cached per normalized query for
+                                 --popularity-ttl seconds, then served stale for
+                                 up to --popularity-stale more while one
+                                 background fetch refreshes them. Identical
+                                 concurrent misses share one upstream call.
+                                 X-Cache says HIT, STALE, MISS or COALESCED.
+  GET  /popularity/stats         hit/miss counters and cache size.
+
+The upstream defaults to the live site and can point at a local stand-in:
+  python3 tools/visibility_server.py --popularity-upstream http://127.0.0.1:8787/api/top
+"""
 from __future__ import annotations
 
+import argparse
+import hashlib
 import json
-from http.server import BaseHTTPRequestHandler, HTTPServer
+import os
+import signal
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 import tempfile
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs, urlencode
 from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+from urllib.error import HTTPError
+
+from catalog_snapshot import Snapshot, current_snapshot
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 GAMES_PATH = PROJECT_ROOT / "data" / "games.json"
 
+WRITE_DEBOUNCE_SECS = 0.5
+WRITE_MAX_DELAY_SECS = 5.0
+# Change batches kept for /events replay after a reconnect.
+CHANGE_LOG_SIZE = 500
+EVENTS_POLL_SECS = 5.0
+EVENTS_HEARTBEAT_SECS = 20.0
+
+POPULARITY_UPSTREAM = os.environ.get("POPULARITY_UPSTREAM", "https://thegamingemporium.com/api/top")
+POPULARITY_TTL_SECS = float(os.environ.get("POPULARITY_TTL", "60"))
+POPULARITY_STALE_SECS = float(os.environ.get("POPULARITY_STALE", "300"))
+POPULARITY_TIMEOUT_SECS = 15
+POPULARITY_MAX_ENTRIES = 256
+
+class CatalogStore:
+    """games.json in memory, indexed by id, with debounced write-back."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.RLock()
+        self._changed = threading.Condition(self._lock)
+        self._boot = str(int(time.time()))
+        self._version = 0
+        self._log: Deque[Tuple[int, Dict[int, bool]]] = deque(maxlen=CHANGE_LOG_SIZE)
+        self._games: List[dict] = []
+        self._by_id: Dict[int, dict] = {}
+        # Set instead of _games/_by_id while only reads have been served.
+        self._snap: Optional[Snapshot] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._digest = b""
+        # id -> hidden for toggles not yet on disk; reapplied if the file
+        # is reloaded underneath them.
+        self._pending: Dict[int, bool] = {}
+        self._first_pending = 0.0
+        self._timer: Optional[threading.Timer] = None
+        self.reloads = 0
+        self.writes = 0
+
+    def _refresh(self, entries: bool = True) -> None:
+        """
+        Catch up with games.json. Reads pass entries=False and may be served
+        from a current compiled snapshot; toggles and writes need the parsed
+        entries.
+        """
+        st = self.path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self._stamp and (self._snap is None or not entries):
+            return
+        if not entries and not self._pending:
+            snap = current_snapshot(self.path)
+            if snap is not None:
+                if snap.source_sha256 != self._digest:
+                    self._load(snap.source_sha256, [], {}, snap)
+                self._stamp = stamp
+                return
+        data = self.path.read_bytes()
+        digest = hashlib.sha256(data).digest()
+        if digest != self._digest or self._snap is not None:
+            games = json.loads(data.decode("utf-8"))
+            if not isinstance(games, list):
+                raise ValueError("data/games.json must be a JSON array")
+            by_id: Dict[int, dict] = {}
+            for g in games:
+                try:
+                    game_id = int(g.get("id"))
+                except (AttributeError, TypeError, ValueError):
+                    continue
+                # First entry wins on duplicate ids, like the old linear scan.
+                by_id.setdefault(game_id, g)
+            for game_id, hidden in self._pending.items():
+                if game_id in by_id:
+                    by_id[game_id]["hidden"] = hidden
+            self._load(digest, games, by_id, None)
+        self._stamp = stamp
+
+    def _load(self, digest: bytes, games: List[dict], by_id: Dict[int, dict], snap: Optional[Snapshot]) -> None:
+        before = self._flags() if self._digest and digest != self._digest else None
+        self._games, self._by_id, self._snap, self._digest = games, by_id, snap, digest
+        self.reloads += 1
+        if before is not None:
+            # Tell /events listeners about visibility edited by hand.
+            changed = {game_id: hidden for game_id, hidden in self._flags().items() if before.get(game_id) != hidden}
+            if changed:
+                self._publish(changed)
+
+    def _flags(self) -> Dict[int, bool]:
+        """id -> hidden for the catalog in memory."""
+        if self._snap is not None:
+            return self._snap.visibility()
+        return {game_id: g.get("hidden") is True for game_id, g in self._by_id.items()}
+
+    def _lookup(self, game_id: int) -> Optional[bool]:
+        if self._snap is not None:
+            rec = self._snap.find(game_id)
+            return None if rec is None else self._snap.hidden(rec)
+        g = self._by_id.get(game_id)
+        return None if g is None else g.get("hidden") is True
+
+    @property
+    def version(self) -> str:
+        return f"{self._boot}.{self._version}"
+
+    def _publish(self, changed: Dict[int, bool]) -> None:
+        self._version += 1
+        self._log.append((self._version, changed))
+        self._changed.notify_all()
+
+    def hidden(self, game_id: int) -> Optional[bool]:
+        """Hidden flag for `game_id`, or None if there is no such game."""
+        with self._lock:
+            self._refresh(entries=False)
+            return self._lookup(game_id)
+
+    def statuses(self, ids: Iterable[int]) -> Tuple[str, Dict[int, bool], List[int]]:
+        """(version, hidden flag per known id, unknown ids)."""
+        with self._lock:
+            self._refresh(entries=False)
+            found: Dict[int, bool] = {}
+            missing: List[int] = []
+            for game_id in ids:
+                hidden = self._lookup(game_id)
+                if hidden is None:
+                    missing.append(game_id)
+                else:
+                    found[game_id] = hidden
+            return self.version, found, missing
+
+    def set_many(self, changes: Dict[int, bool]) -> Tuple[str, Dict[int, bool], List[int]]:
+        """Apply hidden flags in memory and schedule one write for all of them."""
+        with self._lock:
+            self._refresh()
+            applied: Dict[int, bool] = {}
+            changed: Dict[int, bool] = {}
+            missing: List[int] = []
+            for game_id, hidden in changes.items():
+                g = self._by_id.get(game_id)
+                if g is None:
+                    missing.append(game_id)
+                    continue
+                applied[game_id] = hidden
+                if (g.get("hidden") is True) == hidden:
+                    continue
+                g["hidden"] = hidden
+                if not self._pending:
+                    self._first_pending = time.monotonic()
+                self._pending[game_id] = hidden
+                changed[game_id] = hidden
+            if changed:
+                self._publish(changed)
+                self._schedule()
+            return self.version, applied, missing
+
+    def set_hidden(self, game_id: int, hidden: bool) -> bool:
+        """Update memory and schedule a write; False if the id is unknown."""
+        return not self.set_many({game_id: hidden})[2]
+
+    def changes_since(self, version: str) -> Optional[Dict[int, bool]]:
+        """Net changes after `version`, or None if the log cannot say."""
+        boot, _, n = version.partition(".")
+        with self._lock:
+            if boot != self._boot or not n.isdigit() or int(n) > self._version:
+                return None
+            n = int(n)
+            if n < self._version and (not self._log or self._log[0][0] > n + 1):
+                return None
+            merged: Dict[int, bool] = {}
+            for v, changed in self._log:
+                if v > n:
+                    merged.update(changed)
+            return merged
+
+    def wait(self, version: str, timeout: float) -> str:
+        """Block until the version moves past `version` or `timeout` passes."""
+        with self._lock:
+            if self.version == version:
+                self._changed.wait(timeout)
+            if self.version == version:
+                # Nothing from a request; pick up hand edits of games.json.
+                try:
+                    self._refresh(entries=False)
+                except (OSError, ValueError):
+                    pass
+            return self.version
+
+    def _schedule(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+        deadline = self._first_pending + WRITE_MAX_DELAY_SECS
+        delay = max(0.0, min(WRITE_DEBOUNCE_SECS, deadline - time.monotonic()))
+        self._timer = threading.Timer(delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self) -> int:
+        """Write pending changes now; returns how many were written."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending:
+                return 0
+            try:
+                # Pick up a hand edit made since the last toggle first.
+                self._refresh()
+            except (OSError, ValueError) as e:
+                print(f"Not saving: {e}")
+                return 0
+            # Atomic write to avoid partial reads while Hugo/search helpers are reading.
+            payload_out = json.dumps(self._games, indent=2, ensure_ascii=False).encode("utf-8")
+            with tempfile.NamedTemporaryFile("wb", delete=False, dir=self.path.parent) as tf:
+                tf.write(payload_out)
+                tmp_path = Path(tf.name)
+            tmp_path.replace(self.path)
+            st = self.path.stat()
+            self._stamp = (st.st_mtime_ns, st.st_size)
+            self._digest = hashlib.sha256(payload_out).digest()
+            count = len(self._pending)
+            self._pending.clear()
+            self.writes += 1
+            print(f"Saved {count} change(s) to {self.path.name} (write #{self.writes})")
+            return count
+
+STORE = CatalogStore(GAMES_PATH)
+
+def popularity_key(query: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Cache key for an /api/top query: the parameters /api/top reads, with
+    the defaults and ordering it ignores normalized away.
+    """
+    q = parse_qs(query)
+    key = []
+    for name in ("mode", "limit", "days", "ids"):
+        value = (q.get(name) or [""])[0].strip()
+        if name == "mode":
+            value = value.lower()
+        elif name == "ids":
+            # /api/top filters by the set and ranks by count, so order is noise.
+            value = ",".join(sorted({part.strip() for part in value.split(",")} - {""}))
+        if value:
+            key.append((name, value))
+    return tuple(key)
+
+class _Entry:
+    __slots__ = ("status", "body", "fetched")
+
+    def __init__(self, status: int, body: bytes) -> None:
+        self.status = status
+        self.body = body
+        self.fetched = time.monotonic()
+
+class _Flight:
+    """One upstream fetch in progress; concurrent misses wait on it."""
+    __slots__ = ("done", "entry")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.entry: Optional[_Entry] = None
+
+class PopularityCache:
+    """TTL cache with stale-while-revalidate and request coalescing for /api/top."""
+
+    def __init__(self, upstream: str, ttl: float, stale: float) -> None:
+        self.upstream = upstream
+        self.ttl = ttl
+        self.stale = stale
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[Tuple[str, str], ...], _Entry]" = OrderedDict()
+        self._inflight: Dict[Tuple[Tuple[str, str], ...], _Flight] = {}
+        self.counters = {"hits": 0, "stale": 0, "misses": 0, "coalesced": 0, "upstream": 0, "errors": 0}
+
+    def _fetch(self, key: Tuple[Tuple[str, str], ...]) -> Optional[_Entry]:
+        """Call the upstream and store a successful answer; None on failure."""
+        target = self.upstream
+        if key:
+            target += "?" + urlencode(key)
+        req = Request(target, headers={"User-Agent": "TGE local preview"})
+        entry: Optional[_Entry] = None
+        try:
+            with urlopen(req, timeout=POPULARITY_TIMEOUT_SECS) as resp:
+                entry = _Entry(getattr(resp, "status", 200), resp.read())
+        except HTTPError as e:
+            # Not cached; the caller relays the upstream's own error.
+            entry = _Entry(e.code, e.read() or b'{"ok":false,"error":"upstream_error"}')
+        except Exception as e:
+            entry = _Entry(502, json.dumps({"ok": False, "error": "proxy_error", "detail": str(e)}).encode("utf-8"))
+        with self._lock:
+            self.counters["upstream"] += 1
+            if entry.status == 200:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > POPULARITY_MAX_ENTRIES:
+                    self._entries.popitem(last=False)
+            else:
+                self.counters["errors"] += 1
+            flight = self._inflight.pop(key)
+            flight.entry = entry
+            flight.done.set()
+        return entry
+
+    def get(self, query: str) -> Tuple[int, bytes, str]:
+        """(status, body, cache state) for an /api/top query string."""
+        key = popularity_key(query)
+        with self._lock:
+            entry = self._entries.get(key)
+            age = time.monotonic() - entry.fetched if entry else 0.0
+            if entry and age < self.ttl:
+                self.counters["hits"] += 1
+                return entry.status, entry.body, "HIT"
+            if entry and age < self.ttl + self.stale:
+                self.counters["stale"] += 1
+                if key not in self._inflight:
+                    self._inflight[key] = _Flight()
+                    threading.Thread(target=self._fetch, args=(key,), daemon=True).start()
+                return entry.status, entry.body, "STALE"
+            waiting = self._inflight.get(key)
+            if waiting is None:
+                self.counters["misses"] += 1
+                self._inflight[key] = _Flight()
+            else:
+                self.counters["coalesced"] += 1
+
+        if waiting is None:
+            fresh = self._fetch(key)
+            if fresh.status == 200 or entry is None:
+                return fresh.status, fresh.body, "MISS"
+            # Upstream failed: an expired answer beats an error in preview.
+            return entry.status, entry.body, "STALE"
+
+        waiting.done.wait(POPULARITY_TIMEOUT_SECS + 1)
+        shared = waiting.entry
+        if shared is not None and (shared.status == 200 or entry is None):
+            return shared.status, shared.body, "COALESCED"
+        if entry is not None:
+            return entry.status, entry.body, "STALE"
+        return 504, b'{"ok":false,"error":"upstream_timeout"}', "COALESCED"
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                **self.counters,
+                "entries": len(self._entries),
+                "inflight": len(self._inflight),
+                "ttl": self.ttl,
+                "stale_for": self.stale,
+                "upstream_url": self.upstream,
+            }
+
+POPULARITY = PopularityCache(POPULARITY_UPSTREAM, POPULARITY_TTL_SECS, POPULARITY_STALE_SECS)
+
 class Handler(BaseHTTPRequestHandler):
-    def _headers(self, code: int, content_type: str = "text/plain; charset=utf-8") -> None:
+    def _headers(
+        self, code: int, content_type: str = "text/plain; charset=utf-8", extra: Optional[Dict[str, str]] = None
+    ) -> None:
         self.send_response(code)
         self.send_header("Content-Type", content_type)
         # Allow preview JS (served from hugo server) to talk to localhost helper
         self.send_header("Access-Control-Allow-Origin", "*")
         self.send_header("Access-Control-Allow-Methods", "GET, POST, OPTIONS")
-        self.send_header("Access-Control-Allow-Headers", "Content-Type")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, If-None-Match, Last-Event-ID")
+        self.send_header("Access-Control-Expose-Headers", "ETag, X-Cache")
+        for name, value in (extra or {}).items():
+            self.send_header(name, value)
         self.end_headers()
 
+    def _json(self, code: int, data: object, extra: Optional[Dict[str, str]] = None) -> None:
+        self._headers(code, "application/json; charset=utf-8", extra)
+        self.wfile.write(json.dumps(data).encode("utf-8"))
+
     def do_OPTIONS(self):
         self._headers(204)
         self.wfile.write(b"")
@@ -31,26 +456,14 @@ class Handler(BaseHTTPRequestHandler):
         # inconsistent about cross-origin requests from localhost, while the
         # production site uses /api/top on the same origin. Keeping the proxy
         # here makes local preview behave like production without changing D1.
+        if self.path.startswith("/popularity/stats"):
+            self._json(200, POPULARITY.stats())
+            return
         if self.path.startswith("/popularity"):
             try:
-                parsed = urlparse(self.path)
-                q = parse_qs(parsed.query)
-                allowed = {}
-                for key in ("mode", "limit", "days", "ids"):
-                    if key in q and q[key]:
-                        allowed[key] = q[key][0]
-                target = "https://thegamingemporium.com/api/top"
-                if allowed:
-                    target += "?" + urlencode(allowed)
-                req = Request(target, headers={"User-Agent": "TGE local preview"})
-                with urlopen(req, timeout=15) as resp:
-                    body = resp.read()
-                    code = getattr(resp, "status", 200)
-                self._headers(code, "application/json; charset=utf-8")
+                status, body, state = POPULARITY.get(urlparse(self.path).query)
+                self._headers(status, "application/json; charset=utf-8", {"X-Cache": state})
                 self.wfile.write(body)
-            except HTTPError as e:
-                self._headers(e.code, "application/json; charset=utf-8")
-                self.wfile.write(e.read() or b'{"ok":false,"error":"upstream_error"}')
             except Exception as e:
                 self._headers(502, "application/json; charset=utf-8")
                 self.wfile.write(json.dumps({"ok": False, "error": "proxy_error", "detail": str(e)}).encode("utf-8"))
@@ -60,30 +473,42 @@ class Handler(BaseHTTPRequestHandler):
             self._headers(200)
             self.wfile.write(b"OK")
             return
+        if self.path == "/events":
+            self._events()
+            return
         if self.path.startswith("/status"):
-            # /status?id=123
+            # /status?id=123 or /status?ids=1,2,3
             try:
-                from urllib.parse import urlparse, parse_qs
                 q = parse_qs(urlparse(self.path).query)
-                game_id = int(q.get("id", ["-1"])[0])
+                if "ids" in q:
+                    ids = [int(x) for x in ",".join(q["ids"]).split(",") if x.strip()]
+                else:
+                    game_id = int(q.get("id", ["-1"])[0])
             except Exception:
                 self._headers(400)
                 self.wfile.write(b"Bad id")
                 return
 
             try:
-                games = json.loads(GAMES_PATH.read_text(encoding="utf-8"))
-                hidden_val = None
-                for g in games:
-                    if isinstance(g, dict) and int(g.get("id", -1)) == game_id:
-                        hidden_val = bool(g.get("hidden"))
-                        break
+                if "ids" in q:
+                    version, found, missing = STORE.statuses(ids)
+                    etag = f'"{version}"'
+                    extra = {"ETag": etag, "Cache-Control": "no-cache"}
+                    if self.headers.get("If-None-Match") == etag:
+                        self._headers(304, extra=extra)
+                        return
+                    self._json(200, {
+                        "version": version,
+                        "hidden": {str(k): v for k, v in found.items()},
+                        "missing": missing,
+                    }, extra)
+                    return
+                hidden_val = STORE.hidden(game_id)
                 if hidden_val is None:
                     self._headers(404)
                     self.wfile.write(b"Not found")
                     return
-                self._headers(200, "application/json; charset=utf-8")
-                self.wfile.write(json.dumps({"id": game_id, "hidden": hidden_val}).encode("utf-8"))
+                self._json(200, {"id": game_id, "hidden": hidden_val})
             except Exception as e:
                 self._headers(500)
                 self.wfile.write(f"Failed: {e}".encode("utf-8"))
@@ -101,8 +526,9 @@ class Handler(BaseHTTPRequestHandler):
         raw = self.rfile.read(length).decode("utf-8") if length else "{}"
         try:
             payload = json.loads(raw)
-            game_id = int(payload.get("id"))
-            hidden = bool(payload.get("hidden"))
+            batch = "changes" in payload
+            items = payload["changes"] if batch else [payload]
+            changes = {int(item.get("id")): bool(item.get("hidden")) for item in items}
         except Exception as e:
             self._headers(400)
             self.wfile.write(f"Bad JSON: {e}".encode("utf-8"))
@@ -114,41 +540,99 @@ class Handler(BaseHTTPRequestHandler):
             return
 
         try:
-            games = json.loads(GAMES_PATH.read_text(encoding="utf-8"))
-            if not isinstance(games, list):
-                raise ValueError("data/games.json must be a JSON array")
-
-            found = False
-            for g in games:
-                if isinstance(g, dict) and int(g.get("id", -1)) == game_id:
-                    g["hidden"] = hidden
-                    found = True
-                    break
-
-            if not found:
+            version, applied, missing = STORE.set_many(changes)
+            if batch:
+                self._json(200, {
+                    "version": version,
+                    "hidden": {str(k): v for k, v in applied.items()},
+                    "missing": missing,
+                })
+                return
+            if missing:
                 self._headers(404)
                 self.wfile.write(b"Game id not found")
                 return
-
-            # Atomic write to avoid partial reads while Hugo/search helpers are reading.
-            payload_out = json.dumps(games, indent=2, ensure_ascii=False)
-            tmp_dir = GAMES_PATH.parent
-            with tempfile.NamedTemporaryFile("w", delete=False, dir=tmp_dir, encoding="utf-8") as tf:
-                tf.write(payload_out)
-                tmp_path = Path(tf.name)
-            tmp_path.replace(GAMES_PATH)
-
-            self._headers(200, "application/json; charset=utf-8")
-            self.wfile.write(json.dumps({"id": game_id, "hidden": hidden}).encode("utf-8"))
+            game_id, hidden = next(iter(applied.items()))
+            self._json(200, {"id": game_id, "hidden": hidden})
         except Exception as e:
             self._headers(500)
             self.wfile.write(f"Failed: {e}".encode("utf-8"))
 
+    def _events(self) -> None:
+        """Server-Sent Events stream of visibility changes."""
+        self._headers(200, "text/event-stream; charset=utf-8", {"Cache-Control": "no-cache"})
+        version = STORE.version
+        try:
+            self.wfile.write(b"retry: 3000\n")
+            last = self.headers.get("Last-Event-ID")
+            if last:
+                missed = STORE.changes_since(last)
+                if missed is None:
+                    self._send_event("reset", version, {"version": version})
+                elif missed:
+                    self._send_event("visibility", version, {
+                        "version": version, "hidden": {str(k): v for k, v in missed.items()},
+                    })
+            else:
+                self._send_event("hello", version, {"version": version})
+            quiet_since = time.monotonic()
+            while True:
+                current = STORE.wait(version, EVENTS_POLL_SECS)
+                if current != version:
+                    changed = STORE.changes_since(version)
+                    if changed is None:
+                        self._send_event("reset", current, {"version": current})
+                    elif changed:
+                        self._send_event("visibility", current, {
+                            "version": current, "hidden": {str(k): v for k, v in changed.items()},
+                        })
+                    version = current
+                    quiet_since = time.monotonic()
+                elif time.monotonic() - quiet_since >= EVENTS_HEARTBEAT_SECS:
+                    # Comment line; lets the server notice closed tabs.
+                    self.wfile.write(b": keep-alive\n\n")
+                    self.wfile.flush()
+                    quiet_since = time.monotonic()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def _send_event(self, event: str, version: str, data: object) -> None:
+        self.wfile.write(f"id: {version}\nevent: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
+        self.wfile.flush()
+
+def _terminate(signum, frame) -> None:
+    raise KeyboardInterrupt
+
 def main() -> None:
-    server = HTTPServer(("127.0.0.1", 7331), Handler)
+    ap = argparse.ArgumentParser()
+    ap.add_argument(
+        "--popularity-upstream",
+        default=POPULARITY_UPSTREAM,
+        help="/api/top to proxy (default: $POPULARITY_UPSTREAM or the live site)",
+    )
+    ap.add_argument("--popularity-ttl", type=float, default=POPULARITY_TTL_SECS,
+                    help="seconds a popularity answer is fresh (default: $POPULARITY_TTL or 60)")
+    ap.add_argument("--popularity-stale", type=float, default=POPULARITY_STALE_SECS,
+                    help="seconds it may then be served while refreshing (default: $POPULARITY_STALE or 300)")
+    args = ap.parse_args()
+    POPULARITY.upstream = args.popularity_upstream
+    POPULARITY.ttl = args.popularity_ttl
+    POPULARITY.stale = args.popularity_stale
+
+    server = ThreadingHTTPServer(("127.0.0.1", 7331), Handler)
+    server.daemon_threads = True
+    # preview.sh stops the helper with SIGTERM; save pending toggles first.
+    signal.signal(signal.SIGTERM, _terminate)
     print("Visibility server running on http://127.0.0.1:7331")
     print(f"Editing: {GAMES_PATH}")
-    server.serve_forever()
+    print(f"Popularity upstream: {POPULARITY.upstream} (ttl={POPULARITY.ttl:g}s, stale={POPULARITY.stale:g}s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        STORE.flush()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Watch data/games.json and regenerate only what an edit affects.
+
+Meant to run next to `hugo server` and tools/visibility_server.py while
+curating (tools/preview.sh starts it). Instead of a full build.py run after
+every save or /toggle, each change is diffed record by record against the
+previous catalog, keyed by `id` (plus which occurrence of it, as a few ids
+are shared by different games), and only the outputs that read a changed
+field are regenerated:
+
+  field(s) changed                      regenerated
+  ------------------------------------  -----------------------------------------
+  any page field (title, link, notes…)  content/game/<slug>/ for those games only
+  series (new names)                    content/series/<slug>.md for those names
+  anything, even formatting (it stores   data/browse_indexes.json
+    the file's sha256)
+  title, link, slug, category, genres,  client catalog, facet index, search
+    series, hidden, date_added            shards, feature data
+  title, slug, date_added, category,    rss.xml and the section feeds
+    genres, series, image
+
+Added, removed or reordered games shift catalog positions, so they count as
+a change to every field. Each generator already leaves unchanged files
+alone, so Hugo only reloads what really moved.
+
+data/hidden_overrides.json is watched too. No generator reads it (Hugo's
+is-hidden.html applies it at render time, and `hugo server` reloads data/
+itself), so a change to it is reported but triggers no regeneration.
+
+A save that is not valid JSON (an editor mid-write) is reported and the
+previous catalog is kept until the next change.
+
+Usage:
+  python3 tools/watch.py                  # preview settings: hidden games searchable
+  python3 tools/watch.py --interval 0.5
+  python3 tools/watch.py --search-include-hidden 0 --feature-include-hidden 0
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+import catalog
+import generate_browse_indexes
+import generate_client_catalog
+import generate_game_pages
+import generate_rss_feed
+import generate_series_pages
+from build import Stage, _call, print_timings, run_graph
+from catalog import Game
+
+OVERRIDES_JSON = catalog.PROJECT_ROOT / "data" / "hidden_overrides.json"
+
+# Game attributes compared per record.
+FIELDS = (
+    "title", "link", "slug", "category", "genre1", "genre2", "series",
+    "video_link", "notes", "date_added", "image", "hidden",
+)
+PAGE_FIELDS = frozenset(FIELDS) - {"hidden"}
+CLIENT_FIELDS = frozenset({"title", "link", "slug", "category", "genre1", "genre2", "series", "hidden", "date_added"})
+RSS_FIELDS = frozenset({"title", "slug", "date_added", "category", "genre1", "genre2", "series", "image"})
+
+# A save can land in several writes; wait until the file has held still this long.
+SETTLE_SECS = 0.1
+
+# (game id, occurrence) or ("#", position) for entries without a usable id.
+# games.json reuses some ids for different games, so an id alone is not a key.
+Key = Tuple[Union[int, str], int]
+
+class CatalogDiff(NamedTuple):
+    added: List[Game]
+    removed: List[Game]
+    # key -> (old, new, names of the fields that differ)
+    changed: Dict[Key, Tuple[Game, Game, FrozenSet[str]]]
+    reordered: bool
+
+    @property
+    def fields(self) -> FrozenSet[str]:
+        if self.added or self.removed or self.reordered:
+            return frozenset(FIELDS)
+        out: Set[str] = set()
+        for _, _, names in self.changed.values():
+            out |= names
+        return frozenset(out)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed or self.reordered)
+
+def _keyed(games: Sequence[Game]) -> Dict[Key, Game]:
+    # The n-th entry with an id is matched with the n-th entry with that id in
+    # the other catalog, so an edit to either game of a duplicated id shows up.
+    seen: Dict[int, int] = {}
+    out: Dict[Key, Game] = {}
+    for pos, g in enumerate(games):
+        if g.id is None:
+            out[("#", pos)] = g
+            continue
+        n = seen[g.id] = seen.get(g.id, -1) + 1
+        out[(g.id, n)] = g
+    return out
+
+def diff_catalog(old: Sequence[Game], new: Sequence[Game]) -> CatalogDiff:
+    before = _keyed(old)
+    after = _keyed(new)
+    changed = {}
+    for key, g in after.items():
+        prev = before.get(key)
+        if prev is None:
+            continue
+        names = frozenset(f for f in FIELDS if getattr(prev, f) != getattr(g, f))
+        if names:
+            changed[key] = (prev, g, names)
+    added = [g for key, g in after.items() if key not in before]
+    removed = [g for key, g in before.items() if key not in after]
+    reordered = [k for k in before if k in after] != [k for k in after if k in before]
+    return CatalogDiff(added, removed, changed, reordered)
+
+def describe(diff: CatalogDiff) -> str:
+    parts = []
+    if diff.added:
+        parts.append(f"added={len(diff.added)}")
+    if diff.removed:
+        parts.append(f"removed={len(diff.removed)}")
+    if diff.changed:
+        shown = [
+            f"{new.title or key} ({', '.join(sorted(names))})"
+            for key, (_, new, names) in list(diff.changed.items())[:3]
+        ]
+        more = len(diff.changed) - len(shown)
+        parts.append(f"changed={len(diff.changed)}: " + "; ".join(shown) + (f" and {more} more" if more > 0 else ""))
+    if diff.reordered:
+        parts.append("reordered")
+    return ", ".join(parts)
+
+def plan_stages(games: Sequence[Game], diff: CatalogDiff, client_args: List[str]) -> List[Stage]:
+    """The generator stages the diff touches, for build.run_graph()."""
+    fields = diff.fields
+    stages: List[Stage] = []
+
+    touched = [new for _, new, names in diff.changed.values() if names & PAGE_FIELDS]
+    slugs = {g.slug for g in (*touched, *diff.added, *diff.removed)}
+    # A retitled game gets a new slug; its old page has to go.
+    slugs |= {old.slug for old, _, names in diff.changed.values() if "slug" in names}
+    if slugs - {""}:
+        def pages() -> None:
+            written, deleted = generate_game_pages.update_pages(games, slugs)
+            print(f"Game pages: written={written}, deleted={deleted}, checked={len(slugs)}")
+        stages.append(Stage("game_pages", (), pages))
+
+    names = set(generate_series_pages.extract_series([
+        *diff.added, *(new for _, new, changed in diff.changed.values() if "series" in changed),
+    ]))
+    if names:
+        def series() -> None:
+            created, updated, skipped = generate_series_pages.write_series_pages(names)
+            print(f"Series pages: created={created}, updated={updated}, skipped={skipped}")
+        stages.append(Stage("series_pages", (), series))
+
+    # Checked against the sha256 of data/games.json by Hugo, so any save counts.
+    stages.append(Stage("browse_indexes", (), _call(generate_browse_indexes.main)))
+    if fields & CLIENT_FIELDS:
+        stages.append(Stage("client_catalog", (), _call(generate_client_catalog.main, client_args)))
+    if fields & RSS_FIELDS:
+        stages.append(Stage("rss_feed", (), _call(generate_rss_feed.main), optional=True))
+    return stages
+
+def _stamp(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _read_overrides() -> Dict[str, object]:
+    try:
+        data = json.loads(OVERRIDES_JSON.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+def main(argv: Optional[List[str]] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--interval", type=float, default=0.2, help="seconds between checks (default 0.2)")
+    ap.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 4)
+    # Same defaults as tools/preview.sh, which runs the watcher.
+    ap.add_argument("--search-include-hidden", choices=["0", "1"], default="1")
+    ap.add_argument("--feature-include-hidden", choices=["0", "1"], default="1")
+    ap.add_argument(
+        "--search-shards",
+        choices=["0", "1"],
+        default=os.environ.get("SEARCH_SHARDS", "1"),
+        help="write the static/search/ shards instead of search-index.js (default: $SEARCH_SHARDS or 1)",
+    )
+    args = ap.parse_args(argv)
+    client_args = [
+        "--search-include-hidden", args.search_include_hidden,
+        "--feature-include-hidden", args.feature_include_hidden,
+    ]
+    if args.search_shards == "1":
+        client_args.append("--sharded")
+
+    os.chdir(catalog.PROJECT_ROOT)
+    games = catalog.load_games()
+    overrides = _read_overrides()
+    stamps = {path: _stamp(path) for path in (catalog.GAMES_JSON, OVERRIDES_JSON)}
+    print(f"Watching {catalog.GAMES_JSON.name} ({len(games)} games) and {OVERRIDES_JSON.name}; Ctrl+C to stop")
+
+    try:
+        while True:
+            time.sleep(args.interval)
+            moved = [path for path, stamp in stamps.items() if _stamp(path) != stamp]
+            if not moved:
+                continue
+            settled = {path: _stamp(path) for path in moved}
+            while True:
+                time.sleep(SETTLE_SECS)
+                latest = {path: _stamp(path) for path in moved}
+                if latest == settled:
+                    break
+                settled = latest
+            stamps.update(settled)
+
+            if OVERRIDES_JSON in moved:
+                current = _read_overrides()
+                ids = sorted(k for k in current.keys() | overrides.keys() if current.get(k) != overrides.get(k))
+                overrides = current
+                if ids:
+                    print(f"{OVERRIDES_JSON.name}: overrides changed for ids {', '.join(ids)} (applied by Hugo)")
+
+            if catalog.GAMES_JSON not in moved:
+                continue
+            t0 = time.perf_counter()
+            try:
+                latest = catalog.load_games()
+            except (SystemExit, ValueError) as e:
+                print(f"{catalog.GAMES_JSON.name}: not loaded ({e}); keeping the previous catalog")
+                continue
+            diff = diff_catalog(games, latest)
+            games = latest
+            print(f"{catalog.GAMES_JSON.name}: {describe(diff) if diff else 'no record changes'}")
+            stages = plan_stages(games, diff, client_args)
+            ok, results = run_graph(stages, args.jobs)
+            print_timings(results, time.perf_counter() - t0)
+            if not ok:
+                print("Some outputs failed to regenerate; fix the entry and save again.")
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()